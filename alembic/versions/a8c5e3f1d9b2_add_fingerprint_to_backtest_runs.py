@@ -0,0 +1,31 @@
+"""Add fingerprint to backtest_runs for the result cache
+
+Revision ID: a8c5e3f1d9b2
+Revises: f4b8d2e7a9c3
+Create Date: 2026-10-17 09:41:27.508213
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a8c5e3f1d9b2"
+down_revision: Union[str, Sequence[str], None] = "f4b8d2e7a9c3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add nullable fingerprint column and index; existing runs are never cache hits."""
+    op.add_column("backtest_runs", sa.Column("fingerprint", sa.String(length=64), nullable=True))
+    op.create_index("idx_backtest_runs_fingerprint", "backtest_runs", ["fingerprint"])
+
+
+def downgrade() -> None:
+    """Remove fingerprint column and index from backtest_runs."""
+    op.drop_index("idx_backtest_runs_fingerprint", table_name="backtest_runs")
+    op.drop_column("backtest_runs", "fingerprint")
@@ -0,0 +1,31 @@
+"""Add sweep_id to backtest_runs for parameter sweeps
+
+Revision ID: b5e1f7a9c2d4
+Revises: 34f3c8e99016
+Create Date: 2026-10-16 10:12:41.118305
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b5e1f7a9c2d4"
+down_revision: Union[str, Sequence[str], None] = "34f3c8e99016"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add nullable sweep_id column and index to backtest_runs."""
+    op.add_column("backtest_runs", sa.Column("sweep_id", sa.UUID(), nullable=True))
+    op.create_index("idx_backtest_runs_sweep_id", "backtest_runs", ["sweep_id"])
+
+
+def downgrade() -> None:
+    """Remove sweep_id column and index from backtest_runs."""
+    op.drop_index("idx_backtest_runs_sweep_id", table_name="backtest_runs")
+    op.drop_column("backtest_runs", "sweep_id")
@@ -0,0 +1,61 @@
+"""Add walk_forward_analyses table for walk-forward optimization results
+
+Revision ID: b9d4f2a6c8e1
+Revises: a8c5e3f1d9b2
+Create Date: 2026-10-17 05:41:12.508317
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b9d4f2a6c8e1"
+down_revision: Union[str, Sequence[str], None] = "a8c5e3f1d9b2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create walk_forward_analyses."""
+    op.create_table(
+        "walk_forward_analyses",
+        sa.Column("id", sa.BigInteger(), nullable=False, autoincrement=True),
+        sa.Column("walk_forward_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("strategy_type", sa.String(length=100), nullable=False),
+        sa.Column("instrument_symbol", sa.String(length=50), nullable=False),
+        sa.Column("start_date", sa.TIMESTAMP(timezone=True), nullable=False),
+        sa.Column("end_date", sa.TIMESTAMP(timezone=True), nullable=False),
+        sa.Column("initial_capital", sa.Numeric(precision=20, scale=2), nullable=False),
+        sa.Column("config", postgresql.JSONB(), nullable=False),
+        sa.Column("folds", postgresql.JSONB(), nullable=False),
+        sa.Column("total_return", sa.Numeric(precision=15, scale=6), nullable=True),
+        sa.Column("max_drawdown", sa.Numeric(precision=15, scale=6), nullable=True),
+        sa.Column(
+            "execution_duration_seconds", sa.Numeric(precision=10, scale=3), nullable=False
+        ),
+        sa.Column("point_count", sa.Integer(), nullable=False),
+        sa.Column("equity_times", sa.LargeBinary(), nullable=False),
+        sa.Column("equity_values", sa.LargeBinary(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("walk_forward_id"),
+    )
+    op.create_index(
+        "idx_walk_forward_analyses_created", "walk_forward_analyses", ["created_at"]
+    )
+
+
+def downgrade() -> None:
+    """Drop walk_forward_analyses."""
+    op.drop_index("idx_walk_forward_analyses_created", table_name="walk_forward_analyses")
+    op.drop_table("walk_forward_analyses")
@@ -0,0 +1,136 @@
+"""Move equity curves out of config_snapshot into equity_curves
+
+Revision ID: c3a9d4e6f1b7
+Revises: b5e1f7a9c2d4
+Create Date: 2026-10-16 21:20:05.412871
+
+"""
+
+import zlib
+from datetime import datetime
+from typing import Sequence, Union
+
+from alembic import op
+import numpy as np
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c3a9d4e6f1b7"
+down_revision: Union[str, Sequence[str], None] = "b5e1f7a9c2d4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Reason: frozen copy of the src.db.types.NumpyArray encoding, so this
+# migration keeps working if the application code changes
+_TIMES_DTYPE = np.dtype("<i8")
+_VALUES_DTYPE = np.dtype("<f8")
+
+equity_curves = sa.table(
+    "equity_curves",
+    sa.column("backtest_run_id", sa.BigInteger()),
+    sa.column("point_count", sa.Integer()),
+    sa.column("times", sa.LargeBinary()),
+    sa.column("values", sa.LargeBinary()),
+)
+backtest_runs = sa.table(
+    "backtest_runs",
+    sa.column("id", sa.BigInteger()),
+    sa.column("config_snapshot", postgresql.JSONB()),
+)
+
+
+def _point_time(value: object) -> int | None:
+    """Unix seconds of a legacy point time (int, float or ISO string)."""
+    if isinstance(value, (int, float)):
+        return int(value)
+    if isinstance(value, str):
+        try:
+            return int(datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp())
+        except ValueError:
+            return None
+    return None
+
+
+def upgrade() -> None:
+    """Create equity_curves and move every config_snapshot equity_curve into it."""
+    op.create_table(
+        "equity_curves",
+        sa.Column("id", sa.BigInteger(), nullable=False, autoincrement=True),
+        sa.Column("backtest_run_id", sa.BigInteger(), nullable=False),
+        sa.Column("point_count", sa.Integer(), nullable=False),
+        sa.Column("times", sa.LargeBinary(), nullable=False),
+        sa.Column("values", sa.LargeBinary(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.ForeignKeyConstraint(["backtest_run_id"], ["backtest_runs.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("backtest_run_id"),
+    )
+
+    connection = op.get_bind()
+    rows = connection.execute(
+        sa.text(
+            "SELECT id, config_snapshot -> 'equity_curve' FROM backtest_runs "
+            "WHERE config_snapshot -> 'equity_curve' IS NOT NULL"
+        )
+    ).all()
+    for run_id, points in rows:
+        parsed = [
+            (time_value, float(point.get("value", 0)))
+            for point in points or []
+            if (time_value := _point_time(point.get("time"))) is not None
+        ]
+        if not parsed:
+            continue
+        times = np.array([time_value for time_value, _ in parsed], dtype=_TIMES_DTYPE)
+        values = np.array([value for _, value in parsed], dtype=_VALUES_DTYPE)
+        connection.execute(
+            equity_curves.insert().values(
+                backtest_run_id=run_id,
+                point_count=len(parsed),
+                times=zlib.compress(times.tobytes()),
+                values=zlib.compress(values.tobytes()),
+            )
+        )
+
+    op.execute(
+        "UPDATE backtest_runs SET config_snapshot = config_snapshot - 'equity_curve' "
+        "WHERE config_snapshot -> 'equity_curve' IS NOT NULL"
+    )
+
+
+def downgrade() -> None:
+    """Copy equity curves back into config_snapshot and drop equity_curves."""
+    connection = op.get_bind()
+    rows = connection.execute(
+        sa.select(
+            backtest_runs.c.id,
+            backtest_runs.c.config_snapshot,
+            equity_curves.c.times,
+            equity_curves.c["values"],
+        ).join_from(
+            backtest_runs,
+            equity_curves,
+            equity_curves.c.backtest_run_id == backtest_runs.c.id,
+        )
+    ).all()
+    for run_id, config_snapshot, times_data, values_data in rows:
+        times = np.frombuffer(zlib.decompress(times_data), dtype=_TIMES_DTYPE)
+        values = np.frombuffer(zlib.decompress(values_data), dtype=_VALUES_DTYPE)
+        config_snapshot["equity_curve"] = [
+            {"time": int(time_value), "value": float(value)}
+            for time_value, value in zip(times, values)
+        ]
+        connection.execute(
+            backtest_runs.update()
+            .where(backtest_runs.c.id == run_id)
+            .values(config_snapshot=config_snapshot)
+        )
+
+    op.drop_table("equity_curves")
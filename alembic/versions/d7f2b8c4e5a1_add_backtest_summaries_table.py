@@ -0,0 +1,101 @@
+"""Add backtest_summaries rollup table for dashboard statistics
+
+Revision ID: d7f2b8c4e5a1
+Revises: c3a9d4e6f1b7
+Create Date: 2026-10-16 23:04:37.520914
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d7f2b8c4e5a1"
+down_revision: Union[str, Sequence[str], None] = "c3a9d4e6f1b7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Scope name -> expression on backtest_runs r that keys its rollup rows
+# Reason: The cast keeps PostgreSQL from rejecting a bare constant in ORDER BY
+_SCOPE_KEYS = {
+    "all": "''::text",
+    "strategy": "r.strategy_name",
+    "instrument": "r.instrument_symbol",
+}
+
+_BACKFILL_SQL = """
+INSERT INTO backtest_summaries (
+    scope, scope_key, total_runs, successful_runs, total_return_sum,
+    best_sharpe_ratio, best_sharpe_run_id, best_sharpe_strategy,
+    worst_max_drawdown, worst_drawdown_run_id, worst_drawdown_strategy,
+    last_run_at
+)
+SELECT
+    '{scope}', counts.key, counts.total_runs, counts.successful_runs, counts.total_return_sum,
+    best.sharpe_ratio, best.run_id, best.strategy_name,
+    worst.max_drawdown, worst.run_id, worst.strategy_name,
+    counts.last_run_at
+FROM (
+    SELECT {key} AS key,
+           count(*) AS total_runs,
+           count(m.id) AS successful_runs,
+           coalesce(sum(m.total_return), 0) AS total_return_sum,
+           max(r.created_at) AS last_run_at
+    FROM backtest_runs r
+    LEFT JOIN performance_metrics m ON m.backtest_run_id = r.id
+    GROUP BY 1
+) counts
+LEFT JOIN (
+    SELECT DISTINCT ON ({key}) {key} AS key, m.sharpe_ratio, r.run_id, r.strategy_name
+    FROM backtest_runs r
+    JOIN performance_metrics m ON m.backtest_run_id = r.id
+    WHERE m.sharpe_ratio IS NOT NULL
+    ORDER BY {key}, m.sharpe_ratio DESC, r.created_at, r.id
+) best ON best.key = counts.key
+LEFT JOIN (
+    SELECT DISTINCT ON ({key}) {key} AS key, m.max_drawdown, r.run_id, r.strategy_name
+    FROM backtest_runs r
+    JOIN performance_metrics m ON m.backtest_run_id = r.id
+    WHERE m.max_drawdown IS NOT NULL
+    ORDER BY {key}, m.max_drawdown ASC, r.created_at, r.id
+) worst ON worst.key = counts.key
+"""
+
+
+def upgrade() -> None:
+    """Create backtest_summaries and backfill it from every existing run."""
+    op.create_table(
+        "backtest_summaries",
+        sa.Column("id", sa.BigInteger(), nullable=False, autoincrement=True),
+        sa.Column("scope", sa.String(length=20), nullable=False),
+        sa.Column("scope_key", sa.String(length=255), nullable=False),
+        sa.Column("total_runs", sa.Integer(), nullable=False),
+        sa.Column("successful_runs", sa.Integer(), nullable=False),
+        sa.Column("total_return_sum", sa.Numeric(precision=20, scale=6), nullable=False),
+        sa.Column("best_sharpe_ratio", sa.Numeric(precision=15, scale=6), nullable=True),
+        sa.Column("best_sharpe_run_id", sa.UUID(), nullable=True),
+        sa.Column("best_sharpe_strategy", sa.String(length=255), nullable=True),
+        sa.Column("worst_max_drawdown", sa.Numeric(precision=15, scale=6), nullable=True),
+        sa.Column("worst_drawdown_run_id", sa.UUID(), nullable=True),
+        sa.Column("worst_drawdown_strategy", sa.String(length=255), nullable=True),
+        sa.Column("last_run_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column(
+            "updated_at",
+            sa.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("scope", "scope_key", name="uq_backtest_summaries_scope"),
+    )
+
+    for scope, key in _SCOPE_KEYS.items():
+        op.execute(_BACKFILL_SQL.format(scope=scope, key=key))
+
+
+def downgrade() -> None:
+    """Drop backtest_summaries."""
+    op.drop_table("backtest_summaries")
@@ -0,0 +1,57 @@
+"""Add keyset pagination and instrument prefix search indexes
+
+Revision ID: e1a4c9d2b6f3
+Revises: d7f2b8c4e5a1
+Create Date: 2026-10-17 00:41:12.873406
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e1a4c9d2b6f3"
+down_revision: Union[str, Sequence[str], None] = "d7f2b8c4e5a1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, columns) for each list sort key, ties broken by run id
+_KEYSET_INDEXES = [
+    ("idx_backtest_runs_strategy_id", "backtest_runs", ["strategy_name", "id"]),
+    ("idx_backtest_runs_instrument_id", "backtest_runs", ["instrument_symbol", "id"]),
+    ("idx_backtest_runs_status_id", "backtest_runs", ["execution_status", "id"]),
+    ("idx_metrics_total_return", "performance_metrics", ["total_return", "backtest_run_id"]),
+    ("idx_metrics_sharpe_ratio", "performance_metrics", ["sharpe_ratio", "backtest_run_id"]),
+    ("idx_metrics_max_drawdown", "performance_metrics", ["max_drawdown", "backtest_run_id"]),
+]
+
+
+def upgrade() -> None:
+    """Create keyset indexes and the lower(instrument_symbol) prefix index."""
+    # Reason: Superseded by the (column, id) keyset indexes; only ever created
+    # from model metadata, so they may not exist
+    op.execute("DROP INDEX IF EXISTS idx_backtest_runs_instrument")
+    op.execute("DROP INDEX IF EXISTS idx_backtest_runs_status")
+
+    for name, table, columns in _KEYSET_INDEXES:
+        op.create_index(name, table, columns, unique=False)
+
+    op.create_index(
+        "idx_backtest_runs_instrument_lower",
+        "backtest_runs",
+        [sa.text("lower(instrument_symbol) text_pattern_ops")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Drop the keyset and prefix indexes and restore the single-column ones."""
+    op.drop_index("idx_backtest_runs_instrument_lower", table_name="backtest_runs")
+    for name, table, _ in reversed(_KEYSET_INDEXES):
+        op.drop_index(name, table_name=table)
+
+    op.create_index("idx_backtest_runs_status", "backtest_runs", ["execution_status"])
+    op.create_index("idx_backtest_runs_instrument", "backtest_runs", ["instrument_symbol"])
@@ -0,0 +1,46 @@
+"""Add trade_analytics table for persisted trade statistics and drawdowns
+
+Revision ID: f4b8d2e7a9c3
+Revises: e1a4c9d2b6f3
+Create Date: 2026-10-17 02:15:48.296134
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f4b8d2e7a9c3"
+down_revision: Union[str, Sequence[str], None] = "e1a4c9d2b6f3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create trade_analytics; existing runs are filled in on first request."""
+    op.create_table(
+        "trade_analytics",
+        sa.Column("id", sa.BigInteger(), nullable=False, autoincrement=True),
+        sa.Column("backtest_run_id", sa.BigInteger(), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column("statistics", postgresql.JSONB(), nullable=False),
+        sa.Column("drawdowns", postgresql.JSONB(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.ForeignKeyConstraint(["backtest_run_id"], ["backtest_runs.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("backtest_run_id"),
+    )
+
+
+def downgrade() -> None:
+    """Drop trade_analytics."""
+    op.drop_table("trade_analytics")
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Backtest List Benchmark: keyset cursors vs OFFSET pagination at depth.
+
+Seeds a scratch PostgreSQL database with synthetic backtest runs (1,000,000
+by default, 2% failed, the rest with random metrics), then times one page of
+the backtest list at increasing depths, both by following a keyset cursor
+and by the OFFSET fallback used for cursor-less page links. Keyset latency
+should stay flat while OFFSET grows with depth.
+
+The database must be empty or previously seeded by this script; never point
+it at a database holding real results.
+
+Usage:
+    uv run python scripts/benchmark_backtest_list.py --database-url postgresql://.../bench
+    uv run python scripts/benchmark_backtest_list.py --database-url ... --rows 200000
+    uv run python scripts/benchmark_backtest_list.py --database-url ... --sort sharpe_ratio
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.api.models.filter_models import FilterState, SortColumn, encode_cursor  # noqa: E402
+from src.db.base import Base  # noqa: E402
+from src.db.models.backtest import BacktestRun  # noqa: E402
+from src.db.repositories.backtest_repository import (  # noqa: E402
+    BacktestRepository,
+    list_sort_value,
+)
+
+PAGE_SIZE = 20
+DEPTHS = [1, 10, 100, 1_000, 10_000, 40_000]
+
+SEED_RUNS_SQL = """
+INSERT INTO backtest_runs (
+    run_id, strategy_name, strategy_type, instrument_symbol, start_date, end_date,
+    initial_capital, data_source, execution_status, execution_duration_seconds,
+    config_snapshot, created_at
+)
+SELECT
+    gen_random_uuid(),
+    'Strategy ' || (g % 20),
+    'benchmark',
+    (ARRAY['AAPL', 'MSFT', 'SPY', 'QQQ', 'TSLA', 'NVDA', 'AMZN', 'META'])[1 + g % 8],
+    '2020-01-01', '2024-01-01', 100000, 'Benchmark',
+    CASE WHEN g % 50 = 0 THEN 'failed' ELSE 'success' END,
+    1.0, '{}'::jsonb,
+    now() - make_interval(secs => g)
+FROM generate_series(1, :rows) AS g
+"""
+
+SEED_METRICS_SQL = """
+INSERT INTO performance_metrics (
+    backtest_run_id, total_return, final_balance, sharpe_ratio, max_drawdown,
+    total_trades, winning_trades, losing_trades
+)
+SELECT id, random() - 0.5, 100000, random() * 4 - 1, -random() * 0.5, 0, 0, 0
+FROM backtest_runs
+WHERE execution_status = 'success'
+"""
+
+PREFIX_INDEX_SQL = """
+CREATE INDEX IF NOT EXISTS idx_backtest_runs_instrument_lower
+ON backtest_runs (lower(instrument_symbol) text_pattern_ops)
+"""
+
+
+async def seed(session: AsyncSession, rows: int) -> None:
+    """Create the schema and insert rows runs unless already seeded."""
+    existing = (await session.execute(select(func.count(BacktestRun.id)))).scalar_one()
+    if existing >= rows:
+        print(f"Reusing {existing:,} seeded runs")
+        return
+    if existing:
+        raise SystemExit(f"Database holds {existing:,} runs; use an empty scratch database")
+
+    print(f"Seeding {rows:,} runs...")
+    started = time.perf_counter()
+    await session.execute(text(SEED_RUNS_SQL), {"rows": rows})
+    await session.execute(text(SEED_METRICS_SQL))
+    await session.execute(text(PREFIX_INDEX_SQL))
+    await session.commit()
+    await session.execute(text("ANALYZE backtest_runs"))
+    await session.execute(text("ANALYZE performance_metrics"))
+    print(f"Seeded in {time.perf_counter() - started:.1f}s")
+
+
+async def timed_page(repository: BacktestRepository, state: FilterState) -> float:
+    """Best-of-3 wall time of one list page in milliseconds."""
+    timings = []
+    for _ in range(3):
+        repository.session.expunge_all()
+        started = time.perf_counter()
+        await repository.get_filtered_backtests(state)
+        timings.append((time.perf_counter() - started) * 1000)
+    return min(timings)
+
+
+async def cursor_at_depth(repository: BacktestRepository, state: FilterState, page: int) -> str:
+    """Cursor of the last row before the given page (looked up untimed via OFFSET)."""
+    previous, _ = await repository.get_filtered_backtests(
+        state.model_copy(update={"page": page - 1})
+    )
+    last = previous[-1]
+    return encode_cursor(list_sort_value(last, state.sort), last.id)
+
+
+async def main() -> None:
+    """Seed the database and print keyset vs OFFSET page latency by depth."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--database-url", required=True, help="Scratch PostgreSQL database")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Runs to seed")
+    parser.add_argument(
+        "--sort",
+        type=SortColumn,
+        default=SortColumn.CREATED_AT,
+        choices=list(SortColumn),
+        help="List sort column",
+    )
+    parser.add_argument("--strategy", help="Also filter by this strategy (e.g., 'Strategy 3')")
+    args = parser.parse_args()
+
+    url = args.database_url.replace("postgresql://", "postgresql+asyncpg://")
+    engine = create_async_engine(url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with session_maker() as session:
+        await seed(session, args.rows)
+        repository = BacktestRepository(session)
+        state = FilterState(sort=args.sort, strategy=args.strategy, page_size=PAGE_SIZE)
+
+        print("=" * 60)
+        print(f"Backtest list: sort={args.sort.value}, page_size={PAGE_SIZE}")
+        print("=" * 60)
+        print(f"{'Page':>8}{'Keyset (ms)':>18}{'OFFSET (ms)':>18}")
+        print("-" * 60)
+        for page in DEPTHS:
+            if (page - 1) * PAGE_SIZE >= args.rows:
+                break
+            if page == 1:
+                keyset_ms = offset_ms = await timed_page(repository, state)
+            else:
+                cursor = await cursor_at_depth(repository, state, page)
+                keyset_ms = await timed_page(
+                    repository, state.model_copy(update={"page": page, "after": cursor})
+                )
+                offset_ms = await timed_page(repository, state.model_copy(update={"page": page}))
+            print(f"{page:>8,}{keyset_ms:>18.1f}{offset_ms:>18.1f}")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
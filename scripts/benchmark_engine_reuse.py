@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Engine Reuse Benchmark: runs/second with and without keeping the engine loaded.
+
+Runs the same SMA crossover parameter grid over one dataset twice through
+BacktestOrchestrator: once building a fresh BacktestEngine per run (venue,
+instrument and add_data sorting every time), once with reuse_engine=True,
+which resets a single loaded engine and only swaps the strategy. By default
+uses a synthetic random walk of daily bars; pass --instrument to use stored
+bars from the catalog instead.
+
+Usage:
+    uv run python scripts/benchmark_engine_reuse.py
+    uv run python scripts/benchmark_engine_reuse.py --bars 500 --runs 40
+    uv run python scripts/benchmark_engine_reuse.py --instrument AAPL.NASDAQ --bar-type 1-DAY-LAST
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+from nautilus_trader.common.component import init_logging
+from nautilus_trader.common.enums import LogLevel
+from nautilus_trader.model.data import Bar, BarType
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.backtest_orchestrator import BacktestOrchestrator  # noqa: E402
+from src.models.backtest_request import BacktestRequest  # noqa: E402
+from src.utils.logging import set_nautilus_log_guard  # noqa: E402
+
+DAY_NS = 86_400_000_000_000
+START_NS = 946_684_800 * 1_000_000_000  # 2000-01-01
+
+
+def synthetic_daily_bars(count: int) -> list[Bar]:
+    """Random-walk daily AAPL bars starting 2000-01-01."""
+    rng = np.random.default_rng(0)
+    close = np.round(100.0 + rng.standard_normal(count).cumsum(), 2).clip(min=1.0)
+    ts = np.uint64(START_NS) + np.arange(count, dtype=np.uint64) * np.uint64(DAY_NS)
+    return Bar.from_raw_arrays_to_list(
+        BarType.from_str("AAPL.NASDAQ-1-DAY-LAST-EXTERNAL"),
+        2,
+        0,
+        close,
+        close + 0.5,
+        (close - 0.5).clip(min=0.5),
+        close,
+        np.full(count, 1_000_000.0),
+        ts,
+        ts,
+    )
+
+
+def catalog_bars(instrument_id: str, bar_type_spec: str) -> tuple[list[Bar], object]:
+    """Stored bars and instrument of a series from the Parquet catalog."""
+    from src.services.data_catalog import DataCatalogService
+
+    service = DataCatalogService()
+    bars = service.query_bar_arrays(instrument_id, bar_type_spec).to_bars()
+    instrument = service.load_instrument(instrument_id)
+    if instrument is None:
+        raise SystemExit(f"No instrument definition stored for {instrument_id}")
+    return bars, instrument
+
+
+def grid_requests(bars: list[Bar], runs: int) -> list[BacktestRequest]:
+    """SMA crossover requests covering the whole bar range, one per run."""
+    start = datetime.fromtimestamp(bars[0].ts_init / 1e9, tz=timezone.utc)
+    end = datetime.fromtimestamp(bars[-1].ts_init / 1e9, tz=timezone.utc)
+    instrument_id = str(bars[0].bar_type.instrument_id)
+    return [
+        BacktestRequest(
+            strategy_type="sma_crossover",
+            strategy_path="src.core.strategies.sma_crossover:SMACrossover",
+            config_path="src.core.strategies.sma_crossover:SMAConfig",
+            strategy_config={"fast_period": 5 + index % 20, "slow_period": 30 + index // 20 * 10},
+            symbol=instrument_id.split(".")[0],
+            instrument_id=instrument_id,
+            start_date=start,
+            end_date=end,
+            bar_type=str(bars[0].bar_type),
+            persist=False,
+        )
+        for index in range(runs)
+    ]
+
+
+async def run_all(requests: list[BacktestRequest], bars, instrument, reuse: bool) -> float:
+    """Execute every request in sequence and return the wall time in seconds."""
+    started = time.perf_counter()
+    orchestrator = BacktestOrchestrator(reuse_engine=reuse)
+    for request in requests:
+        await orchestrator.execute(request, bars, instrument)
+        if not reuse:
+            orchestrator.dispose()
+    orchestrator.dispose()
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--bars", type=int, default=2_000, help="Synthetic daily bar count")
+    parser.add_argument("--runs", type=int, default=20, help="Backtests per mode")
+    parser.add_argument("--instrument", help="Use catalog bars (e.g., AAPL.NASDAQ)")
+    parser.add_argument("--bar-type", default="1-DAY-LAST", help="Catalog bar type spec")
+    args = parser.parse_args()
+
+    # Reason: Per-run engine logging would dominate the timings
+    set_nautilus_log_guard(init_logging(level_stdout=LogLevel.ERROR))
+
+    if args.instrument:
+        bars, instrument = catalog_bars(args.instrument, args.bar_type)
+    else:
+        bars = synthetic_daily_bars(args.bars)
+        instrument = TestInstrumentProvider.equity("AAPL", "NASDAQ")
+    requests = grid_requests(bars, args.runs)
+
+    # Reason: Warm up imports and strategy discovery so neither mode pays for them
+    asyncio.run(run_all(requests[:1], bars, instrument, reuse=False))
+    fresh_seconds = asyncio.run(run_all(requests, bars, instrument, reuse=False))
+    reused_seconds = asyncio.run(run_all(requests, bars, instrument, reuse=True))
+
+    print("=" * 64)
+    print(f"Engine reuse benchmark: {args.runs} runs over {len(bars):,} bars")
+    print("=" * 64)
+    print(f"{'Mode':<20}{'Total (s)':>14}{'Runs/second':>16}")
+    print("-" * 64)
+    print(f"{'Fresh engine':<20}{fresh_seconds:>14.2f}{args.runs / fresh_seconds:>16.2f}")
+    print(f"{'Reused engine':<20}{reused_seconds:>14.2f}{args.runs / reused_seconds:>16.2f}")
+    print(f"Speedup: {fresh_seconds / reused_seconds:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
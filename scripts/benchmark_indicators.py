@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Indicator Benchmark: vectorized NumPy indicators vs Nautilus bar-by-bar replay.
+
+Times each indicator in src/core/indicators.py against the Nautilus indicator
+it reproduces, fed one bar at a time as the chart overlays used to do. By
+default runs on a synthetic random walk sized like 10 years of US equity
+minute bars (252 sessions x 390 minutes); pass --instrument to use stored
+minute bars from the catalog instead.
+
+Usage:
+    uv run python scripts/benchmark_indicators.py
+    uv run python scripts/benchmark_indicators.py --years 15
+    uv run python scripts/benchmark_indicators.py --instrument SPY.ARCA
+"""
+
+import argparse
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+from nautilus_trader.indicators import (
+    AverageTrueRange,
+    BollingerBands,
+    ExponentialMovingAverage,
+    RelativeStrengthIndex,
+    SimpleMovingAverage,
+)
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core import indicators  # noqa: E402
+
+MINUTES_PER_SESSION = 390
+SESSIONS_PER_YEAR = 252
+
+
+def synthetic_minute_bars(years: int) -> dict[str, np.ndarray]:
+    """Random-walk OHLC with one bar per regular-session minute."""
+    count = years * SESSIONS_PER_YEAR * MINUTES_PER_SESSION
+    rng = np.random.default_rng(0)
+    close = 100.0 + (rng.standard_normal(count) * 0.05).cumsum()
+    spread = rng.uniform(0.01, 0.2, count)
+
+    session = np.arange(count) // MINUTES_PER_SESSION
+    # Reason: Five sessions per calendar week, starting Monday 2010-01-04
+    day = session // 5 * 7 + session % 5
+    minute = np.arange(count) % MINUTES_PER_SESSION
+    ts = (
+        np.datetime64("2010-01-04T14:30", "ns").astype(np.int64)
+        + day * indicators.DAY_NS
+        + minute * 60_000_000_000
+    ).astype(np.uint64)
+    return {"high": close + spread, "low": close - spread, "close": close, "ts": ts}
+
+
+def catalog_minute_bars(instrument_id: str) -> dict[str, np.ndarray]:
+    """Stored minute bars of an instrument from the Parquet catalog."""
+    from src.services.data_catalog import DataCatalogService
+
+    arrays = DataCatalogService().query_bar_arrays(instrument_id, "1-MINUTE-LAST")
+    return {"high": arrays.high, "low": arrays.low, "close": arrays.close, "ts": arrays.ts_event}
+
+
+def replay_close(indicator, close: np.ndarray) -> None:
+    """Feed closes one at a time, reading the value like a strategy would."""
+    for value in close.tolist():
+        indicator.update_raw(value)
+        indicator.value
+
+
+def replay_hlc(indicator, high: np.ndarray, low: np.ndarray, close: np.ndarray) -> None:
+    """Feed high/low/close one bar at a time."""
+    for bar_high, bar_low, bar_close in zip(high.tolist(), low.tolist(), close.tolist()):
+        indicator.update_raw(bar_high, bar_low, bar_close)
+
+
+def replay_weekly(ts: np.ndarray, close: np.ndarray, period: int) -> None:
+    """Per-bar ISO-week aggregation into an SMA, as the Bollinger overlay did."""
+    sma = SimpleMovingAverage(period)
+    current_week = None
+    week_close = None
+    for ts_ns, value in zip(ts.tolist(), close.tolist()):
+        iso_year, iso_week, _ = datetime.fromtimestamp(ts_ns / 1e9, tz=timezone.utc).isocalendar()
+        if current_week is None:
+            current_week = (iso_year, iso_week)
+        elif (iso_year, iso_week) != current_week:
+            sma.update_raw(week_close)
+            current_week = (iso_year, iso_week)
+        week_close = value
+
+
+def timed(func) -> float:
+    """Wall time of one call in seconds."""
+    started = time.perf_counter()
+    func()
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--years", type=int, default=10, help="Years of synthetic minute bars")
+    parser.add_argument("--instrument", help="Use catalog minute bars (e.g., SPY.ARCA)")
+    args = parser.parse_args()
+
+    if args.instrument:
+        bars = catalog_minute_bars(args.instrument)
+    else:
+        bars = synthetic_minute_bars(args.years)
+    high, low, close, ts = bars["high"], bars["low"], bars["close"], bars["ts"]
+
+    cases = [
+        (
+            "SMA(200)",
+            lambda: replay_close(SimpleMovingAverage(200), close),
+            lambda: indicators.sma(close, 200),
+        ),
+        (
+            "EMA(50)",
+            lambda: replay_close(ExponentialMovingAverage(50), close),
+            lambda: indicators.ema(close, 50),
+        ),
+        (
+            "RSI(14)",
+            lambda: replay_close(RelativeStrengthIndex(14), close),
+            lambda: indicators.rsi(close, 14),
+        ),
+        (
+            "Bollinger(20, 2)",
+            lambda: replay_hlc(BollingerBands(20, 2.0), high, low, close),
+            lambda: indicators.bollinger_bands(high, low, close, 20, 2.0),
+        ),
+        (
+            "ATR(14)",
+            lambda: replay_hlc(AverageTrueRange(14), high, low, close),
+            lambda: indicators.atr(high, low, close, 14),
+        ),
+        (
+            "Weekly SMA(20)",
+            lambda: replay_weekly(ts, close, 20),
+            lambda: indicators.weekly_sma(ts, close, 20),
+        ),
+    ]
+
+    print("=" * 72)
+    print(f"Indicator benchmark: {len(close):,} bars")
+    print("=" * 72)
+    print(f"{'Indicator':<18}{'Nautilus (s)':>16}{'Vectorized (s)':>18}{'Speedup':>12}")
+    print("-" * 72)
+    for name, replay, vectorized in cases:
+        replay_seconds = timed(replay)
+        vectorized_seconds = timed(vectorized)
+        speedup = replay_seconds / vectorized_seconds
+        print(f"{name:<18}{replay_seconds:>16.3f}{vectorized_seconds:>18.3f}{speedup:>11.0f}x")
+
+
+if __name__ == "__main__":
+    main()
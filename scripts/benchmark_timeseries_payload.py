@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Timeseries Payload Benchmark: Arrow IPC vs JSON for GET /api/timeseries.
+
+Writes synthetic AAPL 1-minute bars (50,000 by default) to a scratch Parquet
+catalog, then requests the whole range through the FastAPI app as JSON and
+as an Arrow IPC stream. Reports the response size and the best server-side
+CPU time of several requests for each format; the columnar path should be
+both smaller and cheaper.
+
+Usage:
+    uv run python scripts/benchmark_timeseries_payload.py
+    uv run python scripts/benchmark_timeseries_payload.py --bars 200000 --repeats 5
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+from fastapi.testclient import TestClient
+from nautilus_trader.model.data import Bar, BarType
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.api.columnar import ARROW_STREAM_MEDIA_TYPE  # noqa: E402
+from src.api.dependencies import get_data_catalog_service  # noqa: E402
+from src.api.web import app  # noqa: E402
+from src.services.data_catalog import DataCatalogService  # noqa: E402
+
+BASE_NS = 1_704_067_200_000_000_000  # 2024-01-01 00:00 UTC
+MINUTE_NS = 60_000_000_000
+
+
+def synthetic_minute_bars(count: int) -> list[Bar]:
+    """AAPL 1-minute bars starting 2024-01-01."""
+    close = 150.0 + np.round(np.sin(np.arange(count) / 100.0) * 5.0, 2)
+    ts = (BASE_NS + MINUTE_NS * np.arange(count)).astype(np.uint64)
+    return Bar.from_raw_arrays_to_list(
+        BarType.from_str("AAPL.NASDAQ-1-MINUTE-LAST-EXTERNAL"),
+        2,
+        0,
+        close - 0.25,
+        close + 0.5,
+        close - 0.5,
+        close,
+        np.full(count, 1_200.0),
+        ts,
+        ts,
+    )
+
+
+def measure(
+    client: TestClient, params: dict, headers: dict | None, repeats: int
+) -> tuple[int, float]:
+    """Response size in bytes and best CPU seconds over `repeats` requests."""
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.process_time()
+        response = client.get("/api/timeseries", params=params, headers=headers)
+        best = min(best, time.process_time() - started)
+        if response.status_code != 200:
+            raise SystemExit(f"Request failed with {response.status_code}: {response.text}")
+    return len(response.content), best
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--bars", type=int, default=50_000, help="Synthetic minute bar count")
+    parser.add_argument("--repeats", type=int, default=3, help="Requests per format")
+    args = parser.parse_args()
+
+    bars = synthetic_minute_bars(args.bars)
+    end_ns = BASE_NS + MINUTE_NS * args.bars
+    params = {
+        "symbol": "AAPL",
+        "start": "2024-01-01",
+        "end": time.strftime("%Y-%m-%d", time.gmtime(end_ns // 1_000_000_000)),
+        "timeframe": "1_MIN",
+    }
+
+    with tempfile.TemporaryDirectory() as catalog_path:
+        service = DataCatalogService(catalog_path=catalog_path)
+        service.catalog.write_data(bars)
+        service.refresh_availability(force=True)
+        app.dependency_overrides[get_data_catalog_service] = lambda: service
+        try:
+            client = TestClient(app)
+            json_bytes, json_cpu = measure(client, params, None, args.repeats)
+            arrow_headers = {"Accept": ARROW_STREAM_MEDIA_TYPE}
+            arrow_bytes, arrow_cpu = measure(client, params, arrow_headers, args.repeats)
+        finally:
+            app.dependency_overrides.pop(get_data_catalog_service, None)
+
+    print("=" * 64)
+    print(f"Timeseries payload benchmark: {args.bars:,} minute bars")
+    print("=" * 64)
+    print(f"{'Format':<20}{'Payload (B)':>16}{'CPU (ms)':>14}")
+    print("-" * 64)
+    print(f"{'JSON':<20}{json_bytes:>16,}{json_cpu * 1000:>14.0f}")
+    print(f"{'Arrow IPC':<20}{arrow_bytes:>16,}{arrow_cpu * 1000:>14.0f}")
+    print(f"Size ratio: {json_bytes / arrow_bytes:.1f}x, CPU ratio: {json_cpu / arrow_cpu:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Trade Persistence Benchmark: column-wise conversion + bulk insert vs ORM add_all.
+
+Builds a synthetic positions report shaped like
+trader.generate_positions_report() (100,000 closed positions by default),
+then times converting it to trade rows with positions_to_trade_rows and
+inserting them with BacktestRepository.bulk_insert_trades (COPY on
+PostgreSQL, multi-row INSERT elsewhere). For comparison the same rows are
+also inserted as ORM Trade objects with session.add_all + flush, the path
+trades used to take. Each path writes to its own backtest run and the
+transaction is rolled back at the end.
+
+Usage:
+    uv run python scripts/benchmark_trade_persistence.py
+    uv run python scripts/benchmark_trade_persistence.py --trades 20000
+    uv run python scripts/benchmark_trade_persistence.py --database-url postgresql://.../bench
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from datetime import datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.db.base import Base  # noqa: E402
+from src.db.models.backtest import BacktestRun  # noqa: E402
+from src.db.models.trade import Trade  # noqa: E402
+from src.db.repositories.backtest_repository import (  # noqa: E402
+    TRADE_INSERT_COLUMNS,
+    BacktestRepository,
+)
+from src.services.backtest_persistence import positions_to_trade_rows  # noqa: E402
+
+
+def synthetic_positions_report(count: int, seed: int = 42) -> pd.DataFrame:
+    """Closed positions with random prices, sizes and holding periods."""
+    rng = np.random.default_rng(seed)
+    opened = pd.date_range("2020-01-01", periods=count, freq="min", tz="UTC")
+    duration_ns = rng.integers(60, 86_400, count) * 1_000_000_000
+    entry = 100 + rng.random(count) * 100
+    exit_ = entry * (1 + rng.normal(0, 0.02, count))
+    quantity = rng.integers(1, 1000, count)
+    pnl = (exit_ - entry) * quantity
+    return pd.DataFrame(
+        {
+            "instrument_id": "AAPL.NASDAQ",
+            "entry": np.where(rng.random(count) < 0.5, "BUY", "SELL"),
+            "peak_qty": quantity.astype(str),
+            "opening_order_id": [f"O-{i}" for i in range(count)],
+            "closing_order_id": [f"C-{i}" for i in range(count)],
+            "ts_opened": opened,
+            "ts_closed": opened + pd.to_timedelta(duration_ns, unit="ns"),
+            "duration_ns": duration_ns,
+            "avg_px_open": entry,
+            "avg_px_close": exit_,
+            "realized_pnl": [f"{v:.2f} USD" for v in pnl],
+            "commissions": [[f"{v:.2f} USD"] for v in quantity * 0.005],
+        },
+        index=[f"AAPL.NASDAQ-EMA-{i}" for i in range(count)],
+    )
+
+
+async def create_run(session: AsyncSession, name: str) -> int:
+    """Insert a throwaway backtest run and return its database ID."""
+    run = BacktestRun(
+        strategy_name=name,
+        strategy_type="benchmark",
+        instrument_symbol="AAPL",
+        start_date=datetime(2020, 1, 1, tzinfo=timezone.utc),
+        end_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        initial_capital=Decimal("100000"),
+        data_source="Benchmark",
+        execution_status="success",
+        execution_duration_seconds=Decimal("1"),
+        config_snapshot={},
+    )
+    session.add(run)
+    await session.flush()
+    return run.id
+
+
+async def main() -> None:
+    """Time conversion and both insert paths, then roll everything back."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--trades", type=int, default=100_000, help="Closed positions")
+    parser.add_argument(
+        "--database-url",
+        help="Scratch PostgreSQL database (default: in-memory SQLite)",
+    )
+    args = parser.parse_args()
+
+    if args.database_url:
+        url = args.database_url.replace("postgresql://", "postgresql+asyncpg://")
+    else:
+        url = "sqlite+aiosqlite:///:memory:"
+    engine = create_async_engine(url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    report = synthetic_positions_report(args.trades)
+    timings: list[tuple[str, float]] = []
+
+    async with session_maker() as session:
+        bulk_run = await create_run(session, "Bulk")
+        started = time.perf_counter()
+        rows, _ = positions_to_trade_rows(bulk_run, report)
+        timings.append(("Column-wise conversion", time.perf_counter() - started))
+
+        started = time.perf_counter()
+        await BacktestRepository(session).bulk_insert_trades(rows)
+        timings.append(
+            (f"bulk_insert_trades ({engine.dialect.name})", time.perf_counter() - started)
+        )
+
+        orm_run = await create_run(session, "ORM")
+        started = time.perf_counter()
+        session.add_all(
+            Trade(**dict(zip(TRADE_INSERT_COLUMNS, (orm_run, *row[1:])))) for row in rows
+        )
+        await session.flush()
+        timings.append(("ORM add_all + flush", time.perf_counter() - started))
+
+        await session.rollback()
+
+    await engine.dispose()
+
+    print("=" * 60)
+    print(f"Trade persistence: {args.trades:,} closed positions")
+    print("=" * 60)
+    print(f"{'Step':<36}{'Seconds':>10}{'Trades/s':>14}")
+    print("-" * 60)
+    for label, seconds in timings:
+        print(f"{label:<36}{seconds:>10.2f}{args.trades / seconds:>14,.0f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
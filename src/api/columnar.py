@@ -0,0 +1,75 @@
+"""
+Columnar Arrow responses for chart REST endpoints.
+
+Chart endpoints return JSON by default. Clients sending
+``Accept: application/vnd.apache.arrow.stream`` instead receive a single
+Arrow IPC stream whose columns are contiguous typed arrays, built from NumPy
+arrays without creating a Python object per point.
+"""
+
+from typing import Mapping, Sequence
+
+import numpy as np
+import pyarrow as pa
+from fastapi import Request
+from fastapi.responses import Response
+
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+# OpenAPI documentation for endpoints that can answer with an Arrow stream
+ARROW_RESPONSE_DOC = {
+    "content": {ARROW_STREAM_MEDIA_TYPE: {}},
+    "description": "Columnar Arrow IPC stream (send Accept: " + ARROW_STREAM_MEDIA_TYPE + ")",
+}
+
+
+def wants_arrow(request: Request) -> bool:
+    """
+    Check whether the client asked for an Arrow IPC stream.
+
+    Args:
+        request: Incoming request
+
+    Returns:
+        True if the Accept header lists the Arrow stream media type
+
+    Example:
+        >>> if wants_arrow(request):
+        ...     return arrow_response({"time": times, "value": values})
+    """
+    accept = request.headers.get("accept", "")
+    return any(
+        part.split(";")[0].strip().lower() == ARROW_STREAM_MEDIA_TYPE for part in accept.split(",")
+    )
+
+
+def arrow_response(
+    columns: Mapping[str, np.ndarray | Sequence | pa.Array],
+    metadata: Mapping[str, object] | None = None,
+) -> Response:
+    """
+    Serialize columns as a single-batch Arrow IPC stream response.
+
+    Args:
+        columns: Column name to values (NumPy arrays are wrapped zero-copy)
+        metadata: Scalar response fields stored as schema metadata
+
+    Returns:
+        Response with the Arrow stream body and media type
+
+    Example:
+        >>> arrow_response({"time": times, "close": closes}, {"symbol": "AAPL"})
+    """
+    table = pa.table(dict(columns))
+    if metadata:
+        table = table.replace_schema_metadata({key: str(value) for key, value in metadata.items()})
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+
+    return Response(
+        content=sink.getvalue().to_pybytes(),
+        media_type=ARROW_STREAM_MEDIA_TYPE,
+        headers={"Vary": "Accept"},
+    )
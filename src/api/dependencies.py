@@ -6,16 +6,22 @@ and service instances.
 """
 
 import os
+import threading
+from pathlib import Path
 from typing import Annotated, AsyncGenerator
 
 from fastapi import Depends
 from fastapi.templating import Jinja2Templates
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.config import get_settings
 from src.db.repositories.backtest_repository import BacktestRepository
 from src.db.session import get_session as get_db_session
+from src.services.backtest_jobs import BacktestJobManager
 from src.services.backtest_query import BacktestQueryService
 from src.services.data_catalog import DataCatalogService
+from src.services.indicator_series import INDICATORS_DIR_NAME, IndicatorSeriesCache
+from src.services.shared_bars import SharedBarCache
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -101,24 +107,148 @@ def get_templates() -> Jinja2Templates:
     return Jinja2Templates(directory="templates")
 
 
+# Process-wide DataCatalogService shared by all requests (see get_data_catalog_service)
+_data_catalog_service: DataCatalogService | None = None
+_data_catalog_lock = threading.Lock()
+
+
 def get_data_catalog_service() -> DataCatalogService:
     """
-    Get DataCatalogService instance for Parquet catalog operations.
+    Get the shared DataCatalogService instance for Parquet catalog operations.
 
-    Creates a DataCatalogService using the NAUTILUS_PATH environment variable,
-    or defaults to "./data/catalog" if not set.
+    The service is created once per process using the NAUTILUS_PATH environment
+    variable (or "./data/catalog" if not set) and reused by every request, so
+    request latency does not depend on catalog size. Catalog changes made by
+    other processes are picked up by the application's refresh watcher or the
+    admin refresh endpoint.
 
     Returns:
-        DataCatalogService instance
+        Shared DataCatalogService instance
 
     Example:
         >>> @router.get("/")
         ... def route(catalog: DataCatalog):
         ...     bars = catalog.query_bars("AAPL.NASDAQ", start, end)
     """
-    catalog_path = os.environ.get("NAUTILUS_PATH", "./data/catalog")
-    return DataCatalogService(catalog_path=catalog_path)
+    global _data_catalog_service
+
+    # Reason: Sync routes resolve dependencies in a threadpool, so guard
+    # construction with double-checked locking
+    if _data_catalog_service is None:
+        with _data_catalog_lock:
+            if _data_catalog_service is None:
+                catalog_path = os.environ.get("NAUTILUS_PATH", "./data/catalog")
+                _data_catalog_service = DataCatalogService(catalog_path=catalog_path)
+
+    return _data_catalog_service
+
+
+def reset_data_catalog_service() -> None:
+    """
+    Drop the shared DataCatalogService so the next request creates a new one.
+
+    Called on application shutdown.
+    """
+    global _data_catalog_service
+
+    with _data_catalog_lock:
+        _data_catalog_service = None
 
 
 # Type alias for DataCatalogService dependency
 DataCatalog = Annotated[DataCatalogService, Depends(get_data_catalog_service)]
+
+
+# Process-wide indicator series cache (see get_indicator_series_cache)
+_indicator_series_cache: IndicatorSeriesCache | None = None
+
+
+def get_indicator_series_cache() -> IndicatorSeriesCache:
+    """
+    Get the shared cache of backtest indicator overlay series.
+
+    Series are kept in an in-process LRU sized by the indicator_cache_entries
+    setting, backed by sidecar Parquet files in the catalog's .indicators
+    directory (also written by backtest workers when a run is persisted).
+
+    Returns:
+        Shared IndicatorSeriesCache instance
+
+    Example:
+        >>> @router.get("/indicators/{run_id}")
+        ... async def route(indicator_cache: IndicatorCache):
+        ...     series = indicator_cache.get(run_id, key)
+    """
+    global _indicator_series_cache
+
+    if _indicator_series_cache is None:
+        with _data_catalog_lock:
+            if _indicator_series_cache is None:
+                catalog_path = os.environ.get("NAUTILUS_PATH", "./data/catalog")
+                _indicator_series_cache = IndicatorSeriesCache(
+                    Path(catalog_path) / INDICATORS_DIR_NAME,
+                    max_entries=get_settings().indicator_cache_entries,
+                )
+
+    return _indicator_series_cache
+
+
+# Type alias for IndicatorSeriesCache dependency
+IndicatorCache = Annotated[IndicatorSeriesCache, Depends(get_indicator_series_cache)]
+
+
+# Process-wide backtest job manager (see get_backtest_job_manager)
+_backtest_job_manager: BacktestJobManager | None = None
+
+
+def get_backtest_job_manager() -> BacktestJobManager:
+    """
+    Get the shared BacktestJobManager that runs web UI backtests.
+
+    The manager and its worker process pool are created on first use, sized
+    from the backtest_worker_processes and backtest_max_queued_jobs settings.
+    Catalog bar series are shared with the workers through shared memory
+    unless backtest_shared_bar_series is 0.
+    Only async routes use it, so no locking is required.
+
+    Returns:
+        Shared BacktestJobManager instance
+
+    Example:
+        >>> @router.post("/run")
+        ... async def route(jobs: BacktestJobs):
+        ...     job = jobs.submit(bt_request, timeout_seconds=300)
+    """
+    global _backtest_job_manager
+
+    if _backtest_job_manager is None:
+        settings = get_settings()
+        shared_bars = None
+        if settings.backtest_shared_bar_series > 0:
+            shared_bars = SharedBarCache(
+                get_data_catalog_service(), max_entries=settings.backtest_shared_bar_series
+            )
+        _backtest_job_manager = BacktestJobManager(
+            max_workers=settings.backtest_worker_processes,
+            max_queued=settings.backtest_max_queued_jobs,
+            shared_bars=shared_bars,
+        )
+
+    return _backtest_job_manager
+
+
+def shutdown_backtest_job_manager() -> None:
+    """
+    Stop the shared BacktestJobManager's worker pool, if one was started.
+
+    Called on application shutdown.
+    """
+    global _backtest_job_manager
+
+    if _backtest_job_manager is not None:
+        _backtest_job_manager.shutdown()
+        _backtest_job_manager = None
+
+
+# Type alias for BacktestJobManager dependency
+BacktestJobs = Annotated[BacktestJobManager, Depends(get_backtest_job_manager)]
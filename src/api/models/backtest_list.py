@@ -118,7 +118,10 @@ class BacktestListPage(BaseModel):
         backtests: Page of backtest items
         page: Current page number (1-indexed)
         page_size: Results per page
-        total_count: Total backtests in system
+        total_count: Total backtests in system, or a lower bound if total_is_estimate
+        total_is_estimate: total_count stopped at the count cap
+        next_cursor: Cursor of the last row when another page follows
+        previous_cursor: Cursor of the first row when a page precedes
         total_pages: Calculated pages
         has_next: More pages available
         has_previous: Previous page exists
@@ -138,6 +141,9 @@ class BacktestListPage(BaseModel):
     page: int = Field(1, ge=1, description="Current page number (1-indexed)")
     page_size: int = Field(20, description="Results per page")
     total_count: int = Field(0, ge=0, description="Total backtests in system")
+    total_is_estimate: bool = Field(False, description="total_count is a lower bound")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page")
+    previous_cursor: Optional[str] = Field(None, description="Cursor for the previous page")
 
     @computed_field  # type: ignore[prop-decorator]
     @property
@@ -151,7 +157,9 @@ class BacktestListPage(BaseModel):
     @property
     def has_next(self) -> bool:
         """Whether there is a next page."""
-        return self.page < self.total_pages
+        if self.next_cursor is not None:
+            return True
+        return self.page < self.total_pages and not self.total_is_estimate
 
     @computed_field  # type: ignore[prop-decorator]
     @property
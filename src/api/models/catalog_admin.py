@@ -0,0 +1,29 @@
+"""
+Pydantic models for catalog administration API.
+
+Defines response models for catalog maintenance operations.
+"""
+
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+
+class CatalogRefreshResponse(BaseModel):
+    """
+    Result of a catalog availability refresh.
+
+    Attributes:
+        changed: Whether the availability cache changed
+        entries: Number of instrument/bar type combinations now available
+        refreshed_at: When the refresh completed (UTC)
+
+    Example:
+        >>> response = CatalogRefreshResponse(
+        ...     changed=True, entries=12, refreshed_at=datetime.now(timezone.utc)
+        ... )
+    """
+
+    changed: bool = Field(..., description="Whether the availability cache changed")
+    entries: int = Field(..., ge=0, description="Available instrument/bar type combinations")
+    refreshed_at: datetime = Field(..., description="Refresh completion time (UTC)")
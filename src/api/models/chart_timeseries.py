@@ -29,6 +29,9 @@ TIMEFRAME_TO_BAR_TYPE = {
     Timeframe.ONE_DAY: "1-DAY-LAST",
 }
 
+# Upper bound for the max_points query parameter of chart endpoints
+MAX_CHART_POINTS = 20_000
+
 
 class Candle(BaseModel):
     """
@@ -69,6 +72,7 @@ class TimeseriesResponse(BaseModel):
         symbol: Trading symbol (e.g., "AAPL")
         timeframe: Bar timeframe used
         candles: List of OHLCV candles sorted by time ascending
+        bars_per_candle: Source bars merged into each candle (1 = not aggregated)
 
     Example:
         >>> response = TimeseriesResponse(
@@ -81,3 +85,4 @@ class TimeseriesResponse(BaseModel):
     symbol: str = Field(..., description="Trading symbol")
     timeframe: str = Field(..., description="Bar timeframe")
     candles: list[Candle] = Field(default_factory=list, description="OHLCV candles")
+    bars_per_candle: int = Field(default=1, ge=1, description="Source bars merged into each candle")
@@ -12,6 +12,7 @@ from uuid import UUID
 from pydantic import BaseModel, Field, computed_field
 
 from src.db.models.backtest import BacktestRun
+from src.db.models.backtest_summary import BacktestSummary
 
 
 class RecentBacktestItem(BaseModel):
@@ -54,6 +55,34 @@ class RecentBacktestItem(BaseModel):
         return str(self.run_id)[:8]
 
 
+class DashboardRollup(BaseModel):
+    """
+    Aggregate statistics for one strategy or instrument.
+
+    Attributes:
+        name: Strategy name or instrument symbol
+        total_runs: Count of runs, successful or failed
+        successful_runs: Count of successful runs
+        avg_return: Mean total return of successful runs
+        best_sharpe_ratio: Highest Sharpe ratio achieved
+        worst_max_drawdown: Worst (most negative) drawdown
+
+    Example:
+        >>> rollup = DashboardRollup(name="AAPL", total_runs=12, successful_runs=11)
+    """
+
+    name: str = Field(..., description="Strategy name or instrument symbol")
+    total_runs: int = Field(default=0, ge=0, description="Count of runs")
+    successful_runs: int = Field(default=0, ge=0, description="Count of successful runs")
+    avg_return: Optional[Decimal] = Field(default=None, description="Mean total return")
+    best_sharpe_ratio: Optional[Decimal] = Field(
+        default=None, description="Highest Sharpe ratio achieved"
+    )
+    worst_max_drawdown: Optional[Decimal] = Field(
+        default=None, description="Worst (most negative) drawdown"
+    )
+
+
 class DashboardSummary(BaseModel):
     """
     Aggregate statistics displayed on the home dashboard.
@@ -65,6 +94,8 @@ class DashboardSummary(BaseModel):
         worst_max_drawdown: Worst (most negative) drawdown (None if no success)
         worst_drawdown_strategy: Strategy with worst drawdown
         recent_backtests: Last 5 executed backtests
+        strategy_rollups: Per-strategy statistics, most-run first
+        instrument_rollups: Per-instrument statistics, most-run first
 
     Example:
         >>> summary = DashboardSummary(
@@ -93,6 +124,12 @@ class DashboardSummary(BaseModel):
     recent_backtests: list[RecentBacktestItem] = Field(
         default_factory=list, description="Last 5 executed backtests"
     )
+    strategy_rollups: list[DashboardRollup] = Field(
+        default_factory=list, description="Most-run strategies"
+    )
+    instrument_rollups: list[DashboardRollup] = Field(
+        default_factory=list, description="Most-run instruments"
+    )
 
 
 def to_recent_item(run: BacktestRun) -> RecentBacktestItem:
@@ -124,3 +161,23 @@ def to_recent_item(run: BacktestRun) -> RecentBacktestItem:
         created_at=run.created_at,
         total_return=total_return,
     )
+
+
+def to_rollup(summary: BacktestSummary) -> DashboardRollup:
+    """
+    Map a BacktestSummary rollup row to a DashboardRollup view model.
+
+    Args:
+        summary: Strategy or instrument scoped BacktestSummary
+
+    Returns:
+        DashboardRollup for dashboard display
+    """
+    return DashboardRollup(
+        name=summary.scope_key,
+        total_runs=summary.total_runs,
+        successful_runs=summary.successful_runs,
+        avg_return=summary.avg_return,
+        best_sharpe_ratio=summary.best_sharpe_ratio,
+        worst_max_drawdown=summary.worst_max_drawdown,
+    )
@@ -4,9 +4,13 @@ Filter and sort state models for interactive backtest lists.
 Provides data structures for filtering, sorting, and pagination state management.
 """
 
-from datetime import date
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
 from enum import Enum
-from typing import Optional
+from typing import Any, Optional
 
 from pydantic import BaseModel, Field, model_validator
 
@@ -37,6 +41,73 @@ class SortColumn(str, Enum):
     EXECUTION_STATUS = "execution_status"
 
 
+# Sort columns read from performance_metrics; NULL for failed runs
+METRIC_SORT_COLUMNS = frozenset(
+    {SortColumn.TOTAL_RETURN, SortColumn.SHARPE_RATIO, SortColumn.MAX_DRAWDOWN}
+)
+
+
+def encode_cursor(sort_value: Any, row_id: int) -> str:
+    """
+    Encode a keyset position as an opaque URL-safe token.
+
+    Args:
+        sort_value: Value of the sort column at the row (datetime, Decimal, str or None)
+        row_id: Internal id of the row, the tiebreaker within equal sort values
+
+    Returns:
+        Token to pass back as FilterState.after or FilterState.before
+
+    Example:
+        >>> token = encode_cursor(datetime(2024, 1, 1, tzinfo=timezone.utc), 42)
+        >>> decode_cursor(token, SortColumn.CREATED_AT)
+        (datetime.datetime(2024, 1, 1, 0, 0, tzinfo=datetime.timezone.utc), 42)
+    """
+    if isinstance(sort_value, datetime):
+        sort_value = sort_value.isoformat()
+    elif isinstance(sort_value, Decimal):
+        sort_value = str(sort_value)
+    payload = json.dumps([sort_value, row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str, sort: SortColumn) -> tuple[Any, int]:
+    """
+    Decode a token produced by encode_cursor for the given sort column.
+
+    Args:
+        token: Cursor token from a previous page
+        sort: Sort column the token was produced for
+
+    Returns:
+        Tuple of (typed sort value or None, row id)
+
+    Raises:
+        ValueError: If the token is malformed or does not fit the sort column
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded))
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise ValueError(f"Malformed cursor: {token!r}") from e
+
+    if not isinstance(row_id, int) or not (sort_value is None or isinstance(sort_value, str)):
+        raise ValueError(f"Malformed cursor: {token!r}")
+    if sort_value is None:
+        if sort not in METRIC_SORT_COLUMNS:
+            raise ValueError(f"Cursor has no value for {sort.value}")
+        return None, row_id
+
+    try:
+        if sort == SortColumn.CREATED_AT:
+            return datetime.fromisoformat(sort_value), row_id
+        if sort in METRIC_SORT_COLUMNS:
+            return Decimal(sort_value), row_id
+    except (ValueError, InvalidOperation) as e:
+        raise ValueError(f"Cursor value does not fit {sort.value}: {sort_value!r}") from e
+    return sort_value, row_id
+
+
 class FilterState(BaseModel):
     """
     Complete filter, sort, and pagination state for backtest list.
@@ -49,8 +120,10 @@ class FilterState(BaseModel):
         status: Filter by execution status
         sort: Column to sort by
         order: Sort direction (asc/desc)
-        page: Current page number (1-indexed)
+        page: Current page number (1-indexed), used for display once cursors are set
         page_size: Number of results per page
+        after: Cursor of the last row of the previous page (next-page link)
+        before: Cursor of the first row of the following page (previous-page link)
 
     Example:
         >>> state = FilterState(
@@ -82,6 +155,12 @@ class FilterState(BaseModel):
     order: SortOrder = Field(default=SortOrder.DESC, description="Sort direction")
     page: int = Field(default=1, ge=1, description="Current page number")
     page_size: int = Field(default=20, ge=1, le=100, description="Results per page")
+    after: Optional[str] = Field(
+        default=None, max_length=512, description="Return rows after this cursor"
+    )
+    before: Optional[str] = Field(
+        default=None, max_length=512, description="Return rows before this cursor"
+    )
 
     @model_validator(mode="after")
     def validate_date_range(self) -> "FilterState":
@@ -91,6 +170,18 @@ class FilterState(BaseModel):
                 raise ValueError("End date must be on or after start date")
         return self
 
+    @model_validator(mode="after")
+    def validate_cursor_direction(self) -> "FilterState":
+        """Ensure at most one of after and before is set."""
+        if self.after and self.before:
+            raise ValueError("Only one of after and before may be set")
+        return self
+
+    @property
+    def has_filters(self) -> bool:
+        """Whether any filter (not sort or pagination) is applied."""
+        return any([self.strategy, self.instrument, self.date_from, self.date_to, self.status])
+
     def to_query_params(self) -> dict[str, str]:
         """
         Convert filter state to URL query parameters.
@@ -118,6 +209,10 @@ class FilterState(BaseModel):
         params["order"] = self.order.value
         params["page"] = str(self.page)
         params["page_size"] = str(self.page_size)
+        if self.after:
+            params["after"] = self.after
+        if self.before:
+            params["before"] = self.before
         return params
 
     def with_page(self, page: int) -> "FilterState":
@@ -128,9 +223,9 @@ class FilterState(BaseModel):
             page: New page number
 
         Returns:
-            New FilterState instance with updated page
+            New FilterState instance with updated page and no cursor
         """
-        return self.model_copy(update={"page": page})
+        return self.model_copy(update={"page": page, "after": None, "before": None})
 
     def with_sort(self, column: SortColumn) -> "FilterState":
         """
@@ -148,7 +243,9 @@ class FilterState(BaseModel):
             new_order = SortOrder.ASC if self.order == SortOrder.DESC else SortOrder.DESC
         else:
             new_order = SortOrder.DESC
-        return self.model_copy(update={"sort": column, "order": new_order, "page": 1})
+        return self.model_copy(
+            update={"sort": column, "order": new_order, "page": 1, "after": None, "before": None}
+        )
 
     def clear_filters(self) -> "FilterState":
         """
@@ -0,0 +1,95 @@
+"""
+Pydantic models for the parameter sweep API.
+
+Defines response models for ranking the runs of a parameter sweep.
+"""
+
+from typing import Any, Literal
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from src.db.models.backtest import BacktestRun
+
+SweepRankMetric = Literal["sharpe_ratio", "total_return", "sortino_ratio", "max_drawdown"]
+
+
+class SweepRunItem(BaseModel):
+    """
+    One run of a parameter sweep.
+
+    Attributes:
+        run_id: Backtest run UUID
+        rank: 1-based position in the ranking
+        parameters: Strategy configuration used for the run
+        execution_status: "success" or "failed"
+        total_return: Total return (None for failed runs)
+        sharpe_ratio: Sharpe ratio
+        sortino_ratio: Sortino ratio
+        max_drawdown: Maximum drawdown
+        total_trades: Number of trades
+        error_message: Error details for failed runs
+
+    Example:
+        >>> item = SweepRunItem(
+        ...     run_id=uuid4(), rank=1, parameters={"fast_period": 10},
+        ...     execution_status="success", sharpe_ratio=1.4,
+        ... )
+    """
+
+    run_id: UUID
+    rank: int = Field(..., ge=1)
+    parameters: dict[str, Any] = Field(default_factory=dict)
+    execution_status: str
+    total_return: float | None = None
+    sharpe_ratio: float | None = None
+    sortino_ratio: float | None = None
+    max_drawdown: float | None = None
+    total_trades: int = 0
+    error_message: str | None = None
+
+
+class SweepResponse(BaseModel):
+    """
+    Ranked runs of a parameter sweep.
+
+    Attributes:
+        sweep_id: Parameter sweep identifier
+        rank_by: Metric used for ranking
+        runs: Runs ordered best-first
+    """
+
+    sweep_id: UUID
+    rank_by: SweepRankMetric
+    runs: list[SweepRunItem]
+
+
+def _as_float(value: Any) -> float | None:
+    """Convert an optional Decimal metric to float."""
+    return float(value) if value is not None else None
+
+
+def to_sweep_run_item(run: BacktestRun, rank: int) -> SweepRunItem:
+    """
+    Convert a BacktestRun to a SweepRunItem.
+
+    Args:
+        run: Backtest run with metrics loaded
+        rank: 1-based position in the ranking
+
+    Returns:
+        SweepRunItem view of the run
+    """
+    metrics = run.metrics
+    return SweepRunItem(
+        run_id=run.run_id,
+        rank=rank,
+        parameters=(run.config_snapshot or {}).get("config", {}),
+        execution_status=run.execution_status,
+        total_return=_as_float(metrics.total_return) if metrics else None,
+        sharpe_ratio=_as_float(metrics.sharpe_ratio) if metrics else None,
+        sortino_ratio=_as_float(metrics.sortino_ratio) if metrics else None,
+        max_drawdown=_as_float(metrics.max_drawdown) if metrics else None,
+        total_trades=metrics.total_trades if metrics else 0,
+        error_message=run.error_message,
+    )
@@ -0,0 +1,53 @@
+"""
+Catalog admin API endpoint.
+
+Lets operators force the shared DataCatalogService to pick up catalog changes
+immediately instead of waiting for the periodic refresh.
+"""
+
+from datetime import datetime, timezone
+
+import structlog
+from fastapi import APIRouter, Query
+
+from src.api.dependencies import DataCatalog
+from src.api.models.catalog_admin import CatalogRefreshResponse
+
+router = APIRouter()
+logger = structlog.get_logger(__name__)
+
+
+@router.post(
+    "/catalog/refresh",
+    response_model=CatalogRefreshResponse,
+    summary="Refresh catalog availability",
+    description="Re-validate the shared catalog availability cache against disk",
+)
+def refresh_catalog(
+    catalog: DataCatalog,
+    force: bool = Query(default=True, description="Rescan every bar type directory"),
+) -> CatalogRefreshResponse:
+    """
+    Refresh the shared catalog availability cache.
+
+    Args:
+        catalog: Shared DataCatalogService dependency
+        force: Rescan all bar type directories instead of only changed ones
+
+    Returns:
+        CatalogRefreshResponse summarizing the refresh
+    """
+    changed = catalog.refresh_availability(force=force)
+
+    logger.info(
+        "catalog_refresh_requested",
+        force=force,
+        changed=changed,
+        entries=len(catalog.availability_cache),
+    )
+
+    return CatalogRefreshResponse(
+        changed=changed,
+        entries=len(catalog.availability_cache),
+        refreshed_at=datetime.now(timezone.utc),
+    )
@@ -4,51 +4,50 @@ Equity API endpoint for equity curve and drawdown data.
 Provides portfolio value and drawdown time series.
 """
 
-from datetime import datetime
+from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException
+import numpy as np
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import Response
 
+from src.api.columnar import ARROW_RESPONSE_DOC, arrow_response, wants_arrow
 from src.api.dependencies import BacktestService
 from src.api.models.chart_equity import DrawdownPoint, EquityPoint, EquityResponse
 from src.api.models.chart_errors import ErrorDetail
+from src.api.models.chart_timeseries import MAX_CHART_POINTS
+from src.utils.downsampling import lttb_indices
 
 router = APIRouter()
 
 
-def calculate_drawdown(equity_values: list[float]) -> list[float]:
+def calculate_drawdown(equity_values: np.ndarray) -> np.ndarray:
     """
     Calculate drawdown percentages from equity curve.
 
     Args:
-        equity_values: List of portfolio values
+        equity_values: Portfolio values in time order
 
     Returns:
-        List of drawdown percentages (negative numbers)
+        Drawdown percentages from the running peak (zero or negative),
+        rounded to 2 decimals
 
     Example:
-        >>> calculate_drawdown([100000, 105000, 100000, 110000])
-        [0.0, 0.0, -4.76, 0.0]
+        >>> calculate_drawdown(np.array([100000, 105000, 100000, 110000]))
+        array([ 0.  ,  0.  , -4.76,  0.  ])
     """
-    if not equity_values:
-        return []
-
-    drawdowns = []
-    peak = equity_values[0]
-
-    for value in equity_values:
-        if value > peak:
-            peak = value
-        drawdown = ((value - peak) / peak) * 100 if peak > 0 else 0.0
-        drawdowns.append(round(drawdown, 2))
-
-    return drawdowns
+    equity_values = np.asarray(equity_values, dtype=np.float64)
+    peak = np.maximum.accumulate(equity_values) if len(equity_values) else equity_values
+    with np.errstate(divide="ignore", invalid="ignore"):
+        drawdown = np.where(peak > 0, (equity_values - peak) / peak * 100, 0.0)
+    return np.round(drawdown, 2)
 
 
 @router.get(
     "/equity/{run_id}",
     response_model=EquityResponse,
     responses={
+        200: ARROW_RESPONSE_DOC,
         404: {"model": ErrorDetail, "description": "Backtest not found"},
         422: {"description": "Validation error"},
     },
@@ -56,18 +55,32 @@ def calculate_drawdown(equity_values: list[float]) -> list[float]:
     description="Returns portfolio value and drawdown time series",
 )
 async def get_equity(
+    request: Request,
     run_id: UUID,
     service: BacktestService,
-) -> EquityResponse:
+    max_points: Optional[int] = Query(
+        default=None,
+        ge=4,
+        le=MAX_CHART_POINTS,
+        description="Decimate the curve to at most this many points (LTTB)",
+    ),
+) -> EquityResponse | Response:
     """
     Get equity curve and drawdown data for a backtest run.
 
+    With ``Accept: application/vnd.apache.arrow.stream`` the curve is returned
+    as an Arrow IPC stream with int64 ``time`` and float64 ``equity`` and
+    ``drawdown`` columns.
+
     Args:
+        request: Incoming request (Accept header selects the format)
         run_id: Backtest run UUID
         service: BacktestQueryService dependency
+        max_points: Optional point budget; longer curves are decimated with
+            Largest-Triangle-Three-Buckets, always keeping the deepest drawdown
 
     Returns:
-        EquityResponse with equity and drawdown arrays
+        EquityResponse with equity and drawdown arrays, or an Arrow stream response
 
     Raises:
         HTTPException: 404 if backtest not found
@@ -81,64 +94,53 @@ async def get_equity(
             detail=f"Backtest run {run_id} not found",
         )
 
-    # Extract equity curve from config_snapshot
-    config = backtest.config_snapshot or {}
-    equity_data = config.get("equity_curve", [])
-
-    # If no equity curve in config, generate a simple 2-point curve as fallback
-    if not equity_data and backtest.metrics:
-        # Create start and end points using initial capital and final balance
-        start_timestamp = int(backtest.start_date.timestamp())
-        end_timestamp = int(backtest.end_date.timestamp())
-        initial_capital = float(backtest.initial_capital)
-        final_balance = float(backtest.metrics.final_balance)
-
-        equity_data = [
-            {"time": start_timestamp, "value": initial_capital},
-            {"time": end_timestamp, "value": final_balance},
-        ]
-
-    # Convert to EquityPoint objects
-    equity_points = []
-    equity_values = []
-
-    for point in equity_data:
-        # Handle both timestamp and date string formats
-        time_value = point.get("time", "")
-        if isinstance(time_value, str):
-            # Convert date string to Unix timestamp
-            try:
-                dt = datetime.fromisoformat(time_value.replace("Z", "+00:00"))
-                time_value = int(dt.timestamp())
-            except (ValueError, AttributeError):
-                # If parsing fails, skip this point
-                continue
-        elif isinstance(time_value, (int, float)):
-            time_value = int(time_value)
-        else:
-            continue
-
-        equity_point = EquityPoint(
-            time=time_value,
-            value=float(point.get("value", 0)),
+    # Equity curves live in their own table; only this endpoint reads them
+    curve = await service.get_equity_curve(run_id)
+
+    if curve is not None:
+        equity_times = np.asarray(curve.times, dtype=np.int64)
+        equity_values = np.asarray(curve.values, dtype=np.float64)
+    elif backtest.metrics:
+        # No stored curve: fall back to a 2-point curve from initial capital
+        # to final balance
+        equity_times = np.array(
+            [int(backtest.start_date.timestamp()), int(backtest.end_date.timestamp())],
+            dtype=np.int64,
+        )
+        equity_values = np.array(
+            [float(backtest.initial_capital), float(backtest.metrics.final_balance)],
+            dtype=np.float64,
         )
-        equity_points.append(equity_point)
-        equity_values.append(equity_point.value)
+    else:
+        equity_times = np.array([], dtype=np.int64)
+        equity_values = np.array([], dtype=np.float64)
 
     # Calculate drawdown from equity values
     drawdown_values = calculate_drawdown(equity_values)
 
-    # Create DrawdownPoint objects
-    drawdown_points = []
-    for i, equity_point in enumerate(equity_points):
-        drawdown_point = DrawdownPoint(
-            time=equity_point.time,
-            value=drawdown_values[i] if i < len(drawdown_values) else 0.0,
+    if max_points is not None and len(equity_times) > max_points:
+        keep = lttb_indices(equity_times, equity_values, max_points - 1)
+        # Reason: LTTB follows the equity shape; the worst drawdown point is added
+        # explicitly so the drawdown chart never understates it.
+        keep = np.union1d(keep, [int(np.argmin(drawdown_values))])
+        equity_times = equity_times[keep]
+        equity_values = equity_values[keep]
+        drawdown_values = drawdown_values[keep]
+
+    if wants_arrow(request):
+        return arrow_response(
+            {"time": equity_times, "equity": equity_values, "drawdown": drawdown_values},
+            {"run_id": run_id},
         )
-        drawdown_points.append(drawdown_point)
 
     return EquityResponse(
         run_id=run_id,
-        equity=equity_points,
-        drawdown=drawdown_points,
+        equity=[
+            EquityPoint(time=time_value, value=value)
+            for time_value, value in zip(equity_times.tolist(), equity_values.tolist())
+        ],
+        drawdown=[
+            DrawdownPoint(time=time_value, value=value)
+            for time_value, value in zip(equity_times.tolist(), drawdown_values.tolist())
+        ],
     )
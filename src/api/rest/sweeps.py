@@ -0,0 +1,58 @@
+"""
+Parameter sweep API endpoint.
+
+Returns the runs of a parameter sweep ranked by a performance metric.
+"""
+
+from uuid import UUID
+
+from fastapi import APIRouter, HTTPException, Query
+
+from src.api.dependencies import BacktestService
+from src.api.models.chart_errors import ErrorDetail
+from src.api.models.sweep import SweepRankMetric, SweepResponse, to_sweep_run_item
+
+router = APIRouter()
+
+
+@router.get(
+    "/sweeps/{sweep_id}",
+    response_model=SweepResponse,
+    responses={
+        404: {"model": ErrorDetail, "description": "Sweep not found"},
+        422: {"description": "Validation error"},
+    },
+    summary="Get ranked parameter sweep runs",
+    description="Returns the runs of a parameter sweep ordered best-first by a metric",
+)
+async def get_sweep(
+    sweep_id: UUID,
+    service: BacktestService,
+    rank_by: SweepRankMetric = Query(default="sharpe_ratio", description="Ranking metric"),
+    limit: int = Query(default=100, ge=1, le=1000, description="Maximum runs to return"),
+) -> SweepResponse:
+    """
+    Get the runs of a parameter sweep ranked by a metric.
+
+    Args:
+        sweep_id: Parameter sweep UUID
+        service: BacktestQueryService dependency
+        rank_by: Metric to rank by
+        limit: Maximum runs to return
+
+    Returns:
+        SweepResponse with runs ordered best-first
+
+    Raises:
+        HTTPException: 404 if no runs belong to the sweep
+    """
+    runs = await service.get_sweep_runs(sweep_id, metric=rank_by, limit=limit)
+
+    if not runs:
+        raise HTTPException(status_code=404, detail=f"Sweep {sweep_id} not found")
+
+    return SweepResponse(
+        sweep_id=sweep_id,
+        rank_by=rank_by,
+        runs=[to_sweep_run_item(run, rank) for rank, run in enumerate(runs, start=1)],
+    )
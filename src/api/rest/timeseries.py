@@ -5,18 +5,26 @@ Provides TradingView-compatible JSON data from Parquet catalog.
 """
 
 from datetime import date, datetime, timezone
+from typing import Optional
 
-from fastapi import APIRouter, HTTPException, Query
+import numpy as np
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import Response
 
+from src.api.columnar import ARROW_RESPONSE_DOC, arrow_response, wants_arrow
 from src.api.dependencies import DataCatalog
 from src.api.models.chart_errors import ErrorDetail
 from src.api.models.chart_timeseries import (
+    MAX_CHART_POINTS,
     TIMEFRAME_TO_BAR_TYPE,
     Candle,
     Timeframe,
     TimeseriesResponse,
 )
+from src.services.data_catalog import DataCatalogService
 from src.services.exceptions import DataNotFoundError
+from src.services.shared_bars import BarArrays
+from src.utils.downsampling import OHLCVColumns, aggregate_ohlcv
 
 router = APIRouter()
 
@@ -42,10 +50,98 @@ def symbol_to_instrument_id(symbol: str) -> str:
     return f"{symbol}.NASDAQ"
 
 
+def bars_to_columns(bars: list) -> OHLCVColumns:
+    """
+    Convert Nautilus bars to column arrays for chart output.
+
+    Args:
+        bars: Nautilus Bar objects sorted by time ascending
+
+    Returns:
+        OHLCVColumns with times in Unix seconds
+    """
+    return OHLCVColumns(
+        # TradingView Lightweight Charts expects seconds since epoch
+        time=np.array([bar.ts_event // 1_000_000_000 for bar in bars], dtype=np.int64),
+        open=np.array([bar.open.as_double() for bar in bars], dtype=np.float64),
+        high=np.array([bar.high.as_double() for bar in bars], dtype=np.float64),
+        low=np.array([bar.low.as_double() for bar in bars], dtype=np.float64),
+        close=np.array([bar.close.as_double() for bar in bars], dtype=np.float64),
+        volume=np.array([bar.volume.as_double() for bar in bars], dtype=np.float64),
+    )
+
+
+def bar_arrays_to_columns(arrays: BarArrays) -> OHLCVColumns:
+    """
+    Convert catalog bar arrays to chart columns without per-bar objects.
+
+    Args:
+        arrays: Columnar bars decoded from the catalog
+
+    Returns:
+        OHLCVColumns with times in Unix seconds
+    """
+    return OHLCVColumns(
+        time=(arrays.ts_event // 1_000_000_000).astype(np.int64),
+        open=arrays.open,
+        high=arrays.high,
+        low=arrays.low,
+        close=arrays.close,
+        volume=arrays.volume,
+    )
+
+
+def load_chart_columns(
+    catalog: DataCatalogService,
+    instrument_id: str,
+    bar_type_spec: str,
+    start: datetime,
+    end: datetime,
+    columnar: bool = False,
+) -> OHLCVColumns:
+    """
+    Load chart columns, deriving the timeframe from finer bars if it isn't stored.
+
+    Args:
+        catalog: Catalog service
+        instrument_id: Nautilus instrument ID (e.g., "AAPL.NASDAQ")
+        bar_type_spec: Bar type spec of the requested timeframe
+        start: Inclusive start (UTC)
+        end: Inclusive end (UTC)
+        columnar: Decode Parquet columns directly instead of building Bar objects
+
+    Returns:
+        OHLCVColumns with times in Unix seconds
+
+    Raises:
+        DataNotFoundError: If neither stored nor derivable bars cover the range
+    """
+    try:
+        if columnar:
+            return bar_arrays_to_columns(
+                catalog.query_bar_arrays(instrument_id, bar_type_spec, start, end)
+            )
+        bars = catalog.query_bars(
+            instrument_id=instrument_id,
+            start=start,
+            end=end,
+            bar_type_spec=bar_type_spec,
+        )
+        return bars_to_columns(bars)
+    except DataNotFoundError:
+        # Reason: A stored timeframe with no bars in range is a real miss
+        if catalog.get_availability(instrument_id, bar_type_spec) is not None:
+            raise
+        # Reason: Timeframe was never fetched; aggregate it from finer stored bars
+        arrays = catalog.query_derived_bar_arrays(instrument_id, bar_type_spec, start, end)
+        return bar_arrays_to_columns(arrays)
+
+
 @router.get(
     "/timeseries",
     response_model=TimeseriesResponse,
     responses={
+        200: ARROW_RESPONSE_DOC,
         404: {"model": ErrorDetail, "description": "Market data not found"},
         422: {"description": "Validation error"},
     },
@@ -53,6 +149,7 @@ def symbol_to_instrument_id(symbol: str) -> str:
     description="Returns candlestick data for chart rendering from Parquet catalog",
 )
 def get_timeseries(
+    request: Request,
     catalog: DataCatalog,
     symbol: str = Query(
         ..., min_length=1, max_length=20, description="Trading symbol (e.g., AAPL)"
@@ -60,19 +157,34 @@ def get_timeseries(
     start: date = Query(..., description="Start date (ISO 8601)"),
     end: date = Query(..., description="End date (ISO 8601)"),
     timeframe: Timeframe = Query(default=Timeframe.ONE_MIN, description="Bar timeframe"),
-) -> TimeseriesResponse:
+    max_points: Optional[int] = Query(
+        default=None,
+        ge=2,
+        le=MAX_CHART_POINTS,
+        description="Aggregate consecutive bars so at most this many candles are returned",
+    ),
+) -> TimeseriesResponse | Response:
     """
     Get OHLCV time series data for chart rendering.
 
+    With ``Accept: application/vnd.apache.arrow.stream`` the candles are
+    returned as an Arrow IPC stream with int64 ``time`` and float64
+    ``open``/``high``/``low``/``close``/``volume`` columns, decoded straight
+    from the catalog Parquet files. ``symbol``, ``timeframe`` and
+    ``bars_per_candle`` are stored in the schema metadata.
+
     Args:
+        request: Incoming request (Accept header selects the format)
         catalog: DataCatalogService dependency
         symbol: Trading symbol (e.g., AAPL)
         start: Start date for data range
         end: End date for data range
         timeframe: Bar timeframe (default: 1_MIN)
+        max_points: Optional candle budget; larger ranges are merged into
+            OHLCV buckets of consecutive bars
 
     Returns:
-        TimeseriesResponse with candles array
+        TimeseriesResponse with candles array, or an Arrow stream response
 
     Raises:
         HTTPException: 404 if data not found, 422 if validation fails
@@ -95,35 +207,41 @@ def get_timeseries(
     bar_type_spec = TIMEFRAME_TO_BAR_TYPE[timeframe]
 
     try:
-        # Query bars from catalog
-        bars = catalog.query_bars(
-            instrument_id=instrument_id,
-            start=start_dt,
-            end=end_dt,
-            bar_type_spec=bar_type_spec,
+        columnar = wants_arrow(request)
+        columns = load_chart_columns(
+            catalog, instrument_id, bar_type_spec, start_dt, end_dt, columnar=columnar
         )
+        bucket_size = 1
+        if max_points is not None:
+            columns, bucket_size = aggregate_ohlcv(columns, max_points)
+
+        if columnar:
+            return arrow_response(
+                columns._asdict(),
+                {
+                    "symbol": symbol,
+                    "timeframe": timeframe.value,
+                    "bars_per_candle": bucket_size,
+                },
+            )
 
-        # Convert bars to candles
-        candles = []
-        for bar in bars:
-            # Convert nanosecond timestamp to seconds (Unix timestamp)
-            # TradingView Lightweight Charts expects seconds since epoch
-            ts_seconds = int(bar.ts_event / 1e9)
-
-            candle = Candle(
-                time=ts_seconds,
-                open=bar.open.as_double(),
-                high=bar.high.as_double(),
-                low=bar.low.as_double(),
-                close=bar.close.as_double(),
-                volume=int(bar.volume.as_double()),
+        candles = [
+            Candle(
+                time=int(columns.time[i]),
+                open=float(columns.open[i]),
+                high=float(columns.high[i]),
+                low=float(columns.low[i]),
+                close=float(columns.close[i]),
+                volume=int(columns.volume[i]),
             )
-            candles.append(candle)
+            for i in range(len(columns))
+        ]
 
         return TimeseriesResponse(
             symbol=symbol,
             timeframe=timeframe.value,
             candles=candles,
+            bars_per_candle=bucket_size,
         )
 
     except DataNotFoundError:
@@ -4,16 +4,21 @@ Trades API endpoint for trade markers and equity curve.
 Provides trade entry/exit points for chart overlay and equity curve generation.
 """
 
-import csv
-import io
 from typing import Literal
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, Query
-from fastapi.responses import Response
+import numpy as np
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy import select
 from sqlalchemy.sql import func
 
+from src.api.columnar import (
+    ARROW_RESPONSE_DOC,
+    ARROW_STREAM_MEDIA_TYPE,
+    arrow_response,
+    wants_arrow,
+)
 from src.api.dependencies import BacktestService, DbSession
 from src.api.models.chart_errors import ErrorDetail
 from src.api.models.chart_trades import TradeMarker, TradesResponse
@@ -26,19 +31,88 @@ from src.models.trade import (
     TradeListResponse,
     TradeStatistics,
 )
-from src.services.trade_analytics import (
-    calculate_drawdowns,
-    calculate_trade_statistics,
-    generate_equity_curve,
+from src.services.trade_analytics import generate_equity_curve
+from src.services.trade_export import (
+    arrow_chunks,
+    csv_chunks,
+    json_chunks,
+    parquet_chunks,
+    stream_trade_batches,
 )
 
 router = APIRouter()
 
+# Export format -> (media type, encoder of streamed trade batches)
+_EXPORT_FORMATS = {
+    "csv": ("text/csv; charset=utf-8", csv_chunks),
+    "json": ("application/json", json_chunks),
+    "parquet": ("application/vnd.apache.parquet", parquet_chunks),
+    "arrow": (ARROW_STREAM_MEDIA_TYPE, arrow_chunks),
+}
+
+
+def trade_marker_columns(rows: list) -> dict[str, np.ndarray]:
+    """
+    Build trade marker columns from raw trade rows.
+
+    Produces the same markers as the JSON endpoint (an entry marker per trade
+    plus an exit marker per closed trade, stably sorted by date) as column
+    arrays instead of one TradeMarker per marker.
+
+    Args:
+        rows: Tuples of (entry_timestamp, exit_timestamp, order_side,
+              entry_price, exit_price, quantity, profit_loss) ordered by entry
+
+    Returns:
+        Column name to array (time, side, price, quantity, pnl)
+    """
+    if not rows:
+        return {
+            "time": np.array([], dtype=str),
+            "side": np.array([], dtype=str),
+            "price": np.array([], dtype=np.float64),
+            "quantity": np.array([], dtype=np.float64),
+            "pnl": np.array([], dtype=np.float64),
+        }
+
+    entry_ts, exit_ts, sides, entry_price, exit_price, quantity, pnl = zip(*rows)
+    count = len(rows)
+    buy = np.array([side.upper() == "BUY" for side in sides])
+    closed = np.array([bool(ts is not None and price) for ts, price in zip(exit_ts, exit_price)])
+
+    # Reason: interleave entry/exit per trade so a stable sort keeps the JSON
+    # endpoint's marker order for markers on the same date
+    time = np.empty(2 * count, dtype=object)
+    time[0::2] = [ts.strftime("%Y-%m-%d") for ts in entry_ts]
+    time[1::2] = [ts.strftime("%Y-%m-%d") if ts is not None else "" for ts in exit_ts]
+    side = np.empty(2 * count, dtype=object)
+    side[0::2] = np.where(buy, "buy", "sell")
+    side[1::2] = np.where(buy, "sell", "buy")
+    price = np.empty(2 * count, dtype=np.float64)
+    price[0::2] = np.array(entry_price, dtype=np.float64)
+    price[1::2] = np.array([p or 0 for p in exit_price], dtype=np.float64)
+    qty = np.repeat(np.array(quantity, dtype=np.float64), 2)
+    marker_pnl = np.zeros(2 * count, dtype=np.float64)
+    marker_pnl[1::2] = np.array([p or 0 for p in pnl], dtype=np.float64)
+
+    keep = np.ones(2 * count, dtype=bool)
+    keep[1::2] = closed
+    time = time[keep].astype(str)
+    order = np.argsort(time, kind="stable")
+    return {
+        "time": time[order],
+        "side": side[keep][order].astype(str),
+        "price": price[keep][order],
+        "quantity": qty[keep][order],
+        "pnl": marker_pnl[keep][order],
+    }
+
 
 @router.get(
     "/trades/{run_id}",
     response_model=TradesResponse,
     responses={
+        200: ARROW_RESPONSE_DOC,
         404: {"model": ErrorDetail, "description": "Backtest not found"},
         422: {"description": "Validation error"},
     },
@@ -46,20 +120,27 @@ router = APIRouter()
     description="Returns trade entry/exit points for chart overlay",
 )
 async def get_trades(
+    request: Request,
     run_id: UUID,
     service: BacktestService,
     db: DbSession,
-) -> TradesResponse:
+) -> TradesResponse | Response:
     """
     Get trade markers for a backtest run.
 
+    With ``Accept: application/vnd.apache.arrow.stream`` the markers are
+    returned as an Arrow IPC stream with string ``time``/``side`` and float64
+    ``price``/``quantity``/``pnl`` columns, read without loading Trade objects.
+
     Args:
+        request: Incoming request (Accept header selects the format)
         run_id: Backtest run UUID
         service: BacktestQueryService dependency
         db: Database session dependency
 
     Returns:
-        TradesResponse with trade markers array (entry + exit markers per trade)
+        TradesResponse with trade markers array (entry + exit markers per trade),
+        or an Arrow stream response
 
     Raises:
         HTTPException: 404 if backtest not found
@@ -73,6 +154,22 @@ async def get_trades(
             detail=f"Backtest run {run_id} not found",
         )
 
+    if wants_arrow(request):
+        rows = await db.execute(
+            select(
+                Trade.entry_timestamp,
+                Trade.exit_timestamp,
+                Trade.order_side,
+                Trade.entry_price,
+                Trade.exit_price,
+                Trade.quantity,
+                Trade.profit_loss,
+            )
+            .where(Trade.backtest_run_id == backtest.id)
+            .order_by(Trade.entry_timestamp)
+        )
+        return arrow_response(trade_marker_columns(rows.all()), {"run_id": run_id})
+
     # Query trades from database using backtest's internal ID
     result = await db.execute(
         select(Trade).where(Trade.backtest_run_id == backtest.id).order_by(Trade.entry_timestamp)
@@ -217,12 +314,11 @@ async def get_equity_curve(
 async def get_trade_statistics(
     backtest_id: int,
     service: BacktestService,
-    db: DbSession,
 ) -> TradeStatistics:
     """
     Get comprehensive trade statistics for a backtest run.
 
-    Calculates detailed performance metrics from trade history including:
+    Returns detailed performance metrics from trade history including:
     - Trade counts (total, winning, losing, breakeven)
     - Win rate percentage
     - Profit metrics (total profit/loss, average, largest)
@@ -230,10 +326,12 @@ async def get_trade_statistics(
     - Consecutive win/loss streaks
     - Holding period statistics (average, max, min)
 
+    Statistics are computed once per run and read back from its persisted
+    trade analytics row.
+
     Args:
         backtest_id: Backtest run database ID
         service: BacktestQueryService dependency
-        db: Database session dependency
 
     Returns:
         TradeStatistics with comprehensive performance metrics
@@ -268,19 +366,7 @@ async def get_trade_statistics(
             detail=f"Backtest run with ID {backtest_id} not found",
         )
 
-    # Query trades for this backtest
-    result = await db.execute(
-        select(Trade).where(Trade.backtest_run_id == backtest_id).order_by(Trade.entry_timestamp)
-    )
-    trades = result.scalars().all()
-
-    # Convert SQLAlchemy models to Pydantic models
-    from src.models.trade import Trade as PydanticTrade
-
-    pydantic_trades = [PydanticTrade.model_validate(trade) for trade in trades]
-
-    # Calculate trade statistics
-    statistics = calculate_trade_statistics(pydantic_trades)
+    statistics, _ = await service.get_trade_analytics(backtest)
 
     return statistics
 
@@ -301,19 +387,18 @@ async def get_trade_statistics(
 async def get_drawdown_metrics(
     backtest_id: int,
     service: BacktestService,
-    db: DbSession,
 ) -> DrawdownMetrics:
     """
     Get comprehensive drawdown metrics for a backtest run.
 
     Analyzes equity curve to identify peak-to-trough drawdown periods, their
     recovery times, and provides comprehensive drawdown statistics including
-    the maximum drawdown and top 5 largest drawdown periods.
+    the maximum drawdown and top 5 largest drawdown periods. Like trade
+    statistics, the metrics are computed once per run and persisted.
 
     Args:
         backtest_id: Backtest run database ID
         service: BacktestQueryService dependency
-        db: Database session dependency
 
     Returns:
         DrawdownMetrics with:
@@ -355,25 +440,7 @@ async def get_drawdown_metrics(
             detail=f"Backtest run with ID {backtest_id} not found",
         )
 
-    # Query trades for this backtest
-    result = await db.execute(
-        select(Trade).where(Trade.backtest_run_id == backtest_id).order_by(Trade.entry_timestamp)
-    )
-    trades = result.scalars().all()
-
-    # Convert SQLAlchemy models to Pydantic models
-    from src.models.trade import Trade as PydanticTrade
-
-    pydantic_trades = [PydanticTrade.model_validate(trade) for trade in trades]
-
-    # Generate equity curve first
-    equity_curve = generate_equity_curve(
-        pydantic_trades,
-        backtest.initial_capital,
-    )
-
-    # Calculate drawdown metrics from equity curve
-    drawdown_metrics = calculate_drawdowns(equity_curve.points)
+    _, drawdown_metrics = await service.get_trade_analytics(backtest)
 
     return drawdown_metrics
 
@@ -518,35 +585,43 @@ async def get_backtest_trades(
 @router.get(
     "/backtests/{backtest_id}/export",
     responses={
+        200: {
+            "content": {media_type: {} for media_type, _ in _EXPORT_FORMATS.values()},
+            "description": "Trade file download, streamed in batches",
+        },
         404: {"model": ErrorDetail, "description": "Backtest not found"},
         422: {"description": "Validation error"},
     },
-    summary="Export trades to CSV or JSON",
+    summary="Export trades to CSV, JSON, Parquet or Arrow",
     description=(
-        "Exports all trades for a backtest run to CSV or JSON format for external analysis"
+        "Streams all trades for a backtest run as CSV, JSON, Parquet or an Arrow IPC "
+        "stream for external analysis"
     ),
 )
 async def export_trades(
     backtest_id: int,
     service: BacktestService,
     db: DbSession,
-    format: Literal["csv", "json"] = Query("csv", description="Export format (csv or json)"),
-) -> Response:
+    format: Literal["csv", "json", "parquet", "arrow"] = Query(
+        "csv", description="Export format (csv, json, parquet or arrow)"
+    ),
+) -> StreamingResponse:
     """
-    Export complete trade history to CSV or JSON format.
+    Stream complete trade history as CSV, JSON, Parquet or Arrow.
 
-    Exports all trades for a backtest run with full precision for all fields.
-    Useful for external analysis, importing into other tools, or archiving results.
+    Trades are read through a server-side cursor in batches and each batch is
+    encoded and sent as it arrives, so memory use does not grow with the
+    number of trades. All fields keep full precision; Parquet and Arrow keep
+    native timestamp and decimal types.
 
     Args:
         backtest_id: Backtest run database ID
         service: BacktestQueryService dependency
         db: Database session dependency
-        format: Export format (csv or json, default: csv)
+        format: Export format (csv, json, parquet or arrow, default: csv)
 
     Returns:
-        CSV file (text/csv) or JSON file (application/json) with Content-Disposition
-        header for file download
+        Streaming file download with Content-Disposition header
 
     Raises:
         HTTPException: 404 if backtest not found
@@ -571,17 +646,6 @@ async def export_trades(
             detail=f"Backtest run with ID {backtest_id} not found",
         )
 
-    # Query all trades for this backtest (no pagination for export)
-    result = await db.execute(
-        select(Trade).where(Trade.backtest_run_id == backtest_id).order_by(Trade.entry_timestamp)
-    )
-    trades = result.scalars().all()
-
-    # Convert SQLAlchemy models to Pydantic models
-    from src.models.trade import Trade as PydanticTrade
-
-    pydantic_trades = [PydanticTrade.model_validate(trade) for trade in trades]
-
     # Create descriptive filename with strategy, instrument, and dates
     strategy_name = backtest.strategy_name.replace(" ", "_")
     instrument = backtest.instrument_symbol
@@ -589,88 +653,11 @@ async def export_trades(
     end_date = backtest.end_date.strftime("%Y-%m-%d")
     base_filename = f"{strategy_name}_{instrument}_{start_date}_to_{end_date}_trades"
 
-    if format == "csv":
-        # Create CSV in memory
-        output = io.StringIO()
-        writer = csv.DictWriter(
-            output,
-            fieldnames=[
-                "instrument_id",
-                "trade_id",
-                "order_side",
-                "entry_timestamp",
-                "entry_price",
-                "exit_timestamp",
-                "exit_price",
-                "quantity",
-                "profit_loss",
-                "profit_pct",
-                "commission_amount",
-                "holding_period_seconds",
-            ],
-        )
-
-        writer.writeheader()
-
-        for trade in pydantic_trades:
-            writer.writerow(
-                {
-                    "instrument_id": trade.instrument_id,
-                    "trade_id": trade.trade_id,
-                    "order_side": trade.order_side,
-                    "entry_timestamp": trade.entry_timestamp.isoformat(),
-                    "entry_price": str(trade.entry_price),
-                    "exit_timestamp": trade.exit_timestamp.isoformat()
-                    if trade.exit_timestamp
-                    else "",
-                    "exit_price": str(trade.exit_price) if trade.exit_price else "",
-                    "quantity": str(trade.quantity),
-                    "profit_loss": str(trade.profit_loss) if trade.profit_loss else "",
-                    "profit_pct": str(trade.profit_pct) if trade.profit_pct else "",
-                    "commission_amount": str(trade.commission_amount)
-                    if trade.commission_amount
-                    else "",
-                    "holding_period_seconds": trade.holding_period_seconds or "",
-                }
-            )
-
-        csv_content = output.getvalue()
-
-        return Response(
-            content=csv_content,
-            media_type="text/csv; charset=utf-8",
-            headers={"Content-Disposition": f'attachment; filename="{base_filename}.csv"'},
-        )
-    else:  # format == "json"
-        # Export as JSON array
-        json_trades = [
-            {
-                "instrument_id": trade.instrument_id,
-                "trade_id": trade.trade_id,
-                "order_side": trade.order_side,
-                "entry_timestamp": trade.entry_timestamp.isoformat(),
-                "entry_price": str(trade.entry_price),
-                "exit_timestamp": trade.exit_timestamp.isoformat()
-                if trade.exit_timestamp
-                else None,
-                "exit_price": str(trade.exit_price) if trade.exit_price else None,
-                "quantity": str(trade.quantity),
-                "profit_loss": str(trade.profit_loss) if trade.profit_loss else None,
-                "profit_pct": str(trade.profit_pct) if trade.profit_pct else None,
-                "commission_amount": str(trade.commission_amount)
-                if trade.commission_amount
-                else None,
-                "holding_period_seconds": trade.holding_period_seconds,
-            }
-            for trade in pydantic_trades
-        ]
-
-        import json
-
-        json_content = json.dumps(json_trades, indent=2)
-
-        return Response(
-            content=json_content,
-            media_type="application/json",
-            headers={"Content-Disposition": f'attachment; filename="{base_filename}.json"'},
-        )
+    # Reason: The request-scoped session stays open until the response has been
+    # sent, so the cursor can be read while the body streams
+    media_type, encode = _EXPORT_FORMATS[format]
+    return StreamingResponse(
+        encode(stream_trade_batches(db, backtest_id)),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{base_filename}.{format}"'},
+    )
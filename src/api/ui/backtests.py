@@ -4,19 +4,17 @@ Backtests route handler for web UI.
 Provides paginated backtest list, detail view, and HTMX fragment endpoints.
 """
 
-import asyncio
 from datetime import date, datetime, timezone
 from typing import Any, Optional
 from uuid import UUID
 
 import structlog
 from fastapi import APIRouter, HTTPException, Query, Request, Response
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.templating import Jinja2Templates
 from pydantic import ValidationError
-from rich.console import Console
 
-from src.api.dependencies import BacktestService
+from src.api.dependencies import BacktestJobs, BacktestService
 from src.api.models.backtest_detail import to_detail_view
 from src.api.models.common import EmptyStateMessage
 from src.api.models.filter_models import (
@@ -32,27 +30,16 @@ from src.api.models.run_backtest import (
     BacktestRunFormData,
     StrategyOption,
 )
-from src.cli.commands._backtest_helpers import load_backtest_data
-from src.core.backtest_orchestrator import BacktestOrchestrator
 from src.core.strategy_registry import StrategyRegistry
+from src.models.backtest_job import BacktestJob, JobStatus
 from src.models.backtest_request import BacktestRequest
+from src.services.backtest_jobs import BacktestJobManager, BacktestQueueFullError
 
 logger = structlog.get_logger(__name__)
 
 router = APIRouter()
 templates = Jinja2Templates(directory="templates")
 
-# Quiet console for suppressing Rich output in web context.
-# TODO: pass console=None if load_backtest_data adds support for it,
-# avoiding the Rich dependency at module level.
-_quiet_console = Console(quiet=True)
-
-# Only one backtest can run at a time.
-# NOTE: This is a per-process lock — it does NOT prevent concurrent execution
-# across multiple uvicorn workers (--workers N). Acceptable for now since the
-# spec assumes single-process, synchronous execution.
-_backtest_lock = asyncio.Lock()
-
 # Sorted lists for template dropdowns
 DATA_SOURCES = sorted(VALID_DATA_SOURCES)
 TIMEFRAMES = list(VALID_TIMEFRAMES)
@@ -116,8 +103,8 @@ async def run_backtest_form(request: Request) -> HTMLResponse:
 
 
 @router.post("/run", response_class=HTMLResponse)
-async def run_backtest_submit(request: Request) -> Response:
-    """Submit backtest configuration, execute, and redirect to results."""
+async def run_backtest_submit(request: Request, jobs: BacktestJobs) -> Response:
+    """Validate backtest configuration, queue it and redirect to the job page."""
     form = await request.form()
     raw_data: dict[str, Any] = {
         "strategy": form.get("strategy", ""),
@@ -160,90 +147,119 @@ async def run_backtest_submit(request: Request) -> Response:
             request, templates.TemplateResponse("backtests/run.html", context)
         )
 
-    # Prevent concurrent backtest execution.
-    # NOTE: There is a small race window between locked() and `async with` below —
-    # a second request arriving in that gap would block on the lock rather than
-    # getting the 409. Acceptable for a single-user tool; for multi-user, replace
-    # with a database-level advisory lock or distributed mutex.
-    if _backtest_lock.locked():
-        logger.warning("Backtest submission rejected — another backtest is already running")
-        context = _build_run_context(
-            request,
-            execution_error="A backtest is already in progress. Please wait for it to complete.",
-            form_data=raw_data,
+    # Build backtest request
+    # LAST = last-traded price; standard for equity/crypto bar aggregation
+    bar_type_spec = f"{form_data.timeframe}-LAST"
+    start_dt = datetime.combine(form_data.start_date, datetime.min.time(), tzinfo=timezone.utc)
+    end_dt = datetime.combine(form_data.end_date, datetime.min.time(), tzinfo=timezone.utc)
+
+    try:
+        bt_request = BacktestRequest.from_cli_args(
+            strategy=form_data.strategy,
+            symbol=form_data.symbol,
+            start=start_dt,
+            end=end_dt,
+            bar_type_spec=bar_type_spec,
+            persist=True,
+            starting_balance=form_data.starting_balance,
+            data_source=form_data.data_source,
+            **form_data.strategy_params,
         )
+    except (ValueError, RuntimeError) as e:
+        logger.error("Failed to prepare backtest", error=str(e))
+        context = _build_run_context(request, execution_error=str(e), form_data=raw_data)
+        return _htmx_full_page_response(
+            request, templates.TemplateResponse("backtests/run.html", context)
+        )
+
+    # Data loading and execution happen in a worker process; the browser is
+    # sent to the job status page which polls until the run is persisted.
+    try:
+        job = jobs.submit(bt_request, timeout_seconds=form_data.timeout_seconds)
+    except BacktestQueueFullError as e:
+        logger.warning("Backtest submission rejected — job queue is full")
+        context = _build_run_context(request, execution_error=str(e), form_data=raw_data)
         return _htmx_full_page_response(
             request,
-            templates.TemplateResponse("backtests/run.html", context, status_code=409),
+            templates.TemplateResponse("backtests/run.html", context, status_code=429),
         )
 
-    async with _backtest_lock:
-        # Build backtest request
-        # LAST = last-traded price; standard for equity/crypto bar aggregation
-        bar_type_spec = f"{form_data.timeframe}-LAST"
-        start_dt = datetime.combine(form_data.start_date, datetime.min.time(), tzinfo=timezone.utc)
-        end_dt = datetime.combine(form_data.end_date, datetime.min.time(), tzinfo=timezone.utc)
+    logger.info("Backtest job submitted", job_id=str(job.job_id))
+    response = Response(status_code=200)
+    response.headers["HX-Redirect"] = f"/backtests/jobs/{job.job_id}"
+    return response
 
-        try:
-            bt_request = BacktestRequest.from_cli_args(
-                strategy=form_data.strategy,
-                symbol=form_data.symbol,
-                start=start_dt,
-                end=end_dt,
-                bar_type_spec=bar_type_spec,
-                persist=True,
-                starting_balance=form_data.starting_balance,
-                data_source=form_data.data_source,
-                **form_data.strategy_params,
-            )
-
-            data_result = await load_backtest_data(
-                data_source=form_data.data_source,
-                instrument_id=bt_request.instrument_id,
-                bar_type_spec=bar_type_spec,
-                start=start_dt,
-                end=end_dt,
-                console=_quiet_console,
-            )
-        except (ValueError, RuntimeError) as e:
-            logger.error("Failed to prepare backtest", error=str(e))
-            context = _build_run_context(request, execution_error=str(e), form_data=raw_data)
-            return _htmx_full_page_response(
-                request, templates.TemplateResponse("backtests/run.html", context)
-            )
-
-        # Execute backtest with timeout
-        orchestrator = BacktestOrchestrator()
-        try:
-            result, run_id = await asyncio.wait_for(
-                orchestrator.execute(bt_request, data_result.bars, data_result.instrument),
-                timeout=form_data.timeout_seconds,
-            )
-            logger.info("Backtest completed", run_id=str(run_id))
-            response = Response(status_code=200)
-            response.headers["HX-Redirect"] = f"/backtests/{run_id}"
-            return response
-        except asyncio.TimeoutError:
-            logger.warning("Backtest timed out", timeout=form_data.timeout_seconds)
-            context = _build_run_context(
-                request,
-                execution_error=(
-                    f"Backtest timed out after {form_data.timeout_seconds} seconds. "
-                    "Try a shorter date range or larger timeframe."
-                ),
-                form_data=raw_data,
-            )
-            return _htmx_full_page_response(
-                request, templates.TemplateResponse("backtests/run.html", context)
-            )
-        except (ValueError, RuntimeError) as e:
-            logger.error("Backtest execution failed", error=str(e))
-            context = _build_run_context(request, execution_error=str(e), form_data=raw_data)
-            return _htmx_full_page_response(
-                request, templates.TemplateResponse("backtests/run.html", context)
-            )
-        finally:
-            orchestrator.dispose()
+
+def _get_job_or_404(jobs: BacktestJobManager, job_id: UUID) -> BacktestJob:
+    """Look up a backtest job, raising 404 if it is unknown."""
+    job = jobs.get(job_id)
+    if job is None:
+        logger.warning("Backtest job not found", job_id=str(job_id))
+        raise HTTPException(status_code=404, detail=f"Backtest job {job_id} not found")
+    return job
+
+
+@router.get("/jobs/{job_id}", response_class=HTMLResponse)
+async def backtest_job_page(request: Request, job_id: UUID, jobs: BacktestJobs) -> Response:
+    """
+    Display the status page for a submitted backtest job.
+
+    Redirects to the results page if the job already succeeded.
+
+    Args:
+        request: FastAPI request object
+        job_id: Backtest job identifier
+        jobs: BacktestJobManager dependency
+
+    Returns:
+        HTMLResponse with the job status page, or a redirect to the results
+
+    Raises:
+        HTTPException: 404 if the job is unknown
+    """
+    job = _get_job_or_404(jobs, job_id)
+    if job.status == JobStatus.SUCCEEDED and job.run_id is not None:
+        return RedirectResponse(url=f"/backtests/{job.run_id}", status_code=303)
+
+    nav_state = NavigationState(
+        active_page="run_backtest",
+        breadcrumbs=[
+            BreadcrumbItem(label="Dashboard", url="/", is_current=False),
+            BreadcrumbItem(label="Backtests", url="/backtests", is_current=False),
+            BreadcrumbItem(label="Run Backtest", url="/backtests/run", is_current=False),
+            BreadcrumbItem(label="Job Status", url=None, is_current=True),
+        ],
+    )
+    context = {"request": request, "job": job, "nav_state": nav_state}
+    return templates.TemplateResponse("backtests/job.html", context)
+
+
+@router.get("/jobs/{job_id}/status", response_class=HTMLResponse)
+async def backtest_job_status(request: Request, job_id: UUID, jobs: BacktestJobs) -> Response:
+    """
+    Return the job status fragment polled by the job status page.
+
+    Once the job succeeds, responds with an HX-Redirect to the results page.
+
+    Args:
+        request: FastAPI request object
+        job_id: Backtest job identifier
+        jobs: BacktestJobManager dependency
+
+    Returns:
+        HTMLResponse with the status fragment, or an HX-Redirect response
+
+    Raises:
+        HTTPException: 404 if the job is unknown
+    """
+    job = _get_job_or_404(jobs, job_id)
+    if job.status == JobStatus.SUCCEEDED and job.run_id is not None:
+        response = Response(status_code=200)
+        response.headers["HX-Redirect"] = f"/backtests/{job.run_id}"
+        return response
+
+    context = {"request": request, "job": job}
+    return templates.TemplateResponse("backtests/partials/job_status.html", context)
 
 
 @router.get("/run/strategy-params/{strategy_name}", response_class=HTMLResponse)
@@ -279,6 +295,8 @@ async def backtest_list(
     order: SortOrder = Query(SortOrder.DESC),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    after: Optional[str] = Query(None, max_length=512),
+    before: Optional[str] = Query(None, max_length=512),
 ) -> HTMLResponse:
     """
     Render the backtest list page with filtering, sorting, and pagination.
@@ -289,19 +307,21 @@ async def backtest_list(
         request: FastAPI request object
         service: BacktestQueryService dependency
         strategy: Filter by strategy name (exact match)
-        instrument: Filter by instrument symbol (partial match)
+        instrument: Filter by instrument symbol (case-insensitive prefix)
         status: Filter by execution status
         sort: Column to sort by (default: created_at)
         order: Sort order (default: desc)
-        page: Page number (1-indexed, default 1)
+        page: Page number (1-indexed, default 1), shown alongside cursor links
         page_size: Results per page (default 20, max 100)
+        after: Cursor of the last row of the previous page
+        before: Cursor of the first row of the next page
 
     Returns:
         HTMLResponse with rendered backtest list template
 
     Example:
         >>> # GET /backtests
-        >>> # GET /backtests?strategy=SMA%20Crossover&page=2
+        >>> # GET /backtests?strategy=SMA%20Crossover&page=2&after=<next_cursor>
         >>> # GET /backtests?sort=sharpe_ratio&order=desc
     """
     logger.info(
@@ -328,6 +348,8 @@ async def backtest_list(
         order=order,
         page=page,
         page_size=page_size,
+        after=after or None,
+        before=None if after else before or None,
     )
 
     # Get filtered backtest list with error handling
@@ -395,6 +417,8 @@ async def backtest_list_fragment(
     order: SortOrder = Query(SortOrder.DESC),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    after: Optional[str] = Query(None, max_length=512),
+    before: Optional[str] = Query(None, max_length=512),
 ) -> HTMLResponse:
     """
     Render HTMX fragment for backtest table (partial page update).
@@ -406,18 +430,20 @@ async def backtest_list_fragment(
         request: FastAPI request object
         service: BacktestQueryService dependency
         strategy: Filter by strategy name (exact match)
-        instrument: Filter by instrument symbol (partial match)
+        instrument: Filter by instrument symbol (case-insensitive prefix)
         status: Filter by execution status
         sort: Column to sort by (default: created_at)
         order: Sort order (default: desc)
-        page: Page number (1-indexed, default 1)
+        page: Page number (1-indexed, default 1), shown alongside cursor links
         page_size: Results per page (default 20, max 100)
+        after: Cursor of the last row of the previous page
+        before: Cursor of the first row of the next page
 
     Returns:
         HTMLResponse with table fragment only
 
     Example:
-        >>> # GET /backtests/fragment?page=2
+        >>> # GET /backtests/fragment?page=2&after=<next_cursor>
         >>> # GET /backtests/fragment?strategy=SMA%20Crossover
         >>> # Used by HTMX hx-get for partial updates
     """
@@ -471,6 +497,8 @@ async def backtest_list_fragment(
         order=order,
         page=page,
         page_size=page_size,
+        after=after or None,
+        before=None if after else before or None,
     )
 
     # Get filtered backtest list with error handling
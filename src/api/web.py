@@ -5,15 +5,29 @@ Provides server-rendered HTML pages for browsing backtest results, viewing
 dashboard statistics, and navigating the system.
 """
 
+import asyncio
+from contextlib import asynccontextmanager, suppress
+from typing import AsyncIterator
+
+import structlog
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from nautilus_trader.common.component import init_logging
 
-from src.api.rest import equity, indicators, timeseries, trades
+from src.api.dependencies import (
+    get_data_catalog_service,
+    reset_data_catalog_service,
+    shutdown_backtest_job_manager,
+)
+from src.api.rest import catalog, equity, indicators, sweeps, timeseries, trades
 from src.api.ui import backtests, dashboard
+from src.config import get_settings
+from src.services.data_catalog import DataCatalogService
 from src.utils.logging import set_nautilus_log_guard
 
+logger = structlog.get_logger(__name__)
+
 # Pre-initialize Nautilus logging subsystem once for the process lifetime.
 # This prevents "Logging subsystem already initialized" errors when running
 # multiple backtests (each BacktestEngine / HistoricInteractiveBrokersClient
@@ -21,10 +35,51 @@ from src.utils.logging import set_nautilus_log_guard
 _log_guard = init_logging()
 set_nautilus_log_guard(_log_guard)
 
+
+async def _watch_catalog(service: DataCatalogService, interval: float) -> None:
+    """
+    Poll the catalog for changes made by other processes (CLI fetches, imports).
+
+    Each check costs one stat() per bar type directory, and runs in a worker
+    thread so it never blocks the event loop.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await asyncio.to_thread(service.refresh_availability)
+        except Exception as e:
+            logger.warning("catalog_refresh_failed", error=str(e))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Application lifespan: warm the shared catalog service and watch for changes.
+
+    On shutdown the backtest worker pool (started lazily on first submission)
+    is stopped as well.
+    """
+    service = await asyncio.to_thread(get_data_catalog_service)
+
+    interval = get_settings().catalog_refresh_interval
+    watcher = asyncio.create_task(_watch_catalog(service, interval)) if interval > 0 else None
+
+    try:
+        yield
+    finally:
+        if watcher is not None:
+            watcher.cancel()
+            with suppress(asyncio.CancelledError):
+                await watcher
+        shutdown_backtest_job_manager()
+        reset_data_catalog_service()
+
+
 app = FastAPI(
     title="NTrader Web UI",
     description="Web interface for NTrader backtesting system",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # Mount static files for CSS, JS, and vendor libraries
@@ -42,3 +97,9 @@ app.include_router(timeseries.router, prefix="/api", tags=["charts"])
 app.include_router(trades.router, prefix="/api", tags=["charts"])
 app.include_router(equity.router, prefix="/api", tags=["charts"])
 app.include_router(indicators.router, prefix="/api", tags=["charts"])
+
+# Register parameter sweep API router
+app.include_router(sweeps.router, prefix="/api", tags=["sweeps"])
+
+# Register admin API routers
+app.include_router(catalog.router, prefix="/api/admin", tags=["admin"])
@@ -33,11 +33,14 @@ class DataLoadResult:
         bars: List of loaded or generated Bar objects
         instrument: The instrument for the backtest
         data_source_used: Source description ("Parquet Catalog", "IBKR Auto-fetch", "Mock")
+        source_digest: Identity of the bars' catalog files (None if the bars
+                       did not come from the catalog alone)
     """
 
     bars: list[Bar]
     instrument: Instrument
     data_source_used: str
+    source_digest: str | None = None
 
 
 def apply_cli_overrides(
@@ -490,6 +493,7 @@ async def _load_kraken_data(
         bars=bars,
         instrument=instrument,
         data_source_used="Kraken",
+        source_digest=catalog_service.bar_source_digest(instrument_id, bar_type_spec, start, end),
     )
 
 
@@ -538,7 +542,11 @@ async def _load_catalog_data(
             f"   Available: {availability.start_date.strftime('%Y-%m-%d')} to "
             f"{availability.end_date.strftime('%Y-%m-%d')}"
         )
-        console.print("   Will attempt to fetch missing data from IBKR...", style="yellow")
+        missing = availability.missing_ranges(start, end)
+        console.print(
+            f"   Will attempt to fetch {len(missing)} missing range(s) from IBKR...",
+            style="yellow",
+        )
         data_source_used = "IBKR Auto-fetch"
     else:
         console.print("   Data available in catalog", style="green")
@@ -607,6 +615,7 @@ async def _load_catalog_data(
         bars=bars,
         instrument=instrument,
         data_source_used=data_source_used,
+        source_digest=catalog_service.bar_source_digest(instrument_id, bar_type_spec, start, end),
     )
 
 
@@ -617,11 +626,13 @@ async def execute_backtest(
     instrument: Instrument,
     console: Console,
     progress_message: str = "Running backtest...",
+    source_digest: str | None = None,
 ) -> tuple[BacktestResult, UUID | None]:
     """Execute backtest with progress indicator and proper cleanup.
 
     Wraps BacktestOrchestrator execution with:
     - Progress spinner display
+    - A notice when a stored identical run was reused
     - Guaranteed orchestrator disposal (even on error)
 
     Args:
@@ -630,6 +641,7 @@ async def execute_backtest(
         instrument: The instrument to trade
         console: Rich console for progress display
         progress_message: Custom message for the progress spinner
+        source_digest: Identity of the bars' catalog files (see DataLoadResult)
 
     Returns:
         Tuple of (BacktestResult, run_id if persisted else None)
@@ -647,9 +659,18 @@ async def execute_backtest(
             console=console,
         ) as progress:
             task = progress.add_task(progress_message, total=None)
-            result, run_id = await orchestrator.execute(request, bars, instrument)
+            result, run_id = await orchestrator.execute(
+                request, bars, instrument, source_digest=source_digest
+            )
             progress.update(task, completed=True)
 
+        if orchestrator.cached_run_id is not None:
+            console.print(
+                f"♻️  Reused the stored result of identical run {str(run_id)[:8]}... "
+                "(use --no-cache to re-run)",
+                style="yellow",
+            )
+
         return result, run_id
     finally:
         orchestrator.dispose()
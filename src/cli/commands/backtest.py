@@ -17,7 +17,10 @@ from src.cli.commands._backtest_helpers import (
 )
 from src.cli.commands.compare import compare_backtests
 from src.cli.commands.reproduce import reproduce_backtest
+from src.cli.commands.screen import screen_backtest
 from src.cli.commands.show import show_backtest_details
+from src.cli.commands.sweep import sweep_backtest
+from src.cli.commands.walk_forward import walk_forward_backtest
 from src.core.strategy_registry import StrategyRegistry
 from src.services.data_catalog import DataCatalogService
 from src.services.exceptions import (
@@ -140,6 +143,12 @@ def backtest():
     default=True,
     help="Save backtest results to database (default: persist)",
 )
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help="Always execute, even if a stored run has identical inputs",
+)
 def run_backtest(
     config_file: str | None,
     symbol: str | None,
@@ -153,6 +162,7 @@ def run_backtest(
     trade_size: int | None,
     timeframe: str | None,
     persist: bool,
+    no_cache: bool,
 ):
     """Run backtest with real market data.
 
@@ -168,6 +178,9 @@ def run_backtest(
       All parameters from command line.
       --symbol, --start, and --end are required.
 
+    A persisted run whose strategy, parameters, bars and engine settings
+    match a stored run reuses that run's result; --no-cache forces execution.
+
     \b
     Examples:
       backtest run configs/apolo_rsi_amd.yaml
@@ -201,6 +214,9 @@ def run_backtest(
             # Re-raise UsageError to let Click handle it
             raise
 
+        if no_cache:
+            request = request.model_copy(update={"use_cache": False})
+
         # Display mode indicator
         if config_file:
             console.print(f"🚀 Running backtest from config: {config_file}", style="cyan bold")
@@ -318,6 +334,7 @@ def run_backtest(
                 instrument=instrument,
                 console=console,
                 progress_message="Running backtest...",
+                source_digest=data_result.source_digest,
             )
 
             # Calculate total execution time
@@ -440,7 +457,10 @@ def list_backtests():
     asyncio.run(show_data_info())
 
 
-# Add show, compare, and reproduce commands to backtest group
+# Add show, compare, reproduce, sweep, screen, and walk-forward commands to backtest group
 backtest.add_command(show_backtest_details)
 backtest.add_command(compare_backtests)
 backtest.add_command(reproduce_backtest)
+backtest.add_command(sweep_backtest)
+backtest.add_command(screen_backtest)
+backtest.add_command(walk_forward_backtest)
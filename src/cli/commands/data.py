@@ -51,12 +51,20 @@ def data():
     default="skip",
     help="Conflict resolution: skip (default), overwrite, or merge",
 )
+@click.option(
+    "--chunk-size",
+    type=click.IntRange(min=1),
+    default=500_000,
+    show_default=True,
+    help="Rows read and written per chunk (bounds memory for large files)",
+)
 def import_data(
     csv: Path,
     symbol: str,
     venue: str,
     bar_type: str,
     conflict_mode: str,
+    chunk_size: int,
 ):
     """Import CSV market data directly to Parquet catalog."""
 
@@ -75,7 +83,7 @@ def import_data(
 
                 loader = CSVLoader(conflict_mode=conflict_mode.lower())
                 result = await loader.load_file(
-                    csv, symbol.upper(), venue.upper(), bar_type.upper()
+                    csv, symbol.upper(), venue.upper(), bar_type.upper(), chunk_size=chunk_size
                 )
 
                 progress.update(task, completed=True)
@@ -10,11 +10,26 @@ from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
+from src.api.models.filter_models import (
+    ExecutionStatus,
+    FilterState,
+    SortColumn,
+    SortOrder,
+    encode_cursor,
+)
+from src.db.repositories.backtest_repository import list_sort_value
 from src.db.repositories.backtest_repository_sync import SyncBacktestRepository
 from src.db.session_sync import get_sync_session
 
 console = Console()
 
+# --sort choices mapped to backtest list sort columns (always descending)
+HISTORY_SORT_COLUMNS = {
+    "date": SortColumn.CREATED_AT,
+    "return": SortColumn.TOTAL_RETURN,
+    "sharpe": SortColumn.SHARPE_RATIO,
+}
+
 
 @click.command(name="history")
 @click.option(
@@ -24,7 +39,12 @@ console = Console()
     help="Number of results to display (default: 20, max: 1000)",
 )
 @click.option("--strategy", default=None, type=str, help="Filter by strategy name")
-@click.option("--instrument", default=None, type=str, help="Filter by instrument symbol")
+@click.option(
+    "--instrument",
+    default=None,
+    type=str,
+    help="Filter by instrument symbol prefix (case-insensitive)",
+)
 @click.option(
     "--status",
     type=click.Choice(["success", "failed"], case_sensitive=False),
@@ -37,6 +57,12 @@ console = Console()
     default="date",
     help="Sort by: date (default), return, or sharpe",
 )
+@click.option(
+    "--after",
+    default=None,
+    type=str,
+    help="Continue after the cursor printed at the end of a previous page",
+)
 @click.option(
     "--strategy-summary",
     is_flag=True,
@@ -55,6 +81,7 @@ def list_backtest_history(
     instrument: str | None,
     status: str | None,
     sort: str,
+    after: str | None,
     strategy_summary: bool,
     show_params: bool,
 ):
@@ -72,8 +99,11 @@ def list_backtest_history(
         ntrader history --status success          # Show only successful backtests
         ntrader history --sort sharpe             # Sort by Sharpe ratio (best first)
         ntrader history --sort return --limit 10  # Top 10 by return
+        ntrader history --after <cursor>          # Next page of the previous listing
     """
-    _list_history_sync(limit, strategy, instrument, status, sort, strategy_summary, show_params)
+    _list_history_sync(
+        limit, strategy, instrument, status, sort, strategy_summary, show_params, after
+    )
 
 
 def _list_history_sync(
@@ -84,16 +114,23 @@ def _list_history_sync(
     sort: str,
     strategy_summary: bool,
     show_params: bool,
+    after: str | None = None,
 ):
     """
     Synchronous implementation of history listing.
 
+    Filters, sorting and paging all run in SQL through the same keyset
+    query as the web backtest list.
+
     Args:
         limit: Maximum number of results
         strategy: Optional strategy name filter
-        instrument: Optional instrument symbol filter
+        instrument: Optional instrument symbol prefix filter
         status: Optional execution status filter
         sort: Sort order (date, return, sharpe)
+        strategy_summary: Show aggregate statistics instead of the table
+        show_params: Add a parameters column
+        after: Cursor printed at the end of the previous page
     """
     try:
         with get_sync_session() as session:
@@ -110,30 +147,17 @@ def _list_history_sync(
                 # Enforce maximum limit
                 limit = min(limit, 1000)
 
-                # Query based on sort option
-                if sort == "sharpe":
-                    backtests = repository.find_top_performers_by_sharpe(limit=limit)
-                    # Apply strategy filter if provided
-                    if strategy:
-                        backtests = [bt for bt in backtests if bt.strategy_name == strategy]
-                elif sort == "return":
-                    backtests = repository.find_top_performers_by_return(limit=limit)
-                    # Apply strategy filter if provided
-                    if strategy:
-                        backtests = [bt for bt in backtests if bt.strategy_name == strategy]
-                else:  # sort == "date" (default)
-                    # Query based on filters
-                    if strategy:
-                        backtests = repository.find_by_strategy(strategy_name=strategy, limit=limit)
-                    else:
-                        backtests = repository.find_recent(limit=limit)
-
-                # Apply additional filters (instrument, status) in memory
-                if instrument:
-                    backtests = [bt for bt in backtests if bt.instrument_symbol == instrument]
-
-                if status:
-                    backtests = [bt for bt in backtests if bt.execution_status == status]
+                filter_state = FilterState(
+                    strategy=strategy,
+                    instrument=instrument,
+                    status=ExecutionStatus(status.lower()) if status else None,
+                    sort=HISTORY_SORT_COLUMNS[sort],
+                    order=SortOrder.DESC,
+                    after=after,
+                )
+                backtests, has_more = repository.find_filtered(
+                    filter_state, limit=limit, include_config=show_params
+                )
 
                 # Get total count if filtering by strategy (T161)
                 total_count = None
@@ -254,8 +278,10 @@ def _list_history_sync(
         console.print(f"\n✨ Showing {len(backtests)} of {limit} requested", style="dim")
 
         # Add helpful hints
-        if len(backtests) == limit:
-            console.print("💡 Tip: Use --limit to see more results (max 1000)", style="dim italic")
+        if has_more:
+            last = backtests[-1]
+            next_cursor = encode_cursor(list_sort_value(last, filter_state.sort), last.id)
+            console.print(f"💡 Next page: --after {next_cursor}", style="dim italic")
 
     except Exception as e:
         console.print(f"❌ Error: {e}", style="red")
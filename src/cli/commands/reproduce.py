@@ -10,9 +10,13 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from src.core.backtest_runner import MinimalBacktestRunner
+from src.config import get_settings
+from src.core.backtest_orchestrator import BacktestOrchestrator
+from src.core.strategy_factory import StrategyLoader
+from src.core.strategy_registry import StrategyRegistry
 from src.db.repositories.backtest_repository_sync import SyncBacktestRepository
 from src.db.session_sync import get_sync_session
+from src.models.backtest_request import BacktestRequest
 from src.services.exceptions import DataNotFoundError
 
 console = Console()
@@ -20,13 +24,21 @@ console = Console()
 
 @click.command(name="reproduce")
 @click.argument("run_id", type=str)
-def reproduce_backtest(run_id: str):
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help="Always execute, even if a stored run has identical inputs",
+)
+def reproduce_backtest(run_id: str, no_cache: bool):
     """
     Reproduce a previous backtest with its exact same configuration.
 
     Re-runs a backtest using the same strategy, parameters, and date range
     as a previous run. The new backtest creates a separate record linked
-    to the original via reproduced_from_run_id.
+    to the original via reproduced_from_run_id. If a stored run already has
+    identical inputs (strategy, parameters, bars, engine settings), its result
+    is shown instead of executing again, unless --no-cache is given.
 
     Arguments:
         run_id: UUID of the original backtest to reproduce
@@ -34,15 +46,16 @@ def reproduce_backtest(run_id: str):
     Example:
         ntrader backtest reproduce a1b2c3d4-e5f6-7890-abcd-ef1234567890
     """
-    asyncio.run(_reproduce_backtest_async(run_id))
+    asyncio.run(_reproduce_backtest_async(run_id, use_cache=not no_cache))
 
 
-async def _reproduce_backtest_async(run_id_str: str):
+async def _reproduce_backtest_async(run_id_str: str, use_cache: bool = True):
     """
     Async implementation of reproduce backtest command.
 
     Args:
         run_id_str: String representation of run_id UUID
+        use_cache: Reuse a stored run with an identical fingerprint
     """
     try:
         # Step 1: Validate and parse UUID
@@ -101,7 +114,13 @@ async def _reproduce_backtest_async(run_id_str: str):
 
         # Step 5: Validate strategy type
         valid_strategies = ["sma_crossover", "sma", "mean_reversion", "momentum"]
-        if strategy_type not in valid_strategies:
+        strategy_def = None
+        if strategy_type in valid_strategies:
+            try:
+                strategy_def = StrategyRegistry.get(strategy_type)
+            except KeyError:
+                pass
+        if strategy_def is None:
             console.print(
                 f"[red]❌ Unsupported strategy type: {strategy_type}[/red]\n"
                 f"[yellow]💡 Supported strategies: {', '.join(valid_strategies)}[/yellow]\n"
@@ -150,6 +169,9 @@ async def _reproduce_backtest_async(run_id_str: str):
                 )
 
                 instrument = catalog_service.load_instrument(instrument_id)
+                source_digest = catalog_service.bar_source_digest(
+                    instrument_id, bar_type_spec, start_date, end_date
+                )
 
                 progress.update(task, completed=True)
 
@@ -168,9 +190,26 @@ async def _reproduce_backtest_async(run_id_str: str):
 
         start_time = time.time()
 
+        orchestrator = BacktestOrchestrator()
         try:
-            # Initialize backtest runner with catalog data source
-            runner = MinimalBacktestRunner(data_source="catalog")
+            # Reason: Stored configs hold Decimals as strings; resolve them to typed values
+            request = BacktestRequest(
+                strategy_type=strategy_type,
+                strategy_path=strategy_def.strategy_path,
+                config_path=strategy_def.config_path,
+                strategy_config=StrategyLoader.build_strategy_params(
+                    strategy_type=strategy_def.name,
+                    overrides=strategy_params,
+                    settings=get_settings(),
+                ),
+                symbol=symbol,
+                instrument_id=instrument_id,
+                start_date=start_date,
+                end_date=end_date,
+                bar_type=bar_type_spec,
+                starting_balance=original_backtest.initial_capital,
+                use_cache=use_cache,
+            )
 
             # Run backtest with original parameters using loaded catalog data
             with Progress(
@@ -180,15 +219,12 @@ async def _reproduce_backtest_async(run_id_str: str):
             ) as progress:
                 task = progress.add_task("Running backtest...", total=None)
 
-                result, new_run_id = await runner.run_backtest_with_catalog_data(
-                    bars=bars,
-                    strategy_type=strategy_type,
-                    symbol=symbol,
-                    start=start_date,
-                    end=end_date,
-                    instrument=instrument,
+                result, new_run_id = await orchestrator.execute(
+                    request,
+                    bars,
+                    instrument,
                     reproduced_from_run_id=original_run_id,
-                    **strategy_params,
+                    source_digest=source_digest,
                 )
 
                 progress.update(task, completed=True)
@@ -196,14 +232,22 @@ async def _reproduce_backtest_async(run_id_str: str):
             execution_duration = time.time() - start_time
 
             # Step 8: Display results
-            # new_run_id is already set from the tuple unpacking above
+            if orchestrator.cached_run_id is not None:
+                headline = (
+                    "[bold green]✅ Identical run found, stored result reused[/bold green]\n"
+                    "[dim]Use --no-cache to execute again[/dim]\n\n"
+                )
+                run_label = "Stored Run ID"
+            else:
+                headline = "[bold green]✅ Backtest Reproduced Successfully![/bold green]\n\n"
+                run_label = "New Run ID"
 
             console.print(
                 Panel.fit(
-                    f"[bold green]✅ Backtest Reproduced Successfully![/bold green]\n\n"
+                    f"{headline}"
                     f"[bold]Original Run ID:[/bold] "
                     f"[yellow]{str(original_run_id)[:12]}...[/yellow]\n"
-                    f"[bold]New Run ID:[/bold] [green]{str(new_run_id)[:12]}...[/green]\n\n"
+                    f"[bold]{run_label}:[/bold] [green]{str(new_run_id)[:12]}...[/green]\n\n"
                     f"[dim]Execution time: {execution_duration:.2f}s[/dim]\n\n"
                     f"[bold cyan]Quick Commands:[/bold cyan]\n"
                     f"  View details: [dim]ntrader backtest show {new_run_id}[/dim]\n"
@@ -271,6 +315,9 @@ async def _reproduce_backtest_async(run_id_str: str):
             )
             sys.exit(1)
 
+        finally:
+            orchestrator.dispose()
+
     except Exception as e:
         console.print(f"[red]❌ Error: {e}[/red]")
         sys.exit(1)
@@ -0,0 +1,276 @@
+"""
+CLI command for vectorized signal screening.
+
+Values a whole parameter grid with a strategy's vectorized signal function,
+then reconciles the best candidates against full event-driven backtests.
+"""
+
+import asyncio
+from datetime import datetime
+
+import click
+from rich.console import Console
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, SpinnerColumn, TextColumn
+from rich.table import Table
+
+from src.cli.commands._backtest_helpers import load_backtest_data, resolve_backtest_request
+from src.cli.commands.sweep import RANK_METRICS
+from src.models.parameter_sweep import SweepSpec, parse_param_spec
+from src.models.signal_screen import ScreenSummary
+from src.services.exceptions import CatalogError
+from src.services.signal_screening import SignalScreeningService
+
+console = Console()
+
+
+def _validate_strategy(ctx, param, value):
+    """Validate strategy name against the registry (shared with `backtest run`)."""
+    # Reason: Deferred import, the backtest group module imports this one
+    from src.cli.commands.backtest import validate_strategy
+
+    return validate_strategy(ctx, param, value)
+
+
+@click.command(name="screen")
+@click.argument("config_file", type=click.Path(exists=True, dir_okay=False), required=False)
+@click.option(
+    "--param",
+    "-p",
+    "param_specs",
+    multiple=True,
+    required=True,
+    help="Search space: name=v1,v2,... or name=start:stop[:step] (repeatable)",
+)
+@click.option("--symbol", "-sym", help="Trading symbol (required in CLI mode)")
+@click.option(
+    "--strategy",
+    "-s",
+    default=None,
+    callback=_validate_strategy,
+    help="Strategy to screen (CLI mode only). Must provide a vectorized signal function.",
+)
+@click.option(
+    "--start",
+    "-st",
+    type=click.DateTime(formats=["%Y-%m-%d", "%Y-%m-%d %H:%M:%S"]),
+    help="Start date (YYYY-MM-DD or YYYY-MM-DD HH:MM:SS)",
+)
+@click.option(
+    "--end",
+    "-e",
+    type=click.DateTime(formats=["%Y-%m-%d", "%Y-%m-%d %H:%M:%S"]),
+    help="End date (YYYY-MM-DD or YYYY-MM-DD HH:MM:SS)",
+)
+@click.option(
+    "--data-source",
+    "-ds",
+    type=click.Choice(["catalog", "ibkr", "kraken", "mock"], case_sensitive=False),
+    default=None,
+    help="Data source to use (default: catalog)",
+)
+@click.option("--starting-balance", "-sb", type=float, default=None, help="Starting balance")
+@click.option(
+    "--timeframe",
+    "-t",
+    default=None,
+    type=click.Choice(
+        ["1-MINUTE", "5-MINUTE", "15-MINUTE", "1-HOUR", "4-HOUR", "1-DAY", "1-WEEK"],
+        case_sensitive=False,
+    ),
+    help="Bar timeframe (auto-detected from date format if not specified)",
+)
+@click.option(
+    "--rank-by",
+    type=click.Choice(RANK_METRICS),
+    default="sharpe_ratio",
+    help="Metric used to rank candidates",
+)
+@click.option("--top", type=int, default=10, help="Number of ranked candidates to display")
+@click.option(
+    "--reconcile",
+    "reconcile_top",
+    type=click.IntRange(min=0),
+    default=3,
+    help="Best candidates to re-run as full backtests (0 to skip)",
+)
+def screen_backtest(
+    config_file: str | None,
+    param_specs: tuple[str, ...],
+    symbol: str | None,
+    strategy: str | None,
+    start: datetime | None,
+    end: datetime | None,
+    data_source: str | None,
+    starting_balance: float | None,
+    timeframe: str | None,
+    rank_by: str,
+    top: int,
+    reconcile_top: int,
+):
+    """Screen a parameter grid with vectorized signals, then verify the best.
+
+    Every combination is valued from the strategy's signal function over NumPy
+    bar arrays (fills at bar close, no fees or slippage) instead of the
+    event-driven engine. The best --reconcile candidates are then re-run as
+    full backtests and both results are shown side by side. Nothing is saved.
+
+    \b
+    Examples:
+      backtest screen --symbol AAPL --start 2004-01-01 --end 2024-12-31 \\
+          -s sma_crossover -p fast_period=5:50:5 -p slow_period=20:200:10
+      backtest screen --symbol AAPL --start 2024-01-01 --end 2024-12-31 \\
+          -s momentum -p fast_period=5:30 -p slow_period=40:100:10 --reconcile 5
+    """
+    try:
+        params = dict(parse_param_spec(spec) for spec in param_specs)
+        spec = SweepSpec(params=params)
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="--param")
+
+    request, resolved_data_source = resolve_backtest_request(
+        config_file=config_file,
+        symbol=symbol,
+        strategy=strategy,
+        start=start,
+        end=end,
+        data_source=data_source,
+        starting_balance=starting_balance,
+        persist=False,
+        console=console,
+        timeframe=timeframe,
+    )
+
+    async def run_screen_async() -> ScreenSummary:
+        yaml_data = None
+        if resolved_data_source == "mock":
+            import yaml
+
+            with open(config_file, "r") as f:  # type: ignore[arg-type]
+                yaml_data = yaml.safe_load(f)
+
+        data_result = await load_backtest_data(
+            data_source=resolved_data_source,  # type: ignore[arg-type]
+            instrument_id=request.instrument_id,
+            bar_type_spec=request.bar_type,
+            start=request.start_date,
+            end=request.end_date,
+            console=console,
+            yaml_data=yaml_data,
+        )
+
+        service = SignalScreeningService()
+        console.print(
+            f"🔎 Screening {request.strategy_type} on {request.symbol}: "
+            f"{spec.grid_size} grid combinations over {len(data_result.bars):,} bars",
+            style="cyan bold",
+        )
+        summary = service.screen(request, spec, data_result.bars)
+        if reconcile_top == 0:
+            return summary
+
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            console=console,
+        ) as progress:
+            task = progress.add_task("Reconciling with full backtests...", total=None)
+
+            def on_progress(completed: int, total: int) -> None:
+                progress.update(task, completed=completed, total=total)
+
+            return await service.reconcile(
+                summary,
+                request,
+                data_result.bars,
+                data_result.instrument,
+                top=reconcile_top,
+                rank_by=rank_by,
+                on_progress=on_progress,
+            )
+
+    try:
+        summary = asyncio.run(run_screen_async())
+    except CatalogError as e:
+        raise click.ClickException(f"Failed to load data: {e}")
+    except ValueError as e:
+        raise click.ClickException(str(e))
+
+    _display_screen_results(summary, rank_by=rank_by, top=top)
+
+
+def _display_screen_results(summary: ScreenSummary, *, rank_by: str, top: int):
+    """Print the ranked candidates and the reconciliation report."""
+    ranked = summary.ranked(rank_by)
+    param_names = list(summary.candidates[0].params) if summary.candidates else []
+
+    table = Table(
+        title=f"Top {min(top, len(ranked))} by {rank_by} "
+        f"({len(summary.candidates)} screened, approximate)"
+    )
+    table.add_column("#", style="dim", justify="right")
+    for name in param_names:
+        table.add_column(name, style="cyan")
+    table.add_column("Return", justify="right")
+    table.add_column("Sharpe", justify="right")
+    table.add_column("Max DD", justify="right")
+    table.add_column("Trades", justify="right")
+
+    for rank, candidate in enumerate(ranked[:top], start=1):
+        row = [str(rank)]
+        row += [str(candidate.params[name]) for name in param_names]
+        row += [
+            f"{candidate.total_return:.2%}",
+            f"{candidate.sharpe_ratio:.3f}" if candidate.sharpe_ratio is not None else "N/A",
+            f"{candidate.max_drawdown:.2%}",
+            str(candidate.total_trades),
+        ]
+        table.add_row(*row)
+
+    console.print()
+    console.print(table)
+
+    if summary.reconciliations:
+        report = Table(title="Reconciliation: screened vs full backtest")
+        for name in param_names:
+            report.add_column(name, style="cyan")
+        report.add_column("Return (screen / full)", justify="right")
+        report.add_column("Sharpe (screen / full)", justify="right")
+        report.add_column("Trades (screen / full)", justify="right")
+        report.add_column("Return Δ", justify="right")
+
+        for item in summary.reconciliations:
+            screened, full = item.screened, item.full
+            row = [str(screened.params[name]) for name in param_names]
+            if not full.success:
+                row += [f"{screened.total_return:.2%} / failed", "", "", full.error_message or ""]
+                report.add_row(*row)
+                continue
+            row += [
+                f"{screened.total_return:.2%} / {_pct(full.total_return)}",
+                f"{_ratio(screened.sharpe_ratio)} / {_ratio(full.sharpe_ratio)}",
+                f"{screened.total_trades} / {full.total_trades}",
+                _pct(item.return_difference),
+            ]
+            report.add_row(*row)
+
+        console.print()
+        console.print(report)
+
+    if summary.skipped:
+        console.print(
+            f"⚠️  {summary.skipped} combinations rejected by parameter validation",
+            style="yellow",
+        )
+    console.print(f"⏱️  Screened in {summary.duration_seconds:.2f}s")
+
+
+def _pct(value: float | None) -> str:
+    """Format an optional fraction as a percentage."""
+    return f"{value:.2%}" if value is not None else "N/A"
+
+
+def _ratio(value: float | None) -> str:
+    """Format an optional ratio."""
+    return f"{value:.3f}" if value is not None else "N/A"
@@ -0,0 +1,253 @@
+"""
+CLI command for running parallel parameter sweeps.
+
+Loads bars once, runs every parameter combination of a search space across
+a pool of worker processes and ranks the results.
+"""
+
+import asyncio
+from datetime import datetime
+
+import click
+from rich.console import Console
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, SpinnerColumn, TextColumn
+from rich.table import Table
+
+from src.cli.commands._backtest_helpers import load_backtest_data, resolve_backtest_request
+from src.models.parameter_sweep import SweepMode, SweepSpec, SweepSummary, parse_param_spec
+from src.services.exceptions import CatalogError
+from src.services.parameter_sweep import ParameterSweepService
+
+console = Console()
+
+RANK_METRICS = ["sharpe_ratio", "total_return", "max_drawdown"]
+
+
+def _validate_strategy(ctx, param, value):
+    """Validate strategy name against the registry (shared with `backtest run`)."""
+    # Reason: Deferred import, the backtest group module imports this one
+    from src.cli.commands.backtest import validate_strategy
+
+    return validate_strategy(ctx, param, value)
+
+
+@click.command(name="sweep")
+@click.argument("config_file", type=click.Path(exists=True, dir_okay=False), required=False)
+@click.option(
+    "--param",
+    "-p",
+    "param_specs",
+    multiple=True,
+    required=True,
+    help="Search space: name=v1,v2,... or name=start:stop[:step] (repeatable)",
+)
+@click.option("--symbol", "-sym", help="Trading symbol (required in CLI mode)")
+@click.option(
+    "--strategy",
+    "-s",
+    default=None,
+    callback=_validate_strategy,
+    help="Strategy to sweep (CLI mode only). Use 'backtest list' to see available strategies.",
+)
+@click.option(
+    "--start",
+    "-st",
+    type=click.DateTime(formats=["%Y-%m-%d", "%Y-%m-%d %H:%M:%S"]),
+    help="Start date (YYYY-MM-DD or YYYY-MM-DD HH:MM:SS)",
+)
+@click.option(
+    "--end",
+    "-e",
+    type=click.DateTime(formats=["%Y-%m-%d", "%Y-%m-%d %H:%M:%S"]),
+    help="End date (YYYY-MM-DD or YYYY-MM-DD HH:MM:SS)",
+)
+@click.option(
+    "--data-source",
+    "-ds",
+    type=click.Choice(["catalog", "ibkr", "kraken", "mock"], case_sensitive=False),
+    default=None,
+    help="Data source to use (default: catalog)",
+)
+@click.option("--starting-balance", "-sb", type=float, default=None, help="Starting balance")
+@click.option(
+    "--timeframe",
+    "-t",
+    default=None,
+    type=click.Choice(
+        ["1-MINUTE", "5-MINUTE", "15-MINUTE", "1-HOUR", "4-HOUR", "1-DAY", "1-WEEK"],
+        case_sensitive=False,
+    ),
+    help="Bar timeframe (auto-detected from date format if not specified)",
+)
+@click.option(
+    "--mode",
+    type=click.Choice([m.value for m in SweepMode], case_sensitive=False),
+    default=SweepMode.GRID.value,
+    help="grid: every combination; random: sample --samples combinations",
+)
+@click.option("--samples", "-n", type=int, default=None, help="Combinations to sample (random)")
+@click.option("--seed", type=int, default=None, help="Random seed for reproducible sampling")
+@click.option("--workers", "-w", type=int, default=None, help="Worker processes (default: CPUs)")
+@click.option(
+    "--rank-by",
+    type=click.Choice(RANK_METRICS),
+    default="sharpe_ratio",
+    help="Metric used to rank results",
+)
+@click.option("--top", type=int, default=10, help="Number of ranked results to display")
+@click.option(
+    "--persist/--no-persist",
+    default=True,
+    help="Save all runs to the database under a common sweep ID (default: persist)",
+)
+def sweep_backtest(
+    config_file: str | None,
+    param_specs: tuple[str, ...],
+    symbol: str | None,
+    strategy: str | None,
+    start: datetime | None,
+    end: datetime | None,
+    data_source: str | None,
+    starting_balance: float | None,
+    timeframe: str | None,
+    mode: str,
+    samples: int | None,
+    seed: int | None,
+    workers: int | None,
+    rank_by: str,
+    top: int,
+    persist: bool,
+):
+    """Sweep strategy parameters in parallel over the same bars.
+
+    Supports the same CONFIG and CLI modes as `backtest run`; swept parameters
+    override the base strategy configuration.
+
+    \b
+    Examples:
+      backtest sweep --symbol AAPL --start 2024-01-01 --end 2024-12-31 \\
+          -s sma_crossover -p fast_period=5:20:5 -p slow_period=30,50,100
+      backtest sweep configs/apolo_rsi_amd.yaml \\
+          -p rsi_period=2:6 -p buy_threshold=5:20:5 --mode random -n 10 --seed 42
+    """
+    try:
+        params = dict(parse_param_spec(spec) for spec in param_specs)
+        spec = SweepSpec(params=params, mode=SweepMode(mode), samples=samples, seed=seed)
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="--param / --mode / --samples")
+
+    request, resolved_data_source = resolve_backtest_request(
+        config_file=config_file,
+        symbol=symbol,
+        strategy=strategy,
+        start=start,
+        end=end,
+        data_source=data_source,
+        starting_balance=starting_balance,
+        persist=persist,
+        console=console,
+        timeframe=timeframe,
+    )
+
+    async def run_sweep_async() -> SweepSummary:
+        yaml_data = None
+        if resolved_data_source == "mock":
+            import yaml
+
+            with open(config_file, "r") as f:  # type: ignore[arg-type]
+                yaml_data = yaml.safe_load(f)
+
+        data_result = await load_backtest_data(
+            data_source=resolved_data_source,  # type: ignore[arg-type]
+            instrument_id=request.instrument_id,
+            bar_type_spec=request.bar_type,
+            start=request.start_date,
+            end=request.end_date,
+            console=console,
+            yaml_data=yaml_data,
+        )
+
+        service = ParameterSweepService(max_workers=workers)
+        console.print(
+            f"🚀 Sweeping {request.strategy_type} on {request.symbol}: "
+            f"{spec.grid_size} grid combinations, {service.max_workers} workers",
+            style="cyan bold",
+        )
+
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            console=console,
+        ) as progress:
+            task = progress.add_task("Running backtests...", total=None)
+
+            def on_progress(completed: int, total: int) -> None:
+                progress.update(task, completed=completed, total=total)
+
+            return await service.run(
+                request,
+                spec,
+                data_result.bars,
+                data_result.instrument,
+                persist=persist,
+                on_progress=on_progress,
+            )
+
+    try:
+        summary = asyncio.run(run_sweep_async())
+    except CatalogError as e:
+        raise click.ClickException(f"Failed to load data: {e}")
+    except ValueError as e:
+        raise click.ClickException(str(e))
+
+    _display_sweep_results(summary, rank_by=rank_by, top=top, persist=persist)
+
+
+def _display_sweep_results(summary: SweepSummary, *, rank_by: str, top: int, persist: bool):
+    """Print the ranked sweep results table."""
+    ranked = summary.ranked(rank_by)
+    failed = [run for run in summary.runs if not run.success]
+    param_names = list(summary.runs[0].params) if summary.runs else []
+
+    table = Table(title=f"Top {min(top, len(ranked))} by {rank_by} ({len(summary.runs)} runs)")
+    table.add_column("#", style="dim", justify="right")
+    for name in param_names:
+        table.add_column(name, style="cyan")
+    table.add_column("Total Return", justify="right")
+    table.add_column("Sharpe", justify="right")
+    table.add_column("Max DD", justify="right")
+    table.add_column("Trades", justify="right")
+    if persist:
+        table.add_column("Run ID", style="dim")
+
+    for rank, run in enumerate(ranked[:top], start=1):
+        row = [str(rank)]
+        row += [str(run.params[name]) for name in param_names]
+        row += [
+            f"{run.total_return:,.2f}" if run.total_return is not None else "N/A",
+            f"{run.sharpe_ratio:.3f}" if run.sharpe_ratio is not None else "N/A",
+            f"{run.max_drawdown:.2%}" if run.max_drawdown is not None else "N/A",
+            str(run.total_trades),
+        ]
+        if persist:
+            row.append(str(run.run_id)[:8] if run.run_id else "-")
+        table.add_row(*row)
+
+    console.print()
+    console.print(table)
+
+    if summary.skipped:
+        console.print(
+            f"⚠️  {summary.skipped} combinations rejected by parameter validation",
+            style="yellow",
+        )
+    if failed:
+        console.print(f"❌ {len(failed)} runs failed", style="red")
+        for run in failed[:3]:
+            console.print(f"   {run.params}: {run.error_message}", style="dim")
+
+    console.print(f"⏱️  Completed in {summary.duration_seconds:.1f}s")
+    if persist:
+        console.print(f"💾 Sweep ID: {summary.sweep_id}", style="green")
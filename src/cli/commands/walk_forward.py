@@ -0,0 +1,284 @@
+"""
+CLI command for walk-forward optimization.
+
+Loads bars once, optimizes the strategy's parameters on rolling or anchored
+train windows, evaluates each winner on the following test window across a
+pool of worker processes and reports the stitched out-of-sample result.
+"""
+
+import asyncio
+from datetime import datetime
+
+import click
+from rich.console import Console
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, SpinnerColumn, TextColumn
+from rich.table import Table
+
+from src.cli.commands._backtest_helpers import load_backtest_data, resolve_backtest_request
+from src.cli.commands.sweep import RANK_METRICS
+from src.models.parameter_sweep import SweepSpec, parse_param_spec
+from src.models.walk_forward import WalkForwardSpec, WalkForwardSummary
+from src.services.exceptions import CatalogError
+from src.services.walk_forward import WalkForwardService
+
+console = Console()
+
+
+def _validate_strategy(ctx, param, value):
+    """Validate strategy name against the registry (shared with `backtest run`)."""
+    # Reason: Deferred import, the backtest group module imports this one
+    from src.cli.commands.backtest import validate_strategy
+
+    return validate_strategy(ctx, param, value)
+
+
+@click.command(name="walk-forward")
+@click.argument("config_file", type=click.Path(exists=True, dir_okay=False), required=False)
+@click.option(
+    "--param",
+    "-p",
+    "param_specs",
+    multiple=True,
+    required=True,
+    help="Search space: name=v1,v2,... or name=start:stop[:step] (repeatable)",
+)
+@click.option(
+    "--train-months",
+    type=click.IntRange(min=1),
+    required=True,
+    help="Length of each train (in-sample) window in months",
+)
+@click.option(
+    "--test-months",
+    type=click.IntRange(min=1),
+    required=True,
+    help="Length of each test (out-of-sample) window in months; folds advance by this much",
+)
+@click.option(
+    "--anchored",
+    is_flag=True,
+    default=False,
+    help="Start every train window at --start (expanding) instead of rolling it forward",
+)
+@click.option("--symbol", "-sym", help="Trading symbol (required in CLI mode)")
+@click.option(
+    "--strategy",
+    "-s",
+    default=None,
+    callback=_validate_strategy,
+    help="Strategy to optimize (CLI mode only). Use 'backtest list' to see available strategies.",
+)
+@click.option(
+    "--start",
+    "-st",
+    type=click.DateTime(formats=["%Y-%m-%d", "%Y-%m-%d %H:%M:%S"]),
+    help="Start date (YYYY-MM-DD or YYYY-MM-DD HH:MM:SS)",
+)
+@click.option(
+    "--end",
+    "-e",
+    type=click.DateTime(formats=["%Y-%m-%d", "%Y-%m-%d %H:%M:%S"]),
+    help="End date (YYYY-MM-DD or YYYY-MM-DD HH:MM:SS)",
+)
+@click.option(
+    "--data-source",
+    "-ds",
+    type=click.Choice(["catalog", "ibkr", "kraken", "mock"], case_sensitive=False),
+    default=None,
+    help="Data source to use (default: catalog)",
+)
+@click.option("--starting-balance", "-sb", type=float, default=None, help="Starting balance")
+@click.option(
+    "--timeframe",
+    "-t",
+    default=None,
+    type=click.Choice(
+        ["1-MINUTE", "5-MINUTE", "15-MINUTE", "1-HOUR", "4-HOUR", "1-DAY", "1-WEEK"],
+        case_sensitive=False,
+    ),
+    help="Bar timeframe (auto-detected from date format if not specified)",
+)
+@click.option("--workers", "-w", type=int, default=None, help="Worker processes (default: CPUs)")
+@click.option(
+    "--rank-by",
+    type=click.Choice(RANK_METRICS),
+    default="sharpe_ratio",
+    help="Metric choosing the parameters on each train window",
+)
+@click.option(
+    "--persist/--no-persist",
+    default=True,
+    help="Save the out-of-sample runs and the stitched result (default: persist)",
+)
+def walk_forward_backtest(
+    config_file: str | None,
+    param_specs: tuple[str, ...],
+    train_months: int,
+    test_months: int,
+    anchored: bool,
+    symbol: str | None,
+    strategy: str | None,
+    start: datetime | None,
+    end: datetime | None,
+    data_source: str | None,
+    starting_balance: float | None,
+    timeframe: str | None,
+    workers: int | None,
+    rank_by: str,
+    persist: bool,
+):
+    """Optimize on rolling train windows and validate on the windows that follow.
+
+    Every fold runs the whole search space on its train window, picks the best
+    combination by --rank-by and runs it on the next --test-months. Folds run
+    in parallel; the out-of-sample test windows are stitched into one
+    compounded equity curve. Supports the same CONFIG and CLI modes as
+    `backtest run`.
+
+    \b
+    Examples:
+      backtest walk-forward --symbol AAPL --start 2010-01-01 --end 2024-12-31 \\
+          -s sma_crossover -p fast_period=5:20:5 -p slow_period=30,50,100 \\
+          --train-months 36 --test-months 12
+      backtest walk-forward configs/apolo_rsi_amd.yaml --anchored \\
+          -p rsi_period=2:4 -p buy_threshold=0.05,0.1,0.15 --train-months 60 --test-months 12
+    """
+    try:
+        params = dict(parse_param_spec(spec) for spec in param_specs)
+        spec = SweepSpec(params=params)
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="--param")
+    windows_spec = WalkForwardSpec(
+        train_months=train_months, test_months=test_months, anchored=anchored
+    )
+
+    request, resolved_data_source = resolve_backtest_request(
+        config_file=config_file,
+        symbol=symbol,
+        strategy=strategy,
+        start=start,
+        end=end,
+        data_source=data_source,
+        starting_balance=starting_balance,
+        persist=persist,
+        console=console,
+        timeframe=timeframe,
+    )
+
+    async def run_walk_forward_async() -> WalkForwardSummary:
+        yaml_data = None
+        if resolved_data_source == "mock":
+            import yaml
+
+            with open(config_file, "r") as f:  # type: ignore[arg-type]
+                yaml_data = yaml.safe_load(f)
+
+        data_result = await load_backtest_data(
+            data_source=resolved_data_source,  # type: ignore[arg-type]
+            instrument_id=request.instrument_id,
+            bar_type_spec=request.bar_type,
+            start=request.start_date,
+            end=request.end_date,
+            console=console,
+            yaml_data=yaml_data,
+        )
+
+        service = WalkForwardService(max_workers=workers)
+        layout = "anchored" if anchored else "rolling"
+        console.print(
+            f"🚶 Walk-forward {request.strategy_type} on {request.symbol}: {layout} "
+            f"{train_months}m train / {test_months}m test, "
+            f"{spec.grid_size} grid combinations per fold",
+            style="cyan bold",
+        )
+
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            console=console,
+        ) as progress:
+            task = progress.add_task("Running folds...", total=None)
+
+            def on_progress(completed: int, total: int) -> None:
+                progress.update(task, completed=completed, total=total)
+
+            return await service.run(
+                request,
+                spec,
+                windows_spec,
+                data_result.bars,
+                data_result.instrument,
+                rank_by=rank_by,
+                persist=persist,
+                on_progress=on_progress,
+            )
+
+    try:
+        summary = asyncio.run(run_walk_forward_async())
+    except CatalogError as e:
+        raise click.ClickException(f"Failed to load data: {e}")
+    except ValueError as e:
+        raise click.ClickException(str(e))
+
+    _display_walk_forward_results(summary, persist=persist)
+
+
+def _display_walk_forward_results(summary: WalkForwardSummary, *, persist: bool):
+    """Print the per-fold table and the stitched out-of-sample result."""
+    param_names = next((list(fold.params) for fold in summary.folds if fold.params), [])
+
+    table = Table(title=f"Walk-forward folds (parameters chosen by {summary.rank_by})")
+    table.add_column("#", style="dim", justify="right")
+    table.add_column("Train", style="dim")
+    table.add_column("Test")
+    for name in param_names:
+        table.add_column(name, style="cyan")
+    table.add_column("In-sample", justify="right")
+    table.add_column("OOS Return", justify="right")
+    table.add_column("OOS Sharpe", justify="right")
+    table.add_column("OOS Trades", justify="right")
+    if persist:
+        table.add_column("Run ID", style="dim")
+
+    for fold in summary.folds:
+        window = fold.window
+        row = [
+            str(window.index + 1),
+            f"{window.train_start:%Y-%m-%d} → {window.train_end:%Y-%m-%d}",
+            f"{window.test_start:%Y-%m-%d} → {window.test_end:%Y-%m-%d}",
+        ]
+        row += [str(fold.params[name]) if fold.params else "-" for name in param_names]
+        row.append(f"{fold.train_metric:.3f}" if fold.train_metric is not None else "N/A")
+        if fold.success:
+            row += [
+                f"{fold.total_return:.2%}" if fold.total_return is not None else "N/A",
+                f"{fold.sharpe_ratio:.3f}" if fold.sharpe_ratio is not None else "N/A",
+                str(fold.total_trades),
+            ]
+        else:
+            row += ["failed", "", fold.error_message or ""]
+        if persist:
+            row.append(str(fold.run_id)[:8] if fold.run_id else "-")
+        table.add_row(*row)
+
+    console.print()
+    console.print(table)
+
+    total_return = summary.total_return
+    max_drawdown = summary.max_drawdown
+    console.print(
+        f"📈 Stitched out-of-sample: return {total_return:.2%}, max drawdown {max_drawdown:.2%}"
+        if total_return is not None and max_drawdown is not None
+        else "📈 No out-of-sample result (every fold failed)",
+        style="bold",
+    )
+    if summary.skipped:
+        console.print(
+            f"⚠️  {summary.skipped} combinations rejected by parameter validation",
+            style="yellow",
+        )
+    console.print(f"⏱️  Completed in {summary.duration_seconds:.1f}s")
+    if persist:
+        console.print(f"💾 Walk-forward ID: {summary.walk_forward_id}", style="green")
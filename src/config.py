@@ -42,6 +42,9 @@ class IBKRSettings(BaseSettings):
 
     # Rate limiting
     ibkr_rate_limit: int = Field(default=45, description="Requests per second (90% of 50 limit)")
+    ibkr_download_concurrency: int = Field(
+        default=4, ge=1, description="Historical download windows requested concurrently"
+    )
 
     # Data settings
     ibkr_use_rth: bool = Field(default=True, description="Regular Trading Hours only")
@@ -86,6 +89,9 @@ class KrakenSettings(BaseSettings):
     kraken_rate_limit: int = Field(
         default=10, ge=1, le=20, description="Max requests per second (1-20)"
     )
+    kraken_fetch_concurrency: int = Field(
+        default=4, ge=1, description="Historical time windows fetched concurrently"
+    )
     kraken_default_maker_fee: Decimal = Field(
         default=Decimal("0.0016"), ge=0, le=1, description="Maker fee (0-1)"
     )
@@ -169,6 +175,30 @@ class Settings(BaseSettings):
     # Data settings
     data_directory: Path = Field(default=Path("data"), description="Directory for data files")
     mock_data_bars: int = Field(default=1000, description="Number of mock data bars to generate")
+    catalog_refresh_interval: float = Field(
+        default=30.0,
+        ge=0,
+        description="Seconds between web app catalog change checks (0 disables polling)",
+    )
+
+    # Web backtest execution settings
+    backtest_worker_processes: int = Field(
+        default=2, ge=1, description="Worker processes for backtests submitted from the web UI"
+    )
+    backtest_max_queued_jobs: int = Field(
+        default=20, ge=1, description="Maximum queued or running web UI backtest jobs"
+    )
+    backtest_shared_bar_series: int = Field(
+        default=4,
+        ge=0,
+        description="Idle catalog bar series kept in shared memory for backtest workers "
+        "(0 disables sharing)",
+    )
+    indicator_cache_entries: int = Field(
+        default=128,
+        ge=1,
+        description="Backtest indicator overlay series kept in memory by the web app",
+    )
 
     # Database settings
     database_url: Optional[str] = Field(
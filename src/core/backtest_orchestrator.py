@@ -5,12 +5,16 @@ This module provides a single entry point for executing backtests with optional
 persistence, regardless of whether the request comes from CLI arguments or YAML config.
 """
 
+import hashlib
+import json
 import time
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from uuid import UUID, uuid4
 
+import nautilus_trader
+import pandas as pd
 import structlog
 from nautilus_trader.backtest.engine import BacktestEngine, BacktestEngineConfig
 from nautilus_trader.backtest.models import FillModel
@@ -33,10 +37,28 @@ from src.db.repositories.backtest_repository import BacktestRepository
 from src.db.session import get_session
 from src.models.backtest_request import BacktestRequest
 from src.models.backtest_result import BacktestResult
-from src.services.backtest_persistence import BacktestPersistenceService
+from src.services.backtest_persistence import (
+    BacktestPersistenceService,
+    backtest_result_from_metrics,
+)
+from src.services.indicator_series import INDICATORS_DIR_NAME, IndicatorSeriesCache
+from src.services.shared_bars import BarArrays
+
+if TYPE_CHECKING:
+    from src.services.data_catalog import DataCatalogService
 
 logger = structlog.get_logger(__name__)
 
+# Fill model of the simulated venue (part of every run's fingerprint)
+FILL_MODEL_SETTINGS: dict[str, float] = {
+    "prob_fill_on_limit": 0.95,
+    "prob_fill_on_stop": 0.95,
+    "prob_slippage": 0.01,
+}
+
+# Bump when the fingerprint contents change, so older runs stop matching
+FINGERPRINT_VERSION = 2
+
 
 def _make_json_serializable(obj: Any) -> Any:
     """
@@ -57,6 +79,220 @@ def _make_json_serializable(obj: Any) -> Any:
     return obj
 
 
+def _to_utc(value: datetime) -> datetime:
+    """Ensure a datetime is timezone-aware (UTC if naive)."""
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def build_config_snapshot(request: BacktestRequest) -> dict[str, Any]:
+    """
+    Build the config snapshot persisted with a backtest run.
+
+    Args:
+        request: Backtest request that was executed
+
+    Returns:
+        JSON-serializable config snapshot dictionary
+    """
+    # Convert Decimals for JSON serialization
+    config_snapshot: dict[str, Any] = {
+        "strategy_path": request.strategy_path,
+        "config_path": request.config_path,
+        "version": "1.0",
+        "config": _make_json_serializable(request.strategy_config),
+    }
+
+    if request.config_file_path:
+        config_snapshot["config_file_path"] = request.config_file_path
+
+    return config_snapshot
+
+
+def _resolved_strategy_config(request: BacktestRequest, settings: Any) -> dict[str, Any]:
+    """Strategy config with registry defaults filled in, as the strategy will see it."""
+    try:
+        StrategyRegistry.discover()
+        strategy_name = StrategyRegistry.get(request.strategy_type).name
+        resolved = StrategyLoader.build_strategy_params(
+            strategy_type=strategy_name,
+            overrides=request.strategy_config,
+            settings=settings,
+        )
+    except (KeyError, ValueError):
+        # Reason: Config-file strategies outside the registry run with the config as given
+        resolved = {}
+    return {**request.strategy_config, **resolved}
+
+
+def bars_digest(bars: list[Bar]) -> str:
+    """
+    Content hash of in-memory bars, for bars without a catalog source digest.
+
+    Args:
+        bars: Bars to hash
+
+    Returns:
+        SHA-256 hex digest (see BarArrays.digest)
+    """
+    return BarArrays.from_bars(bars).digest()
+
+
+def run_fingerprint(
+    request: BacktestRequest,
+    bars: list[Bar],
+    instrument: Instrument,
+    settings: Any,
+    source_digest: str | None = None,
+) -> str:
+    """
+    Content hash of everything that determines a run's result.
+
+    Covers the strategy class, its fully resolved parameters, the bars and
+    instrument, the date range and starting balance, the venue's fee and fill
+    model settings and the Nautilus Trader version. Runs with equal
+    fingerprints produce the same results, so a stored one can be reused.
+
+    Args:
+        request: Backtest request
+        bars: Bars the run executes over
+        instrument: Instrument traded
+        settings: Application settings (commission model and strategy defaults)
+        source_digest: Identity of the bars' catalog data (see
+                       DataCatalogService.bar_source_digest); the bars
+                       themselves are hashed when None
+
+    Returns:
+        SHA-256 hex digest
+    """
+    payload = json.dumps(
+        {
+            "version": FINGERPRINT_VERSION,
+            "strategy_path": request.strategy_path,
+            "config_path": request.config_path,
+            "config": _make_json_serializable(_resolved_strategy_config(request, settings)),
+            "instrument_id": str(instrument.id),
+            "bars": source_digest or bars_digest(bars),
+            "start_date": _to_utc(request.start_date).isoformat(),
+            "end_date": _to_utc(request.end_date).isoformat(),
+            "starting_balance": str(request.starting_balance),
+            "venue": {
+                "oms_type": OmsType.HEDGING.name,
+                "account_type": AccountType.MARGIN.name,
+                "fill_model": FILL_MODEL_SETTINGS,
+                "commission_per_share": str(settings.commission_per_share),
+                "commission_min_per_order": str(settings.commission_min_per_order),
+                "commission_max_rate": str(settings.commission_max_rate),
+            },
+            "nautilus_trader": nautilus_trader.__version__,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+async def save_run_results(
+    service: BacktestPersistenceService,
+    *,
+    run_id: UUID,
+    request: BacktestRequest,
+    result: BacktestResult,
+    execution_duration: Decimal,
+    equity_curve: list[dict[str, int | float]] | None = None,
+    positions_df: pd.DataFrame | None = None,
+    sweep_id: UUID | None = None,
+    fingerprint: str | None = None,
+    reproduced_from_run_id: UUID | None = None,
+) -> None:
+    """
+    Save a successful run and its trades using an open persistence service.
+
+    The caller owns the session and commits, so several runs can be saved
+    in one transaction.
+
+    Args:
+        service: Persistence service bound to an open session
+        run_id: Business identifier for the run
+        request: Backtest request that was executed
+        result: Extracted backtest results
+        execution_duration: Wall-clock execution time in seconds
+        equity_curve: Equity curve points, stored with the run
+        positions_df: Positions report used to capture trades
+        sweep_id: Parameter sweep this run belongs to
+        fingerprint: Result cache key of the run (see run_fingerprint)
+        reproduced_from_run_id: Original run if this is a reproduction
+    """
+    backtest_run = await service.save_backtest_results(
+        run_id=run_id,
+        strategy_name=request.strategy_type.replace("_", " ").title(),
+        strategy_type=request.strategy_type,
+        instrument_symbol=request.symbol,
+        start_date=_to_utc(request.start_date),
+        end_date=_to_utc(request.end_date),
+        initial_capital=request.starting_balance,
+        data_source=request.data_source,
+        execution_duration_seconds=execution_duration,
+        config_snapshot=build_config_snapshot(request),
+        backtest_result=result,
+        reproduced_from_run_id=reproduced_from_run_id,
+        sweep_id=sweep_id,
+        equity_curve=equity_curve,
+        fingerprint=fingerprint,
+    )
+
+    # Capture trades from positions report
+    if positions_df is not None and not positions_df.empty:
+        try:
+            await service.save_trades_from_positions(
+                backtest_run_id=backtest_run.id,
+                positions_report_df=positions_df,
+                initial_capital=backtest_run.initial_capital,
+            )
+        except Exception as e:
+            logger.warning(
+                f"Failed to capture trades: {e}",
+                exc_info=True,
+            )
+
+
+async def save_failed_run(
+    service: BacktestPersistenceService,
+    *,
+    run_id: UUID,
+    request: BacktestRequest,
+    error_message: str,
+    execution_duration: Decimal,
+    sweep_id: UUID | None = None,
+) -> None:
+    """
+    Save a failed run using an open persistence service.
+
+    The caller owns the session and commits.
+
+    Args:
+        service: Persistence service bound to an open session
+        run_id: Business identifier for the run
+        request: Backtest request that failed
+        error_message: Error description
+        execution_duration: Time taken before failure, in seconds
+        sweep_id: Parameter sweep this run belongs to
+    """
+    await service.save_failed_backtest(
+        run_id=run_id,
+        strategy_name=request.strategy_type.replace("_", " ").title(),
+        strategy_type=request.strategy_type,
+        instrument_symbol=request.symbol,
+        start_date=_to_utc(request.start_date),
+        end_date=_to_utc(request.end_date),
+        initial_capital=request.starting_balance,
+        data_source=request.data_source,
+        execution_duration_seconds=execution_duration,
+        config_snapshot=build_config_snapshot(request),
+        error_message=error_message,
+        sweep_id=sweep_id,
+    )
+
+
 class BacktestOrchestrator:
     """
     Unified backtest execution with optional persistence.
@@ -67,6 +303,13 @@ class BacktestOrchestrator:
     - Strategy creation from various sources
     - Results extraction
     - Optional database persistence
+    - Reusing a stored run whose fingerprint matches (persisted requests only)
+    - Optionally keeping one engine loaded across runs on the same bars
+
+    With reuse_engine=True the engine is kept after a run. The next execute()
+    over the same bar list, instrument and starting balance resets it and only
+    swaps the strategy, skipping engine construction and add_data sorting.
+    Call dispose() once the orchestrator is no longer needed.
 
     Example:
         >>> orchestrator = BacktestOrchestrator()
@@ -75,42 +318,85 @@ class BacktestOrchestrator:
         >>> orchestrator.dispose()
     """
 
-    def __init__(self):
-        """Initialize the orchestrator."""
+    def __init__(
+        self,
+        catalog_service: "DataCatalogService | None" = None,
+        reuse_engine: bool = False,
+    ):
+        """
+        Initialize the orchestrator.
+
+        Args:
+            catalog_service: Optional catalog used to precompute chart indicator
+                series when a run is persisted (skipped if None)
+            reuse_engine: Keep the engine and its data loaded between runs
+                on the same bars (see class docstring)
+        """
         self.settings = get_settings()
+        self.catalog_service = catalog_service
+        self.reuse_engine = reuse_engine
         self.engine: BacktestEngine | None = None
+        # Bars and (instrument, starting balance) the kept engine was loaded with
+        self._engine_bars: list[Bar] | None = None
+        self._engine_key: tuple[str, str] | None = None
         self._venue: Venue | None = None
         self._backtest_start_date: datetime | None = None
         self._backtest_end_date: datetime | None = None
         self._starting_balance: float | None = None
+        # Run whose stored result the last execute() returned, if it was a cache hit
+        self.cached_run_id: UUID | None = None
+        # Last (bars list, digest) fingerprinted; holds the list so its identity stays valid
+        self._hashed_bars: tuple[list[Bar], str] | None = None
 
     async def execute(
         self,
         request: BacktestRequest,
         bars: list[Bar],
         instrument: Instrument,
+        reproduced_from_run_id: UUID | None = None,
+        source_digest: str | None = None,
     ) -> tuple[BacktestResult, UUID | None]:
         """
         Execute backtest with optional persistence.
 
+        A persisted request with request.use_cache set is fingerprinted first
+        (see run_fingerprint). If a successful stored run has the same
+        fingerprint, its result and run_id are returned without running the
+        engine, and cached_run_id is set. Runs with use_cache unset skip the
+        fingerprint and are stored without one.
+
         Args:
             request: Unified backtest request containing all parameters
             bars: Pre-loaded Bar objects from catalog
             instrument: Instrument object for the backtest
+            reproduced_from_run_id: Original run if this is a reproduction
+            source_digest: Identity of the bars' catalog data, which spares
+                           hashing the bars (see DataCatalogService.bar_source_digest)
 
         Returns:
-            Tuple of (BacktestResult, run_id if persisted else None)
+            Tuple of (BacktestResult, run_id if persisted or cached else None)
 
         Raises:
             ValueError: If bars are empty or strategy cannot be created
         """
         execution_start_time = time.time()
         run_id = uuid4() if request.persist else None
+        self.cached_run_id = None
 
         if not bars:
             raise ValueError("No bars provided for backtest")
 
         try:
+            # Reason: Only persisted runs carry fingerprints, so only they can hit
+            fingerprint = None
+            if request.persist and request.use_cache:
+                fingerprint = run_fingerprint(
+                    request, bars, instrument, self.settings, source_digest or self._digest(bars)
+                )
+                cached = await self._find_cached(fingerprint)
+                if cached is not None:
+                    return cached
+
             # Setup engine
             self._setup_engine(request, bars, instrument)
 
@@ -142,6 +428,8 @@ class BacktestOrchestrator:
                     request=request,
                     result=result,
                     execution_duration=execution_duration,
+                    fingerprint=fingerprint,
+                    reproduced_from_run_id=reproduced_from_run_id,
                 )
                 logger.info(
                     "Backtest completed and persisted",
@@ -153,6 +441,10 @@ class BacktestOrchestrator:
             return result, run_id
 
         except Exception as e:
+            if self.reuse_engine:
+                # Reason: A failed run can leave the engine mid-run, so the next one starts fresh
+                self._discard_engine()
+
             # Persist failed backtest if persistence was requested
             if request.persist:
                 execution_duration = Decimal(str(time.time() - execution_start_time))
@@ -163,6 +455,58 @@ class BacktestOrchestrator:
                 )
             raise
 
+    def _digest(self, bars: list[Bar]) -> str:
+        """
+        Hash bars that have no catalog source digest, once per loaded list.
+
+        Converting the bars is a Python loop over every bar, so the digest of
+        the last list is kept by identity while this orchestrator lives; runs
+        repeated over the same list (sweeps, reproductions) hash it once.
+
+        Args:
+            bars: Bars to hash (must not be mutated after hashing)
+
+        Returns:
+            SHA-256 hex digest (see bars_digest)
+        """
+        if self._hashed_bars is not None and self._hashed_bars[0] is bars:
+            return self._hashed_bars[1]
+        digest = bars_digest(bars)
+        self._hashed_bars = (bars, digest)
+        return digest
+
+    async def _find_cached(self, fingerprint: str) -> tuple[BacktestResult, UUID] | None:
+        """
+        Look up a stored successful run with the given fingerprint.
+
+        Args:
+            fingerprint: Result cache key of the request
+
+        Returns:
+            Tuple of (stored result, stored run_id), or None on a miss
+        """
+        try:
+            async with get_session() as session:
+                repository = BacktestRepository(session)
+                cached_run = await repository.find_by_fingerprint(fingerprint)
+        except Exception as e:
+            # Reason: The cache is an optimization, so an unreachable database means a miss
+            logger.warning("backtest_cache_lookup_failed", fingerprint=fingerprint, error=str(e))
+            return None
+
+        if cached_run is None or cached_run.metrics is None:
+            logger.info("backtest_cache_miss", fingerprint=fingerprint)
+            return None
+
+        logger.info(
+            "backtest_cache_hit",
+            fingerprint=fingerprint,
+            run_id=str(cached_run.run_id),
+            saved_seconds=float(cached_run.execution_duration_seconds),
+        )
+        self.cached_run_id = cached_run.run_id
+        return backtest_result_from_metrics(cached_run.metrics), cached_run.run_id
+
     def _setup_engine(
         self,
         request: BacktestRequest,
@@ -172,11 +516,26 @@ class BacktestOrchestrator:
         """
         Setup the backtest engine with venue, instrument, and data.
 
+        In reuse mode an engine already loaded with the same bars, instrument
+        and starting balance is reset instead of rebuilt.
+
         Args:
             request: Backtest request with configuration
             bars: Bar data for the backtest
             instrument: Instrument to trade
         """
+        engine_key = (str(instrument.id), str(request.starting_balance))
+        if (
+            self.reuse_engine
+            and self.engine is not None
+            and self._engine_bars is bars
+            and self._engine_key == engine_key
+        ):
+            self._reset_engine(instrument)
+            return
+
+        self._discard_engine()
+
         # Configure engine — bypass Nautilus logging if already initialized
         # (e.g., when running from the web server process)
         logging_config = LoggingConfig(bypass_logging=is_logging_initialized())
@@ -187,11 +546,7 @@ class BacktestOrchestrator:
         self.engine = BacktestEngine(config=config)
 
         # Create fill model
-        fill_model = FillModel(
-            prob_fill_on_limit=0.95,
-            prob_fill_on_stop=0.95,
-            prob_slippage=0.01,
-        )
+        fill_model = FillModel(**FILL_MODEL_SETTINGS)
 
         # Create commission model
         fee_model = IBKRCommissionModel(
@@ -224,6 +579,32 @@ class BacktestOrchestrator:
         self.engine.add_instrument(instrument)
         self.engine.add_data(bars)
 
+        if self.reuse_engine:
+            self._engine_bars = bars
+            self._engine_key = engine_key
+
+    def _reset_engine(self, instrument: Instrument) -> None:
+        """
+        Prepare the kept engine for another run over its loaded data.
+
+        Args:
+            instrument: Instrument traded (re-added to the cache)
+        """
+        assert self.engine is not None
+        self.engine.clear_strategies()
+        self.engine.reset()
+        # Reason: reset() keeps the data but clears the cache, including instruments
+        self.engine.cache.add_instrument(instrument)
+        logger.debug("backtest_engine_reused", instrument=str(instrument.id))
+
+    def _discard_engine(self) -> None:
+        """Dispose of the current engine, if any."""
+        if self.engine:
+            self.engine.dispose()
+        self.engine = None
+        self._engine_bars = None
+        self._engine_key = None
+
     def _create_strategy(
         self,
         request: BacktestRequest,
@@ -342,85 +723,106 @@ class BacktestOrchestrator:
             end_date=self._backtest_end_date,
         )
 
+    def collect_run_artifacts(self) -> tuple[list[dict[str, int | float]], pd.DataFrame | None]:
+        """
+        Collect the engine outputs needed to persist the last run.
+
+        Must be called after execute() and before dispose().
+
+        Returns:
+            Tuple of (equity curve points, positions report or None)
+        """
+        if not self.engine or self._starting_balance is None:
+            return [], None
+
+        equity_curve = self._extract_equity_curve(self._starting_balance)
+
+        positions_df: pd.DataFrame | None = None
+        try:
+            positions_df = self.engine.trader.generate_positions_report()
+        except Exception as e:
+            logger.warning(f"Failed to generate positions report: {e}", exc_info=True)
+
+        return equity_curve, positions_df
+
+    def collect_balance_curve(self) -> list[dict[str, int | float]]:
+        """
+        Collect the account balance curve of the last run.
+
+        Must be called after execute() and before dispose().
+
+        Returns:
+            Balance points (see ResultsExtractor.extract_balance_curve)
+        """
+        if not self.engine or self._starting_balance is None:
+            return []
+
+        extractor = ResultsExtractor(
+            engine=self.engine,
+            venue=self._venue,
+            settings=self.settings,
+            starting_balance=self._starting_balance,
+        )
+        return extractor.extract_balance_curve()
+
     async def _persist_results(
         self,
         run_id: UUID,
         request: BacktestRequest,
         result: BacktestResult,
         execution_duration: Decimal,
+        fingerprint: str | None = None,
+        reproduced_from_run_id: UUID | None = None,
     ) -> None:
         """Persist successful backtest results to database."""
         try:
-            # Build config snapshot (convert Decimals for JSON serialization)
-            config_snapshot: dict[str, Any] = {
-                "strategy_path": request.strategy_path,
-                "config_path": request.config_path,
-                "version": "1.0",
-                "config": _make_json_serializable(request.strategy_config),
-            }
-
-            # Add equity curve if available
-            equity_curve = self._extract_equity_curve(float(request.starting_balance))
-            if equity_curve:
-                config_snapshot["equity_curve"] = equity_curve
-
-            # Add config file path if available
-            if request.config_file_path:
-                config_snapshot["config_file_path"] = request.config_file_path
-
-            # Ensure dates are timezone-aware
-            start_tz = (
-                request.start_date
-                if request.start_date.tzinfo
-                else request.start_date.replace(tzinfo=timezone.utc)
-            )
-            end_tz = (
-                request.end_date
-                if request.end_date.tzinfo
-                else request.end_date.replace(tzinfo=timezone.utc)
-            )
-
-            strategy_display_name = request.strategy_type.replace("_", " ").title()
+            equity_curve, positions_df = self.collect_run_artifacts()
 
             async with get_session() as session:
                 repository = BacktestRepository(session)
                 service = BacktestPersistenceService(repository)
 
-                backtest_run = await service.save_backtest_results(
+                await save_run_results(
+                    service,
                     run_id=run_id,
-                    strategy_name=strategy_display_name,
-                    strategy_type=request.strategy_type,
-                    instrument_symbol=request.symbol,
-                    start_date=start_tz,
-                    end_date=end_tz,
-                    initial_capital=request.starting_balance,
-                    data_source=request.data_source,
-                    execution_duration_seconds=execution_duration,
-                    config_snapshot=config_snapshot,
-                    backtest_result=result,
+                    request=request,
+                    result=result,
+                    execution_duration=execution_duration,
+                    equity_curve=equity_curve,
+                    positions_df=positions_df,
+                    fingerprint=fingerprint,
+                    reproduced_from_run_id=reproduced_from_run_id,
                 )
 
-                # Capture trades from positions report
-                if self.engine:
-                    try:
-                        positions_df = self.engine.trader.generate_positions_report()
-                        if positions_df is not None and not positions_df.empty:
-                            await service.save_trades_from_positions(
-                                backtest_run_id=backtest_run.id,
-                                positions_report_df=positions_df,
-                            )
-                    except Exception as e:
-                        logger.warning(
-                            f"Failed to capture trades: {e}",
-                            exc_info=True,
-                        )
-
                 await session.commit()
 
             logger.info("Backtest results persisted", run_id=str(run_id))
 
         except Exception as e:
             logger.warning(f"Failed to persist backtest results: {e}", exc_info=True)
+            return
+
+        if self.catalog_service is not None:
+            self._precompute_indicators(run_id, request)
+
+    def _precompute_indicators(self, run_id: UUID, request: BacktestRequest) -> None:
+        """Write the run's chart indicator series so the first chart view is a cache hit."""
+        assert self.catalog_service is not None
+        try:
+            cache = IndicatorSeriesCache(
+                self.catalog_service.catalog_path / INDICATORS_DIR_NAME, max_entries=1
+            )
+            cache.get_or_compute(
+                self.catalog_service,
+                run_id,
+                request.symbol,
+                request.start_date,
+                request.end_date,
+                build_config_snapshot(request),
+            )
+        except Exception as e:
+            # Reason: The chart endpoint computes the series on demand instead
+            logger.warning("indicator_precompute_failed", run_id=str(run_id), error=str(e))
 
     async def _persist_failed(
         self,
@@ -432,42 +834,16 @@ class BacktestOrchestrator:
         try:
             run_id = uuid4()
 
-            config_snapshot: dict[str, Any] = {
-                "strategy_path": request.strategy_path,
-                "config_path": request.config_path,
-                "version": "1.0",
-                "config": _make_json_serializable(request.strategy_config),
-            }
-
-            start_tz = (
-                request.start_date
-                if request.start_date.tzinfo
-                else request.start_date.replace(tzinfo=timezone.utc)
-            )
-            end_tz = (
-                request.end_date
-                if request.end_date.tzinfo
-                else request.end_date.replace(tzinfo=timezone.utc)
-            )
-
-            strategy_display_name = request.strategy_type.replace("_", " ").title()
-
             async with get_session() as session:
                 repository = BacktestRepository(session)
                 service = BacktestPersistenceService(repository)
 
-                await service.save_failed_backtest(
+                await save_failed_run(
+                    service,
                     run_id=run_id,
-                    strategy_name=strategy_display_name,
-                    strategy_type=request.strategy_type,
-                    instrument_symbol=request.symbol,
-                    start_date=start_tz,
-                    end_date=end_tz,
-                    initial_capital=request.starting_balance,
-                    data_source=request.data_source,
-                    execution_duration_seconds=execution_duration,
-                    config_snapshot=config_snapshot,
+                    request=request,
                     error_message=error_message,
+                    execution_duration=execution_duration,
                 )
 
                 await session.commit()
@@ -479,9 +855,10 @@ class BacktestOrchestrator:
 
     def dispose(self) -> None:
         """Dispose of engine resources."""
-        if self.engine:
-            self.engine.dispose()
+        self._discard_engine()
         self._venue = None
         self._backtest_start_date = None
         self._backtest_end_date = None
         self._starting_balance = None
+        self.cached_run_id = None
+        self._hashed_bars = None
@@ -116,13 +116,12 @@ class MinimalBacktestRunner:
                 "config": strategy_config,
             }
 
-            # Extract and store equity curve if engine is available
+            # Extract equity curve if engine is available
+            equity_curve: list[dict[str, Any]] = []
             if self.engine:
                 analyzer = self.engine.portfolio.analyzer
                 starting_balance = float(self.settings.default_balance)
                 equity_curve = self._extract_equity_curve(analyzer, starting_balance)
-                if equity_curve:
-                    config_snapshot["equity_curve"] = equity_curve
 
             async with get_session() as session:
                 repository = BacktestRepository(session)
@@ -141,6 +140,7 @@ class MinimalBacktestRunner:
                     config_snapshot=config_snapshot,
                     backtest_result=result,
                     reproduced_from_run_id=reproduced_from_run_id,
+                    equity_curve=equity_curve,
                 )
 
                 # Capture individual trades from fills report
@@ -185,6 +185,7 @@ class MinimalBacktestRunner:
                             trade_count = await service.save_trades_from_positions(
                                 backtest_run_id=backtest_run.id,
                                 positions_report_df=positions_report_df,
+                                initial_capital=backtest_run.initial_capital,
                             )
 
                             logger.info(
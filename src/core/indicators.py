@@ -0,0 +1,234 @@
+"""
+Vectorized technical indicators over NumPy price arrays.
+
+Each function computes a whole series at once from catalog columns (see
+DataCatalogService.query_bar_arrays) and reproduces the Nautilus Trader
+indicator the strategies use, fed one bar at a time:
+
+- sma: SimpleMovingAverage
+- ema: ExponentialMovingAverage
+- rsi: RelativeStrengthIndex (exponential averages, scaled 0..1)
+- bollinger_bands: BollingerBands (typical price, population std)
+- atr: AverageTrueRange (simple average, previous close)
+- weekly_sma: SimpleMovingAverage of completed ISO-week closes
+
+Outputs are float64 arrays aligned with the inputs, NaN wherever the
+Nautilus indicator is not yet initialized.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+DAY_NS = 86_400_000_000_000
+
+# Reason: 1970-01-01 was a Thursday; shifting by 3 days makes weeks start on Monday
+_EPOCH_TO_MONDAY_DAYS = 3
+
+
+class BollingerBandsSeries(NamedTuple):
+    """Upper, middle and lower band arrays."""
+
+    upper: np.ndarray
+    middle: np.ndarray
+    lower: np.ndarray
+
+
+def _check_period(period: int) -> None:
+    """Raise ValueError for non-positive periods."""
+    if period < 1:
+        raise ValueError(f"period must be positive, got {period}")
+
+
+def _warmup(count: int) -> np.ndarray:
+    """NaN array with room for one value per input."""
+    return np.full(count, np.nan, dtype=np.float64)
+
+
+def sma(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    Simple moving average of the last period values.
+
+    Args:
+        values: Input series
+        period: Window length
+
+    Returns:
+        Averages, NaN for the first period - 1 entries
+
+    Example:
+        >>> sma(np.array([1.0, 2.0, 3.0, 4.0]), 2)
+        array([nan, 1.5, 2.5, 3.5])
+    """
+    _check_period(period)
+    values = np.asarray(values, dtype=np.float64)
+    out = _warmup(len(values))
+    if len(values) >= period:
+        out[period - 1 :] = sliding_window_view(values, period).mean(axis=1)
+    return out
+
+
+def _ema_values(values: np.ndarray, period: int) -> np.ndarray:
+    """EMA seeded with the first value, including the warm-up entries."""
+    alpha = 2.0 / (period + 1.0)
+    return pd.Series(values).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+
+
+def ema(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    Exponential moving average with alpha = 2 / (period + 1).
+
+    Seeded with the first value, as Nautilus does, rather than with an SMA.
+
+    Args:
+        values: Input series
+        period: Span of the average
+
+    Returns:
+        Averages, NaN for the first period - 1 entries
+    """
+    _check_period(period)
+    values = np.asarray(values, dtype=np.float64)
+    out = _warmup(len(values))
+    if len(values) >= period:
+        out[period - 1 :] = _ema_values(values, period)[period - 1 :]
+    return out
+
+
+def rsi(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    Relative strength index from exponential averages of gains and losses.
+
+    Values are in 0..1 (Nautilus scaling); multiply by 100 for the usual
+    scale. A window with no losses reads 1.0.
+
+    Args:
+        values: Input series (typically closes)
+        period: Span of the gain and loss averages
+
+    Returns:
+        RSI values, NaN for the first period - 1 entries
+    """
+    _check_period(period)
+    values = np.asarray(values, dtype=np.float64)
+    out = _warmup(len(values))
+    if len(values) < period:
+        return out
+
+    # Reason: The first input has no previous value, so its change is zero
+    change = np.diff(values, prepend=values[:1])
+    average_gain = _ema_values(np.maximum(change, 0.0), period)
+    average_loss = _ema_values(np.maximum(-change, 0.0), period)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        value = 1.0 - 1.0 / (1.0 + average_gain / average_loss)
+    value = np.where(average_loss == 0.0, 1.0, value)
+
+    out[period - 1 :] = value[period - 1 :]
+    return out
+
+
+def bollinger_bands(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    period: int,
+    k: float,
+) -> BollingerBandsSeries:
+    """
+    Bollinger Bands over the typical price (high + low + close) / 3.
+
+    Bands are the simple moving average plus/minus k population standard
+    deviations of the window.
+
+    Args:
+        high: Bar highs
+        low: Bar lows
+        close: Bar closes
+        period: Window length
+        k: Band width in standard deviations
+
+    Returns:
+        BollingerBandsSeries, NaN for the first period - 1 entries
+    """
+    _check_period(period)
+    typical = (
+        np.asarray(high, dtype=np.float64)
+        + np.asarray(low, dtype=np.float64)
+        + np.asarray(close, dtype=np.float64)
+    ) / 3.0
+    middle = sma(typical, period)
+    std = _warmup(len(typical))
+    if len(typical) >= period:
+        std[period - 1 :] = sliding_window_view(typical, period).std(axis=1)
+    return BollingerBandsSeries(upper=middle + k * std, middle=middle, lower=middle - k * std)
+
+
+def atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int) -> np.ndarray:
+    """
+    Average true range as a simple moving average of true ranges.
+
+    The true range uses the previous close (the bar's own close for the
+    first bar).
+
+    Args:
+        high: Bar highs
+        low: Bar lows
+        close: Bar closes
+        period: Window length
+
+    Returns:
+        ATR values, NaN for the first period - 1 entries
+    """
+    close = np.asarray(close, dtype=np.float64)
+    previous_close = np.concatenate([close[:1], close[:-1]])
+    true_range = np.maximum(previous_close, high) - np.minimum(low, previous_close)
+    return sma(true_range, period)
+
+
+def week_starts(ts_ns: np.ndarray) -> np.ndarray:
+    """
+    Indices of the first bar of each ISO week after the first.
+
+    Args:
+        ts_ns: UNIX nanosecond timestamps sorted ascending
+
+    Returns:
+        Indices where the Monday-aligned week changes
+    """
+    days = np.asarray(ts_ns).astype(np.int64) // DAY_NS
+    week = (days + _EPOCH_TO_MONDAY_DAYS) // 7
+    return np.flatnonzero(np.diff(week)) + 1
+
+
+def weekly_sma(ts_ns: np.ndarray, close: np.ndarray, period: int) -> np.ndarray:
+    """
+    SMA of weekly closes, as seen by a strategy fed bar by bar.
+
+    A week's last close is committed to the average on the first bar of the
+    following week, so the current (incomplete) week never contributes.
+
+    Args:
+        ts_ns: UNIX nanosecond timestamps sorted ascending
+        close: Bar closes
+        period: Number of weeks averaged
+
+    Returns:
+        Per-bar weekly SMA, NaN until period weeks have completed
+
+    Example:
+        >>> values = weekly_sma(arrays.ts_event, arrays.close, 20)
+    """
+    _check_period(period)
+    close = np.asarray(close, dtype=np.float64)
+    out = _warmup(len(close))
+
+    starts = week_starts(ts_ns)
+    weekly = sma(close[starts - 1], period)
+    committed = np.searchsorted(starts, np.arange(len(close)), side="right")
+
+    has_weeks = committed > 0
+    out[has_weeks] = weekly[committed[has_weeks] - 1]
+    return out
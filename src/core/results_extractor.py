@@ -275,6 +275,34 @@ class ResultsExtractor:
 
         return equity_points
 
+    def extract_balance_curve(self) -> list[dict[str, int | float]]:
+        """
+        Extract the venue account's total balance after every account event.
+
+        Unlike extract_equity_curve, whose values compound per-position
+        returns, these are account balances, so the last point matches the
+        run's final balance and total return.
+
+        Returns:
+            List of balance points: [{"time": unix_ts, "value": balance}, ...],
+            keeping the last balance of each second
+        """
+        if not self.engine:
+            return []
+
+        account = self.engine.cache.account_for_venue(self.venue)
+        if not account:
+            return []
+
+        balances: dict[int, float] = {}
+        for event in account.events:
+            for balance in event.balances:
+                if balance.currency == USD:
+                    time_unix = int(event.ts_event / 1_000_000_000)
+                    balances[time_unix] = round(balance.total.as_double(), 2)
+
+        return [{"time": time_unix, "value": value} for time_unix, value in balances.items()]
+
 
 def _safe_float(value) -> float | None:
     """Safely convert a value to float, handling NaN and infinity."""
@@ -0,0 +1,196 @@
+"""
+Vectorized signal screening over NumPy bar arrays.
+
+A strategy registered with a signal function (see
+StrategyRegistry.set_signal_function) turns bars and its parameters into the
+signed position it holds after each bar. Screening values that position
+series directly instead of running the Nautilus engine:
+
+- Orders fill at the close of the bar that signals them
+- The position held from one close to the next earns the price change
+- Fees, slippage, margin and rejected orders are ignored
+- The last position is valued at the final close
+
+Results are approximate and meant for ranking many parameter combinations;
+the best candidates are then reconciled against full BacktestOrchestrator
+runs (see SignalScreeningService).
+"""
+
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Optional
+
+import numpy as np
+
+from src.core.indicators import DAY_NS
+from src.core.indicators import sma as sma_series
+from src.services.shared_bars import BarArrays
+
+# Reason: Matches the annualization of Nautilus' "Sharpe Ratio (252 days)"
+TRADING_DAYS_PER_YEAR = 252
+
+
+class ScreenBars:
+    """
+    Bars of a screen, with indicator series shared by all parameter combinations.
+
+    Each distinct indicator is computed once per screen, so a grid over
+    fast/slow periods costs one SMA per period rather than one per combination.
+
+    Attributes:
+        arrays: Columnar OHLCV bars
+
+    Example:
+        >>> bars = ScreenBars(BarArrays.from_bars(bars))
+        >>> fast, slow = bars.sma(10), bars.sma(20)
+    """
+
+    def __init__(self, arrays: BarArrays) -> None:
+        """
+        Initialize ScreenBars.
+
+        Args:
+            arrays: Non-empty columnar bars sorted by ts_init
+        """
+        if not len(arrays):
+            raise ValueError("No bars provided for signal screening")
+        self.arrays = arrays
+        self._sma: dict[int, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        """Number of bars."""
+        return len(self.arrays)
+
+    @property
+    def close(self) -> np.ndarray:
+        """Bar closes."""
+        return self.arrays.close
+
+    @property
+    def size_precision(self) -> int:
+        """Quantity precision of the instrument."""
+        return self.arrays.size_precision
+
+    def sma(self, period: int) -> np.ndarray:
+        """Simple moving average of the closes, computed once per period."""
+        if period not in self._sma:
+            self._sma[period] = sma_series(self.close, period)
+        return self._sma[period]
+
+    @cached_property
+    def day_ends(self) -> np.ndarray:
+        """Index of the last bar of each UTC day."""
+        days = self.arrays.ts_event // np.uint64(DAY_NS)
+        return np.flatnonzero(np.append(days[1:] != days[:-1], True))
+
+
+@dataclass(frozen=True)
+class ScreenMetrics:
+    """
+    Approximate performance of one position series.
+
+    Attributes:
+        total_pnl: Final balance minus starting balance
+        total_return: total_pnl as a fraction of the starting balance
+        sharpe_ratio: Annualized Sharpe ratio of daily returns (None if undefined)
+        max_drawdown: Largest peak-to-trough decline of daily balances (<= 0)
+        total_trades: Number of positions opened
+    """
+
+    total_pnl: float
+    total_return: float
+    sharpe_ratio: Optional[float]
+    max_drawdown: float
+    total_trades: int
+
+
+def hold_signals(signals: np.ndarray) -> np.ndarray:
+    """
+    Direction held after each bar: the last non-zero signal so far.
+
+    Args:
+        signals: 1 (go long), -1 (go short) or 0 (no change) per bar
+
+    Returns:
+        Direction per bar, 0 before the first signal
+
+    Example:
+        >>> hold_signals(np.array([0, 1, 0, -1, 0]))
+        array([ 0,  1,  1, -1, -1])
+    """
+    signals = np.asarray(signals)
+    last = np.maximum.accumulate(np.where(signals != 0, np.arange(len(signals)), 0))
+    return signals[last]
+
+
+def size_at_entry(direction: np.ndarray, sizes: np.ndarray | float) -> np.ndarray:
+    """
+    Signed position per bar, sized on the bar where each position was entered.
+
+    Args:
+        direction: Direction held after each bar (1, -1 or 0)
+        sizes: Quantity a position entered on each bar would have, or one
+               quantity for every bar
+
+    Returns:
+        float64 signed quantities, constant while a position is held
+    """
+    direction = np.asarray(direction)
+    count = len(direction)
+    entered = np.ones(count, dtype=bool)
+    entered[1:] = direction[1:] != direction[:-1]
+    entry = np.maximum.accumulate(np.where(entered, np.arange(count), 0))
+    sizes = np.broadcast_to(np.asarray(sizes, dtype=np.float64), (count,))
+    return direction * sizes[entry]
+
+
+def evaluate_positions(
+    bars: ScreenBars,
+    positions: np.ndarray,
+    starting_balance: float,
+) -> ScreenMetrics:
+    """
+    Value a position series over the bars.
+
+    Args:
+        bars: Bars the positions were computed from
+        positions: Signed quantity held after each bar
+        starting_balance: Account balance before the first bar
+
+    Returns:
+        ScreenMetrics of the marked-to-market balance
+
+    Example:
+        >>> positions = size_at_entry(hold_signals(signals), 100.0)
+        >>> metrics = evaluate_positions(bars, positions, 100_000.0)
+    """
+    positions = np.asarray(positions, dtype=np.float64)
+    if len(positions) != len(bars):
+        raise ValueError(f"Expected {len(bars)} positions, got {len(positions)}")
+
+    pnl = np.zeros(len(positions))
+    pnl[1:] = positions[:-1] * np.diff(bars.close)
+    balance = starting_balance + np.cumsum(pnl)
+    total_pnl = float(balance[-1] - starting_balance)
+
+    previous = np.concatenate(([0.0], positions[:-1]))
+    total_trades = int(np.count_nonzero((positions != 0) & (positions != previous)))
+
+    daily = np.concatenate(([starting_balance], balance[bars.day_ends]))
+    returns = np.diff(daily) / daily[:-1]
+    sharpe_ratio = None
+    if len(returns) > 1:
+        std = returns.std(ddof=1)
+        if std > 0:
+            sharpe_ratio = float(returns.mean() / std * np.sqrt(TRADING_DAYS_PER_YEAR))
+
+    peaks = np.maximum.accumulate(daily)
+    max_drawdown = float(min(((daily - peaks) / peaks).min(), 0.0))
+
+    return ScreenMetrics(
+        total_pnl=total_pnl,
+        total_return=total_pnl / starting_balance,
+        sharpe_ratio=sharpe_ratio,
+        max_drawdown=max_drawdown,
+        total_trades=total_trades,
+    )
@@ -3,6 +3,8 @@
 from decimal import Decimal
 from enum import Enum
 
+import numpy as np
+
 
 class CrossoverSignal(str, Enum):
     """Enumeration of crossover signals."""
@@ -158,3 +160,40 @@ class SMATradingLogic:
             return Decimal("0")
 
         return risk_amount / price_risk
+
+
+def crossover_signals(fast: np.ndarray, slow: np.ndarray) -> np.ndarray:
+    """
+    Detect crossovers over whole SMA series at once.
+
+    Vectorized form of SMATradingLogic.detect_crossover as the strategies
+    apply it bar by bar: a bar can only signal once both averages were
+    available on the previous bar as well.
+
+    Args:
+        fast: Fast SMA series, NaN while warming up
+        slow: Slow SMA series aligned with fast, NaN while warming up
+
+    Returns:
+        int8 array: 1 for a golden cross, -1 for a death cross, 0 otherwise
+
+    Example:
+        >>> crossover_signals(np.array([1.0, 3.0, 1.0]), np.array([2.0, 2.0, 2.0]))
+        array([ 0,  1, -1], dtype=int8)
+    """
+    fast = np.asarray(fast, dtype=np.float64)
+    slow = np.asarray(slow, dtype=np.float64)
+    signals = np.zeros(len(fast), dtype=np.int8)
+    if len(fast) < 2:
+        return signals
+
+    valid = ~(np.isnan(fast) | np.isnan(slow))
+    ready = valid[1:] & valid[:-1]
+    prev_fast, prev_slow = fast[:-1], slow[:-1]
+    curr_fast, curr_slow = fast[1:], slow[1:]
+
+    golden = ready & (prev_fast <= prev_slow) & (curr_fast > curr_slow)
+    death = ready & (prev_fast >= prev_slow) & (curr_fast < curr_slow)
+    signals[1:][golden] = 1
+    signals[1:][death] = -1
+    return signals
@@ -1,7 +1,9 @@
 """SMA Crossover strategy implementation using Nautilus Trader."""
 
 from decimal import Decimal
+from typing import Any
 
+import numpy as np
 from nautilus_trader.indicators import SimpleMovingAverage
 from nautilus_trader.model.data import Bar, BarType
 from nautilus_trader.model.enums import OrderSide, PriceType
@@ -9,6 +11,8 @@ from nautilus_trader.model.identifiers import InstrumentId
 from nautilus_trader.model.objects import Quantity
 from nautilus_trader.trading.strategy import Strategy, StrategyConfig
 
+from src.core.signal_screening import ScreenBars, hold_signals, size_at_entry
+from src.core.sma_logic import crossover_signals
 from src.core.strategy_registry import StrategyRegistry, register_strategy
 from src.models.strategy import SMAParameters
 
@@ -266,9 +270,36 @@ class SMACrossover(Strategy):
         pass  # Nothing additional to clean up
 
 
+def sma_crossover_signals(bars: ScreenBars, params: dict[str, Any]) -> np.ndarray:
+    """
+    Vectorized SMACrossover positions for signal screening.
+
+    Long after a golden cross and short after a death cross, each position
+    sized like _calculate_position_size at the close of its entry bar.
+
+    Args:
+        bars: Bars to screen
+        params: Resolved SMAParameters values
+
+    Returns:
+        Signed quantity held after each bar
+    """
+    signals = crossover_signals(
+        bars.sma(int(params["fast_period"])), bars.sma(int(params["slow_period"]))
+    )
+    notional = float(params["portfolio_value"]) * float(params["position_size_pct"]) / 100.0
+    raw_qty = notional / bars.close
+    if bars.size_precision > 0:
+        sizes = np.round(raw_qty, bars.size_precision)
+    else:
+        sizes = np.maximum(np.floor(raw_qty), 1.0)
+    return size_at_entry(hold_signals(signals), sizes)
+
+
 # Register config and parameter model for this strategy
 StrategyRegistry.set_config("sma_crossover", SMAConfig)
 StrategyRegistry.set_param_model("sma_crossover", SMAParameters)
+StrategyRegistry.set_signal_function("sma_crossover", sma_crossover_signals)
 StrategyRegistry.set_default_config(
     "sma_crossover",
     {
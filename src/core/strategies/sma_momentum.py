@@ -4,14 +4,17 @@ from __future__ import annotations
 
 from collections import deque
 from decimal import Decimal
-from typing import Optional
+from typing import Any, Optional
 
+import numpy as np
 import pandas as pd
 from nautilus_trader.config import StrategyConfig
 from nautilus_trader.model import Bar, BarType, InstrumentId
 from nautilus_trader.model.enums import OrderSide
 from nautilus_trader.trading.strategy import Strategy
 
+from src.core.signal_screening import ScreenBars, hold_signals
+from src.core.sma_logic import crossover_signals
 from src.core.strategy_registry import StrategyRegistry, register_strategy
 from src.models.strategy import MomentumParameters
 
@@ -76,10 +79,11 @@ class SMAMomentum(Strategy):
         self, q: deque, total: float, x: float, maxlen: int
     ) -> tuple[float | None, float]:
         """Update moving average calculation."""
+        # Reason: The deque drops its oldest value on append, so subtract it first
+        if len(q) == maxlen:
+            total -= q[0]
         q.append(x)
         total += x
-        if len(q) > maxlen:
-            total -= q[-(maxlen + 1)]
         return (total / maxlen if len(q) >= maxlen else None, total)
 
     def on_bar(self, bar: Bar) -> None:
@@ -167,9 +171,34 @@ class SMAMomentum(Strategy):
         self._prev_fast, self._prev_slow = fast_val, slow_val
 
 
+def sma_momentum_signals(bars: ScreenBars, params: dict[str, Any]) -> np.ndarray:
+    """
+    Vectorized SMAMomentum positions for signal screening.
+
+    Long trade_size after a golden cross; after a death cross short
+    trade_size when allow_short is set, flat otherwise.
+
+    Args:
+        bars: Bars to screen
+        params: Resolved MomentumParameters values
+
+    Returns:
+        Signed quantity held after each bar
+    """
+    direction = hold_signals(
+        crossover_signals(
+            bars.sma(int(params["fast_period"])), bars.sma(int(params["slow_period"]))
+        )
+    )
+    if not params["allow_short"]:
+        direction = np.maximum(direction, 0)
+    return direction * float(params["trade_size"])
+
+
 # Register config and parameter model for this strategy
 StrategyRegistry.set_config("momentum", SMAMomentumConfig)
 StrategyRegistry.set_param_model("momentum", MomentumParameters)
+StrategyRegistry.set_signal_function("momentum", sma_momentum_signals)
 StrategyRegistry.set_default_config(
     "momentum",
     {
@@ -23,15 +23,26 @@ Usage:
     # Register config and params separately (after class definitions)
     StrategyRegistry.set_config("my_strategy", MyStrategyConfig)
     StrategyRegistry.set_param_model("my_strategy", MyParameters)
+
+    # Optionally, a vectorized signal function enables `backtest screen`
+    StrategyRegistry.set_signal_function("my_strategy", my_strategy_signals)
 """
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Type, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Type, TypeVar
 
 from nautilus_trader.trading.strategy import Strategy, StrategyConfig
 from pydantic import BaseModel
 
+if TYPE_CHECKING:
+    import numpy as np
+
+    from src.core.signal_screening import ScreenBars
+
+# Target position (signed quantity) after each bar, from bars and full strategy params
+SignalFunction = Callable[["ScreenBars", Dict[str, Any]], "np.ndarray"]
+
 
 @dataclass
 class StrategyDefinition:
@@ -44,6 +55,12 @@ class StrategyDefinition:
     param_model: Optional[Type[BaseModel]] = None
     default_config: Dict[str, Any] = field(default_factory=dict)
     aliases: List[str] = field(default_factory=list)
+    signal_function: Optional[SignalFunction] = None
+
+    @property
+    def screenable(self) -> bool:
+        """Whether the strategy provides a vectorized signal function."""
+        return self.signal_function is not None
 
     @property
     def strategy_path(self) -> str:
@@ -84,6 +101,7 @@ class StrategyRegistry:
         param_model: Optional[Type[BaseModel]] = None,
         default_config: Optional[Dict[str, Any]] = None,
         aliases: Optional[List[str]] = None,
+        signal_function: Optional[SignalFunction] = None,
     ) -> None:
         """
         Register a strategy in the registry.
@@ -104,6 +122,8 @@ class StrategyRegistry:
             Default configuration template
         aliases : Optional[List[str]]
             Alternative names that resolve to this strategy
+        signal_function : Optional[SignalFunction]
+            Vectorized signal function used by signal screening
         """
         definition = StrategyDefinition(
             name=name,
@@ -113,6 +133,7 @@ class StrategyRegistry:
             param_model=param_model,
             default_config=default_config or {},
             aliases=aliases or [],
+            signal_function=signal_function,
         )
 
         cls._strategies[name] = definition
@@ -146,6 +167,13 @@ class StrategyRegistry:
             raise KeyError(f"Strategy '{name}' not registered")
         cls._strategies[name].default_config = default_config
 
+    @classmethod
+    def set_signal_function(cls, name: str, signal_function: SignalFunction) -> None:
+        """Set the vectorized signal function for a registered strategy."""
+        if name not in cls._strategies:
+            raise KeyError(f"Strategy '{name}' not registered")
+        cls._strategies[name].signal_function = signal_function
+
     @classmethod
     def get(cls, name: str) -> StrategyDefinition:
         """
@@ -224,6 +252,7 @@ class StrategyRegistry:
                 "strategy_path": defn.strategy_path,
                 "config_path": defn.config_path,
                 "aliases": defn.aliases,
+                "screenable": defn.screenable,
             }
             for defn in cls._strategies.values()
         ]
@@ -315,6 +344,7 @@ def register_strategy(
     param_model: Optional[Type[BaseModel]] = None,
     default_config: Optional[Dict[str, Any]] = None,
     aliases: Optional[List[str]] = None,
+    signal_function: Optional[SignalFunction] = None,
 ) -> Callable[[T], T]:
     """
     Decorator to register a strategy class.
@@ -342,6 +372,9 @@ def register_strategy(
         Default configuration template
     aliases : Optional[List[str]]
         Alternative names for this strategy
+    signal_function : Optional[SignalFunction]
+        Vectorized signal function (can also be set via
+        StrategyRegistry.set_signal_function)
 
     Returns
     -------
@@ -358,6 +391,7 @@ def register_strategy(
             param_model=param_model,
             default_config=default_config,
             aliases=aliases,
+            signal_function=signal_function,
         )
         return cls
 
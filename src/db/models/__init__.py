@@ -1,6 +1,18 @@
 """Database models for backtesting persistence."""
 
 from src.db.models.backtest import BacktestRun, PerformanceMetrics
+from src.db.models.backtest_summary import BacktestSummary
+from src.db.models.equity_curve import EquityCurve
 from src.db.models.trade import Trade
+from src.db.models.trade_analytics import TradeAnalytics
+from src.db.models.walk_forward import WalkForwardAnalysis
 
-__all__ = ["BacktestRun", "PerformanceMetrics", "Trade"]
+__all__ = [
+    "BacktestRun",
+    "BacktestSummary",
+    "EquityCurve",
+    "PerformanceMetrics",
+    "Trade",
+    "TradeAnalytics",
+    "WalkForwardAnalysis",
+]
@@ -11,7 +11,9 @@ from typing import TYPE_CHECKING, Optional
 from uuid import UUID, uuid4
 
 if TYPE_CHECKING:
+    from src.db.models.equity_curve import EquityCurve
     from src.db.models.trade import Trade
+    from src.db.models.trade_analytics import TradeAnalytics
 
 from sqlalchemy import (
     BigInteger,
@@ -52,8 +54,12 @@ class BacktestRun(Base, TimestampMixin):
         error_message: Error details if status = "failed"
         config_snapshot: Complete strategy configuration (JSONB)
         reproduced_from_run_id: Reference to original run if reproduction
+        sweep_id: Parameter sweep this run belongs to, if any
+        fingerprint: Result cache key (see backtest_orchestrator.run_fingerprint)
         created_at: When record was created
         metrics: Associated performance metrics (one-to-one)
+        equity_curve: Equity curve arrays (one-to-one, loaded on access)
+        trade_analytics: Persisted trade statistics and drawdowns (one-to-one, loaded on access)
 
     Example:
         >>> run = BacktestRun(
@@ -109,6 +115,12 @@ class BacktestRun(Base, TimestampMixin):
         PG_UUID(as_uuid=True), nullable=True
     )
 
+    # Parameter sweep grouping
+    sweep_id: Mapped[Optional[UUID]] = mapped_column(PG_UUID(as_uuid=True), nullable=True)
+
+    # Content hash of everything that determines the result (result cache key)
+    fingerprint: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+
     # Relationships
     metrics: Mapped[Optional["PerformanceMetrics"]] = relationship(
         "PerformanceMetrics",
@@ -117,11 +129,33 @@ class BacktestRun(Base, TimestampMixin):
         uselist=False,
         lazy="selectin",
     )
+    # Reason: a run can hold thousands of trades, so they are loaded only when a
+    # query opts in with selectinload(BacktestRun.trades); the database FK
+    # cascade removes them on delete without loading them first.
     trades: Mapped[list["Trade"]] = relationship(
         "Trade",
         back_populates="backtest_run",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes=True,
+        lazy="select",
+    )
+    # Reason: curves hold one point per bar, so like trades they are loaded
+    # only when an endpoint asks for them.
+    equity_curve: Mapped[Optional["EquityCurve"]] = relationship(
+        "EquityCurve",
+        back_populates="backtest_run",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        uselist=False,
+        lazy="select",
+    )
+    trade_analytics: Mapped[Optional["TradeAnalytics"]] = relationship(
+        "TradeAnalytics",
+        back_populates="backtest_run",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        uselist=False,
+        lazy="select",
     )
 
     # Table constraints
@@ -141,10 +175,16 @@ class BacktestRun(Base, TimestampMixin):
             "created_at",
             "id",
         ),
-        # Index for instrument filtering (Phase 2)
-        Index("idx_backtest_runs_instrument", "instrument_symbol"),
-        # Index for status filtering (Phase 2)
-        Index("idx_backtest_runs_status", "execution_status"),
+        # Keyset indexes for sorting the list by a column, ties broken by id.
+        # Instrument prefix search uses lower(instrument_symbol) text_pattern_ops,
+        # a PostgreSQL-only expression index created in migration e1a4c9d2b6f3.
+        Index("idx_backtest_runs_strategy_id", "strategy_name", "id"),
+        Index("idx_backtest_runs_instrument_id", "instrument_symbol", "id"),
+        Index("idx_backtest_runs_status_id", "execution_status", "id"),
+        # Index for parameter sweep lookups
+        Index("idx_backtest_runs_sweep_id", "sweep_id"),
+        # Index for result cache lookups
+        Index("idx_backtest_runs_fingerprint", "fingerprint"),
     )
 
     def __repr__(self) -> str:
@@ -262,6 +302,10 @@ class PerformanceMetrics(Base, TimestampMixin):
         ),
         # Index for backtest_run_id lookups
         Index("idx_metrics_backtest_run_id", "backtest_run_id"),
+        # Keyset indexes for sorting the list by a metric
+        Index("idx_metrics_total_return", "total_return", "backtest_run_id"),
+        Index("idx_metrics_sharpe_ratio", "sharpe_ratio", "backtest_run_id"),
+        Index("idx_metrics_max_drawdown", "max_drawdown", "backtest_run_id"),
     )
 
     def __repr__(self) -> str:
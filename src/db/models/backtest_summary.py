@@ -0,0 +1,106 @@
+"""
+SQLAlchemy ORM model for maintained backtest rollups.
+
+This module defines the database schema for dashboard statistics that are
+updated in the same transaction as every saved backtest, so reading them
+costs a handful of indexed rows regardless of how many runs exist.
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import BigInteger, Integer, Numeric, String, UniqueConstraint, func
+from sqlalchemy.dialects.postgresql import TIMESTAMP
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.db.base import Base
+
+# Rollup scopes; SCOPE_ALL has a single row with an empty scope_key
+SCOPE_ALL = "all"
+SCOPE_STRATEGY = "strategy"
+SCOPE_INSTRUMENT = "instrument"
+
+
+class BacktestSummary(Base):
+    """
+    Running aggregate over every backtest run in one scope.
+
+    One row covers all runs (scope "all"), one strategy name (scope
+    "strategy") or one instrument symbol (scope "instrument"). Rows only
+    grow: each saved run adds to the counts and replaces the best Sharpe
+    or worst drawdown when it beats them.
+
+    Attributes:
+        id: Internal database primary key
+        scope: "all", "strategy" or "instrument"
+        scope_key: Strategy name or instrument symbol ("" for scope "all")
+        total_runs: Number of runs, successful or failed
+        successful_runs: Number of runs with performance metrics
+        total_return_sum: Sum of total_return over successful runs
+        best_sharpe_ratio: Highest Sharpe ratio in the scope
+        best_sharpe_run_id: Run that achieved best_sharpe_ratio
+        best_sharpe_strategy: Strategy of that run
+        worst_max_drawdown: Most negative max drawdown in the scope
+        worst_drawdown_run_id: Run that suffered worst_max_drawdown
+        worst_drawdown_strategy: Strategy of that run
+        last_run_at: Creation time of the newest run in the scope
+        updated_at: When the row was last updated
+
+    Example:
+        >>> summary = await repository.find_summary(SCOPE_ALL)
+        >>> summary.total_runs, summary.best_sharpe_ratio
+    """
+
+    __tablename__ = "backtest_summaries"
+
+    # Primary key
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+
+    # Rollup identity
+    scope: Mapped[str] = mapped_column(String(20), nullable=False)
+    scope_key: Mapped[str] = mapped_column(String(255), nullable=False)
+
+    # Counts
+    total_runs: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    successful_runs: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_return_sum: Mapped[Decimal] = mapped_column(
+        Numeric(20, 6), nullable=False, default=Decimal("0")
+    )
+
+    # Extremes
+    best_sharpe_ratio: Mapped[Optional[Decimal]] = mapped_column(Numeric(15, 6), nullable=True)
+    best_sharpe_run_id: Mapped[Optional[UUID]] = mapped_column(PG_UUID(as_uuid=True), nullable=True)
+    best_sharpe_strategy: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    worst_max_drawdown: Mapped[Optional[Decimal]] = mapped_column(Numeric(15, 6), nullable=True)
+    worst_drawdown_run_id: Mapped[Optional[UUID]] = mapped_column(
+        PG_UUID(as_uuid=True), nullable=True
+    )
+    worst_drawdown_strategy: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+
+    # Recency
+    last_run_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP(timezone=True), nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+
+    # Table constraints
+    __table_args__ = (UniqueConstraint("scope", "scope_key", name="uq_backtest_summaries_scope"),)
+
+    @property
+    def avg_return(self) -> Optional[Decimal]:
+        """Mean total_return over successful runs, or None without any."""
+        if not self.successful_runs:
+            return None
+        return self.total_return_sum / self.successful_runs
+
+    def __repr__(self) -> str:
+        """Return string representation of BacktestSummary."""
+        return (
+            f"<BacktestSummary(scope={self.scope}, key={self.scope_key}, runs={self.total_runs})>"
+        )
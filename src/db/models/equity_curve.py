@@ -0,0 +1,88 @@
+"""
+SQLAlchemy ORM model for backtest equity curves.
+
+This module defines the database schema for persisting a run's equity curve
+as compact binary arrays, kept apart from the backtest_runs row so that
+list and dashboard queries never load it.
+"""
+
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from src.db.models.backtest import BacktestRun
+
+from sqlalchemy import BigInteger, ForeignKey, Integer
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from src.db.base import Base, TimestampMixin
+from src.db.types import NumpyArray
+
+
+class EquityCurve(Base, TimestampMixin):
+    """
+    Equity curve of a backtest run as parallel time/value arrays.
+
+    Attributes:
+        id: Internal database primary key
+        backtest_run_id: Foreign key to parent backtest run
+        point_count: Number of points in the curve
+        times: Unix timestamps in seconds (int64, compressed)
+        values: Account equity at each time (float64, compressed)
+        created_at: When record was created
+        backtest_run: Associated backtest run (one-to-one)
+
+    Example:
+        >>> curve = EquityCurve.from_points(
+        ...     backtest_run_id=1,
+        ...     points=[{"time": 1704067200, "value": 100000.0}],
+        ... )
+        >>> curve.times, curve.values
+    """
+
+    __tablename__ = "equity_curves"
+
+    # Primary key
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+
+    # Foreign key to backtest_runs
+    backtest_run_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("backtest_runs.id", ondelete="CASCADE"),
+        unique=True,
+        nullable=False,
+    )
+
+    # Curve data
+    point_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    times: Mapped[np.ndarray] = mapped_column(NumpyArray("int64"), nullable=False)
+    values: Mapped[np.ndarray] = mapped_column(NumpyArray("float64"), nullable=False)
+
+    # Relationships
+    backtest_run: Mapped["BacktestRun"] = relationship("BacktestRun", back_populates="equity_curve")
+
+    @classmethod
+    def from_points(cls, backtest_run_id: int, points: list[dict[str, Any]]) -> "EquityCurve":
+        """
+        Build a curve from {"time", "value"} points.
+
+        Args:
+            backtest_run_id: Foreign key to backtest_runs.id
+            points: Points with Unix-second times, sorted by time
+
+        Returns:
+            Unsaved EquityCurve instance
+        """
+        times = np.fromiter((int(p["time"]) for p in points), np.int64, len(points))
+        values = np.fromiter((float(p["value"]) for p in points), np.float64, len(points))
+        return cls(
+            backtest_run_id=backtest_run_id,
+            point_count=len(points),
+            times=times,
+            values=values,
+        )
+
+    def __repr__(self) -> str:
+        """Return string representation of EquityCurve."""
+        return f"<EquityCurve(backtest_run_id={self.backtest_run_id}, points={self.point_count})>"
@@ -0,0 +1,68 @@
+"""
+SQLAlchemy ORM model for persisted trade analytics.
+
+This module defines the database schema for a run's trade statistics and
+drawdown metrics, computed once from its trades so the statistics and
+drawdown endpoints read a single row instead of every trade.
+"""
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.db.models.backtest import BacktestRun
+
+from sqlalchemy import BigInteger, ForeignKey, Integer
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from src.db.base import Base, TimestampMixin
+
+
+class TradeAnalytics(Base, TimestampMixin):
+    """
+    Trade statistics and drawdown metrics of a backtest run.
+
+    Attributes:
+        id: Internal database primary key
+        backtest_run_id: Foreign key to parent backtest run
+        version: TRADE_ANALYTICS_VERSION the results were computed with
+        statistics: TradeStatistics as JSON (decimals kept as strings)
+        drawdowns: DrawdownMetrics as JSON (decimals kept as strings)
+        created_at: When record was created
+        backtest_run: Associated backtest run (one-to-one)
+
+    Example:
+        >>> analytics = TradeAnalytics(
+        ...     backtest_run_id=1,
+        ...     version=TRADE_ANALYTICS_VERSION,
+        ...     statistics=statistics.model_dump(mode="json"),
+        ...     drawdowns=drawdowns.model_dump(mode="json"),
+        ... )
+    """
+
+    __tablename__ = "trade_analytics"
+
+    # Primary key
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+
+    # Foreign key to backtest_runs
+    backtest_run_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("backtest_runs.id", ondelete="CASCADE"),
+        unique=True,
+        nullable=False,
+    )
+
+    # Analytics results
+    version: Mapped[int] = mapped_column(Integer, nullable=False)
+    statistics: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    drawdowns: Mapped[dict] = mapped_column(JSONB, nullable=False)
+
+    # Relationships
+    backtest_run: Mapped["BacktestRun"] = relationship(
+        "BacktestRun", back_populates="trade_analytics"
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation of TradeAnalytics."""
+        return f"<TradeAnalytics(backtest_run_id={self.backtest_run_id}, version={self.version})>"
@@ -0,0 +1,95 @@
+"""
+SQLAlchemy ORM model for walk-forward analyses.
+
+This module defines the database schema for a walk-forward optimization: its
+window layout and search space, the outcome of every fold and the stitched
+out-of-sample equity curve. Each fold's out-of-sample run is also saved as a
+regular backtest run and referenced by run_id from the fold results.
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Optional
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy import BigInteger, Index, Integer, Numeric, String
+from sqlalchemy.dialects.postgresql import JSONB, TIMESTAMP
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.db.base import Base, TimestampMixin
+from src.db.types import NumpyArray
+
+
+class WalkForwardAnalysis(Base, TimestampMixin):
+    """
+    One walk-forward analysis and its stitched out-of-sample result.
+
+    Attributes:
+        id: Internal database primary key
+        walk_forward_id: Unique business identifier
+        strategy_type: Strategy that was optimized
+        instrument_symbol: Trading symbol
+        start_date: Start of the analyzed range
+        end_date: End of the analyzed range
+        initial_capital: Capital the stitched curve starts from
+        config: Window layout, search space, ranking metric and base config
+        folds: FoldSummary of every fold as JSON
+        total_return: Compounded out-of-sample return as a fraction
+        max_drawdown: Maximum drawdown of the stitched curve (negative fraction)
+        execution_duration_seconds: Wall-clock time for the analysis
+        point_count: Number of points in the stitched curve
+        equity_times: Unix timestamps in seconds (int64, compressed)
+        equity_values: Stitched equity at each time (float64, compressed)
+        created_at: When record was created
+
+    Example:
+        >>> analysis = await repository.find_walk_forward(walk_forward_id)
+        >>> [fold["params"] for fold in analysis.folds]
+    """
+
+    __tablename__ = "walk_forward_analyses"
+
+    # Primary key
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+
+    # Business identifier
+    walk_forward_id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True), unique=True, nullable=False
+    )
+
+    # Analysis metadata
+    strategy_type: Mapped[str] = mapped_column(String(100), nullable=False)
+    instrument_symbol: Mapped[str] = mapped_column(String(50), nullable=False)
+    start_date: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True), nullable=False)
+    end_date: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True), nullable=False)
+    initial_capital: Mapped[Decimal] = mapped_column(Numeric(20, 2), nullable=False)
+    config: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    folds: Mapped[list] = mapped_column(JSONB, nullable=False)
+
+    # Out-of-sample results
+    total_return: Mapped[Optional[Decimal]] = mapped_column(Numeric(15, 6), nullable=True)
+    max_drawdown: Mapped[Optional[Decimal]] = mapped_column(Numeric(15, 6), nullable=True)
+    execution_duration_seconds: Mapped[Decimal] = mapped_column(Numeric(10, 3), nullable=False)
+
+    # Stitched equity curve
+    point_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    equity_times: Mapped[np.ndarray] = mapped_column(NumpyArray("int64"), nullable=False)
+    equity_values: Mapped[np.ndarray] = mapped_column(NumpyArray("float64"), nullable=False)
+
+    __table_args__ = (Index("idx_walk_forward_analyses_created", "created_at"),)
+
+    def equity_points(self) -> list[dict[str, Any]]:
+        """Stitched curve as {"time": unix_seconds, "value": equity} points."""
+        return [
+            {"time": int(time), "value": float(value)}
+            for time, value in zip(self.equity_times, self.equity_values)
+        ]
+
+    def __repr__(self) -> str:
+        """Return string representation of WalkForwardAnalysis."""
+        return (
+            f"<WalkForwardAnalysis(walk_forward_id={self.walk_forward_id}, "
+            f"strategy={self.strategy_type}, folds={len(self.folds)})>"
+        )
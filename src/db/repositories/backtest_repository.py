@@ -5,19 +5,305 @@ This module provides the data access layer for backtest metadata and performance
 metrics, implementing async database operations with SQLAlchemy.
 """
 
-from datetime import datetime
+from datetime import date, datetime, time, timedelta, timezone
 from decimal import Decimal
-from typing import List, Optional, Tuple, Union
+from typing import Any, List, Optional, Sequence, Tuple, Union
 from uuid import UUID
 
-from sqlalchemy import and_, func, select, tuple_
+import numpy as np
+from sqlalchemy import ColumnElement, Select, and_, case, func, insert, literal, or_, select, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.exc import IntegrityError, OperationalError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload, selectinload
-
-from src.api.models.filter_models import FilterState, SortColumn, SortOrder
+from sqlalchemy.orm import InstrumentedAttribute, joinedload, load_only, selectinload
+
+from src.api.models.filter_models import (
+    METRIC_SORT_COLUMNS,
+    FilterState,
+    SortColumn,
+    SortOrder,
+    decode_cursor,
+)
 from src.db.exceptions import DatabaseConnectionError, DuplicateRecordError
 from src.db.models.backtest import BacktestRun, PerformanceMetrics
+from src.db.models.backtest_summary import (
+    SCOPE_ALL,
+    SCOPE_INSTRUMENT,
+    SCOPE_STRATEGY,
+    BacktestSummary,
+)
+from src.db.models.equity_curve import EquityCurve
+from src.db.models.trade import Trade
+from src.db.models.trade_analytics import TradeAnalytics
+from src.db.models.walk_forward import WalkForwardAnalysis
+from src.models.trade import DrawdownMetrics, TradeStatistics
+
+# Filtered list totals are counted up to this many rows and shown as "N+" beyond
+LIST_COUNT_CAP = 10_000
+
+# Trade columns written by bulk_insert_trades, in row order; id and
+# created_at come from database defaults
+TRADE_INSERT_COLUMNS = (
+    "backtest_run_id",
+    "instrument_id",
+    "trade_id",
+    "venue_order_id",
+    "client_order_id",
+    "order_side",
+    "quantity",
+    "entry_price",
+    "exit_price",
+    "commission_amount",
+    "commission_currency",
+    "fees_amount",
+    "profit_loss",
+    "profit_pct",
+    "holding_period_seconds",
+    "entry_timestamp",
+    "exit_timestamp",
+)
+
+# Rows per multi-row INSERT (17 columns keeps each statement under the
+# 32,767 bind parameter limit of PostgreSQL and SQLite)
+TRADE_INSERT_CHUNK_SIZE = 1000
+
+# Columns needed to render list, dashboard and recent-activity rows. The JSONB
+# config snapshot and error text are left unloaded for these queries.
+SUMMARY_COLUMNS = (
+    BacktestRun.id,
+    BacktestRun.run_id,
+    BacktestRun.strategy_name,
+    BacktestRun.strategy_type,
+    BacktestRun.instrument_symbol,
+    BacktestRun.start_date,
+    BacktestRun.end_date,
+    BacktestRun.initial_capital,
+    BacktestRun.data_source,
+    BacktestRun.execution_status,
+    BacktestRun.execution_duration_seconds,
+    BacktestRun.created_at,
+    BacktestRun.reproduced_from_run_id,
+    BacktestRun.sweep_id,
+)
+
+
+def summary_load_options() -> tuple:
+    """
+    Loader options selecting only summary columns plus performance metrics.
+
+    Returns:
+        Options to pass to ``select(BacktestRun).options(...)``
+
+    Example:
+        >>> stmt = select(BacktestRun).options(*summary_load_options())
+    """
+    return (load_only(*SUMMARY_COLUMNS), selectinload(BacktestRun.metrics))
+
+
+def run_load_options(include_trades: bool = False) -> tuple:
+    """
+    Loader options for a full backtest run, with trades only on request.
+
+    Args:
+        include_trades: Also load every trade of the run
+
+    Returns:
+        Options to pass to ``select(BacktestRun).options(...)``
+    """
+    if include_trades:
+        return (selectinload(BacktestRun.metrics), selectinload(BacktestRun.trades))
+    return (selectinload(BacktestRun.metrics),)
+
+
+def list_sort_column(sort: SortColumn) -> InstrumentedAttribute[Any]:
+    """
+    Column a backtest list is ordered by for a sort option.
+
+    Args:
+        sort: SortColumn enum value
+
+    Returns:
+        SQLAlchemy column for ordering
+    """
+    column_map = {
+        SortColumn.CREATED_AT: BacktestRun.created_at,
+        SortColumn.STRATEGY_NAME: BacktestRun.strategy_name,
+        SortColumn.INSTRUMENT_SYMBOL: BacktestRun.instrument_symbol,
+        SortColumn.EXECUTION_STATUS: BacktestRun.execution_status,
+        SortColumn.TOTAL_RETURN: PerformanceMetrics.total_return,
+        SortColumn.SHARPE_RATIO: PerformanceMetrics.sharpe_ratio,
+        SortColumn.MAX_DRAWDOWN: PerformanceMetrics.max_drawdown,
+    }
+    return column_map[sort]
+
+
+def list_sort_value(run: BacktestRun, sort: SortColumn) -> Any:
+    """
+    Value of the sort column at a listed run, as encoded in its cursor.
+
+    Args:
+        run: Run loaded with its metrics
+        sort: SortColumn enum value
+
+    Returns:
+        Sort value, or None for a metric the run does not have
+    """
+    if sort in METRIC_SORT_COLUMNS:
+        return getattr(run.metrics, sort.value) if run.metrics else None
+    return getattr(run, sort.value)
+
+
+def _escape_like(value: str) -> str:
+    """Escape LIKE wildcards so user input matches literally."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _day_start(day: date) -> datetime:
+    """Midnight UTC at the start of a calendar day."""
+    return datetime.combine(day, time.min, tzinfo=timezone.utc)
+
+
+def filter_conditions(filter_state: FilterState) -> list:
+    """
+    WHERE conditions for the filters of a backtest list.
+
+    Every condition is sargable: date filters compare created_at against
+    day boundaries instead of casting it, and the instrument filter is a
+    case-insensitive prefix match served by the lower(instrument_symbol)
+    pattern index.
+
+    Args:
+        filter_state: Filter state (sort and pagination are ignored)
+
+    Returns:
+        List of SQLAlchemy conditions to AND together
+    """
+    conditions = []
+
+    if filter_state.strategy:
+        conditions.append(BacktestRun.strategy_name == filter_state.strategy)
+
+    if filter_state.instrument:
+        pattern = _escape_like(filter_state.instrument.lower()) + "%"
+        conditions.append(func.lower(BacktestRun.instrument_symbol).like(pattern, escape="\\"))
+
+    if filter_state.date_from:
+        conditions.append(BacktestRun.created_at >= _day_start(filter_state.date_from))
+
+    if filter_state.date_to:
+        next_day = filter_state.date_to + timedelta(days=1)
+        conditions.append(BacktestRun.created_at < _day_start(next_day))
+
+    if filter_state.status:
+        conditions.append(BacktestRun.execution_status == filter_state.status.value)
+
+    return conditions
+
+
+def _keyset_condition(
+    column: InstrumentedAttribute[Any],
+    nullable: bool,
+    descending: bool,
+    value: Any,
+    row_id: int,
+    after: bool,
+) -> ColumnElement:
+    """
+    Rows strictly after (or before) a (value, id) position in list order.
+
+    List order is the sort column in the given direction with NULLs last,
+    then id in the same direction.
+    """
+    use_gt = descending != after
+
+    def beyond(left, right):
+        return left > right if use_gt else left < right
+
+    if not nullable:
+        # Reason: A row-value comparison matches the (column, id) index order
+        position = tuple_(literal(value, column.type), literal(row_id, BacktestRun.id.type))
+        return beyond(tuple_(column, BacktestRun.id), position)
+
+    same_value_beyond = and_(column == value, beyond(BacktestRun.id, row_id))
+    if after:
+        if value is None:
+            return and_(column.is_(None), beyond(BacktestRun.id, row_id))
+        return or_(column.is_(None), beyond(column, value), same_value_beyond)
+    if value is None:
+        return or_(column.is_not(None), and_(column.is_(None), beyond(BacktestRun.id, row_id)))
+    return or_(beyond(column, value), same_value_beyond)
+
+
+def filtered_list_statement(filter_state: FilterState, limit: Optional[int] = None) -> Select:
+    """
+    SELECT for one page of a filtered, sorted backtest list.
+
+    Fetches one row more than the page so callers can tell whether another
+    page follows. With a before cursor the rows come back in reverse list order.
+
+    Args:
+        filter_state: Complete filter/sort/pagination state
+        limit: Page length overriding filter_state.page_size (e.g., for the CLI)
+
+    Returns:
+        Select over BacktestRun with summary columns and metrics loaded
+
+    Raises:
+        ValueError: If the after/before cursor is malformed
+    """
+    sort = filter_state.sort
+    column = list_sort_column(sort)
+    nullable = sort in METRIC_SORT_COLUMNS
+    descending = filter_state.order == SortOrder.DESC
+    backward = filter_state.before is not None
+
+    stmt = select(BacktestRun).options(*summary_load_options())
+    if nullable:
+        stmt = stmt.outerjoin(
+            PerformanceMetrics, BacktestRun.id == PerformanceMetrics.backtest_run_id
+        )
+
+    conditions = filter_conditions(filter_state)
+    cursor = filter_state.after or filter_state.before
+    if cursor:
+        value, row_id = decode_cursor(cursor, sort)
+        conditions.append(
+            _keyset_condition(column, nullable, descending, value, row_id, after=not backward)
+        )
+    if conditions:
+        stmt = stmt.where(and_(*conditions))
+
+    fetch_descending = descending != backward
+    order_column = column.desc() if fetch_descending else column.asc()
+    if nullable:
+        # NULLs stay at the end of the list, so they come first when fetching backward
+        order_column = order_column.nulls_first() if backward else order_column.nulls_last()
+    order_id = BacktestRun.id.desc() if fetch_descending else BacktestRun.id.asc()
+    stmt = stmt.order_by(order_column, order_id)
+
+    limit = limit or filter_state.page_size
+    if not cursor and filter_state.page > 1:
+        # Reason: Bare page numbers (old bookmarked links) fall back to OFFSET;
+        # capping them keeps the skipped rows within the counted window
+        page = min(filter_state.page, max_offset_page(limit))
+        stmt = stmt.offset((page - 1) * limit)
+    return stmt.limit(limit + 1)
+
+
+def max_offset_page(page_size: int) -> int:
+    """
+    Deepest page number served without a cursor.
+
+    Pages reached by number are fetched with OFFSET, so they stop at the
+    LIST_COUNT_CAP rows the list total is counted to; deeper pages need cursors.
+
+    Args:
+        page_size: Rows per page
+
+    Returns:
+        Last page number whose rows lie within the first LIST_COUNT_CAP rows
+    """
+    return max(LIST_COUNT_CAP // page_size, 1)
 
 
 class BacktestRepository:
@@ -60,6 +346,8 @@ class BacktestRepository:
         config_snapshot: dict,
         error_message: Optional[str] = None,
         reproduced_from_run_id: Optional[UUID] = None,
+        sweep_id: Optional[UUID] = None,
+        fingerprint: Optional[str] = None,
     ) -> BacktestRun:
         """
         Create a new backtest run record.
@@ -78,6 +366,8 @@ class BacktestRepository:
             config_snapshot: Complete configuration (JSONB)
             error_message: Error details if failed
             reproduced_from_run_id: Original run if reproduction
+            sweep_id: Parameter sweep this run belongs to
+            fingerprint: Result cache key of the run
 
         Returns:
             Created BacktestRun instance with ID assigned
@@ -101,6 +391,8 @@ class BacktestRepository:
                 error_message=error_message,
                 config_snapshot=config_snapshot,
                 reproduced_from_run_id=reproduced_from_run_id,
+                sweep_id=sweep_id,
+                fingerprint=fingerprint,
             )
 
             self.session.add(backtest_run)
@@ -218,42 +510,329 @@ class BacktestRepository:
 
         return metrics
 
-    async def find_by_run_id(self, run_id: UUID) -> Optional[BacktestRun]:
+    async def create_equity_curve(self, backtest_run_id: int, points: List[dict]) -> EquityCurve:
+        """
+        Store the equity curve of a backtest run.
+
+        Args:
+            backtest_run_id: Foreign key to backtest_runs.id
+            points: Points as {"time": unix_seconds, "value": equity}, sorted by time
+
+        Returns:
+            Created EquityCurve instance
+
+        Raises:
+            IntegrityError: If backtest_run_id already has an equity curve
+        """
+        equity_curve = EquityCurve.from_points(backtest_run_id, points)
+
+        self.session.add(equity_curve)
+        await self.session.flush()
+
+        return equity_curve
+
+    async def find_equity_curve(self, run_id: UUID) -> Optional[EquityCurve]:
+        """
+        Find the equity curve of a backtest by business identifier.
+
+        Only the curve row is read; the run itself is not loaded.
+
+        Args:
+            run_id: Unique business identifier
+
+        Returns:
+            EquityCurve with decoded arrays, or None if the run has no curve
+        """
+        stmt = (
+            select(EquityCurve)
+            .join(BacktestRun, EquityCurve.backtest_run_id == BacktestRun.id)
+            .where(BacktestRun.run_id == run_id)
+        )
+
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def save_trade_analytics(
+        self,
+        backtest_run_id: int,
+        statistics: TradeStatistics,
+        drawdowns: DrawdownMetrics,
+        version: int,
+    ) -> None:
+        """
+        Store a run's trade statistics and drawdown metrics, replacing any previous ones.
+
+        Runs as a single INSERT ... ON CONFLICT DO UPDATE, so concurrent
+        requests filling in the same run's analytics do not collide.
+
+        Args:
+            backtest_run_id: Foreign key to backtest_runs.id
+            statistics: Trade statistics of the run
+            drawdowns: Drawdown metrics of the run
+            version: TRADE_ANALYTICS_VERSION the results were computed with
+        """
+        row = {
+            "backtest_run_id": backtest_run_id,
+            "version": version,
+            "statistics": statistics.model_dump(mode="json"),
+            "drawdowns": drawdowns.model_dump(mode="json"),
+        }
+
+        dialect = sqlite if self.session.bind.dialect.name == "sqlite" else postgresql
+        table = TradeAnalytics.__table__
+        stmt = dialect.insert(table).values(row)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.backtest_run_id],
+            set_={
+                "version": stmt.excluded.version,
+                "statistics": stmt.excluded.statistics,
+                "drawdowns": stmt.excluded.drawdowns,
+            },
+        )
+
+        await self.session.execute(stmt)
+
+    async def find_trade_analytics(self, backtest_run_id: int) -> Optional[TradeAnalytics]:
+        """
+        Find the persisted trade analytics of a run.
+
+        Args:
+            backtest_run_id: Backtest run database ID
+
+        Returns:
+            TradeAnalytics, or None if they have not been computed yet
+        """
+        stmt = select(TradeAnalytics).where(TradeAnalytics.backtest_run_id == backtest_run_id)
+
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def find_trade_values(
+        self, backtest_run_id: int, columns: Sequence[str]
+    ) -> List[Tuple[Any, ...]]:
+        """
+        Read selected columns of a run's trades, oldest entry first.
+
+        Only the named columns are selected and no Trade objects are built.
+
+        Args:
+            backtest_run_id: Backtest run database ID
+            columns: Trade column names to select
+
+        Returns:
+            One tuple of column values per trade, ordered by entry_timestamp
+        """
+        stmt = (
+            select(*[getattr(Trade, name) for name in columns])
+            .where(Trade.backtest_run_id == backtest_run_id)
+            .order_by(Trade.entry_timestamp)
+        )
+
+        result = await self.session.execute(stmt)
+        return [tuple(row) for row in result.all()]
+
+    async def record_run_summary(
+        self, backtest_run: BacktestRun, metrics: Optional[PerformanceMetrics] = None
+    ) -> None:
+        """
+        Fold a newly created run into the all/strategy/instrument rollups.
+
+        Runs as a single INSERT ... ON CONFLICT DO UPDATE in the caller's
+        transaction, so the rollups commit or roll back with the run itself
+        and concurrent saves serialize on the affected rows.
+
+        Args:
+            backtest_run: Run just created by create_backtest_run
+            metrics: Its performance metrics, or None for a failed run
+        """
+        sharpe = metrics.sharpe_ratio if metrics else None
+        drawdown = metrics.max_drawdown if metrics else None
+        row = {
+            "total_runs": 1,
+            "successful_runs": 1 if metrics else 0,
+            "total_return_sum": metrics.total_return if metrics else Decimal("0"),
+            "best_sharpe_ratio": sharpe,
+            "best_sharpe_run_id": backtest_run.run_id if sharpe is not None else None,
+            "best_sharpe_strategy": backtest_run.strategy_name if sharpe is not None else None,
+            "worst_max_drawdown": drawdown,
+            "worst_drawdown_run_id": backtest_run.run_id if drawdown is not None else None,
+            "worst_drawdown_strategy": (
+                backtest_run.strategy_name if drawdown is not None else None
+            ),
+            "last_run_at": backtest_run.created_at,
+        }
+        # Reason: Fixed scope order keeps concurrent upserts from deadlocking
+        rows = [
+            {"scope": SCOPE_ALL, "scope_key": "", **row},
+            {"scope": SCOPE_STRATEGY, "scope_key": backtest_run.strategy_name, **row},
+            {"scope": SCOPE_INSTRUMENT, "scope_key": backtest_run.instrument_symbol, **row},
+        ]
+
+        dialect = sqlite if self.session.bind.dialect.name == "sqlite" else postgresql
+        table = BacktestSummary.__table__
+        stmt = dialect.insert(table).values(rows)
+        new = stmt.excluded
+        sharpe_wins = and_(
+            new.best_sharpe_ratio.is_not(None),
+            or_(
+                table.c.best_sharpe_ratio.is_(None),
+                new.best_sharpe_ratio > table.c.best_sharpe_ratio,
+            ),
+        )
+        drawdown_wins = and_(
+            new.worst_max_drawdown.is_not(None),
+            or_(
+                table.c.worst_max_drawdown.is_(None),
+                new.worst_max_drawdown < table.c.worst_max_drawdown,
+            ),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.scope, table.c.scope_key],
+            set_={
+                "total_runs": table.c.total_runs + new.total_runs,
+                "successful_runs": table.c.successful_runs + new.successful_runs,
+                "total_return_sum": table.c.total_return_sum + new.total_return_sum,
+                **{
+                    column: case((sharpe_wins, new[column]), else_=table.c[column])
+                    for column in (
+                        "best_sharpe_ratio",
+                        "best_sharpe_run_id",
+                        "best_sharpe_strategy",
+                    )
+                },
+                **{
+                    column: case((drawdown_wins, new[column]), else_=table.c[column])
+                    for column in (
+                        "worst_max_drawdown",
+                        "worst_drawdown_run_id",
+                        "worst_drawdown_strategy",
+                    )
+                },
+                "last_run_at": case(
+                    (
+                        or_(
+                            table.c.last_run_at.is_(None),
+                            new.last_run_at > table.c.last_run_at,
+                        ),
+                        new.last_run_at,
+                    ),
+                    else_=table.c.last_run_at,
+                ),
+                "updated_at": func.now(),
+            },
+        )
+
+        await self.session.execute(stmt)
+
+    async def find_summary(
+        self, scope: str = SCOPE_ALL, scope_key: str = ""
+    ) -> Optional[BacktestSummary]:
+        """
+        Find one rollup row.
+
+        Args:
+            scope: "all", "strategy" or "instrument"
+            scope_key: Strategy name or instrument symbol ("" for scope "all")
+
+        Returns:
+            BacktestSummary, or None if no run has been recorded in the scope
+        """
+        stmt = select(BacktestSummary).where(
+            BacktestSummary.scope == scope, BacktestSummary.scope_key == scope_key
+        )
+
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def find_summaries(self, scope: str, limit: int = 10) -> List[BacktestSummary]:
+        """
+        Find the rollups of a scope, most-run first.
+
+        Args:
+            scope: "strategy" or "instrument"
+            limit: Maximum rows to return
+
+        Returns:
+            List of BacktestSummary ordered by total_runs descending
+        """
+        stmt = (
+            select(BacktestSummary)
+            .where(BacktestSummary.scope == scope)
+            .order_by(BacktestSummary.total_runs.desc(), BacktestSummary.scope_key)
+            .limit(limit)
+        )
+
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def find_by_run_id(
+        self, run_id: UUID, include_trades: bool = False
+    ) -> Optional[BacktestRun]:
         """
         Find backtest by business identifier.
 
         Eagerly loads associated performance metrics to avoid N+1 queries.
+        Trades are loaded only when requested.
 
         Args:
             run_id: Unique business identifier
+            include_trades: Also load the run's trades
 
         Returns:
             BacktestRun with metrics loaded, or None if not found
         """
         stmt = (
             select(BacktestRun)
-            .options(selectinload(BacktestRun.metrics))
+            .options(*run_load_options(include_trades))
             .where(BacktestRun.run_id == run_id)
         )
 
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
-    async def find_by_internal_id(self, internal_id: int) -> Optional[BacktestRun]:
+    async def find_by_fingerprint(self, fingerprint: str) -> Optional[BacktestRun]:
+        """
+        Find the most recent successful run with a result fingerprint.
+
+        Args:
+            fingerprint: Result cache key (see backtest_orchestrator.run_fingerprint)
+
+        Returns:
+            BacktestRun with metrics loaded, or None if no run matches
+        """
+        stmt = (
+            select(BacktestRun)
+            .options(selectinload(BacktestRun.metrics))
+            .where(
+                BacktestRun.fingerprint == fingerprint,
+                BacktestRun.execution_status == "success",
+            )
+            .order_by(BacktestRun.created_at.desc(), BacktestRun.id.desc())
+            .limit(1)
+        )
+
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def find_by_internal_id(
+        self, internal_id: int, include_trades: bool = False
+    ) -> Optional[BacktestRun]:
         """
         Find backtest by internal database ID.
 
         Eagerly loads associated performance metrics to avoid N+1 queries.
+        Trades are loaded only when requested.
 
         Args:
             internal_id: Internal database primary key
+            include_trades: Also load the run's trades
 
         Returns:
             BacktestRun with metrics loaded, or None if not found
         """
         stmt = (
             select(BacktestRun)
-            .options(selectinload(BacktestRun.metrics))
+            .options(*run_load_options(include_trades))
             .where(BacktestRun.id == internal_id)
         )
 
@@ -264,6 +843,7 @@ class BacktestRepository:
         self,
         limit: int = 20,
         cursor: Optional[Union[datetime, Tuple[datetime, int]]] = None,
+        summary_only: bool = False,
     ) -> List[BacktestRun]:
         """
         Find recent backtests with cursor pagination.
@@ -273,11 +853,13 @@ class BacktestRepository:
         Args:
             limit: Maximum number of records to return
             cursor: Pagination cursor - either datetime (created_at) or tuple (created_at, id)
+            summary_only: Load only the summary columns used by list and dashboard views
 
         Returns:
             List of BacktestRun instances with metrics loaded
         """
-        stmt = select(BacktestRun).options(selectinload(BacktestRun.metrics))
+        options = summary_load_options() if summary_only else run_load_options()
+        stmt = select(BacktestRun).options(*options)
 
         if cursor:
             # Handle both datetime and tuple cursor formats
@@ -350,6 +932,135 @@ class BacktestRepository:
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
+    async def find_by_sweep_id(
+        self,
+        sweep_id: UUID,
+        metric: str = "sharpe_ratio",
+        limit: int = 100,
+    ) -> List[BacktestRun]:
+        """
+        Find the runs of a parameter sweep ranked by a performance metric.
+
+        Runs without the metric (e.g., failed runs) are ordered last.
+
+        Args:
+            sweep_id: Parameter sweep identifier
+            metric: Metric to rank by ('sharpe_ratio', 'total_return',
+                    'sortino_ratio', 'max_drawdown')
+            limit: Maximum records to return
+
+        Returns:
+            List of BacktestRun instances with metrics loaded, best first
+
+        Raises:
+            ValueError: If metric is not supported
+
+        Example:
+            >>> repository = BacktestRepository(session)
+            >>> ranked = await repository.find_by_sweep_id(sweep_id, metric="total_return")
+        """
+        metric_column_map = {
+            "sharpe_ratio": PerformanceMetrics.sharpe_ratio,
+            "total_return": PerformanceMetrics.total_return,
+            "sortino_ratio": PerformanceMetrics.sortino_ratio,
+            "max_drawdown": PerformanceMetrics.max_drawdown,
+        }
+
+        if metric not in metric_column_map:
+            raise ValueError(
+                f"Unsupported metric: {metric}. Supported metrics: {list(metric_column_map.keys())}"
+            )
+
+        stmt = (
+            select(BacktestRun)
+            .outerjoin(PerformanceMetrics, BacktestRun.id == PerformanceMetrics.backtest_run_id)
+            .options(selectinload(BacktestRun.metrics))
+            .where(BacktestRun.sweep_id == sweep_id)
+            .order_by(metric_column_map[metric].desc().nulls_last(), BacktestRun.id)
+            .limit(limit)
+        )
+
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def create_walk_forward(
+        self,
+        walk_forward_id: UUID,
+        strategy_type: str,
+        instrument_symbol: str,
+        start_date: datetime,
+        end_date: datetime,
+        initial_capital: Decimal,
+        config: dict,
+        folds: List[dict],
+        equity_curve: List[dict],
+        execution_duration_seconds: Decimal,
+        total_return: Optional[Decimal] = None,
+        max_drawdown: Optional[Decimal] = None,
+    ) -> WalkForwardAnalysis:
+        """
+        Store a walk-forward analysis with its stitched out-of-sample curve.
+
+        Args:
+            walk_forward_id: Unique business identifier
+            strategy_type: Strategy that was optimized
+            instrument_symbol: Trading symbol
+            start_date: Start of the analyzed range
+            end_date: End of the analyzed range
+            initial_capital: Capital the stitched curve starts from
+            config: Window layout, search space and ranking metric (JSONB)
+            folds: Per-fold results (JSONB)
+            equity_curve: Points as {"time": unix_seconds, "value": equity}, sorted by time
+            execution_duration_seconds: Wall-clock time for the analysis
+            total_return: Compounded out-of-sample return as a fraction
+            max_drawdown: Maximum drawdown of the stitched curve
+
+        Returns:
+            Created WalkForwardAnalysis instance with ID assigned
+        """
+        analysis = WalkForwardAnalysis(
+            walk_forward_id=walk_forward_id,
+            strategy_type=strategy_type,
+            instrument_symbol=instrument_symbol,
+            start_date=start_date,
+            end_date=end_date,
+            initial_capital=initial_capital,
+            config=config,
+            folds=folds,
+            total_return=total_return,
+            max_drawdown=max_drawdown,
+            execution_duration_seconds=execution_duration_seconds,
+            point_count=len(equity_curve),
+            equity_times=np.fromiter(
+                (int(p["time"]) for p in equity_curve), np.int64, len(equity_curve)
+            ),
+            equity_values=np.fromiter(
+                (float(p["value"]) for p in equity_curve), np.float64, len(equity_curve)
+            ),
+        )
+
+        self.session.add(analysis)
+        await self.session.flush()
+
+        return analysis
+
+    async def find_walk_forward(self, walk_forward_id: UUID) -> Optional[WalkForwardAnalysis]:
+        """
+        Find a walk-forward analysis by business identifier.
+
+        Args:
+            walk_forward_id: Walk-forward analysis identifier
+
+        Returns:
+            WalkForwardAnalysis, or None if not found
+        """
+        stmt = select(WalkForwardAnalysis).where(
+            WalkForwardAnalysis.walk_forward_id == walk_forward_id
+        )
+
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
     async def find_top_performers(
         self,
         metric: str = "sharpe_ratio",
@@ -500,145 +1211,141 @@ class BacktestRepository:
     async def get_filtered_backtests(
         self,
         filter_state: FilterState,
-    ) -> Tuple[List[BacktestRun], int]:
+    ) -> Tuple[List[BacktestRun], bool]:
         """
-        Get filtered, sorted, and paginated backtests.
+        Get one page of filtered, sorted backtests.
 
-        Applies all filters from FilterState and returns matching results
-        with total count for pagination.
+        Pages by keyset when filter_state carries an after/before cursor, so
+        deep pages cost the same as the first one. Without a cursor, pages
+        beyond the first fall back to OFFSET (old bookmarked links), capped at
+        max_offset_page. Only summary columns and metrics are loaded.
 
         Args:
             filter_state: Complete filter/sort/pagination state
 
         Returns:
-            Tuple of (list of BacktestRun instances, total count)
+            Tuple of (page of BacktestRun instances in list order, whether more
+            rows exist past the page in the direction it was fetched)
+
+        Raises:
+            ValueError: If the after/before cursor is malformed
 
         Example:
             >>> state = FilterState(strategy="SMA", sort=SortColumn.SHARPE_RATIO)
-            >>> runs, total = await repo.get_filtered_backtests(state)
+            >>> runs, has_more = await repo.get_filtered_backtests(state)
         """
-        # Build base query
-        query = select(BacktestRun).options(selectinload(BacktestRun.metrics))
-        count_query = select(func.count(BacktestRun.id))
-
-        # Apply filters
-        conditions = []
-
-        if filter_state.strategy:
-            conditions.append(BacktestRun.strategy_name == filter_state.strategy)
-
-        if filter_state.instrument:
-            # Case-insensitive partial match
-            conditions.append(BacktestRun.instrument_symbol.ilike(f"%{filter_state.instrument}%"))
-
-        if filter_state.date_from:
-            conditions.append(func.date(BacktestRun.created_at) >= filter_state.date_from)
-
-        if filter_state.date_to:
-            conditions.append(func.date(BacktestRun.created_at) <= filter_state.date_to)
-
-        if filter_state.status:
-            conditions.append(BacktestRun.execution_status == filter_state.status.value)
+        stmt = filtered_list_statement(filter_state)
 
-        # Apply conditions to both queries
-        if conditions:
-            query = query.where(and_(*conditions))
-            count_query = count_query.where(and_(*conditions))
-
-        # Get total count (before pagination)
-        count_result = await self.session.execute(count_query)
-        total_count = count_result.scalar_one()
-
-        # Apply sorting
-        sort_column = self._get_sort_column(filter_state.sort)
-        needs_join = filter_state.sort in [
-            SortColumn.TOTAL_RETURN,
-            SortColumn.SHARPE_RATIO,
-            SortColumn.MAX_DRAWDOWN,
-        ]
-
-        if needs_join:
-            query = query.outerjoin(
-                PerformanceMetrics, BacktestRun.id == PerformanceMetrics.backtest_run_id
-            )
-
-        if filter_state.order == SortOrder.ASC:
-            query = query.order_by(sort_column.asc().nulls_last())
-        else:
-            query = query.order_by(sort_column.desc().nulls_last())
-
-        # Apply pagination
-        offset = (filter_state.page - 1) * filter_state.page_size
-        query = query.offset(offset).limit(filter_state.page_size)
-
-        # Execute query
-        result = await self.session.execute(query)
+        result = await self.session.execute(stmt)
         backtests = list(result.scalars().unique().all())
 
-        return backtests, total_count
+        has_more = len(backtests) > filter_state.page_size
+        backtests = backtests[: filter_state.page_size]
+        if filter_state.before:
+            backtests.reverse()
+        return backtests, has_more
 
-    def _get_sort_column(self, sort: SortColumn):
+    async def count_filtered_backtests(
+        self, filter_state: FilterState, cap: int = LIST_COUNT_CAP
+    ) -> int:
         """
-        Map SortColumn enum to SQLAlchemy column.
+        Count backtests matching the filters, stopping at cap.
 
         Args:
-            sort: SortColumn enum value
+            filter_state: Filter state (sort and pagination are ignored)
+            cap: Maximum number of rows to count
 
         Returns:
-            SQLAlchemy column for ordering
-        """
-        column_map = {
-            SortColumn.CREATED_AT: BacktestRun.created_at,
-            SortColumn.STRATEGY_NAME: BacktestRun.strategy_name,
-            SortColumn.INSTRUMENT_SYMBOL: BacktestRun.instrument_symbol,
-            SortColumn.EXECUTION_STATUS: BacktestRun.execution_status,
-            SortColumn.TOTAL_RETURN: PerformanceMetrics.total_return,
-            SortColumn.SHARPE_RATIO: PerformanceMetrics.sharpe_ratio,
-            SortColumn.MAX_DRAWDOWN: PerformanceMetrics.max_drawdown,
-        }
-        return column_map[sort]
+            Number of matching backtests, or cap if there are at least that many
+        """
+        matching = select(BacktestRun.id).where(*filter_conditions(filter_state)).limit(cap)
+        stmt = select(func.count()).select_from(matching.subquery())
+
+        result = await self.session.execute(stmt)
+        return result.scalar_one()
 
     async def get_distinct_strategies(self) -> List[str]:
         """
         Get all distinct strategy names.
 
+        Read from the strategy rollups, one row per strategy, rather than
+        by scanning backtest_runs.
+
         Returns:
             List of unique strategy names, sorted alphabetically
         """
-        stmt = select(BacktestRun.strategy_name).distinct().order_by(BacktestRun.strategy_name)
-
-        result = await self.session.execute(stmt)
-        return [row[0] for row in result.all()]
+        return await self._get_scope_keys(SCOPE_STRATEGY)
 
     async def get_distinct_instruments(self) -> List[str]:
         """
         Get all distinct instrument symbols.
 
+        Read from the instrument rollups, one row per instrument, rather than
+        by scanning backtest_runs.
+
         Returns:
             List of unique instrument symbols, sorted alphabetically
         """
+        return await self._get_scope_keys(SCOPE_INSTRUMENT)
+
+    async def _get_scope_keys(self, scope: str) -> List[str]:
+        """Sorted scope_key values of one rollup scope."""
         stmt = (
-            select(BacktestRun.instrument_symbol).distinct().order_by(BacktestRun.instrument_symbol)
+            select(BacktestSummary.scope_key)
+            .where(BacktestSummary.scope == scope)
+            .order_by(BacktestSummary.scope_key)
         )
 
         result = await self.session.execute(stmt)
-        return [row[0] for row in result.all()]
+        return list(result.scalars().all())
 
-    async def bulk_create_trades(self, trades: List) -> None:
+    async def bulk_insert_trades(self, rows: Sequence[Sequence[Any]]) -> int:
         """
-        Bulk insert trades for a backtest run.
+        Bulk insert trade rows for a backtest run.
 
-        Uses SQLAlchemy's add_all() for efficient bulk insertion.
+        On PostgreSQL with asyncpg the rows are written with COPY on the
+        session's connection, inside its open transaction. Other databases
+        (and a connection with no transaction yet) use multi-row INSERT
+        statements of TRADE_INSERT_CHUNK_SIZE rows. No ORM objects are built.
 
         Args:
-            trades: List of Trade model instances to insert
+            rows: Trade value tuples in TRADE_INSERT_COLUMNS order
+
+        Returns:
+            Number of rows inserted
 
         Raises:
             DatabaseConnectionError: If database operation fails
+
+        Example:
+            >>> rows, _ = positions_to_trade_rows(run.id, positions_df)
+            >>> await repository.bulk_insert_trades(rows)
         """
+        if not rows:
+            return 0
+
         try:
-            self.session.add_all(trades)
-            await self.session.flush()
+            connection = await self.session.connection()
+            if connection.dialect.driver == "asyncpg":
+                raw_connection = await connection.get_raw_connection()
+                driver_connection = raw_connection.driver_connection
+                assert driver_connection is not None, "asyncpg connection is not open"
+                # Reason: COPY bypasses SQLAlchemy, so it is only safe once the
+                # session's transaction has actually begun on the connection
+                if driver_connection.is_in_transaction():
+                    await driver_connection.copy_records_to_table(
+                        Trade.__tablename__,
+                        records=rows,
+                        columns=list(TRADE_INSERT_COLUMNS),
+                    )
+                    return len(rows)
+
+            for start in range(0, len(rows), TRADE_INSERT_CHUNK_SIZE):
+                chunk = rows[start : start + TRADE_INSERT_CHUNK_SIZE]
+                await self.session.execute(
+                    insert(Trade).values([dict(zip(TRADE_INSERT_COLUMNS, row)) for row in chunk])
+                )
+            return len(rows)
 
         except OperationalError as e:
             raise DatabaseConnectionError(f"Database connection failed: {e}") from e
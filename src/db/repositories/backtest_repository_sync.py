@@ -11,10 +11,16 @@ from uuid import UUID
 
 from sqlalchemy import and_, func, select, tuple_
 from sqlalchemy.exc import IntegrityError, OperationalError
-from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy.orm import Session, joinedload, selectinload, undefer
 
+from src.api.models.filter_models import FilterState
 from src.db.exceptions import DatabaseConnectionError, DuplicateRecordError
 from src.db.models.backtest import BacktestRun, PerformanceMetrics
+from src.db.repositories.backtest_repository import (
+    filtered_list_statement,
+    run_load_options,
+    summary_load_options,
+)
 
 
 class SyncBacktestRepository:
@@ -217,21 +223,23 @@ class SyncBacktestRepository:
 
         return metrics
 
-    def find_by_run_id(self, run_id: UUID) -> Optional[BacktestRun]:
+    def find_by_run_id(self, run_id: UUID, include_trades: bool = False) -> Optional[BacktestRun]:
         """
         Find backtest by business identifier.
 
         Eagerly loads associated performance metrics to avoid N+1 queries.
+        Trades are loaded only when requested.
 
         Args:
             run_id: Unique business identifier
+            include_trades: Also load the run's trades
 
         Returns:
             BacktestRun with metrics loaded, or None if not found
         """
         stmt = (
             select(BacktestRun)
-            .options(selectinload(BacktestRun.metrics))
+            .options(*run_load_options(include_trades))
             .where(BacktestRun.run_id == run_id)
         )
 
@@ -242,6 +250,7 @@ class SyncBacktestRepository:
         self,
         limit: int = 20,
         cursor: Optional[Tuple[datetime, int]] = None,
+        summary_only: bool = False,
     ) -> List[BacktestRun]:
         """
         Find recent backtests with cursor pagination.
@@ -251,11 +260,13 @@ class SyncBacktestRepository:
         Args:
             limit: Maximum number of records to return
             cursor: Pagination cursor (created_at, id) from last record
+            summary_only: Load only the summary columns used by list views
 
         Returns:
             List of BacktestRun instances with metrics loaded
         """
-        stmt = select(BacktestRun).options(selectinload(BacktestRun.metrics))
+        options = summary_load_options() if summary_only else run_load_options()
+        stmt = select(BacktestRun).options(*options)
 
         if cursor:
             created_at, id = cursor
@@ -303,6 +314,33 @@ class SyncBacktestRepository:
         result = self.session.execute(stmt)
         return list(result.scalars().all())
 
+    def find_filtered(
+        self, filter_state: FilterState, limit: int = 20, include_config: bool = False
+    ) -> Tuple[List[BacktestRun], bool]:
+        """
+        Find one keyset page of filtered, sorted backtests.
+
+        Shares its query with BacktestRepository.get_filtered_backtests.
+
+        Args:
+            filter_state: Filters, sort and optional after cursor
+            limit: Maximum records
+            include_config: Also load config_snapshot, deferred by default
+
+        Returns:
+            Tuple of (matching BacktestRun instances, whether more rows follow)
+
+        Raises:
+            ValueError: If the after cursor is malformed
+        """
+        stmt = filtered_list_statement(filter_state, limit=limit)
+        if include_config:
+            stmt = stmt.options(undefer(BacktestRun.config_snapshot))
+
+        result = self.session.execute(stmt)
+        backtests = list(result.scalars().unique().all())
+        return backtests[:limit], len(backtests) > limit
+
     def find_by_run_ids(self, run_ids: List[UUID]) -> List[BacktestRun]:
         """
         Find multiple backtests by IDs (for comparison).
@@ -1,5 +1,6 @@
 """Custom SQLAlchemy type decorators."""
 
+from src.db.types.numpy_array import NumpyArray
 from src.db.types.validated_jsonb import ValidatedJSONB
 
-__all__ = ["ValidatedJSONB"]
+__all__ = ["NumpyArray", "ValidatedJSONB"]
@@ -0,0 +1,112 @@
+"""
+Custom SQLAlchemy TypeDecorator for compressed NumPy array columns.
+
+This module provides a TypeDecorator that stores one-dimensional NumPy arrays
+as zlib-compressed little-endian binary, for long numeric series that are
+read and written whole (e.g., equity curves).
+"""
+
+import zlib
+from typing import Any, Optional
+
+import numpy as np
+from sqlalchemy import LargeBinary
+from sqlalchemy.types import TypeDecorator
+
+
+def encode_array(values: Any, dtype: np.dtype) -> bytes:
+    """
+    Encode a one-dimensional array as compressed little-endian bytes.
+
+    Args:
+        values: Array-like of numbers
+        dtype: Element type to store
+
+    Returns:
+        zlib-compressed array bytes
+
+    Example:
+        >>> decode_array(encode_array([1, 2, 3], np.dtype("int64")), np.dtype("int64"))
+        array([1, 2, 3])
+    """
+    array = np.ascontiguousarray(values, dtype=dtype.newbyteorder("<"))
+    return zlib.compress(array.tobytes())
+
+
+def decode_array(data: bytes, dtype: np.dtype) -> np.ndarray:
+    """
+    Decode bytes produced by encode_array.
+
+    Args:
+        data: zlib-compressed array bytes
+        dtype: Element type the array was stored with
+
+    Returns:
+        Array in native byte order
+    """
+    array = np.frombuffer(zlib.decompress(data), dtype=dtype.newbyteorder("<"))
+    return array.astype(dtype, copy=False)
+
+
+class NumpyArray(TypeDecorator):
+    """
+    SQLAlchemy TypeDecorator for one-dimensional NumPy arrays.
+
+    Arrays are stored as zlib-compressed little-endian binary (BYTEA on
+    PostgreSQL) and loaded back as read-only NumPy arrays of the column dtype.
+
+    Attributes:
+        impl: The underlying SQL type (LargeBinary)
+        cache_ok: Whether this type is safe to cache
+        dtype: NumPy element type of the column
+
+    Example:
+        >>> from sqlalchemy.orm import Mapped, mapped_column
+        >>> class MyModel(Base):
+        ...     values: Mapped[np.ndarray] = mapped_column(NumpyArray("float64"))
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def __init__(self, dtype: str = "float64", *args: Any, **kwargs: Any):
+        """
+        Initialize the NumpyArray type.
+
+        Args:
+            dtype: NumPy element type (e.g., "int64", "float64")
+            *args: Additional positional arguments for TypeDecorator
+            **kwargs: Additional keyword arguments for TypeDecorator
+        """
+        super().__init__(*args, **kwargs)
+        self.dtype = np.dtype(dtype)
+
+    def process_bind_param(self, value: Optional[Any], dialect: Any) -> Optional[bytes]:
+        """
+        Encode an array before storing in database.
+
+        Args:
+            value: Array-like to store
+            dialect: SQLAlchemy dialect
+
+        Returns:
+            Compressed bytes, or None
+        """
+        if value is None:
+            return None
+        return encode_array(value, self.dtype)
+
+    def process_result_value(self, value: Optional[bytes], dialect: Any) -> Optional[np.ndarray]:
+        """
+        Decode an array loaded from database.
+
+        Args:
+            value: Compressed bytes from database
+            dialect: SQLAlchemy dialect
+
+        Returns:
+            NumPy array, or None
+        """
+        if value is None:
+            return None
+        return decode_array(value, self.dtype)
@@ -0,0 +1,92 @@
+"""
+Pydantic models for queued backtest jobs.
+
+This module defines the job record tracked by the web application while a
+backtest executes in a worker process.
+"""
+
+from datetime import datetime, timezone
+from enum import Enum
+from uuid import UUID, uuid4
+
+from pydantic import BaseModel, Field
+
+
+class JobStatus(str, Enum):
+    """Lifecycle status of a backtest job."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    TIMED_OUT = "timed_out"
+
+
+class BacktestJob(BaseModel):
+    """
+    Track a backtest submitted to the worker pool.
+
+    Attributes:
+        job_id: Unique job identifier
+        strategy: Strategy name as submitted
+        symbol: Trading symbol as submitted
+        status: Current job status
+        run_id: Persisted backtest run ID once the job succeeds
+        error_message: Error details if the job failed or timed out
+        timeout_seconds: Maximum run time once the job starts
+        submitted_at: Submission timestamp (UTC)
+        started_at: Time a worker picked up the job (UTC)
+        finished_at: Completion timestamp (UTC)
+    """
+
+    job_id: UUID = Field(default_factory=uuid4)
+    strategy: str = Field(..., min_length=1)
+    symbol: str = Field(..., min_length=1)
+    status: JobStatus = JobStatus.QUEUED
+    run_id: UUID | None = None
+    error_message: str | None = None
+    timeout_seconds: int = Field(default=300, gt=0)
+    submitted_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+
+    @property
+    def is_finished(self) -> bool:
+        """True once the job reached a terminal status."""
+        return self.status in (JobStatus.SUCCEEDED, JobStatus.FAILED, JobStatus.TIMED_OUT)
+
+    def mark_running(self) -> None:
+        """Transition job to RUNNING status and record the start time."""
+        self.status = JobStatus.RUNNING
+        self.started_at = datetime.now(timezone.utc)
+
+    def mark_succeeded(self, run_id: UUID | None) -> None:
+        """
+        Transition job to SUCCEEDED status.
+
+        Args:
+            run_id: Persisted backtest run ID
+        """
+        self.status = JobStatus.SUCCEEDED
+        self.run_id = run_id
+        self.finished_at = datetime.now(timezone.utc)
+
+    def mark_failed(self, error: str) -> None:
+        """
+        Transition job to FAILED status.
+
+        Args:
+            error: Error message describing the failure
+        """
+        self.status = JobStatus.FAILED
+        self.error_message = error
+        self.finished_at = datetime.now(timezone.utc)
+
+    def mark_timed_out(self) -> None:
+        """Transition job to TIMED_OUT status."""
+        self.status = JobStatus.TIMED_OUT
+        self.error_message = (
+            f"Backtest timed out after {self.timeout_seconds} seconds. "
+            "Try a shorter date range or larger timeframe."
+        )
+        self.finished_at = datetime.now(timezone.utc)
@@ -70,6 +70,7 @@ class BacktestRequest(BaseModel):
         end_date: Backtest end date (UTC)
         bar_type: Bar specification (e.g., "1-DAY-LAST")
         persist: Whether to persist results to database
+        use_cache: Whether a persisted request may reuse a stored identical run
         config_file_path: Source config file path (for tracking)
         starting_balance: Initial account balance
     """
@@ -88,6 +89,9 @@ class BacktestRequest(BaseModel):
 
     # Execution options
     persist: bool = Field(default=True, description="Persist results to database")
+    use_cache: bool = Field(
+        default=True, description="Reuse a stored run with an identical fingerprint"
+    )
     config_file_path: str | None = Field(
         default=None, description="Source config file path for tracking"
     )
@@ -5,12 +5,50 @@ This module defines data models for tracking catalog availability,
 fetch requests, and related metadata structures.
 """
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from enum import Enum
 from uuid import UUID, uuid4
 
 from pydantic import BaseModel, Field, field_validator
 
+# Reason: Weekends plus an exchange holiday leave up to four days without
+# bars, so shorter holes between catalog files are not treated as missing data
+MARKET_CLOSURE_TOLERANCE = timedelta(days=4)
+
+_BAR_STEP_UNITS = {
+    "SECOND": timedelta(seconds=1),
+    "MINUTE": timedelta(minutes=1),
+    "HOUR": timedelta(hours=1),
+    "DAY": timedelta(days=1),
+    "WEEK": timedelta(weeks=1),
+}
+
+
+def _datetime_to_ns(value: datetime) -> int:
+    """Convert a timezone-aware datetime to UNIX nanoseconds without float rounding."""
+    return (value - datetime(1970, 1, 1, tzinfo=timezone.utc)) // timedelta(microseconds=1) * 1000
+
+
+def bar_spec_interval(bar_type_spec: str) -> timedelta | None:
+    """
+    Get the bar duration of a bar type specification.
+
+    Args:
+        bar_type_spec: Bar type spec (e.g., "5-MINUTE-LAST")
+
+    Returns:
+        Bar duration, or None for non-time aggregations (e.g., TICK)
+
+    Example:
+        >>> bar_spec_interval("5-MINUTE-LAST")
+        datetime.timedelta(seconds=300)
+    """
+    step, _, rest = bar_type_spec.partition("-")
+    unit = rest.split("-", 1)[0]
+    if not step.isdigit() or unit not in _BAR_STEP_UNITS:
+        return None
+    return int(step) * _BAR_STEP_UNITS[unit]
+
 
 class CatalogAvailability(BaseModel):
     """
@@ -27,6 +65,8 @@ class CatalogAvailability(BaseModel):
         file_count: Number of Parquet files in this range
         total_rows: Approximate total number of bars
         last_updated: Last time this metadata was updated (UTC)
+        intervals: Covered (start, end) ranges from per-file ranges, sorted
+                   and merged. Empty means [start_date, end_date] is covered.
     """
 
     instrument_id: str = Field(..., min_length=1, max_length=50)
@@ -36,6 +76,7 @@ class CatalogAvailability(BaseModel):
     file_count: int = Field(..., ge=1)
     total_rows: int = Field(..., ge=0)
     last_updated: datetime
+    intervals: list[tuple[datetime, datetime]] = Field(default_factory=list)
 
     @field_validator("start_date", "end_date", "last_updated")
     @classmethod
@@ -109,13 +150,81 @@ class CatalogAvailability(BaseModel):
             ... )
             True
         """
-        # Reason: For DAY-level data, compare dates only (ignore time portion)
-        # This prevents false negatives when catalog has 23:59:59 but request is 00:00:00
-        if "DAY" in self.bar_type_spec or "WEEK" in self.bar_type_spec:
-            return self.start_date.date() <= start.date() and self.end_date.date() >= end.date()
+        return not self.missing_ranges(start, end)
+
+    @property
+    def covered_intervals(self) -> list[tuple[datetime, datetime]]:
+        """Covered ranges, falling back to [start_date, end_date]."""
+        return self.intervals or [(self.start_date, self.end_date)]
 
-        # Reason: For intraday data, compare full timestamps
-        return self.start_date <= start and self.end_date >= end
+    def missing_ranges(self, start: datetime, end: datetime) -> list[tuple[datetime, datetime]]:
+        """
+        Get the sub-ranges of [start, end] that are not in the catalog.
+
+        For DAY-level data, range edges compare dates only (the catalog stores
+        daily bars at 23:59:59 while requests usually start at 00:00:00).
+        Holes between catalog files of up to MARKET_CLOSURE_TOLERANCE (or one
+        bar, if longer) are market closures, not missing data.
+
+        Args:
+            start: Requested start date
+            end: Requested end date
+
+        Returns:
+            Missing (start, end) ranges in chronological order
+
+        Example:
+            >>> avail.missing_ranges(
+            ...     datetime(2024, 1, 1, tzinfo=timezone.utc),
+            ...     datetime(2024, 12, 31, tzinfo=timezone.utc)
+            ... )
+            [(datetime(2024, 3, 1, ...), datetime(2024, 4, 1, ...))]
+        """
+        start = self.ensure_utc_timezone(start)
+        end = self.ensure_utc_timezone(end)
+        daily = "DAY" in self.bar_type_spec or "WEEK" in self.bar_type_spec
+        interval = bar_spec_interval(self.bar_type_spec) or timedelta(0)
+        tolerance = max(MARKET_CLOSURE_TOLERANCE, interval)
+
+        def before(a: datetime, b: datetime) -> bool:
+            # Reason: For DAY-level data, compare dates only (ignore time portion)
+            return a.date() < b.date() if daily else a < b
+
+        missing: list[tuple[datetime, datetime]] = []
+        cursor = start
+        leading = True
+
+        for interval_start, interval_end in self.covered_intervals:
+            if before(interval_end, cursor):
+                continue
+            if before(end, interval_start):
+                break
+            if before(cursor, interval_start) and (leading or interval_start - cursor > tolerance):
+                missing.append((cursor, interval_start))
+            cursor = max(cursor, interval_end)
+            leading = False
+
+        if leading or before(cursor, end):
+            missing.append((cursor, end))
+
+        return missing
+
+    def covers_ns(self, timestamp_ns: int) -> bool:
+        """
+        Check if a timestamp falls inside a covered range.
+
+        Args:
+            timestamp_ns: UNIX nanoseconds (e.g., a bar's ts_init)
+
+        Returns:
+            True if the timestamp is within any covered range
+        """
+        # Reason: Ranges are truncated to microseconds, so the end of a range
+        # covers the rest of its last microsecond
+        return any(
+            _datetime_to_ns(s) <= timestamp_ns <= _datetime_to_ns(e) + 999
+            for s, e in self.covered_intervals
+        )
 
     def overlaps_range(self, start: datetime, end: datetime) -> bool:
         """
@@ -228,3 +337,137 @@ class FetchRequest(BaseModel):
         self.status = FetchStatus.FAILED
         self.error_message = error
         self.retry_count += 1
+
+
+class CatalogFileEntry(BaseModel):
+    """
+    Index entry for a single Parquet file in a bar type directory.
+
+    Attributes:
+        filename: Parquet file name (e.g., "2024-01-01T00-00-00-000000000Z_...parquet")
+        start_ns: First bar timestamp encoded in the filename (UNIX nanoseconds)
+        end_ns: Last bar timestamp encoded in the filename (UNIX nanoseconds)
+        row_count: Number of rows read from the Parquet footer
+        size_bytes: File size when the entry was recorded
+        mtime_ns: File modification time when the entry was recorded
+    """
+
+    filename: str = Field(..., min_length=1)
+    start_ns: int
+    end_ns: int
+    row_count: int = Field(..., ge=0)
+    size_bytes: int = Field(..., ge=0)
+    mtime_ns: int
+
+
+class BarTypeIndexEntry(BaseModel):
+    """
+    Persisted availability index for one bar type directory.
+
+    The directory mtime is used to cheaply validate the entry on startup:
+    adding, removing or renaming a file updates it, so an unchanged mtime
+    means the file list (and therefore the entry) is still valid.
+
+    Attributes:
+        dir_name: Directory name (e.g., "AAPL.NASDAQ-1-MINUTE-LAST-EXTERNAL")
+        instrument_id: Instrument identifier parsed from the directory name
+        bar_type_spec: Bar type specification parsed from the directory name
+        dir_mtime_ns: Directory modification time when the entry was recorded
+        files: Per-file ranges and row counts, sorted by start timestamp
+    """
+
+    dir_name: str = Field(..., min_length=1)
+    instrument_id: str = Field(..., min_length=1)
+    bar_type_spec: str = Field(..., min_length=1)
+    dir_mtime_ns: int
+    files: list[CatalogFileEntry] = Field(default_factory=list)
+
+    @property
+    def start_ns(self) -> int:
+        """Earliest timestamp covered by any file in the directory."""
+        return min(f.start_ns for f in self.files)
+
+    @property
+    def end_ns(self) -> int:
+        """Latest timestamp covered by any file in the directory."""
+        return max(f.end_ns for f in self.files)
+
+    @property
+    def total_rows(self) -> int:
+        """Total number of rows across all files."""
+        return sum(f.row_count for f in self.files)
+
+
+class DerivedBarProvenance(BaseModel):
+    """
+    Provenance record for a bar type aggregated from finer catalog bars.
+
+    Attributes:
+        bar_type: Derived bar type (e.g., "AAPL.NASDAQ-1-HOUR-LAST-INTERNAL")
+        source_bar_type: Bar type it was built from (e.g., "AAPL.NASDAQ-1-MINUTE-LAST-EXTERNAL")
+        source_fingerprint: Digest of the source Parquet files at build time
+        source_bar_count: Number of source bars aggregated
+        bar_count: Number of derived bars written
+        created_at: When the derived bars were built
+    """
+
+    bar_type: str = Field(..., min_length=1)
+    source_bar_type: str = Field(..., min_length=1)
+    source_fingerprint: str = Field(..., min_length=1)
+    source_bar_count: int = Field(..., ge=0)
+    bar_count: int = Field(..., ge=0)
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+class DownloadChunk(BaseModel):
+    """
+    One IBKR-sized window of a chunked historical download.
+
+    Attributes:
+        start: Window start (UTC, inclusive)
+        end: Window end (UTC, inclusive)
+    """
+
+    start: datetime
+    end: datetime
+
+    @property
+    def start_ns(self) -> int:
+        """Window start in UNIX nanoseconds."""
+        return _datetime_to_ns(self.start)
+
+    @property
+    def end_ns(self) -> int:
+        """Window end in UNIX nanoseconds."""
+        return _datetime_to_ns(self.end)
+
+
+class DownloadProgress(BaseModel):
+    """
+    Progress of a chunked historical download.
+
+    Attributes:
+        total_chunks: Number of planned windows
+        completed_chunks: Windows fetched (or skipped) so far
+        skipped_chunks: Windows already completed by an interrupted earlier run
+        bar_count: Bars received so far
+        elapsed_seconds: Time since the download started
+    """
+
+    total_chunks: int = Field(..., ge=0)
+    completed_chunks: int = Field(default=0, ge=0)
+    skipped_chunks: int = Field(default=0, ge=0)
+    bar_count: int = Field(default=0, ge=0)
+    elapsed_seconds: float = Field(default=0.0, ge=0)
+
+    @property
+    def percent_complete(self) -> float:
+        """Completed windows as a percentage (100 when nothing was planned)."""
+        if not self.total_chunks:
+            return 100.0
+        return 100.0 * self.completed_chunks / self.total_chunks
+
+    @property
+    def bars_per_second(self) -> float:
+        """Download throughput in bars per second."""
+        return self.bar_count / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
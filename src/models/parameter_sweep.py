@@ -0,0 +1,251 @@
+"""
+Pydantic models for parameter sweeps.
+
+A parameter sweep runs one strategy over the same bars many times, once per
+parameter combination drawn from a search space, and groups the persisted
+runs under a common sweep ID.
+"""
+
+import itertools
+import random
+from enum import Enum
+from typing import Any, cast
+from uuid import UUID
+
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+
+class SweepMode(str, Enum):
+    """How parameter combinations are drawn from the search space."""
+
+    GRID = "grid"
+    RANDOM = "random"
+
+
+def _parse_scalar(value: str) -> int | float | bool | str:
+    """Parse a single CLI value into int, float, bool or str."""
+    text = value.strip()
+    lowered = text.lower()
+    if lowered in ("true", "false"):
+        return lowered == "true"
+    try:
+        return int(text)
+    except ValueError:
+        pass
+    try:
+        return float(text)
+    except ValueError:
+        return text
+
+
+def parse_param_spec(spec: str) -> tuple[str, list[Any]]:
+    """
+    Parse a search space specification for a single parameter.
+
+    Supported forms:
+        name=v1,v2,v3          explicit values
+        name=start:stop[:step] inclusive numeric range (step defaults to 1)
+
+    Args:
+        spec: Specification string (e.g., "fast_period=5:20:5")
+
+    Returns:
+        Tuple of (parameter name, candidate values)
+
+    Raises:
+        ValueError: If the specification is malformed
+
+    Example:
+        >>> parse_param_spec("fast_period=5:20:5")
+        ('fast_period', [5, 10, 15, 20])
+        >>> parse_param_spec("buy_threshold=0.05,0.1")
+        ('buy_threshold', [0.05, 0.1])
+    """
+    name, sep, raw_values = spec.partition("=")
+    name = name.strip()
+    if not sep or not name or not raw_values.strip():
+        raise ValueError(f"Invalid parameter spec '{spec}'. Expected name=values")
+
+    if ":" in raw_values:
+        parts = [_parse_scalar(p) for p in raw_values.split(":")]
+        if len(parts) not in (2, 3) or not all(
+            isinstance(p, (int, float)) and not isinstance(p, bool) for p in parts
+        ):
+            raise ValueError(
+                f"Invalid range in '{spec}'. Expected numeric start:stop or start:stop:step"
+            )
+
+        bounds = cast(list[int | float], parts)
+        start, stop = bounds[0], bounds[1]
+        step = bounds[2] if len(bounds) == 3 else 1
+        if step <= 0:
+            raise ValueError(f"Range step must be positive in '{spec}'")
+        if start > stop:
+            raise ValueError(f"Range start must not exceed stop in '{spec}'")
+
+        # Reason: Integer ranges stay integers; float ranges are rounded to
+        # avoid accumulating representation error (0.1 + 0.2 != 0.3)
+        count = int(round((stop - start) / step, 9)) + 1
+        if all(isinstance(p, int) for p in parts):
+            values: list[Any] = [start + i * step for i in range(count)]
+        else:
+            values = [round(start + i * step, 10) for i in range(count)]
+        return name, values
+
+    values = [_parse_scalar(v) for v in raw_values.split(",") if v.strip()]
+    if not values:
+        raise ValueError(f"No values given in '{spec}'")
+    return name, values
+
+
+class SweepSpec(BaseModel):
+    """
+    Search space for a parameter sweep.
+
+    Attributes:
+        params: Candidate values per strategy parameter
+        mode: Grid (every combination) or random sampling
+        samples: Number of combinations to sample in random mode
+        seed: Random seed for reproducible sampling
+
+    Example:
+        >>> spec = SweepSpec(params={"fast_period": [5, 10], "slow_period": [20, 50]})
+        >>> len(spec.combinations())
+        4
+    """
+
+    params: dict[str, list[Any]] = Field(..., min_length=1)
+    mode: SweepMode = SweepMode.GRID
+    samples: int | None = Field(default=None, gt=0)
+    seed: int | None = None
+
+    @field_validator("params")
+    @classmethod
+    def validate_params(cls, v: dict[str, list[Any]]) -> dict[str, list[Any]]:
+        """Ensure every parameter has at least one candidate value."""
+        empty = [name for name, values in v.items() if not values]
+        if empty:
+            raise ValueError(f"No candidate values for: {', '.join(empty)}")
+        return v
+
+    @model_validator(mode="after")
+    def validate_samples(self) -> "SweepSpec":
+        """Random mode requires a sample count."""
+        if self.mode == SweepMode.RANDOM and self.samples is None:
+            raise ValueError("samples is required for random sweeps")
+        return self
+
+    @property
+    def grid_size(self) -> int:
+        """Total number of combinations in the full grid."""
+        size = 1
+        for values in self.params.values():
+            size *= len(values)
+        return size
+
+    def combinations(self) -> list[dict[str, Any]]:
+        """
+        Generate the parameter combinations to run.
+
+        Random mode samples without replacement from the grid; if more samples
+        are requested than the grid holds, the full grid is returned.
+
+        Returns:
+            List of parameter dictionaries
+        """
+        names = list(self.params)
+        grid = itertools.product(*(self.params[name] for name in names))
+
+        if self.mode == SweepMode.GRID or self.samples is None or self.samples >= self.grid_size:
+            return [dict(zip(names, combo)) for combo in grid]
+
+        # Reason: Sample indices instead of materializing very large grids
+        rng = random.Random(self.seed)
+        indices = rng.sample(range(self.grid_size), self.samples)
+        sizes = [len(self.params[name]) for name in names]
+        combos = []
+        for index in indices:
+            combo: dict[str, Any] = {}
+            for name, size in zip(reversed(names), reversed(sizes)):
+                index, position = divmod(index, size)
+                combo[name] = self.params[name][position]
+            combos.append({name: combo[name] for name in names})
+        return combos
+
+
+class SweepRunSummary(BaseModel):
+    """
+    Outcome of one parameter combination within a sweep.
+
+    Attributes:
+        params: Parameter values used for this run
+        run_id: Persisted run ID (None when not persisted or failed to persist)
+        success: Whether the backtest completed
+        error_message: Error details for failed runs
+        total_return: Total return amount
+        sharpe_ratio: Sharpe ratio
+        max_drawdown: Maximum drawdown
+        total_trades: Number of trades
+        duration_seconds: Execution time in the worker
+    """
+
+    params: dict[str, Any]
+    run_id: UUID | None = None
+    success: bool = True
+    error_message: str | None = None
+    total_return: float | None = None
+    sharpe_ratio: float | None = None
+    max_drawdown: float | None = None
+    total_trades: int = 0
+    duration_seconds: float = 0.0
+
+
+class SweepSummary(BaseModel):
+    """
+    Result of a complete parameter sweep.
+
+    Attributes:
+        sweep_id: Identifier shared by all persisted runs of the sweep
+        strategy: Strategy that was swept
+        symbol: Trading symbol
+        runs: Per-combination outcomes
+        skipped: Combinations rejected by the strategy's parameter model
+        duration_seconds: Wall-clock time for the whole sweep
+    """
+
+    sweep_id: UUID
+    strategy: str
+    symbol: str
+    runs: list[SweepRunSummary] = Field(default_factory=list)
+    skipped: int = 0
+    duration_seconds: float = 0.0
+
+    def ranked(self, metric: str = "sharpe_ratio") -> list[SweepRunSummary]:
+        """
+        Successful runs ordered best-first by a metric.
+
+        Args:
+            metric: "sharpe_ratio", "total_return" or "max_drawdown"
+
+        Returns:
+            Successful runs sorted descending; runs missing the metric last
+        """
+        return rank_runs(self.runs, metric)
+
+
+def rank_runs(runs: list[SweepRunSummary], metric: str = "sharpe_ratio") -> list[SweepRunSummary]:
+    """
+    Order successful runs best-first by a metric.
+
+    Args:
+        runs: Run outcomes to rank
+        metric: "sharpe_ratio", "total_return" or "max_drawdown"
+
+    Returns:
+        Successful runs sorted descending; runs missing the metric last
+    """
+    successful = [run for run in runs if run.success]
+    return sorted(
+        successful,
+        key=lambda run: (getattr(run, metric) is None, -(getattr(run, metric) or 0.0)),
+    )
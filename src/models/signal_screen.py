@@ -0,0 +1,99 @@
+"""
+Pydantic models for signal screening.
+
+A signal screen values every parameter combination of a search space with a
+strategy's vectorized signal function instead of the event-driven engine,
+then reconciles the best candidates against full backtests.
+"""
+
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from src.models.parameter_sweep import SweepRunSummary
+
+
+class ScreenCandidate(BaseModel):
+    """
+    Approximate outcome of one parameter combination.
+
+    Attributes:
+        params: Parameter values screened
+        total_pnl: Final balance minus starting balance
+        total_return: Total return as a fraction of the starting balance
+        sharpe_ratio: Annualized Sharpe ratio of daily returns
+        max_drawdown: Maximum drawdown as a negative fraction
+        total_trades: Number of positions opened
+    """
+
+    params: dict[str, Any]
+    total_pnl: float
+    total_return: float
+    sharpe_ratio: float | None = None
+    max_drawdown: float = 0.0
+    total_trades: int = 0
+
+
+class ScreenReconciliation(BaseModel):
+    """
+    A screened candidate next to the full backtest of the same parameters.
+
+    Attributes:
+        screened: Approximate screening outcome
+        full: Event-driven BacktestOrchestrator outcome
+    """
+
+    screened: ScreenCandidate
+    full: SweepRunSummary
+
+    @property
+    def return_difference(self) -> float | None:
+        """Full minus screened total return (None if the full run failed)."""
+        if not self.full.success or self.full.total_return is None:
+            return None
+        return self.full.total_return - self.screened.total_return
+
+    @property
+    def trade_difference(self) -> int | None:
+        """Full minus screened trade count (None if the full run failed)."""
+        if not self.full.success:
+            return None
+        return self.full.total_trades - self.screened.total_trades
+
+
+class ScreenSummary(BaseModel):
+    """
+    Result of a signal screen.
+
+    Attributes:
+        strategy: Strategy that was screened
+        symbol: Trading symbol
+        bar_count: Bars each combination was valued over
+        candidates: Per-combination outcomes
+        skipped: Combinations rejected by the strategy's parameter model
+        reconciliations: Best candidates re-run as full backtests
+        duration_seconds: Wall-clock time of the screen itself
+    """
+
+    strategy: str
+    symbol: str
+    bar_count: int
+    candidates: list[ScreenCandidate] = Field(default_factory=list)
+    skipped: int = 0
+    reconciliations: list[ScreenReconciliation] = Field(default_factory=list)
+    duration_seconds: float = 0.0
+
+    def ranked(self, metric: str = "sharpe_ratio") -> list[ScreenCandidate]:
+        """
+        Candidates ordered best-first by a metric.
+
+        Args:
+            metric: "sharpe_ratio", "total_return" or "max_drawdown"
+
+        Returns:
+            Candidates sorted descending; candidates missing the metric last
+        """
+        return sorted(
+            self.candidates,
+            key=lambda c: (getattr(c, metric) is None, -(getattr(c, metric) or 0.0)),
+        )
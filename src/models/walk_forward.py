@@ -0,0 +1,184 @@
+"""
+Pydantic models for walk-forward optimization.
+
+A walk-forward analysis splits a date range into consecutive folds. Each fold
+optimizes a strategy's parameters on its train window and evaluates the best
+combination on the test window that follows it; the test windows together
+form one out-of-sample record of the strategy.
+"""
+
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+import pandas as pd
+from pydantic import BaseModel, Field
+
+
+class FoldWindow(BaseModel):
+    """
+    Train and test window of one walk-forward fold.
+
+    Windows are half-open: a bar belongs to [start, end). The test window
+    starts where the train window ends.
+
+    Attributes:
+        index: Fold number, starting at 0
+        train_start: First instant of the train window
+        train_end: End of the train window (exclusive) and start of the test window
+        test_end: End of the test window (exclusive)
+    """
+
+    index: int
+    train_start: datetime
+    train_end: datetime
+    test_end: datetime
+
+    @property
+    def test_start(self) -> datetime:
+        """First instant of the test window."""
+        return self.train_end
+
+
+class WalkForwardSpec(BaseModel):
+    """
+    Window layout of a walk-forward analysis.
+
+    Attributes:
+        train_months: Length of each train window in calendar months
+        test_months: Length of each test window in calendar months; folds
+                     advance by this much, so test windows tile the range
+        anchored: Keep every train window starting at the range start, so it
+                  grows by test_months per fold instead of rolling forward
+
+    Example:
+        >>> spec = WalkForwardSpec(train_months=24, test_months=6)
+        >>> windows = spec.windows(datetime(2020, 1, 1), datetime(2024, 1, 1))
+        >>> [(w.train_start.year, w.test_start.date().isoformat()) for w in windows][:2]
+        [(2020, '2022-01-01'), (2020, '2022-07-01')]
+    """
+
+    train_months: int = Field(..., gt=0)
+    test_months: int = Field(..., gt=0)
+    anchored: bool = False
+
+    def windows(self, start: datetime, end: datetime) -> list[FoldWindow]:
+        """
+        Lay out the folds over a date range.
+
+        The last test window is cut off at `end`; folds whose test window
+        would start at or after `end` are dropped.
+
+        Args:
+            start: Range start (first train window starts here)
+            end: Range end (exclusive)
+
+        Returns:
+            Folds in chronological order (empty if the range is shorter than
+            one train window)
+        """
+        folds: list[FoldWindow] = []
+        first_test = pd.Timestamp(start) + pd.DateOffset(months=self.train_months)
+
+        while True:
+            test_start = first_test + pd.DateOffset(months=self.test_months * len(folds))
+            if test_start >= pd.Timestamp(end):
+                return folds
+
+            if self.anchored:
+                train_start = pd.Timestamp(start)
+            else:
+                train_start = test_start - pd.DateOffset(months=self.train_months)
+            test_end = min(test_start + pd.DateOffset(months=self.test_months), pd.Timestamp(end))
+
+            folds.append(
+                FoldWindow(
+                    index=len(folds),
+                    train_start=train_start.to_pydatetime(),
+                    train_end=test_start.to_pydatetime(),
+                    test_end=test_end.to_pydatetime(),
+                )
+            )
+
+
+class FoldSummary(BaseModel):
+    """
+    Outcome of one walk-forward fold.
+
+    Attributes:
+        window: Train and test window of the fold
+        params: Parameters chosen on the train window (None if none succeeded)
+        train_runs: Combinations evaluated on the train window
+        train_failed: Train runs that failed
+        train_metric: Ranking metric of the chosen parameters in-sample
+        run_id: Persisted out-of-sample run (None when not persisted)
+        success: Whether the out-of-sample run completed
+        error_message: Error details if the fold failed
+        total_return: Out-of-sample total return as a fraction
+        sharpe_ratio: Out-of-sample Sharpe ratio
+        max_drawdown: Out-of-sample maximum drawdown
+        total_trades: Out-of-sample trades
+        duration_seconds: Time spent on the fold in its worker
+    """
+
+    window: FoldWindow
+    params: dict[str, Any] | None = None
+    train_runs: int = 0
+    train_failed: int = 0
+    train_metric: float | None = None
+    run_id: UUID | None = None
+    success: bool = True
+    error_message: str | None = None
+    total_return: float | None = None
+    sharpe_ratio: float | None = None
+    max_drawdown: float | None = None
+    total_trades: int = 0
+    duration_seconds: float = 0.0
+
+
+class WalkForwardSummary(BaseModel):
+    """
+    Result of a complete walk-forward analysis.
+
+    Attributes:
+        walk_forward_id: Identifier of the persisted analysis
+        strategy: Strategy that was optimized
+        symbol: Trading symbol
+        rank_by: Metric used to choose parameters on each train window
+        folds: Per-fold outcomes in chronological order
+        skipped: Combinations rejected by the strategy's parameter model
+        equity_curve: Stitched out-of-sample equity curve as
+                      {"time": unix_seconds, "value": equity} points
+        starting_balance: Capital the stitched curve starts from
+        duration_seconds: Wall-clock time for the whole analysis
+    """
+
+    walk_forward_id: UUID
+    strategy: str
+    symbol: str
+    rank_by: str = "sharpe_ratio"
+    folds: list[FoldSummary] = Field(default_factory=list)
+    skipped: int = 0
+    equity_curve: list[dict[str, float]] = Field(default_factory=list)
+    starting_balance: float = 0.0
+    duration_seconds: float = 0.0
+
+    @property
+    def total_return(self) -> float | None:
+        """Compounded out-of-sample return as a fraction (None without a curve)."""
+        if not self.equity_curve or not self.starting_balance:
+            return None
+        return self.equity_curve[-1]["value"] / self.starting_balance - 1.0
+
+    @property
+    def max_drawdown(self) -> float | None:
+        """Deepest peak-to-trough decline of the stitched curve, as a negative fraction."""
+        if not self.equity_curve:
+            return None
+        peak = self.starting_balance
+        deepest = 0.0
+        for point in self.equity_curve:
+            peak = max(peak, point["value"])
+            if peak > 0:
+                deepest = min(deepest, point["value"] / peak - 1.0)
+        return deepest
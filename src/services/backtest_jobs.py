@@ -0,0 +1,337 @@
+"""
+Backtest job queue backed by a pool of worker processes.
+
+The web application submits backtests here instead of running
+BacktestOrchestrator on the event loop. Each job loads its data and runs the
+engine inside a worker process, so the server stays responsive and up to
+``max_workers`` backtests execute in parallel. Results are persisted by the
+orchestrator exactly as for CLI runs; the job record only tracks progress.
+
+When a SharedBarCache is configured, catalog bar series are loaded once into
+shared memory and workers build their bars from it instead of each reading
+the Parquet files again.
+"""
+
+import asyncio
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any
+from uuid import UUID
+
+import structlog
+from rich.console import Console
+
+from src.models.backtest_job import BacktestJob, JobStatus
+from src.models.backtest_request import BacktestRequest
+from src.services.shared_bars import SharedBarCache, SharedBarHandle, load_shared_bars
+
+logger = structlog.get_logger(__name__)
+
+# Reason: Keep a bounded history of finished jobs for status polling
+MAX_FINISHED_JOBS = 200
+
+# Per-worker-process state, created by _init_worker
+_worker_loop: asyncio.AbstractEventLoop | None = None
+_worker_catalog: Any = None
+
+
+class BacktestQueueFullError(RuntimeError):
+    """Raised when the job queue has reached its configured capacity."""
+
+
+def _init_worker() -> None:
+    """
+    Initialize a worker process.
+
+    Nautilus logging is initialized once for the process lifetime (as in the
+    web app) so consecutive engines in the same worker do not re-initialize it,
+    and a persistent event loop keeps the async DB pool valid across jobs.
+    """
+    global _worker_loop
+
+    from nautilus_trader.common.component import init_logging
+
+    from src.utils.logging import set_nautilus_log_guard
+
+    set_nautilus_log_guard(init_logging())
+
+    _worker_loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(_worker_loop)
+
+
+def _load_from_shared(request: BacktestRequest, handle: SharedBarHandle) -> tuple[list, Any]:
+    """Build the job's bars from shared memory; returns ([], None) if unusable."""
+    try:
+        bars = load_shared_bars(handle, request.start_date, request.end_date)
+    except FileNotFoundError:
+        # Reason: The parent released the series (e.g., job timed out meanwhile)
+        return [], None
+
+    instrument = _worker_catalog.load_instrument(request.instrument_id) if bars else None
+    return bars, instrument
+
+
+async def _execute_job(
+    request: BacktestRequest, shared_bars: SharedBarHandle | None = None
+) -> UUID | None:
+    """Load data and run the backtest inside the worker process."""
+    global _worker_catalog
+
+    from src.cli.commands._backtest_helpers import load_backtest_data
+    from src.core.backtest_orchestrator import BacktestOrchestrator
+    from src.services.data_catalog import DataCatalogService
+
+    if _worker_catalog is None:
+        _worker_catalog = DataCatalogService()
+    else:
+        # Reason: Pick up data written by other processes since the last job
+        _worker_catalog.refresh_availability()
+
+    bars: list = []
+    instrument: Any = None
+    source_digest: str | None = None
+    if shared_bars is not None:
+        bars, instrument = _load_from_shared(request, shared_bars)
+        # Reason: Shared series are loaded from the catalog (see SharedBarCache)
+        source_digest = _worker_catalog.bar_source_digest(
+            request.instrument_id, request.bar_type, request.start_date, request.end_date
+        )
+
+    # Reason: Fall back to the regular path (which also handles instrument
+    # fetching and IBKR auto-fetch) when shared bars are unavailable
+    if not bars or instrument is None:
+        data_result = await load_backtest_data(
+            data_source=request.data_source,  # type: ignore[arg-type]
+            instrument_id=request.instrument_id,
+            bar_type_spec=request.bar_type,
+            start=request.start_date,
+            end=request.end_date,
+            console=Console(quiet=True),
+            catalog_service=_worker_catalog,
+        )
+        bars, instrument = data_result.bars, data_result.instrument
+        source_digest = data_result.source_digest
+
+    orchestrator = BacktestOrchestrator(catalog_service=_worker_catalog)
+    try:
+        _, run_id = await orchestrator.execute(
+            request, bars, instrument, source_digest=source_digest
+        )
+        return run_id
+    finally:
+        orchestrator.dispose()
+
+
+def run_backtest_job(
+    request: BacktestRequest, shared_bars: SharedBarHandle | None = None
+) -> UUID | None:
+    """
+    Execute a backtest request in the current (worker) process.
+
+    Args:
+        request: Backtest request to execute
+        shared_bars: Optional handle to the request's bar series in shared memory
+
+    Returns:
+        Persisted run ID, or None if the request was not persisted
+    """
+    global _worker_loop
+
+    if _worker_loop is None:
+        _worker_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_worker_loop)
+
+    return _worker_loop.run_until_complete(_execute_job(request, shared_bars))
+
+
+class BacktestJobManager:
+    """
+    Queue and execute backtest jobs on a process pool.
+
+    Jobs wait on a semaphore sized to the pool so a job is only marked
+    RUNNING (and its timeout started) once a worker is free. A timed-out job
+    keeps its slot until its worker actually finishes.
+
+    Attributes:
+        max_workers: Number of worker processes
+        max_queued: Maximum number of unfinished jobs accepted
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        max_queued: int = 20,
+        executor: Executor | None = None,
+        shared_bars: SharedBarCache | None = None,
+    ) -> None:
+        """
+        Initialize BacktestJobManager.
+
+        Args:
+            max_workers: Number of worker processes
+            max_queued: Maximum number of unfinished (queued or running) jobs
+            executor: Optional executor override (defaults to a spawn-based
+                     ProcessPoolExecutor; Nautilus is not fork-safe)
+            shared_bars: Optional cache sharing catalog bar series with workers
+        """
+        self.max_workers = max_workers
+        self.max_queued = max_queued
+        self._shared_bars = shared_bars
+        self._executor = executor or ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+        )
+        self._slots = asyncio.Semaphore(max_workers)
+        self._jobs: OrderedDict[UUID, BacktestJob] = OrderedDict()
+        self._tasks: set[asyncio.Task] = set()
+
+    @property
+    def pending_count(self) -> int:
+        """Number of queued or running jobs."""
+        return sum(1 for job in self._jobs.values() if not job.is_finished)
+
+    def submit(self, request: BacktestRequest, timeout_seconds: int = 300) -> BacktestJob:
+        """
+        Enqueue a backtest for execution.
+
+        Must be called from a running event loop.
+
+        Args:
+            request: Validated backtest request
+            timeout_seconds: Maximum run time once a worker picks the job up
+
+        Returns:
+            The queued BacktestJob
+
+        Raises:
+            BacktestQueueFullError: If max_queued unfinished jobs already exist
+        """
+        if self.pending_count >= self.max_queued:
+            raise BacktestQueueFullError(
+                f"Backtest queue is full ({self.max_queued} jobs pending). "
+                "Please wait for running backtests to complete."
+            )
+
+        job = BacktestJob(
+            strategy=request.strategy_type,
+            symbol=request.symbol,
+            timeout_seconds=timeout_seconds,
+        )
+        self._jobs[job.job_id] = job
+        self._prune_finished()
+
+        task = asyncio.get_running_loop().create_task(self._run(job, request))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+        logger.info(
+            "backtest_job_queued",
+            job_id=str(job.job_id),
+            strategy=job.strategy,
+            symbol=job.symbol,
+            pending=self.pending_count,
+        )
+        return job
+
+    def get(self, job_id: UUID) -> BacktestJob | None:
+        """Get a job by ID, or None if unknown (or pruned)."""
+        return self._jobs.get(job_id)
+
+    def list_jobs(self) -> list[BacktestJob]:
+        """Get all tracked jobs, most recent first."""
+        return list(reversed(self._jobs.values()))
+
+    async def _run(self, job: BacktestJob, request: BacktestRequest) -> None:
+        """Wait for a free worker, execute the job and record its outcome."""
+        await self._slots.acquire()
+        handle = None
+        try:
+            job.mark_running()
+            logger.info("backtest_job_started", job_id=str(job.job_id))
+
+            handle = await self._acquire_shared_bars(request)
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self._executor, run_backtest_job, request, handle)
+        except BaseException:
+            self._release_worker(None, handle)
+            raise
+
+        # Reason: The slot (and shared series) stay held until the worker is
+        # done, even past a timeout, so queued jobs only start on a free worker
+        future.add_done_callback(lambda done: self._release_worker(done, handle))
+
+        try:
+            # Reason: Shielded so a timeout does not mark the still-running future done
+            run_id = await asyncio.wait_for(asyncio.shield(future), timeout=job.timeout_seconds)
+            job.mark_succeeded(run_id)
+            logger.info(
+                "backtest_job_succeeded",
+                job_id=str(job.job_id),
+                run_id=str(run_id),
+            )
+        except asyncio.TimeoutError:
+            # NOTE: A running worker cannot be interrupted safely mid-engine
+            # run, so the backtest may still finish (and persist) later.
+            job.mark_timed_out()
+            logger.warning(
+                "backtest_job_timed_out",
+                job_id=str(job.job_id),
+                timeout_seconds=job.timeout_seconds,
+            )
+        except Exception as e:
+            job.mark_failed(str(e))
+            logger.error("backtest_job_failed", job_id=str(job.job_id), error=str(e))
+
+    def _release_worker(
+        self, future: asyncio.Future | None, handle: SharedBarHandle | None
+    ) -> None:
+        """Free a job's worker slot and shared series once its worker is done."""
+        if future is not None and not future.cancelled():
+            # Reason: Retrieve late failures of timed-out jobs so they are not reported
+            future.exception()
+        self._slots.release()
+        if handle is not None:
+            self._shared_bars.release(handle)  # type: ignore[union-attr]
+
+    async def _acquire_shared_bars(self, request: BacktestRequest) -> SharedBarHandle | None:
+        """Get the request's catalog series from the shared cache, if possible."""
+        if self._shared_bars is None or request.data_source != "catalog":
+            return None
+
+        try:
+            # Reason: A cache miss reads Parquet, keep it off the event loop
+            return await asyncio.to_thread(
+                self._shared_bars.acquire,
+                request.instrument_id,
+                request.bar_type,
+                request.start_date,
+                request.end_date,
+            )
+        except Exception as e:
+            logger.warning(
+                "shared_bars_unavailable",
+                instrument_id=request.instrument_id,
+                error=str(e),
+            )
+            return None
+
+    def _prune_finished(self) -> None:
+        """Drop the oldest finished jobs beyond MAX_FINISHED_JOBS."""
+        finished = [job_id for job_id, job in self._jobs.items() if job.is_finished]
+        for job_id in finished[: max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            del self._jobs[job_id]
+
+    def shutdown(self) -> None:
+        """Cancel queued jobs and stop the worker pool."""
+        for task in list(self._tasks):
+            task.cancel()
+        for job in self._jobs.values():
+            if job.status == JobStatus.QUEUED:
+                job.mark_failed("Server shutting down")
+
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        if self._shared_bars is not None:
+            self._shared_bars.close()
+        logger.info("backtest_job_manager_shutdown")
@@ -5,23 +5,219 @@ This module provides the business logic layer for persisting backtest results
 to the database, handling metric extraction, validation, and error scenarios.
 """
 
+import itertools
 import math
-from datetime import datetime, timezone
+from datetime import datetime
 from decimal import Decimal
 from typing import Optional
 from uuid import UUID
 
+import numpy as np
 import pandas as pd
 import structlog
 
 from src.db.exceptions import ValidationError
-from src.db.models.backtest import BacktestRun
-from src.db.repositories.backtest_repository import BacktestRepository
+from src.db.models.backtest import BacktestRun, PerformanceMetrics
+from src.db.models.trade import Trade
+from src.db.repositories.backtest_repository import TRADE_INSERT_COLUMNS, BacktestRepository
 from src.models.backtest_result import BacktestResult
 from src.models.config_snapshot import StrategyConfigSnapshot
+from src.services.trade_analytics import (
+    TRADE_ANALYTICS_COLUMNS,
+    TRADE_ANALYTICS_VERSION,
+    TradeColumns,
+    analyze_trade_columns,
+)
 
 logger = structlog.get_logger(__name__)
 
+# Money strings in the positions report, e.g. "-134.66 USD" or "['1.00 USD']"
+_MONEY_PATTERN = r"^[\[\s'\"]*([-+]?\d+(?:\.\d+)?)(?:\s+([^\s'\"\]]+))?"
+
+# Positions listed per validation error message
+_MAX_REPORTED_POSITIONS = 5
+
+# Positions of the analytics columns within trade rows
+_ANALYTICS_ROW_INDEXES = [TRADE_INSERT_COLUMNS.index(name) for name in TRADE_ANALYTICS_COLUMNS]
+
+
+def _report_column(frame: pd.DataFrame, name: str) -> pd.Series:
+    """Return a report column, or an all-missing one if the report lacks it."""
+    if name in frame.columns:
+        return frame[name]
+    return pd.Series(None, index=frame.index, dtype=object)
+
+
+def _numeric_column(values: pd.Series) -> np.ndarray:
+    """Parse report values (floats, or Price/Quantity strings) as float64, NaN if invalid."""
+    return pd.to_numeric(values.astype(str), errors="coerce").to_numpy(dtype=np.float64)
+
+
+def _money_column(values: pd.Series) -> tuple[pd.Series, pd.Series]:
+    """
+    Split Money values into amount and currency strings.
+
+    Accepts "-134.66 USD" strings, Money objects, or lists of either (first
+    entry used). Missing or unparseable values yield NA in both columns.
+    """
+    first = values.map(
+        lambda value: value[0] if isinstance(value, list) and value else value,
+        na_action="ignore",
+    )
+    parts = first.astype("string").str.extract(_MONEY_PATTERN)
+    return parts[0], parts[1]
+
+
+def _decimal_list(values: np.ndarray, places: int) -> list[Optional[Decimal]]:
+    """Round floats to a fixed number of decimal places, None for NaN."""
+    template = f"{{:.{places}f}}"
+    return [Decimal(template.format(v)) if v == v else None for v in values.tolist()]
+
+
+def positions_to_trade_rows(
+    backtest_run_id: int,
+    positions_report_df: pd.DataFrame,
+) -> tuple[list[tuple], int]:
+    """
+    Convert a Nautilus positions report into trade rows, column by column.
+
+    Unclosed positions are skipped. Prices and quantities are rounded to 8
+    decimal places, commissions and realized PnL are parsed from their Money
+    strings, and every column is validated as a whole before any row is
+    built, so one bad position rejects the report with a single error.
+
+    Args:
+        backtest_run_id: ID of the backtest run these trades belong to
+        positions_report_df: DataFrame from trader.generate_positions_report(),
+            indexed by position ID
+
+    Returns:
+        Tuple of (rows in TRADE_INSERT_COLUMNS order, skipped unclosed count)
+
+    Raises:
+        ValidationError: If any closed position has invalid values
+
+    Example:
+        >>> rows, skipped = positions_to_trade_rows(123, trader.generate_positions_report())
+        >>> await repository.bulk_insert_trades(rows)
+    """
+    closed = positions_report_df[positions_report_df["ts_closed"].notna()]
+    skipped_count = len(positions_report_df) - len(closed)
+    if closed.empty:
+        return [], skipped_count
+
+    entry_price = _numeric_column(closed["avg_px_open"]).round(8)
+    exit_price = _numeric_column(closed["avg_px_close"]).round(8)
+    quantity = _numeric_column(closed["peak_qty"]).round(8)
+    instrument_id = closed["instrument_id"].astype(str)
+    order_side = closed["entry"].astype(str)
+    commission_amount, commission_currency = _money_column(_report_column(closed, "commissions"))
+    commission_currency = commission_currency.fillna("USD")
+    profit_loss, _ = _money_column(_report_column(closed, "realized_pnl"))
+
+    invalid = {
+        "quantity must be positive": ~(quantity > 0),
+        "entry price must be positive": ~(entry_price > 0),
+        "exit price must be positive": ~(exit_price > 0),
+        "order side must be BUY or SELL": ~order_side.isin(("BUY", "SELL")).to_numpy(),
+        "instrument ID must be 1-50 characters": ~(
+            instrument_id.str.len().between(1, 50).to_numpy()
+        ),
+        "commission currency must be at most 10 characters": (
+            commission_currency.str.len() > 10
+        ).to_numpy(dtype=bool),
+    }
+    position_ids = closed.index.astype(str).to_numpy()
+    errors = [
+        f"{message} (positions: {', '.join(position_ids[mask][:_MAX_REPORTED_POSITIONS])})"
+        for message, mask in invalid.items()
+        if mask.any()
+    ]
+    if errors:
+        raise ValidationError(f"Invalid positions report: {'; '.join(errors)}")
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        profit_pct = (exit_price - entry_price) / entry_price * 100
+
+    duration_ns = _numeric_column(_report_column(closed, "duration_ns"))
+    holding_period_seconds = [
+        int(ns / 1_000_000_000) if ns == ns and ns else None for ns in duration_ns.tolist()
+    ]
+
+    rows = list(
+        zip(
+            itertools.repeat(backtest_run_id),
+            instrument_id.tolist(),
+            position_ids.tolist(),
+            closed["opening_order_id"].astype(str).tolist(),
+            closed["closing_order_id"].astype(str).tolist(),
+            order_side.tolist(),
+            _decimal_list(quantity, 8),
+            _decimal_list(entry_price, 8),
+            _decimal_list(exit_price, 8),
+            [Decimal(amount) for amount in commission_amount.fillna("0.00")],
+            commission_currency.tolist(),
+            itertools.repeat(Decimal("0.00")),
+            [Decimal(amount) for amount in profit_loss.fillna("0.00")],
+            _decimal_list(profit_pct, 4),
+            holding_period_seconds,
+            pd.DatetimeIndex(pd.to_datetime(closed["ts_opened"], utc=True)).to_pydatetime(),
+            pd.DatetimeIndex(pd.to_datetime(closed["ts_closed"], utc=True)).to_pydatetime(),
+        )
+    )
+    return rows, skipped_count
+
+
+def _optional_float(value: Optional[Decimal]) -> Optional[float]:
+    """Convert a nullable stored metric to float."""
+    return float(value) if value is not None else None
+
+
+def backtest_result_from_metrics(metrics: PerformanceMetrics) -> BacktestResult:
+    """
+    Rebuild a BacktestResult from a run's stored performance metrics.
+
+    The inverse of the metric extraction done when saving. Largest win and
+    loss are not stored, so they are derived from the max winner and loser.
+
+    Args:
+        metrics: Stored metrics of a successful run
+
+    Returns:
+        BacktestResult carrying the stored values
+    """
+    max_winner = _optional_float(metrics.max_winner)
+    max_loser = _optional_float(metrics.max_loser)
+    return BacktestResult(
+        total_return=float(metrics.total_return),
+        total_trades=metrics.total_trades,
+        winning_trades=metrics.winning_trades,
+        losing_trades=metrics.losing_trades,
+        largest_win=max(max_winner or 0.0, 0.0),
+        largest_loss=min(max_loser or 0.0, 0.0),
+        final_balance=float(metrics.final_balance),
+        sharpe_ratio=_optional_float(metrics.sharpe_ratio),
+        sortino_ratio=_optional_float(metrics.sortino_ratio),
+        volatility=_optional_float(metrics.volatility),
+        profit_factor=_optional_float(metrics.profit_factor),
+        risk_return_ratio=_optional_float(metrics.risk_return_ratio),
+        avg_return=_optional_float(metrics.avg_return),
+        avg_win_return=_optional_float(metrics.avg_win_return),
+        avg_loss_return=_optional_float(metrics.avg_loss_return),
+        total_pnl=_optional_float(metrics.total_pnl),
+        total_pnl_percentage=_optional_float(metrics.total_pnl_percentage),
+        expectancy=_optional_float(metrics.expectancy),
+        avg_win=_optional_float(metrics.avg_win),
+        avg_loss=_optional_float(metrics.avg_loss),
+        max_winner=max_winner,
+        max_loser=max_loser,
+        min_winner=_optional_float(metrics.min_winner),
+        min_loser=_optional_float(metrics.min_loser),
+        max_drawdown=_optional_float(metrics.max_drawdown),
+        cagr=_optional_float(metrics.cagr),
+        calmar_ratio=_optional_float(metrics.calmar_ratio),
+    )
+
 
 class BacktestPersistenceService:
     """
@@ -63,6 +259,9 @@ class BacktestPersistenceService:
         config_snapshot: dict,
         backtest_result: BacktestResult,
         reproduced_from_run_id: Optional[UUID] = None,
+        sweep_id: Optional[UUID] = None,
+        equity_curve: Optional[list[dict]] = None,
+        fingerprint: Optional[str] = None,
     ) -> BacktestRun:
         """
         Save successful backtest execution results.
@@ -80,6 +279,10 @@ class BacktestPersistenceService:
             config_snapshot: Strategy configuration
             backtest_result: Backtest execution results
             reproduced_from_run_id: Original run if reproduction
+            sweep_id: Parameter sweep this run belongs to
+            equity_curve: Optional {"time", "value"} points, stored in the
+                equity_curves table rather than the config snapshot
+            fingerprint: Result cache key of the run
 
         Returns:
             Created BacktestRun instance
@@ -113,16 +316,24 @@ class BacktestPersistenceService:
             config_snapshot=validated_config,
             error_message=None,
             reproduced_from_run_id=reproduced_from_run_id,
+            sweep_id=sweep_id,
+            fingerprint=fingerprint,
         )
 
         # Extract and validate metrics from backtest result
         validated_metrics = self._extract_and_validate_metrics(backtest_result)
 
         # Create performance metrics record
-        await self.repository.create_performance_metrics(
+        metrics = await self.repository.create_performance_metrics(
             backtest_run_id=backtest_run.id, **validated_metrics
         )
 
+        if equity_curve:
+            await self.repository.create_equity_curve(backtest_run.id, equity_curve)
+
+        # Keep dashboard rollups in step within the same transaction
+        await self.repository.record_run_summary(backtest_run, metrics)
+
         logger.info(
             "Backtest results saved successfully",
             run_id=str(run_id),
@@ -144,6 +355,7 @@ class BacktestPersistenceService:
         execution_duration_seconds: Decimal,
         config_snapshot: dict,
         error_message: str,
+        sweep_id: Optional[UUID] = None,
     ) -> BacktestRun:
         """
         Save failed backtest execution.
@@ -163,6 +375,7 @@ class BacktestPersistenceService:
             execution_duration_seconds: Time taken before failure
             config_snapshot: Strategy configuration
             error_message: Error description
+            sweep_id: Parameter sweep this run belongs to
 
         Returns:
             Created BacktestRun instance
@@ -191,8 +404,11 @@ class BacktestPersistenceService:
             execution_duration_seconds=execution_duration_seconds,
             config_snapshot=validated_config,
             error_message=error_message,
+            sweep_id=sweep_id,
         )
 
+        await self.repository.record_run_summary(backtest_run)
+
         logger.info("Failed backtest saved", run_id=str(run_id))
 
         return backtest_run
@@ -356,16 +572,20 @@ class BacktestPersistenceService:
         self,
         backtest_run_id: int,
         positions_report_df,
+        initial_capital: Optional[Decimal] = None,
     ) -> int:
         """
         Save trades from Nautilus Trader positions report to database.
 
-        Converts positions report DataFrame to Trade records with complete
-        entry/exit data and realized PnL.
+        Converts the positions report DataFrame column-wise to trade rows with
+        complete entry/exit data and realized PnL, then bulk inserts them.
+        Given the run's initial capital, the run's trade statistics and
+        drawdown metrics are computed from the same rows and stored with them.
 
         Args:
             backtest_run_id: ID of the backtest run these trades belong to
             positions_report_df: Pandas DataFrame from trader.generate_positions_report()
+            initial_capital: Starting balance of the run, as stored on its record
 
         Returns:
             Number of trades saved
@@ -380,9 +600,6 @@ class BacktestPersistenceService:
             ...     positions_report_df=positions_df
             ... )
         """
-        from src.db.models.trade import Trade as TradeDB
-        from src.models.trade import TradeCreate
-
         if positions_report_df is None or positions_report_df.empty:
             logger.info("No positions to save", backtest_run_id=backtest_run_id)
             return 0
@@ -395,135 +612,15 @@ class BacktestPersistenceService:
         )
 
         # Log first row as sample for debugging
-        if len(positions_report_df) > 0:
-            first_row = positions_report_df.iloc[0]
-            logger.info(
-                "Sample position row",
-                backtest_run_id=backtest_run_id,
-                sample_data={k: str(v) for k, v in first_row.to_dict().items()},
-            )
-
-        trades_to_save = []
-        skipped_count = 0
+        first_row = positions_report_df.iloc[0]
+        logger.info(
+            "Sample position row",
+            backtest_run_id=backtest_run_id,
+            sample_data={k: str(v) for k, v in first_row.to_dict().items()},
+        )
 
         try:
-            # Convert DataFrame rows to Trade models
-            for position_id, row in positions_report_df.iterrows():
-                # Skip unclosed positions - trades require both entry and exit
-                if pd.isna(row["ts_closed"]):
-                    logger.debug(
-                        "Skipping unclosed position",
-                        position_id=str(position_id),
-                        instrument_id=str(row.get("instrument_id", "unknown")),
-                    )
-                    skipped_count += 1
-                    continue
-
-                # Convert timestamps to datetime
-                # ts_opened is already pandas Timestamp from positions report
-                entry_timestamp = row["ts_opened"]
-                if hasattr(entry_timestamp, "to_pydatetime"):
-                    entry_timestamp = entry_timestamp.to_pydatetime()
-                if entry_timestamp.tzinfo is None:
-                    entry_timestamp = entry_timestamp.replace(tzinfo=timezone.utc)
-
-                # Convert exit timestamp (ts_closed)
-                exit_timestamp = row["ts_closed"]
-                if hasattr(exit_timestamp, "to_pydatetime"):
-                    exit_timestamp = exit_timestamp.to_pydatetime()
-                if exit_timestamp.tzinfo is None:
-                    exit_timestamp = exit_timestamp.replace(tzinfo=timezone.utc)
-
-                # Extract commission from commissions list
-                commission_amount = Decimal("0.00")
-                commission_currency = "USD"
-                if "commissions" in row and row["commissions"]:
-                    # commissions is a list of Money objects
-                    commissions_list = row["commissions"]
-                    if isinstance(commissions_list, list) and len(commissions_list) > 0:
-                        # Take first commission from list and convert to string
-                        comm_str = str(commissions_list[0])
-                        parts = comm_str.split()
-                        if len(parts) >= 2:
-                            commission_amount = Decimal(parts[0])
-                            commission_currency = parts[1]
-                        elif len(parts) == 1:
-                            commission_amount = Decimal(parts[0])
-                    else:
-                        # If it's not a list, try parsing as string directly
-                        commissions_str = str(commissions_list).strip("[]")
-                        parts = commissions_str.split()
-                        if len(parts) >= 2:
-                            commission_amount = Decimal(parts[0])
-                            commission_currency = parts[1]
-                        elif len(parts) == 1 and parts[0]:
-                            commission_amount = Decimal(parts[0])
-
-                # Calculate holding period in seconds from duration_ns
-                holding_period_seconds = None
-                if "duration_ns" in row and row["duration_ns"]:
-                    holding_period_seconds = int(row["duration_ns"] / 1_000_000_000)
-
-                # Extract realized PnL (format: "-134.66 USD")
-                profit_loss = Decimal("0.00")
-                if "realized_pnl" in row and row["realized_pnl"]:
-                    pnl_str = str(row["realized_pnl"])
-                    parts = pnl_str.split()
-                    if len(parts) >= 1:
-                        profit_loss = Decimal(parts[0])
-
-                # Quantize to 8 decimal places to avoid float artifacts
-                # from Nautilus C extension float → Decimal conversion
-                max_dp = Decimal("0.00000001")
-
-                # Calculate profit percentage
-                profit_pct = None
-                entry_price = Decimal(str(row["avg_px_open"])).quantize(max_dp)
-                exit_price = Decimal(str(row["avg_px_close"])).quantize(max_dp)
-                quantity = Decimal(str(row["peak_qty"])).quantize(max_dp)
-                if entry_price > 0:
-                    profit_pct = ((exit_price - entry_price) / entry_price) * Decimal("100")
-
-                # Create TradeCreate model for validation
-                trade_data = TradeCreate(
-                    backtest_run_id=backtest_run_id,
-                    instrument_id=str(row["instrument_id"]),
-                    trade_id=str(position_id),  # Use position_id as trade_id
-                    venue_order_id=str(row["opening_order_id"]),
-                    client_order_id=str(row["closing_order_id"]),
-                    order_side=str(row["entry"]),  # BUY or SELL
-                    quantity=quantity,
-                    entry_price=entry_price,
-                    exit_price=exit_price,
-                    commission_amount=commission_amount,
-                    commission_currency=commission_currency,
-                    fees_amount=Decimal("0.00"),
-                    entry_timestamp=entry_timestamp,
-                    exit_timestamp=exit_timestamp,
-                )
-
-                # Create database model
-                trade_db = TradeDB(
-                    backtest_run_id=trade_data.backtest_run_id,
-                    instrument_id=trade_data.instrument_id,
-                    trade_id=trade_data.trade_id,
-                    venue_order_id=trade_data.venue_order_id,
-                    client_order_id=trade_data.client_order_id,
-                    order_side=trade_data.order_side,
-                    quantity=trade_data.quantity,
-                    entry_price=trade_data.entry_price,
-                    exit_price=trade_data.exit_price,
-                    commission_amount=trade_data.commission_amount,
-                    commission_currency=trade_data.commission_currency,
-                    fees_amount=trade_data.fees_amount,
-                    profit_loss=profit_loss,
-                    profit_pct=profit_pct,
-                    holding_period_seconds=holding_period_seconds,
-                    entry_timestamp=trade_data.entry_timestamp,
-                    exit_timestamp=trade_data.exit_timestamp,
-                )
-
-                trades_to_save.append(trade_db)
+            rows, skipped_count = positions_to_trade_rows(backtest_run_id, positions_report_df)
 
             # Log skipped unclosed positions if any
             if skipped_count > 0:
@@ -533,20 +630,15 @@ class BacktestPersistenceService:
                     skipped_count=skipped_count,
                 )
 
-            # Bulk insert all trades
-            if trades_to_save:
-                logger.info(
-                    "Calling bulk_create_trades",
-                    backtest_run_id=backtest_run_id,
-                    trade_count=len(trades_to_save),
-                    skipped_unclosed=skipped_count,
-                )
-                await self.repository.bulk_create_trades(trades_to_save)
+            if rows:
+                await self.repository.bulk_insert_trades(rows)
+                if initial_capital is not None:
+                    await self._save_trade_analytics(backtest_run_id, rows, initial_capital)
 
                 logger.info(
                     "Trades saved successfully",
                     backtest_run_id=backtest_run_id,
-                    trade_count=len(trades_to_save),
+                    trade_count=len(rows),
                     skipped_unclosed=skipped_count,
                 )
             else:
@@ -556,7 +648,7 @@ class BacktestPersistenceService:
                     skipped_unclosed=skipped_count,
                 )
 
-            return len(trades_to_save)
+            return len(rows)
 
         except Exception as e:
             logger.error(
@@ -565,3 +657,29 @@ class BacktestPersistenceService:
                 error=str(e),
             )
             raise ValidationError(f"Failed to save trades: {e}") from e
+
+    async def _save_trade_analytics(
+        self,
+        backtest_run_id: int,
+        rows: list[tuple],
+        initial_capital: Decimal,
+    ) -> None:
+        """
+        Compute and store trade analytics from freshly inserted trade rows.
+
+        Args:
+            backtest_run_id: ID of the backtest run the trades belong to
+            rows: Trade rows in TRADE_INSERT_COLUMNS order
+            initial_capital: Starting balance of the run
+        """
+        # Reason: Order and scale as the database returns the trades, so the
+        # stored results are the ones a later recomputation would give
+        analytics_rows = sorted(
+            (tuple(row[i] for i in _ANALYTICS_ROW_INDEXES) for row in rows),
+            key=lambda row: row[0],
+        )
+        columns = TradeColumns.from_rows(analytics_rows, scale=Trade.profit_loss.type.scale)
+        statistics, drawdowns = analyze_trade_columns(columns, initial_capital)
+        await self.repository.save_trade_analytics(
+            backtest_run_id, statistics, drawdowns, TRADE_ANALYTICS_VERSION
+        )
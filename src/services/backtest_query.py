@@ -16,13 +16,31 @@ from src.api.models.backtest_list import (
     FilteredBacktestListPage,
     to_list_item,
 )
-from src.api.models.dashboard import DashboardSummary, to_recent_item
-from src.api.models.filter_models import FilterState
+from src.api.models.dashboard import DashboardSummary, to_recent_item, to_rollup
+from src.api.models.filter_models import ExecutionStatus, FilterState, encode_cursor
 from src.db.models.backtest import BacktestRun
-from src.db.repositories.backtest_repository import BacktestRepository
+from src.db.models.backtest_summary import SCOPE_ALL, SCOPE_INSTRUMENT, SCOPE_STRATEGY
+from src.db.models.equity_curve import EquityCurve
+from src.db.models.trade import Trade
+from src.db.repositories.backtest_repository import (
+    LIST_COUNT_CAP,
+    BacktestRepository,
+    list_sort_value,
+    max_offset_page,
+)
+from src.models.trade import DrawdownMetrics, TradeStatistics
+from src.services.trade_analytics import (
+    TRADE_ANALYTICS_COLUMNS,
+    TRADE_ANALYTICS_VERSION,
+    TradeColumns,
+    analyze_trade_columns,
+)
 
 logger = structlog.get_logger(__name__)
 
+# Strategies and instruments listed on the dashboard
+DASHBOARD_ROLLUP_LIMIT = 10
+
 
 class BacktestQueryService:
     """
@@ -69,6 +87,24 @@ class BacktestQueryService:
         logger.debug("Fetching backtest by ID", run_id=str(run_id))
         return await self.repository.find_by_run_id(run_id)
 
+    async def get_equity_curve(self, run_id: UUID) -> Optional[EquityCurve]:
+        """
+        Retrieve the stored equity curve of a backtest.
+
+        Args:
+            run_id: Unique business identifier
+
+        Returns:
+            EquityCurve with time/value arrays, or None if none was stored
+
+        Example:
+            >>> curve = await service.get_equity_curve(run_id)
+            >>> if curve:
+            ...     print(f"{curve.point_count} points")
+        """
+        logger.debug("Fetching equity curve", run_id=str(run_id))
+        return await self.repository.find_equity_curve(run_id)
+
     async def get_backtest_by_internal_id(self, internal_id: int) -> Optional[BacktestRun]:
         """
         Retrieve complete backtest details by internal database ID.
@@ -87,6 +123,50 @@ class BacktestQueryService:
         logger.debug("Fetching backtest by internal ID", internal_id=internal_id)
         return await self.repository.find_by_internal_id(internal_id)
 
+    async def get_trade_analytics(
+        self, backtest: BacktestRun
+    ) -> Tuple[TradeStatistics, DrawdownMetrics]:
+        """
+        Retrieve a backtest's trade statistics and drawdown metrics.
+
+        Served from the run's persisted trade_analytics row. Runs saved before
+        analytics were persisted, or computed with an older
+        TRADE_ANALYTICS_VERSION, are analyzed once from their trade columns
+        and the results committed for later requests.
+
+        Args:
+            backtest: Backtest run to analyze
+
+        Returns:
+            Tuple of (TradeStatistics, DrawdownMetrics)
+
+        Example:
+            >>> backtest = await service.get_backtest_by_internal_id(123)
+            >>> statistics, drawdowns = await service.get_trade_analytics(backtest)
+        """
+        stored = await self.repository.find_trade_analytics(backtest.id)
+        if stored is not None and stored.version == TRADE_ANALYTICS_VERSION:
+            return (
+                TradeStatistics.model_validate(stored.statistics),
+                DrawdownMetrics.model_validate(stored.drawdowns),
+            )
+
+        logger.info(
+            "Computing trade analytics",
+            backtest_run_id=backtest.id,
+            stored_version=stored.version if stored else None,
+        )
+        rows = await self.repository.find_trade_values(backtest.id, TRADE_ANALYTICS_COLUMNS)
+        statistics, drawdowns = analyze_trade_columns(
+            TradeColumns.from_rows(rows, scale=Trade.profit_loss.type.scale),
+            backtest.initial_capital,
+        )
+        await self.repository.save_trade_analytics(
+            backtest.id, statistics, drawdowns, TRADE_ANALYTICS_VERSION
+        )
+        await self.repository.session.commit()
+        return statistics, drawdowns
+
     async def list_recent_backtests(
         self,
         limit: int = 20,
@@ -212,14 +292,43 @@ class BacktestQueryService:
         else:
             raise ValueError(f"Unsupported metric: {metric}. Supported: sharpe_ratio, total_return")
 
+    async def get_sweep_runs(
+        self, sweep_id: UUID, metric: str = "sharpe_ratio", limit: int = 100
+    ) -> List[BacktestRun]:
+        """
+        Get the runs of a parameter sweep ranked by a metric.
+
+        Args:
+            sweep_id: Parameter sweep identifier
+            metric: Metric to rank by ("sharpe_ratio", "total_return",
+                    "sortino_ratio", "max_drawdown")
+            limit: Maximum records (default 100, max 1000)
+
+        Returns:
+            List of BacktestRun instances ordered best-first
+
+        Raises:
+            ValueError: If unsupported metric specified
+
+        Example:
+            >>> runs = await service.get_sweep_runs(sweep_id, metric="total_return")
+            >>> best = runs[0]
+        """
+        limit = min(limit, 1000)
+
+        logger.debug("Fetching sweep runs", sweep_id=str(sweep_id), metric=metric)
+        return await self.repository.find_by_sweep_id(sweep_id, metric=metric, limit=limit)
+
     async def get_dashboard_stats(self) -> DashboardSummary:
         """
         Get aggregate statistics for dashboard display.
 
-        Retrieves total count, best Sharpe ratio, worst drawdown, and recent activity.
+        Reads the rollups maintained by BacktestPersistenceService on every
+        save, so the cost is a few indexed rows however many runs exist.
 
         Returns:
-            DashboardSummary with aggregate statistics
+            DashboardSummary with aggregate statistics, per-strategy and
+            per-instrument rollups, and recent activity
 
         Example:
             >>> stats = await service.get_dashboard_stats()
@@ -228,46 +337,27 @@ class BacktestQueryService:
         """
         logger.debug("Fetching dashboard statistics")
 
-        # Get total count
-        total = await self._count_all_backtests()
-
-        # Initialize with empty state
-        summary = DashboardSummary(total_backtests=total)
-
-        if total == 0:
-            return summary
-
-        # Get best Sharpe ratio
-        top_sharpe = await self.repository.find_top_performers_by_sharpe(limit=1)
-        if top_sharpe and top_sharpe[0].metrics:
-            summary.best_sharpe_ratio = top_sharpe[0].metrics.sharpe_ratio
-            summary.best_sharpe_strategy = top_sharpe[0].strategy_name
-
-        # Get worst drawdown (smallest value since drawdowns are negative)
-        # We need to find the MINIMUM (most negative) drawdown
-        # The repository sorts DESC, so we scan all runs to find the worst
-        all_runs = await self.repository.find_recent(limit=1000)
-        if all_runs:
-            worst_drawdown_run = None
-            worst_drawdown_value = None
-            for run in all_runs:
-                if run.metrics and run.metrics.max_drawdown is not None:
-                    if (
-                        worst_drawdown_value is None
-                        or run.metrics.max_drawdown < worst_drawdown_value
-                    ):
-                        worst_drawdown_value = run.metrics.max_drawdown
-                        worst_drawdown_run = run
-
-            if worst_drawdown_run and worst_drawdown_value is not None:
-                summary.worst_max_drawdown = worst_drawdown_value
-                summary.worst_drawdown_strategy = worst_drawdown_run.strategy_name
-
-        # Get recent activity
-        recent = await self.get_recent_activity(limit=5)
-        summary.recent_backtests = recent
-
-        return summary
+        overall = await self.repository.find_summary(SCOPE_ALL)
+        if overall is None:
+            return DashboardSummary(total_backtests=0)
+
+        strategies = await self.repository.find_summaries(
+            SCOPE_STRATEGY, limit=DASHBOARD_ROLLUP_LIMIT
+        )
+        instruments = await self.repository.find_summaries(
+            SCOPE_INSTRUMENT, limit=DASHBOARD_ROLLUP_LIMIT
+        )
+
+        return DashboardSummary(
+            total_backtests=overall.total_runs,
+            best_sharpe_ratio=overall.best_sharpe_ratio,
+            best_sharpe_strategy=overall.best_sharpe_strategy,
+            worst_max_drawdown=overall.worst_max_drawdown,
+            worst_drawdown_strategy=overall.worst_drawdown_strategy,
+            recent_backtests=await self.get_recent_activity(limit=5),
+            strategy_rollups=[to_rollup(summary) for summary in strategies],
+            instrument_rollups=[to_rollup(summary) for summary in instruments],
+        )
 
     async def get_recent_activity(self, limit: int = 5) -> list:
         """
@@ -288,25 +378,79 @@ class BacktestQueryService:
 
         logger.debug("Fetching recent activity", limit=limit)
 
-        backtests = await self.repository.find_recent(limit=limit)
+        backtests = await self.repository.find_recent(limit=limit, summary_only=True)
         return [to_recent_item(bt) for bt in backtests]
 
-    async def _count_all_backtests(self) -> int:
+    async def _count_matching(self, filter_state: FilterState) -> Tuple[int, bool]:
         """
-        Count total number of backtests in the system.
+        Count backtests matching the filters of a list page.
+
+        Uses the maintained rollups when the filters are limited to strategy
+        and status, so the common unfiltered and per-strategy views cost one
+        indexed row. Other filters are counted in SQL up to LIST_COUNT_CAP.
+
+        Args:
+            filter_state: Filter state (sort and pagination are ignored)
 
         Returns:
-            Total count of all backtest runs
+            Tuple of (count, whether the count stopped at the cap)
         """
-        # Get count by loading a limited set and checking if more exist
-        # This is a simple approach; for production, add a count method to repository
-        from sqlalchemy import func, select
+        if not (filter_state.instrument or filter_state.date_from or filter_state.date_to):
+            if filter_state.strategy:
+                summary = await self.repository.find_summary(SCOPE_STRATEGY, filter_state.strategy)
+            else:
+                summary = await self.repository.find_summary(SCOPE_ALL)
+            if summary is not None:
+                if filter_state.status == ExecutionStatus.SUCCESS:
+                    return summary.successful_runs, False
+                if filter_state.status == ExecutionStatus.FAILED:
+                    return summary.total_runs - summary.successful_runs, False
+                return summary.total_runs, False
+
+        count = await self.repository.count_filtered_backtests(filter_state, cap=LIST_COUNT_CAP)
+        return count, count >= LIST_COUNT_CAP
+
+    async def _get_page(
+        self, filter_state: FilterState
+    ) -> Tuple[List[BacktestRun], FilterState, Optional[str], Optional[str]]:
+        """
+        Fetch one keyset page and the cursors linking to its neighbours.
 
-        from src.db.models.backtest import BacktestRun
+        A malformed cursor is logged and the first page is served instead.
+        Paging backward onto the first page resets the page number to 1, and
+        a page number past max_offset_page without a cursor is capped to it.
 
-        stmt = select(func.count(BacktestRun.id))
-        result = await self.repository.session.execute(stmt)
-        return result.scalar_one()
+        Args:
+            filter_state: Complete filter/sort/pagination state
+
+        Returns:
+            Tuple of (runs in list order, effective filter state,
+            next-page cursor, previous-page cursor)
+        """
+        deepest = max_offset_page(filter_state.page_size)
+        if not (filter_state.after or filter_state.before) and filter_state.page > deepest:
+            filter_state = filter_state.with_page(deepest)
+
+        try:
+            backtests, has_more = await self.repository.get_filtered_backtests(filter_state)
+        except ValueError as e:
+            logger.warning("Ignoring invalid list cursor", error=str(e))
+            filter_state = filter_state.with_page(1)
+            backtests, has_more = await self.repository.get_filtered_backtests(filter_state)
+
+        if filter_state.before and not has_more:
+            filter_state = filter_state.with_page(1)
+
+        has_next = has_more or filter_state.before is not None
+        has_previous = filter_state.page > 1
+        next_cursor = previous_cursor = None
+        if backtests and has_next:
+            last = backtests[-1]
+            next_cursor = encode_cursor(list_sort_value(last, filter_state.sort), last.id)
+        if backtests and has_previous:
+            first = backtests[0]
+            previous_cursor = encode_cursor(list_sort_value(first, filter_state.sort), first.id)
+        return backtests, filter_state, next_cursor, previous_cursor
 
     async def get_backtest_list_page(self, page: int = 1, page_size: int = 20) -> BacktestListPage:
         """
@@ -331,24 +475,21 @@ class BacktestQueryService:
 
         logger.debug("Fetching backtest list page", page=page, page_size=page_size)
 
-        # Get total count
-        total_count = await self._count_all_backtests()
-
-        # Calculate offset
-        offset = (page - 1) * page_size
-
-        # Get backtests for current page using offset-based pagination
-        all_backtests = await self.repository.find_recent(limit=offset + page_size)
-        page_backtests = all_backtests[offset : offset + page_size]
+        filter_state = FilterState(page=page, page_size=page_size)
+        total_count, total_is_estimate = await self._count_matching(filter_state)
+        backtests, filter_state, next_cursor, previous_cursor = await self._get_page(filter_state)
 
         # Convert to view models
-        items = [to_list_item(bt) for bt in page_backtests]
+        items = [to_list_item(bt) for bt in backtests]
 
         return BacktestListPage(
             backtests=items,
-            page=page,
+            page=filter_state.page,
             page_size=page_size,
             total_count=total_count,
+            total_is_estimate=total_is_estimate,
+            next_cursor=next_cursor,
+            previous_cursor=previous_cursor,
         )
 
     async def get_filtered_backtest_list_page(
@@ -385,8 +526,9 @@ class BacktestQueryService:
             page=filter_state.page,
         )
 
-        # Get filtered backtests and total count
-        backtests, total_count = await self.repository.get_filtered_backtests(filter_state)
+        # Get the page, its neighbour cursors and the (possibly capped) total
+        backtests, filter_state, next_cursor, previous_cursor = await self._get_page(filter_state)
+        total_count, total_is_estimate = await self._count_matching(filter_state)
 
         # Get available filter options
         available_strategies = await self.repository.get_distinct_strategies()
@@ -400,6 +542,9 @@ class BacktestQueryService:
             page=filter_state.page,
             page_size=filter_state.page_size,
             total_count=total_count,
+            total_is_estimate=total_is_estimate,
+            next_cursor=next_cursor,
+            previous_cursor=previous_cursor,
             filter_state=filter_state,
             available_strategies=available_strategies,
             available_instruments=available_instruments,
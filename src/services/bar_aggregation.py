@@ -0,0 +1,349 @@
+"""
+Derived bar types aggregated from finer bars already in the catalog.
+
+Coarser timeframes (N-minute, hourly, daily, weekly) that were never fetched
+are resampled from the finest stored bar type of the same instrument and
+price type, instead of requesting them from a data provider again.
+
+Derived bars are written to the catalog as INTERNAL bar types (Nautilus'
+marker for bars aggregated locally), e.g. ``AAPL.NASDAQ-5-MINUTE-LAST-INTERNAL``,
+so they never mix with provider data and are ignored by availability scans.
+A provenance record per derived bar type ({catalog_path}/.derived/) stores
+the source bar type and a fingerprint of its Parquet files; the derived bars
+are rebuilt when the fingerprint no longer matches.
+
+Source bars are assumed to be stamped with their open time, as written by
+the CSV, IBKR and Kraken importers; each derived bar is stamped with the
+start of its bucket. Daily and weekly buckets are UTC days and
+Monday-aligned UTC weeks.
+"""
+
+import hashlib
+import os
+import shutil
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable
+
+import numpy as np
+import structlog
+from nautilus_trader.persistence.funcs import urisafe_identifier
+from pydantic import ValidationError
+
+from src.models.catalog_metadata import DerivedBarProvenance, bar_spec_interval
+from src.services.exceptions import DataNotFoundError
+from src.services.shared_bars import BarArrays
+
+if TYPE_CHECKING:
+    from src.services.data_catalog import DataCatalogService
+
+logger = structlog.get_logger(__name__)
+
+DERIVED_DIR_NAME = ".derived"
+DERIVED_AGGREGATION_SOURCE = "INTERNAL"
+
+# Reason: 1970-01-01 was a Thursday; weekly buckets start on Monday 1970-01-05
+_WEEK_ORIGIN_NS = 4 * 86_400_000_000_000
+
+
+def _interval_ns(bar_type_spec: str) -> int | None:
+    """Bar duration of a spec in nanoseconds, or None for non-time bars."""
+    interval = bar_spec_interval(bar_type_spec)
+    if interval is None:
+        return None
+    return interval // timedelta(microseconds=1) * 1000
+
+
+def _price_type(bar_type_spec: str) -> str:
+    """Price type of a spec (e.g., "LAST" for "5-MINUTE-LAST")."""
+    return bar_type_spec.rsplit("-", 1)[-1]
+
+
+def derived_bar_type(instrument_id: str, bar_type_spec: str) -> str:
+    """
+    Full bar type string of a derived bar series.
+
+    Args:
+        instrument_id: Instrument identifier (e.g., "AAPL.NASDAQ")
+        bar_type_spec: Target spec (e.g., "5-MINUTE-LAST")
+
+    Returns:
+        Bar type string with INTERNAL aggregation source
+
+    Example:
+        >>> derived_bar_type("AAPL.NASDAQ", "1-HOUR-LAST")
+        'AAPL.NASDAQ-1-HOUR-LAST-INTERNAL'
+    """
+    return f"{instrument_id}-{bar_type_spec}-{DERIVED_AGGREGATION_SOURCE}"
+
+
+def select_source_spec(stored_specs: Iterable[str], target_spec: str) -> str | None:
+    """
+    Pick the finest stored spec that can be aggregated into the target.
+
+    A source qualifies when it has the same price type and its interval is
+    shorter than, and evenly divides, the target interval.
+
+    Args:
+        stored_specs: Bar type specs stored for the instrument
+        target_spec: Spec to derive (e.g., "1-HOUR-LAST")
+
+    Returns:
+        Source spec, or None if no stored spec qualifies
+
+    Example:
+        >>> select_source_spec(["1-DAY-LAST", "1-MINUTE-LAST"], "1-HOUR-LAST")
+        '1-MINUTE-LAST'
+    """
+    target_ns = _interval_ns(target_spec)
+    if target_ns is None:
+        return None
+
+    candidates = []
+    for spec in stored_specs:
+        source_ns = _interval_ns(spec)
+        if (
+            source_ns is not None
+            and _price_type(spec) == _price_type(target_spec)
+            and source_ns < target_ns
+            and target_ns % source_ns == 0
+        ):
+            candidates.append((source_ns, spec))
+
+    return min(candidates)[1] if candidates else None
+
+
+def resample_bar_arrays(source: BarArrays, target_bar_type: str) -> BarArrays:
+    """
+    Aggregate bars into fixed time buckets with vectorized reductions.
+
+    Args:
+        source: Source bars sorted by time
+        target_bar_type: Full bar type string of the result
+                         (e.g., "AAPL.NASDAQ-1-HOUR-LAST-INTERNAL")
+
+    Returns:
+        BarArrays with one bar per non-empty bucket
+
+    Raises:
+        ValueError: If the target is not a time-based bar type
+
+    Example:
+        >>> hourly = resample_bar_arrays(minutes, "AAPL.NASDAQ-1-HOUR-LAST-INTERNAL")
+    """
+    spec = "-".join(target_bar_type.split("-")[-4:-1])
+    step = _interval_ns(spec)
+    if step is None:
+        raise ValueError(f"Cannot resample into non-time bar type: {target_bar_type}")
+
+    origin = _WEEK_ORIGIN_NS if spec.split("-")[1] == "WEEK" else 0
+    bucket = (source.ts_event.astype(np.int64) - origin) // step
+
+    if len(bucket):
+        starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+        last = np.r_[starts[1:], len(bucket)] - 1
+    else:
+        starts = last = np.array([], dtype=np.int64)
+
+    ts = (bucket[starts] * step + origin).astype(np.uint64)
+    reduce = len(starts) > 0
+    return BarArrays(
+        bar_type=target_bar_type,
+        price_precision=source.price_precision,
+        size_precision=source.size_precision,
+        open=source.open[starts],
+        high=np.maximum.reduceat(source.high, starts) if reduce else source.high[:0],
+        low=np.minimum.reduceat(source.low, starts) if reduce else source.low[:0],
+        close=source.close[last],
+        volume=np.add.reduceat(source.volume, starts) if reduce else source.volume[:0],
+        ts_event=ts,
+        ts_init=ts.copy(),
+    )
+
+
+def source_fingerprint(directory: Path) -> str:
+    """
+    Fingerprint a bar type directory by its Parquet file names, sizes and mtimes.
+
+    Args:
+        directory: Bar type directory in the catalog
+
+    Returns:
+        Hex digest that changes whenever a file is added, removed or rewritten
+    """
+    digest = hashlib.sha256()
+    for file in sorted(directory.glob("*.parquet")):
+        stat = file.stat()
+        digest.update(f"{file.name}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+    return digest.hexdigest()
+
+
+class DerivedBarCache:
+    """
+    Builds, stores and invalidates derived bar types in a catalog.
+
+    Attributes:
+        catalog_service: Catalog the source and derived bars live in
+        provenance_dir: Directory holding one provenance record per derived bar type
+
+    Example:
+        >>> cache = DerivedBarCache(catalog_service)
+        >>> hourly = cache.query("AAPL.NASDAQ", "1-HOUR-LAST")
+    """
+
+    def __init__(self, catalog_service: "DataCatalogService") -> None:
+        """
+        Initialize the cache for a catalog.
+
+        Args:
+            catalog_service: Catalog service owning the Parquet catalog
+        """
+        self.catalog_service = catalog_service
+        self.provenance_dir = catalog_service.catalog_path / DERIVED_DIR_NAME
+        # Reason: Web requests run in a thread pool; two requests for the same
+        # timeframe must not rebuild the same directory concurrently
+        self._lock = threading.Lock()
+
+    def _bar_type_dir(self, bar_type: str) -> Path:
+        """Catalog directory for a full bar type string."""
+        return self.catalog_service.catalog_path / "data" / "bar" / urisafe_identifier(bar_type)
+
+    def _provenance_path(self, bar_type: str) -> Path:
+        """Provenance record path for a derived bar type."""
+        return self.provenance_dir / f"{urisafe_identifier(bar_type)}.json"
+
+    def load_provenance(self, bar_type: str) -> DerivedBarProvenance | None:
+        """
+        Read the provenance record of a derived bar type.
+
+        Args:
+            bar_type: Derived bar type string
+
+        Returns:
+            Provenance, or None if missing or unreadable
+        """
+        path = self._provenance_path(bar_type)
+        try:
+            return DerivedBarProvenance.model_validate_json(path.read_text())
+        except (OSError, ValidationError):
+            return None
+
+    def query(
+        self,
+        instrument_id: str,
+        bar_type_spec: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> BarArrays:
+        """
+        Load derived bars, building or rebuilding them from the source first if needed.
+
+        Args:
+            instrument_id: Instrument identifier (e.g., "AAPL.NASDAQ")
+            bar_type_spec: Spec to derive (e.g., "1-HOUR-LAST")
+            start: Optional inclusive start (UTC)
+            end: Optional inclusive end (UTC)
+
+        Returns:
+            Derived bars for the range
+
+        Raises:
+            DataNotFoundError: If no stored bar type can be aggregated into the
+                target, or the range holds no bars
+        """
+        source_spec = select_source_spec(
+            self.catalog_service.list_bar_specs(instrument_id), bar_type_spec
+        )
+        if source_spec is None:
+            now = datetime.now()
+            raise DataNotFoundError(instrument_id, start or now, end or now)
+
+        with self._lock:
+            self._ensure_current(instrument_id, bar_type_spec, source_spec)
+
+        return self.catalog_service.query_bar_arrays(
+            instrument_id,
+            bar_type_spec,
+            start,
+            end,
+            aggregation_source=DERIVED_AGGREGATION_SOURCE,
+        )
+
+    def _ensure_current(self, instrument_id: str, bar_type_spec: str, source_spec: str) -> None:
+        """Rebuild the derived bar type unless its provenance matches the source."""
+        target = derived_bar_type(instrument_id, bar_type_spec)
+        source_bar_type = f"{instrument_id}-{source_spec}-EXTERNAL"
+        fingerprint = source_fingerprint(self._bar_type_dir(source_bar_type))
+
+        provenance = self.load_provenance(target)
+        if (
+            provenance is not None
+            and provenance.source_bar_type == source_bar_type
+            and provenance.source_fingerprint == fingerprint
+            and self._bar_type_dir(target).exists()
+        ):
+            return
+
+        source = self.catalog_service.query_bar_arrays(instrument_id, source_spec)
+        derived = resample_bar_arrays(source, target)
+
+        self._remove(target)
+        self.catalog_service.catalog.write_data(derived.to_bars())
+
+        record = DerivedBarProvenance(
+            bar_type=target,
+            source_bar_type=source_bar_type,
+            source_fingerprint=fingerprint,
+            source_bar_count=len(source),
+            bar_count=len(derived),
+        )
+        self.provenance_dir.mkdir(parents=True, exist_ok=True)
+        path = self._provenance_path(target)
+        tmp_path = path.with_suffix(".json.tmp")
+        tmp_path.write_text(record.model_dump_json(indent=2))
+        os.replace(tmp_path, path)
+
+        logger.info(
+            "derived_bars_built",
+            bar_type=target,
+            source_bar_type=source_bar_type,
+            source_bar_count=len(source),
+            bar_count=len(derived),
+            rebuilt=provenance is not None,
+        )
+
+    def _remove(self, bar_type: str) -> None:
+        """Delete a derived bar type's data and provenance record."""
+        shutil.rmtree(self._bar_type_dir(bar_type), ignore_errors=True)
+        self._provenance_path(bar_type).unlink(missing_ok=True)
+
+    def invalidate(self, instrument_id: str) -> int:
+        """
+        Drop every derived bar type built from an instrument's bars.
+
+        Args:
+            instrument_id: Instrument whose source bars changed
+
+        Returns:
+            Number of derived bar types removed
+        """
+        if not self.provenance_dir.exists():
+            return 0
+
+        # Reason: Compare catalog-normalized IDs ("BTC/USD.KRAKEN" is stored as "BTCUSD.KRAKEN")
+        prefix = urisafe_identifier(f"{instrument_id}-")
+        removed = 0
+        with self._lock:
+            for path in self.provenance_dir.glob("*.json"):
+                try:
+                    record = DerivedBarProvenance.model_validate_json(path.read_text())
+                except (OSError, ValidationError):
+                    continue
+                if urisafe_identifier(record.source_bar_type).startswith(prefix):
+                    self._remove(record.bar_type)
+                    removed += 1
+
+        if removed:
+            logger.info("derived_bars_invalidated", instrument_id=instrument_id, count=removed)
+        return removed
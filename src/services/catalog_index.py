@@ -0,0 +1,343 @@
+"""
+Persistent availability index for the Parquet catalog.
+
+This module maintains an on-disk index of the bar data stored in the
+Nautilus ParquetDataCatalog so that availability can be determined without
+globbing, parsing and stat-ing every Parquet file on each startup.
+
+Index layout ({catalog_path}/.availability_index.json):
+    {
+        "version": 1,
+        "entries": {
+            "AAPL.NASDAQ-1-MINUTE-LAST-EXTERNAL": {BarTypeIndexEntry}
+        }
+    }
+
+Entries are validated against the bar type directory mtime and only
+directories that changed are rescanned.
+"""
+
+import json
+import os
+import re
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict
+
+import pyarrow.parquet as pq
+import structlog
+from pydantic import ValidationError
+
+from src.models.catalog_metadata import BarTypeIndexEntry, CatalogFileEntry
+
+logger = structlog.get_logger(__name__)
+
+INDEX_FILENAME = ".availability_index.json"
+INDEX_VERSION = 1
+
+# Reason: Nautilus file timestamp format, e.g. "2023-12-29T23-59-59-999999999Z"
+_FILE_TIMESTAMP_PATTERN = re.compile(r"^(\d{4}-\d{2}-\d{2})T(\d{2})-(\d{2})-(\d{2})-(\d{9})Z$")
+
+
+def parse_bar_type_dir(dir_name: str) -> tuple[str, str] | None:
+    """
+    Split a bar type directory name into instrument_id and bar_type_spec.
+
+    Args:
+        dir_name: Directory name (e.g., "AAPL.NASDAQ-1-MINUTE-LAST-EXTERNAL")
+
+    Returns:
+        Tuple of (instrument_id, bar_type_spec), or None if the name
+        is not an EXTERNAL bar type directory
+
+    Example:
+        >>> parse_bar_type_dir("AAPL.NASDAQ-1-MINUTE-LAST-EXTERNAL")
+        ('AAPL.NASDAQ', '1-MINUTE-LAST')
+    """
+    if not dir_name.endswith("-EXTERNAL"):
+        logger.debug("skipping_non_external_dir", dir_name=dir_name)
+        return None
+
+    # Reason: Format is {instrument_id}-{bar_type_spec}-EXTERNAL
+    # instrument_id contains ".", bar_type_spec contains hyphens
+    parts = dir_name[: -len("-EXTERNAL")].split("-")
+    if len(parts) < 4:  # Need at least SYMBOL.VENUE-N-PERIOD-PRICE
+        logger.warning("invalid_bar_type_dir_format", dir_name=dir_name)
+        return None
+
+    # Reason: instrument_id is everything up to the first part that looks like a number
+    split_idx = 0
+    for i, part in enumerate(parts):
+        if part.isdigit() or (i > 0 and "." in parts[i - 1]):
+            split_idx = i
+            break
+
+    if split_idx == 0:
+        logger.warning("could_not_parse_bar_type_dir", dir_name=dir_name)
+        return None
+
+    return "-".join(parts[:split_idx]), "-".join(parts[split_idx:])
+
+
+def file_timestamp_to_ns(value: str) -> int:
+    """
+    Convert a Nautilus catalog file timestamp to UNIX nanoseconds.
+
+    Args:
+        value: Timestamp in filename format ("YYYY-MM-DDTHH-MM-SS-NNNNNNNNNZ"),
+               or a bare "YYYY-MM-DD" date
+
+    Returns:
+        UNIX timestamp in nanoseconds
+
+    Raises:
+        ValueError: If the value cannot be parsed
+    """
+    match = _FILE_TIMESTAMP_PATTERN.match(value)
+    if match is None:
+        # Reason: Fallback to date only
+        dt = datetime.strptime(value, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+        return int(dt.timestamp()) * 1_000_000_000
+
+    date_part, hours, minutes, seconds, nanos = match.groups()
+    dt = datetime.strptime(f"{date_part}T{hours}:{minutes}:{seconds}", "%Y-%m-%dT%H:%M:%S").replace(
+        tzinfo=timezone.utc
+    )
+    return int(dt.timestamp()) * 1_000_000_000 + int(nanos)
+
+
+def ns_to_datetime(value: int) -> datetime:
+    """Convert UNIX nanoseconds to a UTC datetime (microsecond precision)."""
+    seconds, remainder = divmod(value, 1_000_000_000)
+    return datetime.fromtimestamp(seconds, tz=timezone.utc).replace(microsecond=remainder // 1_000)
+
+
+class CatalogIndex:
+    """
+    Persistent, incrementally maintained index of catalog bar data.
+
+    Attributes:
+        catalog_path: Catalog root directory
+        index_path: Location of the persisted index file
+        entries: Index entries keyed by bar type directory name
+    """
+
+    def __init__(self, catalog_path: Path) -> None:
+        """
+        Initialize CatalogIndex.
+
+        Args:
+            catalog_path: Catalog root directory
+        """
+        self.catalog_path = catalog_path
+        self.index_path = catalog_path / INDEX_FILENAME
+        self.entries: Dict[str, BarTypeIndexEntry] = {}
+
+    @property
+    def bar_data_path(self) -> Path:
+        """Directory holding one subdirectory per bar type."""
+        return self.catalog_path / "data" / "bar"
+
+    def load(self) -> None:
+        """
+        Load the persisted index from disk.
+
+        A missing, unreadable or outdated index is treated as empty, which
+        causes the next sync() to rescan every bar type directory.
+        """
+        self.entries = {}
+
+        if not self.index_path.exists():
+            return
+
+        try:
+            payload = json.loads(self.index_path.read_text())
+            if payload.get("version") != INDEX_VERSION:
+                logger.info(
+                    "availability_index_version_mismatch",
+                    found=payload.get("version"),
+                    expected=INDEX_VERSION,
+                )
+                return
+
+            self.entries = {
+                name: BarTypeIndexEntry.model_validate(raw)
+                for name, raw in payload.get("entries", {}).items()
+            }
+        except (OSError, ValueError, ValidationError) as e:
+            logger.warning(
+                "availability_index_load_failed",
+                path=str(self.index_path),
+                error=str(e),
+            )
+            self.entries = {}
+
+    def save(self) -> None:
+        """
+        Persist the index to disk atomically.
+
+        Failures are logged and ignored: the index is an optimization and the
+        catalog itself remains the source of truth.
+        """
+        payload = {
+            "version": INDEX_VERSION,
+            "entries": {name: entry.model_dump() for name, entry in self.entries.items()},
+        }
+        tmp_path = self.index_path.with_suffix(".tmp")
+
+        try:
+            self.catalog_path.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(payload))
+            # Reason: os.replace is atomic, readers never see a partial index
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            logger.warning(
+                "availability_index_save_failed",
+                path=str(self.index_path),
+                error=str(e),
+            )
+
+    def sync(self) -> bool:
+        """
+        Validate all entries against the catalog and rescan changed directories.
+
+        Only the bar data directory listing and one stat() per bar type
+        directory are needed when nothing changed.
+
+        Returns:
+            True if any entry was added, updated or removed
+        """
+        if not self.bar_data_path.exists():
+            logger.warning("bar_data_path_not_found", path=str(self.bar_data_path))
+            changed = bool(self.entries)
+            self.entries = {}
+            return changed
+
+        changed = False
+        seen: set[str] = set()
+
+        for bar_type_dir in self.bar_data_path.iterdir():
+            if not bar_type_dir.is_dir():
+                continue
+
+            dir_name = bar_type_dir.name
+            seen.add(dir_name)
+
+            entry = self.entries.get(dir_name)
+            if entry is not None and entry.dir_mtime_ns == bar_type_dir.stat().st_mtime_ns:
+                continue
+
+            if self.refresh(dir_name) is not None or entry is not None:
+                changed = True
+
+        # Reason: Drop entries for directories that were removed
+        for dir_name in set(self.entries) - seen:
+            del self.entries[dir_name]
+            changed = True
+
+        return changed
+
+    def refresh(self, dir_name: str) -> BarTypeIndexEntry | None:
+        """
+        Rescan a single bar type directory and update its entry.
+
+        Files whose size and mtime are unchanged reuse their previous entry,
+        so only new or rewritten files have their footers read.
+
+        Args:
+            dir_name: Bar type directory name
+
+        Returns:
+            The updated entry, or None if the directory has no usable data
+        """
+        bar_type_dir = self.bar_data_path / dir_name
+        previous = self.entries.pop(dir_name, None)
+
+        if not bar_type_dir.is_dir():
+            return None
+
+        parsed = parse_bar_type_dir(dir_name)
+        if parsed is None:
+            return None
+
+        instrument_id, bar_type_spec = parsed
+        dir_mtime_ns = bar_type_dir.stat().st_mtime_ns
+
+        known_files = {f.filename: f for f in previous.files} if previous else {}
+        files: list[CatalogFileEntry] = []
+
+        for file in bar_type_dir.glob("*.parquet"):
+            try:
+                stat = file.stat()
+                known = known_files.get(file.name)
+                if (
+                    known is not None
+                    and known.size_bytes == stat.st_size
+                    and known.mtime_ns == stat.st_mtime_ns
+                ):
+                    files.append(known)
+                    continue
+
+                files.append(self._index_file(file, stat))
+
+            except (ValueError, OSError) as e:
+                logger.warning(
+                    "failed_to_parse_catalog_file",
+                    file=str(file),
+                    error=str(e),
+                )
+                continue
+
+        if not files:
+            return None
+
+        files.sort(key=lambda f: (f.start_ns, f.end_ns))
+        entry = BarTypeIndexEntry(
+            dir_name=dir_name,
+            instrument_id=instrument_id,
+            bar_type_spec=bar_type_spec,
+            dir_mtime_ns=dir_mtime_ns,
+            files=files,
+        )
+        self.entries[dir_name] = entry
+
+        logger.debug(
+            "availability_index_entry_refreshed",
+            dir_name=dir_name,
+            file_count=len(files),
+            reused_files=len(known_files.keys() & {f.filename for f in files}),
+        )
+
+        return entry
+
+    @staticmethod
+    def _index_file(file: Path, stat: os.stat_result) -> CatalogFileEntry:
+        """
+        Build an index entry for a Parquet file.
+
+        Raises:
+            ValueError: If the filename does not encode a timestamp range
+        """
+        start_str, end_str = file.stem.split("_")
+        start_ns = file_timestamp_to_ns(start_str)
+        end_ns = file_timestamp_to_ns(end_str)
+
+        try:
+            # Reason: Only the footer is read, not the row data
+            row_count = pq.read_metadata(file).num_rows
+        except Exception as e:
+            logger.warning(
+                "failed_to_read_parquet_footer",
+                file=str(file),
+                error=str(e),
+            )
+            row_count = stat.st_size // 128  # ~128 bytes/row
+
+        return CatalogFileEntry(
+            filename=file.name,
+            start_ns=start_ns,
+            end_ns=end_ns,
+            row_count=row_count,
+            size_bytes=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+        )
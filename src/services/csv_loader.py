@@ -1,14 +1,13 @@
 """CSV data loading service for Parquet catalog."""
 
 from datetime import datetime, timezone
-from decimal import Decimal
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List
 
+import numpy as np
 import pandas as pd
 import structlog
 from nautilus_trader.model.data import Bar, BarType
-from nautilus_trader.model.objects import Price, Quantity
 
 from src.services.data_catalog import DataCatalogService
 
@@ -31,6 +30,52 @@ class ValidationError(Exception):
         super().__init__(f"Row {row_number}: {message}")
 
 
+MAX_PRICE_PRECISION = 9
+
+
+def _decimal_places(values: np.ndarray) -> int:
+    """Smallest number of decimal places that represents every value."""
+    for precision in range(MAX_PRICE_PRECISION):
+        scaled = values * 10**precision
+        # Reason: Tolerate float representation error only (not real decimals)
+        if np.all(np.abs(scaled - np.round(scaled)) <= 1e-9 + np.abs(scaled) * 1e-12):
+            return precision
+    return MAX_PRICE_PRECISION
+
+
+def _file_price_precision(file_path: Path, chunk_size: int) -> int:
+    """
+    Price precision of a whole CSV file, read in chunks of price columns only.
+
+    Unparsable values are ignored here; they are reported when the rows are
+    converted.
+    """
+    precision = 0
+    price_columns = ["open", "high", "low", "close"]
+    for df in pd.read_csv(
+        file_path,
+        chunksize=chunk_size,
+        usecols=lambda column: column in price_columns,
+    ):
+        for field in df.columns:
+            values = pd.to_numeric(df[field], errors="coerce").to_numpy(dtype=np.float64)
+            values = values[np.isfinite(values)]
+            if len(values):
+                precision = max(precision, _decimal_places(values))
+    return precision
+
+
+def _invalid_values_message(df: pd.DataFrame, position: int) -> str:
+    """Describe the unparsable OHLCV values of one row."""
+    row = df.iloc[position]
+    bad = [
+        f"{field}={row[field]!r}"
+        for field in ("open", "high", "low", "close", "volume")
+        if not np.isfinite(pd.to_numeric(row[field], errors="coerce"))
+    ]
+    return f"Invalid OHLCV data: {', '.join(bad)}"
+
+
 class CSVLoader:
     """
     Service for loading CSV market data directly to Parquet catalog.
@@ -77,6 +122,7 @@ class CSVLoader:
         symbol: str,
         venue: str,
         bar_type_spec: str = "1-MINUTE-LAST",
+        chunk_size: int | None = None,
     ) -> Dict[str, Any]:
         """
         Load CSV file and write to Parquet catalog.
@@ -86,6 +132,10 @@ class CSVLoader:
             symbol: Trading symbol (e.g., "AAPL")
             venue: Venue/exchange (e.g., "NASDAQ")
             bar_type_spec: Bar type specification (e.g., "1-MINUTE-LAST")
+            chunk_size: Rows read, converted and written per chunk. If None,
+                        the whole file is read at once. Chunking keeps memory
+                        bounded for files larger than RAM; the price columns
+                        are then read once beforehand to fix the precision.
 
         Returns:
             Dictionary with import results:
@@ -108,23 +158,71 @@ class CSVLoader:
         if not file_path.exists():
             raise FileNotFoundError(f"CSV file not found: {file_path}")
 
-        logger.info("csv_import_started", file=str(file_path), symbol=symbol)
+        logger.info("csv_import_started", file=str(file_path), symbol=symbol, chunk_size=chunk_size)
 
-        # Read CSV with pandas
-        df = pd.read_csv(file_path)
+        instrument_id = f"{symbol}.{venue}"
+        rows_processed = 0
+        bars_created = 0
+        written_count = 0
+        conflicts_skipped = 0
+        validation_errors: List[str] = []
+        price_precision: int | None = None
+        start_ts: int | None = None
+        end_ts: int | None = None
 
-        # Validate columns
-        self._validate_columns(df)
+        # Reason: Read in chunks (or as one frame) so memory is bounded by chunk size
+        if chunk_size is None:
+            chunks: Iterable[pd.DataFrame] = [pd.read_csv(file_path)]
+        else:
+            # Reason: One precision per file, or chunks of one bar type would be
+            # written at different precisions
+            price_precision = _file_price_precision(file_path, chunk_size)
+            chunks = pd.read_csv(file_path, chunksize=chunk_size)
+
+        for df in chunks:
+            # Validate columns
+            self._validate_columns(df)
+
+            # Validate and convert to Nautilus Bar objects
+            bars, errors = await self._convert_to_bars(
+                df,
+                symbol,
+                venue,
+                bar_type_spec,
+                first_row=rows_processed + 2,  # +2 because: 0-indexed + 1 header row
+                price_precision=price_precision,
+            )
+            rows_processed += len(df)
+            validation_errors.extend(errors)
+            if not bars:
+                continue
 
-        # Validate and convert to Nautilus Bar objects
-        bars, validation_errors = await self._convert_to_bars(df, symbol, venue, bar_type_spec)
+            bars_created += len(bars)
+            chunk_start = min(bar.ts_event for bar in bars)
+            chunk_end = max(bar.ts_event for bar in bars)
+            start_ts = chunk_start if start_ts is None else min(start_ts, chunk_start)
+            end_ts = chunk_end if end_ts is None else max(end_ts, chunk_end)
+
+            # Handle conflicts if needed
+            bars_to_write, skipped = await self._handle_conflicts(
+                bars, instrument_id, bar_type_spec, first_chunk=written_count == 0
+            )
+            conflicts_skipped += skipped
 
-        if not bars:
+            # Write bars to catalog
+            if bars_to_write:
+                self.catalog_service.write_bars(
+                    bars_to_write,
+                    correlation_id=f"csv-import-{symbol}",
+                )
+                written_count += len(bars_to_write)
+
+        if not bars_created:
             return {
                 "file": str(file_path),
-                "instrument_id": f"{symbol}.{venue}",
+                "instrument_id": instrument_id,
                 "bar_type_spec": bar_type_spec,
-                "rows_processed": len(df),
+                "rows_processed": rows_processed,
                 "bars_written": 0,
                 "conflicts_skipped": 0,
                 "validation_errors": validation_errors,
@@ -132,20 +230,6 @@ class CSVLoader:
                 "file_size_kb": 0,
             }
 
-        # Handle conflicts if needed
-        bars_to_write, conflicts_skipped = await self._handle_conflicts(
-            bars, f"{symbol}.{venue}", bar_type_spec
-        )
-
-        # Write bars to catalog
-        written_count = 0
-        if bars_to_write:
-            self.catalog_service.write_bars(
-                bars_to_write,
-                correlation_id=f"csv-import-{symbol}",
-            )
-            written_count = len(bars_to_write)
-
         # Calculate file size
         files = list(
             (
@@ -158,21 +242,16 @@ class CSVLoader:
         total_size_kb = sum(f.stat().st_size for f in files) / 1024 if files else 0
 
         # Get date range
-        date_range = "N/A"
-        if bars:
-            start_ts = min(bar.ts_event for bar in bars)
-            end_ts = max(bar.ts_event for bar in bars)
-            start_dt = datetime.fromtimestamp(start_ts / 1e9, tz=timezone.utc)
-            end_dt = datetime.fromtimestamp(end_ts / 1e9, tz=timezone.utc)
-            date_range = (
-                f"{start_dt.strftime('%Y-%m-%d %H:%M')} to {end_dt.strftime('%Y-%m-%d %H:%M')}"
-            )
+        assert start_ts is not None and end_ts is not None
+        start_dt = datetime.fromtimestamp(start_ts / 1e9, tz=timezone.utc)
+        end_dt = datetime.fromtimestamp(end_ts / 1e9, tz=timezone.utc)
+        date_range = f"{start_dt.strftime('%Y-%m-%d %H:%M')} to {end_dt.strftime('%Y-%m-%d %H:%M')}"
 
         result = {
             "file": str(file_path),
-            "instrument_id": f"{symbol}.{venue}",
+            "instrument_id": instrument_id,
             "bar_type_spec": bar_type_spec,
-            "rows_processed": len(df),
+            "rows_processed": rows_processed,
             "bars_written": written_count,
             "conflicts_skipped": conflicts_skipped,
             "validation_errors": validation_errors,
@@ -209,65 +288,66 @@ class CSVLoader:
         symbol: str,
         venue: str,
         bar_type_spec: str,
+        first_row: int = 2,
+        price_precision: int | None = None,
     ) -> tuple[List[Bar], List[str]]:
         """
         Convert CSV DataFrame to Nautilus Bar objects with validation.
 
+        Timestamps and OHLCV constraints are validated column-wise and bars
+        are built in one bulk call, instead of row by row.
+
         Args:
             df: Source DataFrame
             symbol: Trading symbol
             venue: Venue/exchange
             bar_type_spec: Bar type specification
+            first_row: CSV line number of the first DataFrame row (for errors)
+            price_precision: Minimum price precision (e.g., of the whole file)
 
         Returns:
             Tuple of (bars, validation_errors)
         """
-        bars: List[Bar] = []
-        validation_errors: List[str] = []
-
-        # Reason: Create bar_type once for all rows
-        instrument_id_str = f"{symbol}.{venue}"
-        # Reason: CSV data is external, append -EXTERNAL aggregation source
-        bar_type = BarType.from_str(f"{instrument_id_str}-{bar_type_spec}-EXTERNAL")
+        row_numbers = np.arange(first_row, first_row + len(df))
 
-        for row_idx, (_idx, row) in enumerate(df.iterrows()):
-            row_num = row_idx + 2  # +2 because: 0-indexed + 1 header row
+        # Reason: Validate and parse timestamps
+        ts_nanos, ts_errors = self._parse_timestamps(df["timestamp"], row_numbers)
 
-            try:
-                # Reason: Validate and parse timestamp
-                timestamp = self._parse_timestamp(row["timestamp"], row_num)
+        # Reason: Validate OHLCV data (rows with bad timestamps are reported once)
+        columns, ohlcv_errors = self._validate_ohlcv(df, row_numbers, skip=ts_errors)
 
-                # Reason: Validate OHLCV data
-                open_price, high_price, low_price, close_price, volume = self._validate_ohlcv(
-                    row, row_num
-                )
+        errors = {**ts_errors, **ohlcv_errors}
+        valid = np.ones(len(df), dtype=bool)
+        valid[[int(row - first_row) for row in errors]] = False
+        validation_errors = [errors[row] for row in sorted(errors)]
 
-                # Reason: Create Nautilus Bar object
-                # ts_event and ts_init are the same for historical data
-                ts_nanos = int(timestamp.timestamp() * 1e9)
-
-                bar = Bar(
-                    bar_type=bar_type,
-                    open=open_price,
-                    high=high_price,
-                    low=low_price,
-                    close=close_price,
-                    volume=volume,
-                    ts_event=ts_nanos,
-                    ts_init=ts_nanos,
-                )
+        bars: List[Bar] = []
+        if valid.any():
+            prices = {field: columns[field][valid] for field in ("open", "high", "low", "close")}
 
-                bars.append(bar)
+            # Reason: Determine price precision once for all rows
+            precision = max(
+                price_precision or 0,
+                max(_decimal_places(values) for values in prices.values()),
+            )
 
-            except ValidationError as e:
-                validation_errors.append(str(e))
-                logger.debug("row_validation_failed", row=row_num, error=str(e))
-                continue
-            except Exception as e:
-                error_msg = f"Row {row_num}: Unexpected error - {str(e)}"
-                validation_errors.append(error_msg)
-                logger.debug("row_conversion_failed", row=row_num, error=str(e))
-                continue
+            # Reason: CSV data is external, append -EXTERNAL aggregation source
+            bar_type = BarType.from_str(f"{symbol}.{venue}-{bar_type_spec}-EXTERNAL")
+
+            # Reason: ts_event and ts_init are the same for historical data
+            ts = ts_nanos[valid]
+            bars = Bar.from_raw_arrays_to_list(
+                bar_type,
+                precision,
+                0,
+                prices["open"],
+                prices["high"],
+                prices["low"],
+                prices["close"],
+                columns["volume"][valid],
+                ts,
+                ts,
+            )
 
         logger.info(
             "conversion_completed",
@@ -278,6 +358,39 @@ class CSVLoader:
 
         return bars, validation_errors
 
+    def _parse_timestamps(
+        self, values: pd.Series, row_numbers: np.ndarray
+    ) -> tuple[np.ndarray, Dict[int, str]]:
+        """
+        Parse a timestamp column to UTC nanoseconds.
+
+        Args:
+            values: Timestamp column from CSV
+            row_numbers: CSV line number of each value
+
+        Returns:
+            Tuple of (nanosecond timestamps as uint64, errors by row number)
+        """
+        # Reason: Naive timestamps are assumed UTC, aware ones converted to UTC
+        parsed = pd.to_datetime(values, errors="coerce", utc=True)
+        nanos = np.zeros(len(values), dtype=np.uint64)
+        errors: Dict[int, str] = {}
+
+        ok = parsed.notna().to_numpy()
+        nanos[ok] = parsed[ok].astype("int64").to_numpy().astype(np.uint64)
+
+        # Reason: Column-wise parsing infers one format; re-parse the (rare)
+        # leftover values individually so mixed formats are still accepted
+        for position in np.flatnonzero(~ok):
+            row_num = int(row_numbers[position])
+            try:
+                timestamp = self._parse_timestamp(values.iloc[position], row_num)
+                nanos[position] = pd.Timestamp(timestamp).value
+            except ValidationError as e:
+                errors[row_num] = str(e)
+
+        return nanos, errors
+
     def _parse_timestamp(self, timestamp_value: Any, row_num: int) -> datetime:
         """
         Parse and validate timestamp.
@@ -294,6 +407,8 @@ class CSVLoader:
         """
         try:
             timestamp = pd.to_datetime(timestamp_value)
+            if pd.isna(timestamp):
+                raise ValueError("missing value")
 
             # Reason: Ensure timezone-aware (assume UTC if naive)
             if timestamp.tz is None:
@@ -307,89 +422,72 @@ class CSVLoader:
             raise ValidationError(row_num, f"Invalid timestamp format: {timestamp_value} ({e})")
 
     def _validate_ohlcv(
-        self, row: pd.Series, row_num: int
-    ) -> tuple[Price, Price, Price, Price, Quantity]:
+        self,
+        df: pd.DataFrame,
+        row_numbers: np.ndarray,
+        skip: Dict[int, str] | None = None,
+    ) -> tuple[Dict[str, np.ndarray], Dict[int, str]]:
         """
-        Validate OHLCV data constraints.
+        Validate OHLCV data constraints column-wise.
 
         Args:
-            row: DataFrame row
-            row_num: Row number for error reporting
+            df: DataFrame with open, high, low, close and volume columns
+            row_numbers: CSV line number of each row
+            skip: Rows already rejected (not reported again)
 
         Returns:
-            Tuple of (open, high, low, close, volume) as Nautilus types
-
-        Raises:
-            ValidationError: If OHLCV constraints are violated
+            Tuple of (float64 columns by field, errors by row number). Each
+            invalid row is reported once, with its first violated constraint.
         """
-        try:
-            # Reason: Parse values as Decimal for precision
-            open_val = Decimal(str(row["open"]))
-            high_val = Decimal(str(row["high"]))
-            low_val = Decimal(str(row["low"]))
-            close_val = Decimal(str(row["close"]))
-            volume_val = int(row["volume"])
-
-            # Reason: Validate price constraints
-            if open_val <= 0:
-                raise ValidationError(row_num, f"open must be > 0, got {open_val}")
-            if high_val <= 0:
-                raise ValidationError(row_num, f"high must be > 0, got {high_val}")
-            if low_val <= 0:
-                raise ValidationError(row_num, f"low must be > 0, got {low_val}")
-            if close_val <= 0:
-                raise ValidationError(row_num, f"close must be > 0, got {close_val}")
-
-            # Reason: Validate OHLC relationships
-            if high_val < low_val:
-                raise ValidationError(row_num, f"high ({high_val}) must be >= low ({low_val})")
-            if high_val < open_val:
-                raise ValidationError(row_num, f"high ({high_val}) must be >= open ({open_val})")
-            if high_val < close_val:
-                raise ValidationError(row_num, f"high ({high_val}) must be >= close ({close_val})")
-            if low_val > open_val:
-                raise ValidationError(row_num, f"low ({low_val}) must be <= open ({open_val})")
-            if low_val > close_val:
-                raise ValidationError(row_num, f"low ({low_val}) must be <= close ({close_val})")
-
-            # Reason: Validate volume
-            if volume_val < 0:
-                raise ValidationError(row_num, f"volume must be >= 0, got {volume_val}")
-
-            # Reason: Determine price precision (number of decimal places)
-            # Use max precision from all price fields
-            # Handle special Decimal exponent values (n, N, F for NaN, Infinity)
-            def get_precision(decimal_val: Decimal) -> int:
-                exp = decimal_val.as_tuple().exponent
-                return abs(exp) if isinstance(exp, int) else 0
-
-            precisions = [
-                get_precision(open_val),
-                get_precision(high_val),
-                get_precision(low_val),
-                get_precision(close_val),
-            ]
-            price_precision = max(precisions)
-
-            # Reason: Create Nautilus Price and Quantity objects
-            open_price = Price(float(open_val), precision=price_precision)
-            high_price = Price(float(high_val), precision=price_precision)
-            low_price = Price(float(low_val), precision=price_precision)
-            close_price = Price(float(close_val), precision=price_precision)
-            volume = Quantity(float(volume_val), precision=0)
-
-            return open_price, high_price, low_price, close_price, volume
-
-        except ValidationError:
-            raise
-        except (ValueError, TypeError, ArithmeticError) as e:
-            raise ValidationError(row_num, f"Invalid OHLCV data: {e}")
+        columns = {
+            field: pd.to_numeric(df[field], errors="coerce").to_numpy(dtype=np.float64)
+            for field in ("open", "high", "low", "close", "volume")
+        }
+        # Reason: Volume is a whole number of units (truncated like int())
+        columns["volume"] = np.trunc(columns["volume"])
+
+        o, h, lo, c, v = (columns[f] for f in ("open", "high", "low", "close", "volume"))
+        unparsable = np.logical_or.reduce([~np.isfinite(values) for values in columns.values()])
+
+        # Reason: Checks in reporting order; NaN comparisons are False, so
+        # unparsable rows only trip the first check
+        checks = [
+            (unparsable, lambda i: _invalid_values_message(df, i)),
+            (o <= 0, lambda i: f"open must be > 0, got {o[i]}"),
+            (h <= 0, lambda i: f"high must be > 0, got {h[i]}"),
+            (lo <= 0, lambda i: f"low must be > 0, got {lo[i]}"),
+            (c <= 0, lambda i: f"close must be > 0, got {c[i]}"),
+            (h < lo, lambda i: f"high ({h[i]}) must be >= low ({lo[i]})"),
+            (h < o, lambda i: f"high ({h[i]}) must be >= open ({o[i]})"),
+            (h < c, lambda i: f"high ({h[i]}) must be >= close ({c[i]})"),
+            (lo > o, lambda i: f"low ({lo[i]}) must be <= open ({o[i]})"),
+            (lo > c, lambda i: f"low ({lo[i]}) must be <= close ({c[i]})"),
+            (v < 0, lambda i: f"volume must be >= 0, got {v[i]:.0f}"),
+        ]
+
+        errors: Dict[int, str] = {}
+        reported = np.zeros(len(df), dtype=bool)
+        if skip:
+            reported[np.isin(row_numbers, list(skip))] = True
+
+        for failed, message in checks:
+            new = failed & ~reported
+            for position in np.flatnonzero(new):
+                row_num = int(row_numbers[position])
+                errors[row_num] = str(ValidationError(row_num, message(position)))
+            reported |= new
+
+        if errors:
+            logger.debug("rows_validation_failed", count=len(errors))
+
+        return columns, errors
 
     async def _handle_conflicts(
         self,
         bars: List[Bar],
         instrument_id: str,
         bar_type_spec: str,
+        first_chunk: bool = True,
     ) -> tuple[List[Bar], int]:
         """
         Handle conflicts based on conflict_mode.
@@ -398,14 +496,16 @@ class CSVLoader:
             bars: Bars to write
             instrument_id: Instrument ID
             bar_type_spec: Bar type specification
+            first_chunk: False once earlier chunks of the same file were written
 
         Returns:
             Tuple of (bars_to_write, conflicts_skipped)
         """
         if self.conflict_mode == "skip":
-            # Reason: Skip if any data exists
+            # Reason: Skip if any data existed before this import (data
+            # written by earlier chunks of the same file is not a conflict)
             availability = self.catalog_service.get_availability(instrument_id, bar_type_spec)
-            if availability:
+            if availability and first_chunk:
                 logger.info(
                     "skipping_existing_data",
                     instrument_id=instrument_id,
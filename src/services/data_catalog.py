@@ -6,21 +6,36 @@ the Nautilus Trader ParquetDataCatalog, including availability checking,
 data queries, and write operations with structured logging.
 """
 
+import hashlib
+import json
 import os
-import re
-from datetime import datetime, timezone
+import threading
+from datetime import datetime
 from pathlib import Path
 from typing import Dict, List
 
+import pyarrow as pa
+import pyarrow.parquet as pq
 import structlog
 from dotenv import load_dotenv
 from nautilus_trader.model.data import Bar
 from nautilus_trader.persistence.catalog import ParquetDataCatalog
+from nautilus_trader.persistence.funcs import urisafe_identifier
 
 # Load environment variables from .env file
 load_dotenv()
 
-from src.models.catalog_metadata import CatalogAvailability  # noqa: E402
+from src.models.catalog_metadata import (  # noqa: E402
+    BarTypeIndexEntry,
+    CatalogAvailability,
+    bar_spec_interval,
+)
+from src.services.bar_aggregation import DerivedBarCache  # noqa: E402
+from src.services.catalog_index import (  # noqa: E402
+    CatalogIndex,
+    file_timestamp_to_ns,
+    ns_to_datetime,
+)
 from src.services.exceptions import (  # noqa: E402
     CatalogCorruptionError,
     CatalogError,
@@ -30,7 +45,9 @@ from src.services.exceptions import (  # noqa: E402
     KrakenRateLimitError,  # noqa: F401
 )
 from src.services.ibkr_client import IBKRHistoricalClient  # noqa: E402
+from src.services.ibkr_download import IBKRDownloader, plan_download_chunks  # noqa: E402
 from src.services.kraken_client import KrakenHistoricalClient  # noqa: E402
+from src.services.shared_bars import BarArrays  # noqa: E402
 
 logger = structlog.get_logger(__name__)
 
@@ -82,6 +99,14 @@ class DataCatalogService:
         # Reason: In-memory cache for fast availability checks
         self.availability_cache: Dict[str, CatalogAvailability] = {}
 
+        # Reason: Persisted index avoids rescanning unchanged bar type directories
+        self._index = CatalogIndex(self.catalog_path)
+        self._index_loaded = False
+
+        # Reason: Service may be shared across request threads (web app), so
+        # index updates and cache swaps are serialized
+        self._cache_lock = threading.RLock()
+
         # Reason: Store provided IBKR client or None for lazy initialization
         # This avoids creating connections during backtests when data is already in catalog
         self._ibkr_client = ibkr_client
@@ -91,6 +116,9 @@ class DataCatalogService:
         self._kraken_client = kraken_client
         self._kraken_client_initialized = kraken_client is not None
 
+        # Reason: Derived timeframe cache is created lazily on first use
+        self._derived_bars: DerivedBarCache | None = None
+
         logger.info(
             "data_catalog_initialized",
             catalog_path=str(self.catalog_path),
@@ -170,6 +198,7 @@ class DataCatalogService:
                 rate_limit=settings.kraken_rate_limit,
                 default_maker_fee=settings.kraken_default_maker_fee,
                 default_taker_fee=settings.kraken_default_taker_fee,
+                max_concurrency=settings.kraken_fetch_concurrency,
             )
             self._kraken_client_initialized = True
 
@@ -183,177 +212,130 @@ class DataCatalogService:
 
     def _rebuild_availability_cache(self) -> None:
         """
-        Rebuild the in-memory availability cache by scanning catalog.
+        Rebuild the in-memory availability cache from the persisted catalog index.
 
-        This method scans the Nautilus Parquet catalog directory structure to build
-        metadata about available instruments, bar types, and date ranges.
-        Called automatically on service initialization.
+        The on-disk index is loaded once, validated against bar type directory
+        mtimes, and only directories that changed since it was written are
+        rescanned. Called automatically on service initialization.
 
         Nautilus catalog structure:
         {catalog_path}/data/bar/{instrument_id}-{bar_type_spec}-EXTERNAL/TIMESTAMP_TIMESTAMP.parquet
         """
         logger.info("rebuilding_availability_cache")
 
-        # Reason: Clear existing cache before rebuild
-        self.availability_cache.clear()
+        with self._cache_lock:
+            if not self._index_loaded:
+                self._index.load()
+                self._index_loaded = True
 
-        # Reason: Nautilus stores bar data in catalog_path/data/bar/
-        bar_data_path = self.catalog_path / "data" / "bar"
-        if not bar_data_path.exists():
-            logger.warning(
-                "bar_data_path_not_found",
-                path=str(bar_data_path),
-            )
-            return
+            if self._index.sync():
+                self._index.save()
 
-        # Reason: Iterate through bar type directories
-        # Directory format: {instrument_id}-{bar_type_spec}-EXTERNAL
-        for bar_type_dir in bar_data_path.iterdir():
-            if not bar_type_dir.is_dir():
-                continue
+            # Reason: Build a new dict and swap it in so concurrent readers
+            # never observe a partially rebuilt cache
+            new_cache: Dict[str, CatalogAvailability] = {}
+            for entry in self._index.entries.values():
+                cache_key, availability = self._availability_from_entry(entry)
+                new_cache[cache_key] = availability
+            self.availability_cache = new_cache
 
-            # Reason: Parse directory name to extract instrument_id and bar_type_spec
-            # Example: "AAPL.NASDAQ-1-MINUTE-LAST-EXTERNAL"
-            dir_name = bar_type_dir.name
-            if not dir_name.endswith("-EXTERNAL"):
-                logger.debug("skipping_non_external_dir", dir_name=dir_name)
-                continue
+        logger.info(
+            "availability_cache_rebuilt",
+            total_entries=len(self.availability_cache),
+        )
 
-            # Reason: Remove "-EXTERNAL" suffix
-            name_without_external = dir_name[:-9]  # Remove "-EXTERNAL"
+    def refresh_availability(self, force: bool = False) -> bool:
+        """
+        Re-validate the availability cache against the catalog on disk.
 
-            # Reason: Split into instrument_id and bar_type_spec
-            # Format: {instrument_id}-{bar_type_spec}
-            # instrument_id contains ".", bar_type_spec contains hyphens
-            # Example: "AAPL.NASDAQ-1-MINUTE-LAST" -> "AAPL.NASDAQ" + "1-MINUTE-LAST"
-            parts = name_without_external.split("-")
-            if len(parts) < 4:  # Need at least SYMBOL.VENUE-N-PERIOD-PRICE
-                logger.warning(
-                    "invalid_bar_type_dir_format",
-                    dir_name=dir_name,
-                )
-                continue
+        Cheap when nothing changed (one stat() per bar type directory), so it
+        can be polled periodically by long-lived processes such as the web app.
 
-            # Reason: Find the split point between instrument_id and bar_type_spec
-            # instrument_id is everything up to the first part that looks like a number
-            split_idx = 0
-            for i, part in enumerate(parts):
-                if part.isdigit() or (i > 0 and "." in parts[i - 1]):
-                    # Found the bar type spec start (number like "1" in "1-MINUTE-LAST")
-                    split_idx = i
-                    break
+        Args:
+            force: Discard the index and rescan every bar type directory
 
-            if split_idx == 0:
-                logger.warning(
-                    "could_not_parse_bar_type_dir",
-                    dir_name=dir_name,
-                )
-                continue
+        Returns:
+            True if the cache changed (always True when forced)
 
-            instrument_id = "-".join(parts[:split_idx])
-            bar_type_spec = "-".join(parts[split_idx:])
+        Example:
+            >>> service = DataCatalogService()
+            >>> if service.refresh_availability():
+            ...     print("Catalog changed on disk")
+        """
+        with self._cache_lock:
+            if force:
+                self._index.entries = {}
+                self._index_loaded = True
 
-            # Reason: Find all Parquet files
-            parquet_files = list(bar_type_dir.glob("*.parquet"))
-            if not parquet_files:
-                continue
+            changed = self._index.sync() or force
+            if changed:
+                self._index.save()
+                self._rebuild_availability_cache()
 
-            # Reason: Extract timestamps from filenames
-            # Format: YYYY-MM-DDTHH-MM-SS-NNNNNNNNNZ_YYYY-MM-DDTHH-MM-SS-NNNNNNNNNZ.parquet
-            start_timestamps = []
-            end_timestamps = []
-            total_rows = 0
-
-            for file in parquet_files:
-                try:
-                    # Reason: Parse timestamp range from filename
-                    filename = file.stem  # Remove .parquet extension
-                    start_str, end_str = filename.split("_")
-
-                    # Reason: Parse ISO8601-like timestamp from Nautilus format
-                    # Convert "2023-12-29T20-01-00-000000000Z" or
-                    # "2023-12-29T23-59-59-999999999Z" to datetime
-                    # Remove nanoseconds (any 9-digit number) and Z suffix using regex
-                    start_clean = re.sub(r"-\d{9}Z$", "", start_str)
-                    end_clean = re.sub(r"-\d{9}Z$", "", end_str)
-
-                    # Replace hyphens in time part with colons
-                    # Format is "YYYY-MM-DDTHH-MM-SS"
-                    # We need to keep first two hyphens (date), replace next two (time)
-                    parts_start = start_clean.split("T")
-                    if len(parts_start) == 2:
-                        date_part = parts_start[0]
-                        time_part = parts_start[1].replace("-", ":")
-                        start_datetime = datetime.strptime(
-                            f"{date_part}T{time_part}", "%Y-%m-%dT%H:%M:%S"
-                        ).replace(tzinfo=timezone.utc)
-                    else:
-                        # Fallback to date only
-                        start_datetime = datetime.strptime(parts_start[0], "%Y-%m-%d").replace(
-                            tzinfo=timezone.utc
-                        )
-
-                    parts_end = end_clean.split("T")
-                    if len(parts_end) == 2:
-                        date_part = parts_end[0]
-                        time_part = parts_end[1].replace("-", ":")
-                        end_datetime = datetime.strptime(
-                            f"{date_part}T{time_part}", "%Y-%m-%dT%H:%M:%S"
-                        ).replace(tzinfo=timezone.utc)
-                    else:
-                        # Fallback to date only
-                        end_datetime = datetime.strptime(parts_end[0], "%Y-%m-%d").replace(
-                            tzinfo=timezone.utc
-                        )
-
-                    start_timestamps.append(start_datetime)
-                    end_timestamps.append(end_datetime)
-
-                    # Reason: Estimate row count from file size
-                    file_size = file.stat().st_size
-                    estimated_rows = file_size // 128  # ~128 bytes/row
-                    total_rows += estimated_rows
-
-                except (ValueError, OSError) as e:
-                    logger.warning(
-                        "failed_to_parse_catalog_file",
-                        file=str(file),
-                        error=str(e),
-                    )
-                    continue
+        logger.info("availability_refresh_checked", changed=changed, forced=force)
+        return changed
 
-            if not start_timestamps or not end_timestamps:
-                continue
+    def _refresh_availability(self, bar_type_dir_name: str) -> None:
+        """
+        Incrementally refresh availability for a single bar type directory.
 
-            # Reason: Create availability metadata with full timestamp range
-            # Normalize instrument_id for consistent cache keys
-            cache_key = f"{self._catalog_instrument_id(instrument_id)}_{bar_type_spec}"
-            availability = CatalogAvailability(
-                instrument_id=instrument_id,
-                bar_type_spec=bar_type_spec,
-                start_date=min(start_timestamps),
-                end_date=max(end_timestamps),
-                file_count=len(parquet_files),
-                total_rows=total_rows,
-                last_updated=datetime.now(),
-            )
+        Args:
+            bar_type_dir_name: Directory name (e.g., "AAPL.NASDAQ-1-MINUTE-LAST-EXTERNAL")
+        """
+        with self._cache_lock:
+            previous = self._index.entries.get(bar_type_dir_name)
+            entry = self._index.refresh(bar_type_dir_name)
+            self._index.save()
+
+            if entry is not None:
+                cache_key, availability = self._availability_from_entry(entry)
+                self.availability_cache[cache_key] = availability
+            elif previous is not None:
+                cache_key, _ = self._availability_from_entry(previous)
+                self.availability_cache.pop(cache_key, None)
 
-            self.availability_cache[cache_key] = availability
+        logger.debug(
+            "availability_refreshed",
+            dir_name=bar_type_dir_name,
+            found=entry is not None,
+        )
 
-            logger.debug(
-                "availability_cached",
-                instrument_id=instrument_id,
-                bar_type_spec=bar_type_spec,
-                start_date=availability.start_date.isoformat(),
-                end_date=availability.end_date.isoformat(),
-                file_count=availability.file_count,
-            )
+    def _availability_from_entry(self, entry: BarTypeIndexEntry) -> tuple[str, CatalogAvailability]:
+        """Convert an index entry to a (cache_key, CatalogAvailability) pair."""
+        # Reason: Normalize instrument_id for consistent cache keys
+        cache_key = f"{self._catalog_instrument_id(entry.instrument_id)}_{entry.bar_type_spec}"
+
+        # Reason: Merge overlapping per-file ranges into the covered interval set
+        merged: list[list[int]] = []
+        for file in sorted(entry.files, key=lambda f: f.start_ns):
+            if merged and file.start_ns <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], file.end_ns)
+            else:
+                merged.append([file.start_ns, file.end_ns])
+
+        availability = CatalogAvailability(
+            instrument_id=entry.instrument_id,
+            bar_type_spec=entry.bar_type_spec,
+            start_date=ns_to_datetime(entry.start_ns),
+            end_date=ns_to_datetime(entry.end_ns),
+            file_count=len(entry.files),
+            total_rows=entry.total_rows,
+            last_updated=datetime.now(),
+            intervals=[(ns_to_datetime(start), ns_to_datetime(end)) for start, end in merged],
+        )
 
-        logger.info(
-            "availability_cache_rebuilt",
-            total_entries=len(self.availability_cache),
+        logger.debug(
+            "availability_cached",
+            instrument_id=entry.instrument_id,
+            bar_type_spec=entry.bar_type_spec,
+            start_date=availability.start_date.isoformat(),
+            end_date=availability.end_date.isoformat(),
+            file_count=availability.file_count,
+            interval_count=len(merged),
         )
 
+        return cache_key, availability
+
     def _quarantine_corrupted_file(self, file_path: Path) -> None:
         """
         Move corrupted Parquet file to quarantine directory.
@@ -559,6 +541,128 @@ class DataCatalogService:
             )
             raise CatalogError(f"Query failed: {e}") from e
 
+    def query_bar_arrays(
+        self,
+        instrument_id: str,
+        bar_type_spec: str = "1-MINUTE-LAST",
+        start: datetime | None = None,
+        end: datetime | None = None,
+        aggregation_source: str = "EXTERNAL",
+    ) -> BarArrays:
+        """
+        Load bars as columnar arrays straight from the catalog Parquet files.
+
+        Decodes the OHLCV columns with NumPy instead of materializing Bar
+        objects, for sharing one series across worker processes.
+
+        Args:
+            instrument_id: Instrument identifier (e.g., "AAPL.NASDAQ")
+            bar_type_spec: Bar type specification (default: "1-MINUTE-LAST")
+            start: Optional inclusive start (UTC); defaults to the first bar
+            end: Optional inclusive end (UTC); defaults to the last bar
+            aggregation_source: "EXTERNAL" for provider bars, "INTERNAL" for
+                               bars derived in the catalog
+
+        Returns:
+            BarArrays sorted by ts_init
+
+        Raises:
+            DataNotFoundError: If no bars are in the catalog for the range
+            CatalogCorruptionError: If a Parquet file cannot be decoded
+
+        Example:
+            >>> arrays = service.query_bar_arrays("AAPL.NASDAQ", "1-DAY-LAST")
+            >>> print(f"{len(arrays)} bars, {arrays.nbytes:,} bytes")
+        """
+        dir_name = urisafe_identifier(f"{instrument_id}-{bar_type_spec}-{aggregation_source}")
+        bar_type_dir = self._index.bar_data_path / dir_name
+        files = sorted(bar_type_dir.glob("*.parquet")) if bar_type_dir.exists() else []
+        files = [file for file in files if _file_overlaps(file, start, end)]
+        try:
+            tables = [pq.read_table(file) for file in files]
+            arrays = BarArrays.from_arrow_table(pa.concat_tables(tables)) if tables else None
+        except (pa.ArrowException, KeyError, ValueError) as e:
+            logger.error("bar_arrays_decode_failed", instrument_id=instrument_id, error=str(e))
+            raise CatalogCorruptionError(str(bar_type_dir), e) from e
+
+        if arrays is not None and (start is not None or end is not None):
+            arrays = arrays.slice(start, end)
+
+        if arrays is None or not len(arrays):
+            now = datetime.now()
+            raise DataNotFoundError(instrument_id, start or now, end or now)
+
+        logger.info(
+            "catalog_bar_arrays_loaded",
+            instrument_id=instrument_id,
+            bar_type_spec=bar_type_spec,
+            bar_count=len(arrays),
+            file_count=len(files),
+        )
+
+        return arrays
+
+    def list_bar_specs(self, instrument_id: str) -> list[str]:
+        """
+        List the bar type specs stored in the catalog for an instrument.
+
+        Args:
+            instrument_id: Instrument identifier (e.g., "AAPL.NASDAQ")
+
+        Returns:
+            Bar type specs (e.g., ["1-DAY-LAST", "1-MINUTE-LAST"]), sorted
+
+        Example:
+            >>> service.list_bar_specs("AAPL.NASDAQ")
+            ['1-DAY-LAST', '1-MINUTE-LAST']
+        """
+        prefix = f"{self._catalog_instrument_id(instrument_id)}_"
+        with self._cache_lock:
+            keys = list(self.availability_cache)
+        return sorted(key[len(prefix) :] for key in keys if key.startswith(prefix))
+
+    @property
+    def derived_bars(self) -> DerivedBarCache:
+        """
+        Get the derived bar cache, creating it on first use.
+
+        Returns:
+            DerivedBarCache bound to this catalog
+        """
+        if self._derived_bars is None:
+            self._derived_bars = DerivedBarCache(self)
+        return self._derived_bars
+
+    def query_derived_bar_arrays(
+        self,
+        instrument_id: str,
+        bar_type_spec: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> BarArrays:
+        """
+        Load a timeframe that is not stored by aggregating finer catalog bars.
+
+        The aggregated bars are cached in the catalog as an INTERNAL bar type
+        and rebuilt automatically when the source bars change.
+
+        Args:
+            instrument_id: Instrument identifier (e.g., "AAPL.NASDAQ")
+            bar_type_spec: Timeframe to derive (e.g., "5-MINUTE-LAST", "1-WEEK-LAST")
+            start: Optional inclusive start (UTC)
+            end: Optional inclusive end (UTC)
+
+        Returns:
+            BarArrays of derived bars sorted by ts_init
+
+        Raises:
+            DataNotFoundError: If no finer bar type is stored or the range is empty
+
+        Example:
+            >>> hourly = service.query_derived_bar_arrays("AAPL.NASDAQ", "1-HOUR-LAST")
+        """
+        return self.derived_bars.query(instrument_id, bar_type_spec, start, end)
+
     def load_instrument(self, instrument_id: str) -> object | None:
         """
         Load instrument definition from the Parquet catalog.
@@ -716,8 +820,12 @@ class DataCatalogService:
                 correlation_id=correlation_id,
             )
 
-            # Reason: Rebuild availability cache to reflect new data
-            self._rebuild_availability_cache()
+            # Reason: Refresh availability only for the bar type that was written
+            self._refresh_availability(urisafe_identifier(first_bar.bar_type))
+
+            # Reason: Timeframes aggregated from the old source bars are now stale
+            if first_bar.bar_type.is_externally_aggregated():
+                self.derived_bars.invalidate(instrument_id)
 
         except Exception as e:
             logger.error(
@@ -729,6 +837,37 @@ class DataCatalogService:
             )
             raise CatalogError(f"Write failed: {e}") from e
 
+    def persist_new_bars(
+        self,
+        bars: List[Bar],
+        covered: CatalogAvailability | None,
+        correlation_id: str | None = None,
+    ) -> None:
+        """
+        Write fetched bars that are not already covered by the catalog.
+
+        Args:
+            bars: Fetched Bar objects of one bar type
+            covered: Catalog coverage before the fetch; bars inside it are skipped
+            correlation_id: Optional correlation ID for logging
+
+        Raises:
+            CatalogError: If the write operation fails
+        """
+        new_bars = (
+            bars if covered is None else [b for b in bars if not covered.covers_ns(b.ts_init)]
+        )
+
+        if len(new_bars) < len(bars):
+            logger.debug(
+                "skipping_bars_already_in_catalog",
+                skipped=len(bars) - len(new_bars),
+                correlation_id=correlation_id,
+            )
+
+        if new_bars:
+            self.write_bars(new_bars, correlation_id=correlation_id)
+
     async def _is_ibkr_available(self) -> bool:
         """
         Check if IBKR connection is available for data fetching.
@@ -762,6 +901,59 @@ class DataCatalogService:
         logger.debug("ibkr_availability_check", is_connected=is_connected)
         return is_connected
 
+    def bar_source_digest(
+        self,
+        instrument_id: str,
+        bar_type_spec: str,
+        start: datetime,
+        end: datetime,
+    ) -> str | None:
+        """
+        Identify the catalog bars of a range without reading them.
+
+        Hashes the name, size and modification time of every indexed Parquet
+        file overlapping the range, plus the range itself, so new, re-imported
+        or rewritten data changes the digest. Costs one stat() per file.
+
+        Args:
+            instrument_id: Instrument identifier (e.g., "AAPL.NASDAQ")
+            bar_type_spec: Bar type specification (e.g., "1-DAY-LAST")
+            start: Inclusive start (UTC)
+            end: Inclusive end (UTC)
+
+        Returns:
+            SHA-256 hex digest, or None if the catalog does not cover the
+            range (the bars then did not come from the catalog alone)
+        """
+        availability = self.get_availability(instrument_id, bar_type_spec)
+        if availability is None or not availability.covers_range(start, end):
+            return None
+
+        dir_name = urisafe_identifier(f"{instrument_id}-{bar_type_spec}-EXTERNAL")
+        with self._cache_lock:
+            entry = self._index.entries.get(dir_name)
+        if entry is None:
+            return None
+
+        start_ns = int(start.timestamp() * 1e9)
+        end_ns = int(end.timestamp() * 1e9)
+        bar_type_dir = self._index.bar_data_path / dir_name
+        files = []
+        for file in entry.files:
+            if file.end_ns < start_ns or file.start_ns > end_ns:
+                continue
+            try:
+                # Reason: Stat live, the index is only revalidated per directory
+                stat = (bar_type_dir / file.filename).stat()
+            except OSError:
+                return None
+            files.append([file.filename, stat.st_size, stat.st_mtime_ns])
+
+        payload = json.dumps(
+            {"bar_type": dir_name, "start_ns": start_ns, "end_ns": end_ns, "files": files}
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
     async def fetch_or_load(
         self,
         instrument_id: str,
@@ -805,9 +997,10 @@ class DataCatalogService:
 
         # Reason: Check catalog availability first
         availability = self.get_availability(instrument_id, bar_type_spec)
+        missing = availability.missing_ranges(start, end) if availability else [(start, end)]
 
         # Reason: If data fully available in catalog, load it directly
-        if availability and availability.covers_range(start, end):
+        if not missing:
             logger.info(
                 "data_found_in_catalog",
                 instrument_id=instrument_id,
@@ -816,8 +1009,14 @@ class DataCatalogService:
             return self.query_bars(instrument_id, start, end, bar_type_spec)
 
         # Route to appropriate data source
-        if data_source == "kraken":
-            return await self._fetch_and_persist_from_kraken(
+        fetch = (
+            self._fetch_and_persist_from_kraken
+            if data_source == "kraken"
+            else self._fetch_and_persist_from_ibkr
+        )
+
+        if availability is None:
+            return await fetch(
                 instrument_id,
                 start,
                 end,
@@ -826,16 +1025,65 @@ class DataCatalogService:
                 correlation_id,
             )
 
-        # Default: IBKR path (unchanged)
-        return await self._fetch_and_persist_from_ibkr(
-            instrument_id,
-            start,
-            end,
-            bar_type_spec,
-            max_retries,
-            correlation_id,
+        # Reason: Only fetch the sub-ranges the catalog is missing, then merge
+        # the new bars with what is already stored
+        logger.info(
+            "partial_catalog_coverage",
+            instrument_id=instrument_id,
+            missing_ranges=[(s.isoformat(), e.isoformat()) for s, e in missing],
+            correlation_id=correlation_id,
         )
 
+        fetched: List[Bar] = []
+        for gap_start, gap_end in missing:
+            try:
+                fetched.extend(
+                    await fetch(
+                        instrument_id,
+                        gap_start,
+                        gap_end,
+                        bar_type_spec,
+                        max_retries,
+                        correlation_id,
+                        covered=availability,
+                    )
+                )
+            except DataNotFoundError:
+                # Reason: Gaps may fall entirely on market closures
+                logger.info(
+                    "missing_range_has_no_data",
+                    instrument_id=instrument_id,
+                    start=gap_start.isoformat(),
+                    end=gap_end.isoformat(),
+                    correlation_id=correlation_id,
+                )
+
+        try:
+            stored = self.query_bars(instrument_id, start, end, bar_type_spec)
+        except DataNotFoundError:
+            stored = []
+
+        # Reason: Fetched bars were already written, so they may also be in
+        # the stored query result; keep one bar per timestamp
+        by_ts = {bar.ts_init: bar for bar in stored}
+        for bar in fetched:
+            by_ts.setdefault(bar.ts_init, bar)
+        bars = [by_ts[ts] for ts in sorted(by_ts)]
+
+        if not bars:
+            raise DataNotFoundError(instrument_id, start, end)
+
+        logger.info(
+            "fetch_or_load_completed",
+            instrument_id=instrument_id,
+            bar_count=len(bars),
+            fetched_count=len(fetched),
+            source=f"catalog_and_{data_source}_fetch",
+            correlation_id=correlation_id,
+        )
+
+        return bars
+
     async def _fetch_and_persist_from_ibkr(
         self,
         instrument_id: str,
@@ -844,8 +1092,9 @@ class DataCatalogService:
         bar_type_spec: str,
         max_retries: int,
         correlation_id: str | None,
+        covered: CatalogAvailability | None = None,
     ) -> List[Bar]:
-        """Fetch from IBKR and persist to catalog (original path)."""
+        """Fetch from IBKR and persist bars not already covered to the catalog."""
         logger.info(
             "data_missing_attempting_ibkr_fetch",
             instrument_id=instrument_id,
@@ -858,6 +1107,22 @@ class DataCatalogService:
                 "Ensure IBKR Gateway is running with 'docker compose up ibgateway'."
             )
 
+        # Reason: Ranges larger than one IBKR request are downloaded as
+        # concurrent, checkpointed windows that are written as they complete
+        if (
+            bar_spec_interval(bar_type_spec) is not None
+            and len(plan_download_chunks(start, end, bar_type_spec)) > 1
+        ):
+            return await self._download_from_ibkr(
+                instrument_id=instrument_id,
+                start=start,
+                end=end,
+                bar_type_spec=bar_type_spec,
+                max_retries=max_retries,
+                correlation_id=correlation_id,
+                covered=covered,
+            )
+
         bars, instrument = await self._fetch_from_ibkr_with_retry(
             instrument_id=instrument_id,
             start=start,
@@ -870,7 +1135,7 @@ class DataCatalogService:
         if instrument is not None:
             self.catalog.write_data([instrument])
 
-        self.write_bars(bars, correlation_id=correlation_id)
+        self.persist_new_bars(bars, covered, correlation_id)
 
         logger.info(
             "fetch_or_load_completed",
@@ -882,6 +1147,63 @@ class DataCatalogService:
 
         return bars
 
+    async def _download_from_ibkr(
+        self,
+        instrument_id: str,
+        start: datetime,
+        end: datetime,
+        bar_type_spec: str,
+        max_retries: int,
+        correlation_id: str | None,
+        covered: CatalogAvailability | None = None,
+    ) -> List[Bar]:
+        """
+        Download a multi-window range from IBKR with the chunked downloader.
+
+        Raises:
+            DataNotFoundError: If a window fails after all retries, or IBKR
+                has no data in any window of the range
+        """
+        from src.config import IBKRSettings
+
+        downloader = IBKRDownloader(
+            self.ibkr_client,
+            self,
+            max_concurrency=IBKRSettings().ibkr_download_concurrency,
+            max_retries=max_retries,
+        )
+        bars, instrument, progress = await downloader.download(
+            instrument_id,
+            start,
+            end,
+            bar_type_spec,
+            covered=covered,
+            correlation_id=correlation_id,
+        )
+
+        if instrument is not None:
+            self.catalog.write_data([instrument])
+
+        # Reason: Empty windows complete without error, so a range with no
+        # data at all must still fail like a single-window fetch does
+        if not bars and not progress.skipped_chunks:
+            raise DataNotFoundError(instrument_id, start, end)
+
+        # Reason: Windows completed by an interrupted earlier run were not
+        # re-fetched, so read the whole range back from the catalog
+        if progress.skipped_chunks:
+            bars = self.query_bars(instrument_id, start, end, bar_type_spec)
+
+        logger.info(
+            "fetch_or_load_completed",
+            instrument_id=instrument_id,
+            bar_count=len(bars),
+            source="ibkr_download",
+            correlation_id=correlation_id,
+        )
+
+        return bars
+
     async def _is_kraken_available(self) -> bool:
         """Check if Kraken client is available and connected."""
         if not self.kraken_client.is_connected:
@@ -903,8 +1225,9 @@ class DataCatalogService:
         bar_type_spec: str,
         max_retries: int,
         correlation_id: str | None,
+        covered: CatalogAvailability | None = None,
     ) -> List[Bar]:
-        """Fetch from Kraken and persist to catalog."""
+        """Fetch from Kraken and persist bars not already covered to the catalog."""
         logger.info(
             "data_missing_attempting_kraken_fetch",
             instrument_id=instrument_id,
@@ -928,7 +1251,7 @@ class DataCatalogService:
         if instrument is not None:
             self.catalog.write_data([instrument])
 
-        self.write_bars(bars, correlation_id=correlation_id)
+        self.persist_new_bars(bars, covered, correlation_id)
 
         logger.info(
             "fetch_or_load_completed",
@@ -1180,25 +1503,11 @@ class DataCatalogService:
             # Reason: No data available = entire range is a gap
             return [{"start": start_date, "end": end_date}]
 
-        gaps = []
-
-        # Reason: Gap at the beginning
-        if availability.start_date > start_date:
-            gaps.append(
-                {
-                    "start": start_date,
-                    "end": min(availability.start_date, end_date),
-                }
-            )
-
-        # Reason: Gap at the end
-        if availability.end_date < end_date:
-            gaps.append(
-                {
-                    "start": max(availability.end_date, start_date),
-                    "end": end_date,
-                }
-            )
+        # Reason: Interior holes between catalog files count as gaps too
+        gaps = [
+            {"start": gap_start, "end": gap_end}
+            for gap_start, gap_end in availability.missing_ranges(start_date, end_date)
+        ]
 
         logger.debug(
             "gap_detection_complete",
@@ -1208,3 +1517,21 @@ class DataCatalogService:
         )
 
         return gaps
+
+
+def _file_overlaps(file: Path, start: datetime | None, end: datetime | None) -> bool:
+    """
+    Check whether a catalog file's ts_init range (from its name) overlaps [start, end].
+
+    Files whose names do not encode a range are always included.
+    """
+    try:
+        start_str, end_str = file.stem.split("_")
+        file_start, file_end = file_timestamp_to_ns(start_str), file_timestamp_to_ns(end_str)
+    except ValueError:
+        return True
+    if start is not None and file_end < int(start.timestamp() * 1e9):
+        return False
+    if end is not None and file_start > int(end.timestamp() * 1e9):
+        return False
+    return True
@@ -210,30 +210,26 @@ class IBKRHistoricalClient:
         # Reason: Apply rate limiting before request
         await self.rate_limiter.acquire()
 
-        # Reason: Parse instrument_id to get symbol and venue
-        # Expected format: "SYMBOL.VENUE" (e.g., "AAPL.NASDAQ")
-        parts = instrument_id.split(".")
-        if len(parts) != 2:
-            raise ValueError(f"Invalid instrument_id format: {instrument_id}")
+        self._validate_request(instrument_id, bar_type_spec)
+        instrument, resolved_id = await self.resolve_instrument(instrument_id)
+        bars = await self._request_bars(resolved_id, start, end, bar_type_spec)
 
-        symbol, venue = parts
+        return bars, instrument
 
-        # Reason: Validate bar type spec format
-        # Expected format: "{period}-{aggregation}-{price_type}"
-        # Example: "1-MINUTE-LAST"
-        bar_parts = bar_type_spec.split("-")
-        if len(bar_parts) < 2:
-            raise ValueError(f"Invalid bar_type_spec format: {bar_type_spec}")
+    async def resolve_instrument(self, instrument_id: str) -> tuple[object | None, str]:
+        """
+        Resolve an instrument and the ID IBKR qualifies it to.
 
-        # Reason: Strip timezone info since we're specifying tz_name parameter
-        # Nautilus expects naive datetimes when tz_name is provided
-        start_naive = start.replace(tzinfo=None) if start.tzinfo else start
-        end_naive = end.replace(tzinfo=None) if end.tzinfo else end
+        IBKR qualifies contracts to their primary exchange (e.g., GDX.NASDAQ
+        resolves to GDX.ARCA). Bar requests must use the resolved ID,
+        otherwise Nautilus can't find the instrument in its cache.
+
+        Args:
+            instrument_id: Instrument ID (e.g., "AAPL.NASDAQ")
 
-        # Reason: Resolve instrument first to get the correct exchange.
-        # IBKR qualifies contracts to their primary exchange (e.g., GDX.NASDAQ
-        # resolves to GDX.ARCA). We must use the resolved ID for the bars
-        # request, otherwise Nautilus can't find the instrument in its cache.
+        Returns:
+            Tuple of (instrument or None, resolved instrument ID string)
+        """
         nautilus_instrument_id = InstrumentId.from_str(instrument_id)
         instruments = await self.client.request_instruments(
             instrument_ids=[nautilus_instrument_id],
@@ -250,21 +246,78 @@ class IBKRHistoricalClient:
                 resolved=resolved_id,
             )
 
-        # Reason: Request bars from IBKR via Nautilus client
-        # bar_specifications should be simple format strings like "1-MINUTE-LAST"
+        return instrument, resolved_id
+
+    async def fetch_bar_window(
+        self,
+        resolved_id: str,
+        start: datetime,
+        end: datetime,
+        bar_type_spec: str = "1-MINUTE-LAST",
+        timeout: int = 120,
+    ) -> list:
+        """
+        Fetch bars for one window of an already resolved instrument.
+
+        Used by the chunked downloader, which resolves the instrument once
+        and then requests many IBKR-sized windows.
+
+        Args:
+            resolved_id: Instrument ID returned by resolve_instrument()
+            start: Window start (UTC)
+            end: Window end (UTC)
+            bar_type_spec: Bar type specification (e.g., "1-MINUTE-LAST")
+            timeout: Request timeout in seconds
+
+        Returns:
+            List of Bar objects for the window (empty if IBKR has no data for it)
+        """
+        await self.rate_limiter.acquire()
+        self._validate_request(resolved_id, bar_type_spec)
+        return await self._request_bars(resolved_id, start, end, bar_type_spec, timeout) or []
+
+    @staticmethod
+    def _validate_request(instrument_id: str, bar_type_spec: str) -> None:
+        """Validate instrument ID and bar type spec formats."""
+        # Reason: Parse instrument_id to get symbol and venue
+        # Expected format: "SYMBOL.VENUE" (e.g., "AAPL.NASDAQ")
+        parts = instrument_id.split(".")
+        if len(parts) != 2:
+            raise ValueError(f"Invalid instrument_id format: {instrument_id}")
+
+        # Reason: Validate bar type spec format
+        # Expected format: "{period}-{aggregation}-{price_type}"
+        # Example: "1-MINUTE-LAST"
+        bar_parts = bar_type_spec.split("-")
+        if len(bar_parts) < 2:
+            raise ValueError(f"Invalid bar_type_spec format: {bar_type_spec}")
+
+    async def _request_bars(
+        self,
+        resolved_id: str,
+        start: datetime,
+        end: datetime,
+        bar_type_spec: str,
+        timeout: int = 120,
+    ) -> list:
+        """Request bars from IBKR via the Nautilus client."""
+        # Reason: Strip timezone info since we're specifying tz_name parameter
+        # Nautilus expects naive datetimes when tz_name is provided
+        start_naive = start.replace(tzinfo=None) if start.tzinfo else start
+        end_naive = end.replace(tzinfo=None) if end.tzinfo else end
+
+        # Reason: bar_specifications should be simple format strings like "1-MINUTE-LAST"
         # Use instrument_ids instead of contracts to avoid parsing issues
-        bars = await self.client.request_bars(
+        return await self.client.request_bars(
             bar_specifications=[bar_type_spec],  # Just "1-MINUTE-LAST"
             end_date_time=end_naive,  # Required parameter (comes before start!)
             tz_name="UTC",
             start_date_time=start_naive,  # Optional start time
             instrument_ids=[resolved_id],  # Use resolved ID from IBKR
             use_rth=True,  # Regular Trading Hours only
-            timeout=120,  # 2 minute timeout
+            timeout=timeout,
         )
 
-        return bars, instrument
-
     @property
     def is_connected(self) -> bool:
         """Check if client is connected."""
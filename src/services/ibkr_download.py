@@ -0,0 +1,386 @@
+"""
+Chunked, concurrent and resumable IBKR historical downloads.
+
+A single ``request_bars`` call for years of intraday data is slow and
+all-or-nothing. The downloader splits a range into IBKR-sized windows for
+the bar spec, fetches them concurrently (each request still goes through the
+client's RateLimiter), writes every completed window to the catalog and
+records it in a checkpoint file, so an interrupted download resumes with
+the windows that are still missing.
+
+Checkpoint layout ({catalog_path}/.downloads/{bar_type_dir}.json):
+    {"completed": [[start_ns, end_ns], ...]}
+"""
+
+import asyncio
+import json
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable
+
+import structlog
+from nautilus_trader.model.data import Bar
+from nautilus_trader.persistence.funcs import urisafe_identifier
+
+from src.models.catalog_metadata import (
+    CatalogAvailability,
+    DownloadChunk,
+    DownloadProgress,
+    bar_spec_interval,
+)
+from src.services.exceptions import DataNotFoundError
+
+if TYPE_CHECKING:
+    from src.services.data_catalog import DataCatalogService
+    from src.services.ibkr_client import IBKRHistoricalClient
+
+logger = structlog.get_logger(__name__)
+
+CHECKPOINT_DIRNAME = ".downloads"
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def ibkr_chunk_duration(bar_type_spec: str) -> timedelta:
+    """
+    Get the largest window IBKR serves in one request for a bar spec.
+
+    Follows IBKR's valid duration / bar size combinations: 1 day of 1-2
+    minute bars, 1 week of 3-29 minute bars, 1 month of 30 minute to
+    hourly bars and 1 year of daily or weekly bars.
+
+    Args:
+        bar_type_spec: Bar type specification (e.g., "1-MINUTE-LAST")
+
+    Returns:
+        Window duration
+
+    Raises:
+        ValueError: If the spec is not a time-based bar
+
+    Example:
+        >>> ibkr_chunk_duration("5-MINUTE-LAST")
+        datetime.timedelta(days=7)
+    """
+    interval = bar_spec_interval(bar_type_spec)
+    if interval is None:
+        raise ValueError(f"Cannot plan a download for bar spec: {bar_type_spec}")
+
+    if interval < timedelta(minutes=1):
+        return timedelta(minutes=30)
+    if interval < timedelta(minutes=3):
+        return timedelta(days=1)
+    if interval < timedelta(minutes=30):
+        return timedelta(weeks=1)
+    if interval < timedelta(days=1):
+        return timedelta(days=30)
+    return timedelta(days=365)
+
+
+def plan_download_chunks(start: datetime, end: datetime, bar_type_spec: str) -> list[DownloadChunk]:
+    """
+    Split a range into IBKR-sized windows.
+
+    Window boundaries are aligned to multiples of the window duration since
+    the UNIX epoch, so overlapping downloads share windows and checkpoints
+    from an earlier (interrupted) run line up with a new plan.
+
+    Args:
+        start: Range start (UTC)
+        end: Range end (UTC)
+        bar_type_spec: Bar type specification
+
+    Returns:
+        Windows in chronological order, clipped to [start, end]
+
+    Example:
+        >>> chunks = plan_download_chunks(
+        ...     datetime(2024, 1, 1, tzinfo=timezone.utc),
+        ...     datetime(2024, 1, 31, tzinfo=timezone.utc),
+        ...     "1-MINUTE-LAST",
+        ... )
+        >>> len(chunks)
+        31
+    """
+    if start.tzinfo is None:
+        start = start.replace(tzinfo=timezone.utc)
+    if end.tzinfo is None:
+        end = end.replace(tzinfo=timezone.utc)
+    if end < start:
+        raise ValueError("end must be >= start")
+
+    duration = ibkr_chunk_duration(bar_type_spec)
+    boundary = _EPOCH + ((start - _EPOCH) // duration) * duration
+
+    chunks: list[DownloadChunk] = []
+    while boundary <= end:
+        next_boundary = boundary + duration
+        chunk_start = max(boundary, start)
+        # Reason: Windows are inclusive, stop one microsecond before the next one
+        chunk_end = min(next_boundary - timedelta(microseconds=1), end)
+        chunks.append(DownloadChunk(start=chunk_start, end=chunk_end))
+        boundary = next_boundary
+
+    return chunks
+
+
+class DownloadCheckpoint:
+    """
+    Completed download windows for one bar type, persisted as JSON.
+
+    Attributes:
+        path: Checkpoint file location
+        completed: Completed (start_ns, end_ns) windows
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        Load a checkpoint (missing or unreadable files start empty).
+
+        Args:
+            path: Checkpoint file location
+        """
+        self.path = path
+        self.completed: list[tuple[int, int]] = []
+
+        if path.exists():
+            try:
+                payload = json.loads(path.read_text())
+                self.completed = [(int(s), int(e)) for s, e in payload.get("completed", [])]
+            except (OSError, ValueError, TypeError) as e:
+                logger.warning("download_checkpoint_load_failed", path=str(path), error=str(e))
+
+    def is_completed(self, chunk: DownloadChunk) -> bool:
+        """Check if a window lies within a completed window."""
+        return any(s <= chunk.start_ns and chunk.end_ns <= e for s, e in self.completed)
+
+    def mark_completed(self, chunk: DownloadChunk) -> None:
+        """Record a completed window and persist the checkpoint atomically."""
+        self.completed.append((chunk.start_ns, chunk.end_ns))
+        tmp_path = self.path.with_suffix(".tmp")
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps({"completed": self.completed}))
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            # Reason: Losing the checkpoint only costs re-fetching on resume
+            logger.warning("download_checkpoint_save_failed", path=str(self.path), error=str(e))
+
+    def clear(self) -> None:
+        """Delete the checkpoint once the whole download has completed."""
+        self.completed = []
+        self.path.unlink(missing_ok=True)
+
+
+class IBKRDownloader:
+    """
+    Download a historical range from IBKR as concurrent, checkpointed windows.
+
+    Attributes:
+        client: Connected IBKR historical client
+        catalog_service: Catalog the windows are written to
+        max_concurrency: Maximum windows requested at once
+
+    Example:
+        >>> downloader = IBKRDownloader(client, catalog_service, max_concurrency=4)
+        >>> bars, instrument, progress = await downloader.download(
+        ...     "AAPL.NASDAQ", start, end, "1-MINUTE-LAST"
+        ... )
+        >>> print(f"{progress.bars_per_second:,.0f} bars/s")
+    """
+
+    def __init__(
+        self,
+        client: "IBKRHistoricalClient",
+        catalog_service: "DataCatalogService",
+        max_concurrency: int = 4,
+        max_retries: int = 3,
+        on_progress: Callable[[DownloadProgress], None] | None = None,
+    ) -> None:
+        """
+        Initialize IBKRDownloader.
+
+        Args:
+            client: Connected IBKR historical client
+            catalog_service: Catalog the windows are written to
+            max_concurrency: Maximum windows requested at once
+            max_retries: Retry attempts per window (exponential backoff)
+            on_progress: Optional callback invoked after every window
+        """
+        self.client = client
+        self.catalog_service = catalog_service
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_retries = max_retries
+        self.on_progress = on_progress
+
+    def checkpoint_for(self, instrument_id: str, bar_type_spec: str) -> DownloadCheckpoint:
+        """Get the checkpoint of a bar type's downloads."""
+        dir_name = urisafe_identifier(f"{instrument_id}-{bar_type_spec}-EXTERNAL")
+        return DownloadCheckpoint(
+            self.catalog_service.catalog_path / CHECKPOINT_DIRNAME / f"{dir_name}.json"
+        )
+
+    async def download(
+        self,
+        instrument_id: str,
+        start: datetime,
+        end: datetime,
+        bar_type_spec: str = "1-MINUTE-LAST",
+        covered: CatalogAvailability | None = None,
+        correlation_id: str | None = None,
+    ) -> tuple[list[Bar], object | None, DownloadProgress]:
+        """
+        Download a range, writing each completed window to the catalog.
+
+        Args:
+            instrument_id: Instrument identifier (e.g., "AAPL.NASDAQ")
+            start: Range start (UTC)
+            end: Range end (UTC)
+            bar_type_spec: Bar type specification
+            covered: Catalog coverage; bars inside it are not written again
+            correlation_id: Optional correlation ID for logging
+
+        Returns:
+            Tuple of (bars fetched by this run in ts_init order, instrument,
+            final progress). Windows skipped via the checkpoint are not
+            re-read; callers needing them query the catalog.
+
+        Raises:
+            DataNotFoundError: If a window still fails after all retries
+                               (completed windows stay checkpointed). Windows
+                               without data (market closures, dates before
+                               listing) complete empty instead.
+        """
+        chunks = plan_download_chunks(start, end, bar_type_spec)
+        checkpoint = self.checkpoint_for(instrument_id, bar_type_spec)
+        pending = [chunk for chunk in chunks if not checkpoint.is_completed(chunk)]
+
+        progress = DownloadProgress(
+            total_chunks=len(chunks),
+            completed_chunks=len(chunks) - len(pending),
+            skipped_chunks=len(chunks) - len(pending),
+        )
+        started = time.monotonic()
+
+        logger.info(
+            "ibkr_download_started",
+            instrument_id=instrument_id,
+            bar_type_spec=bar_type_spec,
+            chunks=len(chunks),
+            resumed_chunks=progress.skipped_chunks,
+            max_concurrency=self.max_concurrency,
+            correlation_id=correlation_id,
+        )
+
+        instrument, resolved_id = await self.client.resolve_instrument(instrument_id)
+        fetched: dict[int, Bar] = {}
+        slots = asyncio.Semaphore(self.max_concurrency)
+
+        async def run_chunk(chunk: DownloadChunk) -> None:
+            async with slots:
+                bars = await self._fetch_chunk(resolved_id, chunk, bar_type_spec, correlation_id)
+
+            # Reason: Keep only bars inside this window; IBKR may return
+            # neighbouring bars that belong to (and are written by) other windows
+            bars = [bar for bar in bars if chunk.start_ns <= bar.ts_init <= chunk.end_ns]
+            self.catalog_service.persist_new_bars(bars, covered, correlation_id)
+            checkpoint.mark_completed(chunk)
+
+            for bar in bars:
+                fetched[bar.ts_init] = bar
+            progress.completed_chunks += 1
+            progress.bar_count += len(bars)
+            progress.elapsed_seconds = time.monotonic() - started
+            self._report(progress, instrument_id, correlation_id)
+
+        tasks = [asyncio.create_task(run_chunk(chunk)) for chunk in pending]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        checkpoint.clear()
+        progress.elapsed_seconds = time.monotonic() - started
+
+        logger.info(
+            "ibkr_download_completed",
+            instrument_id=instrument_id,
+            bar_count=progress.bar_count,
+            chunks=progress.total_chunks,
+            resumed_chunks=progress.skipped_chunks,
+            duration_seconds=round(progress.elapsed_seconds, 2),
+            bars_per_second=round(progress.bars_per_second, 1),
+            correlation_id=correlation_id,
+        )
+
+        return [fetched[ts] for ts in sorted(fetched)], instrument, progress
+
+    async def _fetch_chunk(
+        self,
+        resolved_id: str,
+        chunk: DownloadChunk,
+        bar_type_spec: str,
+        correlation_id: str | None,
+    ) -> list[Bar]:
+        """
+        Fetch one window with exponential backoff retry logic.
+
+        A window IBKR has no data for is returned empty, not retried; only
+        transport and API errors count towards max_retries.
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                bars = await self.client.fetch_bar_window(
+                    resolved_id, chunk.start, chunk.end, bar_type_spec
+                )
+            except DataNotFoundError:
+                bars = None
+            except Exception as e:
+                logger.warning(
+                    "ibkr_chunk_fetch_failed",
+                    instrument_id=resolved_id,
+                    chunk_start=chunk.start.isoformat(),
+                    attempt=attempt + 1,
+                    max_retries=self.max_retries,
+                    error=str(e),
+                    correlation_id=correlation_id,
+                )
+                if attempt < self.max_retries:
+                    # Reason: Exponential backoff: 2^attempt seconds
+                    await asyncio.sleep(2 ** (attempt + 1))
+                continue
+
+            if not bars:
+                logger.info(
+                    "ibkr_chunk_empty",
+                    instrument_id=resolved_id,
+                    chunk_start=chunk.start.isoformat(),
+                    chunk_end=chunk.end.isoformat(),
+                    correlation_id=correlation_id,
+                )
+                return []
+            return bars
+
+        raise DataNotFoundError(resolved_id, chunk.start, chunk.end)
+
+    def _report(
+        self, progress: DownloadProgress, instrument_id: str, correlation_id: str | None
+    ) -> None:
+        """Log progress and notify the progress callback."""
+        logger.info(
+            "ibkr_download_progress",
+            instrument_id=instrument_id,
+            completed_chunks=progress.completed_chunks,
+            total_chunks=progress.total_chunks,
+            bar_count=progress.bar_count,
+            bars_per_second=round(progress.bars_per_second, 1),
+            correlation_id=correlation_id,
+        )
+        if self.on_progress is not None:
+            self.on_progress(progress)
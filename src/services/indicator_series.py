@@ -0,0 +1,388 @@
+"""
+Indicator overlay series for finished backtest runs.
+
+Overlays are computed with the vectorized equivalents of the Nautilus
+indicators and parameters the strategy used (src.core.indicators), over the
+run's daily bar columns. A finished run's
+series never change unless its source bars do, so results are cached per
+(run, indicator config, data fingerprint):
+
+- in a bounded in-process LRU for repeated page loads, and
+- as a compact sidecar Parquet file per run ({catalog_path}/.indicators/),
+  shared by the web app and backtest workers, which precompute the series
+  when a run is persisted so the first chart view is served from disk.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+import structlog
+
+from src.core import indicators
+from src.services.shared_bars import BarArrays
+
+if TYPE_CHECKING:
+    from src.services.data_catalog import DataCatalogService
+
+logger = structlog.get_logger(__name__)
+
+INDICATORS_DIR_NAME = ".indicators"
+INDICATOR_BAR_TYPE_SPEC = "1-DAY-LAST"
+
+# Reason: Bump when indicator semantics change so stale sidecar files are ignored
+INDICATOR_SERIES_VERSION = 2
+
+# Indicator name to (time "YYYY-MM-DD", value) points, sorted by time
+IndicatorSeries = dict[str, list[tuple[str, float]]]
+
+
+def indicator_config(config_snapshot: dict[str, Any]) -> dict[str, Any] | None:
+    """
+    Resolve the overlay indicators and parameters for a run's strategy.
+
+    Args:
+        config_snapshot: Run config snapshot with strategy_path and config
+
+    Returns:
+        Indicator config with defaults applied (e.g., {"kind": "sma",
+        "fast_period": 10, "slow_period": 20}), or None if the strategy
+        has no chart overlays
+
+    Example:
+        >>> indicator_config({"strategy_path": "src.core.strategies.sma_crossover:SMA"})
+        {'kind': 'sma', 'fast_period': 10, 'slow_period': 20}
+    """
+    strategy_path = str(config_snapshot.get("strategy_path") or "").lower()
+    strategy_config = config_snapshot.get("config") or {}
+
+    if "bollinger" in strategy_path:
+        return {
+            "kind": "bollinger",
+            "bb_period": int(strategy_config.get("daily_bb_period", 20)),
+            "bb_std": float(strategy_config.get("daily_bb_std_dev", 2.0)),
+            "weekly_ma_period": int(strategy_config.get("weekly_ma_period", 20)),
+        }
+
+    if "sma" in strategy_path or "crossover" in strategy_path:
+        return {
+            "kind": "sma",
+            "fast_period": int(strategy_config.get("fast_period", 10)),
+            "slow_period": int(strategy_config.get("slow_period", 20)),
+        }
+
+    return None
+
+
+def _points(times: np.ndarray, values: np.ndarray) -> list[tuple[str, float]]:
+    """(time, value) points of the initialized (non-NaN) entries."""
+    initialized = ~np.isnan(values)
+    return list(zip(times[initialized].tolist(), values[initialized].tolist()))
+
+
+def compute_bollinger_series(
+    arrays: BarArrays, times: np.ndarray, config: dict[str, Any]
+) -> IndicatorSeries:
+    """
+    Compute Bollinger Bands and the weekly SMA.
+
+    Matches the strategy's Nautilus BollingerBands and weekly-close
+    SimpleMovingAverage (see src.core.indicators).
+
+    Args:
+        arrays: Daily bars sorted by time
+        times: Bar dates as "YYYY-MM-DD" strings
+        config: Indicator config from indicator_config()
+
+    Returns:
+        upper_band, middle_band, lower_band and weekly_sma series
+    """
+    bands = indicators.bollinger_bands(
+        arrays.high, arrays.low, arrays.close, config["bb_period"], config["bb_std"]
+    )
+    return {
+        "upper_band": _points(times, bands.upper),
+        "middle_band": _points(times, bands.middle),
+        "lower_band": _points(times, bands.lower),
+        "weekly_sma": _points(
+            times,
+            indicators.weekly_sma(arrays.ts_event, arrays.close, config["weekly_ma_period"]),
+        ),
+    }
+
+
+def compute_sma_series(
+    arrays: BarArrays, times: np.ndarray, config: dict[str, Any]
+) -> IndicatorSeries:
+    """
+    Compute fast and slow SMAs of the closes.
+
+    Args:
+        arrays: Daily bars sorted by time
+        times: Bar dates as "YYYY-MM-DD" strings
+        config: Indicator config from indicator_config()
+
+    Returns:
+        sma_fast and sma_slow series
+    """
+    return {
+        "sma_fast": _points(times, indicators.sma(arrays.close, config["fast_period"])),
+        "sma_slow": _points(times, indicators.sma(arrays.close, config["slow_period"])),
+    }
+
+
+_COMPUTE_BY_KIND = {
+    "bollinger": compute_bollinger_series,
+    "sma": compute_sma_series,
+}
+
+
+def compute_indicator_series(arrays: BarArrays, config: dict[str, Any]) -> IndicatorSeries:
+    """
+    Compute the overlay series described by an indicator config.
+
+    Args:
+        arrays: Daily bars sorted by time
+        config: Indicator config from indicator_config()
+
+    Returns:
+        Indicator name to (time, value) points
+    """
+    times = arrays.ts_event.astype("datetime64[ns]").astype("datetime64[D]").astype(str)
+    series = _COMPUTE_BY_KIND[config["kind"]](arrays, times, config)
+    logger.info(
+        "indicator_series_computed",
+        kind=config["kind"],
+        bar_count=len(arrays),
+        point_counts={name: len(points) for name, points in series.items()},
+    )
+    return series
+
+
+def indicator_cache_key(run_id: UUID, config: dict[str, Any], data_fingerprint: str) -> str:
+    """
+    Build the cache key of a run's indicator series.
+
+    Args:
+        run_id: Backtest run UUID
+        config: Indicator config from indicator_config()
+        data_fingerprint: Identity of the source bars (see bar_data_fingerprint)
+
+    Returns:
+        Hex digest identifying the series
+    """
+    payload = json.dumps(
+        {
+            "version": INDICATOR_SERIES_VERSION,
+            "run_id": str(run_id),
+            "config": config,
+            "data": data_fingerprint,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+
+def bar_data_fingerprint(catalog: "DataCatalogService", instrument_id: str) -> str | None:
+    """
+    Identify the daily bars a run's indicators are computed from.
+
+    Uses the catalog availability (range, file and row counts), so new or
+    re-imported bars change the fingerprint without reading any Parquet.
+
+    Args:
+        catalog: Catalog service
+        instrument_id: Instrument identifier (e.g., "AAPL.NASDAQ")
+
+    Returns:
+        Fingerprint string, or None if no daily bars are stored
+    """
+    availability = catalog.get_availability(instrument_id, INDICATOR_BAR_TYPE_SPEC)
+    if availability is None:
+        return None
+    return (
+        f"{availability.start_date.isoformat()}/{availability.end_date.isoformat()}/"
+        f"{availability.file_count}/{availability.total_rows}"
+    )
+
+
+class IndicatorSeriesCache:
+    """
+    Two-level cache of indicator series: in-process LRU over sidecar Parquet files.
+
+    Attributes:
+        root: Directory holding one sub-directory of Parquet files per run
+        max_entries: Series kept in memory before least-recently-used eviction
+
+    Example:
+        >>> cache = IndicatorSeriesCache(Path("data/catalog/.indicators"))
+        >>> series = cache.get_or_compute(catalog, run_id, "AAPL.NASDAQ", start, end, snapshot)
+    """
+
+    def __init__(self, root: Path, max_entries: int = 128) -> None:
+        """
+        Initialize IndicatorSeriesCache.
+
+        Args:
+            root: Sidecar directory (created on first write)
+            max_entries: Maximum number of series held in memory
+        """
+        self.root = Path(root)
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, IndicatorSeries] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _path(self, run_id: UUID, key: str) -> Path:
+        """Sidecar file for a run's series."""
+        return self.root / str(run_id) / f"{key}.parquet"
+
+    def _remember(self, key: str, series: IndicatorSeries) -> None:
+        """Insert a series into the LRU, evicting the oldest entries."""
+        with self._lock:
+            self._entries[key] = series
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, run_id: UUID, key: str) -> IndicatorSeries | None:
+        """
+        Look up a series in memory, then on disk.
+
+        Args:
+            run_id: Backtest run UUID
+            key: Cache key from indicator_cache_key()
+
+        Returns:
+            Cached series, or None on a miss
+        """
+        with self._lock:
+            series = self._entries.get(key)
+            if series is not None:
+                self._entries.move_to_end(key)
+                return series
+
+        path = self._path(run_id, key)
+        if not path.exists():
+            return None
+
+        try:
+            series = _read_series(path)
+        except (OSError, pa.ArrowException) as e:
+            logger.warning("indicator_sidecar_unreadable", path=str(path), error=str(e))
+            return None
+
+        self._remember(key, series)
+        return series
+
+    def put(self, run_id: UUID, key: str, series: IndicatorSeries) -> None:
+        """
+        Store a series in memory and as the run's sidecar file.
+
+        Sidecar files of the run for other keys (older data or config) are removed.
+
+        Args:
+            run_id: Backtest run UUID
+            key: Cache key from indicator_cache_key()
+            series: Series to store
+        """
+        self._remember(key, series)
+
+        path = self._path(run_id, key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".parquet.tmp")
+            pq.write_table(_series_to_table(series), tmp_path, compression="zstd")
+            os.replace(tmp_path, path)
+            for stale in path.parent.glob("*.parquet"):
+                if stale != path:
+                    stale.unlink(missing_ok=True)
+        except OSError as e:
+            # Reason: The in-memory entry still serves this process
+            logger.warning("indicator_sidecar_write_failed", path=str(path), error=str(e))
+
+    def get_or_compute(
+        self,
+        catalog: "DataCatalogService",
+        run_id: UUID,
+        instrument_id: str,
+        start: date | datetime,
+        end: date | datetime,
+        config_snapshot: dict[str, Any],
+    ) -> IndicatorSeries:
+        """
+        Get a run's indicator series, computing and caching it on a miss.
+
+        Args:
+            catalog: Catalog service holding the run's daily bars
+            run_id: Backtest run UUID
+            instrument_id: Instrument identifier (e.g., "AAPL.NASDAQ")
+            start: Backtest start date
+            end: Backtest end date
+            config_snapshot: Run config snapshot (strategy_path and config)
+
+        Returns:
+            Indicator series, empty if the strategy has no chart overlays
+
+        Raises:
+            DataNotFoundError: If the catalog holds no daily bars for the range
+        """
+        config = indicator_config(config_snapshot)
+        if config is None:
+            return {}
+
+        fingerprint = bar_data_fingerprint(catalog, instrument_id)
+        key = indicator_cache_key(run_id, config, fingerprint) if fingerprint else None
+        if key is not None:
+            series = self.get(run_id, key)
+            if series is not None:
+                logger.debug("indicator_series_cache_hit", run_id=str(run_id))
+                return series
+
+        arrays = catalog.query_bar_arrays(
+            instrument_id=instrument_id,
+            bar_type_spec=INDICATOR_BAR_TYPE_SPEC,
+            start=datetime.combine(start, datetime.min.time()).replace(tzinfo=timezone.utc),
+            end=datetime.combine(end, datetime.max.time()).replace(tzinfo=timezone.utc),
+        )
+        series = compute_indicator_series(arrays, config)
+
+        # Reason: Without a data fingerprint a cached entry could never be invalidated
+        if key is not None:
+            self.put(run_id, key, series)
+        return series
+
+
+def _series_to_table(series: IndicatorSeries) -> pa.Table:
+    """Flatten series into a long (name, time, value) table."""
+    names = [name for name, points in series.items() for _ in points]
+    times = [time for points in series.values() for time, _ in points]
+    values = [value for points in series.values() for _, value in points]
+    return pa.table(
+        {
+            "name": pa.array(names, pa.string()).dictionary_encode(),
+            "time": pa.array(np.array(times, dtype="datetime64[D]"), pa.date32()),
+            "value": pa.array(values, pa.float64()),
+        }
+    ).replace_schema_metadata({"series": json.dumps(list(series))})
+
+
+def _read_series(path: Path) -> IndicatorSeries:
+    """Read a sidecar table back into series, keeping empty series."""
+    table = pq.read_table(path)
+    names = json.loads(table.schema.metadata[b"series"])
+    series: IndicatorSeries = {name: [] for name in names}
+
+    times = table.column("time").to_numpy().astype("datetime64[D]").astype(str)
+    values = table.column("value").to_numpy()
+    for name, time, value in zip(table.column("name").to_pylist(), times, values):
+        series[name].append((time, float(value)))
+    return series
@@ -5,6 +5,7 @@ from collections import deque
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 
+import numpy as np
 import structlog
 from kraken.futures import Market as FuturesMarket
 from kraken.spot import Market as SpotMarket
@@ -59,6 +60,21 @@ BAR_TYPE_MAP = {
     "1-DAY": "1d",
 }
 
+# Kraken Charts resolution → candle interval in seconds
+RESOLUTION_SECONDS = {
+    "1m": 60,
+    "5m": 300,
+    "15m": 900,
+    "30m": 1800,
+    "1h": 3600,
+    "4h": 14400,
+    "12h": 43200,
+    "1d": 86400,
+}
+
+# Candles requested per time window; the Charts API pages beyond ~2000
+MAX_CANDLES_PER_WINDOW = 2000
+
 # Known Nautilus price type suffixes appended to bar type specs
 PRICE_TYPE_SUFFIXES = {"LAST", "MID", "BID", "ASK"}
 
@@ -131,35 +147,76 @@ def _detect_price_precision(candles: list[dict]) -> int:
     return max_prec
 
 
-def convert_ohlcv_to_bars(
-    candles: list[dict],
-    instrument_id: InstrumentId,
-    bar_type_spec: str,
-    price_precision: int = 1,
-    size_precision: int = 8,
-) -> list[Bar]:
-    """Convert Kraken OHLCV candles to Nautilus Bar objects."""
-    if not candles:
-        return []
-
-    bar_type = BarType.from_str(f"{instrument_id}-{bar_type_spec}-EXTERNAL")
-    price_fmt = f"{{:.{price_precision}f}}"
-    size_fmt = f"{{:.{size_precision}f}}"
-    bars = []
-    for c in candles:
-        ts_ns = c["time"] * 1_000_000  # ms → ns
-        bar = Bar(
-            bar_type=bar_type,
-            open=Price.from_str(price_fmt.format(float(c["open"]))),
-            high=Price.from_str(price_fmt.format(float(c["high"]))),
-            low=Price.from_str(price_fmt.format(float(c["low"]))),
-            close=Price.from_str(price_fmt.format(float(c["close"]))),
-            volume=Quantity.from_str(size_fmt.format(float(c["volume"]))),
-            ts_event=ts_ns,
-            ts_init=ts_ns,
+def plan_fetch_windows(from_ts: int, to_ts: int, resolution: str) -> list[tuple[int, int]]:
+    """Split [from_ts, to_ts] (seconds) into windows of MAX_CANDLES_PER_WINDOW candles."""
+    span = RESOLUTION_SECONDS[resolution] * MAX_CANDLES_PER_WINDOW
+    return [(t, min(t + span - 1, to_ts)) for t in range(from_ts, to_ts + 1, span)]
+
+
+class KrakenCandleBuffer:
+    """Columnar buffer for Kraken OHLCV candles.
+
+    Pages are appended as NumPy columns as they arrive, so long ranges never
+    hold a list of per-candle dicts, and bars are built in one vectorized
+    ``Bar.from_raw_arrays_to_list`` call.
+    """
+
+    def __init__(self) -> None:
+        self._time: list[np.ndarray] = []
+        self._columns: dict[str, list[np.ndarray]] = {
+            field: [] for field in ("open", "high", "low", "close", "volume")
+        }
+        self.price_precision = 0
+
+    def __len__(self) -> int:
+        return sum(len(chunk) for chunk in self._time)
+
+    def extend(self, candles: list[dict]) -> None:
+        """Append one page of raw candles."""
+        if not candles:
+            return
+        self._time.append(np.fromiter((c["time"] for c in candles), np.int64, len(candles)))
+        for field, chunks in self._columns.items():
+            chunks.append(np.array([c[field] for c in candles], dtype=np.float64))
+        self.price_precision = max(self.price_precision, _detect_price_precision(candles))
+
+    def merge(self, other: "KrakenCandleBuffer") -> None:
+        """Append another buffer's columns (e.g., the next time window)."""
+        self._time.extend(other._time)
+        for field, chunks in self._columns.items():
+            chunks.extend(other._columns[field])
+        self.price_precision = max(self.price_precision, other.price_precision)
+
+    def to_bars(
+        self,
+        instrument_id: InstrumentId,
+        bar_type_spec: str,
+        price_precision: int = 1,
+        size_precision: int = 8,
+    ) -> list[Bar]:
+        """Build Nautilus bars, sorted by time with duplicate candles dropped."""
+        if not self._time:
+            return []
+
+        times = np.concatenate(self._time)
+        # Reason: np.unique sorts and keeps the first candle of each timestamp
+        # (windows and pages may repeat a boundary candle)
+        times, index = np.unique(times, return_index=True)
+        columns = {field: np.concatenate(chunks)[index] for field, chunks in self._columns.items()}
+        ts_ns = times.astype(np.uint64) * np.uint64(1_000_000)  # ms → ns
+
+        return Bar.from_raw_arrays_to_list(
+            BarType.from_str(f"{instrument_id}-{bar_type_spec}-EXTERNAL"),
+            price_precision,
+            size_precision,
+            columns["open"],
+            columns["high"],
+            columns["low"],
+            columns["close"],
+            columns["volume"],
+            ts_ns,
+            ts_ns,
         )
-        bars.append(bar)
-    return bars
 
 
 def build_currency_pair(
@@ -237,6 +294,7 @@ class KrakenHistoricalClient:
         rate_limit: int = 10,
         default_maker_fee: Decimal = Decimal("0.0016"),
         default_taker_fee: Decimal = Decimal("0.0026"),
+        max_concurrency: int = 4,
     ):
         self._api_key = api_key
         self._api_secret = api_secret
@@ -246,6 +304,7 @@ class KrakenHistoricalClient:
         self._spot_market: SpotMarket | None = None
         self._connected = False
         self.rate_limiter = KrakenRateLimiter(requests_per_second=rate_limit)
+        self.max_concurrency = max(1, max_concurrency)
         self._pair_info_cache: dict[str, dict] = {}
 
     def __repr__(self) -> str:
@@ -329,7 +388,8 @@ class KrakenHistoricalClient:
 
         rest_pair = KrakenPairMapper.to_kraken_rest(user_pair)
         try:
-            all_pairs = self._spot_market.get_asset_pairs(pair=rest_pair)
+            # Reason: The SDK is synchronous; keep its HTTP call off the event loop
+            all_pairs = await asyncio.to_thread(self._spot_market.get_asset_pairs, pair=rest_pair)
             if all_pairs:
                 # Take first matching pair info
                 pair_info = next(iter(all_pairs.values()))
@@ -345,11 +405,16 @@ class KrakenHistoricalClient:
         resolution: str,
         from_ts: int,
         to_ts: int,
-    ) -> list[dict]:
-        """Fetch OHLCV candles with automatic pagination.
+    ) -> KrakenCandleBuffer:
+        """Fetch OHLCV candles for a range, one concurrent request chain per window.
+
+        The range is split into windows of at most MAX_CANDLES_PER_WINDOW
+        candles. Windows are fetched concurrently (bounded by max_concurrency,
+        every request still goes through the rate limiter) and each window
+        follows ``more_candles`` pagination on its own.
 
         Returns:
-            List of raw candle dicts from the Kraken Charts API.
+            Columnar buffer of the candles, in window order.
 
         Raises:
             KrakenConnectionError: On API failure or client not connected.
@@ -357,40 +422,73 @@ class KrakenHistoricalClient:
         if self._futures_market is None:
             raise KrakenConnectionError("Kraken client not connected. Call connect() first.")
 
-        all_candles: list[dict] = []
+        windows = plan_fetch_windows(from_ts, to_ts, resolution)
+        slots = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch_window(window: tuple[int, int]) -> KrakenCandleBuffer:
+            async with slots:
+                return await self._fetch_window(charts_sym, resolution, *window)
+
         try:
-            while True:
-                await self.rate_limiter.acquire()
-                response = self._futures_market.get_ohlc(
-                    tick_type="trade",
-                    symbol=charts_sym,
-                    resolution=resolution,
-                    from_=from_ts,
-                    to=to_ts,
-                )
-                candles = response.get("candles", [])
-                all_candles.extend(candles)
-
-                if not response.get("more_candles", False) or not candles:
-                    break
-
-                # Kraken candle "time" is in milliseconds; Charts API
-                # from_/to parameters accept seconds. Convert and advance
-                # 1 second past the last candle to avoid duplicates.
-                last_time_ms = candles[-1]["time"]
-                from_ts = (last_time_ms // 1000) + 1
-
-                logger.debug(
-                    "kraken_pagination",
-                    fetched=len(all_candles),
-                    next_from=from_ts,
-                )
+            buffers = await asyncio.gather(*(fetch_window(window) for window in windows))
         except KrakenConnectionError:
             raise
         except Exception as e:
             raise KrakenConnectionError(f"Failed to fetch OHLCV from Kraken: {e}") from e
 
-        return all_candles
+        candles = KrakenCandleBuffer()
+        for buffer in buffers:
+            candles.merge(buffer)
+
+        logger.debug(
+            "kraken_windows_fetched",
+            windows=len(windows),
+            candles=len(candles),
+        )
+
+        return candles
+
+    async def _fetch_window(
+        self,
+        charts_sym: str,
+        resolution: str,
+        from_ts: int,
+        to_ts: int,
+    ) -> KrakenCandleBuffer:
+        """Fetch one time window, following the API's pagination."""
+        assert self._futures_market is not None
+        candles = KrakenCandleBuffer()
+
+        while True:
+            await self.rate_limiter.acquire()
+            # Reason: The SDK is synchronous; keep its HTTP call off the event loop
+            response = await asyncio.to_thread(
+                self._futures_market.get_ohlc,
+                tick_type="trade",
+                symbol=charts_sym,
+                resolution=resolution,
+                from_=from_ts,
+                to=to_ts,
+            )
+            page = response.get("candles", [])
+            candles.extend(page)
+
+            if not response.get("more_candles", False) or not page:
+                break
+
+            # Kraken candle "time" is in milliseconds; Charts API
+            # from_/to parameters accept seconds. Convert and advance
+            # 1 second past the last candle to avoid duplicates.
+            last_time_ms = page[-1]["time"]
+            from_ts = (last_time_ms // 1000) + 1
+
+            logger.debug(
+                "kraken_pagination",
+                fetched=len(candles),
+                next_from=from_ts,
+            )
+
+        return candles
 
     async def fetch_bars(
         self,
@@ -415,23 +513,20 @@ class KrakenHistoricalClient:
 
         pair_info = await self._fetch_pair_info(user_pair)
 
-        all_candles = await self._paginated_fetch(
+        candles = await self._paginated_fetch(
             charts_sym, resolution, int(start.timestamp()), int(end.timestamp())
         )
 
-        if not all_candles:
+        if len(candles) == 0:
             raise DataNotFoundError(instrument_id, start, end)
 
         # Detect actual price precision from candle data — Kraken's Charts API
         # often returns higher precision than pair_decimals metadata claims.
         metadata_prec = pair_info.get("pair_decimals", 1) if pair_info else 1
-        data_prec = _detect_price_precision(all_candles)
-        price_prec = max(metadata_prec, data_prec)
+        price_prec = max(metadata_prec, candles.price_precision)
 
         size_prec = pair_info.get("lot_decimals", 8) if pair_info else 8
-        bars = convert_ohlcv_to_bars(
-            all_candles, naut_instrument_id, bar_type_spec, price_prec, size_prec
-        )
+        bars = candles.to_bars(naut_instrument_id, bar_type_spec, price_prec, size_prec)
 
         currency_pair = None
         if pair_info:
@@ -458,4 +553,4 @@ class KrakenHistoricalClient:
         """Fetch all asset pairs from Kraken Spot API."""
         if self._spot_market is None:
             raise KrakenConnectionError("Kraken client not connected.")
-        return self._spot_market.get_asset_pairs()
+        return await asyncio.to_thread(self._spot_market.get_asset_pairs)
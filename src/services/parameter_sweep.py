@@ -0,0 +1,429 @@
+"""
+Parallel parameter sweeps over a registered strategy.
+
+Bars are loaded once by the caller and placed in a shared-memory bar store;
+each worker process attaches to it in the pool initializer and builds its
+engine bars from the shared columnar arrays on its first run, so every parameter
+combination runs against the same read-only data instead of reloading it
+from the catalog or unpickling a copy per worker. Each worker keeps one
+engine loaded with those bars and resets it between combinations, so only
+the strategy changes from run to run. Workers run the engine without
+persisting; the parent process then saves all runs in one database
+session under a common sweep ID.
+"""
+
+import asyncio
+import os
+import time
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Callable
+from uuid import UUID, uuid4
+
+import pandas as pd
+import structlog
+from nautilus_trader.model.data import Bar
+from nautilus_trader.model.instruments import Instrument
+from pydantic import BaseModel, ValidationError
+
+from src.core.backtest_orchestrator import BacktestOrchestrator, save_failed_run, save_run_results
+from src.core.strategy_registry import StrategyDefinition, StrategyRegistry
+from src.db.repositories.backtest_repository import BacktestRepository
+from src.db.session import get_session
+from src.models.backtest_request import BacktestRequest
+from src.models.backtest_result import BacktestResult
+from src.models.parameter_sweep import SweepRunSummary, SweepSpec, SweepSummary
+from src.services.backtest_persistence import BacktestPersistenceService
+from src.services.shared_bars import (
+    BarArrays,
+    SharedBarHandle,
+    SharedBarStore,
+    load_shared_bars,
+    shared_bar_pool,
+    shared_bar_worker,
+)
+
+logger = structlog.get_logger(__name__)
+
+# Per-worker-process state, built from the shared bars on the worker's first run
+_worker_bars: list[Bar] | None = None
+_worker_orchestrator: BacktestOrchestrator | None = None
+
+
+@dataclass
+class SweepRunOutcome:
+    """Raw outcome of one sweep run, returned from a worker process.
+
+    Attributes:
+        result: Extracted results (None if the run failed)
+        equity_curve: Equity curve points for persistence
+        positions_df: Positions report used to capture trades
+        duration_seconds: Execution time in the worker
+        error: Error message if the run failed
+    """
+
+    result: BacktestResult | None
+    equity_curve: list[dict[str, int | float]]
+    positions_df: pd.DataFrame | None
+    duration_seconds: float
+    error: str | None = None
+
+
+def run_sweep_backtest(request: BacktestRequest) -> SweepRunOutcome:
+    """
+    Run one sweep combination on the worker's kept engine and shared bars.
+
+    Args:
+        request: Backtest request for this combination (persist is ignored)
+
+    Returns:
+        SweepRunOutcome with results and persistence artifacts
+    """
+    global _worker_bars, _worker_orchestrator
+
+    shared_bars, instrument = shared_bar_worker()
+    if _worker_bars is None or _worker_orchestrator is None:
+        _worker_bars = load_shared_bars(shared_bars)
+        _worker_orchestrator = BacktestOrchestrator(reuse_engine=True)
+
+    start = time.time()
+    orchestrator = _worker_orchestrator
+    try:
+        result, _ = asyncio.run(
+            orchestrator.execute(
+                request.model_copy(update={"persist": False}),
+                _worker_bars,
+                instrument,
+            )
+        )
+        equity_curve, positions_df = orchestrator.collect_run_artifacts()
+        return SweepRunOutcome(
+            result=result,
+            equity_curve=equity_curve,
+            positions_df=positions_df,
+            duration_seconds=time.time() - start,
+        )
+    except Exception as e:
+        return SweepRunOutcome(
+            result=None,
+            equity_curve=[],
+            positions_df=None,
+            duration_seconds=time.time() - start,
+            error=str(e),
+        )
+
+
+def resolve_strategy_definition(request: BacktestRequest) -> StrategyDefinition | None:
+    """
+    Find the registered strategy of a request.
+
+    Looks up the strategy by name/alias first, then by config class path
+    (for YAML-based requests whose strategy_type is derived from the class).
+
+    Args:
+        request: Base backtest request
+
+    Returns:
+        Strategy definition, or None if the strategy is not registered
+    """
+    StrategyRegistry.discover()
+
+    if StrategyRegistry.exists(request.strategy_type):
+        return StrategyRegistry.get(request.strategy_type)
+
+    for definition in StrategyRegistry.get_all().values():
+        if request.config_path and definition.config_path == request.config_path:
+            return definition
+
+    return None
+
+
+def resolve_param_model(request: BacktestRequest) -> type[BaseModel] | None:
+    """
+    Find the registered parameter model for a request's strategy.
+
+    Args:
+        request: Base backtest request
+
+    Returns:
+        Parameter model class, or None if the strategy has none registered
+    """
+    definition = resolve_strategy_definition(request)
+    return definition.param_model if definition is not None else None
+
+
+def build_sweep_requests(
+    base_request: BacktestRequest,
+    spec: SweepSpec,
+) -> tuple[list[tuple[dict[str, Any], BacktestRequest]], int]:
+    """
+    Expand a search space into one backtest request per valid combination.
+
+    Each combination is merged over the base request's strategy config and
+    validated against the strategy's registered parameter model; combinations
+    the model rejects (e.g., fast_period >= slow_period) are skipped.
+
+    Args:
+        base_request: Request providing symbol, dates, bars and base config
+        spec: Search space
+
+    Returns:
+        Tuple of ([(params, request), ...], skipped count)
+
+    Raises:
+        ValueError: If a swept parameter is not a field of the parameter model
+    """
+    param_model = resolve_param_model(base_request)
+
+    if param_model is not None:
+        unknown = sorted(set(spec.params) - set(param_model.model_fields))
+        if unknown:
+            raise ValueError(
+                f"Unknown parameter(s) for {base_request.strategy_type}: {', '.join(unknown)}. "
+                f"Available: {', '.join(param_model.model_fields)}"
+            )
+
+    requests: list[tuple[dict[str, Any], BacktestRequest]] = []
+    skipped = 0
+
+    for params in spec.combinations():
+        strategy_config = {**base_request.strategy_config, **params}
+
+        if param_model is not None:
+            known = {k: v for k, v in strategy_config.items() if k in param_model.model_fields}
+            try:
+                param_model(**known)
+            except ValidationError as e:
+                logger.debug("sweep_combination_skipped", params=params, error=str(e))
+                skipped += 1
+                continue
+
+        requests.append(
+            (params, base_request.model_copy(update={"strategy_config": strategy_config}))
+        )
+
+    return requests, skipped
+
+
+class ParameterSweepService:
+    """
+    Run parameter sweeps across a pool of worker processes.
+
+    Attributes:
+        max_workers: Number of worker processes
+
+    Example:
+        >>> service = ParameterSweepService(max_workers=4)
+        >>> spec = SweepSpec(params={"fast_period": [5, 10], "slow_period": [20, 50]})
+        >>> summary = await service.run(base_request, spec, bars, instrument)
+        >>> best = summary.ranked("sharpe_ratio")[0]
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        executor_factory: Callable[[SharedBarHandle, Instrument], Executor] | None = None,
+    ) -> None:
+        """
+        Initialize ParameterSweepService.
+
+        Args:
+            max_workers: Worker process count (defaults to the CPU count)
+            executor_factory: Optional factory building the executor from the
+                              shared bar handle and instrument (used by tests)
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._executor_factory = executor_factory or self._process_pool
+
+    def _process_pool(self, shared_bars: SharedBarHandle, instrument: Instrument) -> Executor:
+        """Create a process pool attached to the shared bars (see shared_bar_pool)."""
+        return shared_bar_pool(shared_bars, instrument, self.max_workers)
+
+    async def run(
+        self,
+        base_request: BacktestRequest,
+        spec: SweepSpec,
+        bars: list[Bar] | BarArrays,
+        instrument: Instrument,
+        persist: bool = True,
+        on_progress: Callable[[int, int], None] | None = None,
+    ) -> SweepSummary:
+        """
+        Run every combination of the search space and optionally persist them.
+
+        Args:
+            base_request: Request providing symbol, dates and base strategy config
+            spec: Search space
+            bars: Pre-loaded bars (or columnar arrays) shared by all runs
+            instrument: Instrument for the backtests
+            persist: Save all runs under a common sweep ID
+            on_progress: Optional callback invoked with (completed, total)
+
+        Returns:
+            SweepSummary with per-combination outcomes
+
+        Raises:
+            ValueError: If bars are empty, a parameter is unknown, or no
+                        combination passes validation
+        """
+        if not len(bars):
+            raise ValueError("No bars provided for parameter sweep")
+
+        sweep_id = uuid4()
+        sweep_start = time.time()
+        requests, skipped = build_sweep_requests(base_request, spec)
+        if not requests:
+            raise ValueError("No valid parameter combinations to run")
+
+        logger.info(
+            "parameter_sweep_started",
+            sweep_id=str(sweep_id),
+            strategy=base_request.strategy_type,
+            combinations=len(requests),
+            skipped=skipped,
+            workers=self.max_workers,
+        )
+
+        arrays = bars if isinstance(bars, BarArrays) else BarArrays.from_bars(bars)
+        store = SharedBarStore(arrays)
+        loop = asyncio.get_running_loop()
+        executor = self._executor_factory(store.handle, instrument)
+        try:
+            futures = [
+                loop.run_in_executor(executor, run_sweep_backtest, request)
+                for _, request in requests
+            ]
+            completed = 0
+
+            async def _tracked(future: asyncio.Future) -> SweepRunOutcome:
+                nonlocal completed
+                outcome = await future
+                completed += 1
+                if on_progress is not None:
+                    on_progress(completed, len(futures))
+                return outcome
+
+            outcomes = await asyncio.gather(*(_tracked(f) for f in futures))
+        finally:
+            executor.shutdown(wait=True)
+            store.close()
+
+        run_ids: list[UUID | None] = [None] * len(outcomes)
+        if persist:
+            run_ids = await self._persist(sweep_id, requests, outcomes)
+
+        runs = [
+            self._summarize(params, outcome, run_id)
+            for (params, _), outcome, run_id in zip(requests, outcomes, run_ids)
+        ]
+
+        summary = SweepSummary(
+            sweep_id=sweep_id,
+            strategy=base_request.strategy_type,
+            symbol=base_request.symbol,
+            runs=runs,
+            skipped=skipped,
+            duration_seconds=time.time() - sweep_start,
+        )
+
+        logger.info(
+            "parameter_sweep_completed",
+            sweep_id=str(sweep_id),
+            runs=len(runs),
+            failed=sum(1 for run in runs if not run.success),
+            duration_seconds=round(summary.duration_seconds, 2),
+        )
+
+        return summary
+
+    async def _persist(
+        self,
+        sweep_id: UUID,
+        requests: list[tuple[dict[str, Any], BacktestRequest]],
+        outcomes: list[SweepRunOutcome],
+    ) -> list[UUID | None]:
+        """
+        Save all sweep runs in one session and transaction.
+
+        Each run is saved inside a savepoint so one invalid run does not
+        discard the rest of the sweep.
+
+        Returns:
+            Persisted run IDs aligned with outcomes (None where saving failed)
+        """
+        run_ids: list[UUID | None] = []
+
+        async with get_session() as session:
+            service = BacktestPersistenceService(BacktestRepository(session))
+
+            for (_, request), outcome in zip(requests, outcomes):
+                run_id = uuid4()
+                duration = Decimal(str(round(outcome.duration_seconds, 3)))
+                try:
+                    async with session.begin_nested():
+                        if outcome.result is not None:
+                            await save_run_results(
+                                service,
+                                run_id=run_id,
+                                request=request,
+                                result=outcome.result,
+                                execution_duration=duration,
+                                equity_curve=outcome.equity_curve,
+                                positions_df=outcome.positions_df,
+                                sweep_id=sweep_id,
+                            )
+                        else:
+                            await save_failed_run(
+                                service,
+                                run_id=run_id,
+                                request=request,
+                                error_message=outcome.error or "Unknown error",
+                                execution_duration=duration,
+                                sweep_id=sweep_id,
+                            )
+                    run_ids.append(run_id)
+                except Exception as e:
+                    logger.warning(
+                        "sweep_run_persist_failed",
+                        sweep_id=str(sweep_id),
+                        error=str(e),
+                    )
+                    run_ids.append(None)
+
+            await session.commit()
+
+        logger.info(
+            "parameter_sweep_persisted",
+            sweep_id=str(sweep_id),
+            persisted=sum(1 for run_id in run_ids if run_id is not None),
+        )
+
+        return run_ids
+
+    @staticmethod
+    def _summarize(
+        params: dict[str, Any],
+        outcome: SweepRunOutcome,
+        run_id: UUID | None,
+    ) -> SweepRunSummary:
+        """Condense a worker outcome into a SweepRunSummary."""
+        if outcome.result is None:
+            return SweepRunSummary(
+                params=params,
+                run_id=run_id,
+                success=False,
+                error_message=outcome.error,
+                duration_seconds=outcome.duration_seconds,
+            )
+
+        result = outcome.result
+        return SweepRunSummary(
+            params=params,
+            run_id=run_id,
+            total_return=result.total_return,
+            sharpe_ratio=result.sharpe_ratio,
+            max_drawdown=result.max_drawdown,
+            total_trades=result.total_trades,
+            duration_seconds=outcome.duration_seconds,
+        )
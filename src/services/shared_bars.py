@@ -0,0 +1,563 @@
+"""
+Shared-memory bar store for backtest worker processes.
+
+Bars are held as columnar NumPy arrays (OHLCV as float64, timestamps as
+uint64) in a single ``multiprocessing.shared_memory`` block. The owning
+process loads an instrument's bars once; worker processes attach read-only
+by name, slice the arrays to their date range and build Nautilus ``Bar``
+objects directly from the views, instead of each worker re-reading Parquet
+or unpickling a ``list[Bar]``.
+"""
+
+import hashlib
+import multiprocessing
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from multiprocessing import shared_memory
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pyarrow as pa
+import structlog
+from nautilus_trader.model.data import Bar, BarType
+from nautilus_trader.model.instruments import Instrument
+
+if TYPE_CHECKING:
+    from src.services.data_catalog import DataCatalogService
+
+logger = structlog.get_logger(__name__)
+
+PRICE_COLUMNS = ("open", "high", "low", "close", "volume")
+TIMESTAMP_COLUMNS = ("ts_event", "ts_init")
+
+# Per-worker-process state, set once by init_shared_bar_worker
+_worker_bars: "SharedBarHandle | None" = None
+_worker_instrument: Instrument | None = None
+
+# Reason: Nautilus stores raw fixed-point values; the binary width tells us
+# whether the catalog was written in high (16 bytes) or standard precision
+_FIXED_SCALARS = {16: 1e16, 8: 1e9}
+
+
+def _decode_fixed_binary(column: pa.ChunkedArray | pa.Array) -> np.ndarray:
+    """Decode a Nautilus fixed-point binary column to float64 values."""
+    if isinstance(column, pa.ChunkedArray):
+        column = column.combine_chunks()
+
+    width = column.type.byte_width
+    scalar = _FIXED_SCALARS.get(width)
+    if scalar is None:
+        raise ValueError(f"Unsupported fixed-point width: {width} bytes")
+
+    # Reason: Buffer 1 holds the contiguous fixed-size values (buffer 0 is validity)
+    start = column.offset * width
+    raw = np.frombuffer(column.buffers()[1], dtype=np.uint8)[start : start + len(column) * width]
+
+    if width == 8:
+        return raw.view("<i8").astype(np.float64) / scalar
+
+    # Reason: Signed little-endian int128 = high (signed) * 2**64 + low (unsigned)
+    words = raw.view("<u8").reshape(-1, 2)
+    high = words[:, 1].view(np.int64).astype(np.float64)
+    low = words[:, 0].astype(np.float64)
+    return (high * 2.0**64 + low) / scalar
+
+
+@dataclass
+class BarArrays:
+    """
+    Columnar OHLCV bars for one bar type, sorted by ts_init.
+
+    Attributes:
+        bar_type: Bar type string (e.g., "AAPL.NASDAQ-1-DAY-LAST-EXTERNAL")
+        price_precision: Price precision of the bars
+        size_precision: Volume precision of the bars
+        open, high, low, close, volume: float64 arrays
+        ts_event, ts_init: uint64 UNIX nanosecond arrays
+
+    Example:
+        >>> arrays = BarArrays.from_bars(bars)
+        >>> window = arrays.slice(start, end)
+        >>> engine_bars = window.to_bars()
+    """
+
+    bar_type: str
+    price_precision: int
+    size_precision: int
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    ts_event: np.ndarray
+    ts_init: np.ndarray
+
+    def __len__(self) -> int:
+        """Number of bars."""
+        return len(self.ts_init)
+
+    @property
+    def nbytes(self) -> int:
+        """Total size of the column arrays in bytes."""
+        return sum(getattr(self, name).nbytes for name in PRICE_COLUMNS + TIMESTAMP_COLUMNS)
+
+    def digest(self) -> str:
+        """
+        Content hash of the bars.
+
+        Covers the bar type, precisions and every column, so any change to the
+        bars (a re-import, a different date range) changes the digest.
+
+        Returns:
+            SHA-256 hex digest
+        """
+        hasher = hashlib.sha256(
+            f"{self.bar_type}/{self.price_precision}/{self.size_precision}".encode()
+        )
+        for name in PRICE_COLUMNS + TIMESTAMP_COLUMNS:
+            hasher.update(np.ascontiguousarray(getattr(self, name)).tobytes())
+        return hasher.hexdigest()
+
+    @classmethod
+    def from_bars(cls, bars: list[Bar]) -> "BarArrays":
+        """
+        Build columnar arrays from Nautilus Bar objects.
+
+        Args:
+            bars: Non-empty list of bars of a single bar type
+
+        Returns:
+            BarArrays holding copies of the bar values
+
+        Raises:
+            ValueError: If bars is empty
+        """
+        if not bars:
+            raise ValueError("Cannot build bar arrays from an empty bar list")
+
+        first = bars[0]
+        count = len(bars)
+        return cls(
+            bar_type=str(first.bar_type),
+            price_precision=first.open.precision,
+            size_precision=first.volume.precision,
+            open=np.fromiter((b.open.as_double() for b in bars), np.float64, count),
+            high=np.fromiter((b.high.as_double() for b in bars), np.float64, count),
+            low=np.fromiter((b.low.as_double() for b in bars), np.float64, count),
+            close=np.fromiter((b.close.as_double() for b in bars), np.float64, count),
+            volume=np.fromiter((b.volume.as_double() for b in bars), np.float64, count),
+            ts_event=np.fromiter((b.ts_event for b in bars), np.uint64, count),
+            ts_init=np.fromiter((b.ts_init for b in bars), np.uint64, count),
+        )
+
+    @classmethod
+    def from_arrow_table(cls, table: pa.Table) -> "BarArrays":
+        """
+        Decode a Nautilus bar Parquet table without creating Bar objects.
+
+        Args:
+            table: Table read from a catalog bar file (schema metadata must
+                   include bar_type, price_precision and size_precision)
+
+        Returns:
+            BarArrays sorted by ts_init
+        """
+        metadata = table.schema.metadata or {}
+        ts_init = table.column("ts_init").to_numpy().astype(np.uint64, copy=False)
+        order = np.argsort(ts_init, kind="stable")
+
+        columns = {name: _decode_fixed_binary(table.column(name))[order] for name in PRICE_COLUMNS}
+        return cls(
+            bar_type=metadata[b"bar_type"].decode(),
+            price_precision=int(metadata[b"price_precision"]),
+            size_precision=int(metadata[b"size_precision"]),
+            ts_event=table.column("ts_event").to_numpy().astype(np.uint64)[order],
+            ts_init=ts_init[order],
+            **columns,
+        )
+
+    def slice(self, start: datetime | None = None, end: datetime | None = None) -> "BarArrays":
+        """
+        Select the bars whose ts_init falls within [start, end].
+
+        Returns views into the same buffers (no copy).
+
+        Args:
+            start: Inclusive start (None for the first bar)
+            end: Inclusive end (None for the last bar)
+
+        Returns:
+            BarArrays view for the requested window
+        """
+        lo = 0 if start is None else int(np.searchsorted(self.ts_init, _to_ns(start), "left"))
+        hi = len(self) if end is None else int(np.searchsorted(self.ts_init, _to_ns(end), "right"))
+        window = slice(lo, hi)
+        return BarArrays(
+            bar_type=self.bar_type,
+            price_precision=self.price_precision,
+            size_precision=self.size_precision,
+            **{name: getattr(self, name)[window] for name in PRICE_COLUMNS + TIMESTAMP_COLUMNS},
+        )
+
+    def to_bars(self) -> list[Bar]:
+        """
+        Build Nautilus Bar objects for the backtest engine.
+
+        Returns:
+            List of Bar objects in ts_init order
+        """
+        if not len(self):
+            return []
+
+        return Bar.from_raw_arrays_to_list(
+            BarType.from_str(self.bar_type),
+            self.price_precision,
+            self.size_precision,
+            *(np.ascontiguousarray(getattr(self, name)) for name in PRICE_COLUMNS),
+            *(np.ascontiguousarray(getattr(self, name)) for name in TIMESTAMP_COLUMNS),
+        )
+
+
+def _to_ns(value: datetime) -> int:
+    """Convert a datetime to UNIX nanoseconds."""
+    return int(value.timestamp() * 1e9)
+
+
+@dataclass(frozen=True)
+class SharedBarHandle:
+    """
+    Picklable reference to bars held in shared memory.
+
+    Attributes:
+        shm_name: Shared memory block name
+        bar_type: Bar type string
+        price_precision: Price precision of the bars
+        size_precision: Volume precision of the bars
+        count: Number of bars
+    """
+
+    shm_name: str
+    bar_type: str
+    price_precision: int
+    size_precision: int
+    count: int
+
+
+def _layout(buffer, count: int) -> dict[str, np.ndarray]:
+    """Map column names to array views over a shared memory buffer."""
+    columns: dict[str, np.ndarray] = {}
+    offset = 0
+    for name in PRICE_COLUMNS + TIMESTAMP_COLUMNS:
+        dtype = np.float64 if name in PRICE_COLUMNS else np.uint64
+        columns[name] = np.ndarray((count,), dtype=dtype, buffer=buffer, offset=offset)
+        offset += count * 8
+    return columns
+
+
+class SharedBarStore:
+    """
+    Owner of one bar series in shared memory.
+
+    The creating process must call close() (or use the store as a context
+    manager) to release the block; attached workers only read from it.
+
+    Example:
+        >>> with SharedBarStore(BarArrays.from_bars(bars)) as store:
+        ...     pool = ProcessPoolExecutor(initializer=init, initargs=(store.handle,))
+    """
+
+    def __init__(self, arrays: BarArrays) -> None:
+        """
+        Copy bar arrays into a new shared memory block.
+
+        Args:
+            arrays: Columnar bars to share
+        """
+        count = len(arrays)
+        columns = PRICE_COLUMNS + TIMESTAMP_COLUMNS
+        # Reason: Zero-size shared memory blocks are not allowed
+        self._shm = shared_memory.SharedMemory(create=True, size=max(count * 8 * len(columns), 1))
+
+        for name, view in _layout(self._shm.buf, count).items():
+            view[:] = getattr(arrays, name)
+
+        self.handle = SharedBarHandle(
+            shm_name=self._shm.name,
+            bar_type=arrays.bar_type,
+            price_precision=arrays.price_precision,
+            size_precision=arrays.size_precision,
+            count=count,
+        )
+        self._closed = False
+
+        logger.debug(
+            "shared_bars_created",
+            shm_name=self._shm.name,
+            bar_type=arrays.bar_type,
+            count=count,
+            size_bytes=self._shm.size,
+        )
+
+    @classmethod
+    def from_bars(cls, bars: list[Bar]) -> "SharedBarStore":
+        """Create a store from Nautilus Bar objects."""
+        return cls(BarArrays.from_bars(bars))
+
+    def close(self) -> None:
+        """Release and unlink the shared memory block (idempotent)."""
+        if self._closed:
+            return
+        self._closed = True
+        self._shm.close()
+        self._shm.unlink()
+        logger.debug("shared_bars_released", shm_name=self.handle.shm_name)
+
+    def __enter__(self) -> "SharedBarStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def load_shared_bars(
+    handle: SharedBarHandle,
+    start: datetime | None = None,
+    end: datetime | None = None,
+) -> list[Bar]:
+    """
+    Attach to shared bars and build Bar objects for a date window.
+
+    The shared block is only mapped while the bars are built, so the worker
+    keeps no reference to it afterwards.
+
+    Args:
+        handle: Handle from SharedBarStore.handle
+        start: Inclusive start (None for the first bar)
+        end: Inclusive end (None for the last bar)
+
+    Returns:
+        Bars within the window, in ts_init order
+
+    Raises:
+        FileNotFoundError: If the owning process has already released the block
+    """
+    shm = shared_memory.SharedMemory(name=handle.shm_name)
+    try:
+        arrays = BarArrays(
+            bar_type=handle.bar_type,
+            price_precision=handle.price_precision,
+            size_precision=handle.size_precision,
+            **_layout(shm.buf, handle.count),
+        )
+        bars = arrays.slice(start, end).to_bars()
+        # Reason: Drop array views before closing, or the buffer cannot be released
+        del arrays
+        return bars
+    finally:
+        shm.close()
+
+
+def init_shared_bar_worker(shared_bars: SharedBarHandle, instrument: Instrument) -> None:
+    """
+    Initialize a pool worker process with a shared bar handle and instrument.
+
+    Only the handle is kept; callers build the bars they need with
+    load_shared_bars. Nautilus logging is initialized once per worker
+    (warnings only) so consecutive engines in the same process do not
+    re-initialize it.
+
+    Args:
+        shared_bars: Handle from SharedBarStore.handle
+        instrument: Instrument the worker's backtests trade
+    """
+    global _worker_bars, _worker_instrument
+
+    from nautilus_trader.common.component import init_logging
+    from nautilus_trader.common.enums import LogLevel
+
+    from src.utils.logging import set_nautilus_log_guard
+
+    set_nautilus_log_guard(init_logging(level_stdout=LogLevel.WARNING))
+
+    _worker_bars = shared_bars
+    _worker_instrument = instrument
+
+
+def shared_bar_worker() -> tuple[SharedBarHandle, Instrument]:
+    """
+    Get the shared bar handle and instrument of this worker process.
+
+    Returns:
+        Tuple of (shared bar handle, instrument)
+
+    Raises:
+        RuntimeError: If the process was not started by shared_bar_pool
+    """
+    if _worker_bars is None or _worker_instrument is None:
+        raise RuntimeError("Worker was not initialized with shared bar data")
+    return _worker_bars, _worker_instrument
+
+
+def shared_bar_pool(
+    shared_bars: SharedBarHandle, instrument: Instrument, max_workers: int
+) -> ProcessPoolExecutor:
+    """
+    Create a process pool whose workers are attached to shared bars.
+
+    Args:
+        shared_bars: Handle from SharedBarStore.handle
+        instrument: Instrument the workers' backtests trade
+        max_workers: Number of worker processes
+
+    Returns:
+        ProcessPoolExecutor running init_shared_bar_worker in every worker
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        # Reason: Nautilus is not fork-safe
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=init_shared_bar_worker,
+        initargs=(shared_bars, instrument),
+    )
+
+
+@dataclass
+class _CacheEntry:
+    """A cached shared bar series and the catalog state it was loaded from."""
+
+    store: SharedBarStore
+    signature: tuple
+    refs: int = 0
+
+
+class SharedBarCache:
+    """
+    Process-wide cache of catalog bar series held in shared memory.
+
+    Each (instrument, bar type) series is loaded once from the catalog into
+    shared memory and reused by every job that requests it. Entries are
+    reference counted so a block is never released while a worker may still
+    attach to it, and reloaded when the catalog availability changes.
+
+    Example:
+        >>> cache = SharedBarCache(catalog_service)
+        >>> handle = cache.acquire("AAPL.NASDAQ", "1-DAY-LAST", start, end)
+        >>> try:
+        ...     bars = load_shared_bars(handle, start, end)  # in a worker
+        ... finally:
+        ...     cache.release(handle)
+    """
+
+    def __init__(self, catalog_service: "DataCatalogService", max_entries: int = 4) -> None:
+        """
+        Initialize SharedBarCache.
+
+        Args:
+            catalog_service: Catalog used to load bar series
+            max_entries: Idle series kept in shared memory before eviction
+        """
+        self.catalog_service = catalog_service
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], _CacheEntry] = OrderedDict()
+        self._retired: dict[str, _CacheEntry] = {}
+        self._lock = threading.Lock()
+
+    def acquire(
+        self,
+        instrument_id: str,
+        bar_type_spec: str,
+        start: datetime,
+        end: datetime,
+    ) -> SharedBarHandle | None:
+        """
+        Get a shared series covering [start, end], loading it if needed.
+
+        Blocking (reads Parquet on a miss); call from a thread in async code.
+        Every returned handle must be passed to release().
+
+        Args:
+            instrument_id: Instrument identifier (e.g., "AAPL.NASDAQ")
+            bar_type_spec: Bar type specification (e.g., "1-DAY-LAST")
+            start: Requested start
+            end: Requested end
+
+        Returns:
+            Handle to the shared series, or None if the catalog does not
+            fully cover the range (callers fall back to the fetching path)
+        """
+        availability = self.catalog_service.get_availability(instrument_id, bar_type_spec)
+        if availability is None or not availability.covers_range(start, end):
+            return None
+
+        key = (instrument_id, bar_type_spec)
+        signature = (availability.end_date, availability.file_count, availability.total_rows)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.signature != signature:
+                self._retire(key)
+                entry = None
+
+            if entry is None:
+                arrays = self.catalog_service.query_bar_arrays(instrument_id, bar_type_spec)
+                entry = _CacheEntry(store=SharedBarStore(arrays), signature=signature)
+                self._entries[key] = entry
+                logger.info(
+                    "shared_bars_loaded",
+                    instrument_id=instrument_id,
+                    bar_type_spec=bar_type_spec,
+                    count=len(arrays),
+                    size_bytes=arrays.nbytes,
+                )
+
+            entry.refs += 1
+            self._entries.move_to_end(key)
+            self._evict_idle()
+            return entry.store.handle
+
+    def release(self, handle: SharedBarHandle) -> None:
+        """
+        Release a handle returned by acquire().
+
+        Args:
+            handle: Handle to release
+        """
+        with self._lock:
+            retired = self._retired.get(handle.shm_name)
+            if retired is not None:
+                retired.refs -= 1
+                if retired.refs <= 0:
+                    retired.store.close()
+                    del self._retired[handle.shm_name]
+                return
+
+            for entry in self._entries.values():
+                if entry.store.handle.shm_name == handle.shm_name:
+                    entry.refs = max(0, entry.refs - 1)
+                    break
+            self._evict_idle()
+
+    def close(self) -> None:
+        """Release every shared series, including ones still referenced."""
+        with self._lock:
+            for entry in list(self._entries.values()) + list(self._retired.values()):
+                entry.store.close()
+            self._entries.clear()
+            self._retired.clear()
+
+    def _retire(self, key: tuple[str, str]) -> None:
+        """Remove a stale entry, keeping it alive until its last release."""
+        entry = self._entries.pop(key)
+        if entry.refs > 0:
+            self._retired[entry.store.handle.shm_name] = entry
+        else:
+            entry.store.close()
+
+    def _evict_idle(self) -> None:
+        """Close least recently used idle entries beyond max_entries."""
+        excess = len(self._entries) - self.max_entries
+        for key in [k for k, e in self._entries.items() if e.refs == 0][: max(0, excess)]:
+            self._entries.pop(key).store.close()
@@ -0,0 +1,216 @@
+"""
+Signal screening of a parameter grid, reconciled against full backtests.
+
+Every valid combination of a search space is valued in one process with the
+strategy's vectorized signal function over the same NumPy bar arrays (see
+src.core.signal_screening), sharing indicator series between combinations.
+The best candidates are then re-run with the event-driven
+BacktestOrchestrator so the approximation can be checked before any of its
+results are trusted.
+"""
+
+import time
+from typing import Callable
+
+import structlog
+from nautilus_trader.model.data import Bar
+from nautilus_trader.model.instruments import Instrument
+
+from src.config import get_settings
+from src.core.backtest_orchestrator import BacktestOrchestrator
+from src.core.signal_screening import ScreenBars, evaluate_positions
+from src.core.strategy_factory import StrategyLoader
+from src.models.backtest_request import BacktestRequest
+from src.models.parameter_sweep import SweepRunSummary, SweepSpec
+from src.models.signal_screen import ScreenCandidate, ScreenReconciliation, ScreenSummary
+from src.services.parameter_sweep import build_sweep_requests, resolve_strategy_definition
+from src.services.shared_bars import BarArrays
+
+logger = structlog.get_logger(__name__)
+
+
+class SignalScreeningService:
+    """
+    Screen parameter grids with vectorized signals and reconcile the best.
+
+    Example:
+        >>> service = SignalScreeningService()
+        >>> summary = service.screen(base_request, spec, bars)
+        >>> summary = await service.reconcile(summary, base_request, bars, instrument, top=3)
+        >>> for item in summary.reconciliations:
+        ...     print(item.screened.params, item.return_difference)
+    """
+
+    def __init__(
+        self,
+        orchestrator_factory: Callable[[], BacktestOrchestrator] | None = None,
+    ) -> None:
+        """
+        Initialize SignalScreeningService.
+
+        Args:
+            orchestrator_factory: Optional factory for the orchestrators that
+                                  run reconciliation backtests (used by tests)
+        """
+        self._orchestrator_factory = orchestrator_factory or BacktestOrchestrator
+
+    def screen(
+        self,
+        base_request: BacktestRequest,
+        spec: SweepSpec,
+        bars: list[Bar] | BarArrays,
+    ) -> ScreenSummary:
+        """
+        Value every valid combination of the search space.
+
+        Args:
+            base_request: Request providing symbol, starting balance and base config
+            spec: Search space
+            bars: Pre-loaded bars (or columnar arrays) shared by all combinations
+
+        Returns:
+            ScreenSummary with one candidate per valid combination
+
+        Raises:
+            ValueError: If bars are empty, the strategy has no signal function,
+                        a parameter is unknown, or no combination is valid
+        """
+        if not len(bars):
+            raise ValueError("No bars provided for signal screening")
+
+        definition = resolve_strategy_definition(base_request)
+        if definition is None or definition.signal_function is None:
+            raise ValueError(
+                f"Strategy {base_request.strategy_type} has no vectorized signal function"
+            )
+        signal_function = definition.signal_function
+
+        started = time.time()
+        requests, skipped = build_sweep_requests(base_request, spec)
+        if not requests:
+            raise ValueError("No valid parameter combinations to screen")
+
+        arrays = bars if isinstance(bars, BarArrays) else BarArrays.from_bars(bars)
+        screen_bars = ScreenBars(arrays)
+        starting_balance = float(base_request.starting_balance)
+        settings = get_settings()
+
+        candidates = []
+        for params, request in requests:
+            strategy_params = StrategyLoader.build_strategy_params(
+                definition.name, request.strategy_config, settings
+            )
+            positions = signal_function(screen_bars, strategy_params)
+            metrics = evaluate_positions(screen_bars, positions, starting_balance)
+            candidates.append(
+                ScreenCandidate(
+                    params=params,
+                    total_pnl=metrics.total_pnl,
+                    total_return=metrics.total_return,
+                    sharpe_ratio=metrics.sharpe_ratio,
+                    max_drawdown=metrics.max_drawdown,
+                    total_trades=metrics.total_trades,
+                )
+            )
+
+        summary = ScreenSummary(
+            strategy=base_request.strategy_type,
+            symbol=base_request.symbol,
+            bar_count=len(screen_bars),
+            candidates=candidates,
+            skipped=skipped,
+            duration_seconds=time.time() - started,
+        )
+
+        logger.info(
+            "signal_screen_completed",
+            strategy=definition.name,
+            combinations=len(candidates),
+            skipped=skipped,
+            bars=len(screen_bars),
+            duration_seconds=round(summary.duration_seconds, 3),
+        )
+
+        return summary
+
+    async def reconcile(
+        self,
+        summary: ScreenSummary,
+        base_request: BacktestRequest,
+        bars: list[Bar] | BarArrays,
+        instrument: Instrument,
+        top: int = 3,
+        rank_by: str = "sharpe_ratio",
+        on_progress: Callable[[int, int], None] | None = None,
+    ) -> ScreenSummary:
+        """
+        Re-run the best screened candidates as full event-driven backtests.
+
+        Args:
+            summary: Result of screen()
+            base_request: The request the screen was built from
+            bars: The bars the screen was run over
+            instrument: Instrument for the backtests
+            top: Number of best candidates to reconcile
+            rank_by: Metric ranking the candidates
+            on_progress: Optional callback invoked with (completed, total)
+
+        Returns:
+            Copy of summary with reconciliations filled in
+        """
+        best = summary.ranked(rank_by)[:top]
+        engine_bars = bars.to_bars() if isinstance(bars, BarArrays) else bars
+
+        reconciliations = []
+        for completed, candidate in enumerate(best, start=1):
+            request = base_request.model_copy(
+                update={
+                    "strategy_config": {**base_request.strategy_config, **candidate.params},
+                    "persist": False,
+                }
+            )
+            full = await self._run_full(candidate, request, engine_bars, instrument)
+            reconciliations.append(ScreenReconciliation(screened=candidate, full=full))
+            if on_progress is not None:
+                on_progress(completed, len(best))
+
+        logger.info(
+            "signal_screen_reconciled",
+            strategy=summary.strategy,
+            candidates=len(reconciliations),
+            failed=sum(1 for item in reconciliations if not item.full.success),
+        )
+
+        return summary.model_copy(update={"reconciliations": reconciliations})
+
+    async def _run_full(
+        self,
+        candidate: ScreenCandidate,
+        request: BacktestRequest,
+        bars: list[Bar],
+        instrument: Instrument,
+    ) -> SweepRunSummary:
+        """Run one candidate through the orchestrator and summarize the outcome."""
+        started = time.time()
+        orchestrator = self._orchestrator_factory()
+        try:
+            result, _ = await orchestrator.execute(request, bars, instrument)
+        except Exception as e:
+            logger.warning("signal_screen_full_run_failed", params=candidate.params, error=str(e))
+            return SweepRunSummary(
+                params=candidate.params,
+                success=False,
+                error_message=str(e),
+                duration_seconds=time.time() - started,
+            )
+        finally:
+            orchestrator.dispose()
+
+        return SweepRunSummary(
+            params=candidate.params,
+            total_return=result.total_return,
+            sharpe_ratio=result.sharpe_ratio,
+            max_drawdown=result.max_drawdown,
+            total_trades=result.total_trades,
+            duration_seconds=time.time() - started,
+        )
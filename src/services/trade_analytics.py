@@ -3,11 +3,18 @@ Trade analytics service for equity curve generation and performance metrics.
 
 This module provides functions for analyzing trade history and generating
 performance visualizations including equity curves, drawdown metrics, and
-trade statistics.
+trade statistics. Statistics and drawdowns are computed over TradeColumns,
+NumPy columns of exact integer profit/loss, so a run's full trade history is
+analyzed with array operations and converted to Decimal only for results.
 """
 
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from decimal import ROUND_HALF_UP, Decimal
+from functools import cached_property
+from typing import Any, Callable, Optional, Sequence
+
+import numpy as np
 
 from src.models.trade import (
     DrawdownMetrics,
@@ -18,6 +25,27 @@ from src.models.trade import (
     TradeStatistics,
 )
 
+# Reason: Bump when statistics or drawdown semantics change so persisted
+# trade analytics are recomputed instead of served stale
+TRADE_ANALYTICS_VERSION = 1
+
+# Trade columns the analytics are computed from, in row order
+TRADE_ANALYTICS_COLUMNS = (
+    "entry_timestamp",
+    "exit_timestamp",
+    "profit_loss",
+    "holding_period_seconds",
+)
+
+# Losses above this amount (between -10 and 0, basically just commission) are breakeven
+_BREAKEVEN_FLOOR = Decimal("-10")
+
+_INT64_MAX = int(np.iinfo(np.int64).max)
+
+# Fewest decimal places a profit/loss read at a fixed scale is written with
+# Reason: Database values carry the column's trailing zeros; keep cents only
+_MIN_SCALED_PLACES = 2
+
 
 def generate_equity_curve(
     trades: list[Trade],
@@ -123,30 +151,199 @@ def generate_equity_curve(
     )
 
 
-def calculate_trade_statistics(trades: list[Trade]) -> TradeStatistics:
+@dataclass(frozen=True)
+class TradeColumns:
+    """
+    Closed trades of a run as NumPy columns, the input of the analytics below.
+
+    Profit/loss is held as exact integers in units of 10**-scale, so sums,
+    comparisons and running balances never round; values become Decimal
+    again only for the reported results, with the decimal places they were
+    written with.
+
+    Attributes:
+        first_entry: Entry time of the first trade (open or closed), where the
+            equity curve starts; None without trades
+        exit_timestamps: Exit time of each closed trade, in input order
+        profit_loss: Profit/loss of each closed trade in units of 10**-scale
+        places: Decimal places each profit/loss was written with
+        holding_seconds: Holding periods of the closed trades that have one
+        scale: Largest number of decimal places among profit/loss values
+
+    Example:
+        >>> columns = TradeColumns.from_trades(trades)
+        >>> stats = calculate_column_statistics(columns)
+        >>> drawdowns = calculate_column_drawdowns(columns, Decimal("100000"))
+    """
+
+    first_entry: Optional[datetime]
+    exit_timestamps: list[datetime]
+    profit_loss: np.ndarray
+    places: np.ndarray
+    holding_seconds: np.ndarray
+    scale: int
+
+    @classmethod
+    def from_columns(
+        cls,
+        entry_timestamps: Sequence[datetime],
+        exit_timestamps: Sequence[Optional[datetime]],
+        profit_loss: Sequence[Optional[Decimal]],
+        holding_period_seconds: Sequence[Optional[int]],
+        scale: Optional[int] = None,
+    ) -> "TradeColumns":
+        """
+        Build columns from per-trade values, keeping closed trades only.
+
+        Args:
+            entry_timestamps: Entry time of every trade, in entry order
+            exit_timestamps: Exit time of every trade (None while open)
+            profit_loss: Realized profit/loss of every trade (None while open)
+            holding_period_seconds: Holding period of every trade, if known
+            scale: Read every profit/loss at this many decimal places, as a
+                database column of that scale would store it, and write it with
+                its significant places but at least cents (default: as written)
+
+        Returns:
+            TradeColumns of the trades with both an exit time and profit/loss
+        """
+        closed = [
+            (exit_ts, pnl, seconds)
+            for exit_ts, pnl, seconds in zip(exit_timestamps, profit_loss, holding_period_seconds)
+            if exit_ts is not None and pnl is not None
+        ]
+        amounts = [pnl for _, pnl, _ in closed]
+        fixed_scale = scale is not None
+        if scale is None:
+            scale = max((_decimal_places(amount) for amount in amounts), default=0)
+        units = [
+            int(amount.scaleb(scale).to_integral_value(rounding=ROUND_HALF_UP))
+            for amount in amounts
+        ]
+        if fixed_scale:
+            places = [_significant_places(unit, scale) for unit in units]
+        else:
+            places = [_decimal_places(amount) for amount in amounts]
+        return cls(
+            first_entry=entry_timestamps[0] if len(entry_timestamps) else None,
+            exit_timestamps=[exit_ts for exit_ts, _, _ in closed],
+            profit_loss=_exact_integers(units, terms=len(units)),
+            places=np.array(places, dtype=np.int64),
+            holding_seconds=np.array(
+                [seconds for _, _, seconds in closed if seconds is not None], dtype=np.int64
+            ),
+            scale=scale,
+        )
+
+    @classmethod
+    def from_trades(cls, trades: Sequence[Trade]) -> "TradeColumns":
+        """
+        Build columns from Trade models.
+
+        Args:
+            trades: Trades of one run (open trades are dropped), in entry order
+
+        Returns:
+            TradeColumns of the closed trades
+        """
+        return cls.from_columns(
+            [t.entry_timestamp for t in trades],
+            [t.exit_timestamp for t in trades],
+            [t.profit_loss for t in trades],
+            [t.holding_period_seconds for t in trades],
+        )
+
+    @classmethod
+    def from_rows(
+        cls, rows: Sequence[Sequence[Any]], scale: Optional[int] = None
+    ) -> "TradeColumns":
+        """
+        Build columns from database rows, without loading Trade objects.
+
+        Args:
+            rows: Tuples of TRADE_ANALYTICS_COLUMNS values, in entry order
+            scale: Decimal places of the profit_loss column (see from_columns)
+
+        Returns:
+            TradeColumns of the closed trades
+        """
+        if not rows:
+            return cls.from_columns([], [], [], [], scale)
+        entry, exit_, profit_loss, holding = zip(*rows)
+        return cls.from_columns(entry, exit_, profit_loss, holding, scale)
+
+    @cached_property
+    def exit_order(self) -> np.ndarray:
+        """Indices of the closed trades sorted by exit time (stable, like sorted())."""
+        order = sorted(range(len(self.exit_timestamps)), key=self.exit_timestamps.__getitem__)
+        return np.array(order, dtype=np.intp)
+
+    def amount(self, index: int) -> Decimal:
+        """Profit/loss of one closed trade as written."""
+        return _to_decimal(self.profit_loss[index], self.places[index], self.scale)
+
+    def total(self, mask: np.ndarray) -> Decimal:
+        """Sum of the selected profit/loss values, as sum(..., Decimal("0")) would give it."""
+        if not mask.any():
+            return Decimal("0")
+        return _to_decimal(self.profit_loss[mask].sum(), self.places[mask].max(), self.scale)
+
+
+def _decimal_places(value: Decimal) -> int:
+    """Digits after the decimal point of a finite Decimal (0 for whole numbers)."""
+    exponent = value.as_tuple().exponent
+    assert isinstance(exponent, int)
+    return max(-exponent, 0)
+
+
+def _significant_places(units: int, scale: int) -> int:
+    """Decimal places of units * 10**-scale without trailing zeros, at least cents."""
+    places = _decimal_places(Decimal(units).scaleb(-scale).normalize())
+    return min(max(places, _MIN_SCALED_PLACES), scale)
+
+
+def _exact_integers(values: list[int], terms: int) -> np.ndarray:
+    """
+    Array of integers that stays exact when up to `terms` of them are summed.
+
+    int64 when the worst-case sum fits, otherwise an object array of Python
+    ints, which NumPy still sums and compares exactly, just more slowly.
+    """
+    bound = max(map(abs, values), default=0) * max(terms, 1)
+    return np.array(values, dtype=np.int64 if bound <= _INT64_MAX else object)
+
+
+def _to_decimal(units: Any, places: Any, scale: int) -> Decimal:
+    """Decimal of an integer in units of 10**-scale, written with `places` decimals."""
+    return Decimal(int(units) // 10 ** (scale - int(places))).scaleb(-int(places))
+
+
+def _longest_run(mask: np.ndarray) -> int:
+    """Length of the longest run of consecutive True values."""
+    if not mask.any():
+        return 0
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], mask.astype(np.int8), [0]))))
+    return int((edges[1::2] - edges[::2]).max())
+
+
+def calculate_column_statistics(columns: TradeColumns) -> TradeStatistics:
     """
-    Calculate comprehensive trade performance statistics.
+    Calculate trade statistics from trade columns.
 
     Analyzes trade history to compute win rate, profit metrics, risk metrics,
-    consecutive streaks, and holding period statistics. Only closed trades
-    (with exit_timestamp and profit_loss) are included in calculations.
+    consecutive streaks, and holding period statistics with array operations
+    over all closed trades at once.
 
     Args:
-        trades: List of Trade objects (open trades are excluded automatically)
+        columns: Closed trades of one run
 
     Returns:
         TradeStatistics object with comprehensive performance metrics
 
     Example:
-        >>> trades = [
-        ...     Trade(profit_loss=Decimal("100"), ...),
-        ...     Trade(profit_loss=Decimal("-50"), ...),
-        ... ]
-        >>> stats = calculate_trade_statistics(trades)
+        >>> stats = calculate_column_statistics(TradeColumns.from_trades(trades))
         >>> stats.win_rate
         Decimal('50.00')
-        >>> stats.profit_factor
-        Decimal('2.00')
 
     Notes:
         - Breakeven trades (profit_loss <= 0 but > -10) are counted separately
@@ -155,13 +352,10 @@ def calculate_trade_statistics(trades: list[Trade]) -> TradeStatistics:
         - Expectancy = net_profit / total_trades (average profit per trade)
         - Holding periods are calculated in hours from seconds
     """
-    # Filter only closed trades with profit_loss data
-    closed_trades = [
-        t for t in trades if t.exit_timestamp is not None and t.profit_loss is not None
-    ]
+    total_trades = len(columns.profit_loss)
 
     # Handle empty trades case
-    if not closed_trades:
+    if total_trades == 0:
         return TradeStatistics(
             total_trades=0,
             winning_trades=0,
@@ -185,57 +379,34 @@ def calculate_trade_statistics(trades: list[Trade]) -> TradeStatistics:
         )
 
     # Categorize trades
-    winning_trades = []
-    losing_trades = []
-    breakeven_trades = []
-
-    for trade in closed_trades:
-        # profit_loss is guaranteed not None by filter above
-        assert trade.profit_loss is not None
-
-        # Breakeven threshold: profit/loss between -10 and 0 (basically just commission)
-        if trade.profit_loss > Decimal("0"):
-            winning_trades.append(trade)
-        elif trade.profit_loss > Decimal("-10") and trade.profit_loss <= Decimal("0"):
-            breakeven_trades.append(trade)
-        else:
-            losing_trades.append(trade)
+    # Breakeven threshold: profit/loss between -10 and 0 (basically just commission)
+    profit_loss = columns.profit_loss
+    breakeven_floor = int(_BREAKEVEN_FLOOR.scaleb(columns.scale))
+    winning = profit_loss > 0
+    breakeven = ~winning & (profit_loss > breakeven_floor)
+    losing = ~(winning | breakeven)
 
-    # Calculate trade counts
-    total_trades = len(closed_trades)
-    num_wins = len(winning_trades)
-    num_losses = len(losing_trades)
-    num_breakeven = len(breakeven_trades)
+    num_wins = int(winning.sum())
+    num_losses = int(losing.sum())
+    num_breakeven = int(breakeven.sum())
 
     # Calculate win rate (breakeven and losses count as non-wins)
-    win_rate = (
-        (Decimal(num_wins) / Decimal(total_trades)) * 100 if total_trades > 0 else Decimal("0.00")
-    )
-    win_rate = win_rate.quantize(Decimal("0.01"))
+    win_rate = ((Decimal(num_wins) / Decimal(total_trades)) * 100).quantize(Decimal("0.01"))
 
     # Calculate profit metrics
-    # All profit_loss values are guaranteed not None by filter above
-    total_profit = sum(
-        (t.profit_loss for t in winning_trades if t.profit_loss is not None), Decimal("0")
-    )
-    total_loss = abs(
-        sum((t.profit_loss for t in losing_trades if t.profit_loss is not None), Decimal("0"))
-    )
+    total_profit = columns.total(winning)
+    total_loss = abs(columns.total(losing))
     net_profit = total_profit - total_loss
 
     average_win = total_profit / num_wins if num_wins > 0 else Decimal("0.00")
     average_loss = total_loss / num_losses if num_losses > 0 else Decimal("0.00")
 
-    largest_win = max(
-        (t.profit_loss for t in winning_trades if t.profit_loss is not None),
-        default=Decimal("0.00"),
-    )
-    largest_loss = abs(
-        min(
-            (t.profit_loss for t in losing_trades if t.profit_loss is not None),
-            default=Decimal("0.00"),
-        )
-    )
+    largest_win = Decimal("0.00")
+    if num_wins:
+        largest_win = columns.amount(np.flatnonzero(winning)[profit_loss[winning].argmax()])
+    largest_loss = Decimal("0.00")
+    if num_losses:
+        largest_loss = abs(columns.amount(np.flatnonzero(losing)[profit_loss[losing].argmin()]))
 
     # Calculate profit factor
     profit_factor = None
@@ -243,25 +414,29 @@ def calculate_trade_statistics(trades: list[Trade]) -> TradeStatistics:
         profit_factor = (total_profit / total_loss).quantize(Decimal("0.01"))
 
     # Calculate expectancy (average profit per trade)
-    expectancy = net_profit / total_trades if total_trades > 0 else Decimal("0.00")
-    expectancy = expectancy.quantize(Decimal("0.01"))
+    expectancy = (net_profit / total_trades).quantize(Decimal("0.01"))
 
-    # Calculate consecutive streaks
-    max_consecutive_wins = _calculate_max_consecutive_wins(closed_trades)
-    max_consecutive_losses = _calculate_max_consecutive_losses(closed_trades)
+    # Calculate consecutive streaks in exit order (breakeven losses break win streaks)
+    chronological = profit_loss[columns.exit_order]
+    max_consecutive_wins = _longest_run(chronological > 0)
+    max_consecutive_losses = _longest_run(chronological < 0)
 
     # Calculate holding period statistics
-    holding_periods = [
-        t.holding_period_seconds for t in closed_trades if t.holding_period_seconds is not None
-    ]
-
-    if holding_periods:
-        # Convert seconds to hours
-        holding_periods_hours = [Decimal(str(sec / 3600)) for sec in holding_periods]
-        avg_holding_hours = sum(holding_periods_hours) / Decimal(len(holding_periods_hours))
-        avg_holding_hours = avg_holding_hours.quantize(Decimal("0.01"))
-        max_holding_hours = int(max(holding_periods) / 3600)
-        min_holding_hours = int(min(holding_periods) / 3600)
+    holding_seconds = columns.holding_seconds
+    if len(holding_seconds):
+        # Reason: Adds the same Decimal(str(hours)) terms a per-trade loop would,
+        # once per distinct holding period, so the average rounds identically
+        seconds, counts = np.unique(holding_seconds, return_counts=True)
+        total_hours = sum(
+            (
+                Decimal(str(sec / 3600)) * count
+                for sec, count in zip(seconds.tolist(), counts.tolist())
+            ),
+            Decimal("0"),
+        )
+        avg_holding_hours = (total_hours / Decimal(len(holding_seconds))).quantize(Decimal("0.01"))
+        max_holding_hours = int(int(seconds[-1]) / 3600)
+        min_holding_hours = int(int(seconds[0]) / 3600)
     else:
         avg_holding_hours = Decimal("0.00")
         max_holding_hours = 0
@@ -290,111 +465,88 @@ def calculate_trade_statistics(trades: list[Trade]) -> TradeStatistics:
     )
 
 
-def _calculate_max_consecutive_wins(trades: list[Trade]) -> int:
+def calculate_column_drawdowns(columns: TradeColumns, initial_capital: Decimal) -> DrawdownMetrics:
     """
-    Calculate the maximum consecutive winning streak.
+    Calculate drawdown periods of the equity curve implied by trade columns.
+
+    The curve is the one generate_equity_curve builds, without a point object
+    per trade: the running balance is a cumulative sum in exact integer units
+    and only the reported peaks and troughs are converted back to Decimal.
 
     Args:
-        trades: List of closed trades (should already be filtered)
+        columns: Closed trades of one run
+        initial_capital: Starting account balance in base currency
 
     Returns:
-        Maximum number of consecutive winning trades
-    """
-    if not trades:
-        return 0
-
-    # Sort trades by exit timestamp to get chronological order
-    sorted_trades = sorted(
-        trades,
-        key=lambda t: (
-            t.exit_timestamp
-            if t.exit_timestamp is not None
-            else datetime.min.replace(tzinfo=timezone.utc)
-        ),
-    )
-
-    max_streak = 0
-    current_streak = 0
-
-    for trade in sorted_trades:
-        if trade.profit_loss and trade.profit_loss > Decimal("0"):
-            current_streak += 1
-            max_streak = max(max_streak, current_streak)
-        else:
-            current_streak = 0
-
-    return max_streak
-
+        DrawdownMetrics with max drawdown, top periods, and current drawdown
 
-def _calculate_max_consecutive_losses(trades: list[Trade]) -> int:
+    Notes:
+        - Drawdown % = (peak - trough) / peak * 100
+        - Duration is calculated in calendar days
+        - Current drawdown is set if equity curve ends in a drawdown
+        - Top drawdowns are sorted by percentage (largest first)
+        - Maximum 5 drawdowns are returned in top_drawdowns list
     """
-    Calculate the maximum consecutive losing streak.
+    order = columns.exit_order
+    if columns.first_entry is None or not len(order):
+        # Reason: Without closed trades the curve is the initial point alone
+        return _drawdown_metrics(np.empty(0, dtype=np.int64), _no_point, _no_point)
+    first_entry: datetime = columns.first_entry
+
+    capital_places = _decimal_places(initial_capital)
+    scale = max(columns.scale, capital_places)
+    factor = 10 ** (scale - columns.scale)
+    start = int(initial_capital.scaleb(scale))
+    steps = columns.profit_loss[order]
+
+    bound = abs(start) + int(np.abs(steps).max()) * factor * len(steps)
+    balances = np.empty(len(steps) + 1, dtype=np.int64 if bound <= _INT64_MAX else object)
+    balances[0] = start
+    balances[1:] = steps * factor
+    balances = np.cumsum(balances)
+
+    # A running sum is written with the most decimal places of its terms
+    balance_places = np.maximum.accumulate(
+        np.concatenate(([capital_places], columns.places[order]))
+    )
 
-    Args:
-        trades: List of closed trades (should already be filtered)
+    def balance_at(i: int) -> Decimal:
+        if i == 0:
+            return initial_capital
+        return _to_decimal(balances[i], balance_places[i], scale)
 
-    Returns:
-        Maximum number of consecutive losing trades
-    """
-    if not trades:
-        return 0
+    def timestamp_at(i: int) -> datetime:
+        return first_entry if i == 0 else columns.exit_timestamps[order[i - 1]]
 
-    # Sort trades by exit timestamp to get chronological order
-    sorted_trades = sorted(
-        trades,
-        key=lambda t: (
-            t.exit_timestamp
-            if t.exit_timestamp is not None
-            else datetime.min.replace(tzinfo=timezone.utc)
-        ),
-    )
+    return _drawdown_metrics(balances, balance_at, timestamp_at)
 
-    max_streak = 0
-    current_streak = 0
 
-    for trade in sorted_trades:
-        if trade.profit_loss and trade.profit_loss <= Decimal("0"):
-            current_streak += 1
-            max_streak = max(max_streak, current_streak)
-        else:
-            current_streak = 0
+def _no_point(i: int) -> Any:
+    """Point accessor of an equity curve too short to have drawdowns."""
+    raise IndexError(i)
 
-    return max_streak
 
-
-def calculate_drawdowns(equity_curve: list[EquityCurvePoint]) -> DrawdownMetrics:
+def _drawdown_metrics(
+    balances: np.ndarray,
+    balance_at: Callable[[int], Decimal],
+    timestamp_at: Callable[[int], datetime],
+) -> DrawdownMetrics:
     """
-    Calculate drawdown periods from equity curve.
+    Find drawdown periods of an equity curve given as exact integer balances.
 
-    Analyzes equity curve to identify peak-to-trough drawdown periods, their
-    recovery times, and provides comprehensive drawdown statistics including
-    the maximum drawdown and top 5 largest drawdown periods.
+    A new peak is a balance above every earlier one; it closes the segment
+    started by the previous peak, whose trough is that segment's first lowest
+    balance. Segments whose trough is below their peak are drawdowns.
 
     Args:
-        equity_curve: Time-series of account balances (sorted by timestamp)
+        balances: Balance at each curve point, as integers of one fixed scale
+        balance_at: Decimal balance of a point, as reported
+        timestamp_at: Timestamp of a point
 
     Returns:
         DrawdownMetrics with max drawdown, top periods, and current drawdown
-
-    Example:
-        >>> equity_curve = [
-        ...     EquityCurvePoint(balance=Decimal("100000"), ...),
-        ...     EquityCurvePoint(balance=Decimal("120000"), ...),  # Peak
-        ...     EquityCurvePoint(balance=Decimal("100000"), ...),  # Trough
-        ...     EquityCurvePoint(balance=Decimal("125000"), ...),  # Recovery
-        ... ]
-        >>> metrics = calculate_drawdowns(equity_curve)
-        >>> metrics.max_drawdown.drawdown_pct
-        Decimal('16.6667')
-
-    Notes:
-        - Drawdown % = (peak - trough) / peak * 100
-        - Duration is calculated in calendar days
-        - Current drawdown is set if equity curve ends in a drawdown
-        - Top drawdowns are sorted by percentage (largest first)
-        - Maximum 5 drawdowns are returned in top_drawdowns list
     """
-    if not equity_curve or len(equity_curve) < 2:
+    if len(balances) < 2:
         return DrawdownMetrics(
             max_drawdown=None,
             top_drawdowns=[],
@@ -402,79 +554,61 @@ def calculate_drawdowns(equity_curve: list[EquityCurvePoint]) -> DrawdownMetrics
             total_drawdown_periods=0,
         )
 
-    completed_drawdowns: list[DrawdownPeriod] = []
-    peak_balance = equity_curve[0].balance
-    peak_timestamp = equity_curve[0].timestamp
-    in_drawdown = False
-    trough_balance = peak_balance
-    trough_timestamp = peak_timestamp
-
-    # Iterate through equity curve to identify drawdown periods
-    for point in equity_curve[1:]:
-        if point.balance > peak_balance:
-            # New peak - end current drawdown if any
-            if in_drawdown:
-                dd_amount = peak_balance - trough_balance
-                dd_pct = (dd_amount / peak_balance) * 100
-                dd_pct = dd_pct.quantize(Decimal("0.0001"), rounding=ROUND_HALF_UP)
-                duration = (trough_timestamp - peak_timestamp).days
-
-                completed_drawdowns.append(
-                    DrawdownPeriod(
-                        peak_timestamp=peak_timestamp,
-                        peak_balance=peak_balance,
-                        trough_timestamp=trough_timestamp,
-                        trough_balance=trough_balance,
-                        drawdown_amount=dd_amount,
-                        drawdown_pct=dd_pct,
-                        duration_days=duration,
-                        recovery_timestamp=point.timestamp,
-                        recovered=True,
-                    )
-                )
-                in_drawdown = False
-
-            # Update peak
-            peak_balance = point.balance
-            peak_timestamp = point.timestamp
-            trough_balance = point.balance
-            trough_timestamp = point.timestamp
-        elif point.balance < trough_balance:
-            # New trough (deeper drawdown)
-            trough_balance = point.balance
-            trough_timestamp = point.timestamp
-            in_drawdown = True
-
-    # Handle ongoing drawdown (not yet recovered)
-    current_dd = None
-    if in_drawdown:
+    new_peak = np.empty(len(balances), dtype=bool)
+    new_peak[0] = True
+    new_peak[1:] = balances[1:] > np.maximum.accumulate(balances)[:-1]
+    peaks = np.flatnonzero(new_peak)
+    segment = np.cumsum(new_peak) - 1
+
+    lows = np.minimum.reduceat(balances, peaks)
+    at_low = np.flatnonzero(balances == lows[segment])
+    first_low = np.ones(len(at_low), dtype=bool)
+    first_low[1:] = segment[at_low[1:]] != segment[at_low[:-1]]
+    troughs = at_low[first_low]
+    in_drawdown = (lows < balances[peaks]).astype(bool)
+
+    def measure(k: int) -> tuple[Decimal, Decimal, Decimal, Decimal]:
+        peak_balance = balance_at(int(peaks[k]))
+        trough_balance = balance_at(int(troughs[k]))
         dd_amount = peak_balance - trough_balance
         dd_pct = (dd_amount / peak_balance) * 100
         dd_pct = dd_pct.quantize(Decimal("0.0001"), rounding=ROUND_HALF_UP)
-        duration = (trough_timestamp - peak_timestamp).days
-
-        current_dd = DrawdownPeriod(
+        return peak_balance, trough_balance, dd_amount, dd_pct
+
+    def period(k: int, measured: tuple[Decimal, Decimal, Decimal, Decimal]) -> DrawdownPeriod:
+        peak_balance, trough_balance, dd_amount, dd_pct = measured
+        peak_timestamp = timestamp_at(int(peaks[k]))
+        trough_timestamp = timestamp_at(int(troughs[k]))
+        recovered = k + 1 < len(peaks)
+        return DrawdownPeriod(
             peak_timestamp=peak_timestamp,
             peak_balance=peak_balance,
             trough_timestamp=trough_timestamp,
             trough_balance=trough_balance,
             drawdown_amount=dd_amount,
             drawdown_pct=dd_pct,
-            duration_days=duration,
-            recovery_timestamp=None,
-            recovered=False,
+            duration_days=(trough_timestamp - peak_timestamp).days,
+            recovery_timestamp=timestamp_at(int(peaks[k + 1])) if recovered else None,
+            recovered=recovered,
         )
 
+    # Every segment but the last ended at a new peak, recovering its drawdown
+    completed = [(int(k), measure(int(k))) for k in np.flatnonzero(in_drawdown[:-1])]
+
     # Sort completed drawdowns by percentage (descending)
-    sorted_drawdowns = sorted(completed_drawdowns, key=lambda d: d.drawdown_pct, reverse=True)
+    completed.sort(key=lambda item: item[1][3], reverse=True)
 
     # Get top 5 drawdowns
-    top_drawdowns = sorted_drawdowns[:5]
+    top_drawdowns = [period(k, measured) for k, measured in completed[:5]]
+
+    # Handle ongoing drawdown (not yet recovered)
+    current_dd = None
+    if in_drawdown[-1]:
+        last = len(peaks) - 1
+        current_dd = period(last, measure(last))
 
     # Determine max drawdown (either from completed or current)
-    max_drawdown = None
-    if sorted_drawdowns:
-        max_drawdown = sorted_drawdowns[0]
+    max_drawdown = top_drawdowns[0] if top_drawdowns else None
 
     # If current drawdown is larger than max completed, use current as max
     if current_dd and (not max_drawdown or current_dd.drawdown_pct > max_drawdown.drawdown_pct):
@@ -484,5 +618,30 @@ def calculate_drawdowns(equity_curve: list[EquityCurvePoint]) -> DrawdownMetrics
         max_drawdown=max_drawdown,
         top_drawdowns=top_drawdowns,
         current_drawdown=current_dd,
-        total_drawdown_periods=len(completed_drawdowns),
+        total_drawdown_periods=len(completed),
+    )
+
+
+def analyze_trade_columns(
+    columns: TradeColumns, initial_capital: Decimal
+) -> tuple[TradeStatistics, DrawdownMetrics]:
+    """
+    Calculate trade statistics and drawdown metrics of one run.
+
+    Args:
+        columns: Closed trades of the run
+        initial_capital: Starting account balance of the run
+
+    Returns:
+        Tuple of (TradeStatistics, DrawdownMetrics)
+
+    Example:
+        >>> rows = await repository.find_trade_values(run.id, TRADE_ANALYTICS_COLUMNS)
+        >>> stats, drawdowns = analyze_trade_columns(
+        ...     TradeColumns.from_rows(rows), run.initial_capital
+        ... )
+    """
+    return (
+        calculate_column_statistics(columns),
+        calculate_column_drawdowns(columns, initial_capital),
     )
@@ -0,0 +1,494 @@
+"""
+Walk-forward optimization over a registered strategy.
+
+Bars are loaded once by the caller and placed in a shared-memory bar store.
+Folds run concurrently across a pool of worker processes: each worker slices
+its fold's train and test windows from the shared arrays, runs every
+parameter combination on the train window (reusing one loaded engine), picks
+the best by the ranking metric and runs it on the following test window.
+Test runs start flat with freshly initialized indicators, as a deployment of
+the chosen parameters would. The parent process stitches the test windows'
+account balance curves into one compounded out-of-sample curve and saves
+the out-of-sample runs and the analysis in one database session.
+"""
+
+import asyncio
+import os
+import time
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any, Callable
+from uuid import uuid4
+
+import pandas as pd
+import structlog
+from nautilus_trader.core.datetime import unix_nanos_to_dt
+from nautilus_trader.model.data import Bar
+from nautilus_trader.model.instruments import Instrument
+
+from src.core.backtest_orchestrator import (
+    BacktestOrchestrator,
+    build_config_snapshot,
+    save_failed_run,
+    save_run_results,
+)
+from src.db.repositories.backtest_repository import BacktestRepository
+from src.db.session import get_session
+from src.models.backtest_request import BacktestRequest
+from src.models.backtest_result import BacktestResult
+from src.models.parameter_sweep import SweepRunSummary, SweepSpec, rank_runs
+from src.models.walk_forward import (
+    FoldSummary,
+    FoldWindow,
+    WalkForwardSpec,
+    WalkForwardSummary,
+)
+from src.services.backtest_persistence import BacktestPersistenceService
+from src.services.parameter_sweep import build_sweep_requests
+from src.services.shared_bars import (
+    BarArrays,
+    SharedBarHandle,
+    SharedBarStore,
+    load_shared_bars,
+    shared_bar_pool,
+    shared_bar_worker,
+)
+
+logger = structlog.get_logger(__name__)
+
+# Reason: Windows are half-open but shared bar slices include their end
+_WINDOW_END_EPSILON = timedelta(microseconds=1)
+
+
+@dataclass
+class FoldOutcome:
+    """Raw outcome of one walk-forward fold, returned from a worker process.
+
+    Attributes:
+        window: Train and test window of the fold
+        train_runs: Outcome of every combination on the train window
+        request: Out-of-sample request (None if no combination succeeded)
+        result: Out-of-sample results (None if the fold failed)
+        equity_curve: Out-of-sample equity curve points (stored with the run)
+        balance_curve: Out-of-sample account balance points (stitched)
+        positions_df: Out-of-sample positions report used to capture trades
+        duration_seconds: Time spent on the fold in the worker
+        error: Error message if the fold failed
+    """
+
+    window: FoldWindow
+    train_runs: list[SweepRunSummary] = field(default_factory=list)
+    request: BacktestRequest | None = None
+    result: BacktestResult | None = None
+    equity_curve: list[dict[str, int | float]] = field(default_factory=list)
+    balance_curve: list[dict[str, int | float]] = field(default_factory=list)
+    positions_df: pd.DataFrame | None = None
+    duration_seconds: float = 0.0
+    error: str | None = None
+
+
+def _window_request(
+    base_request: BacktestRequest, params: dict[str, Any], bars: list[Bar]
+) -> BacktestRequest:
+    """Request running `params` over exactly the given window's bars."""
+    return base_request.model_copy(
+        update={
+            "strategy_config": {**base_request.strategy_config, **params},
+            "start_date": unix_nanos_to_dt(bars[0].ts_init),
+            "end_date": unix_nanos_to_dt(bars[-1].ts_init),
+            "persist": False,
+        }
+    )
+
+
+def _run_summary(params: dict[str, Any], result: BacktestResult) -> SweepRunSummary:
+    """Condense a train run into a SweepRunSummary."""
+    return SweepRunSummary(
+        params=params,
+        total_return=result.total_return,
+        sharpe_ratio=result.sharpe_ratio,
+        max_drawdown=result.max_drawdown,
+        total_trades=result.total_trades,
+    )
+
+
+async def _run_fold(
+    shared_bars: SharedBarHandle,
+    instrument: Instrument,
+    window: FoldWindow,
+    base_request: BacktestRequest,
+    combinations: list[dict[str, Any]],
+    rank_by: str,
+) -> FoldOutcome:
+    """Optimize on the fold's train window, then run the winner on its test window."""
+    train_bars = load_shared_bars(
+        shared_bars, window.train_start, window.train_end - _WINDOW_END_EPSILON
+    )
+    test_bars = load_shared_bars(
+        shared_bars, window.test_start, window.test_end - _WINDOW_END_EPSILON
+    )
+    if not train_bars or not test_bars:
+        empty = "train" if not train_bars else "test"
+        return FoldOutcome(window=window, error=f"No bars in the {empty} window")
+
+    outcome = FoldOutcome(window=window)
+    orchestrator = BacktestOrchestrator(reuse_engine=True)
+    try:
+        for params in combinations:
+            request = _window_request(base_request, params, train_bars)
+            try:
+                result, _ = await orchestrator.execute(request, train_bars, instrument)
+                outcome.train_runs.append(_run_summary(params, result))
+            except Exception as e:
+                outcome.train_runs.append(
+                    SweepRunSummary(params=params, success=False, error_message=str(e))
+                )
+
+        ranked = rank_runs(outcome.train_runs, rank_by)
+        if not ranked:
+            outcome.error = "No parameter combination succeeded on the train window"
+            return outcome
+
+        outcome.request = _window_request(base_request, ranked[0].params, test_bars)
+        outcome.result, _ = await orchestrator.execute(outcome.request, test_bars, instrument)
+        outcome.equity_curve, outcome.positions_df = orchestrator.collect_run_artifacts()
+        outcome.balance_curve = orchestrator.collect_balance_curve()
+        return outcome
+    finally:
+        orchestrator.dispose()
+
+
+def run_walk_forward_fold(
+    window: FoldWindow,
+    base_request: BacktestRequest,
+    combinations: list[dict[str, Any]],
+    rank_by: str,
+) -> FoldOutcome:
+    """
+    Run one walk-forward fold against the worker's shared bars.
+
+    Args:
+        window: Train and test window of the fold
+        base_request: Request providing the strategy and base config
+        combinations: Validated parameter combinations to evaluate
+        rank_by: Metric choosing the parameters on the train window
+
+    Returns:
+        FoldOutcome with the out-of-sample results and persistence artifacts
+    """
+    shared_bars, instrument = shared_bar_worker()
+
+    start = time.time()
+    try:
+        outcome = asyncio.run(
+            _run_fold(shared_bars, instrument, window, base_request, combinations, rank_by)
+        )
+    except Exception as e:
+        outcome = FoldOutcome(window=window, error=str(e))
+    outcome.duration_seconds = time.time() - start
+    return outcome
+
+
+def stitch_equity_curves(
+    curves: list[list[dict[str, int | float]]], starting_balance: float
+) -> list[dict[str, float]]:
+    """
+    Chain consecutive out-of-sample balance curves into one compounded curve.
+
+    Every test run starts from the same starting balance; each curve is
+    scaled so it starts from the equity the previous one ended with.
+    Empty curves (failed folds) are skipped.
+
+    Args:
+        curves: Balance curves in chronological order, as {"time", "value"} points
+        starting_balance: Starting balance of every test run
+
+    Returns:
+        Stitched {"time", "value"} points
+
+    Example:
+        >>> stitch_equity_curves(
+        ...     [[{"time": 1, "value": 100.0}, {"time": 2, "value": 110.0}],
+        ...      [{"time": 3, "value": 100.0}, {"time": 4, "value": 90.0}]],
+        ...     100.0,
+        ... )[-1]
+        {'time': 4, 'value': 99.0}
+    """
+    stitched: list[dict[str, float]] = []
+    equity = starting_balance
+    for curve in curves:
+        if not curve:
+            continue
+        scale = equity / starting_balance
+        stitched.extend(
+            {"time": point["time"], "value": round(point["value"] * scale, 2)} for point in curve
+        )
+        equity = stitched[-1]["value"]
+    return stitched
+
+
+class WalkForwardService:
+    """
+    Run walk-forward analyses with folds spread across worker processes.
+
+    Attributes:
+        max_workers: Maximum number of worker processes
+
+    Example:
+        >>> service = WalkForwardService(max_workers=4)
+        >>> spec = SweepSpec(params={"rsi_period": [2, 3, 4]})
+        >>> windows = WalkForwardSpec(train_months=36, test_months=12)
+        >>> summary = await service.run(base_request, spec, windows, bars, instrument)
+        >>> summary.total_return, [fold.params for fold in summary.folds]
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        executor_factory: Callable[[SharedBarHandle, Instrument, int], Executor] | None = None,
+    ) -> None:
+        """
+        Initialize WalkForwardService.
+
+        Args:
+            max_workers: Worker process limit (defaults to the CPU count)
+            executor_factory: Optional factory building the executor from the
+                              shared bar handle, instrument and worker count
+                              (used by tests)
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._executor_factory = executor_factory or shared_bar_pool
+
+    async def run(
+        self,
+        base_request: BacktestRequest,
+        spec: SweepSpec,
+        windows_spec: WalkForwardSpec,
+        bars: list[Bar] | BarArrays,
+        instrument: Instrument,
+        rank_by: str = "sharpe_ratio",
+        persist: bool = True,
+        on_progress: Callable[[int, int], None] | None = None,
+    ) -> WalkForwardSummary:
+        """
+        Optimize and validate every fold, then stitch and optionally persist.
+
+        Args:
+            base_request: Request providing symbol, date range and base strategy config
+            spec: Search space evaluated on every train window
+            windows_spec: Train/test window layout
+            bars: Pre-loaded bars (or columnar arrays) covering the date range
+            instrument: Instrument for the backtests
+            rank_by: Metric choosing the parameters on each train window
+            persist: Save the out-of-sample runs and the analysis
+            on_progress: Optional callback invoked with (completed folds, total)
+
+        Returns:
+            WalkForwardSummary with per-fold outcomes and the stitched curve
+
+        Raises:
+            ValueError: If bars are empty, the range holds no complete fold,
+                        a parameter is unknown or no combination is valid
+        """
+        if not len(bars):
+            raise ValueError("No bars provided for walk-forward analysis")
+
+        walk_forward_id = uuid4()
+        analysis_start = time.time()
+        arrays = bars if isinstance(bars, BarArrays) else BarArrays.from_bars(bars)
+
+        # Reason: The range ends just after the last loaded bar so it is included
+        range_end = unix_nanos_to_dt(int(arrays.ts_init[-1])) + _WINDOW_END_EPSILON
+        windows = windows_spec.windows(base_request.start_date, range_end)
+        if not windows:
+            raise ValueError(
+                f"Date range is shorter than one train window of "
+                f"{windows_spec.train_months} months plus a test window"
+            )
+
+        requests, skipped = build_sweep_requests(base_request, spec)
+        if not requests:
+            raise ValueError("No valid parameter combinations to run")
+        combinations = [params for params, _ in requests]
+
+        workers = min(self.max_workers, len(windows))
+        logger.info(
+            "walk_forward_started",
+            walk_forward_id=str(walk_forward_id),
+            strategy=base_request.strategy_type,
+            folds=len(windows),
+            combinations=len(combinations),
+            anchored=windows_spec.anchored,
+            workers=workers,
+        )
+
+        store = SharedBarStore(arrays)
+        loop = asyncio.get_running_loop()
+        executor = self._executor_factory(store.handle, instrument, workers)
+        try:
+            futures = [
+                loop.run_in_executor(
+                    executor, run_walk_forward_fold, window, base_request, combinations, rank_by
+                )
+                for window in windows
+            ]
+            completed = 0
+
+            async def _tracked(future: asyncio.Future) -> FoldOutcome:
+                nonlocal completed
+                outcome = await future
+                completed += 1
+                if on_progress is not None:
+                    on_progress(completed, len(futures))
+                return outcome
+
+            outcomes = await asyncio.gather(*(_tracked(f) for f in futures))
+        finally:
+            executor.shutdown(wait=True)
+            store.close()
+
+        starting_balance = float(base_request.starting_balance)
+        summary = WalkForwardSummary(
+            walk_forward_id=walk_forward_id,
+            strategy=base_request.strategy_type,
+            symbol=base_request.symbol,
+            rank_by=rank_by,
+            folds=[self._summarize(outcome, rank_by) for outcome in outcomes],
+            skipped=skipped,
+            equity_curve=stitch_equity_curves(
+                [outcome.balance_curve for outcome in outcomes if outcome.result is not None],
+                starting_balance,
+            ),
+            starting_balance=starting_balance,
+            duration_seconds=time.time() - analysis_start,
+        )
+
+        if persist:
+            await self._persist(summary, outcomes, base_request, spec, windows_spec, range_end)
+
+        logger.info(
+            "walk_forward_completed",
+            walk_forward_id=str(walk_forward_id),
+            folds=len(summary.folds),
+            failed=sum(1 for fold in summary.folds if not fold.success),
+            total_return=summary.total_return,
+            duration_seconds=round(summary.duration_seconds, 2),
+        )
+
+        return summary
+
+    async def _persist(
+        self,
+        summary: WalkForwardSummary,
+        outcomes: list[FoldOutcome],
+        base_request: BacktestRequest,
+        spec: SweepSpec,
+        windows_spec: WalkForwardSpec,
+        range_end: datetime,
+    ) -> None:
+        """
+        Save the out-of-sample runs and the analysis in one session and transaction.
+
+        Each run is saved inside a savepoint so one invalid run does not
+        discard the rest; fold summaries get the run_id of their saved run.
+        """
+        async with get_session() as session:
+            repository = BacktestRepository(session)
+            service = BacktestPersistenceService(repository)
+
+            for fold, outcome in zip(summary.folds, outcomes):
+                if outcome.request is None:
+                    continue
+                run_id = uuid4()
+                duration = Decimal(str(round(outcome.duration_seconds, 3)))
+                try:
+                    async with session.begin_nested():
+                        if outcome.result is not None:
+                            await save_run_results(
+                                service,
+                                run_id=run_id,
+                                request=outcome.request,
+                                result=outcome.result,
+                                execution_duration=duration,
+                                equity_curve=outcome.equity_curve,
+                                positions_df=outcome.positions_df,
+                            )
+                        else:
+                            await save_failed_run(
+                                service,
+                                run_id=run_id,
+                                request=outcome.request,
+                                error_message=outcome.error or "Unknown error",
+                                execution_duration=duration,
+                            )
+                    fold.run_id = run_id
+                except Exception as e:
+                    logger.warning(
+                        "walk_forward_run_persist_failed",
+                        walk_forward_id=str(summary.walk_forward_id),
+                        fold=fold.window.index,
+                        error=str(e),
+                    )
+
+            total_return = summary.total_return
+            max_drawdown = summary.max_drawdown
+            await repository.create_walk_forward(
+                walk_forward_id=summary.walk_forward_id,
+                strategy_type=base_request.strategy_type,
+                instrument_symbol=base_request.symbol,
+                start_date=summary.folds[0].window.train_start,
+                end_date=range_end,
+                initial_capital=base_request.starting_balance,
+                config={
+                    **windows_spec.model_dump(),
+                    "rank_by": summary.rank_by,
+                    "search_space": spec.model_dump(mode="json"),
+                    "skipped": summary.skipped,
+                    "base": build_config_snapshot(base_request),
+                },
+                folds=[fold.model_dump(mode="json") for fold in summary.folds],
+                equity_curve=summary.equity_curve,
+                execution_duration_seconds=Decimal(str(round(summary.duration_seconds, 3))),
+                total_return=Decimal(str(round(total_return, 6)))
+                if total_return is not None
+                else None,
+                max_drawdown=Decimal(str(round(max_drawdown, 6)))
+                if max_drawdown is not None
+                else None,
+            )
+
+            await session.commit()
+
+        logger.info(
+            "walk_forward_persisted",
+            walk_forward_id=str(summary.walk_forward_id),
+            runs=sum(1 for fold in summary.folds if fold.run_id is not None),
+        )
+
+    @staticmethod
+    def _summarize(outcome: FoldOutcome, rank_by: str) -> FoldSummary:
+        """Condense a worker outcome into a FoldSummary."""
+        ranked = rank_runs(outcome.train_runs, rank_by)
+        best = ranked[0] if ranked else None
+        summary = FoldSummary(
+            window=outcome.window,
+            params=best.params if best is not None else None,
+            train_runs=len(outcome.train_runs),
+            train_failed=sum(1 for run in outcome.train_runs if not run.success),
+            train_metric=getattr(best, rank_by) if best is not None else None,
+            duration_seconds=outcome.duration_seconds,
+        )
+
+        if outcome.result is None:
+            summary.success = False
+            summary.error_message = outcome.error
+            return summary
+
+        result = outcome.result
+        summary.total_return = result.total_return
+        summary.sharpe_ratio = result.sharpe_ratio
+        summary.max_drawdown = result.max_drawdown
+        summary.total_trades = result.total_trades
+        return summary
@@ -0,0 +1,133 @@
+"""Utility functions for reducing chart series to a display resolution."""
+
+from typing import NamedTuple
+
+import numpy as np
+
+
+class OHLCVColumns(NamedTuple):
+    """Column-wise OHLCV series, one array entry per bar."""
+
+    time: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    def __len__(self) -> int:
+        """Return number of bars in the series."""
+        return len(self.time)
+
+
+def bars_per_bucket(count: int, max_points: int) -> int:
+    """
+    Number of consecutive bars merged into each output point.
+
+    Args:
+        count: Number of bars in the series
+        max_points: Maximum number of points to return
+
+    Returns:
+        Bucket size (1 when the series already fits)
+
+    Example:
+        >>> bars_per_bucket(10_000, 1_000)
+        10
+        >>> bars_per_bucket(500, 1_000)
+        1
+    """
+    if max_points < 1:
+        raise ValueError(f"max_points must be positive, got {max_points}")
+    return max(1, -(-count // max_points))
+
+
+def aggregate_ohlcv(columns: OHLCVColumns, max_points: int) -> tuple[OHLCVColumns, int]:
+    """
+    Merge consecutive bars into at most max_points OHLCV buckets.
+
+    Buckets are formed by bar count rather than wall-clock time, so session
+    gaps (nights, weekends) never produce empty buckets. Each bucket keeps the
+    first bar's time and open, the last bar's close, the extreme high/low and
+    the summed volume, so the coarse candles cover the same price range.
+
+    Args:
+        columns: Bars sorted by time ascending
+        max_points: Maximum number of buckets to return
+
+    Returns:
+        Tuple of (aggregated columns, bars per bucket)
+
+    Example:
+        >>> coarse, size = aggregate_ohlcv(columns, max_points=2_000)
+    """
+    size = bars_per_bucket(len(columns), max_points)
+    if size == 1:
+        return columns, 1
+
+    starts = np.arange(0, len(columns), size)
+    last = np.append(starts[1:], len(columns)) - 1
+
+    aggregated = OHLCVColumns(
+        time=columns.time[starts],
+        open=columns.open[starts],
+        high=np.maximum.reduceat(columns.high, starts),
+        low=np.minimum.reduceat(columns.low, starts),
+        close=columns.close[last],
+        volume=np.add.reduceat(columns.volume, starts),
+    )
+    return aggregated, size
+
+
+def lttb_indices(times: np.ndarray, values: np.ndarray, max_points: int) -> np.ndarray:
+    """
+    Select points of a line series with Largest-Triangle-Three-Buckets.
+
+    Keeps the first and last points and, from each interior bucket, the point
+    forming the largest triangle with the previously selected point and the
+    average of the next bucket. Peaks and troughs survive decimation, unlike
+    plain striding.
+
+    Args:
+        times: X values sorted ascending
+        values: Y values, same length as times
+        max_points: Maximum number of points to keep (at least 3 to decimate)
+
+    Returns:
+        Sorted indices of the points to keep
+
+    Example:
+        >>> keep = lttb_indices(times, equity, max_points=1_000)
+        >>> times[keep], equity[keep]
+    """
+    count = len(times)
+    if max_points >= count or max_points < 3:
+        return np.arange(count)
+
+    x = np.asarray(times, dtype=np.float64)
+    y = np.asarray(values, dtype=np.float64)
+
+    # Interior points are split into max_points - 2 buckets
+    edges = np.linspace(1, count - 1, max_points - 1).astype(np.int64)
+    selected = np.empty(max_points, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = count - 1
+
+    previous = 0
+    for bucket in range(max_points - 2):
+        start, stop = edges[bucket], edges[bucket + 1]
+        if bucket + 2 < len(edges):
+            next_start, next_stop = edges[bucket + 1], edges[bucket + 2]
+        else:
+            next_start, next_stop = count - 1, count
+        avg_x = x[next_start:next_stop].mean()
+        avg_y = y[next_start:next_stop].mean()
+
+        areas = np.abs(
+            (x[previous] - avg_x) * (y[start:stop] - y[previous])
+            - (x[previous] - x[start:stop]) * (avg_y - y[previous])
+        )
+        previous = start + int(np.argmax(areas))
+        selected[bucket + 1] = previous
+
+    return selected
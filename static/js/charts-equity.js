@@ -15,13 +15,17 @@
  *
  * @param {string} backtestId - Backtest UUID (new format)
  * @param {string} runId - Run UUID (legacy format)
+ * @param {number|null} [maxPoints=null] - Point budget for the stored run curve
  * @returns {Promise<Object>} Equity curve data
  * @throws {Error} If API request fails
  */
-async function fetchEquityData(backtestId, runId) {
-    const endpoint = backtestId
+async function fetchEquityData(backtestId, runId, maxPoints = null) {
+    let endpoint = backtestId
         ? `/api/equity-curve/${backtestId}`
         : `/api/equity/${runId}`;
+    if (!backtestId && maxPoints) {
+        endpoint += `?max_points=${maxPoints}`;
+    }
 
     const response = await fetch(endpoint);
 
@@ -171,7 +175,7 @@ async function initEquityChart(container) {
     const { runId, backtestId } = container.dataset;
 
     try {
-        const data = await fetchEquityData(backtestId, runId);
+        const data = await fetchEquityData(backtestId, runId, getChartPointBudget(container));
         hideLoading(container);
 
         // Route to appropriate renderer based on data format
@@ -11,18 +11,37 @@
  * @version 1.0.0
  */
 
+/**
+ * Upper bound on candles requested per chart, matching the API limit
+ * @constant {number}
+ */
+const MAX_CHART_POINTS = 20000;
+
+/**
+ * Delay before a pan/zoom triggers a higher-resolution fetch (ms)
+ * @constant {number}
+ */
+const VIEWPORT_FETCH_DELAY_MS = 250;
+
 /**
  * Fetches OHLCV candlestick data from the timeseries API
  *
+ * When maxPoints is given, the server merges consecutive bars into at most
+ * that many candles and reports the bucket size as bars_per_candle.
+ *
  * @param {string} symbol - Trading symbol (e.g., "SPY.ARCA")
  * @param {string} start - Start date (YYYY-MM-DD)
  * @param {string} end - End date (YYYY-MM-DD)
  * @param {string} [timeframe="1_DAY"] - Bar timeframe
+ * @param {number|null} [maxPoints=null] - Candle budget for the range
  * @returns {Promise<Object>} API response with candles array
  * @throws {Error} If API request fails
  */
-async function fetchOHLCVData(symbol, start, end, timeframe = "1_DAY") {
-    const url = `/api/timeseries?symbol=${symbol}&start=${start}&end=${end}&timeframe=${timeframe}`;
+async function fetchOHLCVData(symbol, start, end, timeframe = "1_DAY", maxPoints = null) {
+    let url = `/api/timeseries?symbol=${symbol}&start=${start}&end=${end}&timeframe=${timeframe}`;
+    if (maxPoints) {
+        url += `&max_points=${maxPoints}`;
+    }
     const response = await fetch(url);
 
     if (!response.ok) {
@@ -33,6 +52,111 @@ async function fetchOHLCVData(symbol, start, end, timeframe = "1_DAY") {
     return await response.json();
 }
 
+/**
+ * Number of candles worth drawing in a container (about one per pixel)
+ *
+ * @param {HTMLElement} container - Chart container element
+ * @returns {number} Candle budget for a request
+ */
+function getChartPointBudget(container) {
+    const width = container.clientWidth || 1000;
+    return Math.min(Math.max(Math.round(width), 200), MAX_CHART_POINTS);
+}
+
+/**
+ * Formats a Unix timestamp (seconds) as a UTC date string
+ *
+ * @param {number} seconds - Unix timestamp in seconds
+ * @returns {string} Date string (YYYY-MM-DD)
+ */
+function toIsoDate(seconds) {
+    return new Date(seconds * 1000).toISOString().slice(0, 10);
+}
+
+/**
+ * Replaces the candles inside a window with finer-resolution candles
+ *
+ * @param {Array<Object>} coarse - Candles covering the full range
+ * @param {Array<Object>} fine - Candles covering only the window
+ * @returns {Array<Object>} Merged candles sorted by time
+ */
+function mergeCandleWindow(coarse, fine) {
+    if (fine.length === 0) {
+        return coarse;
+    }
+    const first = fine[0].time;
+    const last = fine[fine.length - 1].time;
+    const outside = coarse.filter((c) => c.time < first || c.time > last);
+    return outside.concat(fine);
+}
+
+/**
+ * Loads higher-resolution candles for the visible window on pan/zoom
+ *
+ * The initial request covers the whole range at a coarse resolution. When
+ * the user zooms in, only the visible dates are fetched again with the same
+ * candle budget and spliced into the series, so detail grows with zoom while
+ * each response stays small.
+ *
+ * @param {IChartApi} chart - Chart instance
+ * @param {HTMLElement} container - Chart container element
+ * @param {Object} series - Series to refresh ({candles, volume})
+ * @param {Object} request - Original request ({symbol, start, end, timeframe})
+ * @param {Object} initial - Initial API response
+ */
+function attachViewportLoader(chart, container, series, request, initial) {
+    if (!initial.bars_per_candle || initial.bars_per_candle <= 1) {
+        return;
+    }
+
+    let candles = initial.candles;
+    let loadedWindow = `${request.start}:${request.end}`;
+    let timer = null;
+    let latestRequest = 0;
+
+    const loadVisibleWindow = async (range) => {
+        const start = toIsoDate(range.from) < request.start ? request.start : toIsoDate(range.from);
+        const end = toIsoDate(range.to) > request.end ? request.end : toIsoDate(range.to);
+        const windowKey = `${start}:${end}`;
+        if (windowKey === loadedWindow) {
+            return;
+        }
+        loadedWindow = windowKey;
+        const requestId = ++latestRequest;
+
+        try {
+            const data = await fetchOHLCVData(
+                request.symbol,
+                start,
+                end,
+                request.timeframe,
+                getChartPointBudget(container)
+            );
+            // Ignore responses overtaken by a newer pan/zoom
+            if (requestId !== latestRequest || !data.candles) {
+                return;
+            }
+            candles = mergeCandleWindow(candles, data.candles);
+            const visible = chart.timeScale().getVisibleRange();
+            series.candles.setData(formatCandleData(candles));
+            series.volume.setData(formatVolumeData(candles));
+            if (visible) {
+                chart.timeScale().setVisibleRange(visible);
+            }
+        } catch (error) {
+            console.warn("Failed to load visible price range:", error);
+        }
+    };
+
+    chart.timeScale().subscribeVisibleTimeRangeChange((range) => {
+        if (!range) {
+            return;
+        }
+        clearTimeout(timer);
+        timer = setTimeout(() => loadVisibleWindow(range), VIEWPORT_FETCH_DELAY_MS);
+    });
+}
+
 /**
  * Fetches trade data for a backtest run
  *
@@ -176,7 +300,7 @@ async function initRunPriceChart(container) {
     try {
         // Fetch data in parallel
         const [timeseriesData, tradesData] = await Promise.all([
-            fetchOHLCVData(symbol, start, end, timeframe),
+            fetchOHLCVData(symbol, start, end, timeframe, getChartPointBudget(container)),
             fetchTrades(runId),
         ]);
 
@@ -212,6 +336,13 @@ async function initRunPriceChart(container) {
         // Finalize
         chart.timeScale().fitContent();
         createResizeObserver(container, chart);
+        attachViewportLoader(
+            chart,
+            container,
+            { candles: candlestickSeries, volume: volumeSeries },
+            { symbol, start, end, timeframe },
+            timeseriesData
+        );
 
     } catch (error) {
         console.error("Error initializing price chart:", error);
@@ -229,7 +360,9 @@ async function initDataViewChart(container) {
     const { symbol, start, end, timeframe = "1_DAY" } = container.dataset;
 
     try {
-        const data = await fetchOHLCVData(symbol, start, end, timeframe);
+        const data = await fetchOHLCVData(
+            symbol, start, end, timeframe, getChartPointBudget(container)
+        );
         hideLoading(container);
 
         if (!data.candles || data.candles.length === 0) {
@@ -255,6 +388,13 @@ async function initDataViewChart(container) {
 
         chart.timeScale().fitContent();
         createResizeObserver(container, chart);
+        attachViewportLoader(
+            chart,
+            container,
+            { candles: candlestickSeries, volume: volumeSeries },
+            { symbol, start, end, timeframe },
+            data
+        );
 
     } catch (error) {
         console.error("Error initializing data view chart:", error);
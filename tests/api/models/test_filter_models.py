@@ -4,7 +4,8 @@ Unit tests for FilterState and related filter models.
 Tests validation logic, state transformations, and serialization.
 """
 
-from datetime import date
+from datetime import date, datetime, timezone
+from decimal import Decimal
 
 import pytest
 from pydantic import ValidationError
@@ -16,6 +17,8 @@ from src.api.models.filter_models import (
     SortableColumn,
     SortColumn,
     SortOrder,
+    decode_cursor,
+    encode_cursor,
 )
 
 
@@ -393,3 +396,54 @@ class TestPaginationControl:
             label="Previous",
         )
         assert ctrl.is_disabled is True
+
+
+class TestListCursor:
+    """Test keyset cursor encoding and FilterState cursor fields."""
+
+    @pytest.mark.parametrize(
+        ("sort", "value"),
+        [
+            (SortColumn.CREATED_AT, datetime(2024, 6, 1, 12, 30, tzinfo=timezone.utc)),
+            (SortColumn.SHARPE_RATIO, Decimal("1.234500")),
+            (SortColumn.SHARPE_RATIO, None),
+            (SortColumn.STRATEGY_NAME, "SMA Crossover"),
+        ],
+    )
+    def test_cursor_round_trips(self, sort: SortColumn, value) -> None:
+        """Decoding an encoded cursor returns the typed value and id."""
+        token = encode_cursor(value, 42)
+
+        assert decode_cursor(token, sort) == (value, 42)
+        assert "=" not in token
+
+    @pytest.mark.parametrize("token", ["not-base64!", "bnVsbA", "WzEsMl0"])
+    def test_malformed_cursor_raises(self, token: str) -> None:
+        """Garbage, non-list and wrongly typed payloads are rejected."""
+        with pytest.raises(ValueError):
+            decode_cursor(token, SortColumn.CREATED_AT)
+
+    def test_cursor_value_must_fit_sort_column(self) -> None:
+        """A strategy-name cursor cannot be reused for a date sort."""
+        token = encode_cursor("SMA Crossover", 1)
+
+        with pytest.raises(ValueError):
+            decode_cursor(token, SortColumn.CREATED_AT)
+
+    def test_after_and_before_are_exclusive(self) -> None:
+        """Setting both cursor directions is a validation error."""
+        with pytest.raises(ValidationError):
+            FilterState(after="abc", before="def")
+
+    def test_cursor_included_in_query_params(self) -> None:
+        """A set cursor is carried in query params."""
+        state = FilterState(after="abc", page=2)
+
+        assert state.to_query_params()["after"] == "abc"
+
+    def test_with_sort_drops_cursor(self) -> None:
+        """Cursors belong to one sort order, so changing sort clears them."""
+        state = FilterState(after="abc", page=3).with_sort(SortColumn.SHARPE_RATIO)
+
+        assert state.after is None
+        assert state.page == 1
@@ -20,6 +20,7 @@ from src.api.web import app
 from src.db.base import Base
 from src.db.models.backtest import BacktestRun, PerformanceMetrics
 from src.services.data_catalog import DataCatalogService
+from src.services.exceptions import DataNotFoundError
 
 
 @pytest.fixture
@@ -80,6 +81,9 @@ def mock_data_catalog_service() -> MagicMock:
     mock = MagicMock(spec=DataCatalogService)
     mock.query_bars = MagicMock(return_value=[])
     mock.get_availability = MagicMock(return_value=None)
+    mock.query_derived_bar_arrays = MagicMock(
+        side_effect=DataNotFoundError("AAPL.NASDAQ", datetime(2024, 1, 1), datetime(2024, 1, 1))
+    )
     return mock
 
 
@@ -0,0 +1,82 @@
+"""
+Tests for the shared catalog dependency and POST /api/admin/catalog/refresh.
+"""
+
+from unittest.mock import MagicMock, patch
+
+from fastapi.testclient import TestClient
+
+from src.api import dependencies
+from src.api.dependencies import get_data_catalog_service, reset_data_catalog_service
+from src.api.web import app
+
+
+class TestSharedDataCatalogService:
+    """Tests for the process-wide DataCatalogService dependency."""
+
+    def test_returns_same_instance_across_calls(self):
+        """The catalog service is constructed once and reused."""
+        reset_data_catalog_service()
+        try:
+            with patch.object(dependencies, "DataCatalogService") as mock_cls:
+                first = get_data_catalog_service()
+                second = get_data_catalog_service()
+
+            assert first is second
+            mock_cls.assert_called_once()
+        finally:
+            reset_data_catalog_service()
+
+    def test_reset_forces_new_instance(self):
+        """Resetting the shared service creates a new one on next use."""
+        reset_data_catalog_service()
+        try:
+            with patch.object(dependencies, "DataCatalogService") as mock_cls:
+                mock_cls.side_effect = [MagicMock(), MagicMock()]
+                first = get_data_catalog_service()
+                reset_data_catalog_service()
+                second = get_data_catalog_service()
+
+            assert first is not second
+            assert mock_cls.call_count == 2
+        finally:
+            reset_data_catalog_service()
+
+
+class TestCatalogRefreshEndpoint:
+    """Tests for POST /api/admin/catalog/refresh endpoint."""
+
+    def test_refresh_forces_rescan_by_default(self, client: TestClient):
+        """Refresh endpoint forces a full rescan and reports the result."""
+        mock_catalog = MagicMock()
+        mock_catalog.refresh_availability.return_value = True
+        mock_catalog.availability_cache = {"AAPL.NASDAQ_1-DAY-LAST": MagicMock()}
+        app.dependency_overrides[get_data_catalog_service] = lambda: mock_catalog
+
+        try:
+            response = client.post("/api/admin/catalog/refresh")
+
+            assert response.status_code == 200
+            data = response.json()
+            assert data["changed"] is True
+            assert data["entries"] == 1
+            assert "refreshed_at" in data
+            mock_catalog.refresh_availability.assert_called_once_with(force=True)
+        finally:
+            app.dependency_overrides.pop(get_data_catalog_service, None)
+
+    def test_refresh_without_force(self, client: TestClient):
+        """Refresh endpoint can run an incremental (mtime-based) check."""
+        mock_catalog = MagicMock()
+        mock_catalog.refresh_availability.return_value = False
+        mock_catalog.availability_cache = {}
+        app.dependency_overrides[get_data_catalog_service] = lambda: mock_catalog
+
+        try:
+            response = client.post("/api/admin/catalog/refresh?force=false")
+
+            assert response.status_code == 200
+            assert response.json()["changed"] is False
+            mock_catalog.refresh_availability.assert_called_once_with(force=False)
+        finally:
+            app.dependency_overrides.pop(get_data_catalog_service, None)
@@ -0,0 +1,231 @@
+"""
+Tests for Arrow IPC responses on chart endpoints.
+
+Covers Accept-header negotiation and parity with the JSON payloads. The
+payload-size / server-CPU comparison lives in
+scripts/benchmark_timeseries_payload.py.
+"""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import numpy as np
+import pyarrow as pa
+import pytest
+from fastapi.testclient import TestClient
+from nautilus_trader.model.data import Bar, BarType
+from starlette.requests import Request
+
+from src.api.columnar import ARROW_STREAM_MEDIA_TYPE, wants_arrow
+from src.api.dependencies import get_backtest_query_service, get_data_catalog_service
+from src.api.rest.trades import trade_marker_columns
+from src.api.web import app
+from src.services.data_catalog import DataCatalogService
+
+ARROW_HEADERS = {"Accept": ARROW_STREAM_MEDIA_TYPE}
+BASE_NS = 1_704_067_200_000_000_000  # 2024-01-01 00:00 UTC
+MINUTE_NS = 60_000_000_000
+
+
+def _minute_bars(count: int) -> list[Bar]:
+    """AAPL 1-minute bars starting 2024-01-01."""
+    close = 150.0 + np.round(np.sin(np.arange(count) / 100.0) * 5.0, 2)
+    ts = (BASE_NS + MINUTE_NS * np.arange(count)).astype(np.uint64)
+    return Bar.from_raw_arrays_to_list(
+        BarType.from_str("AAPL.NASDAQ-1-MINUTE-LAST-EXTERNAL"),
+        2,
+        0,
+        close - 0.25,
+        close + 0.5,
+        close - 0.5,
+        close,
+        np.full(count, 1_200.0),
+        ts,
+        ts,
+    )
+
+
+def _read_stream(content: bytes) -> pa.Table:
+    """Decode an Arrow IPC stream body."""
+    return pa.ipc.open_stream(content).read_all()
+
+
+@pytest.fixture
+def catalog_client(tmp_path):
+    """Test client backed by a real catalog holding 50k minute bars."""
+    service = DataCatalogService(catalog_path=tmp_path)
+    service.catalog.write_data(_minute_bars(50_000))
+    service.refresh_availability(force=True)
+    app.dependency_overrides[get_data_catalog_service] = lambda: service
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.pop(get_data_catalog_service, None)
+
+
+TIMESERIES_PARAMS = {
+    "symbol": "AAPL",
+    "start": "2024-01-01",
+    "end": "2024-02-15",
+    "timeframe": "1_MIN",
+}
+
+
+class TestAcceptNegotiation:
+    """Tests for wants_arrow header parsing."""
+
+    @pytest.mark.parametrize(
+        "accept,expected",
+        [
+            (ARROW_STREAM_MEDIA_TYPE, True),
+            (f"application/json;q=0.5, {ARROW_STREAM_MEDIA_TYPE};q=1", True),
+            ("application/json", False),
+            ("*/*", False),
+            ("", False),
+        ],
+    )
+    def test_wants_arrow(self, accept: str, expected: bool):
+        """Only an explicit Arrow media type selects the columnar format."""
+        request = Request({"type": "http", "headers": [(b"accept", accept.encode())]})
+        assert wants_arrow(request) is expected
+
+
+class TestTimeseriesArrow:
+    """Tests for the Arrow stream variant of GET /api/timeseries."""
+
+    def test_arrow_matches_json(self, catalog_client: TestClient):
+        """Arrow columns carry the same candles as the JSON response."""
+        json_data = catalog_client.get("/api/timeseries", params=TIMESERIES_PARAMS).json()
+        response = catalog_client.get(
+            "/api/timeseries", params=TIMESERIES_PARAMS, headers=ARROW_HEADERS
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == ARROW_STREAM_MEDIA_TYPE
+        table = _read_stream(response.content)
+        assert table.schema.metadata[b"symbol"] == b"AAPL"
+        assert table.schema.metadata[b"bars_per_candle"] == b"1"
+        assert table.column_names == ["time", "open", "high", "low", "close", "volume"]
+        assert table.num_rows == len(json_data["candles"])
+        assert table.column("time").to_pylist() == [c["time"] for c in json_data["candles"]]
+        assert table.column("close").to_pylist() == [c["close"] for c in json_data["candles"]]
+
+    def test_arrow_honours_max_points(self, catalog_client: TestClient):
+        """Aggregation applies to the Arrow path too."""
+        params = {**TIMESERIES_PARAMS, "max_points": 500}
+        json_data = catalog_client.get("/api/timeseries", params=params).json()
+        table = _read_stream(
+            catalog_client.get("/api/timeseries", params=params, headers=ARROW_HEADERS).content
+        )
+
+        assert table.num_rows == len(json_data["candles"]) <= 500
+        assert (
+            table.schema.metadata[b"bars_per_candle"] == str(json_data["bars_per_candle"]).encode()
+        )
+        assert table.column("high").to_pylist() == [c["high"] for c in json_data["candles"]]
+
+
+class TestDerivedTimeframes:
+    """Tests for timeframes aggregated from the stored minute bars."""
+
+    def test_hourly_candles_derived_from_minutes(self, catalog_client: TestClient):
+        """An unstored timeframe is served from aggregated minute bars in both formats."""
+        params = {**TIMESERIES_PARAMS, "end": "2024-01-01", "timeframe": "1_HOUR"}
+
+        json_response = catalog_client.get("/api/timeseries", params=params)
+        table = _read_stream(
+            catalog_client.get("/api/timeseries", params=params, headers=ARROW_HEADERS).content
+        )
+
+        assert json_response.status_code == 200
+        candles = json_response.json()["candles"]
+        assert len(candles) == table.num_rows == 24
+        assert candles[1]["time"] == BASE_NS // 1_000_000_000 + 3_600
+        assert candles[0]["volume"] == 60 * 1_200
+        assert table.column("close").to_pylist() == [c["close"] for c in candles]
+
+    def test_stored_timeframe_out_of_range_is_not_derived(self, catalog_client: TestClient):
+        """A stored timeframe with no bars in range still returns 404."""
+        params = {**TIMESERIES_PARAMS, "start": "2025-01-01", "end": "2025-01-02"}
+
+        assert catalog_client.get("/api/timeseries", params=params).status_code == 404
+
+
+class TestEquityArrow:
+    """Tests for the Arrow stream variant of GET /api/equity/{run_id}."""
+
+    def test_arrow_equity_columns(self, client: TestClient):
+        """Equity and drawdown are returned as aligned columns."""
+        run_id = uuid4()
+        mock_backtest = MagicMock()
+        mock_service = MagicMock()
+
+        async def mock_get_equity_curve(rid):
+            curve = MagicMock()
+            curve.times = np.array([1704067200, 1704153600, 1704240000], dtype=np.int64)
+            curve.values = np.array([100000.0, 105000.0, 100000.0])
+            return curve
+
+        mock_service.get_equity_curve = mock_get_equity_curve
+
+        async def mock_get_backtest(rid):
+            return mock_backtest
+
+        mock_service.get_backtest_by_id = mock_get_backtest
+        app.dependency_overrides[get_backtest_query_service] = lambda: mock_service
+
+        try:
+            response = client.get(f"/api/equity/{run_id}", headers=ARROW_HEADERS)
+
+            assert response.status_code == 200
+            table = _read_stream(response.content)
+            assert table.schema.metadata[b"run_id"] == str(run_id).encode()
+            assert table.column("time").to_pylist() == [1704067200, 1704153600, 1704240000]
+            assert table.column("equity").to_pylist() == [100000.0, 105000.0, 100000.0]
+            assert table.column("drawdown").to_pylist() == [0.0, 0.0, -4.76]
+        finally:
+            app.dependency_overrides.pop(get_backtest_query_service, None)
+
+
+class TestTradeMarkerColumns:
+    """Tests for trade_marker_columns function."""
+
+    def test_matches_json_marker_order(self):
+        """Entry and exit markers are interleaved, filtered and sorted by date."""
+        rows = [
+            (
+                datetime(2024, 1, 15, tzinfo=timezone.utc),
+                datetime(2024, 1, 20, tzinfo=timezone.utc),
+                "BUY",
+                Decimal("185.50"),
+                Decimal("190.00"),
+                Decimal("100"),
+                Decimal("450.0"),
+            ),
+            (
+                datetime(2024, 1, 20, tzinfo=timezone.utc),
+                None,
+                "SELL",
+                Decimal("190.00"),
+                None,
+                Decimal("50"),
+                None,
+            ),
+        ]
+
+        columns = trade_marker_columns(rows)
+
+        assert columns["time"].tolist() == ["2024-01-15", "2024-01-20", "2024-01-20"]
+        assert columns["side"].tolist() == ["buy", "sell", "sell"]
+        assert columns["price"].tolist() == [185.5, 190.0, 190.0]
+        assert columns["quantity"].tolist() == [100.0, 100.0, 50.0]
+        assert columns["pnl"].tolist() == [0.0, 450.0, 0.0]
+
+    def test_empty_rows_produce_typed_columns(self):
+        """No trades still yields a valid Arrow schema."""
+        table = pa.table(trade_marker_columns([]))
+
+        assert table.num_rows == 0
+        assert table.schema.field("time").type == pa.string()
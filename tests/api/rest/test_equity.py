@@ -4,15 +4,33 @@ Tests for GET /api/equity/{run_id} endpoint.
 Tests equity curve and drawdown data retrieval.
 """
 
+from datetime import datetime, timezone
+from decimal import Decimal
 from unittest.mock import MagicMock
 from uuid import uuid4
 
+import numpy as np
 from fastapi.testclient import TestClient
 
 from src.api.dependencies import get_backtest_query_service
 from src.api.web import app
 
 
+def _stored_curve(points: list[dict] | None):
+    """Async get_equity_curve stub returning the points as a stored curve."""
+
+    async def get_equity_curve(run_id):
+        if points is None:
+            return None
+        curve = MagicMock()
+        curve.point_count = len(points)
+        curve.times = np.array([p["time"] for p in points], dtype=np.int64)
+        curve.values = np.array([p["value"] for p in points], dtype=np.float64)
+        return curve
+
+    return get_equity_curve
+
+
 class TestEquityEndpoint:
     """Tests for GET /api/equity/{run_id} endpoint."""
 
@@ -22,14 +40,14 @@ class TestEquityEndpoint:
         mock_service = MagicMock()
         mock_backtest = MagicMock()
         mock_backtest.run_id = run_id
-        mock_backtest.config_snapshot = {
-            "equity_curve": [
+        mock_service.get_equity_curve = _stored_curve(
+            [
                 {"time": 1704067200, "value": 100000.0},  # 2024-01-01
                 {"time": 1705276800, "value": 100000.0},  # 2024-01-15
                 {"time": 1705708800, "value": 100450.0},  # 2024-01-20
                 {"time": 1706659200, "value": 100450.0},  # 2024-01-31
             ]
-        }
+        )
 
         async def mock_get_backtest(rid):
             return mock_backtest
@@ -57,14 +75,14 @@ class TestEquityEndpoint:
         mock_backtest = MagicMock()
         mock_backtest.run_id = run_id
         # Equity: 100000 -> 105000 (peak) -> 100000 (5% drawdown) -> 110000 (new peak)
-        mock_backtest.config_snapshot = {
-            "equity_curve": [
+        mock_service.get_equity_curve = _stored_curve(
+            [
                 {"time": 1704067200, "value": 100000.0},  # 2024-01-01
                 {"time": 1704844800, "value": 105000.0},  # 2024-01-10
                 {"time": 1705276800, "value": 100000.0},  # 2024-01-15
                 {"time": 1705708800, "value": 110000.0},  # 2024-01-20
             ]
-        }
+        )
 
         async def mock_get_backtest(rid):
             return mock_backtest
@@ -96,12 +114,12 @@ class TestEquityEndpoint:
         mock_service = MagicMock()
         mock_backtest = MagicMock()
         mock_backtest.run_id = run_id
-        mock_backtest.config_snapshot = {
-            "equity_curve": [
+        mock_service.get_equity_curve = _stored_curve(
+            [
                 {"time": 1704067200, "value": 100000.0},  # 2024-01-01
                 {"time": 1706659200, "value": 100450.0},  # 2024-01-31
             ]
-        }
+        )
 
         async def mock_get_backtest(rid):
             return mock_backtest
@@ -119,6 +137,36 @@ class TestEquityEndpoint:
         finally:
             app.dependency_overrides.pop(get_backtest_query_service, None)
 
+    def test_equity_decimates_to_max_points(self, client: TestClient):
+        """Test that max_points decimates the curve but keeps the deepest drawdown."""
+        run_id = uuid4()
+        mock_service = MagicMock()
+        mock_backtest = MagicMock()
+        mock_backtest.run_id = run_id
+        curve = [{"time": 1704067200 + 3600 * i, "value": 100000.0 + i} for i in range(1000)]
+        curve[500]["value"] = 90000.0  # single-point crash
+        mock_service.get_equity_curve = _stored_curve(curve)
+
+        async def mock_get_backtest(rid):
+            return mock_backtest
+
+        mock_service.get_backtest_by_id = mock_get_backtest
+
+        app.dependency_overrides[get_backtest_query_service] = lambda: mock_service
+
+        try:
+            response = client.get(f"/api/equity/{run_id}", params={"max_points": 50})
+
+            assert response.status_code == 200
+            data = response.json()
+            assert len(data["equity"]) <= 50
+            assert len(data["drawdown"]) == len(data["equity"])
+            assert data["equity"][0]["time"] == curve[0]["time"]
+            assert data["equity"][-1]["time"] == curve[-1]["time"]
+            assert min(p["value"] for p in data["drawdown"]) < -10.0
+        finally:
+            app.dependency_overrides.pop(get_backtest_query_service, None)
+
 
 class TestEquity404Error:
     """Tests for 404 error when run_id not found."""
@@ -156,12 +204,12 @@ class TestEquityEmptyData:
     """Tests for empty equity curve response."""
 
     def test_equity_returns_empty_when_no_data(self, client: TestClient):
-        """Test that missing equity_curve returns empty arrays."""
+        """Test that a run without a stored curve returns empty arrays."""
         run_id = uuid4()
         mock_service = MagicMock()
+        mock_service.get_equity_curve = _stored_curve(None)
         mock_backtest = MagicMock()
         mock_backtest.run_id = run_id
-        mock_backtest.config_snapshot = {}  # No equity_curve key
         mock_backtest.metrics = None  # No metrics to prevent fallback
 
         async def mock_get_backtest(rid):
@@ -180,3 +228,38 @@ class TestEquityEmptyData:
             assert data["drawdown"] == []
         finally:
             app.dependency_overrides.pop(get_backtest_query_service, None)
+
+
+class TestEquityFallback:
+    """Tests for runs without a stored equity curve."""
+
+    def test_equity_falls_back_to_capital_and_final_balance(self, client: TestClient):
+        """With metrics but no curve, a 2-point start/end curve is returned."""
+        run_id = uuid4()
+        mock_service = MagicMock()
+        mock_service.get_equity_curve = _stored_curve(None)
+        mock_backtest = MagicMock()
+        mock_backtest.start_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        mock_backtest.end_date = datetime(2024, 1, 31, tzinfo=timezone.utc)
+        mock_backtest.initial_capital = Decimal("100000.00")
+        mock_backtest.metrics.final_balance = Decimal("95000.00")
+
+        async def mock_get_backtest(rid):
+            return mock_backtest
+
+        mock_service.get_backtest_by_id = mock_get_backtest
+
+        app.dependency_overrides[get_backtest_query_service] = lambda: mock_service
+
+        try:
+            response = client.get(f"/api/equity/{run_id}")
+
+            assert response.status_code == 200
+            data = response.json()
+            assert data["equity"] == [
+                {"time": 1704067200, "value": 100000.0},
+                {"time": 1706659200, "value": 95000.0},
+            ]
+            assert [p["value"] for p in data["drawdown"]] == [0.0, -5.0]
+        finally:
+            app.dependency_overrides.pop(get_backtest_query_service, None)
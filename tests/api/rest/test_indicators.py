@@ -7,13 +7,51 @@ based on the strategy_path in config_snapshot.
 """
 
 from datetime import date, datetime, timezone
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
+import numpy as np
+import pytest
 from fastapi.testclient import TestClient
 
-from src.api.dependencies import get_backtest_query_service, get_data_catalog_service
+from src.api.dependencies import (
+    get_backtest_query_service,
+    get_data_catalog_service,
+    get_indicator_series_cache,
+)
 from src.api.web import app
+from src.services.indicator_series import IndicatorSeriesCache
+from src.services.shared_bars import BarArrays
+
+
+def _daily_arrays(count: int) -> BarArrays:
+    """Daily SPY bars from 2024-01-01 with close = 100 + index."""
+    close = 100.0 + np.arange(count, dtype=np.float64)
+    ts = (
+        int(datetime(2024, 1, 1, tzinfo=timezone.utc).timestamp() * 1e9)
+        + 86_400_000_000_000 * np.arange(count)
+    ).astype(np.uint64)
+    return BarArrays(
+        bar_type="SPY.ARCA-1-DAY-LAST-EXTERNAL",
+        price_precision=2,
+        size_precision=0,
+        open=close,
+        high=close + 1.0,
+        low=close - 1.0,
+        close=close,
+        volume=np.full(count, 1_000.0),
+        ts_event=ts,
+        ts_init=ts,
+    )
+
+
+@pytest.fixture(autouse=True)
+def indicator_cache(tmp_path) -> IndicatorSeriesCache:
+    """Isolated indicator cache so tests never write sidecars into the real catalog."""
+    cache = IndicatorSeriesCache(tmp_path / "indicators")
+    app.dependency_overrides[get_indicator_series_cache] = lambda: cache
+    yield cache
+    app.dependency_overrides.pop(get_indicator_series_cache, None)
 
 
 class TestIndicatorsEndpoint:
@@ -43,7 +81,7 @@ class TestIndicatorsEndpoint:
 
         # Mock DataCatalogService to return empty bars (indicators will be empty)
         mock_catalog = MagicMock()
-        mock_catalog.query_bars = MagicMock(return_value=[])
+        mock_catalog.query_bar_arrays = MagicMock(return_value=_daily_arrays(0))
 
         app.dependency_overrides[get_backtest_query_service] = lambda: mock_service
         app.dependency_overrides[get_data_catalog_service] = lambda: mock_catalog
@@ -83,18 +121,9 @@ class TestIndicatorsEndpoint:
 
         mock_service.get_backtest_by_id = mock_get_backtest
 
-        # Create mock bars that will generate indicator data
-        mock_bars = []
         # Need enough bars for the SMA to initialize (slow_period=10)
-        for i in range(15):
-            mock_bar = MagicMock()
-            mock_bar.ts_event = int(datetime(2024, 1, i + 1, tzinfo=timezone.utc).timestamp() * 1e9)
-            mock_bar.close = MagicMock()
-            mock_bar.close.__float__ = MagicMock(return_value=100.0 + i)
-            mock_bars.append(mock_bar)
-
         mock_catalog = MagicMock()
-        mock_catalog.query_bars = MagicMock(return_value=mock_bars)
+        mock_catalog.query_bar_arrays = MagicMock(return_value=_daily_arrays(15))
 
         app.dependency_overrides[get_backtest_query_service] = lambda: mock_service
         app.dependency_overrides[get_data_catalog_service] = lambda: mock_catalog
@@ -106,12 +135,63 @@ class TestIndicatorsEndpoint:
             data = response.json()
 
             # Check that indicators are computed and sorted
-            if data["indicators"] and "sma_fast" in data["indicators"]:
-                sma_fast = data["indicators"]["sma_fast"]
-                if len(sma_fast) > 1:
-                    # Verify sorted by time
-                    times = [p["time"] for p in sma_fast]
-                    assert times == sorted(times)
+            sma_fast = data["indicators"]["sma_fast"]
+            assert len(sma_fast) == 11
+            times = [p["time"] for p in sma_fast]
+            assert times == sorted(times)
+        finally:
+            app.dependency_overrides.pop(get_backtest_query_service, None)
+            app.dependency_overrides.pop(get_data_catalog_service, None)
+
+
+class TestIndicatorsCaching:
+    """Tests for cached indicator series."""
+
+    def test_second_request_is_served_from_cache(
+        self, client: TestClient, indicator_cache: IndicatorSeriesCache
+    ):
+        """Bars are queried and replayed only on the first view of a run."""
+        run_id = uuid4()
+        mock_backtest = MagicMock()
+        mock_backtest.instrument_symbol = "SPY.ARCA"
+        mock_backtest.start_date = date(2024, 1, 1)
+        mock_backtest.end_date = date(2024, 1, 31)
+        mock_backtest.config_snapshot = {
+            "strategy_path": "src.core.strategies.sma_crossover:SMACrossover",
+            "config": {"fast_period": 2, "slow_period": 3},
+        }
+
+        async def mock_get_backtest(rid):
+            return mock_backtest
+
+        mock_service = MagicMock()
+        mock_service.get_backtest_by_id = mock_get_backtest
+
+        mock_catalog = MagicMock()
+        mock_catalog.get_availability.return_value = MagicMock(
+            start_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            end_date=datetime(2024, 1, 5, tzinfo=timezone.utc),
+            file_count=1,
+            total_rows=5,
+        )
+        mock_catalog.query_bar_arrays = MagicMock(return_value=_daily_arrays(5))
+
+        app.dependency_overrides[get_backtest_query_service] = lambda: mock_service
+        app.dependency_overrides[get_data_catalog_service] = lambda: mock_catalog
+
+        try:
+            with patch(
+                "src.services.indicator_series.compute_indicator_series",
+                return_value={"sma_fast": [("2024-01-02", 100.5)], "sma_slow": []},
+            ) as compute:
+                first = client.get(f"/api/indicators/{run_id}").json()
+                second = client.get(f"/api/indicators/{run_id}").json()
+
+            assert first == second
+            assert first["indicators"]["sma_fast"] == [{"time": "2024-01-02", "value": 100.5}]
+            assert mock_catalog.query_bar_arrays.call_count == 1
+            assert compute.call_count == 1
+            assert any((indicator_cache.root / str(run_id)).glob("*.parquet"))
         finally:
             app.dependency_overrides.pop(get_backtest_query_service, None)
             app.dependency_overrides.pop(get_data_catalog_service, None)
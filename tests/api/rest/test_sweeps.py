@@ -0,0 +1,81 @@
+"""
+Tests for GET /api/sweeps/{sweep_id} endpoint.
+
+Tests ranked retrieval of parameter sweep runs.
+"""
+
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+
+from src.api.dependencies import get_backtest_query_service
+from src.api.web import app
+
+
+def _run(fast_period: int, sharpe: str | None, status: str = "success") -> MagicMock:
+    """Build a mock BacktestRun belonging to a sweep."""
+    run = MagicMock()
+    run.run_id = uuid4()
+    run.execution_status = status
+    run.error_message = None if status == "success" else "engine failed"
+    run.config_snapshot = {"config": {"fast_period": fast_period, "slow_period": 50}}
+    if sharpe is None:
+        run.metrics = None
+    else:
+        run.metrics = MagicMock()
+        run.metrics.total_return = Decimal("0.12")
+        run.metrics.sharpe_ratio = Decimal(sharpe)
+        run.metrics.sortino_ratio = None
+        run.metrics.max_drawdown = Decimal("-0.08")
+        run.metrics.total_trades = 14
+    return run
+
+
+class TestSweepsEndpoint:
+    """Tests for GET /api/sweeps/{sweep_id} endpoint."""
+
+    def test_returns_ranked_runs(self, client: TestClient):
+        """Runs are returned in service order with 1-based ranks and parameters."""
+        sweep_id = uuid4()
+        runs = [_run(10, "1.8"), _run(5, "0.9"), _run(15, None, status="failed")]
+        mock_service = MagicMock()
+        mock_service.get_sweep_runs = AsyncMock(return_value=runs)
+        app.dependency_overrides[get_backtest_query_service] = lambda: mock_service
+
+        try:
+            response = client.get(f"/api/sweeps/{sweep_id}?rank_by=total_return&limit=50")
+        finally:
+            app.dependency_overrides.clear()
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["sweep_id"] == str(sweep_id)
+        assert data["rank_by"] == "total_return"
+        assert [item["rank"] for item in data["runs"]] == [1, 2, 3]
+        assert data["runs"][0]["parameters"]["fast_period"] == 10
+        assert data["runs"][0]["sharpe_ratio"] == 1.8
+        assert data["runs"][2]["execution_status"] == "failed"
+        assert data["runs"][2]["sharpe_ratio"] is None
+        mock_service.get_sweep_runs.assert_awaited_once_with(
+            sweep_id, metric="total_return", limit=50
+        )
+
+    def test_unknown_sweep_returns_404(self, client: TestClient):
+        """A sweep ID with no runs returns 404."""
+        mock_service = MagicMock()
+        mock_service.get_sweep_runs = AsyncMock(return_value=[])
+        app.dependency_overrides[get_backtest_query_service] = lambda: mock_service
+
+        try:
+            response = client.get(f"/api/sweeps/{uuid4()}")
+        finally:
+            app.dependency_overrides.clear()
+
+        assert response.status_code == 404
+
+    def test_invalid_rank_metric_returns_422(self, client: TestClient):
+        """Unsupported ranking metrics are rejected by validation."""
+        response = client.get(f"/api/sweeps/{uuid4()}?rank_by=win_rate")
+        assert response.status_code == 422
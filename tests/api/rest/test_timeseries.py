@@ -112,6 +112,56 @@ class TestTimeseriesEndpoint:
         finally:
             app.dependency_overrides.pop(get_data_catalog_service, None)
 
+    def test_timeseries_aggregates_to_max_points(
+        self, client: TestClient, mock_data_catalog_service: MagicMock
+    ):
+        """Test that max_points merges consecutive bars into OHLCV buckets."""
+        # Arrange: 10 one-minute bars with rising prices
+        bars = []
+        for i in range(10):
+            bar = MagicMock()
+            bar.ts_event = (1705276800 + 60 * i) * 1_000_000_000
+            bar.open.as_double.return_value = 100.0 + i
+            bar.high.as_double.return_value = 101.0 + i
+            bar.low.as_double.return_value = 99.0 + i
+            bar.close.as_double.return_value = 100.5 + i
+            bar.volume.as_double.return_value = 10
+            bars.append(bar)
+        mock_data_catalog_service.query_bars.return_value = bars
+
+        app.dependency_overrides[get_data_catalog_service] = lambda: mock_data_catalog_service
+
+        try:
+            # Act
+            response = client.get(
+                "/api/timeseries",
+                params={
+                    "symbol": "AAPL",
+                    "start": "2024-01-15",
+                    "end": "2024-01-15",
+                    "max_points": 3,
+                },
+            )
+
+            # Assert: buckets of 4, 4 and 2 bars
+            assert response.status_code == 200
+            data = response.json()
+            assert data["bars_per_candle"] == 4
+            assert [c["time"] for c in data["candles"]] == [
+                1705276800,
+                1705276800 + 240,
+                1705276800 + 480,
+            ]
+            first = data["candles"][0]
+            assert first["open"] == 100.0
+            assert first["high"] == 104.0
+            assert first["low"] == 99.0
+            assert first["close"] == 103.5
+            assert first["volume"] == 40
+            assert data["candles"][-1]["volume"] == 20
+        finally:
+            app.dependency_overrides.pop(get_data_catalog_service, None)
+
 
 class TestTimeseriesValidation:
     """Tests for timeseries parameter validation."""
@@ -176,6 +226,20 @@ class TestTimeseriesValidation:
         finally:
             app.dependency_overrides.pop(get_data_catalog_service, None)
 
+    def test_timeseries_rejects_out_of_range_max_points(self, client: TestClient):
+        """Test that max_points must be between 2 and the chart limit."""
+        response = client.get(
+            "/api/timeseries",
+            params={
+                "symbol": "AAPL",
+                "start": "2024-01-01",
+                "end": "2024-01-31",
+                "max_points": 1,
+            },
+        )
+
+        assert response.status_code == 422
+
     def test_timeseries_rejects_invalid_timeframe(self, client: TestClient):
         """Test that invalid timeframe parameter returns 422."""
         response = client.get(
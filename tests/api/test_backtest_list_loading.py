@@ -0,0 +1,425 @@
+"""
+Regression tests for backtest list and dashboard query loading.
+
+Verifies that trades and equity curves are loaded only on request, that
+list-page latency does not grow with the number of trades stored per run,
+and that keyset pages walk the whole list in order in both directions.
+"""
+
+import time
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+import numpy as np
+import pytest
+from sqlalchemy import BigInteger, event, insert, inspect
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+
+from src.api.models.filter_models import FilterState, SortColumn, SortOrder
+from src.db.models.backtest import BacktestRun, PerformanceMetrics
+from src.db.models.trade import Trade
+from src.db.repositories.backtest_repository import (
+    LIST_COUNT_CAP,
+    BacktestRepository,
+    filtered_list_statement,
+    list_sort_value,
+    max_offset_page,
+)
+from src.services.backtest_query import BacktestQueryService
+
+RUN_COUNT = 20
+TRADES_PER_RUN = 500
+
+
+@compiles(JSONB, "sqlite")
+def _compile_jsonb_for_sqlite(type_, compiler, **kw) -> str:
+    """Store JSONB columns as JSON so the schema builds on in-memory SQLite."""
+    return "JSON"
+
+
+@compiles(BigInteger, "sqlite")
+def _compile_biginteger_for_sqlite(type_, compiler, **kw) -> str:
+    """Store BIGINT keys as INTEGER so SQLite assigns ids to rows inserted without one."""
+    return "INTEGER"
+
+
+async def _seed_runs(session: AsyncSession) -> list[BacktestRun]:
+    """Insert successful runs with metrics and no trades."""
+    runs = []
+    for i in range(1, RUN_COUNT + 1):
+        run = BacktestRun(
+            id=i,
+            run_id=uuid4(),
+            strategy_name="SMA Crossover",
+            strategy_type="trend_following",
+            instrument_symbol="AAPL",
+            start_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            end_date=datetime(2024, 12, 31, tzinfo=timezone.utc),
+            initial_capital=Decimal("100000.00"),
+            data_source="IBKR",
+            execution_status="success",
+            execution_duration_seconds=Decimal("1.5"),
+            config_snapshot={"strategy_path": "src.strategies.sma", "config": {"fast": i}},
+            created_at=datetime(2024, 6, 1, tzinfo=timezone.utc) + timedelta(minutes=i),
+        )
+        run.metrics = PerformanceMetrics(
+            id=i,
+            total_return=Decimal("0.10"),
+            final_balance=Decimal("110000.00"),
+            sharpe_ratio=Decimal("1.2"),
+            max_drawdown=Decimal(f"-0.{i:02d}"),
+        )
+        runs.append(run)
+    session.add_all(runs)
+    await session.commit()
+    return runs
+
+
+async def _add_trades(session: AsyncSession, runs: list[BacktestRun]) -> None:
+    """Attach TRADES_PER_RUN trades to every run with a core bulk insert."""
+    entry = datetime(2024, 2, 1, tzinfo=timezone.utc)
+    rows = [
+        {
+            "id": run.id * TRADES_PER_RUN + n,
+            "backtest_run_id": run.id,
+            "instrument_id": "AAPL",
+            "trade_id": f"T-{run.id}-{n}",
+            "venue_order_id": f"O-{run.id}-{n}",
+            "order_side": "BUY",
+            "quantity": Decimal("10"),
+            "entry_price": Decimal("150.00"),
+            "exit_price": Decimal("151.00"),
+            "profit_loss": Decimal("10.00"),
+            "entry_timestamp": entry + timedelta(minutes=n),
+            "exit_timestamp": entry + timedelta(minutes=n + 1),
+            "created_at": entry,
+        }
+        for run in runs
+        for n in range(TRADES_PER_RUN)
+    ]
+    await session.execute(insert(Trade), rows)
+    await session.commit()
+
+
+async def _render_pages(service: BacktestQueryService) -> None:
+    """Run every list and dashboard query once with a fresh identity map."""
+    service.repository.session.expunge_all()
+    await service.get_backtest_list_page(page=1, page_size=20)
+    await service.get_filtered_backtest_list_page(FilterState(page_size=20))
+    await service.get_dashboard_stats()
+
+
+async def _best_latency(service: BacktestQueryService, repeats: int = 5) -> float:
+    """Best-of-N wall time of _render_pages in seconds."""
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        await _render_pages(service)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+@pytest.fixture
+def captured_sql(async_test_db: AsyncSession) -> list[str]:
+    """Record every SQL statement issued on the test database."""
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement.lower())
+
+    engine = async_test_db.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", _record)
+    yield statements
+    event.remove(engine, "before_cursor_execute", _record)
+
+
+class TestTradeLoading:
+    """Trades are opt-in for every backtest query."""
+
+    async def test_list_and_dashboard_queries_skip_trades(
+        self, async_test_db: AsyncSession, captured_sql: list[str]
+    ):
+        """List, filtered list and dashboard never select from the trades table."""
+        # Arrange
+        runs = await _seed_runs(async_test_db)
+        await _add_trades(async_test_db, runs)
+        service = BacktestQueryService(BacktestRepository(async_test_db))
+        captured_sql.clear()
+
+        # Act
+        await _render_pages(service)
+
+        # Assert
+        selects = [sql for sql in captured_sql if sql.lstrip().startswith("select")]
+        assert selects
+        assert not [sql for sql in selects if "from trades" in sql]
+
+    async def test_trades_load_only_on_request(self, async_test_db: AsyncSession):
+        """include_trades=True eagerly loads trades; summary queries skip the snapshot."""
+        # Arrange
+        runs = await _seed_runs(async_test_db)
+        await _add_trades(async_test_db, runs[:1])
+        repository = BacktestRepository(async_test_db)
+        async_test_db.expunge_all()
+
+        # Act
+        summary = await repository.find_by_run_id(runs[0].run_id)
+        async_test_db.expunge_all()
+        detailed = await repository.find_by_run_id(runs[0].run_id, include_trades=True)
+        async_test_db.expunge_all()
+        listed = await repository.find_recent(limit=RUN_COUNT, summary_only=True)
+
+        # Assert
+        assert "trades" in inspect(summary).unloaded
+        assert summary.metrics is not None
+        assert len(detailed.trades) == TRADES_PER_RUN
+        assert {"trades", "config_snapshot"} <= inspect(listed[0]).unloaded
+        assert listed[0].metrics is not None
+
+    async def test_list_latency_is_independent_of_trades_per_run(self, async_test_db: AsyncSession):
+        """Adding hundreds of trades per run does not slow down list pages."""
+        # Arrange
+        runs = await _seed_runs(async_test_db)
+        service = BacktestQueryService(BacktestRepository(async_test_db))
+        await _render_pages(service)  # warm up statement caches
+        baseline = await _best_latency(service)
+        await _add_trades(async_test_db, runs)
+
+        # Act
+        with_trades = await _best_latency(service)
+
+        # Assert
+        # Reason: loading RUN_COUNT * TRADES_PER_RUN trade objects takes far longer
+        # than the summary queries, so a generous bound still catches a regression.
+        assert with_trades < baseline * 3 + 0.05
+
+
+class TestEquityCurveLoading:
+    """Equity curves are stored apart from the run and read only by their endpoint."""
+
+    async def test_equity_curve_round_trips_outside_run_queries(
+        self, async_test_db: AsyncSession, captured_sql: list[str]
+    ):
+        """The curve is stored as arrays and never selected by run queries."""
+        # Arrange
+        runs = await _seed_runs(async_test_db)
+        repository = BacktestRepository(async_test_db)
+        points = [{"time": 1704067200 + 60 * n, "value": 100000.0 + n} for n in range(10_000)]
+        await repository.create_equity_curve(runs[0].id, points)
+        await async_test_db.commit()
+        service = BacktestQueryService(repository)
+        captured_sql.clear()
+
+        # Act
+        await _render_pages(service)
+        async_test_db.expunge_all()
+        run = await service.get_backtest_by_id(runs[0].run_id)
+        run_selects = list(captured_sql)
+        async_test_db.expunge_all()
+        curve = await service.get_equity_curve(runs[0].run_id)
+
+        # Assert
+        assert not [sql for sql in run_selects if "from equity_curves" in sql]
+        assert "equity_curve" in inspect(run).unloaded
+        assert "equity_curve" not in run.config_snapshot
+        assert curve.point_count == len(points)
+        np.testing.assert_array_equal(curve.times, [p["time"] for p in points])
+        np.testing.assert_array_equal(curve.values, [p["value"] for p in points])
+        assert await service.get_equity_curve(runs[1].run_id) is None
+
+
+class TestDashboardRollups:
+    """Dashboard statistics come from maintained rollups, not from scanning runs."""
+
+    async def test_dashboard_reads_rollups_covering_every_run(
+        self, async_test_db: AsyncSession, captured_sql: list[str]
+    ):
+        """Rollups count every run, including failures, per strategy and instrument."""
+        # Arrange
+        runs = await _seed_runs(async_test_db)
+        runs[4].metrics.sharpe_ratio = Decimal("2.5")
+        failed = BacktestRun(
+            run_id=uuid4(),
+            strategy_name="RSI Mean Reversion",
+            strategy_type="mean_reversion",
+            instrument_symbol="MSFT",
+            start_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            end_date=datetime(2024, 12, 31, tzinfo=timezone.utc),
+            initial_capital=Decimal("100000.00"),
+            data_source="IBKR",
+            execution_status="failed",
+            execution_duration_seconds=Decimal("0.5"),
+            config_snapshot={},
+            error_message="boom",
+        )
+        async_test_db.add(failed)
+        await async_test_db.flush()
+        repository = BacktestRepository(async_test_db)
+        for run in runs:
+            await repository.record_run_summary(run, run.metrics)
+        await repository.record_run_summary(failed)
+        await async_test_db.commit()
+        service = BacktestQueryService(repository)
+        captured_sql.clear()
+
+        # Act
+        stats = await service.get_dashboard_stats()
+
+        # Assert
+        assert stats.total_backtests == RUN_COUNT + 1
+        assert stats.best_sharpe_ratio == Decimal("2.5")
+        assert stats.worst_max_drawdown == Decimal(f"-0.{RUN_COUNT:02d}")
+        assert stats.worst_drawdown_strategy == "SMA Crossover"
+        strategies = {rollup.name: rollup for rollup in stats.strategy_rollups}
+        assert strategies["SMA Crossover"].total_runs == RUN_COUNT
+        assert strategies["SMA Crossover"].avg_return == Decimal("0.10")
+        assert strategies["RSI Mean Reversion"].successful_runs == 0
+        assert strategies["RSI Mean Reversion"].avg_return is None
+        assert [rollup.name for rollup in stats.instrument_rollups] == ["AAPL", "MSFT"]
+        assert len(stats.recent_backtests) == 5
+        unbounded = [
+            sql for sql in captured_sql if "from backtest_runs" in sql and "limit" not in sql
+        ]
+        assert not unbounded
+
+
+async def _seed_failed_runs(session: AsyncSession, count: int = 5) -> list[BacktestRun]:
+    """Insert failed runs without metrics, created between the seeded successes."""
+    runs = []
+    for n in range(count):
+        run = BacktestRun(
+            id=100 + n,
+            run_id=uuid4(),
+            strategy_name="RSI Mean Reversion",
+            strategy_type="mean_reversion",
+            instrument_symbol="MSFT",
+            start_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            end_date=datetime(2024, 12, 31, tzinfo=timezone.utc),
+            initial_capital=Decimal("100000.00"),
+            data_source="IBKR",
+            execution_status="failed",
+            execution_duration_seconds=Decimal("0.5"),
+            config_snapshot={},
+            error_message="boom",
+            created_at=datetime(2024, 6, 1, tzinfo=timezone.utc) + timedelta(minutes=4 * n + 2),
+        )
+        run.metrics = None
+        runs.append(run)
+    session.add_all(runs)
+    await session.commit()
+    return runs
+
+
+def _expected_order(runs: list[BacktestRun], sort: SortColumn, order: SortOrder) -> list:
+    """run_ids in list order: sort value then id, NULL values last."""
+    descending = order == SortOrder.DESC
+    present = [run for run in runs if list_sort_value(run, sort) is not None]
+    missing = [run for run in runs if list_sort_value(run, sort) is None]
+    present.sort(key=lambda run: (list_sort_value(run, sort), run.id), reverse=descending)
+    missing.sort(key=lambda run: run.id, reverse=descending)
+    return [run.run_id for run in present + missing]
+
+
+class TestKeysetPagination:
+    """Cursor pages cover every row exactly once, forward and backward."""
+
+    @pytest.mark.parametrize(
+        ("sort", "order"),
+        [
+            (SortColumn.CREATED_AT, SortOrder.DESC),
+            (SortColumn.SHARPE_RATIO, SortOrder.DESC),
+            (SortColumn.MAX_DRAWDOWN, SortOrder.ASC),
+            (SortColumn.STRATEGY_NAME, SortOrder.ASC),
+        ],
+    )
+    async def test_cursor_pages_walk_the_list_both_ways(
+        self, async_test_db: AsyncSession, sort: SortColumn, order: SortOrder
+    ):
+        """Following next cursors then previous cursors visits the same pages."""
+        # Arrange
+        runs = await _seed_runs(async_test_db)
+        runs[3].metrics.sharpe_ratio = None  # NULL metric among successful runs
+        runs += await _seed_failed_runs(async_test_db)
+        await async_test_db.commit()
+        service = BacktestQueryService(BacktestRepository(async_test_db))
+        state = FilterState(sort=sort, order=order, page_size=7)
+
+        # Act
+        forward = []
+        page = await service.get_filtered_backtest_list_page(state)
+        forward.append([item.run_id for item in page.backtests])
+        while page.next_cursor:
+            state = page.filter_state.model_copy(
+                update={"after": page.next_cursor, "before": None, "page": page.page + 1}
+            )
+            page = await service.get_filtered_backtest_list_page(state)
+            forward.append([item.run_id for item in page.backtests])
+
+        backward = [[item.run_id for item in page.backtests]]
+        while page.previous_cursor:
+            state = page.filter_state.model_copy(
+                update={"before": page.previous_cursor, "after": None, "page": page.page - 1}
+            )
+            page = await service.get_filtered_backtest_list_page(state)
+            backward.append([item.run_id for item in page.backtests])
+
+        # Assert
+        assert [run_id for ids in forward for run_id in ids] == _expected_order(runs, sort, order)
+        assert [len(ids) for ids in forward] == [7, 7, 7, 4]
+        assert backward == forward[::-1]
+        assert page.page == 1
+        assert not page.has_previous
+
+    async def test_bare_page_numbers_stop_at_the_counted_window(self, async_test_db: AsyncSession):
+        """Without a cursor a deep page number is capped to the last counted page."""
+        # Arrange
+        await _seed_runs(async_test_db)
+        service = BacktestQueryService(BacktestRepository(async_test_db))
+        state = FilterState(page=1_000_000, page_size=20)
+
+        # Act
+        page = await service.get_filtered_backtest_list_page(state)
+        sql = str(filtered_list_statement(state).compile(compile_kwargs={"literal_binds": True}))
+
+        # Assert
+        assert max_offset_page(20) == LIST_COUNT_CAP // 20
+        assert page.page == max_offset_page(20)
+        assert page.backtests == []
+        assert f"OFFSET {LIST_COUNT_CAP - 20}" in sql
+
+    async def test_filters_are_sargable_ranges_and_prefixes(
+        self, async_test_db: AsyncSession, captured_sql: list[str]
+    ):
+        """Date filters cover whole days without date() casts; instrument is a prefix."""
+        # Arrange
+        await _seed_runs(async_test_db)
+        await _seed_failed_runs(async_test_db)
+        repository = BacktestRepository(async_test_db)
+        captured_sql.clear()
+
+        # Act
+        same_day, _ = await repository.get_filtered_backtests(
+            FilterState(date_from=date(2024, 6, 1), date_to=date(2024, 6, 1), page_size=100)
+        )
+        day_before, _ = await repository.get_filtered_backtests(
+            FilterState(date_to=date(2024, 5, 31), page_size=100)
+        )
+        prefix, _ = await repository.get_filtered_backtests(
+            FilterState(instrument="aa", page_size=100)
+        )
+        infix, _ = await repository.get_filtered_backtests(
+            FilterState(instrument="sf", page_size=100)
+        )
+        counted = await repository.count_filtered_backtests(FilterState(), cap=10)
+
+        # Assert
+        assert len(same_day) == RUN_COUNT + 5
+        assert day_before == []
+        assert {run.instrument_symbol for run in prefix} == {"AAPL"}
+        assert infix == []
+        assert counted == 10
+        # Reason: SQLite renders OFFSET 0 after every LIMIT, so only date() casts are checked
+        assert not [sql for sql in captured_sql if "date(" in sql]
@@ -65,6 +65,7 @@ def mock_service_with_backtests() -> BacktestQueryService:
             page=1,
             page_size=20,
             total_count=25,
+            next_cursor="WyIyMDI0LTAxLTAxIiwyMF0",
             filter_state=FilterState(),
             available_strategies=["Strategy 1", "Strategy 2"],
             available_instruments=["AAPL"],
@@ -197,6 +198,12 @@ def test_htmx_fragment_includes_pagination(client_with_backtests: TestClient):
     assert "/backtests/fragment?" in response.text
 
 
+def test_htmx_fragment_next_link_carries_cursor(client_with_backtests: TestClient):
+    """The Next button continues from the last row's cursor instead of an offset."""
+    response = client_with_backtests.get("/backtests/fragment")
+    assert "page=2&after=WyIyMDI0LTAxLTAxIiwyMF0" in response.text
+
+
 def test_backtest_list_displays_return_color_coding(client_with_backtests: TestClient):
     """Backtest list applies color coding: green for positive returns."""
     response = client_with_backtests.get("/backtests")
@@ -14,7 +14,7 @@ import pytest
 from fastapi.testclient import TestClient
 
 from src.api.dependencies import get_backtest_query_service
-from src.api.models.dashboard import DashboardSummary, RecentBacktestItem
+from src.api.models.dashboard import DashboardRollup, DashboardSummary, RecentBacktestItem
 from src.api.web import app
 from src.services.backtest_query import BacktestQueryService
 
@@ -52,6 +52,19 @@ def mock_service_with_data() -> BacktestQueryService:
             worst_max_drawdown=Decimal("-0.20"),
             worst_drawdown_strategy="Strategy 1",
             recent_backtests=recent_items,
+            strategy_rollups=[
+                DashboardRollup(
+                    name="Strategy 5",
+                    total_runs=3,
+                    successful_runs=3,
+                    avg_return=Decimal("0.125"),
+                    best_sharpe_ratio=Decimal("3.0"),
+                    worst_max_drawdown=Decimal("-0.05"),
+                )
+            ],
+            instrument_rollups=[
+                DashboardRollup(name="AAPL", total_runs=5, successful_runs=4),
+            ],
         )
     )
     return mock_service
@@ -181,3 +194,13 @@ def test_dashboard_displays_recent_backtests(client_with_backtests: TestClient):
     # Should show backtest items
     assert "success" in response.text
     assert "AAPL" in response.text
+
+
+def test_dashboard_displays_rollups(client_with_backtests: TestClient):
+    """Dashboard lists per-strategy and per-instrument statistics."""
+    response = client_with_backtests.get("/")
+
+    assert 'id="strategy-rollups"' in response.text
+    assert 'id="instrument-rollups"' in response.text
+    assert "12.50%" in response.text
+    assert "-5.00%" in response.text
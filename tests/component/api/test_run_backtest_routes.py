@@ -1,15 +1,16 @@
 """Component tests for backtest run page routes."""
 
-import asyncio
-from datetime import datetime, timezone
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
 import pytest
 from fastapi.testclient import TestClient
 
+from src.api.dependencies import get_backtest_job_manager
 from src.api.web import app
 from src.core.strategy_registry import StrategyDefinition, StrategyRegistry
+from src.models.backtest_job import BacktestJob
+from src.services.backtest_jobs import BacktestQueueFullError
 
 
 @pytest.fixture(autouse=True)
@@ -52,6 +53,15 @@ def mock_strategy_registry():
     StrategyRegistry._discovered = original_discovered
 
 
+@pytest.fixture
+def job_manager():
+    """Override the backtest job manager with a mock."""
+    manager = MagicMock()
+    app.dependency_overrides[get_backtest_job_manager] = lambda: manager
+    yield manager
+    app.dependency_overrides.pop(get_backtest_job_manager, None)
+
+
 @pytest.fixture
 def client() -> TestClient:
     """Get test client."""
@@ -120,124 +130,42 @@ class TestPostRunBacktest:
         data.update(overrides)
         return data
 
-    @patch("src.api.ui.backtests.BacktestOrchestrator")
-    @patch("src.api.ui.backtests.load_backtest_data")
     @patch("src.api.ui.backtests.BacktestRequest")
-    def test_successful_submission_redirects(
-        self, mock_request_cls, mock_load_data, mock_orchestrator_cls, client
-    ):
-        run_id = uuid4()
+    def test_successful_submission_redirects_to_job(self, mock_request_cls, client, job_manager):
         mock_request = MagicMock()
-        mock_request.instrument_id = "AAPL.NASDAQ"
-        mock_request.bar_type = "1-DAY-LAST"
-        mock_request.start_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        mock_request.end_date = datetime(2024, 12, 31, tzinfo=timezone.utc)
         mock_request_cls.from_cli_args.return_value = mock_request
-
-        mock_load_result = MagicMock()
-        mock_load_result.bars = [MagicMock()]
-        mock_load_result.instrument = MagicMock()
-        mock_load_data.return_value = mock_load_result
-
-        mock_orchestrator = MagicMock()
-        mock_orchestrator.execute = AsyncMock(return_value=(MagicMock(), run_id))
-        mock_orchestrator_cls.return_value = mock_orchestrator
+        job = BacktestJob(strategy="sma_crossover", symbol="AAPL")
+        job_manager.submit.return_value = job
 
         response = client.post(
             "/backtests/run",
-            data=self._form_data(),
+            data=self._form_data(timeout_seconds="120"),
             follow_redirects=False,
         )
 
-        assert response.headers.get("HX-Redirect") == f"/backtests/{run_id}"
-        mock_orchestrator.dispose.assert_called_once()
+        assert response.headers.get("HX-Redirect") == f"/backtests/jobs/{job.job_id}"
+        job_manager.submit.assert_called_once_with(mock_request, timeout_seconds=120)
 
-    def test_validation_error_rerenders_form(self, client):
+    def test_validation_error_rerenders_form(self, client, job_manager):
         response = client.post(
             "/backtests/run",
             data=self._form_data(start_date="2024-12-31", end_date="2024-01-01"),
         )
         assert response.status_code == 200
         assert "start_date must be before end_date" in response.text
+        job_manager.submit.assert_not_called()
 
-    @patch("src.api.ui.backtests.BacktestOrchestrator")
-    @patch("src.api.ui.backtests.load_backtest_data")
-    @patch("src.api.ui.backtests.BacktestRequest")
-    def test_execution_error_shows_message(
-        self, mock_request_cls, mock_load_data, mock_orchestrator_cls, client
-    ):
-        mock_request = MagicMock()
-        mock_request.instrument_id = "AAPL.NASDAQ"
-        mock_request.bar_type = "1-DAY-LAST"
-        mock_request.start_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        mock_request.end_date = datetime(2024, 12, 31, tzinfo=timezone.utc)
-        mock_request_cls.from_cli_args.return_value = mock_request
-
-        mock_load_data.side_effect = ValueError("No data found for AAPL")
-
-        response = client.post(
-            "/backtests/run",
-            data=self._form_data(),
-        )
-        assert response.status_code == 200
-        assert "No data found for AAPL" in response.text
-
-    @patch("src.api.ui.backtests.BacktestOrchestrator")
-    @patch("src.api.ui.backtests.load_backtest_data")
     @patch("src.api.ui.backtests.BacktestRequest")
-    def test_orchestrator_disposed_on_error(
-        self, mock_request_cls, mock_load_data, mock_orchestrator_cls, client
-    ):
-        mock_request = MagicMock()
-        mock_request.instrument_id = "AAPL.NASDAQ"
-        mock_request.bar_type = "1-DAY-LAST"
-        mock_request.start_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        mock_request.end_date = datetime(2024, 12, 31, tzinfo=timezone.utc)
-        mock_request_cls.from_cli_args.return_value = mock_request
-
-        mock_load_result = MagicMock()
-        mock_load_result.bars = [MagicMock()]
-        mock_load_result.instrument = MagicMock()
-        mock_load_data.return_value = mock_load_result
-
-        mock_orchestrator = MagicMock()
-        mock_orchestrator.execute = AsyncMock(side_effect=RuntimeError("Engine error"))
-        mock_orchestrator_cls.return_value = mock_orchestrator
+    def test_request_error_shows_message(self, mock_request_cls, client, job_manager):
+        mock_request_cls.from_cli_args.side_effect = ValueError("Invalid strategy config")
 
         response = client.post(
             "/backtests/run",
             data=self._form_data(),
         )
         assert response.status_code == 200
-        mock_orchestrator.dispose.assert_called_once()
-
-    @patch("src.api.ui.backtests.BacktestOrchestrator")
-    @patch("src.api.ui.backtests.load_backtest_data")
-    @patch("src.api.ui.backtests.BacktestRequest")
-    def test_timeout_shows_error_message(
-        self, mock_request_cls, mock_load_data, mock_orchestrator_cls, client
-    ):
-        mock_request = MagicMock()
-        mock_request.instrument_id = "AAPL.NASDAQ"
-        mock_request_cls.from_cli_args.return_value = mock_request
-
-        mock_load_result = MagicMock()
-        mock_load_result.bars = [MagicMock()]
-        mock_load_result.instrument = MagicMock()
-        mock_load_data.return_value = mock_load_result
-
-        mock_orchestrator = MagicMock()
-        mock_orchestrator.execute = AsyncMock(side_effect=asyncio.TimeoutError())
-        mock_orchestrator_cls.return_value = mock_orchestrator
-
-        response = client.post(
-            "/backtests/run",
-            data=self._form_data(timeout_seconds="60"),
-        )
-        assert response.status_code == 200
-        assert "timed out after 60 seconds" in response.text
-        assert "Try a shorter date range" in response.text
-        mock_orchestrator.dispose.assert_called_once()
+        assert "Invalid strategy config" in response.text
+        job_manager.submit.assert_not_called()
 
     def test_validation_error_preserves_form_data(self, client):
         response = client.post(
@@ -254,17 +182,72 @@ class TestPostRunBacktest:
         assert 'value="MSFT"' in html
         assert 'value="500000"' in html
 
-    @patch("src.api.ui.backtests._backtest_lock")
-    def test_concurrent_submission_returns_409(self, mock_lock, client):
-        """Submitting while a backtest is running returns 409 with message."""
-        mock_lock.locked.return_value = True
+    @patch("src.api.ui.backtests.BacktestRequest")
+    def test_full_queue_returns_429(self, mock_request_cls, client, job_manager):
+        """Submitting while the job queue is full returns 429 with message."""
+        mock_request_cls.from_cli_args.return_value = MagicMock()
+        job_manager.submit.side_effect = BacktestQueueFullError("Backtest queue is full")
 
         response = client.post(
             "/backtests/run",
             data=self._form_data(),
         )
-        assert response.status_code == 409
-        assert "already in progress" in response.text.lower()
+        assert response.status_code == 429
+        assert "queue is full" in response.text.lower()
+
+
+class TestBacktestJobRoutes:
+    """Tests for GET /backtests/jobs/{job_id} and its status fragment."""
+
+    def test_unknown_job_returns_404(self, client, job_manager):
+        job_manager.get.return_value = None
+
+        response = client.get(f"/backtests/jobs/{uuid4()}")
+        assert response.status_code == 404
+
+    def test_running_job_page_polls_status(self, client, job_manager):
+        job = BacktestJob(strategy="sma_crossover", symbol="AAPL")
+        job.mark_running()
+        job_manager.get.return_value = job
+
+        response = client.get(f"/backtests/jobs/{job.job_id}")
+
+        assert response.status_code == 200
+        assert f'hx-get="/backtests/jobs/{job.job_id}/status"' in response.text
+        assert "Running backtest" in response.text
+
+    def test_succeeded_job_page_redirects_to_results(self, client, job_manager):
+        run_id = uuid4()
+        job = BacktestJob(strategy="sma_crossover", symbol="AAPL")
+        job.mark_succeeded(run_id)
+        job_manager.get.return_value = job
+
+        response = client.get(f"/backtests/jobs/{job.job_id}", follow_redirects=False)
+
+        assert response.status_code == 303
+        assert response.headers["location"] == f"/backtests/{run_id}"
+
+    def test_succeeded_status_fragment_sends_hx_redirect(self, client, job_manager):
+        run_id = uuid4()
+        job = BacktestJob(strategy="sma_crossover", symbol="AAPL")
+        job.mark_succeeded(run_id)
+        job_manager.get.return_value = job
+
+        response = client.get(f"/backtests/jobs/{job.job_id}/status")
+
+        assert response.headers.get("HX-Redirect") == f"/backtests/{run_id}"
+
+    def test_timed_out_status_fragment_shows_error_and_stops_polling(self, client, job_manager):
+        job = BacktestJob(strategy="sma_crossover", symbol="AAPL", timeout_seconds=60)
+        job.mark_timed_out()
+        job_manager.get.return_value = job
+
+        response = client.get(f"/backtests/jobs/{job.job_id}/status")
+
+        assert response.status_code == 200
+        assert "timed out after 60 seconds" in response.text
+        assert "Try a shorter date range" in response.text
+        assert "hx-trigger" not in response.text
 
 
 class TestGetStrategyParams:
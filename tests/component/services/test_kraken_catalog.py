@@ -157,8 +157,9 @@ class TestDataCatalogServiceKrakenIntegration:
                 with patch.object(svc, "_is_ibkr_available", return_value=True):
                     bars = await svc.fetch_or_load(
                         instrument_id="AAPL.NASDAQ",
-                        start=datetime(2024, 1, 1, tzinfo=timezone.utc),
-                        end=datetime(2024, 1, 31, tzinfo=timezone.utc),
+                        # Reason: One IBKR window; longer ranges use the chunked downloader
+                        start=datetime(2024, 1, 2, 14, 30, tzinfo=timezone.utc),
+                        end=datetime(2024, 1, 2, 21, tzinfo=timezone.utc),
                         data_source="ibkr",
                     )
 
@@ -239,6 +240,7 @@ class TestKrakenClientLazyInit:
         mock_settings.kraken_api_key = "test-key"
         mock_settings.kraken_api_secret = "test-secret"
         mock_settings.kraken_rate_limit = 5
+        mock_settings.kraken_fetch_concurrency = 3
         mock_settings.kraken_default_maker_fee = Decimal("0.0010")
         mock_settings.kraken_default_taker_fee = Decimal("0.0020")
 
@@ -248,3 +250,4 @@ class TestKrakenClientLazyInit:
         assert client._default_maker_fee == Decimal("0.0010")
         assert client._default_taker_fee == Decimal("0.0020")
         assert client.rate_limiter.requests_per_second == 5
+        assert client.max_concurrency == 3
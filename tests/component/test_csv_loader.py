@@ -1,10 +1,12 @@
 """Tests for CSV loader service."""
 
+import re
 import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pandas as pd
 import pytest
 from nautilus_trader.model.data import Bar
@@ -344,24 +346,24 @@ class TestCSVLoader:
         mock_catalog_service_class.return_value = MagicMock()
         loader = CSVLoader()
 
-        row = pd.Series(
+        df = pd.DataFrame(
             {
-                "open": 100.50,
-                "high": 101.00,
-                "low": 100.25,
-                "close": 100.75,
-                "volume": 10000,
+                "open": [100.50],
+                "high": [101.00],
+                "low": [100.25],
+                "close": [100.75],
+                "volume": [10000],
             }
         )
 
-        # Should not raise
-        open_p, high_p, low_p, close_p, volume = loader._validate_ohlcv(row, 1)
+        columns, errors = loader._validate_ohlcv(df, np.array([2]))
 
-        assert open_p.as_double() == 100.50
-        assert high_p.as_double() == 101.00
-        assert low_p.as_double() == 100.25
-        assert close_p.as_double() == 100.75
-        assert volume.as_double() == 10000.0
+        assert errors == {}
+        assert columns["open"][0] == 100.50
+        assert columns["high"][0] == 101.00
+        assert columns["low"][0] == 100.25
+        assert columns["close"][0] == 100.75
+        assert columns["volume"][0] == 10000.0
 
     @patch("src.services.csv_loader.DataCatalogService")
     @pytest.mark.component
@@ -370,18 +372,19 @@ class TestCSVLoader:
         mock_catalog_service_class.return_value = MagicMock()
         loader = CSVLoader()
 
-        row = pd.Series(
+        df = pd.DataFrame(
             {
-                "open": -100.50,  # Negative price
-                "high": 101.00,
-                "low": 100.25,
-                "close": 100.75,
-                "volume": 10000,
+                "open": [-100.50],  # Negative price
+                "high": [101.00],
+                "low": [100.25],
+                "close": [100.75],
+                "volume": [10000],
             }
         )
 
-        with pytest.raises(ValidationError, match="open must be > 0"):
-            loader._validate_ohlcv(row, 1)
+        _, errors = loader._validate_ohlcv(df, np.array([2]))
+
+        assert errors[2].startswith("Row 2: open must be > 0")
 
     @patch("src.services.csv_loader.DataCatalogService")
     @pytest.mark.component
@@ -390,18 +393,19 @@ class TestCSVLoader:
         mock_catalog_service_class.return_value = MagicMock()
         loader = CSVLoader()
 
-        row = pd.Series(
+        df = pd.DataFrame(
             {
-                "open": 100.50,
-                "high": 100.00,  # High less than low
-                "low": 100.25,
-                "close": 100.75,
-                "volume": 10000,
+                "open": [100.50],
+                "high": [100.00],  # High less than low
+                "low": [100.25],
+                "close": [100.75],
+                "volume": [10000],
             }
         )
 
-        with pytest.raises(ValidationError, match="high.*must be.*low"):
-            loader._validate_ohlcv(row, 1)
+        _, errors = loader._validate_ohlcv(df, np.array([2]))
+
+        assert re.search("high.*must be.*low", errors[2])
 
     @patch("src.services.csv_loader.DataCatalogService")
     @pytest.mark.component
@@ -410,15 +414,113 @@ class TestCSVLoader:
         mock_catalog_service_class.return_value = MagicMock()
         loader = CSVLoader()
 
-        row = pd.Series(
+        df = pd.DataFrame(
+            {
+                "open": [100.50],
+                "high": [101.00],
+                "low": [100.25],
+                "close": [100.75],
+                "volume": [-1000],  # Negative volume
+            }
+        )
+
+        _, errors = loader._validate_ohlcv(df, np.array([2]))
+
+        assert "volume must be >= 0" in errors[2]
+
+    @pytest.mark.asyncio
+    @patch("src.services.csv_loader.DataCatalogService")
+    async def test_convert_to_bars_reports_each_invalid_row_once(self, mock_catalog_service_class):
+        """Valid rows become bars; invalid rows are reported with their CSV line."""
+        mock_catalog_service_class.return_value = MagicMock()
+        loader = CSVLoader()
+        df = pd.DataFrame(
+            {
+                "timestamp": [
+                    "2024-01-01 09:30:00",
+                    "bad-date",
+                    "2024-01-01 09:32:00",
+                    "2024-01-01T09:33:00-05:00",
+                    "2024-01-01 09:34:00",
+                ],
+                "open": [100.5, 100.5, "n/a", 100.5, 100.5],
+                "high": [101.0, 101.0, 101.0, 101.0, 99.0],
+                "low": [100.25, 100.25, 100.25, 100.25, 100.25],
+                "close": [100.75, 100.75, 100.75, 100.875, 100.75],
+                "volume": [10000, 10000, 10000, 10000, 10000],
+            }
+        )
+
+        bars, errors = await loader._convert_to_bars(df, "AAPL", "NASDAQ", "1-MINUTE-LAST")
+
+        assert [bar.ts_event for bar in bars] == [
+            int(pd.Timestamp("2024-01-01 09:30:00", tz="UTC").value),
+            int(pd.Timestamp("2024-01-01 14:33:00", tz="UTC").value),
+        ]
+        # Reason: One precision for the whole file (100.875 needs 3 decimals)
+        assert {bar.close.precision for bar in bars} == {3}
+        assert [error.split(":")[0] for error in errors] == ["Row 3", "Row 4", "Row 6"]
+        assert "Invalid timestamp format" in errors[0]
+        assert "Invalid OHLCV data: open='n/a'" in errors[1]
+        assert "high (99.0) must be >= low (100.25)" in errors[2]
+
+    @pytest.mark.asyncio
+    async def test_load_file_in_chunks(self, tmp_path):
+        """Chunked import writes every chunk and numbers rows across chunks."""
+        csv_file = tmp_path / "bars.csv"
+        timestamps = pd.date_range("2024-01-01 09:30", periods=10, freq="1min")
+        frame = pd.DataFrame(
             {
-                "open": 100.50,
-                "high": 101.00,
+                "timestamp": timestamps.strftime("%Y-%m-%d %H:%M:%S"),
+                "open": 100.5,
+                "high": 101.0,
                 "low": 100.25,
                 "close": 100.75,
-                "volume": -1000,  # Negative volume
+                "volume": 1000,
             }
         )
+        frame.loc[7, "volume"] = -5
+        frame.to_csv(csv_file, index=False)
+
+        catalog_service = MagicMock()
+        catalog_service.get_availability.return_value = None
+        catalog_service.catalog_path = tmp_path / "catalog"
+        loader = CSVLoader(catalog_service=catalog_service)
+
+        result = await loader.load_file(csv_file, "AAPL", "NASDAQ", chunk_size=4)
+
+        assert result["rows_processed"] == 10
+        assert result["bars_written"] == 9
+        assert result["validation_errors"] == ["Row 9: volume must be >= 0, got -5"]
+        assert result["date_range"] == "2024-01-01 09:30 to 2024-01-01 09:39"
+        assert [len(c.args[0]) for c in catalog_service.write_bars.call_args_list] == [4, 3, 2]
+
+    @pytest.mark.asyncio
+    async def test_chunks_share_the_file_precision(self, tmp_path):
+        """A finer price in a later chunk sets the precision of every chunk."""
+        csv_file = tmp_path / "bars.csv"
+        timestamps = pd.date_range("2024-01-01 09:30", periods=8, freq="1min")
+        frame = pd.DataFrame(
+            {
+                "timestamp": timestamps.strftime("%Y-%m-%d %H:%M:%S"),
+                "open": 100.5,
+                "high": 101.0,
+                "low": 100.25,
+                "close": 100.75,
+                "volume": 1000,
+            }
+        )
+        frame.loc[6, "close"] = 100.8125
+        frame.to_csv(csv_file, index=False)
+
+        catalog_service = MagicMock()
+        catalog_service.get_availability.return_value = None
+        catalog_service.catalog_path = tmp_path / "catalog"
+        loader = CSVLoader(catalog_service=catalog_service)
+
+        await loader.load_file(csv_file, "AAPL", "NASDAQ", chunk_size=4)
 
-        with pytest.raises(ValidationError, match="volume must be >= 0"):
-            loader._validate_ohlcv(row, 1)
+        written = [c.args[0] for c in catalog_service.write_bars.call_args_list]
+        assert len(written) == 2
+        assert {bar.close.precision for chunk in written for bar in chunk} == {4}
+        assert written[1][2].close.as_double() == 100.8125
@@ -355,7 +355,7 @@ class TestDataCommands:
         """Test that import converts symbol to uppercase."""
         mock_loader_instance = MagicMock()
 
-        async def mock_load_file(file_path, symbol, venue, bar_type_spec):
+        async def mock_load_file(file_path, symbol, venue, bar_type_spec, **kwargs):
             # Verify symbol was uppercased
             assert symbol == "AAPL"
             assert venue == "NASDAQ"
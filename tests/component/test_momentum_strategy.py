@@ -154,6 +154,33 @@ class TestSMAMomentumStrategy:
         expected_ma = sum(test_prices[:3]) / 3
         assert abs(ma_val - expected_ma) < 0.01
 
+    def test_sma_momentum_ma_drops_old_values(self):
+        """Test the moving average only covers the last `maxlen` prices."""
+        from collections import deque
+
+        from src.core.strategies.sma_momentum import SMAMomentum, SMAMomentumConfig
+
+        config = SMAMomentumConfig(
+            instrument_id=InstrumentId.from_str("AAPL.NASDAQ"),
+            bar_type=BarType.from_str("AAPL.NASDAQ-1-MINUTE-LAST-INTERNAL"),
+            trade_size=Decimal("1000000"),
+            order_id_tag="004",
+            fast_period=3,
+            slow_period=5,
+        )
+
+        strategy = SMAMomentum(config)
+
+        test_prices = [100.0, 102.0, 101.0, 103.0, 102.0]
+        test_deque = deque(maxlen=3)
+        total = 0.0
+
+        for price in test_prices:
+            ma_val, total = strategy._update_ma(test_deque, total, price, 3)
+
+        assert total == pytest.approx(sum(test_prices[-3:]))
+        assert ma_val == pytest.approx(sum(test_prices[-3:]) / 3)
+
     def test_sma_momentum_crossover_detection(self):
         """Test crossover detection logic."""
         from src.core.strategies.sma_momentum import SMAMomentum, SMAMomentumConfig
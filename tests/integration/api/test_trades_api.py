@@ -9,12 +9,16 @@ from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 
 import httpx
+import pandas as pd
 import pytest
+from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.web import app
 from src.db.models.backtest import BacktestRun
 from src.db.models.trade import Trade
+from src.db.models.trade_analytics import TradeAnalytics
+from src.services.trade_analytics import TRADE_ANALYTICS_VERSION
 
 
 class TestEquityCurveEndpoint:
@@ -800,6 +804,152 @@ class TestDrawdownEndpoint:
         app.dependency_overrides.clear()
 
 
+class TestPersistedTradeAnalytics:
+    """Test suite for trade analytics stored per backtest run."""
+
+    @pytest.mark.asyncio
+    async def test_analytics_computed_once_and_served_from_row(
+        self,
+        db_session: AsyncSession,
+        sample_backtest_run: BacktestRun,
+    ):
+        """
+        Test statistics and drawdown endpoints persist their results.
+
+        Given: A backtest with trades and no stored analytics
+        When: GET /api/statistics/{id} is called, then the trades are deleted
+        Then: One analytics row is stored and both endpoints keep serving it
+        """
+        from src.api.dependencies import get_db
+
+        async def override_get_db():
+            yield db_session
+
+        app.dependency_overrides[get_db] = override_get_db
+
+        base_time = datetime(2025, 1, 1, 10, 0, 0, tzinfo=timezone.utc)
+        for i, pnl in enumerate(["20000.00", "-20000.00", "25000.00"]):
+            db_session.add(
+                Trade(
+                    backtest_run_id=sample_backtest_run.id,
+                    instrument_id="AAPL",
+                    trade_id=f"trade-{i}",
+                    venue_order_id=f"order-{i}",
+                    order_side="BUY",
+                    quantity=Decimal("100"),
+                    entry_price=Decimal("1000.00"),
+                    exit_price=Decimal("1100.00"),
+                    profit_loss=Decimal(pnl),
+                    entry_timestamp=base_time + timedelta(hours=2 * i),
+                    exit_timestamp=base_time + timedelta(hours=2 * i + 1),
+                    holding_period_seconds=3600,
+                )
+            )
+        await db_session.commit()
+
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            statistics = (await client.get(f"/api/statistics/{sample_backtest_run.id}")).json()
+
+            stored = (
+                await db_session.execute(
+                    select(TradeAnalytics).where(
+                        TradeAnalytics.backtest_run_id == sample_backtest_run.id
+                    )
+                )
+            ).scalar_one()
+            assert stored.version == TRADE_ANALYTICS_VERSION
+            assert stored.statistics == statistics
+
+            await db_session.execute(
+                delete(Trade).where(Trade.backtest_run_id == sample_backtest_run.id)
+            )
+            await db_session.commit()
+
+            again = (await client.get(f"/api/statistics/{sample_backtest_run.id}")).json()
+            drawdowns = (await client.get(f"/api/drawdown/{sample_backtest_run.id}")).json()
+
+        assert again == statistics
+        assert statistics["total_trades"] == 3
+        assert drawdowns["total_drawdown_periods"] == 1
+        assert drawdowns["max_drawdown"]["drawdown_amount"] == "20000.00"
+
+        app.dependency_overrides.clear()
+
+    @pytest.mark.asyncio
+    async def test_save_time_analytics_match_lazy_computation(
+        self,
+        db_session: AsyncSession,
+        sample_backtest_run: BacktestRun,
+    ):
+        """
+        Test analytics stored with the trades equal those computed on request.
+
+        Given: Trades saved from a positions report with the run's initial capital
+        When: The stored analytics are dropped and the endpoints recompute them
+        Then: The recomputed statistics and drawdowns equal the stored ones
+        """
+        from src.api.dependencies import get_db
+        from src.db.repositories.backtest_repository import BacktestRepository
+        from src.services.backtest_persistence import BacktestPersistenceService
+
+        async def override_get_db():
+            yield db_session
+
+        app.dependency_overrides[get_db] = override_get_db
+
+        count = 50
+        opened = pd.date_range("2025-01-01", periods=count, freq="h", tz="UTC")
+        report = pd.DataFrame(
+            {
+                "instrument_id": "AAPL.NASDAQ",
+                "entry": "BUY",
+                "peak_qty": "10",
+                "opening_order_id": [f"O-{i}" for i in range(count)],
+                "closing_order_id": [f"C-{i}" for i in range(count)],
+                "ts_opened": opened,
+                "ts_closed": opened + pd.Timedelta(minutes=30),
+                "duration_ns": 1_800_000_000_000,
+                "avg_px_open": 150.0,
+                "avg_px_close": 151.25,
+                "realized_pnl": [f"{(i * 37 % 23 - 11) * 10.13:.2f} USD" for i in range(count)],
+                "commissions": "['1.00 USD']",
+            },
+            index=[f"P-{i}" for i in range(count)],
+        )
+        service = BacktestPersistenceService(BacktestRepository(db_session))
+        await service.save_trades_from_positions(
+            sample_backtest_run.id, report, initial_capital=sample_backtest_run.initial_capital
+        )
+        await db_session.commit()
+
+        stored = (
+            await db_session.execute(
+                select(TradeAnalytics).where(
+                    TradeAnalytics.backtest_run_id == sample_backtest_run.id
+                )
+            )
+        ).scalar_one()
+        saved_statistics, saved_drawdowns = stored.statistics, stored.drawdowns
+        await db_session.execute(
+            delete(TradeAnalytics).where(TradeAnalytics.backtest_run_id == sample_backtest_run.id)
+        )
+        await db_session.commit()
+
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            statistics = (await client.get(f"/api/statistics/{sample_backtest_run.id}")).json()
+            drawdowns = (await client.get(f"/api/drawdown/{sample_backtest_run.id}")).json()
+
+        assert statistics == saved_statistics
+        assert drawdowns == saved_drawdowns
+        assert statistics["total_trades"] == count
+
+        app.dependency_overrides.clear()
+
+
 class TestTradesListEndpoint:
     """Test suite for GET /api/backtests/{id}/trades endpoint with pagination."""
 
@@ -1506,3 +1656,70 @@ class TestTradeExportEndpoint:
         assert 'SPY,"US",EQUITY' in rows[0]["instrument_id"] or "SPY" in rows[0]["instrument_id"]
 
         app.dependency_overrides.clear()
+
+    @pytest.mark.asyncio
+    async def test_export_trades_as_parquet_streams_batches(
+        self,
+        db_session: AsyncSession,
+        sample_backtest_run: BacktestRun,
+    ):
+        """
+        Test exporting trades to Parquet through the batched cursor.
+
+        Given: A backtest with 12 trades and an export batch size of 5
+        When: GET /api/backtests/{id}/export?format=parquet is called
+        Then: Returns a Parquet file with every trade, one row group per batch
+        """
+        import io
+        from unittest.mock import patch
+
+        import pyarrow.parquet as pq
+
+        from src.api.dependencies import get_db
+        from src.services import trade_export
+
+        async def override_get_db():
+            yield db_session
+
+        app.dependency_overrides[get_db] = override_get_db
+
+        base_time = datetime(2025, 1, 1, 10, 0, 0, tzinfo=timezone.utc)
+        for i in range(12):
+            db_session.add(
+                Trade(
+                    backtest_run_id=sample_backtest_run.id,
+                    instrument_id="AAPL",
+                    trade_id=f"trade-{i + 1}",
+                    venue_order_id=f"order-{i + 1}",
+                    order_side="BUY",
+                    quantity=Decimal("10"),
+                    entry_price=Decimal("150.12345678"),
+                    exit_price=Decimal("151.00"),
+                    entry_timestamp=base_time + timedelta(hours=i),
+                    exit_timestamp=base_time + timedelta(hours=i + 1),
+                    profit_loss=Decimal("8.77"),
+                    holding_period_seconds=3600,
+                )
+            )
+        await db_session.commit()
+
+        with patch.object(trade_export, "EXPORT_BATCH_SIZE", 5):
+            async with httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app), base_url="http://test"
+            ) as client:
+                response = await client.get(
+                    f"/api/backtests/{sample_backtest_run.id}/export",
+                    params={"format": "parquet"},
+                )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/vnd.apache.parquet"
+        assert "_trades.parquet" in response.headers["content-disposition"]
+
+        parquet = pq.ParquetFile(io.BytesIO(response.content))
+        assert parquet.metadata.num_row_groups == 3
+        table = parquet.read()
+        assert table.column("trade_id").to_pylist() == [f"trade-{i + 1}" for i in range(12)]
+        assert table.column("entry_price")[0].as_py() == Decimal("150.12345678")
+
+        app.dependency_overrides.clear()
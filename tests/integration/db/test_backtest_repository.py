@@ -500,3 +500,84 @@ class TestBacktestRepositoryRetrieve:
 
         # Assert
         assert count == 0
+
+    @pytest.mark.asyncio
+    async def test_find_by_fingerprint_returns_latest_success(self, repository, async_session):
+        """Test that fingerprint lookups ignore failed runs and prefer the newest run."""
+        # Arrange
+        fingerprint = "f" * 64
+        run_ids = {}
+        for label, status in [("older", "success"), ("newer", "success"), ("failed", "failed")]:
+            run_ids[label] = uuid4()
+            run = await repository.create_backtest_run(
+                run_id=run_ids[label],
+                strategy_name="Test Strategy",
+                strategy_type="test",
+                instrument_symbol="AAPL",
+                start_date=datetime(2023, 1, 1, tzinfo=timezone.utc),
+                end_date=datetime(2023, 12, 31, tzinfo=timezone.utc),
+                initial_capital=Decimal("100000.00"),
+                data_source="catalog",
+                execution_status=status,
+                execution_duration_seconds=Decimal("10.0"),
+                config_snapshot={},
+                fingerprint=fingerprint,
+            )
+            if status == "success":
+                await repository.create_performance_metrics(
+                    backtest_run_id=run.id,
+                    total_return=Decimal("0.1"),
+                    final_balance=Decimal("110000.00"),
+                    total_trades=3,
+                    winning_trades=2,
+                    losing_trades=1,
+                )
+        await async_session.commit()
+
+        # Act
+        result = await repository.find_by_fingerprint(fingerprint)
+        missing = await repository.find_by_fingerprint("0" * 64)
+
+        # Assert
+        assert result is not None
+        assert result.run_id == run_ids["newer"]
+        assert result.metrics is not None
+        assert result.metrics.total_trades == 3
+        assert missing is None
+
+    @pytest.mark.asyncio
+    async def test_create_and_find_walk_forward(self, repository, async_session):
+        """Test that a walk-forward analysis round-trips with its stitched curve."""
+        # Arrange
+        walk_forward_id = uuid4()
+        curve = [
+            {"time": 1_700_000_000, "value": 100000.0},
+            {"time": 1_700_086_400, "value": 99000.5},
+        ]
+
+        # Act
+        await repository.create_walk_forward(
+            walk_forward_id=walk_forward_id,
+            strategy_type="sma_crossover",
+            instrument_symbol="AAPL",
+            start_date=datetime(2020, 1, 1, tzinfo=timezone.utc),
+            end_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            initial_capital=Decimal("100000.00"),
+            config={"train_months": 24, "test_months": 12, "anchored": False},
+            folds=[{"window": {"index": 0}, "params": {"fast_period": 10}}],
+            equity_curve=curve,
+            execution_duration_seconds=Decimal("12.5"),
+            total_return=Decimal("-0.009995"),
+            max_drawdown=Decimal("-0.009995"),
+        )
+        await async_session.commit()
+        result = await repository.find_walk_forward(walk_forward_id)
+        missing = await repository.find_walk_forward(uuid4())
+
+        # Assert
+        assert result is not None
+        assert result.point_count == 2
+        assert result.equity_points() == curve
+        assert result.folds[0]["params"] == {"fast_period": 10}
+        assert result.total_return == Decimal("-0.009995")
+        assert missing is None
@@ -8,7 +8,7 @@ with their exact same configuration.
 from contextlib import contextmanager
 from datetime import datetime, timezone
 from decimal import Decimal
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
@@ -64,18 +64,19 @@ def test_reproduce_creates_new_run_with_same_config(sync_db_session):
     def mock_get_sync_session():
         yield sync_db_session
 
-    # Mock DataCatalogService and MinimalBacktestRunner to prevent actual execution
+    # Mock DataCatalogService and BacktestOrchestrator to prevent actual execution
     mock_catalog = MagicMock()
     mock_catalog.fetch_or_load.return_value = []  # Return empty bars list
     mock_catalog.load_instrument.return_value = MagicMock()
 
-    mock_runner = MagicMock()
-    mock_runner.run_backtest_with_catalog_data.return_value = (MagicMock(), uuid4())
+    mock_orchestrator = MagicMock()
+    mock_orchestrator.execute = AsyncMock(return_value=(MagicMock(), uuid4()))
+    mock_orchestrator.cached_run_id = None
 
     with (
         patch("src.cli.commands.reproduce.get_sync_session", mock_get_sync_session),
         patch("src.services.data_catalog.DataCatalogService", return_value=mock_catalog),
-        patch("src.cli.commands.reproduce.MinimalBacktestRunner", return_value=mock_runner),
+        patch("src.cli.commands.reproduce.BacktestOrchestrator", return_value=mock_orchestrator),
     ):
         runner = CliRunner()
         result = runner.invoke(reproduce_backtest, [str(original_run_id)])
@@ -133,18 +134,19 @@ def test_reproduce_sets_reproduced_from_run_id(sync_db_session):
     def mock_get_sync_session():
         yield sync_db_session
 
-    # Mock DataCatalogService and MinimalBacktestRunner to prevent actual execution
+    # Mock DataCatalogService and BacktestOrchestrator to prevent actual execution
     mock_catalog = MagicMock()
     mock_catalog.fetch_or_load.return_value = []  # Return empty bars list
     mock_catalog.load_instrument.return_value = MagicMock()
 
-    mock_runner = MagicMock()
-    mock_runner.run_backtest_with_catalog_data.return_value = (MagicMock(), uuid4())
+    mock_orchestrator = MagicMock()
+    mock_orchestrator.execute = AsyncMock(return_value=(MagicMock(), uuid4()))
+    mock_orchestrator.cached_run_id = None
 
     with (
         patch("src.cli.commands.reproduce.get_sync_session", mock_get_sync_session),
         patch("src.services.data_catalog.DataCatalogService", return_value=mock_catalog),
-        patch("src.cli.commands.reproduce.MinimalBacktestRunner", return_value=mock_runner),
+        patch("src.cli.commands.reproduce.BacktestOrchestrator", return_value=mock_orchestrator),
     ):
         runner = CliRunner()
         result = runner.invoke(reproduce_backtest, [str(original_run_id)])
@@ -251,18 +253,19 @@ def test_reproduce_displays_original_configuration(sync_db_session):
     def mock_get_sync_session():
         yield sync_db_session
 
-    # Mock DataCatalogService and MinimalBacktestRunner to prevent actual execution
+    # Mock DataCatalogService and BacktestOrchestrator to prevent actual execution
     mock_catalog = MagicMock()
     mock_catalog.fetch_or_load.return_value = []  # Return empty bars list
     mock_catalog.load_instrument.return_value = MagicMock()
 
-    mock_runner = MagicMock()
-    mock_runner.run_backtest_with_catalog_data.return_value = (MagicMock(), uuid4())
+    mock_orchestrator = MagicMock()
+    mock_orchestrator.execute = AsyncMock(return_value=(MagicMock(), uuid4()))
+    mock_orchestrator.cached_run_id = None
 
     with (
         patch("src.cli.commands.reproduce.get_sync_session", mock_get_sync_session),
         patch("src.services.data_catalog.DataCatalogService", return_value=mock_catalog),
-        patch("src.cli.commands.reproduce.MinimalBacktestRunner", return_value=mock_runner),
+        patch("src.cli.commands.reproduce.BacktestOrchestrator", return_value=mock_orchestrator),
     ):
         runner = CliRunner()
         result = runner.invoke(reproduce_backtest, [str(original_run_id)])
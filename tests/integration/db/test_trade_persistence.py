@@ -14,6 +14,7 @@ from decimal import Decimal
 import pytest
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from src.db.models.backtest import BacktestRun
 from src.db.models.trade import Trade as TradeDB
@@ -134,7 +135,9 @@ class TestTradePersistence:
 
         # Verify relationship
         result = await db_session.execute(
-            select(BacktestRun).where(BacktestRun.id == backtest_run.id)
+            select(BacktestRun)
+            .options(selectinload(BacktestRun.trades))
+            .where(BacktestRun.id == backtest_run.id)
         )
         run_with_trades = result.scalar_one()
 
@@ -240,3 +243,66 @@ class TestBulkTradeInsertion:
         )
         saved_trades = result.scalars().all()
         assert len(saved_trades) == 500
+
+    async def test_bulk_insert_trades_from_positions_report(self, db_session: AsyncSession):
+        """Test that 10,000 positions are converted and copied in under 5 seconds."""
+        import pandas as pd
+
+        from src.db.repositories.backtest_repository import BacktestRepository
+        from src.services.backtest_persistence import BacktestPersistenceService
+
+        backtest_run = BacktestRun(
+            strategy_name="Test Strategy",
+            strategy_type="test",
+            instrument_symbol="AAPL",
+            start_date=datetime(2025, 1, 1, tzinfo=timezone.utc),
+            end_date=datetime(2025, 1, 31, tzinfo=timezone.utc),
+            initial_capital=Decimal("100000.00"),
+            data_source="test",
+            execution_status="success",
+            execution_duration_seconds=Decimal("10.5"),
+            config_snapshot={},
+        )
+        db_session.add(backtest_run)
+        await db_session.flush()
+
+        count = 10_000
+        opened = pd.date_range("2025-01-01", periods=count, freq="min", tz="UTC")
+        report = pd.DataFrame(
+            {
+                "instrument_id": "AAPL.NASDAQ",
+                "entry": ["BUY", "SELL"] * (count // 2),
+                "peak_qty": "100",
+                "opening_order_id": [f"O-{i}" for i in range(count)],
+                "closing_order_id": [f"C-{i}" for i in range(count)],
+                "ts_opened": opened,
+                "ts_closed": opened + pd.Timedelta(seconds=30),
+                "duration_ns": 30_000_000_000,
+                "avg_px_open": 150.0,
+                "avg_px_close": 151.25,
+                "realized_pnl": "125.00 USD",
+                "commissions": "['1.00 USD']",
+            },
+            index=[f"P-{i}" for i in range(count)],
+        )
+        service = BacktestPersistenceService(BacktestRepository(db_session))
+
+        start_time = time.time()
+        saved = await service.save_trades_from_positions(backtest_run.id, report)
+        await db_session.commit()
+        elapsed_time = time.time() - start_time
+
+        assert saved == count
+        assert elapsed_time < 5.0, f"Bulk insert took {elapsed_time:.2f}s (should be < 5s)"
+
+        result = await db_session.execute(
+            select(TradeDB)
+            .where(TradeDB.backtest_run_id == backtest_run.id)
+            .order_by(TradeDB.entry_timestamp)
+            .limit(1)
+        )
+        first = result.scalar_one()
+        assert first.trade_id == "P-0"
+        assert first.exit_price == Decimal("151.25")
+        assert first.profit_loss == Decimal("125.00")
+        assert first.holding_period_seconds == 30
@@ -0,0 +1,165 @@
+"""
+Parity tests: vectorized indicators against the Nautilus indicators.
+
+Each Nautilus indicator is fed bar by bar, as a strategy would feed it, and
+its value is recorded after every update. The vectorized series must be NaN
+exactly where the indicator is not initialized and equal elsewhere, up to
+floating-point summation order.
+"""
+
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+from nautilus_trader.indicators import (
+    AverageTrueRange,
+    BollingerBands,
+    ExponentialMovingAverage,
+    RelativeStrengthIndex,
+    SimpleMovingAverage,
+)
+
+from src.core import indicators
+
+pytestmark = pytest.mark.integration
+
+# Reason: Rolling sums and one-pass window means round differently in the last bits
+RTOL = 1e-10
+
+
+@pytest.fixture(scope="module")
+def ohlc() -> dict[str, np.ndarray]:
+    """Random-walk OHLC on weekdays only, with gaps between closes and opens."""
+    rng = np.random.default_rng(42)
+    count = 2_000
+    close = 100.0 + rng.standard_normal(count).cumsum()
+    spread = rng.uniform(0.1, 2.0, count)
+    high = close + spread
+    low = close - spread
+
+    days = np.arange(count * 7 // 5 + 7)
+    weekdays = days[days % 7 < 5][:count]  # Day 0 is Monday 2024-01-01
+    ts = (1_704_067_200_000_000_000 + weekdays * indicators.DAY_NS).astype(np.uint64)
+    return {"high": high, "low": low, "close": close, "ts": ts}
+
+
+def _replay(update, read, count: int, is_initialized) -> np.ndarray:
+    """Feed count inputs through update, reading the value after each one."""
+    out = np.full(count, np.nan)
+    for i in range(count):
+        update(i)
+        if is_initialized():
+            out[i] = read()
+    return out
+
+
+def _assert_parity(actual: np.ndarray, expected: np.ndarray) -> None:
+    """Same warm-up mask and element-wise equal values."""
+    np.testing.assert_array_equal(np.isnan(actual), np.isnan(expected))
+    np.testing.assert_allclose(actual, expected, rtol=RTOL, equal_nan=True)
+
+
+@pytest.mark.parametrize("period", [1, 5, 20, 200])
+def test_sma_parity(ohlc, period):
+    """sma matches SimpleMovingAverage.update_raw."""
+    close = ohlc["close"]
+    indicator = SimpleMovingAverage(period)
+
+    expected = _replay(
+        lambda i: indicator.update_raw(close[i]),
+        lambda: indicator.value,
+        len(close),
+        lambda: indicator.initialized,
+    )
+
+    _assert_parity(indicators.sma(close, period), expected)
+
+
+@pytest.mark.parametrize("period", [1, 10, 50])
+def test_ema_parity(ohlc, period):
+    """ema matches ExponentialMovingAverage.update_raw."""
+    close = ohlc["close"]
+    indicator = ExponentialMovingAverage(period)
+
+    expected = _replay(
+        lambda i: indicator.update_raw(close[i]),
+        lambda: indicator.value,
+        len(close),
+        lambda: indicator.initialized,
+    )
+
+    _assert_parity(indicators.ema(close, period), expected)
+
+
+@pytest.mark.parametrize("period", [2, 14])
+def test_rsi_parity(ohlc, period):
+    """rsi matches RelativeStrengthIndex.update_raw."""
+    close = ohlc["close"]
+    indicator = RelativeStrengthIndex(period)
+
+    expected = _replay(
+        lambda i: indicator.update_raw(close[i]),
+        lambda: indicator.value,
+        len(close),
+        lambda: indicator.initialized,
+    )
+
+    _assert_parity(indicators.rsi(close, period), expected)
+
+
+@pytest.mark.parametrize(("period", "k"), [(20, 2.0), (10, 1.5)])
+def test_bollinger_bands_parity(ohlc, period, k):
+    """bollinger_bands matches BollingerBands.update_raw for every band."""
+    high, low, close = ohlc["high"], ohlc["low"], ohlc["close"]
+    bands = indicators.bollinger_bands(high, low, close, period, k)
+
+    indicator = BollingerBands(period, k)
+    expected = {name: np.full(len(close), np.nan) for name in ("upper", "middle", "lower")}
+    for i in range(len(close)):
+        indicator.update_raw(high[i], low[i], close[i])
+        if indicator.initialized:
+            for name, values in expected.items():
+                values[i] = getattr(indicator, name)
+
+    for name, values in expected.items():
+        _assert_parity(getattr(bands, name), values)
+
+
+@pytest.mark.parametrize("period", [1, 14])
+def test_atr_parity(ohlc, period):
+    """atr matches AverageTrueRange.update_raw with its default simple average."""
+    high, low, close = ohlc["high"], ohlc["low"], ohlc["close"]
+    indicator = AverageTrueRange(period)
+
+    expected = _replay(
+        lambda i: indicator.update_raw(high[i], low[i], close[i]),
+        lambda: indicator.value,
+        len(close),
+        lambda: indicator.initialized,
+    )
+
+    _assert_parity(indicators.atr(high, low, close, period), expected)
+
+
+def test_weekly_sma_parity(ohlc):
+    """weekly_sma matches the Bollinger strategy's per-bar ISO-week aggregation."""
+    ts, close = ohlc["ts"], ohlc["close"]
+    indicator = SimpleMovingAverage(20)
+    expected = np.full(len(close), np.nan)
+
+    current_week_iso: tuple[int, int] | None = None
+    current_week_close: float | None = None
+    for i in range(len(close)):
+        bar_dt = datetime.fromtimestamp(int(ts[i]) / 1e9, tz=timezone.utc)
+        iso_year, iso_week, _ = bar_dt.isocalendar()
+        if current_week_iso is None:
+            current_week_iso = (iso_year, iso_week)
+        elif (iso_year, iso_week) != current_week_iso:
+            indicator.update_raw(current_week_close)
+            current_week_iso = (iso_year, iso_week)
+        current_week_close = float(close[i])
+
+        if indicator.initialized:
+            expected[i] = indicator.value
+
+    _assert_parity(indicators.weekly_sma(ts, close, 20), expected)
@@ -1,8 +1,69 @@
 """Tests for backtest_orchestrator module."""
 
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
 from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
 
-from src.core.backtest_orchestrator import _make_json_serializable
+import nautilus_trader
+import numpy as np
+import pytest
+from nautilus_trader.model.data import Bar, BarType
+from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+
+from src.config import get_settings
+from src.core.backtest_orchestrator import (
+    BacktestOrchestrator,
+    _make_json_serializable,
+    bars_digest,
+    run_fingerprint,
+)
+from src.db.models.backtest import PerformanceMetrics
+from src.models.backtest_request import BacktestRequest
+from src.services.shared_bars import BarArrays
+
+
+def _request(**updates) -> BacktestRequest:
+    """Persisted SMA crossover request."""
+    request = BacktestRequest(
+        strategy_type="sma_crossover",
+        strategy_path="src.core.strategies.sma_crossover:SMACrossover",
+        config_path="src.core.strategies.sma_crossover:SMAConfig",
+        strategy_config={"fast_period": 5, "slow_period": 20},
+        symbol="AAPL",
+        instrument_id="AAPL.NASDAQ",
+        start_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        end_date=datetime(2024, 6, 1, tzinfo=timezone.utc),
+        bar_type="1-DAY-LAST",
+    )
+    return request.model_copy(update=updates)
+
+
+def _bars(count: int = 30, start_price: float = 100.0) -> list[Bar]:
+    """Daily AAPL bars with rising prices."""
+    prices = np.linspace(start_price, start_price + 10.0, count)
+    ts = np.arange(count, dtype=np.uint64) * np.uint64(86_400_000_000_000)
+    return Bar.from_raw_arrays_to_list(
+        BarType.from_str("AAPL.NASDAQ-1-DAY-LAST-EXTERNAL"),
+        2,
+        0,
+        prices,
+        prices + 1.0,
+        prices - 1.0,
+        prices,
+        np.full(count, 1000.0),
+        ts,
+        ts,
+    )
+
+
+def _instrument() -> MagicMock:
+    """Instrument stand-in with a real identifier."""
+    instrument = MagicMock()
+    instrument.id = InstrumentId.from_str("AAPL.NASDAQ")
+    return instrument
 
 
 class TestMakeJsonSerializable:
@@ -89,3 +150,288 @@ class TestMakeJsonSerializable:
         """Test that negative Decimal values are converted correctly."""
         result = _make_json_serializable(Decimal("-500.25"))
         assert result == "-500.25"
+
+
+class TestRunFingerprint:
+    """Test cases for run_fingerprint."""
+
+    def test_identical_inputs_match(self) -> None:
+        """The same request over equal bars has one fingerprint."""
+        settings = get_settings()
+
+        first = run_fingerprint(_request(), _bars(), _instrument(), settings)
+        second = run_fingerprint(_request(), _bars(), _instrument(), settings)
+
+        assert first == second
+        assert len(first) == 64
+
+    def test_parameters_are_resolved_before_hashing(self) -> None:
+        """Spelling out a default parameter does not change the fingerprint."""
+        settings = get_settings()
+        explicit = _request(
+            strategy_config={"fast_period": 5, "slow_period": 20, "portfolio_value": 1000000}
+        )
+
+        assert run_fingerprint(explicit, _bars(), _instrument(), settings) == run_fingerprint(
+            _request(), _bars(), _instrument(), settings
+        )
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            {"request": {"strategy_config": {"fast_period": 6, "slow_period": 20}}},
+            {"request": {"starting_balance": Decimal("50000")}},
+            {"request": {"end_date": datetime(2024, 7, 1, tzinfo=timezone.utc)}},
+            {"bars": {"start_price": 100.5}},
+            {"settings": {"commission_per_share": Decimal("0.01")}},
+            {"nautilus_version": "0.0.0"},
+        ],
+    )
+    def test_any_input_change_changes_fingerprint(self, change) -> None:
+        """Strategy config, account, bars, fee settings and engine version all count."""
+        settings = get_settings()
+        baseline = run_fingerprint(_request(), _bars(), _instrument(), settings)
+
+        changed_settings = settings.model_copy(update=change.get("settings", {}))
+        with patch(
+            "src.core.backtest_orchestrator.nautilus_trader.__version__",
+            change.get("nautilus_version", nautilus_trader.__version__),
+        ):
+            fingerprint = run_fingerprint(
+                _request(**change.get("request", {})),
+                _bars(**change.get("bars", {})),
+                _instrument(),
+                changed_settings,
+            )
+
+        assert fingerprint != baseline
+
+    def test_source_digest_replaces_bar_hashing(self) -> None:
+        """With a catalog source digest the bars are not converted at all."""
+        settings = get_settings()
+
+        with patch("src.core.backtest_orchestrator.bars_digest") as digest:
+            first = run_fingerprint(_request(), _bars(), _instrument(), settings, "abc")
+            other_bars = run_fingerprint(
+                _request(), _bars(start_price=50.0), _instrument(), settings, "abc"
+            )
+            other_source = run_fingerprint(_request(), _bars(), _instrument(), settings, "def")
+
+        digest.assert_not_called()
+        assert first == other_bars
+        assert first != other_source
+
+    def test_bar_digest_hashes_content(self) -> None:
+        """Equal bar lists share a digest; different prices change it."""
+        assert bars_digest(_bars()) == bars_digest(_bars())
+        assert bars_digest(_bars()) != bars_digest(_bars(start_price=50.0))
+
+
+class TestResultCache:
+    """Test cases for the result cache lookup in BacktestOrchestrator.execute."""
+
+    @staticmethod
+    def _patch_repository(cached_run):
+        """Patch the session and repository used for cache lookups."""
+        repository = MagicMock()
+        repository.find_by_fingerprint = AsyncMock(return_value=cached_run)
+
+        @asynccontextmanager
+        async def session():
+            yield MagicMock()
+
+        return (
+            patch("src.core.backtest_orchestrator.get_session", session),
+            patch("src.core.backtest_orchestrator.BacktestRepository", return_value=repository),
+            repository,
+        )
+
+    async def test_hit_returns_stored_result_without_running(self) -> None:
+        """A stored run with the same fingerprint is returned as is."""
+        cached_run = MagicMock()
+        cached_run.run_id = uuid4()
+        cached_run.execution_duration_seconds = Decimal("12.5")
+        cached_run.metrics = PerformanceMetrics(
+            total_return=Decimal("0.12"),
+            final_balance=Decimal("1120000"),
+            total_trades=4,
+            winning_trades=3,
+            losing_trades=1,
+        )
+        session_patch, repository_patch, repository = self._patch_repository(cached_run)
+        orchestrator = BacktestOrchestrator()
+
+        with session_patch, repository_patch:
+            result, run_id = await orchestrator.execute(_request(), _bars(), _instrument())
+
+        expected = run_fingerprint(_request(), _bars(), _instrument(), get_settings())
+        repository.find_by_fingerprint.assert_awaited_once_with(expected)
+        assert run_id == cached_run.run_id
+        assert orchestrator.cached_run_id == cached_run.run_id
+        assert orchestrator.engine is None
+        assert result.total_return == pytest.approx(0.12)
+        assert result.total_trades == 4
+
+    async def test_no_cache_skips_lookup(self) -> None:
+        """use_cache=False always executes the engine, without fingerprinting."""
+        orchestrator = BacktestOrchestrator()
+
+        with (
+            patch("src.core.backtest_orchestrator.run_fingerprint") as fingerprint,
+            patch.object(orchestrator, "_find_cached", AsyncMock()) as find_cached,
+            patch.object(orchestrator, "_setup_engine", side_effect=RuntimeError("engine")),
+            patch.object(orchestrator, "_persist_failed", AsyncMock()),
+        ):
+            with pytest.raises(RuntimeError, match="engine"):
+                await orchestrator.execute(_request(use_cache=False), _bars(), _instrument())
+
+        fingerprint.assert_not_called()
+        find_cached.assert_not_awaited()
+        assert orchestrator.cached_run_id is None
+
+    async def test_unpersisted_requests_skip_lookup(self) -> None:
+        """Requests that are not persisted never consult the database."""
+        orchestrator = BacktestOrchestrator()
+
+        with (
+            patch.object(orchestrator, "_find_cached", AsyncMock()) as find_cached,
+            patch.object(orchestrator, "_setup_engine", side_effect=RuntimeError("engine")),
+        ):
+            with pytest.raises(RuntimeError, match="engine"):
+                await orchestrator.execute(_request(persist=False), _bars(), _instrument())
+
+        find_cached.assert_not_awaited()
+
+    async def test_bar_digest_is_kept_per_orchestrator(self) -> None:
+        """Runs over the same list hash it once; dispose() drops the list."""
+        bars = _bars()
+        orchestrator = BacktestOrchestrator()
+        cached = (MagicMock(), uuid4())
+
+        with (
+            patch(
+                "src.core.backtest_orchestrator.BarArrays.from_bars", wraps=BarArrays.from_bars
+            ) as from_bars,
+            patch.object(orchestrator, "_find_cached", AsyncMock(return_value=cached)),
+        ):
+            await orchestrator.execute(_request(), bars, _instrument())
+            await orchestrator.execute(_request(), bars, _instrument())
+            await orchestrator.execute(_request(), _bars(), _instrument())
+
+        assert from_bars.call_count == 2
+        orchestrator.dispose()
+        assert orchestrator._hashed_bars is None
+
+    async def test_lookup_failure_is_a_miss(self) -> None:
+        """An unreachable database falls through to executing the run."""
+
+        @asynccontextmanager
+        async def broken_session():
+            raise ConnectionError("database down")
+            yield  # pragma: no cover
+
+        orchestrator = BacktestOrchestrator()
+        with patch("src.core.backtest_orchestrator.get_session", broken_session):
+            assert await orchestrator._find_cached("abc") is None
+        assert orchestrator.cached_run_id is None
+
+
+def _oscillating_bars(count: int = 200) -> list[Bar]:
+    """Daily AAPL bars oscillating around 100, so SMA crossovers trade."""
+    prices = np.round(100.0 + 10.0 * np.sin(np.arange(count) / 8.0), 2)
+    ts = np.uint64(1_704_067_200 * 10**9) + np.arange(count, dtype=np.uint64) * np.uint64(
+        86_400_000_000_000
+    )
+    return Bar.from_raw_arrays_to_list(
+        BarType.from_str("AAPL.NASDAQ-1-DAY-LAST-EXTERNAL"),
+        2,
+        0,
+        prices,
+        prices + 1.0,
+        prices - 1.0,
+        prices,
+        np.full(count, 1000.0),
+        ts,
+        ts,
+    )
+
+
+class TestEngineReuse:
+    """Test cases for keeping one engine loaded across runs (reuse_engine=True)."""
+
+    @staticmethod
+    def _run_request(fast_period: int) -> BacktestRequest:
+        return _request(
+            strategy_config={"fast_period": fast_period, "slow_period": 40},
+            end_date=datetime(2024, 12, 31, tzinfo=timezone.utc),
+            persist=False,
+        )
+
+    async def test_reused_engine_matches_fresh_engines(self) -> None:
+        """Runs on a reset engine trade exactly like runs on fresh engines."""
+        bars = _oscillating_bars()
+        instrument = TestInstrumentProvider.equity("AAPL", "NASDAQ")
+
+        fresh = []
+        for fast_period in (5, 10):
+            orchestrator = BacktestOrchestrator()
+            result, _ = await orchestrator.execute(self._run_request(fast_period), bars, instrument)
+            _, positions = orchestrator.collect_run_artifacts()
+            fresh.append((result, len(positions)))
+            orchestrator.dispose()
+
+        orchestrator = BacktestOrchestrator(reuse_engine=True)
+        reused = []
+        engines = []
+        for fast_period in (5, 10):
+            result, _ = await orchestrator.execute(self._run_request(fast_period), bars, instrument)
+            _, positions = orchestrator.collect_run_artifacts()
+            reused.append((result, len(positions)))
+            engines.append(orchestrator.engine)
+        orchestrator.dispose()
+
+        assert engines[0] is engines[1]
+        assert orchestrator.engine is None
+        for (fresh_result, fresh_positions), (reused_result, reused_positions) in zip(
+            fresh, reused
+        ):
+            # Only the current run's positions are left in a reset engine
+            assert reused_positions == fresh_positions
+            assert reused_result.total_trades == fresh_result.total_trades > 0
+            # Reason: The fill model's slippage is random; one slipped tick moves the
+            # return by about 1e-5, so compare absolutely rather than relatively
+            assert reused_result.total_return == pytest.approx(fresh_result.total_return, abs=1e-4)
+
+    async def test_engine_is_rebuilt_for_other_data(self) -> None:
+        """Other bars or another starting balance get a new engine."""
+        bars = _oscillating_bars()
+        instrument = TestInstrumentProvider.equity("AAPL", "NASDAQ")
+        orchestrator = BacktestOrchestrator(reuse_engine=True)
+
+        await orchestrator.execute(self._run_request(5), bars, instrument)
+        first = orchestrator.engine
+        await orchestrator.execute(self._run_request(5), list(bars), instrument)
+        second = orchestrator.engine
+        await orchestrator.execute(
+            self._run_request(5).model_copy(update={"starting_balance": Decimal("50000")}),
+            list(bars),
+            instrument,
+        )
+        third = orchestrator.engine
+        orchestrator.dispose()
+
+        assert first is not second
+        assert second is not third
+
+    async def test_failed_run_discards_engine(self) -> None:
+        """A failing run drops the kept engine instead of reusing it."""
+        bars = _oscillating_bars()
+        instrument = TestInstrumentProvider.equity("AAPL", "NASDAQ")
+        orchestrator = BacktestOrchestrator(reuse_engine=True)
+        await orchestrator.execute(self._run_request(5), bars, instrument)
+
+        with patch.object(orchestrator, "_create_strategy", side_effect=ValueError("bad")):
+            with pytest.raises(ValueError, match="bad"):
+                await orchestrator.execute(self._run_request(10), bars, instrument)
+
+        assert orchestrator.engine is None
@@ -178,7 +178,7 @@ class TestPersistBacktestResultsEquityCurve:
     async def test_persist_backtest_results_includes_equity_curve(
         self, backtest_runner_with_engine
     ):
-        """Persist method adds equity curve to config_snapshot."""
+        """Persist method passes the equity curve apart from config_snapshot."""
         # Arrange
         from src.core.backtest_runner import BacktestResult
 
@@ -222,10 +222,8 @@ class TestPersistBacktestResultsEquityCurve:
 
                     # Assert
                     call_kwargs = mock_service.save_backtest_results.call_args[1]
-                    config_snapshot = call_kwargs["config_snapshot"]
+                    equity_curve = call_kwargs["equity_curve"]
 
-                    assert "equity_curve" in config_snapshot
-                    assert len(config_snapshot["equity_curve"]) == 3
-                    assert (
-                        config_snapshot["equity_curve"][0]["time"] == 1704067200
-                    )  # 2024-01-01 Unix timestamp
+                    assert "equity_curve" not in call_kwargs["config_snapshot"]
+                    assert len(equity_curve) == 3
+                    assert equity_curve[0]["time"] == 1704067200  # 2024-01-01 Unix timestamp
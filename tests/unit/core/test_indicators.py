@@ -0,0 +1,121 @@
+"""Tests for vectorized technical indicators."""
+
+import numpy as np
+import pytest
+
+from src.core.indicators import (
+    DAY_NS,
+    atr,
+    bollinger_bands,
+    ema,
+    rsi,
+    sma,
+    week_starts,
+    weekly_sma,
+)
+
+# 2024-01-01 00:00 UTC, a Monday
+MONDAY_NS = 1_704_067_200_000_000_000
+
+
+def _daily_ts(count: int) -> np.ndarray:
+    """Daily timestamps starting on a Monday."""
+    return (MONDAY_NS + DAY_NS * np.arange(count)).astype(np.uint64)
+
+
+class TestMovingAverages:
+    """Tests for sma and ema functions."""
+
+    def test_sma_warmup_and_values(self):
+        """SMA is NaN until the window is full, then averages the window."""
+        values = sma(np.array([1.0, 2.0, 3.0, 4.0, 5.0]), 3)
+
+        np.testing.assert_array_equal(values, [np.nan, np.nan, 2.0, 3.0, 4.0])
+
+    def test_ema_is_seeded_with_first_value(self):
+        """EMA starts from the first input, not from an SMA of the window."""
+        values = ema(np.array([10.0, 20.0, 20.0]), 3)
+
+        # alpha = 0.5: 10 -> 15 -> 17.5
+        np.testing.assert_array_equal(values, [np.nan, np.nan, 17.5])
+
+    @pytest.mark.parametrize("func", [sma, ema, rsi])
+    def test_shorter_than_period_is_all_nan(self, func):
+        """Inputs shorter than the period never initialize."""
+        assert np.isnan(func(np.array([1.0, 2.0]), 3)).all()
+
+    @pytest.mark.parametrize("func", [sma, ema, rsi])
+    def test_rejects_non_positive_period(self, func):
+        """Periods must be positive."""
+        with pytest.raises(ValueError, match="period must be positive"):
+            func(np.array([1.0, 2.0]), 0)
+
+
+class TestRsi:
+    """Tests for rsi function."""
+
+    def test_rising_series_reads_one(self):
+        """Without losses the RSI is at its 1.0 maximum."""
+        values = rsi(np.arange(10.0), 3)
+
+        assert np.isnan(values[:2]).all()
+        np.testing.assert_array_equal(values[2:], 1.0)
+
+    def test_values_are_bounded(self):
+        """RSI stays within 0..1 on a random walk."""
+        rng = np.random.default_rng(7)
+        values = rsi(100.0 + rng.standard_normal(500).cumsum(), 14)
+
+        assert ((values[13:] >= 0.0) & (values[13:] <= 1.0)).all()
+
+
+class TestRangeIndicators:
+    """Tests for bollinger_bands and atr functions."""
+
+    def test_bollinger_bands_use_typical_price(self):
+        """Bands are centered on the SMA of (high + low + close) / 3."""
+        close = np.array([1.0, 2.0, 3.0, 4.0])
+        bands = bollinger_bands(close + 3.0, close - 3.0, close, 2, 2.0)
+
+        np.testing.assert_array_equal(bands.middle, [np.nan, 1.5, 2.5, 3.5])
+        # Population std of two points one apart is 0.5
+        np.testing.assert_array_equal(bands.upper, [np.nan, 2.5, 3.5, 4.5])
+        np.testing.assert_array_equal(bands.lower, [np.nan, 0.5, 1.5, 2.5])
+
+    def test_atr_includes_gaps_from_previous_close(self):
+        """A gap beyond the bar's range widens the true range."""
+        high = np.array([11.0, 21.0, 22.0])
+        low = np.array([9.0, 19.0, 20.0])
+        close = np.array([10.0, 20.0, 21.0])
+
+        # True ranges: 2 (first bar), 21 - 10 = 11, 22 - 20 = 2
+        np.testing.assert_array_equal(atr(high, low, close, 2), [np.nan, 6.5, 6.5])
+
+
+class TestWeekly:
+    """Tests for week_starts and weekly_sma functions."""
+
+    def test_week_starts_on_mondays(self):
+        """Weeks change on Mondays, including across gaps in the data."""
+        ts = _daily_ts(15)
+        # Drop the weekend and Monday of week two (a holiday gap)
+        ts = np.delete(ts, [5, 6, 7])
+
+        np.testing.assert_array_equal(week_starts(ts), [5, 11])
+
+    def test_weekly_sma_commits_closes_on_the_next_week(self):
+        """A week's close only counts once the following week starts."""
+        ts = _daily_ts(21)
+        close = np.arange(21, dtype=np.float64)
+
+        values = weekly_sma(ts, close, 2)
+
+        # Week closes are 6 and 13; both are committed from the first bar of week three
+        assert np.isnan(values[:14]).all()
+        np.testing.assert_array_equal(values[14:], 9.5)
+
+    def test_weekly_sma_handles_empty_input(self):
+        """No bars yield an empty series."""
+        values = weekly_sma(np.array([], dtype=np.uint64), np.array([]), 2)
+
+        assert len(values) == 0
@@ -0,0 +1,216 @@
+"""Tests for vectorized signal screening and the strategies' signal functions."""
+
+from decimal import Decimal
+
+import numpy as np
+import pytest
+from nautilus_trader.model.data import BarType
+from nautilus_trader.model.identifiers import InstrumentId
+
+from src.core.indicators import DAY_NS, sma
+from src.core.signal_screening import (
+    ScreenBars,
+    evaluate_positions,
+    hold_signals,
+    size_at_entry,
+)
+from src.core.sma_logic import CrossoverSignal, SMATradingLogic, crossover_signals
+from src.core.strategies.sma_crossover import sma_crossover_signals
+from src.core.strategies.sma_momentum import SMAMomentum, SMAMomentumConfig, sma_momentum_signals
+from src.core.strategy_registry import StrategyRegistry
+from src.services.shared_bars import BarArrays
+
+
+def _screen_bars(close, bars_per_day: int = 1, size_precision: int = 0) -> ScreenBars:
+    """ScreenBars over closes, bars_per_day bars per UTC day."""
+    close = np.asarray(close, dtype=np.float64)
+    count = len(close)
+    ts = (np.arange(count) * (DAY_NS // bars_per_day)).astype(np.uint64)
+    return ScreenBars(
+        BarArrays(
+            bar_type="AAPL.NASDAQ-1-DAY-LAST-EXTERNAL",
+            price_precision=2,
+            size_precision=size_precision,
+            open=close,
+            high=close + 1.0,
+            low=close - 1.0,
+            close=close,
+            volume=np.full(count, 1000.0),
+            ts_event=ts,
+            ts_init=ts,
+        )
+    )
+
+
+def _random_walk(count: int, seed: int) -> np.ndarray:
+    """Positive closes following a seeded random walk."""
+    rng = np.random.default_rng(seed)
+    return np.round(100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.02, count))), 2)
+
+
+class TestCrossoverSignals:
+    """Tests for the vectorized crossover detection."""
+
+    def test_matches_bar_by_bar_detection(self):
+        """Every bar signals what SMATradingLogic.detect_crossover would."""
+        close = _random_walk(300, seed=1)
+        fast, slow = sma(close, 5), sma(close, 20)
+        logic = SMATradingLogic(5, 20)
+        codes = {
+            CrossoverSignal.GOLDEN_CROSS: 1,
+            CrossoverSignal.DEATH_CROSS: -1,
+            CrossoverSignal.NO_CROSS: 0,
+        }
+
+        expected = np.zeros(len(close), dtype=np.int8)
+        for i in range(20, len(close)):
+            expected[i] = codes[logic.detect_crossover(fast[i - 1], slow[i - 1], fast[i], slow[i])]
+
+        np.testing.assert_array_equal(crossover_signals(fast, slow), expected)
+
+    def test_no_signal_until_previous_values_exist(self):
+        """The first bar with both averages only records them."""
+        fast = np.array([np.nan, 3.0, 1.0])
+        slow = np.array([np.nan, 2.0, 2.0])
+
+        np.testing.assert_array_equal(crossover_signals(fast, slow), [0, 0, -1])
+
+
+class TestPositionHelpers:
+    """Tests for hold_signals and size_at_entry."""
+
+    def test_hold_signals_keeps_last_direction(self):
+        """Directions persist until the next signal."""
+        np.testing.assert_array_equal(
+            hold_signals(np.array([0, 1, 0, 0, -1, 0, 1])), [0, 1, 1, 1, -1, -1, 1]
+        )
+
+    def test_size_at_entry_keeps_entry_quantity(self):
+        """Each position keeps the size of the bar it was entered on."""
+        direction = np.array([0, 1, 1, -1, -1, 1])
+        sizes = np.array([10.0, 20.0, 30.0, 40.0, 50.0, 60.0])
+
+        np.testing.assert_array_equal(size_at_entry(direction, sizes), [0, 20, 20, -40, -40, 60])
+
+
+class TestEvaluatePositions:
+    """Tests for evaluate_positions."""
+
+    def test_pnl_trades_and_drawdown(self):
+        """Positions earn the next close-to-close change; drawdown uses daily balances."""
+        bars = _screen_bars([100.0, 110.0, 99.0, 105.0, 105.0])
+        positions = np.array([0.0, 10.0, 10.0, -10.0, 0.0])
+
+        metrics = evaluate_positions(bars, positions, 1000.0)
+
+        # 0, +0 (flat into bar 1), -110, +60, -0
+        assert metrics.total_pnl == pytest.approx(-50.0)
+        assert metrics.total_return == pytest.approx(-0.05)
+        assert metrics.total_trades == 2
+        # Daily balances 1000, 1000, 1000, 890, 950, 950
+        assert metrics.max_drawdown == pytest.approx(-0.11)
+        assert metrics.sharpe_ratio is not None
+
+    def test_daily_returns_aggregate_intraday_bars(self):
+        """Sharpe and drawdown use one balance per day, not per bar."""
+        close = [100.0, 90.0, 105.0, 110.0, 95.0, 120.0]
+        bars = _screen_bars(close, bars_per_day=3)
+
+        metrics = evaluate_positions(bars, np.ones(6), 1000.0)
+
+        # Intraday dips to 990 and 995 are invisible; days end at 1005 and 1020
+        assert metrics.max_drawdown == 0.0
+        assert metrics.total_pnl == pytest.approx(20.0)
+
+    def test_flat_positions(self):
+        """Never trading returns zeros and no Sharpe ratio."""
+        bars = _screen_bars([100.0, 101.0, 102.0])
+
+        metrics = evaluate_positions(bars, np.zeros(3), 1000.0)
+
+        assert metrics.total_pnl == 0.0
+        assert metrics.total_trades == 0
+        assert metrics.sharpe_ratio is None
+
+    def test_rejects_misaligned_positions(self):
+        """Positions must have one value per bar."""
+        with pytest.raises(ValueError, match="Expected 3 positions"):
+            evaluate_positions(_screen_bars([1.0, 2.0, 3.0]), np.zeros(2), 1000.0)
+
+
+class TestStrategySignalFunctions:
+    """Parity of the strategies' signal functions with their bar-by-bar logic."""
+
+    def test_registered_for_screening(self):
+        """Both SMA strategies register a signal function."""
+        assert StrategyRegistry.get("sma_crossover").signal_function is sma_crossover_signals
+        assert StrategyRegistry.get("momentum").signal_function is sma_momentum_signals
+
+    def test_sma_crossover_matches_event_logic(self):
+        """Long/short flips sized at the entry close, as SMACrossover trades."""
+        close = _random_walk(400, seed=2)
+        params = {
+            "fast_period": 5,
+            "slow_period": 20,
+            "portfolio_value": Decimal("1000000"),
+            "position_size_pct": Decimal("10.0"),
+        }
+        fast, slow = sma(close, 5), sma(close, 20)
+
+        expected = np.zeros(len(close))
+        position = 0.0
+        for i in range(20, len(close)):
+            shares = max(int(100_000 / close[i]), 1)
+            if fast[i - 1] <= slow[i - 1] and fast[i] > slow[i] and position <= 0:
+                position = float(shares)
+            elif fast[i - 1] >= slow[i - 1] and fast[i] < slow[i] and position >= 0:
+                position = -float(shares)
+            expected[i] = position
+
+        positions = sma_crossover_signals(_screen_bars(close), params)
+
+        np.testing.assert_array_equal(positions, expected)
+
+    @pytest.mark.parametrize("allow_short", [False, True])
+    def test_sma_momentum_matches_event_logic(self, allow_short):
+        """Positions follow SMAMomentum's own moving averages and order rules."""
+        close = _random_walk(400, seed=3)
+        strategy = SMAMomentum(
+            SMAMomentumConfig(
+                instrument_id=InstrumentId.from_str("AAPL.NASDAQ"),
+                bar_type=BarType.from_str("AAPL.NASDAQ-1-DAY-LAST-EXTERNAL"),
+                trade_size=Decimal("100"),
+                order_id_tag="001",
+                fast_period=5,
+                slow_period=20,
+            )
+        )
+
+        expected = np.zeros(len(close))
+        position = 0.0
+        prev = None
+        for i, price in enumerate(close):
+            fast, strategy._fast_sum = strategy._update_ma(
+                strategy._fast, strategy._fast_sum, float(price), 5
+            )
+            slow, strategy._slow_sum = strategy._update_ma(
+                strategy._slow, strategy._slow_sum, float(price), 20
+            )
+            if fast is not None and slow is not None:
+                if prev is not None:
+                    if prev[0] <= prev[1] and fast > slow:
+                        position = 100.0
+                    elif prev[0] >= prev[1] and fast < slow:
+                        position = -100.0 if allow_short else 0.0
+                prev = (fast, slow)
+            expected[i] = position
+
+        params = {
+            "fast_period": 5,
+            "slow_period": 20,
+            "trade_size": Decimal("100"),
+            "allow_short": allow_short,
+        }
+        positions = sma_momentum_signals(_screen_bars(close), params)
+
+        np.testing.assert_array_equal(positions, expected)
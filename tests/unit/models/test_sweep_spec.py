@@ -0,0 +1,107 @@
+"""Tests for parameter sweep models."""
+
+from uuid import uuid4
+
+import pytest
+from pydantic import ValidationError
+
+from src.models.parameter_sweep import (
+    SweepMode,
+    SweepRunSummary,
+    SweepSpec,
+    SweepSummary,
+    parse_param_spec,
+)
+
+
+class TestParseParamSpec:
+    """Tests for parse_param_spec."""
+
+    def test_integer_range_is_inclusive(self):
+        """Integer ranges include the stop value and stay integers."""
+        assert parse_param_spec("fast_period=5:20:5") == ("fast_period", [5, 10, 15, 20])
+
+    def test_range_step_defaults_to_one(self):
+        """start:stop ranges step by one."""
+        assert parse_param_spec("rsi_period=2:4") == ("rsi_period", [2, 3, 4])
+
+    def test_float_range_is_rounded(self):
+        """Float ranges avoid accumulated representation error."""
+        _, values = parse_param_spec("buy_threshold=0.1:0.3:0.1")
+        assert values == [0.1, 0.2, 0.3]
+
+    def test_explicit_values(self):
+        """Comma-separated values are parsed to scalars."""
+        assert parse_param_spec("x=1, 2.5,true,abc") == ("x", [1, 2.5, True, "abc"])
+
+    @pytest.mark.parametrize(
+        "spec",
+        ["fast_period", "=1,2", "fast_period=", "x=1:a", "x=5:1", "x=1:5:0", "x=1:2:3:4"],
+    )
+    def test_malformed_specs_raise(self, spec):
+        """Malformed specifications raise ValueError."""
+        with pytest.raises(ValueError):
+            parse_param_spec(spec)
+
+
+class TestSweepSpec:
+    """Tests for SweepSpec."""
+
+    def test_grid_returns_every_combination(self):
+        """Grid mode yields the full cartesian product."""
+        spec = SweepSpec(params={"fast_period": [5, 10], "slow_period": [20, 50, 100]})
+
+        combos = spec.combinations()
+
+        assert spec.grid_size == 6
+        assert len(combos) == 6
+        assert {"fast_period": 10, "slow_period": 50} in combos
+
+    def test_random_sampling_is_reproducible_and_unique(self):
+        """Random mode samples without replacement for a fixed seed."""
+        params = {"a": list(range(10)), "b": list(range(10))}
+        spec = SweepSpec(params=params, mode=SweepMode.RANDOM, samples=15, seed=7)
+
+        first = spec.combinations()
+        second = spec.combinations()
+
+        assert first == second
+        assert len(first) == 15
+        assert len({(c["a"], c["b"]) for c in first}) == 15
+
+    def test_random_with_more_samples_than_grid_returns_grid(self):
+        """Oversampling falls back to the full grid."""
+        spec = SweepSpec(params={"a": [1, 2]}, mode=SweepMode.RANDOM, samples=10)
+        assert spec.combinations() == [{"a": 1}, {"a": 2}]
+
+    def test_random_requires_samples(self):
+        """Random mode without a sample count is rejected."""
+        with pytest.raises(ValidationError):
+            SweepSpec(params={"a": [1, 2]}, mode=SweepMode.RANDOM)
+
+    def test_empty_values_rejected(self):
+        """Every parameter needs at least one candidate value."""
+        with pytest.raises(ValidationError):
+            SweepSpec(params={"a": []})
+
+
+class TestSweepSummary:
+    """Tests for SweepSummary ranking."""
+
+    def test_ranked_orders_best_first_and_drops_failures(self):
+        """Successful runs sort descending with missing metrics last."""
+        summary = SweepSummary(
+            sweep_id=uuid4(),
+            strategy="sma_crossover",
+            symbol="AAPL",
+            runs=[
+                SweepRunSummary(params={"a": 1}, sharpe_ratio=0.5),
+                SweepRunSummary(params={"a": 2}, sharpe_ratio=None),
+                SweepRunSummary(params={"a": 3}, sharpe_ratio=1.5),
+                SweepRunSummary(params={"a": 4}, success=False, error_message="boom"),
+            ],
+        )
+
+        ranked = summary.ranked("sharpe_ratio")
+
+        assert [run.params["a"] for run in ranked] == [3, 1, 2]
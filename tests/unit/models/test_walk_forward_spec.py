@@ -0,0 +1,87 @@
+"""Tests for walk-forward models."""
+
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+from pydantic import ValidationError
+
+from src.models.walk_forward import WalkForwardSpec, WalkForwardSummary
+
+
+def _utc(year: int, month: int = 1, day: int = 1) -> datetime:
+    return datetime(year, month, day, tzinfo=timezone.utc)
+
+
+class TestWalkForwardSpec:
+    """Tests for WalkForwardSpec.windows."""
+
+    def test_rolling_windows_tile_the_range(self):
+        """Rolling train windows keep their length and test windows follow each other."""
+        spec = WalkForwardSpec(train_months=24, test_months=12)
+
+        windows = spec.windows(_utc(2020), _utc(2024))
+
+        assert [(w.train_start, w.test_start, w.test_end) for w in windows] == [
+            (_utc(2020), _utc(2022), _utc(2023)),
+            (_utc(2021), _utc(2023), _utc(2024)),
+        ]
+        assert [w.index for w in windows] == [0, 1]
+
+    def test_anchored_windows_grow_from_the_start(self):
+        """Anchored train windows all start at the range start."""
+        spec = WalkForwardSpec(train_months=24, test_months=12, anchored=True)
+
+        windows = spec.windows(_utc(2020), _utc(2024))
+
+        assert [w.train_start for w in windows] == [_utc(2020), _utc(2020)]
+        assert [w.train_end for w in windows] == [_utc(2022), _utc(2023)]
+
+    def test_last_test_window_is_cut_at_range_end(self):
+        """A partial final test window ends at the range end."""
+        spec = WalkForwardSpec(train_months=12, test_months=6)
+
+        windows = spec.windows(_utc(2020), _utc(2021, 9, 15))
+
+        assert len(windows) == 2
+        assert windows[-1].test_start == _utc(2021, 7)
+        assert windows[-1].test_end == _utc(2021, 9, 15)
+
+    def test_range_shorter_than_train_window(self):
+        """No folds fit when the range ends before the first test window starts."""
+        spec = WalkForwardSpec(train_months=36, test_months=12)
+
+        assert spec.windows(_utc(2020), _utc(2023)) == []
+
+    @pytest.mark.parametrize("train, test", [(0, 12), (12, 0), (-1, 6)])
+    def test_window_lengths_must_be_positive(self, train, test):
+        """Zero or negative window lengths are rejected."""
+        with pytest.raises(ValidationError):
+            WalkForwardSpec(train_months=train, test_months=test)
+
+
+class TestWalkForwardSummary:
+    """Tests for the stitched-curve metrics of WalkForwardSummary."""
+
+    def _summary(self, values: list[float]) -> WalkForwardSummary:
+        return WalkForwardSummary(
+            walk_forward_id=uuid4(),
+            strategy="sma_crossover",
+            symbol="AAPL",
+            equity_curve=[{"time": i, "value": v} for i, v in enumerate(values)],
+            starting_balance=100.0,
+        )
+
+    def test_total_return_and_drawdown(self):
+        """Return uses the last point; drawdown is measured from the running peak."""
+        summary = self._summary([110.0, 88.0, 121.0])
+
+        assert summary.total_return == pytest.approx(0.21)
+        assert summary.max_drawdown == pytest.approx(-0.2)
+
+    def test_metrics_without_curve(self):
+        """Without out-of-sample points there is no result."""
+        summary = self._summary([])
+
+        assert summary.total_return is None
+        assert summary.max_drawdown is None
@@ -0,0 +1,180 @@
+"""Unit tests for the web backtest job manager."""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.models.backtest_job import JobStatus
+from src.services.backtest_jobs import BacktestJobManager, BacktestQueueFullError
+
+
+def _request() -> MagicMock:
+    """Minimal stand-in for a BacktestRequest."""
+    request = MagicMock()
+    request.strategy_type = "sma_crossover"
+    request.symbol = "AAPL"
+    return request
+
+
+@pytest.fixture
+def executor():
+    """Thread pool standing in for the worker process pool."""
+    pool = ThreadPoolExecutor(max_workers=2)
+    yield pool
+    pool.shutdown(wait=True)
+
+
+async def _wait_finished(manager: BacktestJobManager) -> None:
+    """Wait for all submitted jobs to finish."""
+    while manager.pending_count:
+        await asyncio.sleep(0.01)
+
+
+class TestBacktestJobManager:
+    """Test suite for BacktestJobManager."""
+
+    async def test_successful_job_records_run_id(self, executor):
+        """A job that completes records the persisted run ID."""
+        run_id = uuid4()
+        manager = BacktestJobManager(max_workers=2, executor=executor)
+
+        with patch("src.services.backtest_jobs.run_backtest_job", return_value=run_id):
+            job = manager.submit(_request(), timeout_seconds=5)
+            assert job.status == JobStatus.QUEUED
+            await _wait_finished(manager)
+
+        assert job.status == JobStatus.SUCCEEDED
+        assert job.run_id == run_id
+        assert job.started_at is not None
+        assert manager.get(job.job_id) is job
+
+    async def test_failed_job_records_error(self, executor):
+        """Exceptions raised in the worker mark the job as failed."""
+        manager = BacktestJobManager(max_workers=2, executor=executor)
+
+        with patch(
+            "src.services.backtest_jobs.run_backtest_job",
+            side_effect=ValueError("No data found for AAPL"),
+        ):
+            job = manager.submit(_request(), timeout_seconds=5)
+            await _wait_finished(manager)
+
+        assert job.status == JobStatus.FAILED
+        assert job.error_message == "No data found for AAPL"
+
+    async def test_slow_job_times_out(self, executor):
+        """Jobs exceeding their timeout are marked as timed out."""
+        release = threading.Event()
+        manager = BacktestJobManager(max_workers=2, executor=executor)
+
+        with patch(
+            "src.services.backtest_jobs.run_backtest_job",
+            side_effect=lambda request, shared_bars=None: release.wait(5),
+        ):
+            job = manager.submit(_request(), timeout_seconds=1)
+            await _wait_finished(manager)
+            release.set()
+
+        assert job.status == JobStatus.TIMED_OUT
+        assert "timed out after 1 seconds" in job.error_message
+
+    async def test_timed_out_job_keeps_its_worker_slot(self, executor):
+        """A job queued behind a timed-out one starts only once the worker is done."""
+        release = threading.Event()
+        manager = BacktestJobManager(max_workers=1, executor=executor)
+
+        with patch(
+            "src.services.backtest_jobs.run_backtest_job",
+            side_effect=lambda request, shared_bars=None: release.wait(5) and None,
+        ):
+            first = manager.submit(_request(), timeout_seconds=1)
+            second = manager.submit(_request(), timeout_seconds=5)
+            while not first.is_finished:
+                await asyncio.sleep(0.01)
+            await asyncio.sleep(0.05)
+
+            assert first.status == JobStatus.TIMED_OUT
+            assert second.status == JobStatus.QUEUED
+
+            release.set()
+            await _wait_finished(manager)
+
+        assert second.status == JobStatus.SUCCEEDED
+
+    async def test_jobs_beyond_pool_size_wait_queued(self, executor):
+        """Only max_workers jobs run at once; the rest stay queued."""
+        release = threading.Event()
+        manager = BacktestJobManager(max_workers=1, executor=executor)
+
+        with patch(
+            "src.services.backtest_jobs.run_backtest_job",
+            side_effect=lambda request, shared_bars=None: release.wait(5) and None,
+        ):
+            first = manager.submit(_request(), timeout_seconds=5)
+            second = manager.submit(_request(), timeout_seconds=5)
+            await asyncio.sleep(0.05)
+
+            assert first.status == JobStatus.RUNNING
+            assert second.status == JobStatus.QUEUED
+
+            release.set()
+            await _wait_finished(manager)
+
+        assert first.status == JobStatus.SUCCEEDED
+        assert second.status == JobStatus.SUCCEEDED
+
+    async def test_submit_rejects_when_queue_full(self, executor):
+        """Submitting beyond max_queued unfinished jobs raises."""
+        release = threading.Event()
+        manager = BacktestJobManager(max_workers=1, max_queued=1, executor=executor)
+
+        with patch(
+            "src.services.backtest_jobs.run_backtest_job",
+            side_effect=lambda request, shared_bars=None: release.wait(5) and None,
+        ):
+            manager.submit(_request(), timeout_seconds=5)
+
+            with pytest.raises(BacktestQueueFullError):
+                manager.submit(_request(), timeout_seconds=5)
+
+            release.set()
+            await _wait_finished(manager)
+
+    async def test_shutdown_fails_queued_jobs(self, executor):
+        """Shutdown marks jobs that never started as failed."""
+        release = threading.Event()
+        manager = BacktestJobManager(max_workers=1, executor=executor)
+
+        with patch(
+            "src.services.backtest_jobs.run_backtest_job",
+            side_effect=lambda request, shared_bars=None: release.wait(5) and None,
+        ):
+            manager.submit(_request(), timeout_seconds=5)
+            queued = manager.submit(_request(), timeout_seconds=5)
+            await asyncio.sleep(0.05)
+
+            manager.shutdown()
+            release.set()
+
+        assert queued.status == JobStatus.FAILED
+        assert queued.error_message == "Server shutting down"
+
+    async def test_catalog_jobs_receive_and_release_shared_bars(self, executor):
+        """Catalog jobs get a shared bar handle that is released afterwards."""
+        handle = MagicMock()
+        shared_bars = MagicMock()
+        shared_bars.acquire.return_value = handle
+        request = _request()
+        request.data_source = "catalog"
+        manager = BacktestJobManager(max_workers=1, executor=executor, shared_bars=shared_bars)
+
+        with patch("src.services.backtest_jobs.run_backtest_job", return_value=uuid4()) as run:
+            manager.submit(request, timeout_seconds=5)
+            await _wait_finished(manager)
+
+        run.assert_called_once_with(request, handle)
+        shared_bars.release.assert_called_once_with(handle)
@@ -5,6 +5,7 @@ from decimal import Decimal
 from unittest.mock import AsyncMock, Mock
 from uuid import uuid4
 
+import pandas as pd
 import pytest
 
 from src.core.backtest_runner import BacktestResult
@@ -12,7 +13,14 @@ from src.db.exceptions import (
     DuplicateRecordError,
     ValidationError,
 )
-from src.services.backtest_persistence import BacktestPersistenceService
+from src.db.models.backtest import PerformanceMetrics
+from src.db.repositories.backtest_repository import TRADE_INSERT_COLUMNS
+from src.services.backtest_persistence import (
+    BacktestPersistenceService,
+    backtest_result_from_metrics,
+    positions_to_trade_rows,
+)
+from src.services.trade_analytics import TRADE_ANALYTICS_VERSION
 
 
 @pytest.fixture
@@ -21,6 +29,9 @@ def mock_repository():
     repo = Mock()
     repo.create_backtest_run = AsyncMock()
     repo.create_performance_metrics = AsyncMock()
+    repo.record_run_summary = AsyncMock()
+    repo.bulk_insert_trades = AsyncMock()
+    repo.save_trade_analytics = AsyncMock()
     return repo
 
 
@@ -108,6 +119,9 @@ class TestBacktestPersistenceServiceSaveSuccess:
         assert call_kwargs["execution_status"] == "success"
         assert call_kwargs["error_message"] is None
 
+        # Verify dashboard rollups were updated with the saved metrics
+        mock_repository.record_run_summary.assert_awaited_once_with(mock_run, mock_metrics)
+
     @pytest.mark.asyncio
     async def test_save_failed_backtest_with_error_message(
         self, persistence_service, mock_repository, sample_config_snapshot
@@ -139,6 +153,7 @@ class TestBacktestPersistenceServiceSaveSuccess:
         assert result == mock_run
         mock_repository.create_backtest_run.assert_called_once()
         mock_repository.create_performance_metrics.assert_not_called()
+        mock_repository.record_run_summary.assert_awaited_once_with(mock_run)
 
         # Verify failed status and error message
         call_kwargs = mock_repository.create_backtest_run.call_args.kwargs
@@ -392,3 +407,147 @@ class TestBacktestPersistenceServiceMetricCalculation:
         metrics_call_kwargs = mock_repository.create_performance_metrics.call_args.kwargs
         assert metrics_call_kwargs["win_rate"] is None  # Cannot calculate with 0 trades
         assert metrics_call_kwargs["total_trades"] == 0
+
+    def test_result_round_trips_through_stored_metrics(self, persistence_service):
+        """backtest_result_from_metrics restores what the metric extraction stored."""
+        result = BacktestResult(
+            total_return=0.12,
+            total_trades=10,
+            winning_trades=6,
+            losing_trades=4,
+            largest_win=900.0,
+            largest_loss=-400.0,
+            final_balance=112000.0,
+            sharpe_ratio=1.25,
+            max_drawdown=-0.08,
+            cagr=0.11,
+            max_winner=900.0,
+            max_loser=-400.0,
+        )
+        metrics = PerformanceMetrics(**persistence_service._extract_and_validate_metrics(result))
+
+        restored = backtest_result_from_metrics(metrics)
+
+        expected = result.to_dict()
+        actual = restored.to_dict()
+        expected.pop("result_id")
+        actual.pop("result_id")
+        assert actual == expected
+        assert restored.sortino_ratio is None
+
+
+def _positions_report(**overrides) -> pd.DataFrame:
+    """Positions report shaped like trader.generate_positions_report()."""
+    data = {
+        "instrument_id": ["AAPL.NASDAQ", "AAPL.NASDAQ", "AAPL.NASDAQ"],
+        "entry": ["BUY", "SELL", "BUY"],
+        "peak_qty": ["100", "50.5", "10"],
+        "opening_order_id": ["O-1", "O-2", "O-3"],
+        "closing_order_id": ["O-4", "O-5", None],
+        "ts_opened": pd.to_datetime(
+            ["2024-01-02 15:00", "2024-01-03 15:00", "2024-01-04 15:00"], utc=True
+        ),
+        "ts_closed": pd.to_datetime(["2024-01-02 16:00", "2024-01-05 15:00", None], utc=True),
+        "duration_ns": [3_600_000_000_000, 172_800_000_000_000, 0],
+        "avg_px_open": [150.123456789, 200.0, 180.0],
+        "avg_px_close": [151.5, 190.0, float("nan")],
+        "realized_pnl": ["137.65 USD", "505.00 USD", None],
+        "commissions": [["1.00 USD"], "['2.50 USD']", []],
+    }
+    data.update(overrides)
+    return pd.DataFrame(data, index=["P-1", "P-2", "P-3"])
+
+
+class TestPositionsToTradeRows:
+    """Test suite for the column-wise positions report conversion."""
+
+    def test_converts_closed_positions_and_skips_open_ones(self):
+        """Closed positions become typed rows; open positions are counted as skipped."""
+        rows, skipped = positions_to_trade_rows(7, _positions_report())
+
+        assert skipped == 1
+        assert len(rows) == 2
+        first = dict(zip(TRADE_INSERT_COLUMNS, rows[0]))
+        assert first["backtest_run_id"] == 7
+        assert first["trade_id"] == "P-1"
+        assert first["venue_order_id"] == "O-1"
+        assert first["client_order_id"] == "O-4"
+        assert first["entry_price"] == Decimal("150.12345679")
+        assert first["exit_price"] == Decimal("151.50000000")
+        assert first["quantity"] == Decimal("100.00000000")
+        assert first["commission_amount"] == Decimal("1.00")
+        assert first["commission_currency"] == "USD"
+        assert first["profit_loss"] == Decimal("137.65")
+        assert first["profit_pct"] == Decimal("0.9169")
+        assert first["holding_period_seconds"] == 3600
+        assert first["entry_timestamp"] == datetime(2024, 1, 2, 15, tzinfo=timezone.utc)
+
+        second = dict(zip(TRADE_INSERT_COLUMNS, rows[1]))
+        assert second["order_side"] == "SELL"
+        assert second["commission_amount"] == Decimal("2.50")
+        assert second["holding_period_seconds"] == 172800
+
+    def test_missing_money_columns_default_to_zero(self):
+        """Reports without commissions or realized PnL store zero amounts in USD."""
+        report = _positions_report().drop(columns=["commissions", "realized_pnl"])
+
+        rows, _ = positions_to_trade_rows(7, report)
+
+        first = dict(zip(TRADE_INSERT_COLUMNS, rows[0]))
+        assert first["commission_amount"] == Decimal("0.00")
+        assert first["commission_currency"] == "USD"
+        assert first["profit_loss"] == Decimal("0.00")
+
+    def test_rejects_invalid_columns_with_position_ids(self):
+        """Every invalid column is reported once, naming the offending positions."""
+        report = _positions_report(entry=["BUY", "HOLD", "BUY"], peak_qty=["0", "1", "1"])
+
+        with pytest.raises(ValidationError) as exc_info:
+            positions_to_trade_rows(7, report)
+
+        message = str(exc_info.value)
+        assert "quantity must be positive (positions: P-1)" in message
+        assert "order side must be BUY or SELL (positions: P-2)" in message
+
+    @pytest.mark.asyncio
+    async def test_save_trades_bulk_inserts_rows(self, persistence_service, mock_repository):
+        """save_trades_from_positions hands all converted rows to one bulk insert."""
+        count = await persistence_service.save_trades_from_positions(
+            backtest_run_id=7, positions_report_df=_positions_report()
+        )
+
+        assert count == 2
+        mock_repository.bulk_insert_trades.assert_awaited_once()
+        (rows,) = mock_repository.bulk_insert_trades.call_args.args
+        assert [row[2] for row in rows] == ["P-1", "P-2"]
+
+        mock_repository.save_trade_analytics.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_save_trades_stores_analytics(self, persistence_service, mock_repository):
+        """With the initial capital, analytics of the inserted rows are stored."""
+        await persistence_service.save_trades_from_positions(
+            backtest_run_id=7,
+            positions_report_df=_positions_report(),
+            initial_capital=Decimal("100000.00"),
+        )
+
+        mock_repository.save_trade_analytics.assert_awaited_once()
+        run_id, statistics, drawdowns, version = mock_repository.save_trade_analytics.call_args.args
+        assert run_id == 7
+        assert version == TRADE_ANALYTICS_VERSION
+        assert statistics.winning_trades == 2
+        assert statistics.net_profit == Decimal("642.65")
+        assert drawdowns.total_drawdown_periods == 0
+
+    @pytest.mark.asyncio
+    async def test_save_trades_wraps_invalid_report(self, persistence_service, mock_repository):
+        """Invalid reports raise ValidationError without inserting anything."""
+        report = _positions_report(avg_px_open=[0.0, 200.0, 180.0])
+
+        with pytest.raises(ValidationError, match="entry price must be positive"):
+            await persistence_service.save_trades_from_positions(
+                backtest_run_id=7, positions_report_df=report
+            )
+
+        mock_repository.bulk_insert_trades.assert_not_awaited()
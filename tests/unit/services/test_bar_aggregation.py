@@ -0,0 +1,151 @@
+"""Tests for derived bar aggregation and its catalog cache."""
+
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+from nautilus_trader.model.data import Bar, BarType
+
+from src.services.bar_aggregation import (
+    resample_bar_arrays,
+    select_source_spec,
+)
+from src.services.data_catalog import DataCatalogService
+from src.services.exceptions import DataNotFoundError
+from src.services.shared_bars import BarArrays
+
+BASE_NS = 1_704_067_200_000_000_000  # 2024-01-01 00:00 UTC (a Monday)
+MINUTE_NS = 60_000_000_000
+DAY_NS = 86_400_000_000_000
+
+
+def _bars(bar_type: str, count: int, step_ns: int, start_ns: int = BASE_NS) -> list[Bar]:
+    """Bars with close = 100 + index, spaced step_ns apart."""
+    close = 100.0 + np.arange(count, dtype=np.float64)
+    ts = (start_ns + step_ns * np.arange(count)).astype(np.uint64)
+    return Bar.from_raw_arrays_to_list(
+        BarType.from_str(bar_type),
+        2,
+        0,
+        close - 0.5,
+        close + 1.0,
+        close - 1.0,
+        close,
+        np.full(count, 10.0),
+        ts,
+        ts,
+    )
+
+
+class TestSelectSourceSpec:
+    """Tests for select_source_spec function."""
+
+    def test_prefers_finest_divisor(self):
+        """The finest stored interval that divides the target is chosen."""
+        specs = ["1-DAY-LAST", "1-MINUTE-LAST", "1-HOUR-LAST"]
+
+        assert select_source_spec(specs, "4-HOUR-LAST") == "1-MINUTE-LAST"
+        assert select_source_spec(["1-DAY-LAST"], "1-WEEK-LAST") == "1-DAY-LAST"
+
+    def test_rejects_incompatible_sources(self):
+        """Coarser, non-dividing or different price type specs are not used."""
+        assert select_source_spec(["1-DAY-LAST"], "1-HOUR-LAST") is None
+        assert select_source_spec(["7-MINUTE-LAST"], "5-MINUTE-LAST") is None
+        assert select_source_spec(["1-MINUTE-MID"], "5-MINUTE-LAST") is None
+        assert select_source_spec(["1-MINUTE-LAST"], "1-MINUTE-LAST") is None
+
+
+class TestResampleBarArrays:
+    """Tests for resample_bar_arrays function."""
+
+    def test_minutes_to_five_minutes(self):
+        """Each bucket keeps first open, last close, extremes and summed volume."""
+        source = BarArrays.from_bars(_bars("AAPL.NASDAQ-1-MINUTE-LAST-EXTERNAL", 12, MINUTE_NS))
+
+        result = resample_bar_arrays(source, "AAPL.NASDAQ-5-MINUTE-LAST-INTERNAL")
+
+        assert len(result) == 3
+        assert result.ts_event.tolist() == [BASE_NS + i * 5 * MINUTE_NS for i in range(3)]
+        assert result.open.tolist() == [99.5, 104.5, 109.5]
+        assert result.close.tolist() == [104.0, 109.0, 111.0]
+        assert result.high.tolist() == [105.0, 110.0, 112.0]
+        assert result.low.tolist() == [99.0, 104.0, 109.0]
+        assert result.volume.tolist() == [50.0, 50.0, 20.0]
+
+    def test_days_to_monday_aligned_weeks(self):
+        """Weekly buckets start on Monday and skip empty weeks."""
+        # Wednesday 2024-01-03 through Tuesday 2024-01-16, 14 days
+        source = BarArrays.from_bars(
+            _bars("AAPL.NASDAQ-1-DAY-LAST-EXTERNAL", 14, DAY_NS, BASE_NS + 2 * DAY_NS)
+        )
+
+        result = resample_bar_arrays(source, "AAPL.NASDAQ-1-WEEK-LAST-INTERNAL")
+
+        monday = BASE_NS
+        assert result.ts_event.tolist() == [monday, monday + 7 * DAY_NS, monday + 14 * DAY_NS]
+        assert result.close.tolist() == [104.0, 111.0, 113.0]
+        assert result.to_bars()[0].bar_type == BarType.from_str("AAPL.NASDAQ-1-WEEK-LAST-INTERNAL")
+
+    def test_rejects_non_time_target(self):
+        """Tick and volume bars cannot be derived from time buckets."""
+        source = BarArrays.from_bars(_bars("AAPL.NASDAQ-1-MINUTE-LAST-EXTERNAL", 3, MINUTE_NS))
+
+        with pytest.raises(ValueError):
+            resample_bar_arrays(source, "AAPL.NASDAQ-100-TICK-LAST-INTERNAL")
+
+
+class TestDerivedBarCache:
+    """Tests for derived bars cached in a real catalog."""
+
+    @pytest.fixture
+    def service(self, tmp_path) -> DataCatalogService:
+        """Catalog holding two days of AAPL minute bars."""
+        service = DataCatalogService(catalog_path=tmp_path)
+        service.write_bars(_bars("AAPL.NASDAQ-1-MINUTE-LAST-EXTERNAL", 2 * 1_440, MINUTE_NS))
+        return service
+
+    def test_builds_once_and_reuses(self, service: DataCatalogService):
+        """The first query writes an INTERNAL bar type with provenance; later ones reuse it."""
+        hourly = service.query_derived_bar_arrays("AAPL.NASDAQ", "1-HOUR-LAST")
+
+        assert len(hourly) == 48
+        assert hourly.volume[0] == 600.0
+        provenance = service.derived_bars.load_provenance("AAPL.NASDAQ-1-HOUR-LAST-INTERNAL")
+        assert provenance.source_bar_type == "AAPL.NASDAQ-1-MINUTE-LAST-EXTERNAL"
+        assert provenance.source_bar_count == 2_880
+        assert provenance.bar_count == 48
+
+        built_at = provenance.created_at
+        service.query_derived_bar_arrays("AAPL.NASDAQ", "1-HOUR-LAST")
+        reloaded = service.derived_bars.load_provenance("AAPL.NASDAQ-1-HOUR-LAST-INTERNAL")
+        assert reloaded.created_at == built_at
+
+    def test_range_query_and_availability_unaffected(self, service: DataCatalogService):
+        """Derived bars honour the range and never appear as stored bar types."""
+        day_two = datetime(2024, 1, 2, tzinfo=timezone.utc)
+
+        daily = service.query_derived_bar_arrays("AAPL.NASDAQ", "1-DAY-LAST", start=day_two)
+
+        assert len(daily) == 1
+        assert daily.close[0] == 100.0 + 2_879
+        service.refresh_availability(force=True)
+        assert service.list_bar_specs("AAPL.NASDAQ") == ["1-MINUTE-LAST"]
+
+    def test_source_write_invalidates(self, service: DataCatalogService):
+        """Writing new source bars drops derived bars so the next query rebuilds them."""
+        service.query_derived_bar_arrays("AAPL.NASDAQ", "1-DAY-LAST")
+
+        service.write_bars(
+            _bars("AAPL.NASDAQ-1-MINUTE-LAST-EXTERNAL", 1_440, MINUTE_NS, BASE_NS + 2 * DAY_NS)
+        )
+        assert service.derived_bars.load_provenance("AAPL.NASDAQ-1-DAY-LAST-INTERNAL") is None
+
+        daily = service.query_derived_bar_arrays("AAPL.NASDAQ", "1-DAY-LAST")
+        assert len(daily) == 3
+
+    def test_no_finer_source_raises(self, service: DataCatalogService):
+        """Targets that cannot be derived raise DataNotFoundError."""
+        with pytest.raises(DataNotFoundError):
+            service.query_derived_bar_arrays("AAPL.NASDAQ", "1-SECOND-LAST")
+        with pytest.raises(DataNotFoundError):
+            service.query_derived_bar_arrays("MSFT.NASDAQ", "1-HOUR-LAST")
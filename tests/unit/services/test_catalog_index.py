@@ -0,0 +1,240 @@
+"""Unit tests for the persistent catalog availability index."""
+
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from src.services.catalog_index import (
+    INDEX_FILENAME,
+    CatalogIndex,
+    file_timestamp_to_ns,
+    parse_bar_type_dir,
+)
+from src.services.data_catalog import DataCatalogService
+
+BAR_DIR = "AAPL.NASDAQ-1-MINUTE-LAST-EXTERNAL"
+
+
+def _write_parquet(directory: Path, filename: str, rows: int) -> Path:
+    """Write a minimal Parquet file with the given number of rows."""
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / filename
+    pq.write_table(pa.table({"ts_event": list(range(rows))}), path)
+    return path
+
+
+class TestParsing:
+    """Test suite for directory and filename parsing helpers."""
+
+    def test_parse_bar_type_dir_splits_instrument_and_spec(self):
+        """Directory name is split into instrument_id and bar_type_spec."""
+        assert parse_bar_type_dir(BAR_DIR) == ("AAPL.NASDAQ", "1-MINUTE-LAST")
+
+    def test_parse_bar_type_dir_rejects_non_external(self):
+        """Directories without the EXTERNAL suffix are ignored."""
+        assert parse_bar_type_dir("AAPL.NASDAQ-1-MINUTE-LAST-INTERNAL") is None
+
+    def test_file_timestamp_to_ns_keeps_nanoseconds(self):
+        """Nautilus filename timestamps convert with full nanosecond precision."""
+        result = file_timestamp_to_ns("2024-01-02T23-59-59-999999999Z")
+
+        expected = int(datetime(2024, 1, 2, 23, 59, 59, tzinfo=timezone.utc).timestamp())
+        assert result == expected * 1_000_000_000 + 999_999_999
+
+    def test_file_timestamp_to_ns_raises_on_garbage(self):
+        """Unparseable timestamps raise ValueError."""
+        with pytest.raises(ValueError):
+            file_timestamp_to_ns("not-a-timestamp")
+
+
+class TestCatalogIndex:
+    """Test suite for CatalogIndex sync, refresh and persistence."""
+
+    @pytest.fixture
+    def bar_dir(self, tmp_path):
+        """Bar type directory with two Parquet files."""
+        directory = tmp_path / "data" / "bar" / BAR_DIR
+        _write_parquet(
+            directory,
+            "2024-01-01T00-00-00-000000000Z_2024-01-31T00-00-00-000000000Z.parquet",
+            rows=10,
+        )
+        _write_parquet(
+            directory,
+            "2024-02-01T00-00-00-000000000Z_2024-02-29T00-00-00-000000000Z.parquet",
+            rows=5,
+        )
+        return directory
+
+    def test_sync_indexes_files_with_footer_row_counts(self, tmp_path, bar_dir):
+        """Sync records per-file ranges and real row counts."""
+        index = CatalogIndex(tmp_path)
+
+        changed = index.sync()
+
+        assert changed is True
+        entry = index.entries[BAR_DIR]
+        assert entry.instrument_id == "AAPL.NASDAQ"
+        assert entry.bar_type_spec == "1-MINUTE-LAST"
+        assert [f.row_count for f in entry.files] == [10, 5]
+        assert entry.total_rows == 15
+        assert entry.start_ns < entry.end_ns
+
+    def test_sync_skips_unchanged_directories(self, tmp_path, bar_dir):
+        """Directories whose mtime is unchanged are not rescanned."""
+        index = CatalogIndex(tmp_path)
+        index.sync()
+
+        with patch.object(index, "refresh") as mock_refresh:
+            changed = index.sync()
+
+        assert changed is False
+        mock_refresh.assert_not_called()
+
+    def test_sync_drops_removed_directories(self, tmp_path, bar_dir):
+        """Entries for deleted bar type directories are removed."""
+        index = CatalogIndex(tmp_path)
+        index.sync()
+
+        for file in bar_dir.iterdir():
+            file.unlink()
+        bar_dir.rmdir()
+
+        assert index.sync() is True
+        assert index.entries == {}
+
+    def test_refresh_only_reads_new_files(self, tmp_path, bar_dir):
+        """Refresh reuses entries for files whose size and mtime are unchanged."""
+        index = CatalogIndex(tmp_path)
+        index.sync()
+        _write_parquet(
+            bar_dir,
+            "2024-03-01T00-00-00-000000000Z_2024-03-31T00-00-00-000000000Z.parquet",
+            rows=3,
+        )
+
+        with patch(
+            "src.services.catalog_index.pq.read_metadata", wraps=pq.read_metadata
+        ) as mock_read:
+            entry = index.refresh(BAR_DIR)
+
+        assert entry is not None
+        assert len(entry.files) == 3
+        assert entry.total_rows == 18
+        mock_read.assert_called_once()
+
+    def test_save_and_load_round_trip(self, tmp_path, bar_dir):
+        """Persisted index is restored by a fresh instance."""
+        index = CatalogIndex(tmp_path)
+        index.sync()
+        index.save()
+
+        restored = CatalogIndex(tmp_path)
+        restored.load()
+
+        assert restored.entries == index.entries
+
+    def test_load_ignores_index_with_other_version(self, tmp_path):
+        """Index files from another format version are discarded."""
+        (tmp_path / INDEX_FILENAME).write_text(json.dumps({"version": 0, "entries": {}}))
+
+        index = CatalogIndex(tmp_path)
+        index.load()
+
+        assert index.entries == {}
+
+    def test_load_ignores_corrupt_index(self, tmp_path):
+        """Unreadable index files are treated as empty."""
+        (tmp_path / INDEX_FILENAME).write_text("{not json")
+
+        index = CatalogIndex(tmp_path)
+        index.load()
+
+        assert index.entries == {}
+
+
+class TestDataCatalogServiceIndex:
+    """Test suite for DataCatalogService integration with the index."""
+
+    @pytest.fixture
+    def bar_dir(self, tmp_path):
+        """Bar type directory with one Parquet file."""
+        directory = tmp_path / "data" / "bar" / BAR_DIR
+        _write_parquet(
+            directory,
+            "2024-01-01T00-00-00-000000000Z_2024-01-31T00-00-00-000000000Z.parquet",
+            rows=7,
+        )
+        return directory
+
+    def _service(self, tmp_path) -> DataCatalogService:
+        with patch("src.services.data_catalog.ParquetDataCatalog", return_value=MagicMock()):
+            return DataCatalogService(catalog_path=tmp_path)
+
+    def test_startup_builds_cache_and_persists_index(self, tmp_path, bar_dir):
+        """Service startup populates availability and writes the index file."""
+        service = self._service(tmp_path)
+
+        availability = service.get_availability("AAPL.NASDAQ", "1-MINUTE-LAST")
+        assert availability is not None
+        assert availability.total_rows == 7
+        assert availability.start_date == datetime(2024, 1, 1, tzinfo=timezone.utc)
+        assert (tmp_path / INDEX_FILENAME).exists()
+
+    def test_second_startup_does_not_rescan(self, tmp_path, bar_dir):
+        """A valid persisted index avoids rescanning bar type directories."""
+        self._service(tmp_path)
+
+        with patch.object(CatalogIndex, "refresh") as mock_refresh:
+            service = self._service(tmp_path)
+
+        mock_refresh.assert_not_called()
+        assert service.get_availability("AAPL.NASDAQ", "1-MINUTE-LAST") is not None
+
+    def test_refresh_availability_updates_single_bar_type(self, tmp_path, bar_dir):
+        """Refreshing a bar type picks up newly written files."""
+        service = self._service(tmp_path)
+        _write_parquet(
+            bar_dir,
+            "2024-02-01T00-00-00-000000000Z_2024-02-29T00-00-00-000000000Z.parquet",
+            rows=4,
+        )
+
+        service._refresh_availability(BAR_DIR)
+
+        availability = service.get_availability("AAPL.NASDAQ", "1-MINUTE-LAST")
+        assert availability is not None
+        assert availability.file_count == 2
+        assert availability.total_rows == 11
+        assert availability.end_date == datetime(2024, 2, 29, tzinfo=timezone.utc)
+
+    def test_refresh_availability_detects_external_changes(self, tmp_path, bar_dir):
+        """Polling refresh picks up files written by another process."""
+        service = self._service(tmp_path)
+        assert service.refresh_availability() is False
+
+        other_dir = tmp_path / "data" / "bar" / "MSFT.NASDAQ-1-DAY-LAST-EXTERNAL"
+        _write_parquet(
+            other_dir,
+            "2024-01-01T00-00-00-000000000Z_2024-01-31T00-00-00-000000000Z.parquet",
+            rows=2,
+        )
+
+        assert service.refresh_availability() is True
+        assert service.get_availability("MSFT.NASDAQ", "1-DAY-LAST") is not None
+
+    def test_forced_refresh_rescans_everything(self, tmp_path, bar_dir):
+        """Forced refresh rescans all directories even if unchanged."""
+        service = self._service(tmp_path)
+
+        with patch.object(CatalogIndex, "refresh", wraps=service._index.refresh) as mock_refresh:
+            changed = service.refresh_availability(force=True)
+
+        assert changed is True
+        mock_refresh.assert_called_once_with(BAR_DIR)
+        assert service.get_availability("AAPL.NASDAQ", "1-MINUTE-LAST") is not None
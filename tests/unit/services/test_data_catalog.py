@@ -5,7 +5,9 @@ from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
+import numpy as np
 import pytest
+from nautilus_trader.model.data import Bar, BarType
 
 from src.models.catalog_metadata import CatalogAvailability
 from src.services.data_catalog import DataCatalogService
@@ -13,6 +15,8 @@ from src.services.exceptions import (
     CatalogError,
 )
 
+DAY_NS = 86_400_000_000_000
+
 
 class TestQueryBarsBarTypeFiltering:
     """Test suite for bar type filtering in query_bars.
@@ -490,25 +494,30 @@ class TestWriteBars:
             service.catalog = mock_catalog
             return service
 
-    def test_write_bars_writes_to_catalog_and_rebuilds_cache(
+    def test_write_bars_writes_to_catalog_and_refreshes_written_bar_type(
         self, data_catalog_service, mock_catalog
     ):
-        """Write bars writes to catalog and rebuilds cache."""
+        """Write bars writes to catalog and refreshes only the written bar type."""
         # Arrange
         mock_bar = Mock()
         mock_bar_type = Mock()
         mock_bar_type.instrument_id = "AAPL.NASDAQ"
+        mock_bar_type.__str__ = Mock(return_value="AAPL.NASDAQ-1-MINUTE-LAST-EXTERNAL")
         mock_bar.bar_type = mock_bar_type
 
         bars = [mock_bar]
 
-        with patch.object(data_catalog_service, "_rebuild_availability_cache") as mock_rebuild:
+        with (
+            patch.object(data_catalog_service, "_rebuild_availability_cache") as mock_rebuild,
+            patch.object(data_catalog_service, "_refresh_availability") as mock_refresh,
+        ):
             # Act
             data_catalog_service.write_bars(bars, correlation_id="test-123")
 
             # Assert
             mock_catalog.write_data.assert_called_once_with(bars, skip_disjoint_check=True)
-            mock_rebuild.assert_called_once()
+            mock_refresh.assert_called_once_with("AAPL.NASDAQ-1-MINUTE-LAST-EXTERNAL")
+            mock_rebuild.assert_not_called()
 
     def test_write_bars_does_nothing_with_empty_list(self, data_catalog_service, mock_catalog):
         """Write bars does nothing when called with empty list."""
@@ -795,3 +804,164 @@ class TestDetectGaps:
 
         # Assert
         assert len(gaps) == 0
+
+    def test_detect_gaps_reports_holes_between_catalog_files(self, data_catalog_service):
+        """Interior ranges missing between files are reported, market closures are not."""
+        # Arrange
+        jan = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        feb = datetime(2024, 2, 1, tzinfo=timezone.utc)
+        june = datetime(2024, 6, 1, tzinfo=timezone.utc)
+        dec = datetime(2024, 12, 31, tzinfo=timezone.utc)
+        availability = CatalogAvailability(
+            instrument_id="AAPL.NASDAQ",
+            bar_type_spec="1-MINUTE-LAST",
+            start_date=jan,
+            end_date=dec,
+            file_count=3,
+            total_rows=10000,
+            last_updated=datetime.now(),
+            intervals=[
+                (jan, datetime(2024, 1, 26, 21, tzinfo=timezone.utc)),  # Friday close
+                (datetime(2024, 1, 29, 14, tzinfo=timezone.utc), feb),  # Monday open
+                (june, dec),
+            ],
+        )
+        data_catalog_service.availability_cache["AAPL.NASDAQ_1-MINUTE-LAST"] = availability
+
+        # Act
+        gaps = data_catalog_service.detect_gaps("AAPL.NASDAQ", "1-MINUTE-LAST", jan, dec)
+
+        # Assert
+        assert gaps == [{"start": feb, "end": june}]
+
+
+def _daily_bars(first_day: datetime, count: int) -> list[Bar]:
+    """Daily AAPL bars stamped at midnight UTC."""
+    prices = 100.0 + np.arange(count, dtype=np.float64)
+    start_ns = int(first_day.timestamp() * 1e9)
+    ts = np.uint64(start_ns) + np.arange(count, dtype=np.uint64) * np.uint64(DAY_NS)
+    return Bar.from_raw_arrays_to_list(
+        BarType.from_str("AAPL.NASDAQ-1-DAY-LAST-EXTERNAL"),
+        2,
+        0,
+        prices,
+        prices + 1.0,
+        prices - 1.0,
+        prices,
+        np.full(count, 1000.0),
+        ts,
+        ts,
+    )
+
+
+class TestFetchOrLoadPartialCoverage:
+    """fetch_or_load fetches only the ranges missing from the catalog."""
+
+    @pytest.fixture
+    def service(self, tmp_path):
+        """Real catalog holding Jan 1-10 and Jan 25-31, 2024."""
+        service = DataCatalogService(catalog_path=tmp_path)
+        service.catalog.write_data(_daily_bars(datetime(2024, 1, 1, tzinfo=timezone.utc), 10))
+        service.catalog.write_data(_daily_bars(datetime(2024, 1, 25, tzinfo=timezone.utc), 7))
+        service.refresh_availability(force=True)
+        return service
+
+    async def test_fetches_only_missing_ranges_and_writes_new_bars(self, service):
+        """Holes and the trailing range are fetched; covered bars are not rewritten."""
+        # Arrange
+        requested: list[tuple[datetime, datetime]] = []
+
+        async def fake_fetch(instrument_id, start, end, bar_type_spec, **kwargs):
+            requested.append((start, end))
+            first = datetime(start.year, start.month, start.day, tzinfo=timezone.utc)
+            days = (end.date() - start.date()).days + 1
+            return _daily_bars(first, days), None
+
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        end = datetime(2024, 2, 5, tzinfo=timezone.utc)
+
+        # Act
+        with (
+            patch.object(service, "_is_ibkr_available", AsyncMock(return_value=True)),
+            patch.object(service, "_fetch_from_ibkr_with_retry", side_effect=fake_fetch),
+        ):
+            bars = await service.fetch_or_load("AAPL.NASDAQ", start, end, "1-DAY-LAST")
+
+        # Assert
+        assert [(s.date().isoformat(), e.date().isoformat()) for s, e in requested] == [
+            ("2024-01-10", "2024-01-25"),
+            ("2024-01-31", "2024-02-05"),
+        ]
+        ts = [bar.ts_init for bar in bars]
+        assert len(bars) == 36
+        assert ts == sorted(set(ts))
+
+        availability = service.get_availability("AAPL.NASDAQ", "1-DAY-LAST")
+        assert availability.covers_range(start, end)
+        assert availability.total_rows == 36
+
+    async def test_fully_covered_range_skips_fetch(self, service):
+        """A range inside one catalog file is served from the catalog only."""
+        with patch.object(service, "_fetch_and_persist_from_ibkr") as fetch:
+            bars = await service.fetch_or_load(
+                "AAPL.NASDAQ",
+                datetime(2024, 1, 2, tzinfo=timezone.utc),
+                datetime(2024, 1, 8, tzinfo=timezone.utc),
+                "1-DAY-LAST",
+            )
+
+        fetch.assert_not_called()
+        assert len(bars) == 7
+
+
+class TestBarSourceDigest:
+    """bar_source_digest identifies catalog bars from their file stats."""
+
+    @pytest.fixture
+    def service(self, tmp_path):
+        """Real catalog holding Jan 1-10 and Jan 11-20, 2024."""
+        service = DataCatalogService(catalog_path=tmp_path)
+        service.catalog.write_data(_daily_bars(datetime(2024, 1, 1, tzinfo=timezone.utc), 10))
+        service.catalog.write_data(_daily_bars(datetime(2024, 1, 11, tzinfo=timezone.utc), 10))
+        service.refresh_availability(force=True)
+        return service
+
+    def test_digest_follows_range_and_files(self, service):
+        """Equal ranges match; other ranges and rewritten files do not."""
+        start = datetime(2024, 1, 2, tzinfo=timezone.utc)
+        end = datetime(2024, 1, 8, tzinfo=timezone.utc)
+
+        digest = service.bar_source_digest("AAPL.NASDAQ", "1-DAY-LAST", start, end)
+
+        assert digest == service.bar_source_digest("AAPL.NASDAQ", "1-DAY-LAST", start, end)
+        assert digest != service.bar_source_digest(
+            "AAPL.NASDAQ", "1-DAY-LAST", start, datetime(2024, 1, 9, tzinfo=timezone.utc)
+        )
+
+        # Rewriting the file in place leaves the directory (and index) unchanged
+        file = next(service.catalog_path.glob("data/bar/*/2024-01-01*.parquet"))
+        stat = file.stat()
+        os.utime(file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert digest != service.bar_source_digest("AAPL.NASDAQ", "1-DAY-LAST", start, end)
+
+    def test_uncovered_range_has_no_digest(self, service):
+        """Bars beyond the catalog did not come from it alone, so there is no digest."""
+        assert (
+            service.bar_source_digest(
+                "AAPL.NASDAQ",
+                "1-DAY-LAST",
+                datetime(2024, 1, 5, tzinfo=timezone.utc),
+                datetime(2024, 3, 1, tzinfo=timezone.utc),
+            )
+            is None
+        )
+        assert (
+            service.bar_source_digest(
+                "MSFT.NASDAQ",
+                "1-DAY-LAST",
+                datetime(2024, 1, 5, tzinfo=timezone.utc),
+                datetime(2024, 1, 6, tzinfo=timezone.utc),
+            )
+            is None
+        )
@@ -0,0 +1,248 @@
+"""Unit tests for the chunked IBKR downloader."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pytest
+from nautilus_trader.model.data import Bar, BarType
+
+from src.services.data_catalog import DataCatalogService
+from src.services.exceptions import DataNotFoundError
+from src.services.ibkr_download import (
+    DownloadCheckpoint,
+    IBKRDownloader,
+    ibkr_chunk_duration,
+    plan_download_chunks,
+)
+
+BAR_TYPE = "AAPL.NASDAQ-1-HOUR-LAST-EXTERNAL"
+HOUR_NS = 3_600_000_000_000
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+END = datetime(2024, 3, 31, 23, tzinfo=timezone.utc)
+
+
+def _hourly_bars(start: datetime, end: datetime) -> list[Bar]:
+    """Hourly AAPL bars from start to end (inclusive), priced by the hour."""
+    count = int((end - start) / timedelta(hours=1)) + 1
+    hours = int(start.timestamp()) // 3600 + np.arange(count, dtype=np.uint64)
+    prices = 100.0 + (hours % 50).astype(np.float64)
+    ts = hours * np.uint64(HOUR_NS)
+    return Bar.from_raw_arrays_to_list(
+        BarType.from_str(BAR_TYPE),
+        2,
+        0,
+        prices,
+        prices + 1.0,
+        prices - 1.0,
+        prices,
+        np.full(count, 1000.0),
+        ts,
+        ts,
+    )
+
+
+def _mock_client(fail_windows: int = 0) -> MagicMock:
+    """IBKR client stub serving hourly bars for any window."""
+    client = MagicMock()
+    client.resolve_instrument = AsyncMock(return_value=(None, "AAPL.NASDAQ"))
+    state = {"active": 0, "peak": 0, "failures": fail_windows}
+
+    async def fetch_bar_window(resolved_id, start, end, bar_type_spec):
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(0.01)
+        state["active"] -= 1
+        if state["failures"]:
+            state["failures"] -= 1
+            raise TimeoutError("request timed out")
+        first = start.replace(minute=0, second=0, microsecond=0)
+        if first < start:
+            first += timedelta(hours=1)
+        return _hourly_bars(first, end)
+
+    client.fetch_bar_window = AsyncMock(side_effect=fetch_bar_window)
+    client.state = state
+    return client
+
+
+class TestPlanDownloadChunks:
+    """Test suite for download planning."""
+
+    @pytest.mark.parametrize(
+        "spec,expected",
+        [
+            ("1-MINUTE-LAST", timedelta(days=1)),
+            ("5-MINUTE-LAST", timedelta(weeks=1)),
+            ("1-HOUR-LAST", timedelta(days=30)),
+            ("1-DAY-LAST", timedelta(days=365)),
+        ],
+    )
+    def test_chunk_duration_follows_bar_size(self, spec, expected):
+        """Finer bars are requested in shorter windows."""
+        assert ibkr_chunk_duration(spec) == expected
+
+    def test_chunks_cover_range_without_overlap(self):
+        """Windows are contiguous, clipped to the range and day-aligned."""
+        chunks = plan_download_chunks(
+            datetime(2024, 1, 1, 14, 30, tzinfo=timezone.utc),
+            datetime(2024, 1, 5, 21, tzinfo=timezone.utc),
+            "1-MINUTE-LAST",
+        )
+
+        assert len(chunks) == 5
+        assert chunks[0].start == datetime(2024, 1, 1, 14, 30, tzinfo=timezone.utc)
+        assert chunks[-1].end == datetime(2024, 1, 5, 21, tzinfo=timezone.utc)
+        assert chunks[1].start == datetime(2024, 1, 2, tzinfo=timezone.utc)
+        for previous, current in zip(chunks, chunks[1:]):
+            assert current.start_ns == previous.end_ns + 1_000
+
+    def test_small_range_is_one_chunk(self):
+        """A range inside one window is not split."""
+        chunks = plan_download_chunks(START, START + timedelta(hours=6), "1-MINUTE-LAST")
+
+        assert len(chunks) == 1
+
+    def test_non_time_bars_are_rejected(self):
+        """Tick and volume bars have no fixed request window."""
+        with pytest.raises(ValueError):
+            plan_download_chunks(START, END, "100-TICK-LAST")
+
+
+class TestIBKRDownloader:
+    """Test suite for IBKRDownloader against a real catalog."""
+
+    @pytest.fixture
+    def catalog_service(self, tmp_path):
+        """Empty catalog in a temp directory."""
+        return DataCatalogService(catalog_path=tmp_path)
+
+    async def test_downloads_chunks_concurrently_and_writes_catalog(self, catalog_service):
+        """All windows are fetched within the concurrency limit and persisted."""
+        # Arrange
+        client = _mock_client()
+        updates = []
+        downloader = IBKRDownloader(
+            client,
+            catalog_service,
+            max_concurrency=2,
+            on_progress=lambda progress: updates.append(progress.completed_chunks),
+        )
+
+        # Act
+        bars, _, progress = await downloader.download("AAPL.NASDAQ", START, END, "1-HOUR-LAST")
+
+        # Assert
+        expected = _hourly_bars(START, END)
+        assert bars == expected
+        assert client.fetch_bar_window.call_count == progress.total_chunks == 4
+        assert client.state["peak"] == 2
+        client.resolve_instrument.assert_awaited_once()
+        assert sorted(updates) == [1, 2, 3, 4]
+        assert progress.percent_complete == 100.0
+        assert progress.bar_count == len(expected)
+
+        stored = catalog_service.query_bars("AAPL.NASDAQ", START, END, "1-HOUR-LAST")
+        assert len(stored) == len(expected)
+        assert not downloader.checkpoint_for("AAPL.NASDAQ", "1-HOUR-LAST").path.exists()
+
+    async def test_resume_skips_checkpointed_chunks(self, catalog_service):
+        """A checkpoint left by an interrupted run is honoured."""
+        # Arrange
+        downloader = IBKRDownloader(_mock_client(), catalog_service)
+        chunks = plan_download_chunks(START, END, "1-HOUR-LAST")
+        checkpoint = downloader.checkpoint_for("AAPL.NASDAQ", "1-HOUR-LAST")
+        checkpoint.mark_completed(chunks[0])
+        checkpoint.mark_completed(chunks[1])
+
+        # Act
+        _, _, progress = await downloader.download("AAPL.NASDAQ", START, END, "1-HOUR-LAST")
+
+        # Assert
+        assert downloader.client.fetch_bar_window.call_count == 2
+        assert progress.skipped_chunks == 2
+        assert progress.completed_chunks == 4
+
+    async def test_failed_chunk_keeps_completed_ones_checkpointed(self, catalog_service):
+        """A window failing after all retries aborts but leaves progress on disk."""
+        # Arrange
+        client = _mock_client()
+        real_fetch = client.fetch_bar_window.side_effect
+        chunks = plan_download_chunks(START, END, "1-HOUR-LAST")
+
+        async def fail_last(resolved_id, start, end, bar_type_spec):
+            if start == chunks[-1].start:
+                raise TimeoutError("request timed out")
+            return await real_fetch(resolved_id, start, end, bar_type_spec)
+
+        client.fetch_bar_window = AsyncMock(side_effect=fail_last)
+        downloader = IBKRDownloader(client, catalog_service, max_concurrency=1, max_retries=1)
+
+        # Act
+        with patch("src.services.ibkr_download.asyncio.sleep", AsyncMock()):
+            with pytest.raises(DataNotFoundError):
+                await downloader.download("AAPL.NASDAQ", START, END, "1-HOUR-LAST")
+
+        # Assert
+        checkpoint = DownloadCheckpoint(
+            downloader.checkpoint_for("AAPL.NASDAQ", "1-HOUR-LAST").path
+        )
+        assert [checkpoint.is_completed(chunk) for chunk in chunks] == [True, True, True, False]
+
+    async def test_transient_failures_are_retried(self, catalog_service):
+        """A window that times out once succeeds on retry."""
+        client = _mock_client(fail_windows=1)
+        downloader = IBKRDownloader(client, catalog_service, max_concurrency=1)
+
+        with patch("src.services.ibkr_download.asyncio.sleep", AsyncMock()):
+            bars, _, progress = await downloader.download("AAPL.NASDAQ", START, END, "1-HOUR-LAST")
+
+        assert client.fetch_bar_window.call_count == progress.total_chunks + 1
+        assert len(bars) == len(_hourly_bars(START, END))
+
+    async def test_empty_window_completes_without_retries(self, catalog_service):
+        """A window without data (e.g. a market closure) is checkpointed, not retried."""
+        # Arrange
+        client = _mock_client()
+        real_fetch = client.fetch_bar_window.side_effect
+        chunks = plan_download_chunks(START, END, "1-HOUR-LAST")
+        empty = chunks[1]
+
+        async def no_data_in_middle(resolved_id, start, end, bar_type_spec):
+            if start == empty.start:
+                raise DataNotFoundError(resolved_id, start, end)
+            if start == chunks[2].start:
+                return []
+            return await real_fetch(resolved_id, start, end, bar_type_spec)
+
+        client.fetch_bar_window = AsyncMock(side_effect=no_data_in_middle)
+        downloader = IBKRDownloader(client, catalog_service, max_concurrency=1)
+
+        # Act
+        with patch("src.services.ibkr_download.asyncio.sleep", AsyncMock()):
+            bars, _, progress = await downloader.download("AAPL.NASDAQ", START, END, "1-HOUR-LAST")
+
+        # Assert
+        assert client.fetch_bar_window.call_count == progress.total_chunks == 4
+        assert progress.completed_chunks == 4
+        expected = _hourly_bars(chunks[0].start, chunks[0].end) + _hourly_bars(
+            chunks[3].start, chunks[3].end
+        )
+        assert bars == expected
+        assert not downloader.checkpoint_for("AAPL.NASDAQ", "1-HOUR-LAST").path.exists()
+
+    async def test_range_without_any_data_is_not_found(self, tmp_path):
+        """fetch_or_load fails when every window of an uncached range is empty."""
+        # Arrange
+        client = _mock_client()
+        client.is_connected = True
+        client.fetch_bar_window = AsyncMock(return_value=[])
+        catalog_service = DataCatalogService(catalog_path=tmp_path, ibkr_client=client)
+
+        # Act / Assert
+        with pytest.raises(DataNotFoundError):
+            await catalog_service.fetch_or_load("AAPL.NASDAQ", START, END, "1-HOUR-LAST")
+        assert client.fetch_bar_window.call_count == len(
+            plan_download_chunks(START, END, "1-HOUR-LAST")
+        )
@@ -0,0 +1,171 @@
+"""Tests for backtest indicator series computation and caching."""
+
+from datetime import date, datetime, timezone
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from src.services.indicator_series import (
+    IndicatorSeriesCache,
+    compute_indicator_series,
+    indicator_cache_key,
+    indicator_config,
+)
+from src.services.shared_bars import BarArrays
+
+SMA_SNAPSHOT = {
+    "strategy_path": "src.core.strategies.sma_crossover:SMACrossover",
+    "config": {"fast_period": 3, "slow_period": 5},
+}
+DAY_NS = 86_400_000_000_000
+
+
+def _daily_bars(count: int) -> BarArrays:
+    """Daily SPY bars from 2024-01-01 with close = 100 + index."""
+    close = 100.0 + np.arange(count, dtype=np.float64)
+    ts = (1_704_067_200_000_000_000 + DAY_NS * np.arange(count)).astype(np.uint64)
+    return BarArrays(
+        bar_type="SPY.ARCA-1-DAY-LAST-EXTERNAL",
+        price_precision=2,
+        size_precision=0,
+        open=close,
+        high=close + 1.0,
+        low=close - 1.0,
+        close=close,
+        volume=np.full(count, 1_000.0),
+        ts_event=ts,
+        ts_init=ts,
+    )
+
+
+def _catalog(arrays: BarArrays, total_rows: int = 30) -> MagicMock:
+    """Mock catalog serving bars with a fixed availability."""
+    catalog = MagicMock()
+    catalog.get_availability.return_value = MagicMock(
+        start_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        end_date=datetime(2024, 1, 30, tzinfo=timezone.utc),
+        file_count=1,
+        total_rows=total_rows,
+    )
+    catalog.query_bar_arrays.return_value = arrays
+    return catalog
+
+
+class TestIndicatorConfig:
+    """Tests for indicator_config function."""
+
+    def test_resolves_strategy_defaults(self):
+        """Missing parameters fall back to the strategy defaults."""
+        assert indicator_config({"strategy_path": "x.bollinger_reversal:Strategy"}) == {
+            "kind": "bollinger",
+            "bb_period": 20,
+            "bb_std": 2.0,
+            "weekly_ma_period": 20,
+        }
+        assert indicator_config(SMA_SNAPSHOT) == {"kind": "sma", "fast_period": 3, "slow_period": 5}
+
+    def test_unknown_strategy_has_no_overlays(self):
+        """Strategies without chart overlays return None."""
+        assert indicator_config({"strategy_path": "x.unknown:Strategy"}) is None
+        assert indicator_config({}) is None
+
+
+class TestComputeIndicatorSeries:
+    """Tests for compute_indicator_series function."""
+
+    def test_sma_values(self):
+        """SMA points start once the period is filled and average the last closes."""
+        series = compute_indicator_series(_daily_bars(10), indicator_config(SMA_SNAPSHOT))
+
+        assert len(series["sma_fast"]) == 8
+        assert series["sma_fast"][0] == ("2024-01-03", 101.0)
+        assert series["sma_slow"][-1] == ("2024-01-10", 107.0)
+
+
+class TestIndicatorSeriesCache:
+    """Tests for IndicatorSeriesCache class."""
+
+    def test_computes_once_then_serves_from_memory_and_disk(self, tmp_path):
+        """A miss computes and writes a sidecar; other processes read it back."""
+        catalog = _catalog(_daily_bars(10))
+        run_id = uuid4()
+        cache = IndicatorSeriesCache(tmp_path)
+
+        first = cache.get_or_compute(
+            catalog, run_id, "SPY.ARCA", date(2024, 1, 1), date(2024, 1, 10), SMA_SNAPSHOT
+        )
+        second = cache.get_or_compute(
+            catalog, run_id, "SPY.ARCA", date(2024, 1, 1), date(2024, 1, 10), SMA_SNAPSHOT
+        )
+        from_disk = IndicatorSeriesCache(tmp_path).get_or_compute(
+            catalog, run_id, "SPY.ARCA", date(2024, 1, 1), date(2024, 1, 10), SMA_SNAPSHOT
+        )
+
+        assert catalog.query_bar_arrays.call_count == 1
+        assert second is first
+        assert from_disk == first
+        assert len(list((tmp_path / str(run_id)).glob("*.parquet"))) == 1
+
+    def test_data_change_recomputes_and_replaces_sidecar(self, tmp_path):
+        """New catalog data changes the fingerprint and supersedes the old file."""
+        catalog = _catalog(_daily_bars(10))
+        run_id = uuid4()
+        cache = IndicatorSeriesCache(tmp_path)
+        args = (run_id, "SPY.ARCA", date(2024, 1, 1), date(2024, 1, 10), SMA_SNAPSHOT)
+
+        cache.get_or_compute(catalog, *args)
+        catalog.get_availability.return_value.total_rows = 31
+        cache.get_or_compute(catalog, *args)
+
+        assert catalog.query_bar_arrays.call_count == 2
+        assert len(list((tmp_path / str(run_id)).glob("*.parquet"))) == 1
+
+    def test_without_stored_bars_nothing_is_cached(self, tmp_path):
+        """No availability means no fingerprint, so results are not cached."""
+        catalog = _catalog(_daily_bars(0))
+        catalog.get_availability.return_value = None
+        cache = IndicatorSeriesCache(tmp_path)
+        args = (uuid4(), "SPY.ARCA", date(2024, 1, 1), date(2024, 1, 10), SMA_SNAPSHOT)
+
+        cache.get_or_compute(catalog, *args)
+        cache.get_or_compute(catalog, *args)
+
+        assert catalog.query_bar_arrays.call_count == 2
+        assert not tmp_path.exists() or not any(tmp_path.iterdir())
+
+    def test_lru_is_bounded(self, tmp_path):
+        """Entries beyond max_entries are evicted from memory but stay on disk."""
+        cache = IndicatorSeriesCache(tmp_path, max_entries=2)
+        run_ids = [uuid4() for _ in range(3)]
+        config = indicator_config(SMA_SNAPSHOT)
+        keys = [indicator_cache_key(run_id, config, "fp") for run_id in run_ids]
+
+        for run_id, key in zip(run_ids, keys):
+            cache.put(run_id, key, {"sma_fast": [("2024-01-03", 101.0)], "sma_slow": []})
+
+        assert list(cache._entries) == keys[1:]
+        assert cache.get(run_ids[0], keys[0]) == {
+            "sma_fast": [("2024-01-03", 101.0)],
+            "sma_slow": [],
+        }
+
+    def test_key_depends_on_run_config_and_data(self):
+        """Each part of the cache identity changes the key."""
+        run_id = uuid4()
+        config = indicator_config(SMA_SNAPSHOT)
+        key = indicator_cache_key(run_id, config, "fp")
+
+        assert key == indicator_cache_key(run_id, dict(config), "fp")
+        assert key != indicator_cache_key(uuid4(), config, "fp")
+        assert key != indicator_cache_key(run_id, {**config, "fast_period": 4}, "fp")
+        assert key != indicator_cache_key(run_id, config, "fp2")
+
+
+@pytest.mark.parametrize("count", [0, 2])
+def test_short_series_produce_empty_overlays(count: int):
+    """Too few bars to initialize the indicators yield empty series."""
+    series = compute_indicator_series(_daily_bars(count), indicator_config(SMA_SNAPSHOT))
+
+    assert series == {"sma_fast": [], "sma_slow": []}
@@ -1,7 +1,9 @@
 """Unit tests for Kraken client: pair mapper, converter, rate limiter, client."""
 
 import asyncio
-from datetime import datetime, timezone
+import threading
+import time
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from unittest.mock import MagicMock, patch
 
@@ -13,11 +15,12 @@ from nautilus_trader.model.objects import Price, Quantity
 
 from src.services.exceptions import DataNotFoundError, KrakenConnectionError
 from src.services.kraken_client import (
+    KrakenCandleBuffer,
     KrakenHistoricalClient,
     KrakenPairMapper,
     KrakenRateLimiter,
     build_currency_pair,
-    convert_ohlcv_to_bars,
+    plan_fetch_windows,
 )
 
 # ---------------------------------------------------------------------------
@@ -147,8 +150,15 @@ class TestKrakenPairMapperErrors:
 # ---------------------------------------------------------------------------
 
 
-class TestConvertOhlcvToBars:
-    """Test convert_ohlcv_to_bars: Kraken candles → Nautilus Bars."""
+def _to_bars(candles: list[dict], instrument_id: InstrumentId, bar_type_spec: str, **kwargs):
+    """Convert one page of candles through a KrakenCandleBuffer."""
+    buffer = KrakenCandleBuffer()
+    buffer.extend(candles)
+    return buffer.to_bars(instrument_id, bar_type_spec, **kwargs)
+
+
+class TestCandleConversion:
+    """Test KrakenCandleBuffer.to_bars: Kraken candles → Nautilus Bars."""
 
     def test_single_candle_conversion(self):
         candles = [
@@ -162,7 +172,7 @@ class TestConvertOhlcvToBars:
             }
         ]
         instrument_id = InstrumentId(Symbol("BTC/USD"), Venue("KRAKEN"))
-        bars = convert_ohlcv_to_bars(candles, instrument_id, "1-HOUR-LAST", price_precision=1)
+        bars = _to_bars(candles, instrument_id, "1-HOUR-LAST", price_precision=1)
         assert len(bars) == 1
         bar = bars[0]
         assert isinstance(bar, Bar)
@@ -179,7 +189,7 @@ class TestConvertOhlcvToBars:
             }
         ]
         instrument_id = InstrumentId(Symbol("BTC/USD"), Venue("KRAKEN"))
-        bars = convert_ohlcv_to_bars(candles, instrument_id, "1-HOUR-LAST", price_precision=1)
+        bars = _to_bars(candles, instrument_id, "1-HOUR-LAST", price_precision=1)
         bar = bars[0]
         expected_bar_type = "BTC/USD.KRAKEN-1-HOUR-LAST-EXTERNAL"
         assert str(bar.bar_type) == expected_bar_type
@@ -197,7 +207,7 @@ class TestConvertOhlcvToBars:
             }
         ]
         instrument_id = InstrumentId(Symbol("BTC/USD"), Venue("KRAKEN"))
-        bars = convert_ohlcv_to_bars(candles, instrument_id, "1-HOUR-LAST")
+        bars = _to_bars(candles, instrument_id, "1-HOUR-LAST")
         bar = bars[0]
         expected_ns = 1678888800000 * 1_000_000
         assert bar.ts_event == expected_ns
@@ -215,7 +225,7 @@ class TestConvertOhlcvToBars:
             }
         ]
         instrument_id = InstrumentId(Symbol("BTC/USD"), Venue("KRAKEN"))
-        bars = convert_ohlcv_to_bars(candles, instrument_id, "1-HOUR-LAST", price_precision=2)
+        bars = _to_bars(candles, instrument_id, "1-HOUR-LAST", price_precision=2)
         bar = bars[0]
         assert bar.open == Price.from_str("24885.4")
         assert bar.high == Price.from_str("25039.43")
@@ -234,13 +244,13 @@ class TestConvertOhlcvToBars:
             }
         ]
         instrument_id = InstrumentId(Symbol("BTC/USD"), Venue("KRAKEN"))
-        bars = convert_ohlcv_to_bars(candles, instrument_id, "1-HOUR-LAST")
+        bars = _to_bars(candles, instrument_id, "1-HOUR-LAST")
         bar = bars[0]
         assert bar.volume == Quantity.from_str("123.456")
 
     def test_empty_candles_returns_empty(self):
         instrument_id = InstrumentId(Symbol("BTC/USD"), Venue("KRAKEN"))
-        bars = convert_ohlcv_to_bars([], instrument_id, "1-HOUR-LAST")
+        bars = _to_bars([], instrument_id, "1-HOUR-LAST")
         assert bars == []
 
     def test_multiple_candles_ordered(self):
@@ -263,11 +273,80 @@ class TestConvertOhlcvToBars:
             },
         ]
         instrument_id = InstrumentId(Symbol("BTC/USD"), Venue("KRAKEN"))
-        bars = convert_ohlcv_to_bars(candles, instrument_id, "1-HOUR-LAST")
+        bars = _to_bars(candles, instrument_id, "1-HOUR-LAST")
         assert len(bars) == 2
         assert bars[0].ts_event < bars[1].ts_event
 
 
+class TestKrakenCandleBuffer:
+    """Test KrakenCandleBuffer: columnar candle pages → Nautilus Bars."""
+
+    CANDLES = [
+        {
+            "time": 1678888800000,
+            "open": "24885.4",
+            "high": "25039.43",
+            "low": "24529.18",
+            "close": "24793.87",
+            "volume": "7560378.5",
+        },
+        {
+            "time": 1678892400000,
+            "open": 24793.87,
+            "high": 24900.0,
+            "low": 24700.1,
+            "close": 24850.25,
+            "volume": 12.00000001,
+        },
+    ]
+
+    def test_mixed_string_and_float_pages(self):
+        instrument_id = InstrumentId(Symbol("BTC/USD"), Venue("KRAKEN"))
+        buffer = KrakenCandleBuffer()
+        buffer.extend(self.CANDLES)
+
+        bars = buffer.to_bars(instrument_id, "1-HOUR-LAST", price_precision=2)
+
+        assert len(buffer) == 2
+        assert buffer.price_precision == 2
+        assert [b.open for b in bars] == [Price.from_str("24885.40"), Price.from_str("24793.87")]
+        assert [b.close for b in bars] == [Price.from_str("24793.87"), Price.from_str("24850.25")]
+        assert [b.volume for b in bars] == [
+            Quantity.from_str("7560378.50000000"),
+            Quantity.from_str("12.00000001"),
+        ]
+
+    def test_merged_pages_are_sorted_and_deduplicated(self):
+        instrument_id = InstrumentId(Symbol("BTC/USD"), Venue("KRAKEN"))
+        later, earlier = KrakenCandleBuffer(), KrakenCandleBuffer()
+        later.extend(self.CANDLES[1:])
+        earlier.extend(self.CANDLES)
+        later.merge(earlier)
+
+        bars = later.to_bars(instrument_id, "1-HOUR-LAST", price_precision=2)
+
+        assert [b.ts_event for b in bars] == [1678888800000000000, 1678892400000000000]
+
+    def test_empty_buffer_returns_empty(self):
+        instrument_id = InstrumentId(Symbol("BTC/USD"), Venue("KRAKEN"))
+        assert KrakenCandleBuffer().to_bars(instrument_id, "1-HOUR-LAST") == []
+
+
+class TestPlanFetchWindows:
+    """Test plan_fetch_windows: range splitting for concurrent fetches."""
+
+    def test_short_range_is_one_window(self):
+        assert plan_fetch_windows(0, 86_400, "1h") == [(0, 86_400)]
+
+    def test_long_range_windows_are_contiguous(self):
+        windows = plan_fetch_windows(0, 5_000 * 3600, "1h")
+        assert windows == [
+            (0, 2_000 * 3600 - 1),
+            (2_000 * 3600, 4_000 * 3600 - 1),
+            (4_000 * 3600, 5_000 * 3600),
+        ]
+
+
 class TestBuildCurrencyPair:
     """Test build_currency_pair: Kraken pair info → Nautilus CurrencyPair."""
 
@@ -447,6 +526,38 @@ class TestKrakenHistoricalClientFetchBars:
         assert len(bars) == 2
         assert mock_futures_market.get_ohlc.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_long_range_windows_fetched_concurrently_off_loop(
+        self, client, mock_futures_market, mock_spot_market
+    ):
+        """Windows run in parallel worker threads instead of blocking the loop."""
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def get_ohlc(tick_type, symbol, resolution, from_, to):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.05)  # blocking HTTP round trip
+            with lock:
+                state["active"] -= 1
+            candle = {"time": from_ * 1000, "open": "1.5", "high": "2", "low": "1", "close": "1.5"}
+            return {"candles": [{**candle, "volume": "3"}], "more_candles": False}
+
+        mock_futures_market.get_ohlc.side_effect = get_ohlc
+        mock_spot_market.get_asset_pairs.return_value = {
+            "XXBTZUSD": {"pair_decimals": 1, "lot_decimals": 8}
+        }
+        start = datetime(2023, 1, 1, tzinfo=timezone.utc)
+        end = start + timedelta(hours=7_999)
+
+        bars, _ = await client.fetch_bars("BTC/USD.KRAKEN", start, end, "1-HOUR-LAST")
+
+        assert mock_futures_market.get_ohlc.call_count == 4
+        assert state["peak"] > 1
+        assert [b.ts_event for b in bars] == sorted(b.ts_event for b in bars)
+        assert len(bars) == 4
+
     @pytest.mark.asyncio
     async def test_connection_error_on_failure(self, client, mock_futures_market, mock_spot_market):
         mock_futures_market.get_ohlc.side_effect = Exception("API down")
@@ -0,0 +1,158 @@
+"""Unit tests for the parameter sweep service."""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+from nautilus_trader.model.data import Bar, BarType
+
+from src.models.backtest_request import BacktestRequest
+from src.models.parameter_sweep import SweepSpec
+from src.services.parameter_sweep import (
+    ParameterSweepService,
+    SweepRunOutcome,
+    build_sweep_requests,
+)
+from src.services.shared_bars import SharedBarHandle, load_shared_bars
+
+
+@pytest.fixture
+def base_request() -> BacktestRequest:
+    """Base SMA crossover request to sweep."""
+    return BacktestRequest(
+        strategy_type="sma_crossover",
+        strategy_path="src.core.strategies.sma_crossover:SMACrossover",
+        config_path="src.core.strategies.sma_crossover:SMAConfig",
+        strategy_config={"fast_period": 10, "slow_period": 20, "trade_size": 100},
+        symbol="AAPL",
+        instrument_id="AAPL.NASDAQ",
+        start_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        end_date=datetime(2024, 6, 1, tzinfo=timezone.utc),
+        bar_type="1-DAY-LAST",
+        persist=False,
+    )
+
+
+def _bars(count: int) -> list[Bar]:
+    """Daily AAPL bars with rising prices."""
+    prices = np.linspace(100.0, 110.0, count)
+    ts = np.arange(count, dtype=np.uint64) * np.uint64(86_400_000_000_000)
+    return Bar.from_raw_arrays_to_list(
+        BarType.from_str("AAPL.NASDAQ-1-DAY-LAST-EXTERNAL"),
+        2,
+        0,
+        prices,
+        prices + 1.0,
+        prices - 1.0,
+        prices,
+        np.full(count, 1000.0),
+        ts,
+        ts,
+    )
+
+
+def _outcome(request: BacktestRequest) -> SweepRunOutcome:
+    """Fake worker outcome whose Sharpe ratio tracks the fast period."""
+    fast = request.strategy_config["fast_period"]
+    if fast == 15:
+        return SweepRunOutcome(
+            result=None,
+            equity_curve=[],
+            positions_df=None,
+            duration_seconds=0.1,
+            error="engine failed",
+        )
+
+    result = MagicMock()
+    result.total_return = Decimal(fast * 100)
+    result.sharpe_ratio = fast / 10
+    result.max_drawdown = -0.1
+    result.total_trades = fast
+    return SweepRunOutcome(result=result, equity_curve=[], positions_df=None, duration_seconds=0.1)
+
+
+class TestBuildSweepRequests:
+    """Tests for build_sweep_requests."""
+
+    def test_invalid_combinations_are_skipped(self, base_request):
+        """Combinations rejected by the param model are counted, not run."""
+        spec = SweepSpec(params={"fast_period": [5, 30], "slow_period": [20, 50]})
+
+        requests, skipped = build_sweep_requests(base_request, spec)
+
+        # fast=30/slow=20 violates slow > fast
+        assert skipped == 1
+        assert len(requests) == 3
+        for params, request in requests:
+            assert request.strategy_config["fast_period"] == params["fast_period"]
+            assert request.strategy_config["trade_size"] == 100
+
+    def test_unknown_parameter_rejected(self, base_request):
+        """Parameters outside the strategy's param model raise ValueError."""
+        spec = SweepSpec(params={"not_a_param": [1, 2]})
+
+        with pytest.raises(ValueError, match="Unknown parameter"):
+            build_sweep_requests(base_request, spec)
+
+
+class TestParameterSweepService:
+    """Tests for ParameterSweepService.run."""
+
+    async def test_run_collects_outcomes_and_progress(self, base_request):
+        """All combinations run once, failures are reported and progress is tracked."""
+        progress: list[tuple[int, int]] = []
+        handles: list[SharedBarHandle] = []
+
+        def factory(shared_bars, instrument):
+            handles.append(shared_bars)
+            return ThreadPoolExecutor(max_workers=2)
+
+        service = ParameterSweepService(max_workers=2, executor_factory=factory)
+        spec = SweepSpec(params={"fast_period": [5, 10, 15], "slow_period": [50]})
+        bars = _bars(3)
+        instrument = MagicMock()
+
+        with patch(
+            "src.services.parameter_sweep.run_sweep_backtest", side_effect=_outcome
+        ) as run_mock:
+            summary = await service.run(
+                base_request,
+                spec,
+                bars,
+                instrument,
+                persist=False,
+                on_progress=lambda done, total: progress.append((done, total)),
+            )
+
+        assert run_mock.call_count == 3
+        assert len(handles) == 1
+        assert handles[0].count == 3
+        # Shared memory is released once the sweep finishes
+        with pytest.raises(FileNotFoundError):
+            load_shared_bars(handles[0])
+        assert progress[-1] == (3, 3)
+        assert len(summary.runs) == 3
+        assert [run.params["fast_period"] for run in summary.ranked()] == [10, 5]
+
+        failed = [run for run in summary.runs if not run.success]
+        assert len(failed) == 1
+        assert failed[0].error_message == "engine failed"
+        assert all(run.run_id is None for run in summary.runs)
+
+    async def test_run_rejects_empty_bars(self, base_request):
+        """A sweep without bars fails fast."""
+        service = ParameterSweepService(max_workers=1)
+
+        with pytest.raises(ValueError, match="No bars"):
+            await service.run(base_request, SweepSpec(params={"fast_period": [5]}), [], None)
+
+    async def test_run_rejects_when_no_valid_combinations(self, base_request):
+        """A sweep whose every combination is invalid raises ValueError."""
+        service = ParameterSweepService(max_workers=1)
+        spec = SweepSpec(params={"fast_period": [30], "slow_period": [20]})
+
+        with pytest.raises(ValueError, match="No valid parameter combinations"):
+            await service.run(base_request, spec, [MagicMock()], MagicMock())
@@ -0,0 +1,221 @@
+"""Unit tests for the shared-memory bar store."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pyarrow.parquet as pq
+import pytest
+from nautilus_trader.model.data import Bar, BarType
+
+from src.models.catalog_metadata import CatalogAvailability
+from src.services.data_catalog import DataCatalogService
+from src.services.shared_bars import BarArrays, SharedBarCache, SharedBarStore, load_shared_bars
+
+BAR_TYPE = "AAPL.NASDAQ-1-DAY-LAST-EXTERNAL"
+DAY_NS = 86_400_000_000_000
+BASE = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _bars(count: int, start_price: float = 100.0) -> list[Bar]:
+    """Daily bars starting 2024-01-01 with rising prices."""
+    prices = start_price + np.arange(count, dtype=np.float64)
+    ts = np.uint64(int(BASE.timestamp() * 1e9)) + np.arange(count, dtype=np.uint64) * np.uint64(
+        DAY_NS
+    )
+    return Bar.from_raw_arrays_to_list(
+        BarType.from_str(BAR_TYPE),
+        2,
+        0,
+        prices,
+        prices + 0.5,
+        prices - 0.5,
+        prices + 0.25,
+        np.full(count, 1_000_000.0),
+        ts,
+        ts,
+    )
+
+
+class TestBarArrays:
+    """Test suite for BarArrays."""
+
+    def test_round_trip_preserves_bars(self):
+        """Bars converted to arrays and back are identical."""
+        bars = _bars(10)
+
+        arrays = BarArrays.from_bars(bars)
+        rebuilt = arrays.to_bars()
+
+        assert len(arrays) == 10
+        assert arrays.nbytes == 10 * 7 * 8
+        assert rebuilt == bars
+        assert [b.volume for b in rebuilt] == [b.volume for b in bars]
+
+    def test_slice_selects_inclusive_window(self):
+        """slice() keeps bars whose ts_init is within [start, end]."""
+        arrays = BarArrays.from_bars(_bars(10))
+
+        window = arrays.slice(BASE + timedelta(days=2), BASE + timedelta(days=5))
+
+        assert len(window) == 4
+        assert window.to_bars()[0].ts_init == _bars(10)[2].ts_init
+        assert np.shares_memory(window.close, arrays.close)
+
+    def test_digest_tracks_bar_contents(self):
+        """Equal bars hash equally; any changed value or window changes the digest."""
+        digest = BarArrays.from_bars(_bars(10)).digest()
+
+        assert BarArrays.from_bars(_bars(10)).digest() == digest
+        assert BarArrays.from_bars(_bars(10, start_price=100.01)).digest() != digest
+        assert BarArrays.from_bars(_bars(9)).digest() != digest
+        assert BarArrays.from_bars(_bars(10)).slice(BASE, BASE + timedelta(days=20)).digest() == (
+            digest
+        )
+
+    def test_from_bars_rejects_empty_list(self):
+        """An empty bar list cannot be converted."""
+        with pytest.raises(ValueError):
+            BarArrays.from_bars([])
+
+
+class TestSharedBarStore:
+    """Test suite for SharedBarStore and load_shared_bars."""
+
+    def test_workers_build_bars_from_shared_memory(self):
+        """Attached readers see the same bars, sliced to their window."""
+        bars = _bars(20)
+
+        with SharedBarStore.from_bars(bars) as store:
+            assert store.handle.count == 20
+            assert load_shared_bars(store.handle) == bars
+            window = load_shared_bars(
+                store.handle, BASE + timedelta(days=5), BASE + timedelta(days=9)
+            )
+
+        assert window == bars[5:10]
+
+    def test_closed_store_cannot_be_attached(self):
+        """Closing the owner unlinks the shared block."""
+        store = SharedBarStore.from_bars(_bars(3))
+        store.close()
+        store.close()  # idempotent
+
+        with pytest.raises(FileNotFoundError):
+            load_shared_bars(store.handle)
+
+
+class TestCatalogBarArrays:
+    """Test DataCatalogService.query_bar_arrays against a real catalog."""
+
+    def test_arrays_match_catalog_query(self, tmp_path):
+        """Decoding Parquet columns directly matches the Nautilus query."""
+        service = DataCatalogService(catalog_path=tmp_path)
+        service.catalog.write_data(_bars(15, start_price=12_345.67))
+        service.refresh_availability(force=True)
+
+        arrays = service.query_bar_arrays("AAPL.NASDAQ", "1-DAY-LAST")
+        bars = service.query_bars(
+            "AAPL.NASDAQ", BASE, BASE + timedelta(days=30), bar_type_spec="1-DAY-LAST"
+        )
+
+        assert arrays.bar_type == BAR_TYPE
+        assert arrays.to_bars() == bars
+        assert len(service.query_bar_arrays("AAPL.NASDAQ", "1-DAY-LAST", end=BASE)) == 1
+
+    def test_only_overlapping_files_are_read(self, tmp_path):
+        """Files outside the requested window are skipped by their name range."""
+        service = DataCatalogService(catalog_path=tmp_path)
+        bars = _bars(60)
+        service.catalog.write_data(bars[:30])
+        service.catalog.write_data(bars[30:])
+
+        with patch("src.services.data_catalog.pq.read_table", wraps=pq.read_table) as read:
+            arrays = service.query_bar_arrays(
+                "AAPL.NASDAQ", "1-DAY-LAST", BASE, BASE + timedelta(days=5)
+            )
+
+        assert read.call_count == 1
+        assert len(arrays) == 6
+
+
+def _availability(total_rows: int = 20) -> CatalogAvailability:
+    """Availability covering January 2024."""
+    return CatalogAvailability(
+        instrument_id="AAPL.NASDAQ",
+        bar_type_spec="1-DAY-LAST",
+        start_date=BASE,
+        end_date=BASE + timedelta(days=31),
+        file_count=1,
+        total_rows=total_rows,
+        last_updated=datetime.now(),
+    )
+
+
+@pytest.fixture
+def catalog_service():
+    """Catalog stub serving one AAPL series."""
+    service = MagicMock()
+    service.get_availability.return_value = _availability()
+    service.query_bar_arrays.side_effect = lambda *args: BarArrays.from_bars(_bars(20))
+    return service
+
+
+class TestSharedBarCache:
+    """Test suite for SharedBarCache."""
+
+    def test_series_is_loaded_once_and_shared(self, catalog_service):
+        """Repeated requests for the same series reuse one shared block."""
+        cache = SharedBarCache(catalog_service)
+        end = BASE + timedelta(days=10)
+
+        first = cache.acquire("AAPL.NASDAQ", "1-DAY-LAST", BASE, end)
+        second = cache.acquire("AAPL.NASDAQ", "1-DAY-LAST", BASE, end)
+
+        assert first == second
+        assert catalog_service.query_bar_arrays.call_count == 1
+        assert len(load_shared_bars(first, BASE, end)) == 11
+
+        cache.release(first)
+        cache.release(second)
+        cache.close()
+
+    def test_uncovered_range_returns_none(self, catalog_service):
+        """Ranges outside the catalog fall back to the regular loading path."""
+        cache = SharedBarCache(catalog_service)
+
+        handle = cache.acquire("AAPL.NASDAQ", "1-DAY-LAST", BASE, BASE + timedelta(days=90))
+
+        assert handle is None
+        catalog_service.query_bar_arrays.assert_not_called()
+
+    def test_idle_entries_beyond_limit_are_released(self, catalog_service):
+        """Only max_entries idle series stay in shared memory."""
+        cache = SharedBarCache(catalog_service, max_entries=0)
+
+        handle = cache.acquire("AAPL.NASDAQ", "1-DAY-LAST", BASE, BASE)
+        assert load_shared_bars(handle, BASE, BASE)  # still referenced
+
+        cache.release(handle)
+
+        with pytest.raises(FileNotFoundError):
+            load_shared_bars(handle)
+
+    def test_changed_catalog_reloads_but_keeps_referenced_block(self, catalog_service):
+        """A stale series is replaced but stays readable until released."""
+        cache = SharedBarCache(catalog_service)
+        stale = cache.acquire("AAPL.NASDAQ", "1-DAY-LAST", BASE, BASE)
+
+        catalog_service.get_availability.return_value = _availability(total_rows=21)
+        fresh = cache.acquire("AAPL.NASDAQ", "1-DAY-LAST", BASE, BASE)
+
+        assert fresh != stale
+        assert catalog_service.query_bar_arrays.call_count == 2
+        assert load_shared_bars(stale, BASE, BASE)
+
+        cache.release(stale)
+        with pytest.raises(FileNotFoundError):
+            load_shared_bars(stale)
+
+        cache.release(fresh)
+        cache.close()
@@ -0,0 +1,143 @@
+"""Unit tests for the signal screening service."""
+
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pytest
+from nautilus_trader.model.data import Bar, BarType
+
+from src.models.backtest_request import BacktestRequest
+from src.models.parameter_sweep import SweepSpec
+from src.services.signal_screening import SignalScreeningService
+
+
+@pytest.fixture
+def base_request() -> BacktestRequest:
+    """Base SMA crossover request to screen."""
+    return BacktestRequest(
+        strategy_type="sma_crossover",
+        strategy_path="src.core.strategies.sma_crossover:SMACrossover",
+        config_path="src.core.strategies.sma_crossover:SMAConfig",
+        strategy_config={"fast_period": 10, "slow_period": 20},
+        symbol="AAPL",
+        instrument_id="AAPL.NASDAQ",
+        start_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        end_date=datetime(2024, 6, 1, tzinfo=timezone.utc),
+        bar_type="1-DAY-LAST",
+        persist=False,
+    )
+
+
+def _bars(count: int) -> list[Bar]:
+    """Daily AAPL bars oscillating around 100."""
+    prices = np.round(100.0 + 10.0 * np.sin(np.arange(count) / 8.0), 2)
+    ts = np.arange(count, dtype=np.uint64) * np.uint64(86_400_000_000_000)
+    return Bar.from_raw_arrays_to_list(
+        BarType.from_str("AAPL.NASDAQ-1-DAY-LAST-EXTERNAL"),
+        2,
+        0,
+        prices,
+        prices + 1.0,
+        prices - 1.0,
+        prices,
+        np.full(count, 1000.0),
+        ts,
+        ts,
+    )
+
+
+def _result(total_return: float) -> MagicMock:
+    """Fake BacktestResult."""
+    result = MagicMock()
+    result.total_return = total_return
+    result.sharpe_ratio = 1.0
+    result.max_drawdown = -0.05
+    result.total_trades = 4
+    return result
+
+
+class TestSignalScreeningService:
+    """Tests for SignalScreeningService."""
+
+    def test_screen_values_every_valid_combination(self, base_request):
+        """Each valid combination gets a candidate; invalid ones are counted."""
+        spec = SweepSpec(params={"fast_period": [5, 10, 30], "slow_period": [20, 40]})
+
+        summary = SignalScreeningService().screen(base_request, spec, _bars(200))
+
+        # fast=30/slow=20 violates slow > fast
+        assert summary.skipped == 1
+        assert len(summary.candidates) == 5
+        assert summary.bar_count == 200
+        assert all(candidate.total_trades > 0 for candidate in summary.candidates)
+        assert {tuple(c.params.values()) for c in summary.candidates} == {
+            (5, 20),
+            (5, 40),
+            (10, 20),
+            (10, 40),
+            (30, 40),
+        }
+
+    def test_screen_rejects_empty_bars(self, base_request):
+        """A screen without bars fails fast."""
+        with pytest.raises(ValueError, match="No bars"):
+            SignalScreeningService().screen(
+                base_request, SweepSpec(params={"fast_period": [5]}), []
+            )
+
+    def test_screen_requires_signal_function(self, base_request):
+        """Strategies without a vectorized signal function cannot be screened."""
+        with patch("src.services.signal_screening.resolve_strategy_definition", return_value=None):
+            with pytest.raises(ValueError, match="no vectorized signal function"):
+                SignalScreeningService().screen(
+                    base_request, SweepSpec(params={"fast_period": [5]}), _bars(50)
+                )
+
+    async def test_reconcile_runs_best_candidates(self, base_request):
+        """The top candidates are re-run with their params; failures are recorded."""
+        spec = SweepSpec(params={"fast_period": [5, 8, 10], "slow_period": [40]})
+        bars = _bars(200)
+        orchestrators: list[MagicMock] = []
+
+        def factory() -> MagicMock:
+            orchestrator = MagicMock()
+            if not orchestrators:
+                orchestrator.execute = AsyncMock(return_value=(_result(0.02), None))
+            else:
+                orchestrator.execute = AsyncMock(side_effect=RuntimeError("engine failed"))
+            orchestrators.append(orchestrator)
+            return orchestrator
+
+        service = SignalScreeningService(orchestrator_factory=factory)
+        summary = service.screen(base_request, spec, bars)
+        progress: list[tuple[int, int]] = []
+
+        reconciled = await service.reconcile(
+            summary,
+            base_request,
+            bars,
+            MagicMock(),
+            top=2,
+            rank_by="total_return",
+            on_progress=lambda done, total: progress.append((done, total)),
+        )
+
+        best = summary.ranked("total_return")[:2]
+        assert [item.screened for item in reconciled.reconciliations] == best
+        assert progress == [(1, 2), (2, 2)]
+        for orchestrator, candidate in zip(orchestrators, best):
+            request = orchestrator.execute.call_args.args[0]
+            assert request.strategy_config["fast_period"] == candidate.params["fast_period"]
+            assert request.persist is False
+            orchestrator.dispose.assert_called_once()
+
+        ok, failed = reconciled.reconciliations
+        assert ok.full.success
+        assert ok.return_difference == pytest.approx(0.02 - best[0].total_return)
+        assert ok.trade_difference == 4 - best[0].total_trades
+        assert not failed.full.success
+        assert failed.full.error_message == "engine failed"
+        assert failed.return_difference is None
+        # The screen itself is left untouched
+        assert summary.reconciliations == []
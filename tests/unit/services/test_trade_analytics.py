@@ -4,9 +4,12 @@ Unit tests for trade analytics service.
 Tests cover equity curve generation, drawdown calculations, and trade statistics.
 """
 
+import random
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 
+import numpy as np
+
 from src.models.trade import (
     DrawdownMetrics,
     EquityCurvePoint,
@@ -15,12 +18,26 @@ from src.models.trade import (
     TradeStatistics,
 )
 from src.services.trade_analytics import (
-    calculate_drawdowns,
-    calculate_trade_statistics,
+    TradeColumns,
+    analyze_trade_columns,
+    calculate_column_drawdowns,
+    calculate_column_statistics,
     generate_equity_curve,
 )
 
 
+def _curve_drawdowns(equity_curve: list[EquityCurvePoint]) -> DrawdownMetrics:
+    """Drawdowns of an equity curve, computed from the trades that produce it."""
+    points = equity_curve[1:]
+    columns = TradeColumns.from_columns(
+        [equity_curve[0].timestamp] * len(points),
+        [point.timestamp for point in points],
+        [point.balance - prev.balance for prev, point in zip(equity_curve, points)],
+        [None] * len(points),
+    )
+    return calculate_column_drawdowns(columns, equity_curve[0].balance)
+
+
 class TestEquityCurveGeneration:
     """Test suite for equity curve generation logic."""
 
@@ -374,17 +391,17 @@ class TestEquityCurveGeneration:
 class TestTradeStatistics:
     """Test suite for trade statistics calculation."""
 
-    def test_calculate_trade_statistics_with_no_trades(self):
+    def test_calculate_column_statistics_with_no_trades(self):
         """
         Test trade statistics calculation with no trades.
 
         Given: An empty trades list
-        When: calculate_trade_statistics() is called
+        When: calculate_column_statistics() is called
         Then: Returns statistics with zero values and zero win rate
         """
         trades = []
 
-        result = calculate_trade_statistics(trades)
+        result = calculate_column_statistics(TradeColumns.from_trades(trades))
 
         assert isinstance(result, TradeStatistics)
         assert result.total_trades == 0
@@ -409,7 +426,7 @@ class TestTradeStatistics:
         Test win rate calculation with mixed wins and losses.
 
         Given: 10 winning trades and 5 losing trades
-        When: calculate_trade_statistics() is called
+        When: calculate_column_statistics() is called
         Then: Win rate is 66.67%
         """
         base_time = datetime(2025, 1, 1, 10, 0, 0, tzinfo=timezone.utc)
@@ -459,7 +476,7 @@ class TestTradeStatistics:
                 )
             )
 
-        result = calculate_trade_statistics(trades)
+        result = calculate_column_statistics(TradeColumns.from_trades(trades))
 
         assert result.total_trades == 15
         assert result.winning_trades == 10
@@ -471,7 +488,7 @@ class TestTradeStatistics:
         Test profit factor calculation.
 
         Given: Trades with total_profit=5000 and total_loss=2000
-        When: calculate_trade_statistics() is called
+        When: calculate_column_statistics() is called
         Then: Profit factor = 2.50 (5000 / 2000)
         """
         base_time = datetime(2025, 1, 1, 10, 0, 0, tzinfo=timezone.utc)
@@ -513,7 +530,7 @@ class TestTradeStatistics:
             ),
         ]
 
-        result = calculate_trade_statistics(trades)
+        result = calculate_column_statistics(TradeColumns.from_trades(trades))
 
         assert result.total_profit == Decimal("5000.00")
         assert result.total_loss == Decimal("2000.00")
@@ -525,7 +542,7 @@ class TestTradeStatistics:
         Test consecutive win/loss streak detection.
 
         Given: Sequence with 4 consecutive wins, then 2 consecutive losses
-        When: calculate_trade_statistics() is called
+        When: calculate_column_statistics() is called
         Then: max_consecutive_wins=4, max_consecutive_losses=2
         """
         base_time = datetime(2025, 1, 1, 10, 0, 0, tzinfo=timezone.utc)
@@ -555,7 +572,7 @@ class TestTradeStatistics:
                 )
             )
 
-        result = calculate_trade_statistics(trades)
+        result = calculate_column_statistics(TradeColumns.from_trades(trades))
 
         assert result.max_consecutive_wins == 4
         assert result.max_consecutive_losses == 2
@@ -565,7 +582,7 @@ class TestTradeStatistics:
         Test holding period calculations.
 
         Given: Trades with different holding periods
-        When: calculate_trade_statistics() is called
+        When: calculate_column_statistics() is called
         Then: Correctly calculates average, max, and min holding periods
         """
         base_time = datetime(2025, 1, 1, 10, 0, 0, tzinfo=timezone.utc)
@@ -624,7 +641,7 @@ class TestTradeStatistics:
             ),
         ]
 
-        result = calculate_trade_statistics(trades)
+        result = calculate_column_statistics(TradeColumns.from_trades(trades))
 
         # Average: (3600 + 14400 + 7200) / 3 = 8400 seconds = 2.33 hours
         assert abs(result.avg_holding_period_hours - Decimal("2.33")) < Decimal("0.01")
@@ -636,7 +653,7 @@ class TestTradeStatistics:
         Test that breakeven trades (profit_loss <= 0 but near zero) are counted separately.
 
         Given: Trades with 2 wins, 1 loss, 1 breakeven (profit_loss = -5, only commission)
-        When: calculate_trade_statistics() is called
+        When: calculate_column_statistics() is called
         Then: breakeven_trades = 1, treated as a loss for win_rate
         """
         base_time = datetime(2025, 1, 1, 10, 0, 0, tzinfo=timezone.utc)
@@ -713,7 +730,7 @@ class TestTradeStatistics:
             ),
         ]
 
-        result = calculate_trade_statistics(trades)
+        result = calculate_column_statistics(TradeColumns.from_trades(trades))
 
         assert result.total_trades == 4
         assert result.winning_trades == 2
@@ -726,12 +743,12 @@ class TestTradeStatistics:
 class TestDrawdownCalculation:
     """Test suite for drawdown calculation logic."""
 
-    def test_calculate_drawdowns_with_no_drawdown(self):
+    def test_calculate_column_drawdowns_with_no_drawdown(self):
         """
         Test drawdown calculation with monotonically increasing equity curve.
 
         Given: An equity curve that only goes up (no drawdowns)
-        When: calculate_drawdowns() is called
+        When: calculate_column_drawdowns() is called
         Then: Returns metrics with no drawdowns detected
         """
         # Create upward trending equity curve (no drawdowns)
@@ -762,7 +779,7 @@ class TestDrawdownCalculation:
             ),
         ]
 
-        result = calculate_drawdowns(equity_curve)
+        result = _curve_drawdowns(equity_curve)
 
         assert isinstance(result, DrawdownMetrics)
         assert result.max_drawdown is None
@@ -770,12 +787,12 @@ class TestDrawdownCalculation:
         assert result.current_drawdown is None
         assert result.total_drawdown_periods == 0
 
-    def test_calculate_drawdowns_single_period(self):
+    def test_calculate_column_drawdowns_single_period(self):
         """
         Test drawdown calculation with a single complete drawdown period.
 
         Given: An equity curve with one peak, trough, and recovery
-        When: calculate_drawdowns() is called
+        When: calculate_column_drawdowns() is called
         Then: Returns metrics with single recovered drawdown period
         """
         # Create equity curve with single drawdown:
@@ -813,7 +830,7 @@ class TestDrawdownCalculation:
             ),
         ]
 
-        result = calculate_drawdowns(equity_curve)
+        result = _curve_drawdowns(equity_curve)
 
         assert result.total_drawdown_periods == 1
         assert result.max_drawdown is not None
@@ -830,12 +847,12 @@ class TestDrawdownCalculation:
         assert dd.recovered is True
         assert dd.recovery_timestamp == datetime(2025, 1, 1, 14, 0, 0, tzinfo=timezone.utc)
 
-    def test_calculate_drawdowns_multiple_periods(self):
+    def test_calculate_column_drawdowns_multiple_periods(self):
         """
         Test drawdown calculation with multiple drawdown periods.
 
         Given: An equity curve with 3 distinct drawdown periods
-        When: calculate_drawdowns() is called
+        When: calculate_column_drawdowns() is called
         Then: Returns metrics with all 3 periods sorted by magnitude
         """
         # Create equity curve with 3 drawdown periods
@@ -893,7 +910,7 @@ class TestDrawdownCalculation:
             ),
         ]
 
-        result = calculate_drawdowns(equity_curve)
+        result = _curve_drawdowns(equity_curve)
 
         assert result.total_drawdown_periods == 3
         assert result.max_drawdown is not None
@@ -913,12 +930,12 @@ class TestDrawdownCalculation:
         assert result.top_drawdowns[0].drawdown_pct >= result.top_drawdowns[1].drawdown_pct
         assert result.top_drawdowns[1].drawdown_pct >= result.top_drawdowns[2].drawdown_pct
 
-    def test_calculate_drawdowns_ongoing_not_recovered(self):
+    def test_calculate_column_drawdowns_ongoing_not_recovered(self):
         """
         Test drawdown calculation with ongoing drawdown (not yet recovered).
 
         Given: An equity curve ending in a drawdown that hasn't recovered
-        When: calculate_drawdowns() is called
+        When: calculate_column_drawdowns() is called
         Then: Returns metrics with current_drawdown populated and recovered=False
         """
         # Create equity curve with ongoing drawdown
@@ -949,7 +966,7 @@ class TestDrawdownCalculation:
             ),
         ]
 
-        result = calculate_drawdowns(equity_curve)
+        result = _curve_drawdowns(equity_curve)
 
         # Should have 0 completed drawdowns
         assert result.total_drawdown_periods == 0
@@ -968,3 +985,92 @@ class TestDrawdownCalculation:
         assert abs(dd.drawdown_pct - Decimal("16.6667")) < Decimal("0.01")
         assert dd.recovered is False
         assert dd.recovery_timestamp is None
+
+
+def _random_trades(count: int, seed: int) -> list[Trade]:
+    """Closed and open trades with 2 decimal place P&L, in entry order."""
+    rng = random.Random(seed)
+    base_time = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    trades = []
+    for i in range(count):
+        entry = base_time + timedelta(hours=i)
+        closed = rng.random() < 0.9
+        trades.append(
+            Trade(
+                id=i + 1,
+                backtest_run_id=1,
+                instrument_id="AAPL",
+                trade_id=f"trade-{i}",
+                venue_order_id=f"order-{i}",
+                order_side="BUY",
+                quantity=Decimal("10"),
+                entry_price=Decimal("100.00"),
+                exit_price=Decimal("101.00") if closed else None,
+                entry_timestamp=entry,
+                exit_timestamp=entry + timedelta(minutes=rng.randint(1, 600)) if closed else None,
+                profit_loss=Decimal(rng.randint(-500_00, 500_00)).scaleb(-2) if closed else None,
+                holding_period_seconds=rng.choice([None, 60, 3600, 5400]) if closed else None,
+                created_at=entry,
+            )
+        )
+    return trades
+
+
+class TestTradeColumns:
+    """Test suite for the column-wise analytics over TradeColumns."""
+
+    def test_column_drawdowns_match_equity_curve(self):
+        """The max drawdown from columns is the deepest fall of the equity curve."""
+        initial_capital = Decimal("100000.00")
+        for seed in range(20):
+            trades = _random_trades(60, seed)
+            curve = generate_equity_curve(trades, initial_capital)
+            peak = curve.points[0].balance
+            deepest = Decimal("0")
+            for point in curve.points:
+                peak = max(peak, point.balance)
+                deepest = max(deepest, (peak - point.balance) / peak * 100)
+
+            result = calculate_column_drawdowns(TradeColumns.from_trades(trades), initial_capital)
+
+            assert result.max_drawdown is not None
+            assert result.max_drawdown.drawdown_pct == deepest.quantize(Decimal("0.0001"))
+            assert (result.current_drawdown is not None) == (curve.points[-1].balance < peak)
+
+    def test_analyze_trade_columns_matches_statistics(self):
+        """analyze_trade_columns returns the column statistics and drawdowns unchanged."""
+        trades = _random_trades(40, seed=7)
+        columns = TradeColumns.from_trades(trades)
+
+        statistics, drawdowns = analyze_trade_columns(columns, Decimal("50000.00"))
+
+        assert statistics == calculate_column_statistics(columns)
+        assert drawdowns == calculate_column_drawdowns(columns, Decimal("50000.00"))
+
+    def test_from_rows_reads_values_at_scale(self):
+        """With a scale, profit/loss is read as a column of that scale stores it."""
+        time = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        rows = [
+            (time, time + timedelta(hours=1), Decimal("1.5"), 3600),
+            (time, None, None, None),
+            (time, time + timedelta(hours=2), Decimal("-0.25"), None),
+        ]
+
+        columns = TradeColumns.from_rows(rows, scale=8)
+
+        assert columns.scale == 8
+        assert columns.profit_loss.tolist() == [150_000_000, -25_000_000]
+        assert columns.places.tolist() == [2, 2]
+        assert columns.holding_seconds.tolist() == [3600]
+        assert columns.total(np.array([True, True])) == Decimal("1.25000000")
+
+    def test_large_values_fall_back_to_exact_integers(self):
+        """Sums that could overflow int64 are kept as Python integers."""
+        time = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        amount = Decimal("90000000000.12345678")
+        rows = [(time, time + timedelta(hours=i), amount, None) for i in range(1, 200)]
+
+        columns = TradeColumns.from_rows(rows, scale=8)
+
+        assert columns.profit_loss.dtype == object
+        assert columns.total(columns.profit_loss > 0) == amount * 199
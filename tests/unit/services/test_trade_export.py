@@ -0,0 +1,127 @@
+"""Unit tests for streaming trade export encoders."""
+
+import csv
+import io
+import json
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from src.services.trade_export import (
+    EXPORT_COLUMNS,
+    EXPORT_SCHEMA,
+    arrow_chunks,
+    csv_chunks,
+    json_chunks,
+    parquet_chunks,
+)
+
+BASE = datetime(2025, 1, 1, 10, 0, tzinfo=timezone.utc)
+
+
+def _row(i: int, closed: bool = True) -> tuple:
+    """Trade row in EXPORT_COLUMNS order; open trades have no exit values."""
+    return (
+        f"AAPL{i}",
+        f"trade-{i}",
+        "BUY",
+        BASE + timedelta(hours=i),
+        Decimal("150.25000000"),
+        BASE + timedelta(hours=i + 1) if closed else None,
+        Decimal("155.75000000") if closed else None,
+        Decimal("100.50000000"),
+        Decimal("552.75000000") if closed else None,
+        Decimal("3.6600") if closed else None,
+        Decimal("5.00000000"),
+        3600 if closed else None,
+    )
+
+
+async def _batches(*batches: list[tuple]):
+    """Yield the given batches like stream_trade_batches."""
+    for batch in batches:
+        yield batch
+
+
+async def _collect(chunks) -> list:
+    """Drain an encoder into a list of chunks."""
+    return [chunk async for chunk in chunks]
+
+
+class TestTextExports:
+    """Test suite for CSV and JSON export encoders."""
+
+    @pytest.mark.asyncio
+    async def test_csv_emits_header_then_one_chunk_per_batch(self):
+        """CSV output is a header chunk plus one chunk per batch, parseable as a whole."""
+        chunks = await _collect(csv_chunks(_batches([_row(0), _row(1)], [_row(2, closed=False)])))
+
+        assert len(chunks) == 3
+        rows = list(csv.DictReader(io.StringIO("".join(chunks))))
+        assert list(rows[0]) == list(EXPORT_COLUMNS)
+        assert [r["trade_id"] for r in rows] == ["trade-0", "trade-1", "trade-2"]
+        assert rows[0]["entry_price"] == "150.25000000"
+        assert rows[0]["entry_timestamp"] == "2025-01-01T10:00:00+00:00"
+        assert rows[2]["exit_price"] == ""
+        assert rows[2]["holding_period_seconds"] == ""
+
+    @pytest.mark.asyncio
+    async def test_json_concatenates_to_array(self):
+        """JSON chunks form one array with nulls for missing values."""
+        chunks = await _collect(json_chunks(_batches([_row(0)], [], [_row(1, closed=False)])))
+
+        trades = json.loads("".join(chunks))
+        assert [t["trade_id"] for t in trades] == ["trade-0", "trade-1"]
+        assert trades[0]["profit_loss"] == "552.75000000"
+        assert trades[1]["exit_timestamp"] is None
+        assert trades[1]["profit_pct"] is None
+
+    @pytest.mark.asyncio
+    async def test_json_without_trades_is_empty_array(self):
+        """A run without trades exports an empty JSON array."""
+        chunks = await _collect(json_chunks(_batches()))
+
+        assert json.loads("".join(chunks)) == []
+
+
+class TestColumnarExports:
+    """Test suite for Parquet and Arrow export encoders."""
+
+    @pytest.mark.asyncio
+    async def test_parquet_writes_a_row_group_per_batch(self):
+        """Each batch is flushed as its own row group with native types."""
+        chunks = await _collect(
+            parquet_chunks(_batches([_row(0), _row(1)], [_row(2, closed=False)]))
+        )
+
+        assert all(chunks[:-1])
+        parquet = pq.ParquetFile(io.BytesIO(b"".join(chunks)))
+        assert parquet.metadata.num_row_groups == 2
+        table = parquet.read()
+        assert table.schema == EXPORT_SCHEMA
+        assert table.column("trade_id").to_pylist() == ["trade-0", "trade-1", "trade-2"]
+        assert table.column("entry_price")[0].as_py() == Decimal("150.25000000")
+        assert table.column("exit_timestamp")[2].as_py() is None
+        assert table.column("entry_timestamp")[1].as_py() == BASE + timedelta(hours=1)
+
+    @pytest.mark.asyncio
+    async def test_arrow_stream_round_trips(self):
+        """Arrow IPC chunks concatenate to a readable stream of all trades."""
+        chunks = await _collect(arrow_chunks(_batches([_row(0)], [_row(1)])))
+
+        table = pa.ipc.open_stream(b"".join(chunks)).read_all()
+        assert table.schema == EXPORT_SCHEMA
+        assert table.num_rows == 2
+        assert table.column("holding_period_seconds").to_pylist() == [3600, 3600]
+
+    @pytest.mark.asyncio
+    async def test_empty_export_is_a_valid_file(self):
+        """Without trades, Parquet and Arrow still produce readable empty files."""
+        parquet = await _collect(parquet_chunks(_batches()))
+        arrow = await _collect(arrow_chunks(_batches()))
+
+        assert pq.read_table(io.BytesIO(b"".join(parquet))).num_rows == 0
+        assert pa.ipc.open_stream(b"".join(arrow)).read_all().num_rows == 0
@@ -0,0 +1,174 @@
+"""Unit tests for the walk-forward service."""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+from nautilus_trader.model.data import Bar, BarType
+
+from src.models.backtest_request import BacktestRequest
+from src.models.backtest_result import BacktestResult
+from src.models.parameter_sweep import SweepRunSummary, SweepSpec
+from src.models.walk_forward import FoldWindow, WalkForwardSpec
+from src.services.shared_bars import SharedBarHandle, load_shared_bars
+from src.services.walk_forward import FoldOutcome, WalkForwardService, stitch_equity_curves
+
+_DAY_NS = 86_400_000_000_000
+
+
+@pytest.fixture
+def base_request() -> BacktestRequest:
+    """Base SMA crossover request to walk forward."""
+    return BacktestRequest(
+        strategy_type="sma_crossover",
+        strategy_path="src.core.strategies.sma_crossover:SMACrossover",
+        config_path="src.core.strategies.sma_crossover:SMAConfig",
+        strategy_config={"fast_period": 10, "slow_period": 20, "trade_size": 100},
+        symbol="AAPL",
+        instrument_id="AAPL.NASDAQ",
+        start_date=datetime(2020, 1, 1, tzinfo=timezone.utc),
+        end_date=datetime(2022, 12, 31, tzinfo=timezone.utc),
+        bar_type="1-DAY-LAST",
+        starting_balance=100_000,
+        persist=False,
+    )
+
+
+def _bars(start: datetime, count: int) -> list[Bar]:
+    """Daily AAPL bars starting at `start`."""
+    prices = np.linspace(100.0, 110.0, count)
+    first = int(start.timestamp()) * 1_000_000_000
+    ts = np.uint64(first) + np.arange(count, dtype=np.uint64) * np.uint64(_DAY_NS)
+    return Bar.from_raw_arrays_to_list(
+        BarType.from_str("AAPL.NASDAQ-1-DAY-LAST-EXTERNAL"),
+        2,
+        0,
+        prices,
+        prices + 1.0,
+        prices - 1.0,
+        prices,
+        np.full(count, 1000.0),
+        ts,
+        ts,
+    )
+
+
+def _fold(window: FoldWindow, base_request, combinations, rank_by) -> FoldOutcome:
+    """Fake worker fold: the second fold fails, others gain 10% out of sample."""
+    train_runs = [
+        SweepRunSummary(params=params, sharpe_ratio=params["fast_period"] / 10)
+        for params in combinations
+    ]
+    if window.index == 1:
+        return FoldOutcome(window=window, train_runs=train_runs, error="engine failed")
+
+    time = int(window.test_start.timestamp())
+    return FoldOutcome(
+        window=window,
+        train_runs=train_runs,
+        request=base_request,
+        result=BacktestResult(total_return=0.1, sharpe_ratio=1.5, total_trades=4),
+        balance_curve=[
+            {"time": time, "value": 100_000.0},
+            {"time": time + 1, "value": 110_000.0},
+        ],
+    )
+
+
+class TestStitchEquityCurves:
+    """Tests for stitch_equity_curves."""
+
+    def test_curves_compound(self):
+        """Each curve continues from the equity the previous one ended with."""
+        stitched = stitch_equity_curves(
+            [
+                [{"time": 1, "value": 100.0}, {"time": 2, "value": 120.0}],
+                [],
+                [{"time": 3, "value": 100.0}, {"time": 4, "value": 50.0}],
+            ],
+            100.0,
+        )
+
+        assert [point["time"] for point in stitched] == [1, 2, 3, 4]
+        assert [point["value"] for point in stitched] == pytest.approx([100, 120, 120, 60])
+
+    def test_no_curves(self):
+        """Without curves there is nothing to stitch."""
+        assert stitch_equity_curves([], 100.0) == []
+
+
+class TestWalkForwardService:
+    """Tests for WalkForwardService.run."""
+
+    async def test_run_summarizes_folds_and_stitches(self, base_request):
+        """Every fold runs once, failures are reported and test windows compound."""
+        progress: list[tuple[int, int]] = []
+        handles: list[SharedBarHandle] = []
+
+        def factory(shared_bars, instrument, workers):
+            handles.append(shared_bars)
+            return ThreadPoolExecutor(max_workers=workers)
+
+        service = WalkForwardService(max_workers=8, executor_factory=factory)
+        spec = SweepSpec(params={"fast_period": [5, 10], "slow_period": [50]})
+        windows_spec = WalkForwardSpec(train_months=12, test_months=6)
+        bars = _bars(base_request.start_date, 3 * 365)
+
+        with patch(
+            "src.services.walk_forward.run_walk_forward_fold", side_effect=_fold
+        ) as fold_mock:
+            summary = await service.run(
+                base_request,
+                spec,
+                windows_spec,
+                bars,
+                MagicMock(),
+                persist=False,
+                on_progress=lambda done, total: progress.append((done, total)),
+            )
+
+        assert fold_mock.call_count == 4
+        assert handles[0].count == len(bars)
+        # Shared memory is released once the analysis finishes
+        with pytest.raises(FileNotFoundError):
+            load_shared_bars(handles[0])
+        assert progress[-1] == (4, 4)
+
+        assert [fold.success for fold in summary.folds] == [True, False, True, True]
+        assert summary.folds[1].error_message == "engine failed"
+        assert all(fold.params == {"fast_period": 10, "slow_period": 50} for fold in summary.folds)
+        assert summary.folds[0].train_metric == pytest.approx(1.0)
+        assert summary.folds[0].total_return == pytest.approx(0.1)
+        assert all(fold.run_id is None for fold in summary.folds)
+        # Three successful folds of +10% each
+        assert summary.total_return == pytest.approx(1.1**3 - 1)
+        assert summary.max_drawdown == 0.0
+
+    async def test_run_rejects_range_without_folds(self, base_request):
+        """A date range shorter than one train window raises ValueError."""
+        service = WalkForwardService(max_workers=1)
+        windows_spec = WalkForwardSpec(train_months=60, test_months=12)
+
+        with pytest.raises(ValueError, match="shorter than one train window"):
+            await service.run(
+                base_request,
+                SweepSpec(params={"fast_period": [5]}),
+                windows_spec,
+                _bars(base_request.start_date, 30),
+                MagicMock(),
+            )
+
+    async def test_run_rejects_empty_bars(self, base_request):
+        """An analysis without bars fails fast."""
+        service = WalkForwardService(max_workers=1)
+
+        with pytest.raises(ValueError, match="No bars"):
+            await service.run(
+                base_request,
+                SweepSpec(params={"fast_period": [5]}),
+                WalkForwardSpec(train_months=1, test_months=1),
+                [],
+                MagicMock(),
+            )
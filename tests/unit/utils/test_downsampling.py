@@ -0,0 +1,88 @@
+"""Tests for chart downsampling utilities."""
+
+import numpy as np
+import pytest
+
+from src.utils.downsampling import (
+    OHLCVColumns,
+    aggregate_ohlcv,
+    bars_per_bucket,
+    lttb_indices,
+)
+
+
+def _columns(count: int) -> OHLCVColumns:
+    """Synthetic minute bars with a sine-shaped close."""
+    close = 100.0 + 10.0 * np.sin(np.arange(count) / 50.0)
+    return OHLCVColumns(
+        time=1_704_067_200 + 60 * np.arange(count, dtype=np.int64),
+        open=close - 0.5,
+        high=close + 1.0,
+        low=close - 1.0,
+        close=close,
+        volume=np.full(count, 100.0),
+    )
+
+
+class TestAggregateOHLCV:
+    """Tests for aggregate_ohlcv function."""
+
+    def test_small_series_is_returned_unchanged(self):
+        """Series within the budget are not aggregated."""
+        columns = _columns(50)
+
+        result, size = aggregate_ohlcv(columns, max_points=100)
+
+        assert size == 1
+        assert result is columns
+
+    def test_buckets_preserve_ohlcv_semantics(self):
+        """Each bucket keeps first open, last close, extreme high/low and total volume."""
+        columns = _columns(1_005)
+
+        result, size = aggregate_ohlcv(columns, max_points=100)
+
+        assert size == 11
+        assert len(result) == 92
+        assert result.time[1] == columns.time[11]
+        assert result.open[1] == columns.open[11]
+        assert result.close[1] == columns.close[21]
+        assert result.high[1] == columns.high[11:22].max()
+        assert result.low[1] == columns.low[11:22].min()
+        assert result.volume.sum() == columns.volume.sum()
+        assert result.close[-1] == columns.close[-1]
+
+    def test_bucket_size_rejects_non_positive_budget(self):
+        """A zero budget is a programming error."""
+        with pytest.raises(ValueError):
+            bars_per_bucket(100, 0)
+
+
+class TestLTTBIndices:
+    """Tests for lttb_indices function."""
+
+    def test_keeps_endpoints_and_budget(self):
+        """Output is sorted, sized to the budget and keeps both endpoints."""
+        columns = _columns(10_000)
+
+        keep = lttb_indices(columns.time, columns.close, max_points=500)
+
+        assert len(keep) == 500
+        assert keep[0] == 0
+        assert keep[-1] == 9_999
+        assert np.all(np.diff(keep) > 0)
+
+    def test_preserves_spike(self):
+        """A single-point spike survives decimation."""
+        values = np.zeros(5_000)
+        values[2_345] = 50.0
+
+        keep = lttb_indices(np.arange(5_000), values, max_points=100)
+
+        assert 2_345 in keep
+
+    def test_short_series_is_not_decimated(self):
+        """Series within the budget keep every point."""
+        keep = lttb_indices(np.arange(10), np.arange(10), max_points=20)
+
+        assert keep.tolist() == list(range(10))